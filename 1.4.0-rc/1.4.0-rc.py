@@ -1,12 +1,28 @@
 # 新增图标，程序打包为exe
 
 import tkinter as tk
-from tkinter import messagebox
-from idCode import region_data  # 从idCode.py导入行政区划数据
-import datetime
+from tkinter import messagebox, filedialog, ttk
+from idRegion import region_data  # 行政区划数据（首次查询时加载）
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from itertools import zip_longest
+import idChecksum
+import idDate
+import threading
+import tempfile
+import time
+import codecs
+import gzip
+import csv
+import io
 import sys
 import os
 
+POLL_MS = 16  # 轮询后台结果的间隔（约60帧/秒）
+BATCH_POLL_MS = 100  # 批量模式刷新进度的间隔
+BATCH_CHUNK = 5000  # 批量模式每块记录数
+VISIBLE_ROWS = 20  # 结果表格可见行数
+
 
 class IDAuthenticator:
     def __init__(self, root):
@@ -16,6 +32,12 @@ class IDAuthenticator:
         self.root.minsize(500, 480)
         self.root.config(bg="ghostwhite")
 
+        # 后台线程执行校验和行政区划查询，避免阻塞界面
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.request_id = 0
+        self.pending = None
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
         # 设置窗口图标
         self.set_icon()
 
@@ -68,10 +90,14 @@ class IDAuthenticator:
         entry_container = tk.Frame(input_frame, bg="aliceblue")
         entry_container.pack(side="left", fill="x", expand=True)
 
-        self.entry = tk.Entry(entry_container, font=("微软雅黑", 12), bd=2, relief="groove")
+        self.entry_text = tk.StringVar()
+        self.entry = tk.Entry(entry_container, textvariable=self.entry_text,
+                              font=("微软雅黑", 12), bd=2, relief="groove")
         self.entry.pack(side="left", fill="x", expand=True)  # 关键：设置fill和expand
         self.entry.focus()
         self.entry.bind("<Return>", self.validate)
+        # 输入内容变化时取消未完成的验证（Shift、方向键等不改变内容的按键不受影响）
+        self.entry_text.trace_add("write", lambda *args: self.cancel())
 
         # 验证按钮 - 放在entry_container中
         validate_btn = tk.Button(entry_container, text="验证", font=("微软雅黑", 12),
@@ -79,9 +105,16 @@ class IDAuthenticator:
                                  command=self.validate, padx=15)
         validate_btn.pack(side="right", padx=(10, 0))  # 固定在右侧
 
+        # 批量验证按钮
+        batch_btn = tk.Button(entry_container, text="批量", font=("微软雅黑", 12),
+                              bg="dodgerblue", fg="white", relief="flat",
+                              command=self.open_batch, padx=15)
+        batch_btn.pack(side="right", padx=(10, 0))
+
         # 按钮悬停效果
-        validate_btn.bind("<Enter>", lambda e: validate_btn.config(bg="royalblue"))
-        validate_btn.bind("<Leave>", lambda e: validate_btn.config(bg="dodgerblue"))
+        for btn in (validate_btn, batch_btn):
+            btn.bind("<Enter>", lambda e: e.widget.config(bg="royalblue"))
+            btn.bind("<Leave>", lambda e: e.widget.config(bg="dodgerblue"))
 
     def output(self):
         """创建结果展示区域"""
@@ -123,20 +156,70 @@ class IDAuthenticator:
         status.pack(side="bottom", fill="x")
 
     def validate(self, event=None):
-        """验证身份证并显示结果"""
+        """提交后台验证，结果通过 root.after 回到界面线程显示"""
         id_num = self.entry.get().strip().upper()
 
         # 清空之前的结果
         for label in self.info_labels.values():
             label.config(text="")
 
+        self.cancel()
+        self.pending = self.executor.submit(self.resolve, id_num)
+        self.root.after(POLL_MS, self.poll, self.request_id, self.pending)
+
+    def cancel(self, event=None):
+        """作废尚未显示的验证请求"""
+        self.request_id += 1
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+    def poll(self, request_id, future):
+        """在界面线程中检查后台结果，过期请求直接丢弃"""
+        if request_id != self.request_id:
+            return
+        if not future.done():
+            self.root.after(POLL_MS, self.poll, request_id, future)
+            return
+        self.pending = None
+
+        try:
+            info = future.result()
+        except Exception as e:
+            messagebox.showerror("错误", f"验证失败: {e}")
+            return
+
         # 只要有任何错误都弹出同一种错误提示
-        if not self.check_all(id_num):
+        if info is None:
             messagebox.showerror("错误", "身份证格式或内容有误")
             return
 
-        # 提取并显示信息
-        self.display_info(id_num)
+        # 显示信息
+        self.display_info(info)
+
+    def resolve(self, id_num):
+        """后台线程：校验并提取信息，不访问任何界面组件"""
+        if not self.check_all(id_num):
+            return None
+        return self.extract_info(id_num)
+
+    def open_batch(self):
+        """选择文件并打开批量验证窗口"""
+        path = filedialog.askopenfilename(
+            parent=self.root, title="选择身份证号码文件",
+            filetypes=[("身份证号码文件", "*.csv *.tsv *.txt *.gz"), ("所有文件", "*.*")])
+        if not path:
+            return
+        skip_header = messagebox.askyesnocancel(
+            "批量验证", "文件首行是否为表头？\n选择“是”将跳过首行。", parent=self.root)
+        if skip_header is not None:
+            BatchWindow(self.root, path, skip_header)
+
+    def close(self):
+        """关闭窗口并停止后台线程"""
+        self.cancel()
+        self.executor.shutdown(wait=False)
+        self.root.destroy()
 
     def check_all(self, id_num):
         """合并所有校验"""
@@ -152,49 +235,257 @@ class IDAuthenticator:
 
     def check_verify_code(self, id_num):
         """验证校验码"""
-        factors = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-        mapping = "10X98765432"
-        try:
-            total = sum(int(d) * f for d, f in zip(id_num[:17], factors))
-            return mapping[total % 11] == id_num[-1]
-        except Exception:
-            return False
+        return idChecksum.verify(id_num)
 
     def check_birth(self, id_num):
         """检查出生日期的有效性"""
-        birth_str = id_num[6:14]
-        try:
-            year = int(birth_str[:4])
-            month = int(birth_str[4:6])
-            day = int(birth_str[6:8])
-            month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-            today = datetime.date.today()
-            birth_date = datetime.date(year, month, day)
-            if year < 1840 or month < 1 or month > 12 or day < 1 or day > month_days[month - 1] or birth_date > today:
-                return False
-            # 闰年
-            if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-                month_days[1] = 29
-            return True
-        except Exception:
-            return False
+        return idDate.check_birth(id_num[6:14])
 
-    def display_info(self, id_num):
-        """显示身份证信息"""
+    def extract_info(self, id_num):
+        """提取身份证信息"""
         gender = "男" if int(id_num[16]) % 2 else "女"
-        self.info_labels["gender"].config(text=gender)
-
         birth = f"{int(id_num[6:10])} 年 {int(id_num[10:12])} 月 {int(id_num[12:14])} 日"
-        self.info_labels["birth"].config(text=birth)
 
         region_code = id_num[:6]
         province, city, district, source = region_data.get(
             region_code, ("-", "-", "-", "-"))
 
-        self.info_labels["province"].config(text=province)
-        self.info_labels["city"].config(text=city)
-        self.info_labels["district"].config(text=district)
-        self.info_labels["source"].config(text=source)
+        return {
+            "gender": gender,
+            "birth": birth,
+            "province": province,
+            "city": city,
+            "district": district,
+            "source": source,
+        }
+
+    def display_info(self, info):
+        """显示身份证信息"""
+        for key, text in info.items():
+            self.info_labels[key].config(text=text)
+
+
+class ResultStore:
+    """批量结果暂存于临时文件，内存中只保留每行的偏移量"""
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.offsets = array("q")
+        self.end = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def extend(self, lines):
+        """追加一批已编码的CSV行（UTF-8 字节，每项一行）"""
+        with self.lock:
+            self.file.seek(self.end)
+            for line in lines:
+                self.offsets.append(self.end)
+                self.file.write(line)
+                self.end += len(line)
+
+    def rows(self, start, count):
+        """读取第 start 行起的 count 行"""
+        with self.lock:
+            stop = min(start + count, len(self.offsets))
+            if start >= stop:
+                return []
+            end = self.offsets[stop] if stop < len(self.offsets) else self.end
+            self.file.seek(self.offsets[start])
+            data = self.file.read(end - self.offsets[start])
+        return list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+    def export(self, path, header):
+        """导出为带表头的CSV（UTF-8 BOM，便于Excel打开）"""
+        import idOutput
+        with self.lock, open(path, "wb") as out:
+            out.write(codecs.BOM_UTF8 + idOutput.csv_line(header))
+            self.file.seek(0)
+            remaining = self.end
+            while remaining > 0:
+                block = self.file.read(min(remaining, 1 << 20))
+                out.write(block)
+                remaining -= len(block)
+
+    def close(self):
+        self.file.close()
+
+
+class BatchWindow:
+    """批量验证窗口：后台线程分块校验文件，进度条显示速率与剩余时间，结果表格只渲染可见行"""
+
+    def __init__(self, master, path, skip_header=False):
+        # 批量校验依赖 NumPy，首次打开批量窗口时才加载，单条验证不受影响
+        import idCheck
+        self.header = idCheck.HEADER
+        self.path = path
+        self.skip_header = skip_header
+        self.store = ResultStore()
+        self.total_bytes = os.path.getsize(path) or 1
+        self.bytes_read = 0
+        self.valid = 0
+        self.done = False
+        self.closed = False
+        self.error = None
+        self.cancelled = threading.Event()
+        self.first = 0
+        self.start = time.perf_counter()
+
+        self.window = tk.Toplevel(master)
+        self.window.title(f"批量验证 - {os.path.basename(path)}")
+        self.window.geometry("860x560")
+        self.window.config(bg="ghostwhite")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.widgets()
+
+        threading.Thread(target=self.work, daemon=True).start()
+        self.after_id = self.window.after(BATCH_POLL_MS, self.poll)
+
+    def widgets(self):
+        """创建进度区域、结果表格和按钮"""
+        top = tk.Frame(self.window, bg="aliceblue", padx=15, pady=10)
+        top.pack(fill="x", padx=10, pady=5)
+
+        self.progress = ttk.Progressbar(top, maximum=1000)
+        self.progress.pack(fill="x")
+        self.status = tk.Label(top, text="正在读取...", font=("微软雅黑", 10),
+                               bg="aliceblue", anchor="w")
+        self.status.pack(fill="x", pady=(5, 0))
+
+        table = tk.Frame(self.window, bg="ghostwhite")
+        table.pack(fill="both", expand=True, padx=10, pady=5)
+
+        # 固定数量的表格行，滚动时只替换内容
+        self.tree = ttk.Treeview(table, columns=self.header, show="headings",
+                                 height=VISIBLE_ROWS, selectmode="none")
+        for column in self.header:
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=160 if column == "身份证号码" else 90, anchor="w")
+        self.items = [self.tree.insert("", "end", values=[""] * len(self.header))
+                      for _ in range(VISIBLE_ROWS)]
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<MouseWheel>", lambda e: self.on_scroll("scroll", -e.delta // 120, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.on_scroll("scroll", -1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.on_scroll("scroll", 1, "units"))
+
+        bottom = tk.Frame(self.window, bg="ghostwhite")
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+        self.export_btn = tk.Button(bottom, text="导出", font=("微软雅黑", 11),
+                                    bg="dodgerblue", fg="white", relief="flat",
+                                    command=self.export, padx=15, state="disabled")
+        self.export_btn.pack(side="right")
+        self.cancel_btn = tk.Button(bottom, text="取消", font=("微软雅黑", 11),
+                                    relief="flat", command=self.cancelled.set, padx=15)
+        self.cancel_btn.pack(side="right", padx=(0, 10))
+
+    def work(self):
+        """后台线程：流式读取文件并分块校验，不访问任何界面组件"""
+        import idBatch
+        import idCheck
+        import idOutput
+        try:
+            with open(self.path, "rb") as raw:
+                stream = gzip.open(raw) if self.path.endswith(".gz") else raw
+                # 进度按原始文件读取位置计算（gzip按压缩后字节）
+                text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+                ids = idCheck.read_ids(text, idCheck.guess_format(self.path),
+                                       skip_header=self.skip_header)
+                for chunk in idCheck.chunked(ids, BATCH_CHUNK):
+                    if self.cancelled.is_set():
+                        break
+                    reasons, data = idCheck.check_chunk_bytes(chunk)
+                    lines = data.splitlines(keepends=True)
+                    if len(lines) != len(chunk):
+                        # 号码本身含换行符时逐行编码
+                        lines = [idOutput.csv_line(row) for row in idCheck.check_chunk(chunk)]
+                    self.store.extend(lines)
+                    self.valid += int((reasons == idBatch.REASON_OK).sum())
+                    self.bytes_read = raw.tell()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            if self.closed:
+                self.store.close()
+
+    def poll(self):
+        """界面线程：刷新进度与可见行"""
+        count = len(self.store)
+        elapsed = time.perf_counter() - self.start
+        rate = count / elapsed if elapsed else 0.0
+        fraction = 1.0 if self.done else min(self.bytes_read / self.total_bytes, 1.0)
+        self.progress["value"] = fraction * 1000
+
+        if self.done:
+            state = "已取消" if self.cancelled.is_set() else "已完成"
+            eta = ""
+        else:
+            state = "处理中"
+            eta = (f" | 剩余约 {elapsed * (1 - fraction) / fraction:.0f} 秒"
+                   if fraction > 0 else "")
+        self.status.config(text=f"{state} | 已处理 {count:,} 条，有效 {self.valid:,} 条 | "
+                                f"{rate:,.0f} 条/秒{eta}")
+        self.refresh()
+
+        if not self.done:
+            self.after_id = self.window.after(BATCH_POLL_MS, self.poll)
+            return
+        self.after_id = None
+        self.cancel_btn.config(state="disabled")
+        self.export_btn.config(state="normal")
+        if self.error is not None:
+            messagebox.showerror("错误", f"读取文件失败: {self.error}", parent=self.window)
+
+    def on_scroll(self, action, *args):
+        """滚动条与鼠标滚轮：只移动可见窗口的起始行"""
+        if action == "moveto":
+            self.first = int(float(args[0]) * len(self.store))
+        elif action == "scroll":
+            step = int(args[0])
+            if args[1] == "pages":
+                step *= VISIBLE_ROWS
+            self.first += step
+        self.refresh()
+
+    def refresh(self):
+        """用当前可见范围的结果填充固定的表格行"""
+        total = len(self.store)
+        self.first = max(0, min(self.first, total - VISIBLE_ROWS))
+        rows = self.store.rows(self.first, VISIBLE_ROWS)
+        for item, row in zip_longest(self.items, rows):
+            self.tree.item(item, values=row or [""] * len(self.header))
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + len(rows)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def export(self):
+        """导出全部结果"""
+        path = filedialog.asksaveasfilename(
+            parent=self.window, title="导出结果", defaultextension=".csv",
+            filetypes=[("CSV 文件", "*.csv")])
+        if not path:
+            return
+        try:
+            self.store.export(path, self.header)
+        except OSError as e:
+            messagebox.showerror("错误", f"导出失败: {e}", parent=self.window)
+            return
+        messagebox.showinfo("完成", f"已导出 {len(self.store):,} 条结果", parent=self.window)
+
+    def close(self):
+        """关闭窗口，停止后台线程并删除临时文件"""
+        self.cancelled.set()
+        self.closed = True
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+        self.window.destroy()
+        if self.done:
+            self.store.close()
 
 
 if __name__ == "__main__":
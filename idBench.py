@@ -0,0 +1,227 @@
+# 基准测试套件：校验、行政区划查询、转归解析与冷启动，结果保存为JSON并可与基线对比
+
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BENCHMARKS = {}
+
+
+def benchmark(name, max_size=None):
+    """注册基准测试；函数接收 (fixtures, size)，返回被计时的可调用对象"""
+    def register(func):
+        BENCHMARKS[name] = (func, max_size)
+        return func
+    return register
+
+
+class Fixtures:
+    """按需构造、在各项测试间复用的测试数据"""
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self._ids = []
+        self._app = None
+        self._tmp = None
+
+    def ids(self, size):
+        if len(self._ids) < size:
+            import idGenerate
+            self._ids = idGenerate.to_strings(idGenerate.generate(
+                size, seed=self.seed, bad_checksum=0.1, bad_date=0.05, unknown_region=0.05))
+        return self._ids[:size]
+
+    def path(self, name):
+        """临时目录中的文件路径，close() 时连同目录一起删除"""
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory()
+        return os.path.join(self._tmp.name, name)
+
+    def close(self):
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    @property
+    def app(self):
+        """不创建窗口的 IDAuthenticator 实例，只用于调用校验方法"""
+        if self._app is None:
+            sys.path.insert(0, ROOT)
+            spec = importlib.util.spec_from_file_location(
+                "authenticator", os.path.join(ROOT, "1.4.0-rc", "1.4.0-rc.py"))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._app = module.IDAuthenticator.__new__(module.IDAuthenticator)
+        return self._app
+
+
+@benchmark("check_all")
+def _check_all(fx, size):
+    ids, check = fx.ids(size), fx.app.check_all
+    return lambda: [check(i) for i in ids]
+
+
+@benchmark("check_verify_code")
+def _check_verify_code(fx, size):
+    ids, check = fx.ids(size), fx.app.check_verify_code
+    return lambda: [check(i) for i in ids]
+
+
+@benchmark("check_birth")
+def _check_birth(fx, size):
+    ids, check = fx.ids(size), fx.app.check_birth
+    return lambda: [check(i) for i in ids]
+
+
+@benchmark("check_batch")
+def _check_batch(fx, size):
+    import idBatch
+    ids = fx.ids(size)
+    return lambda: idBatch.check_batch(ids)
+
+
+@benchmark("idFixed.check_file")
+def _check_fixed(fx, size):
+    import idFixed
+    path = fx.path("ids.txt")
+    with open(path, "w", encoding="ascii") as f:
+        f.writelines(f"{id_num}\n" for id_num in fx.ids(size))
+    return lambda: idFixed.check_file(path)
+
+
+@benchmark("region_data.get")
+def _region_dict(fx, size):
+    from idCode import region_data
+    codes = [i[:6] for i in fx.ids(size)]
+    return lambda: [region_data.get(c, ("-", "-", "-", "-")) for c in codes]
+
+
+@benchmark("RegionIndex.get")
+def _region_index(fx, size):
+    import idIndex
+    if not os.path.exists(idIndex.DEFAULT_PATH):
+        idIndex.build()
+    index = idIndex.load()
+    codes = [i[:6] for i in fx.ids(size)]
+    return lambda: [index.get(c, ("-", "-", "-", "-")) for c in codes]
+
+
+@benchmark("batch_transfer_codes", max_size=7266)
+def _transfer(fx, size):
+    import idFilter
+    lines = idFilter.read_history().strip().split("\n")
+    data = "\n".join(lines[:size + 1])
+    return lambda: idFilter.batch_transfer_codes_with_names_full_columns(data)
+
+
+def _import_time(env):
+    code = "import time; s = time.perf_counter(); import idCode; print(time.perf_counter() - s)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def _cold_import_time(env):
+    with tempfile.TemporaryDirectory() as cache:
+        return _import_time(dict(env, PYTHONPYCACHEPREFIX=cache, PYTHONDONTWRITEBYTECODE="1"))
+
+
+def cold_import(repeat):
+    """在子进程中测量 import idCode：无 .pyc（冷启动）与有 .pyc 两种情况，临时缓存目录用后删除"""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    with tempfile.TemporaryDirectory() as cache:
+        warm = dict(env, PYTHONPYCACHEPREFIX=cache)
+        _import_time(warm)
+        results = []
+        for name, probe in (("import idCode (no pyc)", lambda: _cold_import_time(env)),
+                            ("import idCode (pyc)", lambda: _import_time(warm))):
+            seconds = min(probe() for _ in range(repeat))
+            results.append({"name": name, "size": 1, "seconds": seconds, "rate": 1 / seconds})
+    return results
+
+
+def run(names, sizes, repeat=3, seed=0):
+    fx = Fixtures(seed)
+    results = []
+    try:
+        for name in names:
+            func, max_size = BENCHMARKS[name]
+            for size in sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                target = func(fx, size)
+                seconds = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    target()
+                    seconds = min(seconds, time.perf_counter() - start)
+                results.append({"name": name, "size": size, "seconds": seconds,
+                                "rate": size / seconds if seconds else float("inf")})
+                print(f"{name:<24} {size:>10,}  {seconds:>10.4f} s  {size / seconds:>14,.0f} 条/秒",
+                      file=sys.stderr)
+    finally:
+        fx.close()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """与基线对比，耗时增加超过 threshold（比例）的项目视为性能回退"""
+    old = {(r["name"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        before = old.get((r["name"], r["size"]))
+        if before is None:
+            continue
+        ratio = r["seconds"] / before if before else float("inf")
+        flag = "回退" if ratio > 1 + threshold else ""
+        print(f"{r['name']:<24} {r['size']:>10,}  x{ratio:6.2f}  {flag}")
+        if flag:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="身份证验证系统基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100_000, 1_000_000],
+                        help="输入规模，最大可到10000000")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS) + ["import"],
+                        help="只运行指定项目")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数，取最小值")
+    parser.add_argument("-o", "--output", default="idBench.json", help="结果JSON文件")
+    parser.add_argument("--baseline", help="基线JSON文件，用于检测性能回退")
+    parser.add_argument("--threshold", type=float, default=0.2, help="回退阈值（比例），默认0.2")
+    args = parser.parse_args(argv)
+
+    names = [n for n in (args.only or BENCHMARKS) if n != "import"]
+    results = run(names, args.sizes, args.repeat)
+    if not args.only or "import" in args.only:
+        results += cold_import(args.repeat)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"结果已保存到 {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"发现 {len(regressions)} 项性能回退", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# 行政区划查询与结果格式化的有界LRU缓存，统计命中/未命中/淘汰次数
+
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """有界LRU缓存，超出 maxsize 时淘汰最久未使用的条目"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_or_compute(self, key, compute):
+        """命中时返回缓存值，否则调用 compute(key) 并缓存结果"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return value
+            self.misses += 1
+
+        value = compute(key)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class CachedRegionData:
+    """按6位代码缓存的行政区划查询，接口与 region_data 字典一致"""
+
+    def __init__(self, source=None, maxsize=1024):
+        if source is None:
+            from idRegion import region_data as source
+        self.source = source
+        self.cache = LRUCache(maxsize)
+
+    def get(self, code, default=None):
+        record = self.cache.get_or_compute(code, lambda key: self.source.get(key, _MISSING))
+        return default if record is _MISSING else record
+
+    def __getitem__(self, code):
+        record = self.get(code, _MISSING)
+        if record is _MISSING:
+            raise KeyError(code)
+        return record
+
+    def __contains__(self, code):
+        return self.get(code, _MISSING) is not _MISSING
+
+    def stats(self):
+        return self.cache.stats()
+
+
+class CachedFormatter:
+    """按17位本体码缓存完整的格式化结果（性别、出生日期、行政区划）"""
+
+    def __init__(self, extract=None, maxsize=65536):
+        if extract is None:
+            from idCheck import extract
+        self.extract = extract
+        self.cache = LRUCache(maxsize)
+
+    def __call__(self, id_num):
+        return self.cache.get_or_compute(id_num[:17], self.extract)
+
+    def stats(self):
+        return self.cache.stats()
@@ -0,0 +1,127 @@
+# 校验码计算引擎：按位预计算 数字×权重 mod 11 查找表，支持单条、批量、逐字输入和补全校验码
+
+import operator
+import sys
+import time
+
+# GB 11643-1999 加权因子与校验码映射
+WEIGHTS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+CHECK_CODES = "10X98765432"
+
+# TABLES[位置][数字字符] = 数字 × 权重 mod 11
+TABLES = tuple({str(d): d * w % 11 for d in range(10)} for w in WEIGHTS)
+# 字节转换表：ASCII数字 -> 数值 0-9
+_DIGIT_BYTES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def _weighted_sum(prefix):
+    """17位数字前缀的加权和（快速路径：字节转换后在C层完成乘加）"""
+    if prefix.isascii():
+        values = prefix.encode("ascii").translate(_DIGIT_BYTES)
+        return sum(map(operator.mul, values, WEIGHTS))
+    # 非ASCII数字（如全角）回退到 int()，无法转换时抛出 ValueError
+    return sum(int(d) * w for d, w in zip(prefix, WEIGHTS))
+
+
+def check_code(prefix):
+    """根据前17位数字计算第18位校验码"""
+    if len(prefix) != 17 or not prefix.isdigit():
+        raise ValueError("需要17位数字")
+    return CHECK_CODES[_weighted_sum(prefix) % 11]
+
+
+def complete(prefix):
+    """为17位数字前缀补全校验码，返回18位身份证号码"""
+    return prefix + check_code(prefix)
+
+
+def verify(id_num):
+    """验证18位身份证号码的校验码"""
+    prefix = id_num[:17]
+    if len(id_num) != 18 or not prefix.isdigit():
+        return False
+    try:
+        return CHECK_CODES[_weighted_sum(prefix) % 11] == id_num[17]
+    except ValueError:
+        return False
+
+
+def check_codes(prefixes):
+    """批量计算校验码
+
+    prefixes 为字符串序列时返回字符串列表；为 (N, 17) uint8 数组时返回 uint8 数组（ASCII）。
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None and isinstance(prefixes, np.ndarray):
+        # uint8 相减后非数字字符回绕为大于9的值，一次 max 即可判断；加权和用矩阵乘法在 C 层完成
+        digits = prefixes[:, :17] - np.uint8(48)
+        if digits.max(initial=0) > 9:
+            raise ValueError("需要17位数字")
+        total = digits.astype(np.int32) @ np.array(WEIGHTS, dtype=np.int32)
+        return np.frombuffer(CHECK_CODES.encode("ascii"), dtype=np.uint8)[total % 11]
+    return [check_code(prefix) for prefix in prefixes]
+
+
+class PrefixChecksum:
+    """逐字输入时增量维护加权和，输入第17位后即可得到应有的校验码"""
+
+    def __init__(self, text=""):
+        self._sums = [0]
+        for char in text[:17]:
+            self.push(char)
+
+    def __len__(self):
+        return len(self._sums) - 1
+
+    def push(self, char):
+        """追加一位数字；超过17位或不是数字时抛出 ValueError"""
+        position = len(self)
+        if position >= 17 or char not in TABLES[0]:
+            raise ValueError(f"无效输入: {char!r}")
+        self._sums.append((self._sums[-1] + TABLES[position][char]) % 11)
+
+    def pop(self):
+        """删除最后一位（退格）"""
+        if len(self._sums) > 1:
+            self._sums.pop()
+
+    @property
+    def check_code(self):
+        """已输入17位时返回校验码，否则返回None"""
+        return CHECK_CODES[self._sums[-1]] if len(self) == 17 else None
+
+
+def _verify_original(id_num):
+    """旧实现（生成器逐位 int()），仅用于基准对比"""
+    factors = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+    mapping = "10X98765432"
+    try:
+        total = sum(int(d) * f for d, f in zip(id_num[:17], factors))
+        return mapping[total % 11] == id_num[-1]
+    except Exception:
+        return False
+
+
+def benchmark(n=500_000):
+    import idGenerate
+
+    ids = idGenerate.to_strings(idGenerate.generate(n, seed=0, bad_checksum=0.5))
+
+    start = time.perf_counter()
+    old = [_verify_original(i) for i in ids]
+    old_rate = n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    new = [verify(i) for i in ids]
+    new_rate = n / (time.perf_counter() - start)
+
+    assert old == new
+    print(f"原实现 逐条:   {old_rate:>12,.0f} 条/秒")
+    print(f"查找表 逐条:   {new_rate:>12,.0f} 条/秒  (x{new_rate / old_rate:.1f})")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,95 @@
+# 出生日期校验：纯算术判断，不逐条构造 datetime.date，标量与 NumPy 数组通用
+
+import datetime
+import sys
+import time
+
+MIN_YEAR = 1840
+
+
+def today_ymd(today=None):
+    """将"今天"转为 YYYYMMDD 整数，批量校验时只需计算一次"""
+    today = today or datetime.date.today()
+    return today.year * 10000 + today.month * 100 + today.day
+
+
+def days_in_month(year, month):
+    """每月天数，标量与数组均可
+
+    1-7月单数月、8-12月双数月为31天，其余为30天；2月为28天，闰年29天。
+    """
+    leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    return 30 + (month + month // 8) % 2 - (month == 2) * (2 - leap)
+
+
+def valid_birth(year, month, day, today=None):
+    """判断出生日期是否有效：不早于1840年、日期存在且不晚于今天
+
+    year/month/day 可以是整数或整数数组；today 可传入 YYYYMMDD 整数以复用。
+    """
+    if today is None or isinstance(today, datetime.date):
+        today = today_ymd(today)
+    return ((year >= MIN_YEAR) & (month >= 1) & (month <= 12) & (day >= 1)
+            & (day <= days_in_month(year, month))
+            & (year * 10000 + month * 100 + day <= today))
+
+
+def check_birth(birth_str, today=None):
+    """校验8位 YYYYMMDD 出生日期字符串"""
+    try:
+        year = int(birth_str[:4])
+        month = int(birth_str[4:6])
+        day = int(birth_str[6:8])
+    except ValueError:
+        return False
+    return len(birth_str) == 8 and bool(valid_birth(year, month, day, today))
+
+
+def _check_birth_datetime(birth_str):
+    """旧实现（逐条构造 datetime.date），仅用于基准对比"""
+    try:
+        year = int(birth_str[:4])
+        month = int(birth_str[4:6])
+        day = int(birth_str[6:8])
+        month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        today = datetime.date.today()
+        birth_date = datetime.date(year, month, day)
+        if year < 1840 or month < 1 or month > 12 or day < 1 or day > month_days[month - 1] or birth_date > today:
+            return False
+        return True
+    except Exception:
+        return False
+
+
+def benchmark(n=1_000_000):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    year = rng.integers(1800, 2100, size=n)
+    month = rng.integers(0, 14, size=n)
+    day = rng.integers(0, 33, size=n)
+    strings = [f"{y:04d}{m:02d}{d:02d}" for y, m, d in zip(year.tolist(), month.tolist(), day.tolist())]
+
+    loop_n = min(n, 200_000)
+    start = time.perf_counter()
+    for s in strings[:loop_n]:
+        _check_birth_datetime(s)
+    old_rate = loop_n / (time.perf_counter() - start)
+
+    today = today_ymd()
+    start = time.perf_counter()
+    scalar = [check_birth(s, today) for s in strings[:loop_n]]
+    scalar_rate = loop_n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    vector = valid_birth(year, month, day, today)
+    vector_rate = n / (time.perf_counter() - start)
+
+    assert vector[:loop_n].tolist() == scalar
+    print(f"datetime 逐条: {old_rate:>14,.0f} 条/秒")
+    print(f"算术 逐条:     {scalar_rate:>14,.0f} 条/秒  (x{scalar_rate / old_rate:.1f})")
+    print(f"算术 向量化:   {vector_rate:>14,.0f} 条/秒  (x{vector_rate / old_rate:.1f})")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,129 @@
+# Excel 行政区划导入：构建时读取 idCode.xlsx 一次，转换为二进制索引（可选同时生成 idCode.py），内容未变时跳过
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+import idIndex
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EXCEL = os.path.join(ROOT, "idCode.xlsx")
+COLUMNS = ["行政区划代码", "省级", "地市级", "县区级", "数据来源"]
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def file_hash(path):
+    """文件内容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_xlsx(path):
+    """不依赖 pandas 读取第一个工作表，返回行列表（每行为 列字母 -> 文本）"""
+    with zipfile.ZipFile(path) as z:
+        strings = []
+        if "xl/sharedStrings.xml" in z.namelist():
+            for si in ET.fromstring(z.read("xl/sharedStrings.xml")).iter(_NS + "si"):
+                strings.append("".join(t.text or "" for t in si.iter(_NS + "t")))
+        sheet = ET.fromstring(z.read("xl/worksheets/sheet1.xml"))
+
+    rows = []
+    for row in sheet.iter(_NS + "row"):
+        values = {}
+        for cell in row.iter(_NS + "c"):
+            column = re.match(r"[A-Z]+", cell.get("r")).group()
+            if cell.get("t") == "inlineStr":
+                values[column] = "".join(t.text or "" for t in cell.iter(_NS + "t"))
+                continue
+            value = cell.find(_NS + "v")
+            if value is not None:
+                values[column] = strings[int(value.text)] if cell.get("t") == "s" else value.text
+        rows.append(values)
+    return rows
+
+
+def read_excel(path=DEFAULT_EXCEL):
+    """读取 Excel 行政区划表，返回与 region_data 相同结构的字典（空值为''）"""
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    data = {}
+    if pd is not None:
+        df = pd.read_excel(path, dtype=str).fillna("")
+        for row in df[COLUMNS].itertuples(index=False):
+            code = row[0].strip()
+            if code:
+                data[code] = tuple(value.strip() for value in row[1:])
+        return data
+
+    rows = _read_xlsx(path)
+    header = {value: column for column, value in rows[0].items()}
+    columns = [header[name] for name in COLUMNS]
+    for values in rows[1:]:
+        code = values.get(columns[0], "").strip()
+        if code:
+            data[code] = tuple(values.get(column, "").strip() for column in columns[1:])
+    return data
+
+
+def write_module(data, path):
+    """生成与 idCode.py 相同格式的 region_data 字典源码"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# 行政区划数据字典\nregion_data = {\n")
+        for code in sorted(data):
+            f.write(f"    {code!r}: {data[code]!r},\n")
+        f.write("}\n")
+
+
+def convert(excel=DEFAULT_EXCEL, output=idIndex.DEFAULT_PATH, module=None, force=False):
+    """转换 Excel 为二进制索引；记录源文件与输出文件的哈希，两者都未变化时直接跳过
+
+    返回 True 表示进行了转换，False 表示已是最新。
+    """
+    stamp = output + ".json"
+    digest = file_hash(excel)
+    if not force and os.path.exists(output) and os.path.exists(stamp):
+        with open(stamp, encoding="utf-8") as f:
+            recorded = json.load(f)
+        # 索引被其他程序（如 idIndex build）覆盖或损坏时，哈希不一致，需重新转换
+        if (recorded.get("sha256") == digest and recorded.get("index_sha256") == file_hash(output)
+                and (module is None or os.path.exists(module))):
+            return False
+
+    data = read_excel(excel)
+    if module is not None:
+        write_module(data, module)
+    # 先生成源码再构建索引，使索引文件头记录的是新 idCode.py 的大小与修改时间
+    idIndex.build(output, data)
+    with open(stamp, "w", encoding="utf-8") as f:
+        json.dump({"source": os.path.basename(excel), "sha256": digest, "count": len(data),
+                   "index_sha256": file_hash(output)}, f)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="将 idCode.xlsx 转换为行政区划二进制索引")
+    parser.add_argument("excel", nargs="?", default=DEFAULT_EXCEL)
+    parser.add_argument("-o", "--output", default=idIndex.DEFAULT_PATH, help="二进制索引输出路径")
+    parser.add_argument("--module", help="同时生成 region_data 源码文件，如 idCode.py")
+    parser.add_argument("--force", action="store_true", help="忽略哈希，强制重新转换")
+    args = parser.parse_args(argv)
+
+    if convert(args.excel, args.output, args.module, args.force):
+        print(f"已转换 {args.excel} -> {args.output}")
+    else:
+        print(f"{args.excel} 未变化，跳过转换")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
-def batch_transfer_codes_with_names_full_columns(data):
-    # 分割文本为行
-    lines = data.strip().split('\n')
-    header = lines[0].split('\t')
-    data_lines = [line.split('\t') for line in lines[1:]]
+import io
+import os
+import sys
 
-    # 步骤1: 构建两个字典
+# 区划历史表（制表符分隔，首行为表头）
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'idHistory.tsv')
+
+
+def build_transfer_mappings(data_lines):
+    """构建代码转归映射和转归名称映射"""
     mapping_dict = {}  # 代码转归映射 (原始代码 -> 转归代码)
     name_dict = {}  # 代码名称映射 (原始代码 -> 转归名称)
 
@@ -21,33 +24,87 @@ def batch_transfer_codes_with_names_full_columns(data):
             mapping_dict[orig_code] = transfer_code
             name_dict[orig_code] = transfer_name
 
-    # 步骤2: 递归查找最终转归代码和名称
-    def get_final_info(start_code):
-        current_code = start_code
-        final_name = None
-        visited = set()
+    return mapping_dict, name_dict
+
+
+def resolve_transfers(mapping_dict, name_dict):
+    """一次性计算转归链的传递闭包
+
+    返回 (closure, cycles)：
+    closure 为 原始代码 -> (最终转归代码, 最终转归名称)，只包含有转归记录的代码；
+    cycles 为检测到的循环引用列表，每项为环上的代码序列（自循环为单个代码）。
+    每条链只遍历一次，链上所有代码共享同一结果（路径压缩）。
+    """
+    closure = {}
+    cycles = []
+
+    for start in mapping_dict:
+        if start in closure:
+            continue
+
+        path = []
+        position = {}
+        code = start
+        while True:
+            if code in closure:
+                result = closure[code]
+                break
+
+            next_code = mapping_dict[code]
 
-        while current_code in mapping_dict:
-            # 防止循环引用
-            if current_code in visited:
+            # 自循环：自身无转归名称，指向它的代码以它为终点
+            if next_code == code:
+                cycles.append([code])
+                result = closure[code] = (code, None)
                 break
-            visited.add(current_code)
 
-            # 获取下一级转归信息
-            next_code = mapping_dict[current_code]
+            # 下一级没有转归（或为自循环）：链在此结束
+            if next_code not in mapping_dict or mapping_dict[next_code] == next_code:
+                result = closure[code] = (next_code, name_dict.get(code))
+                break
 
-            # 检查自循环
-            if next_code == current_code:
+            position[code] = len(path)
+            path.append(code)
+
+            # 循环引用：环上每个代码止于自身，名称取环上前一个代码的转归名称
+            if next_code in position:
+                cycle = path[position[next_code]:]
+                cycles.append(cycle)
+                for i, node in enumerate(cycle):
+                    closure[node] = (node, name_dict.get(cycle[i - 1]))
+                del path[position[next_code]:]
+                result = closure[next_code]
                 break
 
-            # 获取名称（如果存在）
-            if current_code in name_dict:
-                final_name = name_dict[current_code]
+            code = next_code
+
+        # 路径压缩：链上所有代码共享最终结果
+        for node in path:
+            closure[node] = result
+
+    return closure, cycles
+
+
+def transfer_table(data):
+    """从区划历史表文本构建可复用的转归闭包表"""
+    lines = data.strip().split('\n')
+    data_lines = [line.split('\t') for line in lines[1:]]
+    return resolve_transfers(*build_transfer_mappings(data_lines))
+
 
-            # 更新当前代码
-            current_code = next_code
+def batch_transfer_codes_with_names_full_columns(data):
+    # 分割文本为行
+    lines = data.strip().split('\n')
+    header = lines[0].split('\t')
+    data_lines = [line.split('\t') for line in lines[1:]]
+
+    # 步骤1: 构建两个字典
+    mapping_dict, name_dict = build_transfer_mappings(data_lines)
 
-        return current_code, final_name
+    # 步骤2: 一次性计算最终转归代码和名称
+    closure, cycles = resolve_transfers(mapping_dict, name_dict)
+    for cycle in cycles:
+        print(f"检测到循环转归: {' -> '.join(cycle + cycle[:1])}", file=sys.stderr)
 
     # 步骤3: 更新表格（保留所有列）
     updated_data = []
@@ -58,7 +115,7 @@ def batch_transfer_codes_with_names_full_columns(data):
         orig_code = row[0].strip()
 
         # 获取最终转归信息
-        final_code, final_name = get_final_info(orig_code)
+        final_code, final_name = closure.get(orig_code, (orig_code, None))
 
         # 创建新行（只更新第10和11列，其他列保持不变）
         new_row = row.copy()  # 复制原始行所有数据
@@ -80,7276 +137,111 @@ def batch_transfer_codes_with_names_full_columns(data):
     return '\n'.join(output_lines)
 
 
-# 使用示例（包含12列）
-input_data = """
-行政区划代码	行政区划名称（官方按最新）	省级	地市级	县区级	数据来源	初次记录年份	最后记录年份	当前状态	代码转归	转归名称（或分拆后归属）	身份证使用情况（个案居民)	民政编码曾用名称记录[最后年份]、其他备注
-110000	北京市	北京市	-	-	民政部	1980年	2024年					
-110100	市辖区	北京市	市辖区	-	国标							见（GB/T 2260-2007）
-110101	东城区	北京市	市辖区	东城区	民政部	1980年	2024年					
-110102	西城区	北京市	市辖区	西城区	民政部	1980年	2024年					
-110103	崇文区	北京市	市辖区	崇文区	民政部	1980年	2009年	[已撤销]	110101	北京市,市辖区,东城区		
-110104	宣武区	北京市	市辖区	宣武区	民政部	1980年	2009年	[已撤销]	110102	北京市,市辖区,西城区		
-110105	朝阳区	北京市	市辖区	朝阳区	民政部	1980年	2024年					
-110106	丰台区	北京市	市辖区	丰台区	民政部	1980年	2024年					
-110107	石景山区	北京市	市辖区	石景山区	民政部	1980年	2024年					
-110108	海淀区	北京市	市辖区	海淀区	民政部	1980年	2024年					
-110109	门头沟区	北京市	市辖区	门头沟区	民政部	1980年	2024年					
-110110	燕山区	北京市	市辖区	燕山区	民政部	1980年	1985年	[已撤销]	110111	北京市,市辖区,房山区		
-110111	房山区	北京市	市辖区	房山区	民政部	1986年	2024年					
-110112	通州区	北京市	市辖区	通州区	民政部	1997年	2024年					
-110113	顺义区	北京市	市辖区	顺义区	民政部	1998年	2024年					
-110114	昌平区	北京市	市辖区	昌平区	民政部	1999年	2024年					
-110115	大兴区	北京市	市辖区	大兴区	民政部	2001年	2024年					
-110116	怀柔区	北京市	市辖区	怀柔区	民政部	2001年	2024年					
-110117	平谷区	北京市	市辖区	平谷区	民政部	2001年	2024年					
-110118	密云区	北京市	市辖区	密云区	民政部	2015年	2024年					
-110119	延庆区	北京市	市辖区	延庆区	民政部	2015年	2024年					
-110200	县	北京市	县	-	国标							
-110201	昌平县	北京市	县	昌平县	民政部	1980年	1981年	[已撤销]	110221	北京市,县,昌平县[已撤销]		
-110202	顺义县	北京市	县	顺义县	民政部	1980年	1981年	[已撤销]	110222	北京市,县,顺义县[已撤销]		
-110203	通县	北京市	县	通县	民政部	1980年	1981年	[已撤销]	110223	北京市,县,通县[已撤销]		
-110204	大兴县	北京市	县	大兴县	民政部	1980年	1981年	[已撤销]	110224	北京市,县,大兴县[已撤销]		
-110205	房山县	北京市	县	房山县	民政部	1980年	1981年	[已撤销]	110225	北京市,县,房山县[已撤销]		
-110206	平谷县	北京市	县	平谷县	民政部	1980年	1981年	[已撤销]	110226	北京市,县,平谷县[已撤销]		
-110207	怀柔县	北京市	县	怀柔县	民政部	1980年	1981年	[已撤销]	110227	北京市,县,怀柔县[已撤销]		
-110208	密云县	北京市	县	密云县	民政部	1980年	1981年	[已撤销]	110228	北京市,县,密云县[已撤销]		
-110209	延庆县	北京市	县	延庆县	民政部	1980年	1981年	[已撤销]	110229	北京市,县,延庆县[已撤销]		
-110221	昌平县	北京市	县	昌平县	民政部	1982年	1998年	[已撤销]	110114	北京市,市辖区,昌平区		
-110222	顺义县	北京市	县	顺义县	民政部	1982年	1997年	[已撤销]	110113	北京市,市辖区,顺义区		
-110223	通县	北京市	县	通县	民政部	1982年	1996年	[已撤销]	110112	北京市,市辖区,通州区		
-110224	大兴县	北京市	县	大兴县	民政部	1982年	2000年	[已撤销]	110115	北京市,市辖区,大兴区		
-110225	房山县	北京市	县	房山县	民政部	1982年	1985年	[已撤销]	110111	北京市,市辖区,房山区		
-110226	平谷县	北京市	县	平谷县	民政部	1982年	2000年	[已撤销]	110117	北京市,市辖区,平谷区		
-110227	怀柔县	北京市	县	怀柔县	民政部	1982年	2000年	[已撤销]	110116	北京市,市辖区,怀柔区		
-110228	密云县	北京市	县	密云县	民政部	1982年	2014年	[已撤销]	110118	北京市,市辖区,密云区		
-110229	延庆县	北京市	县	延庆县	民政部	1982年	2014年	[已撤销]	110119	北京市,市辖区,延庆区		
-110708		北京市			非官方						1965年	
-120000	天津市	天津市	-	-	民政部	1980年	2024年					
-120100	市辖区	天津市	市辖区	-	国标							
-120101	和平区	天津市	市辖区	和平区	民政部	1980年	2024年					
-120102	河东区	天津市	市辖区	河东区	民政部	1980年	2024年					
-120103	河西区	天津市	市辖区	河西区	民政部	1980年	2024年					
-120104	南开区	天津市	市辖区	南开区	民政部	1980年	2024年					
-120105	河北区	天津市	市辖区	河北区	民政部	1980年	2024年					
-120106	红桥区	天津市	市辖区	红桥区	民政部	1980年	2024年					
-120107	塘沽区	天津市	市辖区	塘沽区	民政部	1980年	2008年	[已撤销]	120116	天津市,市辖区,滨海新区		
-120108	汉沽区	天津市	市辖区	汉沽区	民政部	1980年	2008年	[已撤销]	120116	天津市,市辖区,滨海新区		
-120109	大港区	天津市	市辖区	大港区	民政部	1980年	2008年	[已撤销]	120116	天津市,市辖区,滨海新区		
-120110	东丽区	天津市	市辖区	东丽区	民政部	1980年	2024年					东郊区[1991年]
-120111	西青区	天津市	市辖区	西青区	民政部	1980年	2024年					西郊区[1991年]
-120112	津南区	天津市	市辖区	津南区	民政部	1980年	2024年					南郊区[1991年]
-120113	北辰区	天津市	市辖区	北辰区	民政部	1980年	2024年					北郊区[1991年]
-120114	武清区	天津市	市辖区	武清区	民政部	2000年	2024年					
-120115	宝坻区	天津市	市辖区	宝坻区	民政部	2001年	2024年					
-120116	滨海新区	天津市	市辖区	滨海新区	民政部	2009年	2024年					
-120117	宁河区	天津市	市辖区	宁河区	民政部	2015年	2024年					
-120118	静海区	天津市	市辖区	静海区	民政部	2015年	2024年					
-120119	蓟州区	天津市	市辖区	蓟州区	民政部	2016年	2024年					
-120200	县	天津市	县	-	国标							
-120201	宁河县	天津市	县	宁河县	民政部	1980年	1981年	[已撤销]	120221	天津市,县,宁河县[已撤销]		
-120202	武清县	天津市	县	武清县	民政部	1980年	1981年	[已撤销]	120222	天津市,县,武清县[已撤销]		
-120203	静海县	天津市	县	静海县	民政部	1980年	1981年	[已撤销]	120223	天津市,县,静海县[已撤销]		
-120204	宝坻县	天津市	县	宝坻县	民政部	1980年	1981年	[已撤销]	120224	天津市,县,宝坻县[已撤销]		
-120205	蓟县	天津市	县	蓟县	民政部	1980年	1981年	[已撤销]	120225	天津市,县,蓟县[已撤销]		
-120221	宁河县	天津市	县	宁河县	民政部	1982年	2014年	[已撤销]	120117	天津市,市辖区,宁河区		
-120222	武清县	天津市	县	武清县	民政部	1982年	1999年	[已撤销]	120114	天津市,市辖区,武清区		
-120223	静海县	天津市	县	静海县	民政部	1982年	2014年	[已撤销]	120118	天津市,市辖区,静海区		
-120224	宝坻县	天津市	县	宝坻县	民政部	1982年	2000年	[已撤销]	120115	天津市,市辖区,宝坻区		
-120225	蓟县	天津市	县	蓟县	民政部	1982年	2015年	[已撤销]	120119	天津市,市辖区,蓟州区		
-123020		天津市			非官方						1978年	
-130000	河北省	河北省	-	-	民政部	1980年	2024年					
-130100	石家庄市	河北省	石家庄市	-	民政部	1980年	2024年					
-130101	市辖区	河北省	石家庄市	市辖区	国标							增设（GB/T 2260-1984）
-130102	长安区	河北省	石家庄市	长安区	民政部	1980年	2024年					
-130103	桥东区	河北省	石家庄市	桥东区	民政部	1980年	2013年	[已撤销]	130102,130104	石家庄市,长安区,桥西区		
-130104	桥西区	河北省	石家庄市	桥西区	民政部	1980年	2024年					
-130105	新华区	河北省	石家庄市	新华区	民政部	1980年	2024年					
-130106	郊区	河北省	石家庄市	郊区	民政部	1980年	2000年	[已撤销]	130108	石家庄市,裕华区		
-130107	井陉矿区	河北省	石家庄市	井陉矿区	民政部	1980年	2024年					
-130108	裕华区	河北省	石家庄市	裕华区	民政部	2001年	2024年					
-130109	藁城区	河北省	石家庄市	藁城区	民政部	2014年	2024年					
-130110	鹿泉区	河北省	石家庄市	鹿泉区	民政部	2014年	2024年					
-130111	栾城区	河北省	石家庄市	栾城区	民政部	2014年	2024年					
-130121	井陉县	河北省	石家庄市	井陉县	民政部	1983年	2024年					
-130122	获鹿县	河北省	石家庄市	获鹿县	民政部	1983年	1993年	[已撤销]	139019	省直辖县级行政区划,鹿泉市[已撤销]		
-130123	正定县	河北省	石家庄市	正定县	民政部	1986年	2024年					栾城县[1992年]
-130124	栾城县	河北省	石家庄市	栾城县	民政部	1986年	2013年	[已撤销]	130111	石家庄市,栾城区		正定县[1992年]
-130125	行唐县	河北省	石家庄市	行唐县	民政部	1993年	2024年					
-130126	灵寿县	河北省	石家庄市	灵寿县	民政部	1993年	2024年					
-130127	高邑县	河北省	石家庄市	高邑县	民政部	1993年	2024年					
-130128	深泽县	河北省	石家庄市	深泽县	民政部	1993年	2024年					
-130129	赞皇县	河北省	石家庄市	赞皇县	民政部	1993年	2024年					
-130130	无极县	河北省	石家庄市	无极县	民政部	1993年	2024年					
-130131	平山县	河北省	石家庄市	平山县	民政部	1993年	2024年					
-130132	元氏县	河北省	石家庄市	元氏县	民政部	1993年	2024年					
-130133	赵县	河北省	石家庄市	赵县	民政部	1993年	2024年					
-130181	辛集市	河北省	石家庄市	辛集市	民政部	1995年	2024年					
-130182	藁城市	河北省	石家庄市	藁城市	民政部	1995年	2013年	[已撤销]	130109	石家庄市,藁城区		
-130183	晋州市	河北省	石家庄市	晋州市	民政部	1995年	2024年					
-130184	新乐市	河北省	石家庄市	新乐市	民政部	1995年	2024年					
-130185	鹿泉市	河北省	石家庄市	鹿泉市	民政部	1995年	2013年	[已撤销]	130110	石家庄市,鹿泉区		
-130200	唐山市	河北省	唐山市	-	民政部	1980年	2024年					
-130201	市辖区	河北省	唐山市	市辖区	国标							增设（GB/T 2260-1984）
-130202	路南区	河北省	唐山市	路南区	民政部	1980年	2024年					
-130203	路北区	河北省	唐山市	路北区	民政部	1980年	2024年					
-130204	古冶区	河北省	唐山市	古冶区	民政部	1980年	2024年					东矿区[1994年]
-130205	开平区	河北省	唐山市	开平区	民政部	1980年	2024年					
-130206	新区	河北省	唐山市	新区	民政部	1980年	2001年	[已撤销]	130208	唐山市,丰润区		
-130207	丰南区	河北省	唐山市	丰南区	民政部	2002年	2024年					
-130208	丰润区	河北省	唐山市	丰润区	民政部	2002年	2024年					
-130209	曹妃甸区	河北省	唐山市	曹妃甸区	民政部	2012年	2024年					
-130221	丰润县	河北省	唐山市	丰润县	民政部	1983年	2001年	[已撤销]	130208	唐山市,丰润区		
-130222	丰南县	河北省	唐山市	丰南县	民政部	1983年	1993年	[已撤销]	139020	省直辖县级行政区划,丰南市[已撤销]		
-130223	滦县	河北省	唐山市	滦县	民政部	1983年	2017年	[已撤销]	130284	唐山市,滦州市		
-130224	滦南县	河北省	唐山市	滦南县	民政部	1983年	2024年					
-130225	乐亭县	河北省	唐山市	乐亭县	民政部	1983年	2024年					
-130226	迁安县	河北省	唐山市	迁安县	民政部	1983年	1995年	[已撤销]	130283	唐山市,迁安市		玉田县[1983年]
-130227	迁西县	河北省	唐山市	迁西县	民政部	1983年	2024年					唐海县[1983年]
-130228	遵化县	河北省	唐山市	遵化县	民政部	1983年	1991年	[已撤销]	139003	省直辖县级行政区划,遵化市[已撤销]		迁安县[1983年]
-130229	玉田县	河北省	唐山市	玉田县	民政部	1983年	2024年					迁西县[1983年]
-130230	唐海县	河北省	唐山市	唐海县	民政部	1983年	2011年	[已撤销]	130209	唐山市,曹妃甸区		遵化县[1983年]
-130281	遵化市	河北省	唐山市	遵化市	民政部	1995年	2024年					
-130282	丰南市	河北省	唐山市	丰南市	民政部	1995年	2001年	[已撤销]	130207	唐山市,丰南区		
-130283	迁安市	河北省	唐山市	迁安市	民政部	1996年	2024年					
-130284	滦州市	河北省	唐山市	滦州市	民政部	2018年	2024年					
-130300	秦皇岛市	河北省	秦皇岛市	-	民政部	1983年	2024年					
-130301	市辖区	河北省	秦皇岛市	市辖区	国标							增设（GB/T 2260-1984）
-130302	海港区	河北省	秦皇岛市	海港区	民政部	1983年	2024年					
-130303	山海关区	河北省	秦皇岛市	山海关区	民政部	1983年	2024年					
-130304	北戴河区	河北省	秦皇岛市	北戴河区	民政部	1983年	2024年					
-130305	郊区	河北省	秦皇岛市	郊区	民政部	1983年	1983年	[已撤销]	130302	秦皇岛市,海港区		
-130306	抚宁区	河北省	秦皇岛市	抚宁区	民政部	2015年	2024年					
-130321	青龙满族自治县	河北省	秦皇岛市	青龙满族自治县	民政部	1983年	2024年					青龙县[1985年]
-130322	昌黎县	河北省	秦皇岛市	昌黎县	民政部	1983年	2024年					
-130323	抚宁县	河北省	秦皇岛市	抚宁县	民政部	1983年	2014年	[已撤销]	130306	秦皇岛市,抚宁区		
-130324	卢龙县	河北省	秦皇岛市	卢龙县	民政部	1983年	2024年					
-130400	邯郸市	河北省	邯郸市	-	民政部	1983年	2024年					
-130401	市辖区	河北省	邯郸市	市辖区	国标							增设（GB/T 2260-1984）
-130402	邯山区	河北省	邯郸市	邯山区	民政部	1983年	2024年					
-130403	丛台区	河北省	邯郸市	丛台区	民政部	1983年	2024年					
-130404	复兴区	河北省	邯郸市	复兴区	民政部	1983年	2024年					
-130405	郊区	河北省	邯郸市	郊区	民政部	1983年	1985年	[已撤销]	130403,130404,130402	邯郸市,丛台区,复兴区,邯山区		
-130406	峰峰矿区	河北省	邯郸市	峰峰矿区	民政部	1983年	2024年					
-130407	肥乡区	河北省	邯郸市	肥乡区	民政部	2016年	2024年					
-130408	永年区	河北省	邯郸市	永年区	民政部	2016年	2024年					
-130421	邯郸县	河北省	邯郸市	邯郸县	民政部	1983年	2015年	[已撤销]	130402,130403	邯郸市,邯山区,丛台区		
-130422	武安县	河北省	邯郸市	武安县	民政部	1986年	1987年	[已撤销]	139001	省直辖县级行政区划,武安市[已撤销]		
-130423	临漳县	河北省	邯郸市	临漳县	民政部	1993年	2024年					
-130424	成安县	河北省	邯郸市	成安县	民政部	1993年	2024年					
-130425	大名县	河北省	邯郸市	大名县	民政部	1993年	2024年					
-130426	涉县	河北省	邯郸市	涉县	民政部	1993年	2024年					
-130427	磁县	河北省	邯郸市	磁县	民政部	1993年	2024年					
-130428	肥乡县	河北省	邯郸市	肥乡县	民政部	1993年	2015年	[已撤销]	130407	邯郸市,肥乡区		
-130429	永年县	河北省	邯郸市	永年县	民政部	1993年	2015年	[已撤销]	130408	邯郸市,永年区		
-130430	邱县	河北省	邯郸市	邱县	民政部	1993年	2024年					丘县[1995年]
-130431	鸡泽县	河北省	邯郸市	鸡泽县	民政部	1993年	2024年					
-130432	广平县	河北省	邯郸市	广平县	民政部	1993年	2024年					
-130433	馆陶县	河北省	邯郸市	馆陶县	民政部	1993年	2024年					
-130434	魏县	河北省	邯郸市	魏县	民政部	1993年	2024年					
-130435	曲周县	河北省	邯郸市	曲周县	民政部	1993年	2024年					
-130481	武安市	河北省	邯郸市	武安市	民政部	1995年	2024年					
-130500	邢台市	河北省	邢台市	-	民政部	1983年	2024年					
-130501	市辖区	河北省	邢台市	市辖区	国标							增设（GB/T 2260-1984）
-130502	襄都区	河北省	邢台市	襄都区	民政部	1983年	2024年					桥东区[2019年]
-130503	信都区	河北省	邢台市	信都区	民政部	1983年	2024年					桥西区[2019年]
-130504	郊区	河北省	邢台市	郊区	民政部	1983年	1987年	[已撤销]	130502,130503	邢台市,襄都区,信都区		
-130505	任泽区	河北省	邢台市	任泽区	民政部	2020年	2024年					
-130506	南和区	河北省	邢台市	南和区	民政部	2020年	2024年					
-130521	邢台县	河北省	邢台市	邢台县	民政部	1986年	2019年	[已撤销]	130502,130503	邢台市,襄都区,信都区		
-130522	临城县	河北省	邢台市	临城县	民政部	1993年	2024年					
-130523	内丘县	河北省	邢台市	内丘县	民政部	1993年	2024年					旧称：内丘县(内邱县)；
-130524	柏乡县	河北省	邢台市	柏乡县	民政部	1993年	2024年					
-130525	隆尧县	河北省	邢台市	隆尧县	民政部	1993年	2024年					
-130526	任县	河北省	邢台市	任县	民政部	1993年	2019年	[已撤销]	130505	邢台市,任泽区		
-130527	南和县	河北省	邢台市	南和县	民政部	1993年	2019年	[已撤销]	130506	邢台市,南和区		
-130528	宁晋县	河北省	邢台市	宁晋县	民政部	1993年	2024年					
-130529	巨鹿县	河北省	邢台市	巨鹿县	民政部	1993年	2024年					
-130530	新河县	河北省	邢台市	新河县	民政部	1993年	2024年					
-130531	广宗县	河北省	邢台市	广宗县	民政部	1993年	2024年					
-130532	平乡县	河北省	邢台市	平乡县	民政部	1993年	2024年					
-130533	威县	河北省	邢台市	威县	民政部	1993年	2024年					
-130534	清河县	河北省	邢台市	清河县	民政部	1993年	2024年					
-130535	临西县	河北省	邢台市	临西县	民政部	1993年	2024年					
-130581	南宫市	河北省	邢台市	南宫市	民政部	1995年	2024年					
-130582	沙河市	河北省	邢台市	沙河市	民政部	1995年	2024年					
-130600	保定市	河北省	保定市	-	民政部	1983年	2024年					
-130601	市辖区	河北省	保定市	市辖区	国标							增设（GB/T 2260-1984）
-130602	竞秀区	河北省	保定市	竞秀区	民政部	1983年	2024年					新市区[2014年]
-130603	北市区	河北省	保定市	北市区	民政部	1983年	2014年	[已撤销]	130606	保定市,莲池区		
-130604	南市区	河北省	保定市	南市区	民政部	1983年	2014年	[已撤销]	130606	保定市,莲池区		
-130605	郊区	河北省	保定市	郊区	民政部	1983年	1986年	[已撤销]	130604,130603,130602	保定市,南市区[已撤销],北市区[已撤销],竞秀区		
-130606	莲池区	河北省	保定市	莲池区	民政部	2015年	2024年					
-130607	满城区	河北省	保定市	满城区	民政部	2015年	2024年					
-130608	清苑区	河北省	保定市	清苑区	民政部	2015年	2024年					
-130609	徐水区	河北省	保定市	徐水区	民政部	2015年	2024年					
-130621	满城县	河北省	保定市	满城县	民政部	1983年	2014年	[已撤销]	130607	保定市,满城区		
-130622	清苑县	河北省	保定市	清苑县	民政部	1986年	2014年	[已撤销]	130608	保定市,清苑区		
-130623	涞水县	河北省	保定市	涞水县	民政部	1994年	2024年					
-130624	阜平县	河北省	保定市	阜平县	民政部	1994年	2024年					
-130625	徐水县	河北省	保定市	徐水县	民政部	1994年	2014年	[已撤销]	130609	保定市,徐水区		
-130626	定兴县	河北省	保定市	定兴县	民政部	1994年	2024年					
-130627	唐县	河北省	保定市	唐县	民政部	1994年	2024年					
-130628	高阳县	河北省	保定市	高阳县	民政部	1994年	2024年					
-130629	容城县	河北省	保定市	容城县	民政部	1994年	2024年					
-130630	涞源县	河北省	保定市	涞源县	民政部	1994年	2024年					
-130631	望都县	河北省	保定市	望都县	民政部	1994年	2024年					
-130632	安新县	河北省	保定市	安新县	民政部	1994年	2024年					
-130633	易县	河北省	保定市	易县	民政部	1994年	2024年					
-130634	曲阳县	河北省	保定市	曲阳县	民政部	1994年	2024年					
-130635	蠡县	河北省	保定市	蠡县	民政部	1994年	2024年					
-130636	顺平县	河北省	保定市	顺平县	民政部	1994年	2024年					
-130637	博野县	河北省	保定市	博野县	民政部	1994年	2024年					
-130638	雄县	河北省	保定市	雄县	民政部	1994年	2024年					
-130681	涿州市	河北省	保定市	涿州市	民政部	1995年	2024年					
-130682	定州市	河北省	保定市	定州市	民政部	1995年	2024年					
-130683	安国市	河北省	保定市	安国市	民政部	1995年	2024年					
-130684	高碑店市	河北省	保定市	高碑店市	民政部	1995年	2024年					
-130700	张家口市	河北省	张家口市	-	民政部	1983年	2024年					
-130701	市辖区	河北省	张家口市	市辖区	国标							增设（GB/T 2260-1984）
-130702	桥东区	河北省	张家口市	桥东区	民政部	1983年	2024年					
-130703	桥西区	河北省	张家口市	桥西区	民政部	1983年	2024年					
-130704	茶坊区	河北省	张家口市	茶坊区	民政部	1983年	1988年	[已撤销]	130703	张家口市,桥西区		
-130705	宣化区	河北省	张家口市	宣化区	民政部	1983年	2024年					
-130706	下花园区	河北省	张家口市	下花园区	民政部	1983年	2024年					
-130707	庞家堡区	河北省	张家口市	庞家堡区	民政部	1983年	1988年	[已撤销]	130705	张家口市,宣化区		
-130708	万全区	河北省	张家口市	万全区	民政部	2016年	2024年					
-130709	崇礼区	河北省	张家口市	崇礼区	民政部	2016年	2024年					
-130721	宣化县	河北省	张家口市	宣化县	民政部	1983年	2015年	[已撤销]	130705	张家口市,宣化区		
-130722	张北县	河北省	张家口市	张北县	民政部	1993年	2024年					
-130723	康保县	河北省	张家口市	康保县	民政部	1993年	2024年					
-130724	沽源县	河北省	张家口市	沽源县	民政部	1993年	2024年					
-130725	尚义县	河北省	张家口市	尚义县	民政部	1993年	2024年					
-130726	蔚县	河北省	张家口市	蔚县	民政部	1993年	2024年					
-130727	阳原县	河北省	张家口市	阳原县	民政部	1993年	2024年					
-130728	怀安县	河北省	张家口市	怀安县	民政部	1993年	2024年					
-130729	万全县	河北省	张家口市	万全县	民政部	1993年	2015年	[已撤销]	130708	张家口市,万全区		
-130730	怀来县	河北省	张家口市	怀来县	民政部	1993年	2024年					
-130731	涿鹿县	河北省	张家口市	涿鹿县	民政部	1993年	2024年					
-130732	赤城县	河北省	张家口市	赤城县	民政部	1993年	2024年					
-130733	崇礼县	河北省	张家口市	崇礼县	民政部	1993年	2015年	[已撤销]	130709	张家口市,崇礼区		
-130800	承德市	河北省	承德市	-	民政部	1983年	2024年					
-130801	市辖区	河北省	承德市	市辖区	国标							增设（GB/T 2260-1984）
-130802	双桥区	河北省	承德市	双桥区	民政部	1983年	2024年					
-130803	双滦区	河北省	承德市	双滦区	民政部	1983年	2024年					
-130804	鹰手营子矿区	河北省	承德市	鹰手营子矿区	民政部	1983年	2024年					
-130821	承德县	河北省	承德市	承德县	民政部	1983年	2024年					
-130822	兴隆县	河北省	承德市	兴隆县	民政部	1993年	2024年					
-130823	平泉县	河北省	承德市	平泉县	民政部	1993年	2016年	[已撤销]	130881	承德市,平泉市		
-130824	滦平县	河北省	承德市	滦平县	民政部	1993年	2024年					
-130825	隆化县	河北省	承德市	隆化县	民政部	1993年	2024年					
-130826	丰宁满族自治县	河北省	承德市	丰宁满族自治县	民政部	1993年	2024年					
-130827	宽城满族自治县	河北省	承德市	宽城满族自治县	民政部	1993年	2024年					
-130828	围场满族蒙古族自治县	河北省	承德市	围场满族蒙古族自治县	民政部	1993年	2024年					
-130881	平泉市	河北省	承德市	平泉市	民政部	2017年	2024年					
-130900	沧州市	河北省	沧州市	-	民政部	1983年	2024年					
-130901	市辖区	河北省	沧州市	市辖区	国标							增设（GB/T 2260-1984）
-130902	新华区	河北省	沧州市	新华区	民政部	1983年	2024年					
-130903	运河区	河北省	沧州市	运河区	民政部	1983年	2024年					
-130904	郊区	河北省	沧州市	郊区	民政部	1983年	1996年	[已撤销]	130903,130902	沧州市,运河区,新华区		
-130921	沧县	河北省	沧州市	沧县	民政部	1983年	2024年					
-130922	青县	河北省	沧州市	青县	民政部	1986年	2024年					
-130923	东光县	河北省	沧州市	东光县	民政部	1993年	2024年					
-130924	海兴县	河北省	沧州市	海兴县	民政部	1993年	2024年					
-130925	盐山县	河北省	沧州市	盐山县	民政部	1993年	2024年					
-130926	肃宁县	河北省	沧州市	肃宁县	民政部	1993年	2024年					
-130927	南皮县	河北省	沧州市	南皮县	民政部	1993年	2024年					
-130928	吴桥县	河北省	沧州市	吴桥县	民政部	1993年	2024年					
-130929	献县	河北省	沧州市	献县	民政部	1993年	2024年					
-130930	孟村回族自治县	河北省	沧州市	孟村回族自治县	民政部	1993年	2024年					
-130981	泊头市	河北省	沧州市	泊头市	民政部	1995年	2024年					
-130982	任丘市	河北省	沧州市	任丘市	民政部	1995年	2024年					旧称：任丘市(任邱市)；
-130983	黄骅市	河北省	沧州市	黄骅市	民政部	1995年	2024年					
-130984	河间市	河北省	沧州市	河间市	民政部	1995年	2024年					
-131000	廊坊市	河北省	廊坊市	-	民政部	1988年	2024年					
-131001	市辖区	河北省	廊坊市	市辖区	国标							
-131002	安次区	河北省	廊坊市	安次区	民政部	1988年	2024年					
-131003	广阳区	河北省	廊坊市	广阳区	民政部	2000年	2024年					
-131021	三河县	河北省	廊坊市	三河县	民政部	1988年	1992年	[已撤销]	139012	省直辖县级行政区划,三河市[已撤销]		
-131022	固安县	河北省	廊坊市	固安县	民政部	1988年	2024年					
-131023	永清县	河北省	廊坊市	永清县	民政部	1988年	2024年					
-131024	香河县	河北省	廊坊市	香河县	民政部	1988年	2024年					
-131025	大城县	河北省	廊坊市	大城县	民政部	1988年	2024年					
-131026	文安县	河北省	廊坊市	文安县	民政部	1988年	2024年					
-131027	霸县	河北省	廊坊市	霸县	民政部	1988年	1989年	[已撤销]	139002	省直辖县级行政区划,霸州市[已撤销]		
-131028	大厂回族自治县	河北省	廊坊市	大厂回族自治县	民政部	1988年	2024年					
-131081	霸州市	河北省	廊坊市	霸州市	民政部	1995年	2024年					
-131082	三河市	河北省	廊坊市	三河市	民政部	1995年	2024年					
-131100	衡水市	河北省	衡水市	-	民政部	1996年	2024年					
-131101	市辖区	河北省	衡水市	市辖区	国标							
-131102	桃城区	河北省	衡水市	桃城区	民政部	1996年	2024年					
-131103	冀州区	河北省	衡水市	冀州区	民政部	2016年	2024年					
-131121	枣强县	河北省	衡水市	枣强县	民政部	1996年	2024年					
-131122	武邑县	河北省	衡水市	武邑县	民政部	1996年	2024年					
-131123	武强县	河北省	衡水市	武强县	民政部	1996年	2024年					
-131124	饶阳县	河北省	衡水市	饶阳县	民政部	1996年	2024年					
-131125	安平县	河北省	衡水市	安平县	民政部	1996年	2024年					
-131126	故城县	河北省	衡水市	故城县	民政部	1996年	2024年					
-131127	景县	河北省	衡水市	景县	民政部	1996年	2024年					
-131128	阜城县	河北省	衡水市	阜城县	民政部	1996年	2024年					
-131181	冀州市	河北省	衡水市	冀州市	民政部	1996年	2015年	[已撤销]	131103	衡水市,冀州区		
-131182	深州市	河北省	衡水市	深州市	民政部	1996年	2024年					
-132100	邯郸地区	河北省	邯郸地区	-	民政部	1980年	1992年	[已撤销]	130400	邯郸市（地市）		
-132101	邯郸市	河北省	邯郸地区	邯郸市	民政部	1980年	1982年	[已撤销]	130400	邯郸市（地市）		
-132102	邯山区	河北省	邯郸地区	邯山区	民政部	1980年	1982年	[已撤销]	130402	邯郸市,邯山区		
-132103	丛台区	河北省	邯郸地区	丛台区	民政部	1980年	1982年	[已撤销]	130403	邯郸市,丛台区		
-132104	复兴区	河北省	邯郸地区	复兴区	民政部	1980年	1982年	[已撤销]	130404	邯郸市,复兴区		
-132105	郊区	河北省	邯郸地区	郊区	民政部	1980年	1982年	[已撤销]	130405	邯郸市,郊区[已撤销]		
-132106	峰峰矿区	河北省	邯郸地区	峰峰矿区	民政部	1980年	1982年	[已撤销]	130406	邯郸市,峰峰矿区		
-132121	大名县	河北省	邯郸地区	大名县	民政部	1980年	1992年	[已撤销]	130425	邯郸市,大名县		
-132122	魏县	河北省	邯郸地区	魏县	民政部	1980年	1992年	[已撤销]	130434	邯郸市,魏县		
-132123	曲周县	河北省	邯郸地区	曲周县	民政部	1980年	1992年	[已撤销]	130435	邯郸市,曲周县		
-132124	丘县	河北省	邯郸地区	丘县	民政部	1980年	1992年	[已撤销]	130430	邯郸市,邱县		旧称：丘县(邱县)；
-132125	鸡泽县	河北省	邯郸地区	鸡泽县	民政部	1980年	1992年	[已撤销]	130431	邯郸市,鸡泽县		
-132126	肥乡县	河北省	邯郸地区	肥乡县	民政部	1980年	1992年	[已撤销]	130428	邯郸市,肥乡县[已撤销]		
-132127	广平县	河北省	邯郸地区	广平县	民政部	1980年	1992年	[已撤销]	130432	邯郸市,广平县		
-132128	成安县	河北省	邯郸地区	成安县	民政部	1980年	1992年	[已撤销]	130424	邯郸市,成安县		
-132129	临漳县	河北省	邯郸地区	临漳县	民政部	1980年	1992年	[已撤销]	130423	邯郸市,临漳县		
-132130	磁县	河北省	邯郸地区	磁县	民政部	1980年	1992年	[已撤销]	130427	邯郸市,磁县		
-132131	武安县	河北省	邯郸地区	武安县	民政部	1980年	1985年	[已撤销]	130422	邯郸市,武安县[已撤销]		
-132132	涉县	河北省	邯郸地区	涉县	民政部	1980年	1992年	[已撤销]	130426	邯郸市,涉县		
-132133	永年县	河北省	邯郸地区	永年县	民政部	1980年	1992年	[已撤销]	130429	邯郸市,永年县[已撤销]		
-132134	邯郸县	河北省	邯郸地区	邯郸县	民政部	1980年	1982年	[已撤销]	130421	邯郸市,邯郸县[已撤销]		
-132135	馆陶县	河北省	邯郸地区	馆陶县	民政部	1980年	1992年	[已撤销]	130433	邯郸市,馆陶县		
-132200	邢台地区	河北省	邢台地区	-	民政部	1980年	1992年	[已撤销]	130500	邢台市（地市）		
-132201	南宫市	河北省	邢台地区	南宫市	民政部	1980年	1992年	[已撤销]	139013	省直辖县级行政区划,南宫市[已撤销]		邢台市[1982年]
-132202	沙河市	河北省	邢台地区	沙河市	民政部	1980年	1992年	[已撤销]	139014	省直辖县级行政区划,沙河市[已撤销]		桥东区[1982年]
-132203	桥西区	河北省	邢台地区	桥西区	民政部	1980年	1982年	[已撤销]	130703	张家口市,桥西区		
-132204	郊区	河北省	邢台地区	郊区	民政部	1980年	1982年	[已撤销]	130504	邢台市,郊区[已撤销]		
-132221	邢台县	河北省	邢台地区	邢台县	民政部	1980年	1985年	[已撤销]	130521	邢台市,邢台县[已撤销]		
-132222	沙河县	河北省	邢台地区	沙河县	民政部	1980年	1986年	[已撤销]	132202	邢台地区,沙河市[已撤销]		
-132223	临城县	河北省	邢台地区	临城县	民政部	1980年	1992年	[已撤销]	130522	邢台市,临城县		
-132224	内丘县	河北省	邢台地区	内丘县	民政部	1980年	1992年	[已撤销]	130523	邢台市,内丘县		旧称：内丘县(内邱县)；
-132225	柏乡县	河北省	邢台地区	柏乡县	民政部	1980年	1992年	[已撤销]	130524	邢台市,柏乡县		
-132226	隆尧县	河北省	邢台地区	隆尧县	民政部	1980年	1992年	[已撤销]	130525	邢台市,隆尧县		
-132227	任县	河北省	邢台地区	任县	民政部	1980年	1992年	[已撤销]	130526	邢台市,任县[已撤销]		
-132228	南和县	河北省	邢台地区	南和县	民政部	1980年	1992年	[已撤销]	130527	邢台市,南和县[已撤销]		
-132229	宁晋县	河北省	邢台地区	宁晋县	民政部	1980年	1992年	[已撤销]	130528	邢台市,宁晋县		
-132230	南宫县	河北省	邢台地区	南宫县	民政部	1980年	1985年	[已撤销]	132201	邢台地区,南宫市[已撤销]		
-132231	巨鹿县	河北省	邢台地区	巨鹿县	民政部	1980年	1992年	[已撤销]	130529	邢台市,巨鹿县		
-132232	新河县	河北省	邢台地区	新河县	民政部	1980年	1992年	[已撤销]	130530	邢台市,新河县		
-132233	广宗县	河北省	邢台地区	广宗县	民政部	1980年	1992年	[已撤销]	130531	邢台市,广宗县		
-132234	平乡县	河北省	邢台地区	平乡县	民政部	1980年	1992年	[已撤销]	130532	邢台市,平乡县		
-132235	威县	河北省	邢台地区	威县	民政部	1980年	1992年	[已撤销]	130533	邢台市,威县		
-132236	清河县	河北省	邢台地区	清河县	民政部	1980年	1992年	[已撤销]	130534	邢台市,清河县		
-132237	临西县	河北省	邢台地区	临西县	民政部	1980年	1992年	[已撤销]	130535	邢台市,临西县		
-132300	石家庄地区	河北省	石家庄地区	-	民政部	1980年	1992年	[已撤销]	130100	石家庄市（地市）		
-132301	辛集市	河北省	石家庄地区	辛集市	民政部	1986年	1992年	[已撤销]	139004	省直辖县级行政区划,辛集市[已撤销]		
-132302	藁城市	河北省	石家庄地区	藁城市	民政部	1989年	1992年	[已撤销]	139005	省直辖县级行政区划,藁城市[已撤销]		
-132303	晋州市	河北省	石家庄地区	晋州市	民政部	1991年	1992年	[已撤销]	139006	省直辖县级行政区划,晋州市[已撤销]		
-132304	新乐市	河北省	石家庄地区	新乐市	民政部	1992年	1992年	[已撤销]	139007	省直辖县级行政区划,新乐市[已撤销]		
-132321	束鹿县	河北省	石家庄地区	束鹿县	民政部	1980年	1985年	[已撤销]	132301	石家庄地区,辛集市[已撤销]		
-132322	晋县	河北省	石家庄地区	晋县	民政部	1980年	1990年	[已撤销]	132303	石家庄地区,晋州市[已撤销]		
-132323	深泽县	河北省	石家庄地区	深泽县	民政部	1980年	1992年	[已撤销]	130128	石家庄市,深泽县		
-132324	无极县	河北省	石家庄地区	无极县	民政部	1980年	1992年	[已撤销]	130130	石家庄市,无极县		
-132325	藁城县	河北省	石家庄地区	藁城县	民政部	1980年	1988年	[已撤销]	132302	石家庄地区,藁城市[已撤销]		
-132326	赵县	河北省	石家庄地区	赵县	民政部	1980年	1992年	[已撤销]	130133	石家庄市,赵县		
-132327	栾城县	河北省	石家庄地区	栾城县	民政部	1980年	1985年	[已撤销]	130124	石家庄市,栾城县[已撤销]		
-132328	正定县	河北省	石家庄地区	正定县	民政部	1980年	1985年	[已撤销]	130123	石家庄市,正定县		
-132329	新乐县	河北省	石家庄地区	新乐县	民政部	1980年	1991年	[已撤销]	132304	石家庄地区,新乐市[已撤销]		
-132330	高邑县	河北省	石家庄地区	高邑县	民政部	1980年	1992年	[已撤销]	130127	石家庄市,高邑县		
-132331	元氏县	河北省	石家庄地区	元氏县	民政部	1980年	1992年	[已撤销]	130132	石家庄市,元氏县		
-132332	赞皇县	河北省	石家庄地区	赞皇县	民政部	1980年	1992年	[已撤销]	130129	石家庄市,赞皇县		
-132333	井陉县	河北省	石家庄地区	井陉县	民政部	1980年	1982年	[已撤销]	130121	石家庄市,井陉县		
-132334	获鹿县	河北省	石家庄地区	获鹿县	民政部	1980年	1982年	[已撤销]	130122	石家庄市,获鹿县[已撤销]		
-132335	平山县	河北省	石家庄地区	平山县	民政部	1980年	1992年	[已撤销]	130131	石家庄市,平山县		
-132336	灵寿县	河北省	石家庄地区	灵寿县	民政部	1980年	1992年	[已撤销]	130126	石家庄市,灵寿县		
-132337	行唐县	河北省	石家庄地区	行唐县	民政部	1980年	1992年	[已撤销]	130125	石家庄市,行唐县		
-132400	保定地区	河北省	保定地区	-	民政部	1980年	1993年	[已撤销]	130600	保定市（地市）		
-132401	定州市	河北省	保定地区	定州市	民政部	1980年	1993年	[已撤销]	139015	省直辖县级行政区划,定州市[已撤销]		保定市[1982年]
-132402	涿州市	河北省	保定地区	涿州市	民政部	1980年	1993年	[已撤销]	139016	省直辖县级行政区划,涿州市[已撤销]		新市区[1982年]
-132403	安国市	河北省	保定地区	安国市	民政部	1980年	1993年	[已撤销]	139017	省直辖县级行政区划,安国市[已撤销]		北市区[1982年]
-132404	高碑店市	河北省	保定地区	高碑店市	民政部	1980年	1993年	[已撤销]	139018	省直辖县级行政区划,高碑店市[已撤销]		
-132405	郊区	河北省	保定地区	郊区	民政部	1980年	1982年	[已撤销]	130605	保定市,郊区[已撤销]		
-132421	易县	河北省	保定地区	易县	民政部	1980年	1993年	[已撤销]	130633	保定市,易县		
-132422	满城县	河北省	保定地区	满城县	民政部	1980年	1982年	[已撤销]	130621	保定市,满城县[已撤销]		
-132423	徐水县	河北省	保定地区	徐水县	民政部	1980年	1993年	[已撤销]	130625	保定市,徐水县[已撤销]		
-132424	涞源县	河北省	保定地区	涞源县	民政部	1980年	1993年	[已撤销]	130630	保定市,涞源县		
-132425	定兴县	河北省	保定地区	定兴县	民政部	1980年	1993年	[已撤销]	130626	保定市,定兴县		
-132426	顺平县	河北省	保定地区	顺平县	民政部	1980年	1993年	[已撤销]	130636	保定市,顺平县		完县[1992年]
-132427	唐县	河北省	保定地区	唐县	民政部	1980年	1993年	[已撤销]	130627	保定市,唐县		
-132428	望都县	河北省	保定地区	望都县	民政部	1980年	1993年	[已撤销]	130631	保定市,望都县		
-132429	涞水县	河北省	保定地区	涞水县	民政部	1980年	1993年	[已撤销]	130623	保定市,涞水县		
-132430	涿县	河北省	保定地区	涿县	民政部	1980年	1985年	[已撤销]	132402	保定地区,涿州市[已撤销]		
-132431	清苑县	河北省	保定地区	清苑县	民政部	1980年	1985年	[已撤销]	130622	保定市,清苑县[已撤销]		
-132432	高阳县	河北省	保定地区	高阳县	民政部	1980年	1993年	[已撤销]	130628	保定市,高阳县		
-132433	安新县	河北省	保定地区	安新县	民政部	1980年	1993年	[已撤销]	130632	保定市,安新县		
-132434	雄县	河北省	保定地区	雄县	民政部	1980年	1993年	[已撤销]	130638	保定市,雄县		
-132435	容城县	河北省	保定地区	容城县	民政部	1980年	1993年	[已撤销]	130629	保定市,容城县		
-132436	新城县	河北省	保定地区	新城县	民政部	1980年	1992年	[已撤销]	130684	保定市,高碑店市		
-132437	曲阳县	河北省	保定地区	曲阳县	民政部	1980年	1993年	[已撤销]	130634	保定市,曲阳县		
-132438	阜平县	河北省	保定地区	阜平县	民政部	1980年	1993年	[已撤销]	130624	保定市,阜平县		
-132439	定县	河北省	保定地区	定县	民政部	1980年	1985年	[已撤销]	132401	保定地区,定州市[已撤销]		
-132440	安国县	河北省	保定地区	安国县	民政部	1980年	1990年	[已撤销]	132403	保定地区,安国市[已撤销]		
-132441	博野县	河北省	保定地区	博野县	民政部	1980年	1993年	[已撤销]	130637	保定市,博野县		
-132442	蠡县	河北省	保定地区	蠡县	民政部	1980年	1993年	[已撤销]	130635	保定市,蠡县		
-132500	张家口地区	河北省	张家口地区	-	民政部	1980年	1992年	[已撤销]	130700	张家口市（地市）		
-132501	张家口市	河北省	张家口地区	张家口市	民政部	1980年	1982年	[已撤销]	130700	张家口市（地市）		
-132502	桥东区	河北省	张家口地区	桥东区	民政部	1980年	1982年	[已撤销]	130702	张家口市,桥东区		
-132503	桥西区	河北省	张家口地区	桥西区	民政部	1980年	1982年	[已撤销]	130703	张家口市,桥西区		
-132504	茶坊区	河北省	张家口地区	茶坊区	民政部	1980年	1982年	[已撤销]	130704	张家口市,茶坊区[已撤销]		
-132505	宣化区	河北省	张家口地区	宣化区	民政部	1980年	1982年	[已撤销]	130705	张家口市,宣化区		
-132506	下花园区	河北省	张家口地区	下花园区	民政部	1980年	1982年	[已撤销]	130706	张家口市,下花园区		
-132507	庞家堡区	河北省	张家口地区	庞家堡区	民政部	1980年	1982年	[已撤销]	130707	张家口市,庞家堡区[已撤销]		
-132521	张北县	河北省	张家口地区	张北县	民政部	1980年	1992年	[已撤销]	130722	张家口市,张北县		
-132522	康保县	河北省	张家口地区	康保县	民政部	1980年	1992年	[已撤销]	130723	张家口市,康保县		
-132523	沽源县	河北省	张家口地区	沽源县	民政部	1980年	1992年	[已撤销]	130724	张家口市,沽源县		
-132524	尚义县	河北省	张家口地区	尚义县	民政部	1980年	1992年	[已撤销]	130725	张家口市,尚义县		
-132525	蔚县	河北省	张家口地区	蔚县	民政部	1980年	1992年	[已撤销]	130726	张家口市,蔚县		
-132526	阳原县	河北省	张家口地区	阳原县	民政部	1980年	1992年	[已撤销]	130727	张家口市,阳原县		
-132527	怀安县	河北省	张家口地区	怀安县	民政部	1980年	1992年	[已撤销]	130728	张家口市,怀安县		
-132528	万全县	河北省	张家口地区	万全县	民政部	1980年	1992年	[已撤销]	130729	张家口市,万全县[已撤销]		
-132529	怀来县	河北省	张家口地区	怀来县	民政部	1980年	1992年	[已撤销]	130730	张家口市,怀来县		
-132530	涿鹿县	河北省	张家口地区	涿鹿县	民政部	1980年	1992年	[已撤销]	130731	张家口市,涿鹿县		
-132531	宣化县	河北省	张家口地区	宣化县	民政部	1980年	1982年	[已撤销]	130721	张家口市,宣化县[已撤销]		
-132532	赤城县	河北省	张家口地区	赤城县	民政部	1980年	1992年	[已撤销]	130732	张家口市,赤城县		
-132533	崇礼县	河北省	张家口地区	崇礼县	民政部	1980年	1992年	[已撤销]	130733	张家口市,崇礼县[已撤销]		
-132600	承德地区	河北省	承德地区	-	民政部	1980年	1992年	[已撤销]	130800	承德市（地市）		
-132601	承德市	河北省	承德地区	承德市	民政部	1980年	1982年	[已撤销]	130800	承德市（地市）		
-132602	双桥区	河北省	承德地区	双桥区	民政部	1980年	1982年	[已撤销]	130802	承德市,双桥区		
-132603	双滦区	河北省	承德地区	双滦区	民政部	1980年	1982年	[已撤销]	130803	承德市,双滦区		
-132604	鹰手营子矿区	河北省	承德地区	鹰手营子矿区	民政部	1980年	1982年	[已撤销]	130804	承德市,鹰手营子矿区		
-132621	青龙县	河北省	承德地区	青龙县	民政部	1980年	1982年	[已撤销]	130321	秦皇岛市,青龙满族自治县		
-132622	宽城满族自治县	河北省	承德地区	宽城满族自治县	民政部	1980年	1992年	[已撤销]	130827	承德市,宽城满族自治县		宽城县[1988年]
-132623	兴隆县	河北省	承德地区	兴隆县	民政部	1980年	1992年	[已撤销]	130822	承德市,兴隆县		
-132624	平泉县	河北省	承德地区	平泉县	民政部	1980年	1992年	[已撤销]	130823	承德市,平泉县[已撤销]		
-132625	承德县	河北省	承德地区	承德县	民政部	1980年	1982年	[已撤销]	130800	承德市（地市）		
-132626	滦平县	河北省	承德地区	滦平县	民政部	1980年	1992年	[已撤销]	130824	承德市,滦平县		
-132627	丰宁满族自治县	河北省	承德地区	丰宁满族自治县	民政部	1980年	1992年	[已撤销]	130826	承德市,丰宁满族自治县		丰宁县[1985年]
-132628	隆化县	河北省	承德地区	隆化县	民政部	1980年	1992年	[已撤销]	130825	承德市,隆化县		
-132629	围场满族蒙古族自治县	河北省	承德地区	围场满族蒙古族自治县	民政部	1980年	1992年	[已撤销]	130828	承德市,围场满族蒙古族自治县		围场县[1988年]
-132700	唐山地区	河北省	唐山地区	-	民政部	1980年	1982年	[已撤销]	130200	唐山市（地市）		
-132701	秦皇岛市	河北省	唐山地区	秦皇岛市	民政部	1980年	1982年	[已撤销]	130300	秦皇岛市（地市）		
-132702	海港区	河北省	唐山地区	海港区	民政部	1980年	1982年	[已撤销]	130302	秦皇岛市,海港区		
-132703	山海关区	河北省	唐山地区	山海关区	民政部	1980年	1982年	[已撤销]	130303	秦皇岛市,山海关区		
-132704	北戴河区	河北省	唐山地区	北戴河区	民政部	1980年	1982年	[已撤销]	130304	秦皇岛市,北戴河区		
-132705	郊区	河北省	唐山地区	郊区	民政部	1980年	1982年	[已撤销]	130205	唐山市,开平区		
-132721	丰润县	河北省	唐山地区	丰润县	民政部	1980年	1982年	[已撤销]	130221	唐山市,丰润县[已撤销]		
-132722	丰南县	河北省	唐山地区	丰南县	民政部	1980年	1982年	[已撤销]	130222	唐山市,丰南县[已撤销]		
-132723	滦县	河北省	唐山地区	滦县	民政部	1980年	1982年	[已撤销]	130223	唐山市,滦县[已撤销]		
-132724	滦南县	河北省	唐山地区	滦南县	民政部	1980年	1982年	[已撤销]	130224	唐山市,滦南县		
-132725	乐亭县	河北省	唐山地区	乐亭县	民政部	1980年	1982年	[已撤销]	130225	唐山市,乐亭县		
-132726	昌黎县	河北省	唐山地区	昌黎县	民政部	1980年	1982年	[已撤销]	130322	秦皇岛市,昌黎县		
-132727	抚宁县	河北省	唐山地区	抚宁县	民政部	1980年	1982年	[已撤销]	130323	秦皇岛市,抚宁县[已撤销]		
-132728	卢龙县	河北省	唐山地区	卢龙县	民政部	1980年	1982年	[已撤销]	130324	秦皇岛市,卢龙县		
-132729	迁安县	河北省	唐山地区	迁安县	民政部	1980年	1982年	[已撤销]	130226	唐山市,迁安县[已撤销]		
-132730	迁西县	河北省	唐山地区	迁西县	民政部	1980年	1982年	[已撤销]	130227	唐山市,迁西县		
-132731	遵化县	河北省	唐山地区	遵化县	民政部	1980年	1982年	[已撤销]	130228	唐山市,遵化县[已撤销]		
-132732	玉田县	河北省	唐山地区	玉田县	民政部	1980年	1982年	[已撤销]	130229	唐山市,玉田县		
-132733	唐海县	河北省	唐山地区	唐海县	民政部	1982年	1982年	[已撤销]	130230	唐山市,唐海县[已撤销]		
-132800	廊坊地区	河北省	廊坊地区	-	民政部	1980年	1987年	[已撤销]	131000	廊坊市（地市）		
-132801	廊坊市	河北省	廊坊地区	廊坊市	民政部	1981年	1987年	[已撤销]	131000	廊坊市（地市）		
-132821	三河县	河北省	廊坊地区	三河县	民政部	1980年	1987年	[已撤销]	131021	廊坊市,三河县[已撤销]		
-132822	大厂回族自治县	河北省	廊坊地区	大厂回族自治县	民政部	1980年	1987年	[已撤销]	131028	廊坊市,大厂回族自治县		
-132823	香河县	河北省	廊坊地区	香河县	民政部	1980年	1987年	[已撤销]	131024	廊坊市,香河县		
-132824	安次县	河北省	廊坊地区	安次县	民政部	1980年	1982年	[已撤销]	132801	廊坊地区,廊坊市[已撤销]		
-132825	永清县	河北省	廊坊地区	永清县	民政部	1980年	1987年	[已撤销]	131023	廊坊市,永清县		
-132826	固安县	河北省	廊坊地区	固安县	民政部	1980年	1987年	[已撤销]	131022	廊坊市,固安县		
-132827	霸县	河北省	廊坊地区	霸县	民政部	1980年	1987年	[已撤销]	131027	廊坊市,霸县[已撤销]		
-132828	文安县	河北省	廊坊地区	文安县	民政部	1980年	1987年	[已撤销]	131026	廊坊市,文安县		
-132829	大城县	河北省	廊坊地区	大城县	民政部	1980年	1987年	[已撤销]	131025	廊坊市,大城县		
-132900	沧州地区	河北省	沧州地区	-	民政部	1980年	1992年	[已撤销]	130900	沧州市（地市）		
-132901	沧州市	河北省	沧州地区	沧州市	民政部	1980年	1982年	[已撤销]	130900	沧州市（地市）		
-132902	泊头市	河北省	沧州地区	泊头市	民政部	1980年	1992年	[已撤销]	139008	省直辖县级行政区划,泊头市[已撤销]		新华区[1982年]
-132903	任丘市	河北省	沧州地区	任丘市	民政部	1980年	1992年	[已撤销]	139009	省直辖县级行政区划,任丘市[已撤销]		旧称：任丘市(任邱市)；运河区[1982年]
-132904	黄骅市	河北省	沧州地区	黄骅市	民政部	1980年	1992年	[已撤销]	139010	省直辖县级行政区划,黄骅市[已撤销]		郊区[1982年]
-132905	河间市	河北省	沧州地区	河间市	民政部	1982年	1992年	[已撤销]	139011	省直辖县级行政区划,河间市[已撤销]		泊头市[1983年]
-132921	沧县	河北省	沧州地区	沧县	民政部	1980年	1982年	[已撤销]	130921	沧州市,沧县		
-132922	河间县	河北省	沧州地区	河间县	民政部	1980年	1989年	[已撤销]	132905	沧州地区,河间市[已撤销]		
-132923	肃宁县	河北省	沧州地区	肃宁县	民政部	1980年	1992年	[已撤销]	130926	沧州市,肃宁县		
-132924	献县	河北省	沧州地区	献县	民政部	1980年	1992年	[已撤销]	130929	沧州市,献县		
-132925	交河县	河北省	沧州地区	交河县	民政部	1980年	1982年	[已撤销]	132902	沧州地区,泊头市[已撤销]		
-132926	吴桥县	河北省	沧州地区	吴桥县	民政部	1980年	1992年	[已撤销]	130928	沧州市,吴桥县		
-132927	东光县	河北省	沧州地区	东光县	民政部	1980年	1992年	[已撤销]	130923	沧州市,东光县		
-132928	南皮县	河北省	沧州地区	南皮县	民政部	1980年	1992年	[已撤销]	130927	沧州市,南皮县		
-132929	盐山县	河北省	沧州地区	盐山县	民政部	1980年	1992年	[已撤销]	130925	沧州市,盐山县		
-132930	黄骅县	河北省	沧州地区	黄骅县	民政部	1980年	1988年	[已撤销]	612632	延安地区,黄陵县[已撤销]		
-132931	孟村回族自治县	河北省	沧州地区	孟村回族自治县	民政部	1980年	1992年	[已撤销]	130930	沧州市,孟村回族自治县		
-132932	青县	河北省	沧州地区	青县	民政部	1980年	1985年	[已撤销]	130922	沧州市,青县		
-132933	任丘县	河北省	沧州地区	任丘县	民政部	1980年	1985年	[已撤销]	132903	沧州地区,任丘市[已撤销]		旧称：任丘县(任邱县)；
-132934	海兴县	河北省	沧州地区	海兴县	民政部	1980年	1992年	[已撤销]	130924	沧州市,海兴县		
-133000	衡水地区	河北省	衡水地区	-	民政部	1980年	1995年	[已撤销]	131100	衡水市（地市）		
-133001	衡水市	河北省	衡水地区	衡水市	民政部	1982年	1995年	[已撤销]	131100	衡水市（地市）		
-133002	冀州市	河北省	衡水地区	冀州市	民政部	1993年	1995年	[已撤销]	131181	衡水市,冀州市[已撤销]		
-133003	深州市	河北省	衡水地区	深州市	民政部	1994年	1995年	[已撤销]	131182	衡水市,深州市		
-133021	衡水县	河北省	衡水地区	衡水县	民政部	1980年	1982年	[已撤销]	131102	衡水市,桃城区		
-133022	冀县	河北省	衡水地区	冀县	民政部	1980年	1992年	[已撤销]	133002	衡水地区,冀州市[已撤销]		
-133023	枣强县	河北省	衡水地区	枣强县	民政部	1980年	1995年	[已撤销]	131121	衡水市,枣强县		
-133024	武邑县	河北省	衡水地区	武邑县	民政部	1980年	1995年	[已撤销]	131122	衡水市,武邑县		
-133025	深县	河北省	衡水地区	深县	民政部	1980年	1993年	[已撤销]	133003	衡水地区,深州市[已撤销]		
-133026	武强县	河北省	衡水地区	武强县	民政部	1980年	1995年	[已撤销]	131123	衡水市,武强县		
-133027	饶阳县	河北省	衡水地区	饶阳县	民政部	1980年	1995年	[已撤销]	131124	衡水市,饶阳县		
-133028	安平县	河北省	衡水地区	安平县	民政部	1980年	1995年	[已撤销]	131125	衡水市,安平县		
-133029	故城县	河北省	衡水地区	故城县	民政部	1980年	1995年	[已撤销]	131126	衡水市,故城县		
-133030	景县	河北省	衡水地区	景县	民政部	1980年	1995年	[已撤销]	131127	衡水市,景县		
-133031	阜城县	河北省	衡水地区	阜城县	民政部	1980年	1995年	[已撤销]	131128	衡水市,阜城县		
-139000	省直辖行政单位	河北省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-139001	武安市	河北省	省直辖县级行政区划	武安市	民政部	1988年	1994年	[已撤销]	130481	邯郸市,武安市		
-139002	霸州市	河北省	省直辖县级行政区划	霸州市	民政部	1990年	1994年	[已撤销]	131081	廊坊市,霸州市		
-139003	遵化市	河北省	省直辖县级行政区划	遵化市	民政部	1992年	1994年	[已撤销]	130281	唐山市,遵化市		
-139004	辛集市	河北省	省直辖县级行政区划	辛集市	民政部	1993年	1994年	[已撤销]	130181	石家庄市,辛集市		
-139005	藁城市	河北省	省直辖县级行政区划	藁城市	民政部	1993年	1994年	[已撤销]	130182	石家庄市,藁城市[已撤销]		
-139006	晋州市	河北省	省直辖县级行政区划	晋州市	民政部	1993年	1994年	[已撤销]	130183	石家庄市,晋州市		
-139007	新乐市	河北省	省直辖县级行政区划	新乐市	民政部	1993年	1994年	[已撤销]	130184	石家庄市,新乐市		
-139008	泊头市	河北省	省直辖县级行政区划	泊头市	民政部	1993年	1994年	[已撤销]	130981	沧州市,泊头市		
-139009	任丘市	河北省	省直辖县级行政区划	任丘市	民政部	1993年	1994年	[已撤销]	130982	沧州市,任丘市		旧称：任丘市(任邱市)；
-139010	黄骅市	河北省	省直辖县级行政区划	黄骅市	民政部	1993年	1994年	[已撤销]	130983	沧州市,黄骅市		
-139011	河间市	河北省	省直辖县级行政区划	河间市	民政部	1993年	1994年	[已撤销]	130984	沧州市,河间市		
-139012	三河市	河北省	省直辖县级行政区划	三河市	民政部	1993年	1994年	[已撤销]	131082	廊坊市,三河市		三河县[1993年]
-139013	南宫市	河北省	省直辖县级行政区划	南宫市	民政部	1993年	1994年	[已撤销]	130581	邢台市,南宫市		
-139014	沙河市	河北省	省直辖县级行政区划	沙河市	民政部	1993年	1994年	[已撤销]	130582	邢台市,沙河市		
-139015	定州市	河北省	省直辖县级行政区划	定州市	民政部	1994年	1994年	[已撤销]	130682	保定市,定州市		
-139016	涿州市	河北省	省直辖县级行政区划	涿州市	民政部	1994年	1994年	[已撤销]	130681	保定市,涿州市		
-139017	安国市	河北省	省直辖县级行政区划	安国市	民政部	1994年	1994年	[已撤销]	130683	保定市,安国市		
-139018	高碑店市	河北省	省直辖县级行政区划	高碑店市	民政部	1994年	1994年	[已撤销]	130684	保定市,高碑店市		
-139019	鹿泉市	河北省	省直辖县级行政区划	鹿泉市	民政部	1994年	1994年	[已撤销]	130185	石家庄市,鹿泉市[已撤销]		
-139020	丰南市	河北省	省直辖县级行政区划	丰南市	民政部	1994年	1994年	[已撤销]	130282	唐山市,丰南市[已撤销]		
-140000	山西省	山西省	-	-	民政部	1980年	2024年					
-140100	太原市	山西省	太原市	-	民政部	1980年	2024年					
-140101	市辖区	山西省	太原市	市辖区	国标							增设（GB/T 2260-1984）
-140102	南城区	山西省	太原市	南城区	民政部	1980年	1996年	[已撤销]	140105,140106	太原市,小店区,迎泽区		
-140103	北城区	山西省	太原市	北城区	民政部	1980年	1996年	[已撤销]	140107,140108	太原市,杏花岭区,尖草坪区		
-140104	河西区	山西省	太原市	河西区	民政部	1980年	1996年	[已撤销]	140109	太原市,万柏林区		
-140105	小店区	山西省	太原市	小店区	民政部	1997年	2024年					
-140106	迎泽区	山西省	太原市	迎泽区	民政部	1997年	2024年					
-140107	杏花岭区	山西省	太原市	杏花岭区	民政部	1997年	2024年					
-140108	尖草坪区	山西省	太原市	尖草坪区	民政部	1997年	2024年					
-140109	万柏林区	山西省	太原市	万柏林区	民政部	1997年	2024年					
-140110	晋源区	山西省	太原市	晋源区	民政部	1997年	2024年					
-140111	古交工矿区	山西省	太原市	古交工矿区	民政部	1980年	1987年	[已撤销]	149001	省直辖县级行政区划,古交市[已撤销]		
-140112	南郊区	山西省	太原市	南郊区	民政部	1980年	1996年	[已撤销]	140105,140106,140107,140110	太原市,小店区,迎泽区,杏花岭区,晋源区		
-140113	北郊区	山西省	太原市	北郊区	民政部	1980年	1996年	[已撤销]	140107,140108,140109	太原市,杏花岭区,尖草坪区,万柏林区		
-140120	太原市区	山西省	太原市	太原市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-140121	清徐县	山西省	太原市	清徐县	民政部	1980年	2024年					
-140122	阳曲县	山西省	太原市	阳曲县	民政部	1980年	2024年					
-140123	娄烦县	山西省	太原市	娄烦县	民政部	1980年	2024年					
-140181	古交市	山西省	太原市	古交市	民政部	1995年	2024年					
-140200	大同市	山西省	大同市	-	民政部	1980年	2024年					
-140201	市辖区	山西省	大同市	市辖区	国标							增设（GB/T 2260-1984）
-140202	城区	山西省	大同市	城区	民政部	1980年	2017年	[已撤销]	140214,140213	大同市,云冈区,平城区		
-140203	矿区	山西省	大同市	矿区	民政部	1980年	2017年	[已撤销]	140214	大同市,云冈区		
-140204	白云矿区（包头市）	山西省	大同市	白云矿区（包头市）	国标							更名（GB-T 2260-1988）
-140211	南郊区	山西省	大同市	南郊区	民政部	1980年	2017年	[已撤销]	140214,140213	大同市,云冈区,平城区		
-140212	新荣区	山西省	大同市	新荣区	民政部	1980年	2024年					
-140213	平城区	山西省	大同市	平城区	民政部	2018年	2024年					
-140214	云冈区	山西省	大同市	云冈区	民政部	2018年	2024年					
-140215	云州区	山西省	大同市	云州区	民政部	2018年	2024年					
-140221	阳高县	山西省	大同市	阳高县	民政部	1993年	2024年					
-140222	天镇县	山西省	大同市	天镇县	民政部	1993年	2024年					
-140223	广灵县	山西省	大同市	广灵县	民政部	1993年	2024年					
-140224	灵丘县	山西省	大同市	灵丘县	民政部	1993年	2024年					旧称：灵丘县(灵邱县)；
-140225	浑源县	山西省	大同市	浑源县	民政部	1993年	2024年					
-140226	左云县	山西省	大同市	左云县	民政部	1993年	2024年					
-140227	大同县	山西省	大同市	大同县	民政部	1993年	2017年	[已撤销]	140215	大同市,云州区		
-140300	阳泉市	山西省	阳泉市	-	民政部	1980年	2024年					
-140301	市辖区	山西省	阳泉市	市辖区	国标							增设（GB/T 2260-1984）
-140302	城区	山西省	阳泉市	城区	民政部	1980年	2024年					
-140303	矿区	山西省	阳泉市	矿区	民政部	1980年	2024年					
-140311	郊区	山西省	阳泉市	郊区	民政部	1980年	2024年					
-140321	平定县	山西省	阳泉市	平定县	民政部	1983年	2024年					
-140322	盂县	山西省	阳泉市	盂县	民政部	1983年	2024年					
-140400	长治市	山西省	长治市	-	民政部	1980年	2024年					
-140401	市辖区	山西省	长治市	市辖区	国标							增设（GB/T 2260-1984）
-140402	城区	山西省	长治市	城区	民政部	1980年	2017年	[已撤销]	140403	长治市,潞州区		
-140403	潞州区	山西省	长治市	潞州区	民政部	2018年	2024年					
-140404	上党区	山西省	长治市	上党区	民政部	2018年	2024年					
-140405	屯留区	山西省	长治市	屯留区	民政部	2018年	2024年					
-140406	潞城区	山西省	长治市	潞城区	民政部	2018年	2024年					
-140411	郊区	山西省	长治市	郊区	民政部	1980年	2017年	[已撤销]	140403	长治市,潞州区		
-140421	长治县	山西省	长治市	长治县	民政部	1983年	2017年	[已撤销]	140404	长治市,上党区		
-140422	潞城县	山西省	长治市	潞城县	民政部	1983年	1993年	[已撤销]	149003	省直辖县级行政区划,潞城市[已撤销]		
-140423	襄垣县	山西省	长治市	襄垣县	民政部	1985年	2024年					
-140424	屯留县	山西省	长治市	屯留县	民政部	1985年	2017年	[已撤销]	140405	长治市,屯留区		
-140425	平顺县	山西省	长治市	平顺县	民政部	1985年	2024年					
-140426	黎城县	山西省	长治市	黎城县	民政部	1985年	2024年					
-140427	壶关县	山西省	长治市	壶关县	民政部	1985年	2024年					
-140428	长子县	山西省	长治市	长子县	民政部	1985年	2024年					
-140429	武乡县	山西省	长治市	武乡县	民政部	1985年	2024年					
-140430	沁县	山西省	长治市	沁县	民政部	1985年	2024年					
-140431	沁源县	山西省	长治市	沁源县	民政部	1985年	2024年					
-140481	潞城市	山西省	长治市	潞城市	民政部	1995年	2017年	[已撤销]	140406	长治市,潞城区		
-140500	晋城市	山西省	晋城市	-	民政部	1985年	2024年					
-140501	市辖区	山西省	晋城市	市辖区	国标							
-140502	城区	山西省	晋城市	城区	民政部	1985年	2024年					
-140503	郊区	山西省	晋城市	郊区	民政部	1985年	1995年	[已撤销]	140525	晋城市,泽州县		
-140511	郊区	山西省	晋城市	郊区	非官方							
-140521	沁水县	山西省	晋城市	沁水县	民政部	1985年	2024年					
-140522	阳城县	山西省	晋城市	阳城县	民政部	1985年	2024年					
-140523	高平县	山西省	晋城市	高平县	民政部	1985年	1992年	[已撤销]	149002	省直辖县级行政区划,高平市[已撤销]		
-140524	陵川县	山西省	晋城市	陵川县	民政部	1985年	2024年					
-140525	泽州县	山西省	晋城市	泽州县	民政部	1996年	2024年					
-140581	高平市	山西省	晋城市	高平市	民政部	1995年	2024年					
-140600	朔州市	山西省	朔州市	-	民政部	1988年	2024年					
-140601	市辖区	山西省	朔州市	市辖区	国标							
-140602	朔城区	山西省	朔州市	朔城区	民政部	1988年	2024年					
-140603	平鲁区	山西省	朔州市	平鲁区	民政部	1988年	2024年					
-140621	山阴县	山西省	朔州市	山阴县	民政部	1988年	2024年					
-140622	应县	山西省	朔州市	应县	民政部	1993年	2024年					
-140623	右玉县	山西省	朔州市	右玉县	民政部	1993年	2024年					
-140624	怀仁县	山西省	朔州市	怀仁县	民政部	1993年	2017年	[已撤销]	140681	朔州市,怀仁市		
-140681	怀仁市	山西省	朔州市	怀仁市	民政部	2018年	2024年					
-140700	晋中市	山西省	晋中市	-	民政部	1999年	2024年					
-140701	市辖区	山西省	晋中市	市辖区	国标							
-140702	榆次区	山西省	晋中市	榆次区	民政部	1999年	2024年					
-140703	太谷区	山西省	晋中市	太谷区	民政部	2019年	2024年					
-140721	榆社县	山西省	晋中市	榆社县	民政部	1999年	2024年					
-140722	左权县	山西省	晋中市	左权县	民政部	1999年	2024年					
-140723	和顺县	山西省	晋中市	和顺县	民政部	1999年	2024年					
-140724	昔阳县	山西省	晋中市	昔阳县	民政部	1999年	2024年					
-140725	寿阳县	山西省	晋中市	寿阳县	民政部	1999年	2024年					
-140726	太谷县	山西省	晋中市	太谷县	民政部	1999年	2018年	[已撤销]	140703	晋中市,太谷区		
-140727	祁县	山西省	晋中市	祁县	民政部	1999年	2024年					
-140728	平遥县	山西省	晋中市	平遥县	民政部	1999年	2024年					
-140729	灵石县	山西省	晋中市	灵石县	民政部	1999年	2024年					
-140781	介休市	山西省	晋中市	介休市	民政部	1999年	2024年					
-140800	运城市	山西省	运城市	-	民政部	2000年	2024年					
-140801	市辖区	山西省	运城市	市辖区	国标							
-140802	盐湖区	山西省	运城市	盐湖区	民政部	2000年	2024年					
-140821	临猗县	山西省	运城市	临猗县	民政部	2000年	2024年					
-140822	万荣县	山西省	运城市	万荣县	民政部	2000年	2024年					
-140823	闻喜县	山西省	运城市	闻喜县	民政部	2000年	2024年					
-140824	稷山县	山西省	运城市	稷山县	民政部	2000年	2024年					
-140825	新绛县	山西省	运城市	新绛县	民政部	2000年	2024年					
-140826	绛县	山西省	运城市	绛县	民政部	2000年	2024年					
-140827	垣曲县	山西省	运城市	垣曲县	民政部	2000年	2024年					
-140828	夏县	山西省	运城市	夏县	民政部	2000年	2024年					
-140829	平陆县	山西省	运城市	平陆县	民政部	2000年	2024年					
-140830	芮城县	山西省	运城市	芮城县	民政部	2000年	2024年					
-140881	永济市	山西省	运城市	永济市	民政部	2000年	2024年					
-140882	河津市	山西省	运城市	河津市	民政部	2000年	2024年					
-140900	忻州市	山西省	忻州市	-	民政部	2000年	2024年					
-140901	市辖区	山西省	忻州市	市辖区	国标							
-140902	忻府区	山西省	忻州市	忻府区	民政部	2000年	2024年					
-140921	定襄县	山西省	忻州市	定襄县	民政部	2000年	2024年					
-140922	五台县	山西省	忻州市	五台县	民政部	2000年	2024年					
-140923	代县	山西省	忻州市	代县	民政部	2000年	2024年					
-140924	繁峙县	山西省	忻州市	繁峙县	民政部	2000年	2024年					
-140925	宁武县	山西省	忻州市	宁武县	民政部	2000年	2024年					
-140926	静乐县	山西省	忻州市	静乐县	民政部	2000年	2024年					
-140927	神池县	山西省	忻州市	神池县	民政部	2000年	2024年					
-140928	五寨县	山西省	忻州市	五寨县	民政部	2000年	2024年					
-140929	岢岚县	山西省	忻州市	岢岚县	民政部	2000年	2024年					
-140930	河曲县	山西省	忻州市	河曲县	民政部	2000年	2024年					
-140931	保德县	山西省	忻州市	保德县	民政部	2000年	2024年					
-140932	偏关县	山西省	忻州市	偏关县	民政部	2000年	2024年					
-140981	原平市	山西省	忻州市	原平市	民政部	2000年	2024年					
-141000	临汾市	山西省	临汾市	-	民政部	2000年	2024年					
-141001	市辖区	山西省	临汾市	市辖区	国标							
-141002	尧都区	山西省	临汾市	尧都区	民政部	2000年	2024年					
-141021	曲沃县	山西省	临汾市	曲沃县	民政部	2000年	2024年					
-141022	翼城县	山西省	临汾市	翼城县	民政部	2000年	2024年					
-141023	襄汾县	山西省	临汾市	襄汾县	民政部	2000年	2024年					
-141024	洪洞县	山西省	临汾市	洪洞县	民政部	2000年	2024年					
-141025	古县	山西省	临汾市	古县	民政部	2000年	2024年					
-141026	安泽县	山西省	临汾市	安泽县	民政部	2000年	2024年					
-141027	浮山县	山西省	临汾市	浮山县	民政部	2000年	2024年					
-141028	吉县	山西省	临汾市	吉县	民政部	2000年	2024年					
-141029	乡宁县	山西省	临汾市	乡宁县	民政部	2000年	2024年					
-141030	大宁县	山西省	临汾市	大宁县	民政部	2000年	2024年					
-141031	隰县	山西省	临汾市	隰县	民政部	2000年	2024年					
-141032	永和县	山西省	临汾市	永和县	民政部	2000年	2024年					
-141033	蒲县	山西省	临汾市	蒲县	民政部	2000年	2024年					
-141034	汾西县	山西省	临汾市	汾西县	民政部	2000年	2024年					
-141081	侯马市	山西省	临汾市	侯马市	民政部	2000年	2024年					
-141082	霍州市	山西省	临汾市	霍州市	民政部	2000年	2024年					
-141100	吕梁市	山西省	吕梁市	-	民政部	2003年	2024年					
-141101	市辖区	山西省	吕梁市	市辖区	国标							
-141102	离石区	山西省	吕梁市	离石区	民政部	2003年	2024年					
-141121	文水县	山西省	吕梁市	文水县	民政部	2003年	2024年					
-141122	交城县	山西省	吕梁市	交城县	民政部	2003年	2024年					
-141123	兴县	山西省	吕梁市	兴县	民政部	2003年	2024年					
-141124	临县	山西省	吕梁市	临县	民政部	2003年	2024年					
-141125	柳林县	山西省	吕梁市	柳林县	民政部	2003年	2024年					
-141126	石楼县	山西省	吕梁市	石楼县	民政部	2003年	2024年					
-141127	岚县	山西省	吕梁市	岚县	民政部	2003年	2024年					
-141128	方山县	山西省	吕梁市	方山县	民政部	2003年	2024年					
-141129	中阳县	山西省	吕梁市	中阳县	民政部	2003年	2024年					
-141130	交口县	山西省	吕梁市	交口县	民政部	2003年	2024年					
-141181	孝义市	山西省	吕梁市	孝义市	民政部	2003年	2024年					
-141182	汾阳市	山西省	吕梁市	汾阳市	民政部	2003年	2024年					
-142100	雁北地区	山西省	雁北地区	-	民政部	1980年	1992年	[已撤销]	140200,140600	大同市,朔州市		
-142121	阳高县	山西省	雁北地区	阳高县	民政部	1980年	1992年	[已撤销]	140221	大同市,阳高县		大同县[1981年]
-142122	天镇县	山西省	雁北地区	天镇县	民政部	1980年	1992年	[已撤销]	140222	大同市,天镇县		阳高县[1981年]
-142123	广灵县	山西省	雁北地区	广灵县	民政部	1980年	1992年	[已撤销]	140223	大同市,广灵县		天镇县[1981年]
-142124	灵丘县	山西省	雁北地区	灵丘县	民政部	1980年	1992年	[已撤销]	140224	大同市,灵丘县		旧称：灵丘县(灵邱县)；广灵县[1981年]
-142125	浑源县	山西省	雁北地区	浑源县	民政部	1980年	1992年	[已撤销]	140225	大同市,浑源县		灵丘县[1981年]
-142126	应县	山西省	雁北地区	应县	民政部	1980年	1992年	[已撤销]	140622	朔州市,应县		浑源县[1981年]
-142127	山阴县	山西省	雁北地区	山阴县	民政部	1980年	1987年	[已撤销]	140621	朔州市,山阴县		怀仁县[1981年]
-142128	朔县	山西省	雁北地区	朔县	民政部	1980年	1987年	[已撤销]	140602	朔州市,朔城区		应县[1981年]
-142129	平鲁县	山西省	雁北地区	平鲁县	民政部	1980年	1987年	[已撤销]	140603	朔州市,平鲁区		山阴县[1981年]
-142130	左云县	山西省	雁北地区	左云县	民政部	1980年	1992年	[已撤销]	140226	大同市,左云县		朔县[1981年]
-142131	右玉县	山西省	雁北地区	右玉县	民政部	1980年	1992年	[已撤销]	140623	朔州市,右玉县		平鲁县[1981年]
-142132	大同县	山西省	雁北地区	大同县	民政部	1980年	1992年	[已撤销]	140227	大同市,大同县[已撤销]		左云县[1981年]
-142133	怀仁县	山西省	雁北地区	怀仁县	民政部	1980年	1992年	[已撤销]	140624	朔州市,怀仁县[已撤销]		右玉县[1981年]
-142200	忻州地区	山西省	忻州地区	-	民政部	1980年	1999年	[已撤销]	140900	忻州市（地市）		忻县地区[1982年]
-142201	忻州市	山西省	忻州地区	忻州市	民政部	1983年	1999年	[已撤销]	140900	忻州市（地市）		
-142202	原平市	山西省	忻州地区	原平市	民政部	1993年	1999年	[已撤销]	140981	忻州市,原平市		
-142221	忻县	山西省	忻州地区	忻县	民政部	1980年	1982年	[已撤销]	142201	忻州地区,忻州市[已撤销]		
-142222	定襄县	山西省	忻州地区	定襄县	民政部	1980年	1999年	[已撤销]	140921	忻州市,定襄县		原平县[1981年]
-142223	五台县	山西省	忻州地区	五台县	民政部	1980年	1999年	[已撤销]	140922	忻州市,五台县		代县[1981年]
-142224	原平县	山西省	忻州地区	原平县	民政部	1980年	1992年	[已撤销]	142202	忻州地区,原平市[已撤销]		繁峙县[1981年]
-142225	代县	山西省	忻州地区	代县	民政部	1980年	1999年	[已撤销]	140923	忻州市,代县		五台县[1981年]
-142226	繁峙县	山西省	忻州地区	繁峙县	民政部	1980年	1999年	[已撤销]	140924	忻州市,繁峙县		定襄县[1981年]
-142227	宁武县	山西省	忻州地区	宁武县	民政部	1980年	1999年	[已撤销]	140925	忻州市,宁武县		静乐县[1981年]
-142228	静乐县	山西省	忻州地区	静乐县	民政部	1980年	1999年	[已撤销]	140926	忻州市,静乐县		岢岚县[1981年]
-142229	神池县	山西省	忻州地区	神池县	民政部	1980年	1999年	[已撤销]	140927	忻州市,神池县		保德县[1981年]
-142230	五寨县	山西省	忻州地区	五寨县	民政部	1980年	1999年	[已撤销]	140928	忻州市,五寨县		
-142231	岢岚县	山西省	忻州地区	岢岚县	民政部	1980年	1999年	[已撤销]	140929	忻州市,岢岚县		河曲县[1981年]
-142232	河曲县	山西省	忻州地区	河曲县	民政部	1980年	1999年	[已撤销]	140930	忻州市,河曲县		偏关县[1981年]
-142233	保德县	山西省	忻州地区	保德县	民政部	1980年	1999年	[已撤销]	140931	忻州市,保德县		神池县[1981年]
-142234	偏关县	山西省	忻州地区	偏关县	民政部	1980年	1999年	[已撤销]	140932	忻州市,偏关县		宁武县[1981年]
-142300	吕梁地区	山西省	吕梁地区	-	民政部	1980年	2002年	[已撤销]	141100	吕梁市（地市）		晋中地区[1981年]
-142301	孝义市	山西省	吕梁地区	孝义市	民政部	1980年	2002年	[已撤销]	141181	吕梁市,孝义市		榆次市[1981年]
-142302	离石市	山西省	吕梁地区	离石市	民政部	1996年	2002年	[已撤销]	141102	吕梁市,离石区		
-142303	汾阳市	山西省	吕梁地区	汾阳市	民政部	1996年	2002年	[已撤销]	141182	吕梁市,汾阳市		
-142321	汾阳县	山西省	吕梁地区	汾阳县	民政部	1980年	1995年	[已撤销]	142303	吕梁地区,汾阳市[已撤销]		榆次县[1981年]
-142322	文水县	山西省	吕梁地区	文水县	民政部	1980年	2002年	[已撤销]	141121	吕梁市,文水县		寿阳县[1981年]
-142323	交城县	山西省	吕梁地区	交城县	民政部	1980年	2002年	[已撤销]	141122	吕梁市,交城县		盂县[1981年]
-142324	孝义县	山西省	吕梁地区	孝义县	民政部	1980年	1991年	[已撤销]	142301	吕梁地区,孝义市[已撤销]		平定县[1981年]
-142325	兴县	山西省	吕梁地区	兴县	民政部	1980年	2002年	[已撤销]	141123	吕梁市,兴县		昔阳县[1981年]
-142326	临县	山西省	吕梁地区	临县	民政部	1980年	2002年	[已撤销]	141124	吕梁市,临县		和顺县[1981年]
-142327	柳林县	山西省	吕梁地区	柳林县	民政部	1980年	2002年	[已撤销]	141125	吕梁市,柳林县		左权县[1981年]
-142328	石楼县	山西省	吕梁地区	石楼县	民政部	1980年	2002年	[已撤销]	141126	吕梁市,石楼县		榆社县[1981年]
-142329	岚县	山西省	吕梁地区	岚县	民政部	1980年	2002年	[已撤销]	141127	吕梁市,岚县		太谷县[1981年]
-142330	方山县	山西省	吕梁地区	方山县	民政部	1980年	2002年	[已撤销]	141128	吕梁市,方山县		祁县[1981年]
-142331	离石县	山西省	吕梁地区	离石县	民政部	1980年	1995年	[已撤销]	142302	吕梁地区,离石市[已撤销]		平遥县[1981年]
-142332	中阳县	山西省	吕梁地区	中阳县	民政部	1980年	2002年	[已撤销]	141129	吕梁市,中阳县		介休县[1981年]
-142333	交口县	山西省	吕梁地区	交口县	民政部	1980年	2002年	[已撤销]	141130	吕梁市,交口县		灵石县[1981年]
-142400	晋中地区	山西省	晋中地区	-	民政部	1980年	1998年	[已撤销]	140700	晋中市（地市）		吕梁地区[1981年]
-142401	榆次市	山西省	晋中地区	榆次市	民政部	1982年	1998年	[已撤销]	140702	晋中市,榆次区		
-142402	介休市	山西省	晋中地区	介休市	民政部	1992年	1998年	[已撤销]	140781	晋中市,介休市		
-142421	榆社县	山西省	晋中地区	榆社县	民政部	1980年	1998年	[已撤销]	140721	晋中市,榆社县		离石县[1981年]
-142422	左权县	山西省	晋中地区	左权县	民政部	1980年	1998年	[已撤销]	140722	晋中市,左权县		孝义县[1981年]
-142423	和顺县	山西省	晋中地区	和顺县	民政部	1980年	1998年	[已撤销]	140723	晋中市,和顺县		兴县[1981年]
-142424	昔阳县	山西省	晋中地区	昔阳县	民政部	1980年	1998年	[已撤销]	140724	晋中市,昔阳县		交口县[1981年]
-142425	平定县	山西省	晋中地区	平定县	民政部	1980年	1982年	[已撤销]	140321	阳泉市,平定县		方山县[1981年]
-142426	盂县	山西省	晋中地区	盂县	民政部	1980年	1982年	[已撤销]	140322	阳泉市,盂县		石楼县[1981年]
-142427	寿阳县	山西省	晋中地区	寿阳县	民政部	1980年	1998年	[已撤销]	140725	晋中市,寿阳县		岚县[1981年]
-142428	榆次县	山西省	晋中地区	榆次县	民政部	1980年	1982年	[已撤销]	142401	晋中地区,榆次市[已撤销]		中阳县[1981年]
-142429	太谷县	山西省	晋中地区	太谷县	民政部	1980年	1998年	[已撤销]	140726	晋中市,太谷县[已撤销]		交城县[1981年]
-142430	祁县	山西省	晋中地区	祁县	民政部	1980年	1998年	[已撤销]	140727	晋中市,祁县		临县[1981年]
-142431	平遥县	山西省	晋中地区	平遥县	民政部	1980年	1998年	[已撤销]	140728	晋中市,平遥县		文水县[1981年]
-142432	介休县	山西省	晋中地区	介休县	民政部	1980年	1991年	[已撤销]	142402	晋中地区,介休市[已撤销]		柳林县[1981年]
-142433	灵石县	山西省	晋中地区	灵石县	民政部	1980年	1998年	[已撤销]	140729	晋中市,灵石县		汾阳县[1981年]
-142500	晋东南地区	山西省	晋东南地区	-	民政部	1980年	1984年	[已撤销]	140500,140400	晋城市,长治市		
-142501	晋城市	山西省	晋东南地区	晋城市	民政部	1983年	1984年	[已撤销]	140500	晋城市（地市）		
-142521	长治县	山西省	晋东南地区	长治县	民政部	1980年	1982年	[已撤销]	140421	长治市,长治县[已撤销]		
-142522	潞城县	山西省	晋东南地区	潞城县	民政部	1980年	1982年	[已撤销]	140422	长治市,潞城县[已撤销]		
-142523	屯留县	山西省	晋东南地区	屯留县	民政部	1980年	1984年	[已撤销]	140424	长治市,屯留县[已撤销]		襄垣县[1981年]
-142524	长子县	山西省	晋东南地区	长子县	民政部	1980年	1984年	[已撤销]	140428	长治市,长子县		武乡县[1981年]
-142525	沁水县	山西省	晋东南地区	沁水县	民政部	1980年	1984年	[已撤销]	140521	晋城市,沁水县		黎城县[1981年]
-142526	阳城县	山西省	晋东南地区	阳城县	民政部	1980年	1984年	[已撤销]	140522	晋城市,阳城县		平顺县[1981年]
-142527	晋城县	山西省	晋东南地区	晋城县	民政部	1980年	1982年	[已撤销]	142501	晋东南地区,晋城市[已撤销]		壶关县[1981年]
-142528	高平县	山西省	晋东南地区	高平县	民政部	1980年	1984年	[已撤销]	140523	晋城市,高平县[已撤销]		陵川县[1981年]
-142529	陵川县	山西省	晋东南地区	陵川县	民政部	1980年	1984年	[已撤销]	140524	晋城市,陵川县		高平县[1981年]
-142530	壶关县	山西省	晋东南地区	壶关县	民政部	1980年	1984年	[已撤销]	140427	长治市,壶关县		晋城县[1981年]
-142531	平顺县	山西省	晋东南地区	平顺县	民政部	1980年	1984年	[已撤销]	140425	长治市,平顺县		阳城县[1981年]
-142532	黎城县	山西省	晋东南地区	黎城县	民政部	1980年	1984年	[已撤销]	140426	长治市,黎城县		沁水县[1981年]
-142533	武乡县	山西省	晋东南地区	武乡县	民政部	1980年	1984年	[已撤销]	140429	长治市,武乡县		长子县[1981年]
-142534	襄垣县	山西省	晋东南地区	襄垣县	民政部	1980年	1984年	[已撤销]	140423	长治市,襄垣县		屯留县[1981年]
-142535	沁县	山西省	晋东南地区	沁县	民政部	1980年	1984年	[已撤销]	140430	长治市,沁县		沁源县[1981年]
-142536	沁源县	山西省	晋东南地区	沁源县	民政部	1980年	1984年	[已撤销]	140431	长治市,沁源县		沁县[1981年]
-142600	临汾地区	山西省	临汾地区	-	民政部	1980年	1999年	[已撤销]	141000	临汾市（地市）		
-142601	临汾市	山西省	临汾地区	临汾市	民政部	1980年	1999年	[已撤销]	141000	临汾市（地市）		
-142602	侯马市	山西省	临汾地区	侯马市	民政部	1980年	1999年	[已撤销]	141081	临汾市,侯马市		
-142603	霍州市	山西省	临汾地区	霍州市	民政部	1989年	1999年	[已撤销]	141082	临汾市,霍州市		
-142621	曲沃县	山西省	临汾地区	曲沃县	民政部	1980年	1999年	[已撤销]	141021	临汾市,曲沃县		临汾县[1981年]
-142622	翼城县	山西省	临汾地区	翼城县	民政部	1980年	1999年	[已撤销]	141022	临汾市,翼城县		隰县[1981年]
-142623	襄汾县	山西省	临汾地区	襄汾县	民政部	1980年	1999年	[已撤销]	141023	临汾市,襄汾县		汾西县[1981年]
-142624	临汾县	山西省	临汾地区	临汾县	民政部	1980年	1982年	[已撤销]	142601	临汾地区,临汾市[已撤销]		永和县[1981年]
-142625	洪洞县	山西省	临汾地区	洪洞县	民政部	1980年	1999年	[已撤销]	141024	临汾市,洪洞县		安泽县[1981年]
-142626	霍县	山西省	临汾地区	霍县	民政部	1980年	1988年	[已撤销]	142603	临汾地区,霍州市[已撤销]		洪洞县[1981年]
-142627	古县	山西省	临汾地区	古县	民政部	1980年	1999年	[已撤销]	141025	临汾市,古县		
-142628	安泽县	山西省	临汾地区	安泽县	民政部	1980年	1999年	[已撤销]	141026	临汾市,安泽县		霍县[1981年]
-142629	浮山县	山西省	临汾地区	浮山县	民政部	1980年	1999年	[已撤销]	141027	临汾市,浮山县		翼城县[1981年]
-142630	吉县	山西省	临汾地区	吉县	民政部	1980年	1999年	[已撤销]	141028	临汾市,吉县		浮山县[1981年]
-142631	乡宁县	山西省	临汾地区	乡宁县	民政部	1980年	1999年	[已撤销]	141029	临汾市,乡宁县		曲沃县[1981年]
-142632	蒲县	山西省	临汾地区	蒲县	民政部	1980年	1999年	[已撤销]	141033	临汾市,蒲县		襄汾县[1981年]
-142633	大宁县	山西省	临汾地区	大宁县	民政部	1980年	1999年	[已撤销]	141030	临汾市,大宁县		吉县[1981年]
-142634	永和县	山西省	临汾地区	永和县	民政部	1980年	1999年	[已撤销]	141032	临汾市,永和县		乡宁县[1981年]
-142635	隰县	山西省	临汾地区	隰县	民政部	1980年	1999年	[已撤销]	141031	临汾市,隰县		大宁县[1981年]
-142636	汾西县	山西省	临汾地区	汾西县	民政部	1980年	1999年	[已撤销]	141034	临汾市,汾西县		蒲县[1981年]
-142700	运城地区	山西省	运城地区	-	民政部	1980年	1999年	[已撤销]	140800	运城市（地市）		
-142701	运城市	山西省	运城地区	运城市	民政部	1983年	1999年	[已撤销]	140800	运城市（地市）		
-142702	永济市	山西省	运城地区	永济市	民政部	1994年	1999年	[已撤销]	140881	运城市,永济市		
-142703	河津市	山西省	运城地区	河津市	民政部	1994年	1999年	[已撤销]	140882	运城市,河津市		
-142721	运城县	山西省	运城地区	运城县	民政部	1980年	1982年	[已撤销]	142701	运城地区,运城市[已撤销]		
-142722	永济县	山西省	运城地区	永济县	民政部	1980年	1993年	[已撤销]	142702	运城地区,永济市[已撤销]		夏县[1981年]
-142723	芮城县	山西省	运城地区	芮城县	民政部	1980年	1999年	[已撤销]	140830	运城市,芮城县		闻喜县[1981年]
-142724	临猗县	山西省	运城地区	临猗县	民政部	1980年	1999年	[已撤销]	140821	运城市,临猗县		绛县[1981年]
-142725	万荣县	山西省	运城地区	万荣县	民政部	1980年	1999年	[已撤销]	140822	运城市,万荣县		垣曲县[1981年]
-142726	新绛县	山西省	运城地区	新绛县	民政部	1980年	1999年	[已撤销]	140825	运城市,新绛县		平陆县[1981年]
-142727	稷山县	山西省	运城地区	稷山县	民政部	1980年	1999年	[已撤销]	140824	运城市,稷山县		芮城县[1981年]
-142728	河津县	山西省	运城地区	河津县	民政部	1980年	1993年	[已撤销]	142703	运城地区,河津市[已撤销]		永济县[1981年]
-142729	闻喜县	山西省	运城地区	闻喜县	民政部	1980年	1999年	[已撤销]	140823	运城市,闻喜县		临猗县[1981年]
-142730	夏县	山西省	运城地区	夏县	民政部	1980年	1999年	[已撤销]	140828	运城市,夏县		万荣县[1981年]
-142731	绛县	山西省	运城地区	绛县	民政部	1980年	1999年	[已撤销]	140826	运城市,绛县		新绛县[1981年]
-142732	平陆县	山西省	运城地区	平陆县	民政部	1980年	1999年	[已撤销]	140829	运城市,平陆县		稷山县[1981年]
-142733	垣曲县	山西省	运城地区	垣曲县	民政部	1980年	1999年	[已撤销]	140827	运城市,垣曲县		河津县[1981年]
-149000	省直辖行政单位	山西省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-149001	古交市	山西省	省直辖县级行政区划	古交市	民政部	1988年	1994年	[已撤销]	140181	太原市,古交市		
-149002	高平市	山西省	省直辖县级行政区划	高平市	民政部	1993年	1994年	[已撤销]	140581	晋城市,高平市		
-149003	潞城市	山西省	省直辖县级行政区划	潞城市	民政部	1994年	1994年	[已撤销]	140481	长治市,潞城市[已撤销]		
-150000	内蒙古自治区	内蒙古自治区	-	-	民政部	1980年	2024年					
-150100	呼和浩特市	内蒙古自治区	呼和浩特市	-	民政部	1980年	2024年					
-150101	市辖区	内蒙古自治区	呼和浩特市	市辖区	国标							增设（GB/T 2260-1984）
-150102	新城区	内蒙古自治区	呼和浩特市	新城区	民政部	1980年	2024年					
-150103	回民区	内蒙古自治区	呼和浩特市	回民区	民政部	1980年	2024年					
-150104	玉泉区	内蒙古自治区	呼和浩特市	玉泉区	民政部	1980年	2024年					
-150105	赛罕区	内蒙古自治区	呼和浩特市	赛罕区	民政部	1980年	2024年					郊区[1999年]
-150120	呼和浩特市区	内蒙古自治区	呼和浩特市	呼和浩特市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-150121	土默特左旗	内蒙古自治区	呼和浩特市	土默特左旗	民政部	1980年	2024年					
-150122	托克托县	内蒙古自治区	呼和浩特市	托克托县	民政部	1980年	2024年					
-150123	和林格尔县	内蒙古自治区	呼和浩特市	和林格尔县	民政部	1995年	2024年					
-150124	清水河县	内蒙古自治区	呼和浩特市	清水河县	民政部	1995年	2024年					
-150125	武川县	内蒙古自治区	呼和浩特市	武川县	民政部	1996年	2024年					
-150200	包头市	内蒙古自治区	包头市	-	民政部	1980年	2024年					
-150201	市辖区	内蒙古自治区	包头市	市辖区	国标							增设（GB/T 2260-1984）
-150202	东河区	内蒙古自治区	包头市	东河区	民政部	1980年	2024年					
-150203	昆都仑区	内蒙古自治区	包头市	昆都仑区	民政部	1980年	2024年					
-150204	青山区	内蒙古自治区	包头市	青山区	民政部	1980年	2024年					
-150205	石拐区	内蒙古自治区	包头市	石拐区	民政部	1980年	2024年					石拐矿区[1998年]
-150206	白云鄂博矿区	内蒙古自治区	包头市	白云鄂博矿区	民政部	1980年	2024年					白云矿区[2006年]
-150207	九原区	内蒙古自治区	包头市	九原区	民政部	1980年	2024年					郊区[1998年]
-150220	包头市区	内蒙古自治区	包头市	包头市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-150221	土默特右旗	内蒙古自治区	包头市	土默特右旗	民政部	1980年	2024年					
-150222	固阳县	内蒙古自治区	包头市	固阳县	民政部	1980年	2024年					
-150223	达尔罕茂明安联合旗	内蒙古自治区	包头市	达尔罕茂明安联合旗	民政部	1996年	2024年					
-150300	乌海市	内蒙古自治区	乌海市	-	民政部	1980年	2024年					
-150301	市辖区	内蒙古自治区	乌海市	市辖区	国标							增设（GB/T 2260-1984）
-150302	海勃湾区	内蒙古自治区	乌海市	海勃湾区	民政部	1980年	2024年					
-150303	海南区	内蒙古自治区	乌海市	海南区	民政部	1980年	2024年					
-150304	乌达区	内蒙古自治区	乌海市	乌达区	民政部	1980年	2024年					
-150400	赤峰市	内蒙古自治区	赤峰市	-	民政部	1983年	2024年					
-150401	市辖区	内蒙古自治区	赤峰市	市辖区	国标							增设（GB/T 2260-1984）
-150402	红山区	内蒙古自治区	赤峰市	红山区	民政部	1983年	2024年					
-150403	元宝山区	内蒙古自治区	赤峰市	元宝山区	民政部	1983年	2024年					
-150404	松山区	内蒙古自治区	赤峰市	松山区	民政部	1983年	2024年					郊区[1992年]
-150421	阿鲁科尔沁旗	内蒙古自治区	赤峰市	阿鲁科尔沁旗	民政部	1983年	2024年					
-150422	巴林左旗	内蒙古自治区	赤峰市	巴林左旗	民政部	1983年	2024年					
-150423	巴林右旗	内蒙古自治区	赤峰市	巴林右旗	民政部	1983年	2024年					
-150424	林西县	内蒙古自治区	赤峰市	林西县	民政部	1983年	2024年					
-150425	克什克腾旗	内蒙古自治区	赤峰市	克什克腾旗	民政部	1983年	2024年					
-150426	翁牛特旗	内蒙古自治区	赤峰市	翁牛特旗	民政部	1983年	2024年					
-150427	赤峰县	内蒙古自治区	赤峰市	赤峰县	非官方							
-150428	喀喇沁旗	内蒙古自治区	赤峰市	喀喇沁旗	民政部	1983年	2024年					
-150429	宁城县	内蒙古自治区	赤峰市	宁城县	民政部	1983年	2024年					
-150430	敖汉旗	内蒙古自治区	赤峰市	敖汉旗	民政部	1983年	2024年					
-150500	通辽市	内蒙古自治区	通辽市	-	民政部	1999年	2024年					
-150501	市辖区	内蒙古自治区	通辽市	市辖区	国标							
-150502	科尔沁区	内蒙古自治区	通辽市	科尔沁区	民政部	1999年	2024年					
-150521	科尔沁左翼中旗	内蒙古自治区	通辽市	科尔沁左翼中旗	民政部	1999年	2024年					
-150522	科尔沁左翼后旗	内蒙古自治区	通辽市	科尔沁左翼后旗	民政部	1999年	2024年					
-150523	开鲁县	内蒙古自治区	通辽市	开鲁县	民政部	1999年	2024年					
-150524	库伦旗	内蒙古自治区	通辽市	库伦旗	民政部	1999年	2024年					
-150525	奈曼旗	内蒙古自治区	通辽市	奈曼旗	民政部	1999年	2024年					
-150526	扎鲁特旗	内蒙古自治区	通辽市	扎鲁特旗	民政部	1999年	2024年					
-150581	霍林郭勒市	内蒙古自治区	通辽市	霍林郭勒市	民政部	1999年	2024年					
-150600	鄂尔多斯市	内蒙古自治区	鄂尔多斯市	-	民政部	2001年	2024年					
-150601	市辖区	内蒙古自治区	鄂尔多斯市	市辖区	国标							
-150602	东胜区	内蒙古自治区	鄂尔多斯市	东胜区	民政部	2001年	2024年					
-150603	康巴什区	内蒙古自治区	鄂尔多斯市	康巴什区	民政部	2016年	2024年					
-150621	达拉特旗	内蒙古自治区	鄂尔多斯市	达拉特旗	民政部	2001年	2024年					
-150622	准格尔旗	内蒙古自治区	鄂尔多斯市	准格尔旗	民政部	2001年	2024年					
-150623	鄂托克前旗	内蒙古自治区	鄂尔多斯市	鄂托克前旗	民政部	2001年	2024年					
-150624	鄂托克旗	内蒙古自治区	鄂尔多斯市	鄂托克旗	民政部	2001年	2024年					
-150625	杭锦旗	内蒙古自治区	鄂尔多斯市	杭锦旗	民政部	2001年	2024年					
-150626	乌审旗	内蒙古自治区	鄂尔多斯市	乌审旗	民政部	2001年	2024年					
-150627	伊金霍洛旗	内蒙古自治区	鄂尔多斯市	伊金霍洛旗	民政部	2001年	2024年					
-150700	呼伦贝尔市	内蒙古自治区	呼伦贝尔市	-	民政部	2001年	2024年					
-150701	市辖区	内蒙古自治区	呼伦贝尔市	市辖区	国标							
-150702	海拉尔区	内蒙古自治区	呼伦贝尔市	海拉尔区	民政部	2001年	2024年					
-150703	扎赉诺尔区	内蒙古自治区	呼伦贝尔市	扎赉诺尔区	民政部	2013年	2024年					
-150721	阿荣旗	内蒙古自治区	呼伦贝尔市	阿荣旗	民政部	2001年	2024年					
-150722	莫力达瓦达斡尔族自治旗	内蒙古自治区	呼伦贝尔市	莫力达瓦达斡尔族自治旗	民政部	2001年	2024年					
-150723	鄂伦春自治旗	内蒙古自治区	呼伦贝尔市	鄂伦春自治旗	民政部	2001年	2024年					
-150724	鄂温克族自治旗	内蒙古自治区	呼伦贝尔市	鄂温克族自治旗	民政部	2001年	2024年					
-150725	陈巴尔虎旗	内蒙古自治区	呼伦贝尔市	陈巴尔虎旗	民政部	2001年	2024年					
-150726	新巴尔虎左旗	内蒙古自治区	呼伦贝尔市	新巴尔虎左旗	民政部	2001年	2024年					
-150727	新巴尔虎右旗	内蒙古自治区	呼伦贝尔市	新巴尔虎右旗	民政部	2001年	2024年					
-150781	满洲里市	内蒙古自治区	呼伦贝尔市	满洲里市	民政部	2001年	2024年					
-150782	牙克石市	内蒙古自治区	呼伦贝尔市	牙克石市	民政部	2001年	2024年					
-150783	扎兰屯市	内蒙古自治区	呼伦贝尔市	扎兰屯市	民政部	2001年	2024年					
-150784	额尔古纳市	内蒙古自治区	呼伦贝尔市	额尔古纳市	民政部	2001年	2024年					
-150785	根河市	内蒙古自治区	呼伦贝尔市	根河市	民政部	2001年	2024年					
-150800	巴彦淖尔市	内蒙古自治区	巴彦淖尔市	-	民政部	2003年	2024年					
-150801	市辖区	内蒙古自治区	巴彦淖尔市	市辖区	国标							
-150802	临河区	内蒙古自治区	巴彦淖尔市	临河区	民政部	2003年	2024年					
-150821	五原县	内蒙古自治区	巴彦淖尔市	五原县	民政部	2003年	2024年					
-150822	磴口县	内蒙古自治区	巴彦淖尔市	磴口县	民政部	2003年	2024年					
-150823	乌拉特前旗	内蒙古自治区	巴彦淖尔市	乌拉特前旗	民政部	2003年	2024年					
-150824	乌拉特中旗	内蒙古自治区	巴彦淖尔市	乌拉特中旗	民政部	2003年	2024年					
-150825	乌拉特后旗	内蒙古自治区	巴彦淖尔市	乌拉特后旗	民政部	2003年	2024年					
-150826	杭锦后旗	内蒙古自治区	巴彦淖尔市	杭锦后旗	民政部	2003年	2024年					
-150900	乌兰察布市	内蒙古自治区	乌兰察布市	-	民政部	2003年	2024年					
-150901	市辖区	内蒙古自治区	乌兰察布市	市辖区	国标							
-150902	集宁区	内蒙古自治区	乌兰察布市	集宁区	民政部	2003年	2024年					
-150921	卓资县	内蒙古自治区	乌兰察布市	卓资县	民政部	2003年	2024年					
-150922	化德县	内蒙古自治区	乌兰察布市	化德县	民政部	2003年	2024年					
-150923	商都县	内蒙古自治区	乌兰察布市	商都县	民政部	2003年	2024年					
-150924	兴和县	内蒙古自治区	乌兰察布市	兴和县	民政部	2003年	2024年					
-150925	凉城县	内蒙古自治区	乌兰察布市	凉城县	民政部	2003年	2024年					
-150926	察哈尔右翼前旗	内蒙古自治区	乌兰察布市	察哈尔右翼前旗	民政部	2003年	2024年					
-150927	察哈尔右翼中旗	内蒙古自治区	乌兰察布市	察哈尔右翼中旗	民政部	2003年	2024年					
-150928	察哈尔右翼后旗	内蒙古自治区	乌兰察布市	察哈尔右翼后旗	民政部	2003年	2024年					
-150929	四子王旗	内蒙古自治区	乌兰察布市	四子王旗	民政部	2003年	2024年					
-150981	丰镇市	内蒙古自治区	乌兰察布市	丰镇市	民政部	2003年	2024年					
-152100	呼伦贝尔盟	内蒙古自治区	呼伦贝尔盟	-	民政部	1980年	2000年	[已撤销]	150700	呼伦贝尔市（地市）		
-152101	海拉尔市	内蒙古自治区	呼伦贝尔盟	海拉尔市	民政部	1980年	2000年	[已撤销]	150702	呼伦贝尔市,海拉尔区		
-152102	满洲里市	内蒙古自治区	呼伦贝尔盟	满洲里市	民政部	1980年	2000年	[已撤销]	150781	呼伦贝尔市,满洲里市		
-152103	扎兰屯市	内蒙古自治区	呼伦贝尔盟	扎兰屯市	民政部	1983年	2000年	[已撤销]	150783	呼伦贝尔市,扎兰屯市		
-152104	牙克石市	内蒙古自治区	呼伦贝尔盟	牙克石市	民政部	1983年	2000年	[已撤销]	150782	呼伦贝尔市,牙克石市		
-152105	根河市	内蒙古自治区	呼伦贝尔盟	根河市	民政部	1994年	2000年	[已撤销]	150785	呼伦贝尔市,根河市		
-152106	额尔古纳市	内蒙古自治区	呼伦贝尔盟	额尔古纳市	民政部	1994年	2000年	[已撤销]	150784	呼伦贝尔市,额尔古纳市		
-152121	布特哈旗	内蒙古自治区	呼伦贝尔盟	布特哈旗	民政部	1980年	1982年	[已撤销]	152104	呼伦贝尔盟,牙克石市[已撤销]		
-152122	阿荣旗	内蒙古自治区	呼伦贝尔盟	阿荣旗	民政部	1980年	2000年	[已撤销]	150721	呼伦贝尔市,阿荣旗		
-152123	莫力达瓦达斡尔族自治旗	内蒙古自治区	呼伦贝尔盟	莫力达瓦达斡尔族自治旗	民政部	1980年	2000年	[已撤销]	150722	呼伦贝尔市,莫力达瓦达斡尔族自治旗		
-152124	喜桂图旗	内蒙古自治区	呼伦贝尔盟	喜桂图旗	民政部	1980年	1982年	[已撤销]	152103	呼伦贝尔盟,扎兰屯市[已撤销]		
-152125	额尔古纳右旗	内蒙古自治区	呼伦贝尔盟	额尔古纳右旗	民政部	1980年	1993年	[已撤销]	152106	呼伦贝尔盟,额尔古纳市[已撤销]		
-152126	额尔古纳左旗	内蒙古自治区	呼伦贝尔盟	额尔古纳左旗	民政部	1980年	1993年	[已撤销]	152105	呼伦贝尔盟,根河市[已撤销]		
-152127	鄂伦春自治旗	内蒙古自治区	呼伦贝尔盟	鄂伦春自治旗	民政部	1980年	2000年	[已撤销]	150723	呼伦贝尔市,鄂伦春自治旗		
-152128	鄂温克族自治旗	内蒙古自治区	呼伦贝尔盟	鄂温克族自治旗	民政部	1980年	2000年	[已撤销]	150724	呼伦贝尔市,鄂温克族自治旗		
-152129	新巴尔虎右旗	内蒙古自治区	呼伦贝尔盟	新巴尔虎右旗	民政部	1980年	2000年	[已撤销]	150727	呼伦贝尔市,新巴尔虎右旗		
-152130	新巴尔虎左旗	内蒙古自治区	呼伦贝尔盟	新巴尔虎左旗	民政部	1980年	2000年	[已撤销]	150726	呼伦贝尔市,新巴尔虎左旗		
-152131	陈巴尔虎旗	内蒙古自治区	呼伦贝尔盟	陈巴尔虎旗	民政部	1980年	2000年	[已撤销]	150725	呼伦贝尔市,陈巴尔虎旗		
-152200	兴安盟	内蒙古自治区	兴安盟	-	民政部	1980年	2024年					
-152201	乌兰浩特市	内蒙古自治区	兴安盟	乌兰浩特市	民政部	1980年	2024年					
-152202	阿尔山市	内蒙古自治区	兴安盟	阿尔山市	民政部	1996年	2024年					
-152221	科尔沁右翼前旗	内蒙古自治区	兴安盟	科尔沁右翼前旗	民政部	1980年	2024年					
-152222	科尔沁右翼中旗	内蒙古自治区	兴安盟	科尔沁右翼中旗	民政部	1980年	2024年					
-152223	扎赉特旗	内蒙古自治区	兴安盟	扎赉特旗	民政部	1980年	2024年					
-152224	突泉县	内蒙古自治区	兴安盟	突泉县	民政部	1980年	2024年					
-152300	哲里木盟	内蒙古自治区	哲里木盟	-	民政部	1980年	1998年	[已撤销]	150500	通辽市（地市）		
-152301	通辽市	内蒙古自治区	哲里木盟	通辽市	民政部	1980年	1998年	[已撤销]	150500	通辽市（地市）		
-152302	霍林郭勒市	内蒙古自治区	哲里木盟	霍林郭勒市	民政部	1985年	1998年	[已撤销]	150581	通辽市,霍林郭勒市		
-152321	通辽县	内蒙古自治区	哲里木盟	通辽县	民政部	1980年	1985年	[已撤销]	152301	哲里木盟,通辽市[已撤销]		
-152322	科尔沁左翼中旗	内蒙古自治区	哲里木盟	科尔沁左翼中旗	民政部	1980年	1998年	[已撤销]	150521	通辽市,科尔沁左翼中旗		
-152323	科尔沁左翼后旗	内蒙古自治区	哲里木盟	科尔沁左翼后旗	民政部	1980年	1998年	[已撤销]	150522	通辽市,科尔沁左翼后旗		
-152324	开鲁县	内蒙古自治区	哲里木盟	开鲁县	民政部	1980年	1998年	[已撤销]	150523	通辽市,开鲁县		
-152325	库伦旗	内蒙古自治区	哲里木盟	库伦旗	民政部	1980年	1998年	[已撤销]	150524	通辽市,库伦旗		
-152326	奈曼旗	内蒙古自治区	哲里木盟	奈曼旗	民政部	1980年	1998年	[已撤销]	150525	通辽市,奈曼旗		
-152327	扎鲁特旗	内蒙古自治区	哲里木盟	扎鲁特旗	民政部	1980年	1998年	[已撤销]	150526	通辽市,扎鲁特旗		
-152400	昭乌达盟	内蒙古自治区	昭乌达盟	-	民政部	1980年	1982年	[已撤销]	150400	赤峰市（地市）		
-152401	赤峰市	内蒙古自治区	昭乌达盟	赤峰市	民政部	1980年	1982年	[已撤销]	150400	赤峰市（地市）		
-152421	阿鲁科尔沁旗	内蒙古自治区	昭乌达盟	阿鲁科尔沁旗	民政部	1980年	1982年	[已撤销]	150421	赤峰市,阿鲁科尔沁旗		赤峰县[1981年]
-152422	巴林左旗	内蒙古自治区	昭乌达盟	巴林左旗	民政部	1980年	1982年	[已撤销]	150422	赤峰市,巴林左旗		
-152423	巴林右旗	内蒙古自治区	昭乌达盟	巴林右旗	民政部	1980年	1982年	[已撤销]	150423	赤峰市,巴林右旗		
-152424	林西县	内蒙古自治区	昭乌达盟	林西县	民政部	1980年	1982年	[已撤销]	150424	赤峰市,林西县		
-152425	克什克腾旗	内蒙古自治区	昭乌达盟	克什克腾旗	民政部	1980年	1982年	[已撤销]	150425	赤峰市,克什克腾旗		
-152426	翁牛特旗	内蒙古自治区	昭乌达盟	翁牛特旗	民政部	1980年	1982年	[已撤销]	150426	赤峰市,翁牛特旗		
-152427	赤峰县	内蒙古自治区	昭乌达盟	赤峰县	民政部	1982年	1982年	[已撤销]	150400	赤峰市（地市）		
-152428	喀喇沁旗	内蒙古自治区	昭乌达盟	喀喇沁旗	民政部	1980年	1982年	[已撤销]	150428	赤峰市,喀喇沁旗		
-152429	宁城县	内蒙古自治区	昭乌达盟	宁城县	民政部	1980年	1982年	[已撤销]	150429	赤峰市,宁城县		
-152430	敖汉旗	内蒙古自治区	昭乌达盟	敖汉旗	民政部	1980年	1982年	[已撤销]	150430	赤峰市,敖汉旗		
-152431	阿鲁科尔沁旗	内蒙古自治区	昭乌达盟	阿鲁科尔沁旗	民政部	1980年	1981年	[已撤销]	150421	赤峰市,阿鲁科尔沁旗		
-152500	锡林郭勒盟	内蒙古自治区	锡林郭勒盟	-	民政部	1980年	2024年					伊克昭盟[1981年]
-152501	二连浩特市	内蒙古自治区	锡林郭勒盟	二连浩特市	民政部	1982年	2024年					
-152502	锡林浩特市	内蒙古自治区	锡林郭勒盟	锡林浩特市	民政部	1983年	2024年					
-152521	阿巴哈纳尔旗	内蒙古自治区	锡林郭勒盟	阿巴哈纳尔旗	民政部	1980年	1982年	[已撤销]	152502	锡林郭勒盟,锡林浩特市		东胜县[1981年]
-152522	阿巴嘎旗	内蒙古自治区	锡林郭勒盟	阿巴嘎旗	民政部	1980年	2024年					达拉特旗[1981年]
-152523	苏尼特左旗	内蒙古自治区	锡林郭勒盟	苏尼特左旗	民政部	1980年	2024年					准格尔旗[1981年]
-152524	苏尼特右旗	内蒙古自治区	锡林郭勒盟	苏尼特右旗	民政部	1980年	2024年					鄂托克前旗[1981年]
-152525	东乌珠穆沁旗	内蒙古自治区	锡林郭勒盟	东乌珠穆沁旗	民政部	1980年	2024年					鄂托克旗[1981年]
-152526	西乌珠穆沁旗	内蒙古自治区	锡林郭勒盟	西乌珠穆沁旗	民政部	1980年	2024年					杭锦旗[1981年]
-152527	太仆寺旗	内蒙古自治区	锡林郭勒盟	太仆寺旗	民政部	1980年	2024年					乌审旗[1981年]
-152528	镶黄旗	内蒙古自治区	锡林郭勒盟	镶黄旗	民政部	1980年	2024年					伊金霍洛旗[1981年]
-152529	正镶白旗	内蒙古自治区	锡林郭勒盟	正镶白旗	民政部	1982年	2024年					
-152530	正蓝旗	内蒙古自治区	锡林郭勒盟	正蓝旗	民政部	1982年	2024年					
-152531	多伦县	内蒙古自治区	锡林郭勒盟	多伦县	民政部	1982年	2024年					
-152600	乌兰察布盟	内蒙古自治区	乌兰察布盟	-	民政部	1980年	2002年	[已撤销]	150900	乌兰察布市（地市）		锡林郭勒盟[1981年]
-152601	集宁市	内蒙古自治区	乌兰察布盟	集宁市	民政部	1980年	2002年	[已撤销]	150902	乌兰察布市,集宁区		二连浩特市[1981年]
-152602	丰镇市	内蒙古自治区	乌兰察布盟	丰镇市	民政部	1990年	2002年	[已撤销]	150981	乌兰察布市,丰镇市		
-152621	武川县	内蒙古自治区	乌兰察布盟	武川县	民政部	1980年	1995年	[已撤销]	150125	呼和浩特市,武川县		阿巴哈纳尔旗[1981年]
-152622	和林格尔县	内蒙古自治区	乌兰察布盟	和林格尔县	民政部	1980年	1994年	[已撤销]	150123	呼和浩特市,和林格尔县		阿巴嘎旗[1981年]
-152623	清水河县	内蒙古自治区	乌兰察布盟	清水河县	民政部	1980年	1994年	[已撤销]	150124	呼和浩特市,清水河县		苏尼特左旗[1981年]
-152624	卓资县	内蒙古自治区	乌兰察布盟	卓资县	民政部	1980年	2002年	[已撤销]	150921	乌兰察布市,卓资县		苏尼特右旗[1981年]
-152625	化德县	内蒙古自治区	乌兰察布盟	化德县	民政部	1980年	2002年	[已撤销]	150922	乌兰察布市,化德县		东乌珠穆沁旗[1981年]
-152626	商都县	内蒙古自治区	乌兰察布盟	商都县	民政部	1980年	2002年	[已撤销]	150923	乌兰察布市,商都县		西乌珠穆沁旗[1981年]
-152627	兴和县	内蒙古自治区	乌兰察布盟	兴和县	民政部	1980年	2002年	[已撤销]	150924	乌兰察布市,兴和县		太仆寺旗[1981年]
-152628	丰镇县	内蒙古自治区	乌兰察布盟	丰镇县	民政部	1980年	1989年	[已撤销]	152602	乌兰察布盟,丰镇市[已撤销]		镶黄旗[1981年]
-152629	凉城县	内蒙古自治区	乌兰察布盟	凉城县	民政部	1980年	2002年	[已撤销]	150925	乌兰察布市,凉城县		正镶白旗[1981年]
-152630	察哈尔右翼前旗	内蒙古自治区	乌兰察布盟	察哈尔右翼前旗	民政部	1980年	2002年	[已撤销]	150926	乌兰察布市,察哈尔右翼前旗		正蓝旗[1981年]
-152631	察哈尔右翼中旗	内蒙古自治区	乌兰察布盟	察哈尔右翼中旗	民政部	1980年	2002年	[已撤销]	150927	乌兰察布市,察哈尔右翼中旗		多伦县[1981年]
-152632	察哈尔右翼后旗	内蒙古自治区	乌兰察布盟	察哈尔右翼后旗	民政部	1982年	2002年	[已撤销]	150928	乌兰察布市,察哈尔右翼后旗		
-152633	达尔罕茂明安联合旗	内蒙古自治区	乌兰察布盟	达尔罕茂明安联合旗	民政部	1982年	1995年	[已撤销]	150223	包头市,达尔罕茂明安联合旗		
-152634	四子王旗	内蒙古自治区	乌兰察布盟	四子王旗	民政部	1982年	2002年	[已撤销]	150929	乌兰察布市,四子王旗		
-152700	伊克昭盟	内蒙古自治区	伊克昭盟	-	民政部	1980年	2000年	[已撤销]	150600	鄂尔多斯市（地市）		巴彦淖尔盟[1981年]
-152701	东胜市	内蒙古自治区	伊克昭盟	东胜市	民政部	1983年	2000年	[已撤销]	150602	鄂尔多斯市,东胜区		
-152721	东胜县	内蒙古自治区	伊克昭盟	东胜县	民政部	1980年	1982年	[已撤销]	152701	伊克昭盟,东胜市[已撤销]		临河县[1981年]
-152722	达拉特旗	内蒙古自治区	伊克昭盟	达拉特旗	民政部	1980年	2000年	[已撤销]	150621	鄂尔多斯市,达拉特旗		五原县[1981年]
-152723	准格尔旗	内蒙古自治区	伊克昭盟	准格尔旗	民政部	1980年	2000年	[已撤销]	150622	鄂尔多斯市,准格尔旗		磴口县[1981年]
-152724	鄂托克前旗	内蒙古自治区	伊克昭盟	鄂托克前旗	民政部	1980年	2000年	[已撤销]	150623	鄂尔多斯市,鄂托克前旗		乌拉特前旗[1981年]
-152725	鄂托克旗	内蒙古自治区	伊克昭盟	鄂托克旗	民政部	1980年	2000年	[已撤销]	150624	鄂尔多斯市,鄂托克旗		乌拉特中后联合旗[1980年]；乌拉特中旗[1981年]
-152726	杭锦旗	内蒙古自治区	伊克昭盟	杭锦旗	民政部	1980年	2000年	[已撤销]	150625	鄂尔多斯市,杭锦旗		杭锦后旗[1981年]
-152727	乌审旗	内蒙古自治区	伊克昭盟	乌审旗	民政部	1980年	2000年	[已撤销]	150626	鄂尔多斯市,乌审旗		潮格旗[1980年]；乌拉特后旗[1981年]
-152728	伊金霍洛旗	内蒙古自治区	伊克昭盟	伊金霍洛旗	民政部	1982年	2000年	[已撤销]	150627	鄂尔多斯市,伊金霍洛旗		
-152800	巴彦淖尔盟	内蒙古自治区	巴彦淖尔盟	-	民政部	1980年	2002年	[已撤销]	150800	巴彦淖尔市（地市）		乌兰察布盟[1981年]
-152801	临河市	内蒙古自治区	巴彦淖尔盟	临河市	民政部	1980年	2002年	[已撤销]	150802	巴彦淖尔市,临河区		集宁市[1981年]
-152821	临河县	内蒙古自治区	巴彦淖尔盟	临河县	民政部	1980年	1983年	[已撤销]	152801	巴彦淖尔盟,临河市[已撤销]		武川县[1981年]
-152822	五原县	内蒙古自治区	巴彦淖尔盟	五原县	民政部	1980年	2002年	[已撤销]	150821	巴彦淖尔市,五原县		和林格尔县[1981年]
-152823	磴口县	内蒙古自治区	巴彦淖尔盟	磴口县	民政部	1980年	2002年	[已撤销]	150822	巴彦淖尔市,磴口县		清水河县[1981年]
-152824	乌拉特前旗	内蒙古自治区	巴彦淖尔盟	乌拉特前旗	民政部	1980年	2002年	[已撤销]	150823	巴彦淖尔市,乌拉特前旗		卓资县[1981年]
-152825	乌拉特中旗	内蒙古自治区	巴彦淖尔盟	乌拉特中旗	民政部	1980年	2002年	[已撤销]	150824	巴彦淖尔市,乌拉特中旗		化德县[1981年]
-152826	乌拉特后旗	内蒙古自治区	巴彦淖尔盟	乌拉特后旗	民政部	1980年	2002年	[已撤销]	150825	巴彦淖尔市,乌拉特后旗		商都县[1981年]
-152827	杭锦后旗	内蒙古自治区	巴彦淖尔盟	杭锦后旗	民政部	1980年	2002年	[已撤销]	150826	巴彦淖尔市,杭锦后旗		兴和县[1981年]
-152828	丰镇县	内蒙古自治区	巴彦淖尔盟	丰镇县	民政部	1980年	1981年	[已撤销]	152628	乌兰察布盟,丰镇县[已撤销]		
-152829	凉城县	内蒙古自治区	巴彦淖尔盟	凉城县	民政部	1980年	1981年	[已撤销]	152629	乌兰察布盟,凉城县[已撤销]		
-152830	察哈尔右翼前旗	内蒙古自治区	巴彦淖尔盟	察哈尔右翼前旗	民政部	1980年	1981年	[已撤销]	152630	乌兰察布盟,察哈尔右翼前旗[已撤销]		
-152831	察哈尔右翼中旗	内蒙古自治区	巴彦淖尔盟	察哈尔右翼中旗	民政部	1980年	1981年	[已撤销]	152631	乌兰察布盟,察哈尔右翼中旗[已撤销]		
-152832	察哈尔右翼后旗	内蒙古自治区	巴彦淖尔盟	察哈尔右翼后旗	民政部	1980年	1981年	[已撤销]	152632	乌兰察布盟,察哈尔右翼后旗[已撤销]		
-152833	达尔罕茂明安联合旗	内蒙古自治区	巴彦淖尔盟	达尔罕茂明安联合旗	民政部	1980年	1981年	[已撤销]	152633	乌兰察布盟,达尔罕茂明安联合旗[已撤销]		
-152834	四子王旗	内蒙古自治区	巴彦淖尔盟	四子王旗	民政部	1980年	1981年	[已撤销]	152634	乌兰察布盟,四子王旗[已撤销]		
-152900	阿拉善盟	内蒙古自治区	阿拉善盟	-	民政部	1980年	2024年					
-152921	阿拉善左旗	内蒙古自治区	阿拉善盟	阿拉善左旗	民政部	1980年	2024年					
-152922	阿拉善右旗	内蒙古自治区	阿拉善盟	阿拉善右旗	民政部	1980年	2024年					
-152923	额济纳旗	内蒙古自治区	阿拉善盟	额济纳旗	民政部	1980年	2024年					
-210000	辽宁省	辽宁省	-	-	民政部	1980年	2024年					
-210100	沈阳市	辽宁省	沈阳市	-	民政部	1980年	2024年					
-210101	市辖区	辽宁省	沈阳市	市辖区	国标							增设（GB/T 2260-1984）
-210102	和平区	辽宁省	沈阳市	和平区	民政部	1980年	2024年					
-210103	沈河区	辽宁省	沈阳市	沈河区	民政部	1980年	2024年					
-210104	大东区	辽宁省	沈阳市	大东区	民政部	1980年	2024年					
-210105	皇姑区	辽宁省	沈阳市	皇姑区	民政部	1980年	2024年					
-210106	铁西区	辽宁省	沈阳市	铁西区	民政部	1980年	2024年					
-210111	苏家屯区	辽宁省	沈阳市	苏家屯区	民政部	1980年	2024年					
-210112	浑南区	辽宁省	沈阳市	浑南区	民政部	1980年	2024年					东陵区[2015年]
-210113	沈北新区	辽宁省	沈阳市	沈北新区	民政部	1980年	2024年					新城子区[2005年]
-210114	于洪区	辽宁省	沈阳市	于洪区	民政部	1980年	2024年					
-210115	辽中区	辽宁省	沈阳市	辽中区	民政部	2016年	2024年					
-210120	沈阳市区	辽宁省	沈阳市	沈阳市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210121	新民县	辽宁省	沈阳市	新民县	民政部	1980年	1992年	[已撤销]	219013	省直辖县级行政区划,新民市[已撤销]		
-210122	辽中县	辽宁省	沈阳市	辽中县	民政部	1980年	2015年	[已撤销]	210115	沈阳市,辽中区		
-210123	康平县	辽宁省	沈阳市	康平县	民政部	1992年	2024年					
-210124	法库县	辽宁省	沈阳市	法库县	民政部	1992年	2024年					
-210181	新民市	辽宁省	沈阳市	新民市	民政部	1995年	2024年					
-210200	大连市	辽宁省	大连市	-	民政部	1980年	2024年					旅大市[1980年]
-210201	市辖区	辽宁省	大连市	市辖区	国标							增设（GB/T 2260-1984）
-210202	中山区	辽宁省	大连市	中山区	民政部	1980年	2024年					
-210203	西岗区	辽宁省	大连市	西岗区	民政部	1980年	2024年					
-210204	沙河口区	辽宁省	大连市	沙河口区	民政部	1980年	2024年					
-210211	甘井子区	辽宁省	大连市	甘井子区	民政部	1980年	2024年					
-210212	旅顺口区	辽宁省	大连市	旅顺口区	民政部	1980年	2024年					
-210213	金州区	辽宁省	大连市	金州区	民政部	1987年	2024年					
-210214	普兰店区	辽宁省	大连市	普兰店区	民政部	2015年	2024年			省直辖县级行政区划,普兰店市[已撤销]		
-210219	瓦房店市	辽宁省	大连市	瓦房店市	民政部	1985年	1985年	[已撤销]	219001	省直辖县级行政区划,瓦房店市[已撤销]		
-210220	市区	辽宁省	大连市	市区	国标							旅大市区（GB/T 2260-1982）
-210221	金县	辽宁省	大连市	金县	民政部	1980年	1986年	[已撤销]	210213	大连市,金州区		
-210222	新金县	辽宁省	大连市	新金县	民政部	1980年	1990年	[已撤销]	210282	大连市,普兰店市[已撤销]		
-210223	复县	辽宁省	大连市	复县	民政部	1980年	1984年	[已撤销]	210219	大连市,瓦房店市[已撤销]		
-210224	长海县	辽宁省	大连市	长海县	民政部	1980年	2024年					
-210225	庄河县	辽宁省	大连市	庄河县	民政部	1980年	1991年	[已撤销]	219010	省直辖县级行政区划,庄河市[已撤销]		
-210281	瓦房店市	辽宁省	大连市	瓦房店市	民政部	1995年	2024年					
-210282	普兰店市	辽宁省	大连市	普兰店市	民政部	1995年	2014年	[已撤销]	210214	大连市,普兰店市		
-210283	庄河市	辽宁省	大连市	庄河市	民政部	1995年	2024年					
-210300	鞍山市	辽宁省	鞍山市	-	民政部	1980年	2024年					
-210301	市辖区	辽宁省	鞍山市	市辖区	国标							增设（GB/T 2260-1984）
-210302	铁东区	辽宁省	鞍山市	铁东区	民政部	1980年	2024年					
-210303	铁西区	辽宁省	鞍山市	铁西区	民政部	1980年	2024年					
-210304	立山区	辽宁省	鞍山市	立山区	民政部	1980年	2024年					
-210311	千山区	辽宁省	鞍山市	千山区	民政部	1980年	2024年					郊区[1983年]；旧堡区[1995年]
-210319	海城市	辽宁省	鞍山市	海城市	民政部	1985年	1985年	[已撤销]	219002	省直辖县级行政区划,海城市[已撤销]		
-210320	市区	辽宁省	鞍山市	市区	非官方							
-210321	台安县	辽宁省	鞍山市	台安县	民政部	1980年	2024年					
-210322	海城县	辽宁省	鞍山市	海城县	民政部	1980年	1984年	[已撤销]	210319	鞍山市,海城市[已撤销]		
-210323	岫岩满族自治县	辽宁省	鞍山市	岫岩满族自治县	民政部	1992年	2024年					
-210381	海城市	辽宁省	鞍山市	海城市	民政部	1995年	2024年					
-210400	抚顺市	辽宁省	抚顺市	-	民政部	1980年	2024年					
-210401	市辖区	辽宁省	抚顺市	市辖区	国标							增设（GB/T 2260-1984）
-210402	新抚区	辽宁省	抚顺市	新抚区	民政部	1980年	2024年					
-210403	东洲区	辽宁省	抚顺市	东洲区	民政部	1980年	2024年					露天区[1998年]
-210404	望花区	辽宁省	抚顺市	望花区	民政部	1980年	2024年					
-210411	顺城区	辽宁省	抚顺市	顺城区	民政部	1980年	2024年					郊区[1987年]
-210420	抚顺市区	辽宁省	抚顺市	抚顺市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210421	抚顺县	辽宁省	抚顺市	抚顺县	民政部	1980年	2024年					
-210422	新宾满族自治县	辽宁省	抚顺市	新宾满族自治县	民政部	1980年	2024年					新宾县[1984年]
-210423	清原满族自治县	辽宁省	抚顺市	清原满族自治县	民政部	1980年	2024年					清原县[1988年]
-210500	本溪市	辽宁省	本溪市	-	民政部	1980年	2024年					
-210501	市辖区	辽宁省	本溪市	市辖区	国标							增设（GB/T 2260-1984）
-210502	平山区	辽宁省	本溪市	平山区	民政部	1980年	2024年					
-210503	溪湖区	辽宁省	本溪市	溪湖区	民政部	1980年	2024年					
-210504	明山区	辽宁省	本溪市	明山区	民政部	1984年	2024年					
-210505	南芬区	辽宁省	本溪市	南芬区	民政部	1984年	2024年					
-210511	立新区	辽宁省	本溪市	南芬区	民政部	1980年	1985年	[已撤销]	210505	本溪市,南芬区		立新区[1983年]
-210520	本溪市区	辽宁省	本溪市	本溪市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210521	本溪满族自治县	辽宁省	本溪市	本溪满族自治县	民政部	1980年	2024年					本溪县[1988年]
-210522	桓仁满族自治县	辽宁省	本溪市	桓仁满族自治县	民政部	1980年	2024年					桓仁县[1988年]
-210600	丹东市	辽宁省	丹东市	-	民政部	1980年	2024年					
-210601	市辖区	辽宁省	丹东市	市辖区	国标							增设（GB/T 2260-1984）
-210602	元宝区	辽宁省	丹东市	元宝区	民政部	1980年	2024年					
-210603	振兴区	辽宁省	丹东市	振兴区	民政部	1980年	2024年					
-210604	振安区	辽宁省	丹东市	振安区	民政部	1980年	2024年					
-210620	丹东市区	辽宁省	丹东市	丹东市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210621	凤城满族自治县	辽宁省	丹东市	凤城满族自治县	民政部	1980年	1993年	[已撤销]	219016	省直辖县级行政区划,凤城市[已撤销]		凤城县[1984年]
-210622	岫岩满族自治县	辽宁省	丹东市	岫岩满族自治县	民政部	1980年	1991年	[已撤销]	210323	鞍山市,岫岩满族自治县		岫岩县[1984年]
-210623	东沟县	辽宁省	丹东市	东沟县	民政部	1980年	1992年	[已撤销]	219014	省直辖县级行政区划,东港市[已撤销]		
-210624	宽甸满族自治县	辽宁省	丹东市	宽甸满族自治县	民政部	1980年	2024年					宽甸县[1988年]
-210681	东港市	辽宁省	丹东市	东港市	民政部	1995年	2024年					
-210682	凤城市	辽宁省	丹东市	凤城市	民政部	1995年	2024年					
-210700	锦州市	辽宁省	锦州市	-	民政部	1980年	2024年					
-210701	市辖区	辽宁省	锦州市	市辖区	国标							增设（GB/T 2260-1984）
-210702	古塔区	辽宁省	锦州市	古塔区	民政部	1980年	2024年					
-210703	凌河区	辽宁省	锦州市	凌河区	民政部	1980年	2024年					
-210704	南票区	辽宁省	锦州市	南票区	民政部	1982年	1988年	[已撤销]	211404	葫芦岛市,南票区		
-210705	葫芦岛区	辽宁省	锦州市	葫芦岛区	民政部	1982年	1988年	[已撤销]	211405	葫芦岛市,葫芦岛区[已撤销]		
-210706	太和区	辽宁省	锦州市	太和区	民政部	1982年	1982年	[已撤销]	210711	锦州市,太和区		
-210711	太和区	辽宁省	锦州市	太和区	民政部	1980年	2024年					郊区[1981年]
-210719	锦西市	辽宁省	锦州市	锦西市	民政部	1985年	1985年	[已撤销]	219003	省直辖县级行政区划,锦西市[已撤销]		
-210720	锦州市区	辽宁省	锦州市	锦州市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210721	锦西县	辽宁省	锦州市	锦西县	民政部	1980年	1984年	[已撤销]	210719	锦州市,锦西市[已撤销]		
-210722	兴城县	辽宁省	锦州市	兴城县	民政部	1980年	1985年	[已撤销]	219004	省直辖县级行政区划,兴城市[已撤销]		
-210723	绥中县	辽宁省	锦州市	绥中县	民政部	1980年	1988年	[已撤销]	211421	葫芦岛市,绥中县		
-210724	锦县	辽宁省	锦州市	锦县	民政部	1980年	1992年	[已撤销]	219015	省直辖县级行政区划,凌海市[已撤销]		
-210725	北镇满族自治县	辽宁省	锦州市	北镇满族自治县	民政部	1980年	1994年	[已撤销]	210782	锦州市,北镇市		北镇县[1988年]
-210726	黑山县	辽宁省	锦州市	黑山县	民政部	1980年	2024年					
-210727	义县	辽宁省	锦州市	义县	民政部	1980年	2024年					
-210781	凌海市	辽宁省	锦州市	凌海市	民政部	1995年	2024年					
-210782	北镇市	辽宁省	锦州市	北镇市	民政部	1995年	2024年					北宁市[2005年]
-210800	营口市	辽宁省	营口市	-	民政部	1980年	2024年					
-210801	市辖区	辽宁省	营口市	市辖区	国标							增设（GB/T 2260-1984）
-210802	站前区	辽宁省	营口市	站前区	民政部	1980年	2024年					
-210803	西市区	辽宁省	营口市	西市区	民政部	1980年	2024年					
-210804	鲅鱼圈区	辽宁省	营口市	鲅鱼圈区	民政部	1984年	2024年					
-210811	老边区	辽宁省	营口市	老边区	民政部	1980年	2024年					郊区[1983年]
-210812	鲅鱼圈区	辽宁省	营口市	鲅鱼圈区	非官方							
-210820	营口市区	辽宁省	营口市	营口市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210821	营口县	辽宁省	营口市	营口县	民政部	1980年	1991年	[已撤销]	210882	营口市,大石桥市		
-210822	盘山县	辽宁省	营口市	盘山县	民政部	1980年	1983年	[已撤销]	211122	盘锦市,盘山县		
-210823	大洼县	辽宁省	营口市	大洼县	民政部	1980年	1983年	[已撤销]	211121	盘锦市,大洼县[已撤销]		
-210824	盖县	辽宁省	营口市	盖县	民政部	1980年	1991年	[已撤销]	219012	省直辖县级行政区划,盖州市[已撤销]		
-210881	盖州市	辽宁省	营口市	盖州市	民政部	1995年	2024年					
-210882	大石桥市	辽宁省	营口市	大石桥市	民政部	1995年	2024年					
-210900	阜新市	辽宁省	阜新市	-	民政部	1980年	2024年					
-210901	市辖区	辽宁省	阜新市	市辖区	国标							增设（GB/T 2260-1984）
-210902	海州区	辽宁省	阜新市	海州区	民政部	1980年	2024年					
-210903	新邱区	辽宁省	阜新市	新邱区	民政部	1980年	2024年					
-210904	太平区	辽宁省	阜新市	太平区	民政部	1980年	2024年					
-210905	清河门区	辽宁省	阜新市	清河门区	民政部	1983年	2024年					
-210911	细河区	辽宁省	阜新市	细河区	民政部	1980年	2024年					郊区[1983年]
-210920	阜新市区	辽宁省	阜新市	阜新市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-210921	阜新蒙古族自治县	辽宁省	阜新市	阜新蒙古族自治县	民政部	1980年	2024年					
-210922	彰武县	辽宁省	阜新市	彰武县	民政部	1980年	2024年					
-211000	辽阳市	辽宁省	辽阳市	-	民政部	1980年	2024年					
-211001	市辖区	辽宁省	辽阳市	市辖区	国标							增设（GB/T 2260-1984）
-211002	白塔区	辽宁省	辽阳市	白塔区	民政部	1980年	2024年					
-211003	文圣区	辽宁省	辽阳市	文圣区	民政部	1980年	2024年					
-211004	宏伟区	辽宁省	辽阳市	宏伟区	民政部	1980年	2024年					
-211005	弓长岭区	辽宁省	辽阳市	弓长岭区	民政部	1984年	2024年					
-211011	太子河区	辽宁省	辽阳市	太子河区	民政部	1980年	2024年					郊区[1983年]
-211020	辽阳市区	辽宁省	辽阳市	辽阳市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-211021	辽阳县	辽宁省	辽阳市	辽阳县	民政部	1980年	2024年					
-211022	灯塔县	辽宁省	辽阳市	灯塔县	民政部	1980年	1995年	[已撤销]	211081	辽阳市,灯塔市		
-211081	灯塔市	辽宁省	辽阳市	灯塔市	民政部	1996年	2024年					
-211100	盘锦市	辽宁省	盘锦市	-	民政部	1984年	2024年					
-211101	市辖区	辽宁省	盘锦市	市辖区	国标							增设（GB/T 2260-1984）
-211102	双台子区	辽宁省	盘锦市	双台子区	民政部	1984年	2024年					盘山区[1985年]
-211103	兴隆台区	辽宁省	盘锦市	兴隆台区	民政部	1984年	2024年					
-211104	大洼区	辽宁省	盘锦市	大洼区	民政部	2016年	2024年					
-211111	郊区	辽宁省	盘锦市	郊区	民政部	1984年	1985年	[已撤销]	211122	盘锦市,盘山县		
-211121	大洼县	辽宁省	盘锦市	大洼县	民政部	1984年	2015年	[已撤销]	211104	盘锦市,大洼区		
-211122	盘山县	辽宁省	盘锦市	盘山县	民政部	1986年	2024年					
-211200	铁岭市	辽宁省	铁岭市	-	民政部	1984年	2024年					
-211201	市辖区	辽宁省	铁岭市	市辖区	国标							增设（GB/T 2260-1984）
-211202	银州区	辽宁省	铁岭市	银州区	民政部	1984年	2024年					
-211203	铁法区	辽宁省	铁岭市	铁法区	民政部	1984年	1985年	[已撤销]	219005	省直辖县级行政区划,铁法市[已撤销]		
-211204	清河区	辽宁省	铁岭市	清河区	民政部	1984年	2024年					
-211221	铁岭县	辽宁省	铁岭市	铁岭县	民政部	1984年	2024年					
-211222	开原县	辽宁省	铁岭市	开原县	民政部	1984年	1987年	[已撤销]	219007	省直辖县级行政区划,开原市[已撤销]		
-211223	西丰县	辽宁省	铁岭市	西丰县	民政部	1984年	2024年					
-211224	昌图县	辽宁省	铁岭市	昌图县	民政部	1984年	2024年					
-211225	康平县	辽宁省	铁岭市	康平县	民政部	1984年	1991年	[已撤销]	210123	沈阳市,康平县		
-211226	法库县	辽宁省	铁岭市	法库县	民政部	1984年	1991年	[已撤销]	210124	沈阳市,法库县		
-211281	调兵山市	辽宁省	铁岭市	调兵山市	民政部	1995年	2024年					铁法市[2001年]
-211282	开原市	辽宁省	铁岭市	开原市	民政部	1995年	2024年					
-211300	朝阳市	辽宁省	朝阳市	-	民政部	1984年	2024年					
-211301	市辖区	辽宁省	朝阳市	市辖区	国标							增设（GB/T 2260-1984）
-211302	双塔区	辽宁省	朝阳市	双塔区	民政部	1984年	2024年					
-211303	龙城区	辽宁省	朝阳市	龙城区	民政部	1984年	2024年					
-211319	北票市	辽宁省	朝阳市	北票市	民政部	1985年	1985年	[已撤销]	219006	省直辖县级行政区划,北票市[已撤销]		
-211321	朝阳县	辽宁省	朝阳市	朝阳县	民政部	1984年	2024年					
-211322	建平县	辽宁省	朝阳市	建平县	民政部	1984年	2024年					
-211323	凌源县	辽宁省	朝阳市	凌源县	民政部	1984年	1990年	[已撤销]	219009	省直辖县级行政区划,凌源市[已撤销]		
-211324	喀喇沁左翼蒙古族自治县	辽宁省	朝阳市	喀喇沁左翼蒙古族自治县	民政部	1984年	2024年					
-211325	建昌县	辽宁省	朝阳市	建昌县	民政部	1984年	1988年	[已撤销]	211422	葫芦岛市,建昌县		
-211326	北票县	辽宁省	朝阳市	北票县	民政部	1984年	1984年	[已撤销]	211319	朝阳市,北票市[已撤销]		
-211381	北票市	辽宁省	朝阳市	北票市	民政部	1995年	2024年					
-211382	凌源市	辽宁省	朝阳市	凌源市	民政部	1995年	2024年					
-211400	葫芦岛市	辽宁省	葫芦岛市	-	民政部	1989年	2024年					锦西市[1993年]
-211401	市辖区	辽宁省	葫芦岛市	市辖区	国标							
-211402	连山区	辽宁省	葫芦岛市	连山区	民政部	1989年	2024年					
-211403	龙港区	辽宁省	葫芦岛市	龙港区	民政部	1994年	2024年					
-211404	南票区	辽宁省	葫芦岛市	南票区	民政部	1989年	2024年					
-211405	葫芦岛区	辽宁省	葫芦岛市	葫芦岛区	民政部	1989年	1993年	[已撤销]	211403	葫芦岛市,龙港区		
-211421	绥中县	辽宁省	葫芦岛市	绥中县	民政部	1989年	2024年					
-211422	建昌县	辽宁省	葫芦岛市	建昌县	民政部	1989年	2024年					
-211481	兴城市	辽宁省	葫芦岛市	兴城市	民政部	1995年	2024年					
-212100	铁岭地区	辽宁省	铁岭地区	-	民政部	1980年	1983年	[已撤销]	211200	铁岭市（地市）		
-212101	铁岭市	辽宁省	铁岭地区	铁岭市	民政部	1980年	1983年	[已撤销]	211200	铁岭市（地市）		
-212102	铁法市	辽宁省	铁岭地区	铁法市	民政部	1981年	1983年	[已撤销]	211203	铁岭市,铁法区[已撤销]		
-212121	铁岭县	辽宁省	铁岭地区	铁岭县	民政部	1980年	1983年	[已撤销]	211221	铁岭市,铁岭县		
-212122	开原县	辽宁省	铁岭地区	开原县	民政部	1980年	1983年	[已撤销]	211222	铁岭市,开原县[已撤销]		
-212123	西丰县	辽宁省	铁岭地区	西丰县	民政部	1980年	1983年	[已撤销]	211223	铁岭市,西丰县		
-212124	昌图县	辽宁省	铁岭地区	昌图县	民政部	1980年	1983年	[已撤销]	211224	铁岭市,昌图县		
-212125	康平县	辽宁省	铁岭地区	康平县	民政部	1980年	1983年	[已撤销]	211225	铁岭市,康平县[已撤销]		
-212126	法库县	辽宁省	铁岭地区	法库县	民政部	1980年	1983年	[已撤销]	211226	铁岭市,法库县[已撤销]		
-212200	朝阳地区	辽宁省	朝阳地区	-	民政部	1980年	1983年	[已撤销]	211300	朝阳市（地市）		
-212201	朝阳市	辽宁省	朝阳地区	朝阳市	民政部	1980年	1983年	[已撤销]	211300	朝阳市（地市）		
-212221	朝阳县	辽宁省	朝阳地区	朝阳县	民政部	1980年	1983年	[已撤销]	211303	朝阳市,龙城区		
-212222	建平县	辽宁省	朝阳地区	建平县	民政部	1980年	1983年	[已撤销]	211322	朝阳市,建平县		
-212223	凌源县	辽宁省	朝阳地区	凌源县	民政部	1980年	1983年	[已撤销]	211323	朝阳市,凌源县[已撤销]		
-212224	喀喇沁左翼蒙古族自治县	辽宁省	朝阳地区	喀喇沁左翼蒙古族自治县	民政部	1980年	1983年	[已撤销]	211324	朝阳市,喀喇沁左翼蒙古族自治县		
-212225	建昌县	辽宁省	朝阳地区	建昌县	民政部	1980年	1983年	[已撤销]	211325	朝阳市,建昌县[已撤销]		
-212226	北票县	辽宁省	朝阳地区	北票县	民政部	1980年	1983年	[已撤销]	211326	朝阳市,北票县[已撤销]		
-219000	省直辖行政单位	辽宁省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-219001	瓦房店市	辽宁省	省直辖县级行政区划	瓦房店市	民政部	1986年	1994年	[已撤销]	210281	大连市,瓦房店市		
-219002	海城市	辽宁省	省直辖县级行政区划	海城市	民政部	1986年	1994年	[已撤销]	210381	鞍山市,海城市		
-219003	锦西市	辽宁省	省直辖县级行政区划	锦西市	民政部	1986年	1988年	[已撤销]	211400	葫芦岛市（地市）		
-219004	兴城市	辽宁省	省直辖县级行政区划	兴城市	民政部	1986年	1994年	[已撤销]	211481	葫芦岛市,兴城市		
-219005	铁法市	辽宁省	省直辖县级行政区划	铁法市	民政部	1986年	1994年	[已撤销]	211281	铁岭市,调兵山市		
-219006	北票市	辽宁省	省直辖县级行政区划	北票市	民政部	1986年	1994年	[已撤销]	211381	朝阳市,北票市		
-219007	开原市	辽宁省	省直辖县级行政区划	开原市	民政部	1988年	1994年	[已撤销]	211282	铁岭市,开原市		
-219008	普兰店市	辽宁省	省直辖县级行政区划	普兰店市	民政部	1991年	1994年	[已撤销]	210282	大连市,普兰店市[已撤销]		
-219009	凌源市	辽宁省	省直辖县级行政区划	凌源市	民政部	1991年	1994年	[已撤销]	211382	朝阳市,凌源市		
-219010	庄河市	辽宁省	省直辖县级行政区划	庄河市	民政部	1992年	1994年	[已撤销]	210283	大连市,庄河市		
-219011	大石桥市	辽宁省	省直辖县级行政区划	大石桥市	民政部	1992年	1994年	[已撤销]	210882	营口市,大石桥市		
-219012	盖州市	辽宁省	省直辖县级行政区划	盖州市	民政部	1992年	1994年	[已撤销]	210881	营口市,盖州市		
-219013	新民市	辽宁省	省直辖县级行政区划	新民市	民政部	1993年	1994年	[已撤销]	210181	沈阳市,新民市		
-219014	东港市	辽宁省	省直辖县级行政区划	东港市	民政部	1993年	1994年	[已撤销]	210681	丹东市,东港市		
-219015	凌海市	辽宁省	省直辖县级行政区划	凌海市	民政部	1993年	1994年	[已撤销]	210781	锦州市,凌海市		
-219016	凤城市	辽宁省	省直辖县级行政区划	凤城市	民政部	1994年	1994年	[已撤销]	210682	丹东市,凤城市		
-220000	吉林省	吉林省	-	-	民政部	1980年	2024年					
-220100	长春市	吉林省	长春市	-	民政部	1980年	2024年					
-220101	市辖区	吉林省	长春市	市辖区	国标							增设（GB/T 2260-1984）
-220102	南关区	吉林省	长春市	南关区	民政部	1980年	2024年					
-220103	宽城区	吉林省	长春市	宽城区	民政部	1980年	2024年					
-220104	朝阳区	吉林省	长春市	朝阳区	民政部	1980年	2024年					
-220105	二道区	吉林省	长春市	二道区	民政部	1980年	2024年					二道河子区[1994年]
-220106	绿园区	吉林省	长春市	绿园区	民政部	1995年	2024年					
-220111	郊区	吉林省	长春市	郊区	民政部	1980年	1994年	[已撤销]	220106	长春市,绿园区		
-220112	双阳区	吉林省	长春市	双阳区	民政部	1995年	2024年					
-220113	九台区	吉林省	长春市	九台区	民政部	2014年	2024年					
-220120	长春市区	吉林省	长春市	长春市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-220121	榆树县	吉林省	长春市	榆树县	民政部	1980年	1989年	[已撤销]	229007	省直辖县级行政区划,榆树市[已撤销]		
-220122	农安县	吉林省	长春市	农安县	民政部	1980年	2024年					
-220123	九台县	吉林省	长春市	九台县	民政部	1980年	1987年	[已撤销]	229005	省直辖县级行政区划,九台市[已撤销]		
-220124	德惠县	吉林省	长春市	德惠县	民政部	1980年	1993年	[已撤销]	229012	省直辖县级行政区划,德惠市[已撤销]		
-220125	双阳县	吉林省	长春市	双阳县	民政部	1980年	1994年	[已撤销]	220112	长春市,双阳区		
-220181	九台市	吉林省	长春市	九台市	民政部	1995年	2013年	[已撤销]	220113	长春市,九台区		
-220182	榆树市	吉林省	长春市	榆树市	民政部	1995年	2024年					
-220183	德惠市	吉林省	长春市	德惠市	民政部	1995年	2024年					
-220184	公主岭市	吉林省	长春市	公主岭市	民政部	2020年	2024年					
-220200	吉林市	吉林省	吉林市	-	民政部	1980年	2024年					
-220201	市辖区	吉林省	吉林市	市辖区	国标							增设（GB/T 2260-1984）
-220202	昌邑区	吉林省	吉林市	昌邑区	民政部	1980年	2024年					
-220203	龙潭区	吉林省	吉林市	龙潭区	民政部	1980年	2024年					
-220204	船营区	吉林省	吉林市	船营区	民政部	1980年	2024年					
-220205	丰满区	吉林省	吉林市	丰满区	非官方							医保区划为“高新区”
-220211	丰满区	吉林省	吉林市	丰满区	民政部	1980年	2024年					郊区[1991年]
-220220	吉林市区	吉林省	吉林市	吉林市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-220221	永吉县	吉林省	吉林市	永吉县	民政部	1980年	2024年					
-220222	舒兰县	吉林省	吉林市	舒兰县	民政部	1980年	1991年	[已撤销]	229008	省直辖县级行政区划,舒兰市[已撤销]		
-220223	磐石县	吉林省	吉林市	磐石县	民政部	1980年	1994年	[已撤销]	220284	吉林市,磐石市		
-220224	蛟河县	吉林省	吉林市	蛟河县	民政部	1980年	1988年	[已撤销]	229006	省直辖县级行政区划,蛟河市[已撤销]		
-220225	桦甸县	吉林省	吉林市	桦甸县	民政部	1980年	1987年	[已撤销]	229004	省直辖县级行政区划,桦甸市[已撤销]		
-220281	蛟河市	吉林省	吉林市	蛟河市	民政部	1995年	2024年					蛟河市[2002年]；桦甸市[2003年]
-220282	桦甸市	吉林省	吉林市	桦甸市	民政部	1995年	2024年					桦甸市[2002年]；蛟河市[2003年]
-220283	舒兰市	吉林省	吉林市	舒兰市	民政部	1995年	2024年					
-220284	磐石市	吉林省	吉林市	磐石市	民政部	1995年	2024年					
-220300	四平市	吉林省	四平市	-	民政部	1983年	2024年					
-220301	铁西区	吉林省	四平市	铁西区	民政部	1983年	1983年	[已撤销]	220302	四平市,铁西区		
-220302	铁西区	吉林省	四平市	铁西区	民政部	1983年	2024年					铁东区[1983年]
-220303	铁东区	吉林省	四平市	铁东区	民政部	1984年	2024年					
-220319	公主岭市	吉林省	四平市	公主岭市	民政部	1985年	1987年	[已撤销]	229001	省直辖县级行政区划,公主岭市[已撤销]		
-220321	怀德县	吉林省	四平市	怀德县	民政部	1983年	1984年	[已撤销]	220319	四平市,公主岭市[已撤销]		
-220322	梨树县	吉林省	四平市	梨树县	民政部	1983年	2024年					
-220323	伊通满族自治县	吉林省	四平市	伊通满族自治县	民政部	1983年	2024年					伊通县[1987年]
-220324	双辽县	吉林省	四平市	双辽县	民政部	1983年	1995年	[已撤销]	220382	四平市,双辽市		
-220381	公主岭市	吉林省	四平市	公主岭市	民政部	1995年	2019年	[已撤销]	220184	长春市,公主岭市		
-220382	双辽市	吉林省	四平市	双辽市	民政部	1996年	2024年					
-220400	辽源市	吉林省	辽源市	-	民政部	1983年	2024年					
-220401	龙山区	吉林省	辽源市	龙山区	民政部	1983年	1983年	[已撤销]	220402	辽源市,龙山区		
-220402	龙山区	吉林省	辽源市	龙山区	民政部	1983年	2024年					西安区[1983年]
-220403	西安区	吉林省	辽源市	西安区	民政部	1984年	2024年					
-220421	东丰县	吉林省	辽源市	东丰县	民政部	1983年	2024年					
-220422	东辽县	吉林省	辽源市	东辽县	民政部	1983年	2024年					
-220500	通化市	吉林省	通化市	-	民政部	1985年	2024年					
-220501	市辖区	吉林省	通化市	市辖区	国标							
-220502	东昌区	吉林省	通化市	东昌区	民政部	1986年	2024年					
-220503	二道江区	吉林省	通化市	二道江区	民政部	1986年	2024年					
-220519	梅河口市	吉林省	通化市	梅河口市	民政部	1985年	1987年	[已撤销]	229002	省直辖县级行政区划,梅河口市[已撤销]		
-220520		吉林省	通化市		非官方						1970年	未知地区（通化市区？参考220120、220220）
-220521	通化县	吉林省	通化市	通化县	民政部	1985年	2024年					
-220522	集安县	吉林省	通化市	集安县	民政部	1985年	1987年	[已撤销]	229003	省直辖县级行政区划,集安市[已撤销]		
-220523	辉南县	吉林省	通化市	辉南县	民政部	1985年	2024年					
-220524	柳河县	吉林省	通化市	柳河县	民政部	1985年	2024年					
-220581	梅河口市	吉林省	通化市	梅河口市	民政部	1995年	2024年					
-220582	集安市	吉林省	通化市	集安市	民政部	1995年	2024年					
-220600	白山市	吉林省	白山市	-	民政部	1985年	2024年					浑江市[1993年]
-220601	市辖区	吉林省	白山市	市辖区	国标							
-220602	浑江区	吉林省	白山市	浑江区	民政部	1986年	2024年					八道江区[2009年]
-220603	三岔子区	吉林省	白山市	三岔子区	民政部	1986年	1994年	[已撤销]	220625	白山市,江源县[已撤销]		
-220604	临江区	吉林省	白山市	临江区	民政部	1986年	1991年	[已撤销]	220624	白山市,临江县[已撤销]		
-220605	江源区	吉林省	白山市	江源区	民政部	2006年	2024年					
-220621	抚松县	吉林省	白山市	抚松县	民政部	1985年	2024年					
-220622	靖宇县	吉林省	白山市	靖宇县	民政部	1985年	2024年					
-220623	长白朝鲜族自治县	吉林省	白山市	长白朝鲜族自治县	民政部	1985年	2024年					
-220624	临江县	吉林省	白山市	临江县	民政部	1992年	1992年	[已撤销]	229011	省直辖县级行政区划,临江市[已撤销]		
-220625	江源县	吉林省	白山市	江源县	民政部	1995年	2005年	[已撤销]	220605	白山市,江源区		
-220681	临江市	吉林省	白山市	临江市	民政部	1995年	2024年					
-220700	松原市	吉林省	松原市	-	民政部	1992年	2024年					
-220701	市辖区	吉林省	松原市	市辖区	国标							
-220702	宁江区	吉林省	松原市	宁江区	民政部	1992年	2024年					扶余区[1994年]
-220721	前郭尔罗斯蒙古族自治县	吉林省	松原市	前郭尔罗斯蒙古族自治县	民政部	1992年	2024年					
-220722	长岭县	吉林省	松原市	长岭县	民政部	1992年	2024年					
-220723	乾安县	吉林省	松原市	乾安县	民政部	1992年	2024年					
-220724	扶余县	吉林省	松原市	扶余县	民政部	1995年	2012年	[已撤销]	220781	松原市,扶余市		
-220781	扶余市	吉林省	松原市	扶余市	民政部	2013年	2024年					
-220800	白城市	吉林省	白城市	-	民政部	1993年	2024年					
-220801	市辖区	吉林省	白城市	市辖区	国标							
-220802	洮北区	吉林省	白城市	洮北区	民政部	1993年	2024年					
-220821	镇赉县	吉林省	白城市	镇赉县	民政部	1993年	2024年					
-220822	通榆县	吉林省	白城市	通榆县	民政部	1993年	2024年					
-220881	洮南市	吉林省	白城市	洮南市	民政部	1995年	2024年					
-220882	大安市	吉林省	白城市	大安市	民政部	1995年	2024年					
-222100	四平地区	吉林省	四平地区	-	民政部	1980年	1982年	[已撤销]	220300	四平市（地市）		
-222101	四平市	吉林省	四平地区	四平市	民政部	1980年	1982年	[已撤销]	220300	四平市（地市）		
-222102	辽源市	吉林省	四平地区	辽源市	民政部	1980年	1982年	[已撤销]	220400	辽源市（地市）		
-222121	怀德县	吉林省	四平地区	怀德县	民政部	1980年	1982年	[已撤销]	220321	四平市,怀德县[已撤销]		
-222122	梨树县	吉林省	四平地区	梨树县	民政部	1980年	1982年	[已撤销]	220322	四平市,梨树县		
-222123	伊通县	吉林省	四平地区	伊通县	民政部	1980年	1982年	[已撤销]	220323	四平市,伊通满族自治县		
-222124	东丰县	吉林省	四平地区	东丰县	民政部	1980年	1982年	[已撤销]	220421	辽源市,东丰县		
-222125	双辽县	吉林省	四平地区	双辽县	民政部	1980年	1982年	[已撤销]	220324	四平市,双辽县[已撤销]		
-222200	通化地区	吉林省	通化地区	-	民政部	1980年	1984年	[已撤销]	220500	通化市（地市）		
-222201	通化市	吉林省	通化地区	通化市	民政部	1980年	1984年	[已撤销]	220521	通化市,通化县		
-222202	浑江市	吉林省	通化地区	浑江市	民政部	1980年	1984年	[已撤销]	220602	白山市,浑江区		
-222221	海龙县	吉林省	通化地区	海龙县	民政部	1980年	1984年	[已撤销]	220519	通化市,梅河口市[已撤销]		
-222222	通化县	吉林省	通化地区	通化县	民政部	1980年	1984年	[已撤销]	220521	通化市,通化县		
-222223	柳河县	吉林省	通化地区	柳河县	民政部	1980年	1984年	[已撤销]	220524	通化市,柳河县		
-222224	辉南县	吉林省	通化地区	辉南县	民政部	1980年	1984年	[已撤销]	220523	通化市,辉南县		
-222225	集安县	吉林省	通化地区	集安县	民政部	1980年	1984年	[已撤销]	220522	通化市,集安县[已撤销]		
-222226	抚松县	吉林省	通化地区	抚松县	民政部	1980年	1984年	[已撤销]	220621	白山市,抚松县		
-222227	靖宇县	吉林省	通化地区	靖宇县	民政部	1980年	1984年	[已撤销]	220622	白山市,靖宇县		
-222228	长白朝鲜族自治县	吉林省	通化地区	长白朝鲜族自治县	民政部	1980年	1984年	[已撤销]	220623	白山市,长白朝鲜族自治县		
-222300	白城地区	吉林省	白城地区	-	民政部	1980年	1992年	[已撤销]	220800	白城市（地市）		
-222301	白城市	吉林省	白城地区	白城市	民政部	1980年	1992年	[已撤销]	220800	白城市（地市）		
-222302	洮南市	吉林省	白城地区	洮南市	民政部	1987年	1992年	[已撤销]	229010	省直辖县级行政区划,洮南市[已撤销]		
-222303	扶余市	吉林省	白城地区	扶余市	民政部	1987年	1991年	[已撤销]	220724	松原市,扶余县[已撤销]		
-222304	大安市	吉林省	白城地区	大安市	民政部	1988年	1992年	[已撤销]	229009	省直辖县级行政区划,大安市[已撤销]		
-222321	扶余县	吉林省	白城地区	扶余县	民政部	1980年	1986年	[已撤销]	222303	白城地区,扶余市[已撤销]		
-222322	洮安县	吉林省	白城地区	洮安县	民政部	1980年	1986年	[已撤销]	222302	白城地区,洮南市[已撤销]		
-222323	长岭县	吉林省	白城地区	长岭县	民政部	1980年	1991年	[已撤销]	220722	松原市,长岭县		
-222324	前郭尔罗斯蒙古族自治县	吉林省	白城地区	前郭尔罗斯蒙古族自治县	民政部	1980年	1991年	[已撤销]	220721	松原市,前郭尔罗斯蒙古族自治县		
-222325	大安县	吉林省	白城地区	大安县	民政部	1980年	1987年	[已撤销]	222304	白城地区,大安市[已撤销]		
-222326	镇赉县	吉林省	白城地区	镇赉县	民政部	1980年	1992年	[已撤销]	220821	白城市,镇赉县		
-222327	通榆县	吉林省	白城地区	通榆县	民政部	1980年	1992年	[已撤销]	220822	白城市,通榆县		
-222328	乾安县	吉林省	白城地区	乾安县	民政部	1980年	1991年	[已撤销]	220723	松原市,乾安县		
-222400	延边朝鲜族自治州	吉林省	延边朝鲜族自治州	-	民政部	1980年	2024年					
-222401	延吉市	吉林省	延边朝鲜族自治州	延吉市	民政部	1980年	2024年					
-222402	图们市	吉林省	延边朝鲜族自治州	图们市	民政部	1980年	2024年					
-222403	敦化市	吉林省	延边朝鲜族自治州	敦化市	民政部	1985年	2024年					
-222404	珲春市	吉林省	延边朝鲜族自治州	珲春市	民政部	1988年	2024年					
-222405	龙井市	吉林省	延边朝鲜族自治州	龙井市	民政部	1988年	2024年					
-222406	和龙市	吉林省	延边朝鲜族自治州	和龙市	民政部	1993年	2024年					
-222421	龙井县	吉林省	延边朝鲜族自治州	龙井县	民政部	1980年	1987年	[已撤销]	222405	延边朝鲜族自治州,龙井市		延吉县[1982年]
-222422	敦化县	吉林省	延边朝鲜族自治州	敦化县	民政部	1980年	1984年	[已撤销]	222403	延边朝鲜族自治州,敦化市		
-222423	和龙县	吉林省	延边朝鲜族自治州	和龙县	民政部	1980年	1992年	[已撤销]	222406	延边朝鲜族自治州,和龙市		
-222424	汪清县	吉林省	延边朝鲜族自治州	汪清县	民政部	1980年	2024年					
-222425	珲春县	吉林省	延边朝鲜族自治州	珲春县	民政部	1980年	1987年	[已撤销]	222404	延边朝鲜族自治州,珲春市		
-222426	安图县	吉林省	延边朝鲜族自治州	安图县	民政部	1980年	2024年					
-222427	龙井县	吉林省	延边朝鲜族自治州	龙井县	民政部	1983年	1983年	[已撤销]	222421	延边朝鲜族自治州,龙井县[已撤销]		
-222500	德惠地区	吉林省	德惠地区	-	民政部	1982年	1982年	[已撤销]	220100	长春市（地市）		
-222521	榆树县	吉林省	德惠地区	榆树县	民政部	1982年	1982年	[已撤销]	220121	长春市,榆树县[已撤销]		
-222522	农安县	吉林省	德惠地区	农安县	民政部	1982年	1982年	[已撤销]	220122	长春市,农安县		
-222523	九台县	吉林省	德惠地区	九台县	民政部	1982年	1982年	[已撤销]	220123	长春市,九台县[已撤销]		
-222524	德惠县	吉林省	德惠地区	德惠县	民政部	1982年	1982年	[已撤销]	220124	长春市,德惠县[已撤销]		
-222525	双阳县	吉林省	德惠地区	双阳县	民政部	1982年	1982年	[已撤销]	220125	长春市,双阳县[已撤销]		
-222600	永吉地区	吉林省	永吉地区	-	民政部	1982年	1982年	[已撤销]	220200	吉林市（地市）		
-222621	永吉县	吉林省	永吉地区	永吉县	民政部	1982年	1982年	[已撤销]	220221	吉林市,永吉县		
-222622	舒兰县	吉林省	永吉地区	舒兰县	民政部	1982年	1982年	[已撤销]	220222	吉林市,舒兰县[已撤销]		
-222623	磐石县	吉林省	永吉地区	磐石县	民政部	1982年	1982年	[已撤销]	220223	吉林市,磐石县[已撤销]		
-222624	蛟河县	吉林省	永吉地区	蛟河县	民政部	1982年	1982年	[已撤销]	220224	吉林市,蛟河县[已撤销]		
-222625	桦甸县	吉林省	永吉地区	桦甸县	民政部	1982年	1982年	[已撤销]	220225	吉林市,桦甸县[已撤销]		
-229000	省直辖行政单位	吉林省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-229001	公主岭市	吉林省	省直辖县级行政区划	公主岭市	民政部	1988年	1994年	[已撤销]	220381	四平市,公主岭市[已撤销]		
-229002	梅河口市	吉林省	省直辖县级行政区划	梅河口市	民政部	1988年	1994年	[已撤销]	220581	通化市,梅河口市		
-229003	集安市	吉林省	省直辖县级行政区划	集安市	民政部	1988年	1994年	[已撤销]	220582	通化市,集安市		
-229004	桦甸市	吉林省	省直辖县级行政区划	桦甸市	民政部	1988年	1994年	[已撤销]	220282	吉林市,桦甸市		
-229005	九台市	吉林省	省直辖县级行政区划	九台市	民政部	1988年	1994年	[已撤销]	220181	长春市,九台市[已撤销]		
-229006	蛟河市	吉林省	省直辖县级行政区划	蛟河市	民政部	1989年	1994年	[已撤销]	220281	吉林市,蛟河市		
-229007	榆树市	吉林省	省直辖县级行政区划	榆树市	民政部	1990年	1994年	[已撤销]	220182	长春市,榆树市		
-229008	舒兰市	吉林省	省直辖县级行政区划	舒兰市	民政部	1992年	1994年	[已撤销]	220283	吉林市,舒兰市		
-229009	大安市	吉林省	省直辖县级行政区划	大安市	民政部	1993年	1994年	[已撤销]	220882	白城市,大安市		
-229010	洮南市	吉林省	省直辖县级行政区划	洮南市	民政部	1993年	1994年	[已撤销]	220881	白城市,洮南市		
-229011	临江市	吉林省	省直辖县级行政区划	临江市	民政部	1993年	1994年	[已撤销]	220681	白山市,临江市		
-229012	德惠市	吉林省	省直辖县级行政区划	德惠市	民政部	1994年	1994年	[已撤销]	220183	长春市,德惠市		
-230000	黑龙江省	黑龙江省	-	-	民政部	1980年	2024年					
-230100	哈尔滨市	黑龙江省	哈尔滨市	-	民政部	1980年	2024年					
-230101	市辖区	黑龙江省	哈尔滨市	市辖区	国标							增设（GB/T 2260-1984）
-230102	道里区	黑龙江省	哈尔滨市	道里区	民政部	1980年	2024年					
-230103	南岗区	黑龙江省	哈尔滨市	南岗区	民政部	1980年	2024年					
-230104	道外区	黑龙江省	哈尔滨市	道外区	民政部	1980年	2024年					
-230105	太平区	黑龙江省	哈尔滨市	太平区	民政部	1980年	2003年	[已撤销]	230104	哈尔滨市,道外区		
-230106	香坊区	黑龙江省	哈尔滨市	香坊区	民政部	1980年	2003年	[已撤销]	230110	哈尔滨市,香坊区		
-230107	动力区	黑龙江省	哈尔滨市	动力区	民政部	1980年	2005年	[已撤销]	230110	哈尔滨市,香坊区		
-230108	平房区	黑龙江省	哈尔滨市	平房区	民政部	1980年	2024年					
-230109	松北区	黑龙江省	哈尔滨市	松北区	民政部	2004年	2024年					
-230110	香坊区	黑龙江省	哈尔滨市	香坊区	民政部	2004年	2024年					
-230111	呼兰区	黑龙江省	哈尔滨市	呼兰区	民政部	2004年	2024年					
-230112	阿城区	黑龙江省	哈尔滨市	阿城区	民政部	2006年	2024年					
-230113	双城区	黑龙江省	哈尔滨市	双城区	民政部	2014年	2024年					
-230119	阿城市	黑龙江省	哈尔滨市	阿城市	非官方						1976-1986年	
-230121	呼兰县	黑龙江省	哈尔滨市	呼兰县	民政部	1983年	2003年	[已撤销]	230111	哈尔滨市,呼兰区		阿城县[1983年]
-230122	阿城县	黑龙江省	哈尔滨市	阿城县	民政部	1983年	1986年	[已撤销]	239002	省直辖县级行政区划,阿城市[已撤销]		呼兰县[1983年]
-230123	依兰县	黑龙江省	哈尔滨市	依兰县	民政部	1991年	2024年					
-230124	方正县	黑龙江省	哈尔滨市	方正县	民政部	1991年	2024年					
-230125	宾县	黑龙江省	哈尔滨市	宾县	民政部	1991年	2024年					
-230126	巴彦县	黑龙江省	哈尔滨市	巴彦县	民政部	1996年	2024年					
-230127	木兰县	黑龙江省	哈尔滨市	木兰县	民政部	1996年	2024年					
-230128	通河县	黑龙江省	哈尔滨市	通河县	民政部	1996年	2024年					
-230129	延寿县	黑龙江省	哈尔滨市	延寿县	民政部	1996年	2024年					
-230181	阿城市	黑龙江省	哈尔滨市	阿城市	民政部	1995年	2005年	[已撤销]	230112	哈尔滨市,阿城区		
-230182	双城市	黑龙江省	哈尔滨市	双城市	民政部	1996年	2013年	[已撤销]	230113	哈尔滨市,双城区		
-230183	尚志市	黑龙江省	哈尔滨市	尚志市	民政部	1996年	2024年					
-230184	五常市	黑龙江省	哈尔滨市	五常市	民政部	1996年	2024年					
-230200	齐齐哈尔市	黑龙江省	齐齐哈尔市	-	民政部	1980年	2024年					
-230201	市辖区	黑龙江省	齐齐哈尔市	市辖区	国标							增设（GB/T 2260-1984）
-230202	龙沙区	黑龙江省	齐齐哈尔市	龙沙区	民政部	1980年	2024年					
-230203	建华区	黑龙江省	齐齐哈尔市	建华区	民政部	1980年	2024年					
-230204	铁锋区	黑龙江省	齐齐哈尔市	铁锋区	民政部	1980年	2024年					
-230205	昂昂溪区	黑龙江省	齐齐哈尔市	昂昂溪区	民政部	1980年	2024年					
-230206	富拉尔基区	黑龙江省	齐齐哈尔市	富拉尔基区	民政部	1980年	2024年					
-230207	碾子山区	黑龙江省	齐齐哈尔市	碾子山区	民政部	1980年	2024年					华安区[1983年]
-230208	梅里斯达斡尔族区	黑龙江省	齐齐哈尔市	梅里斯达斡尔族区	民政部	1980年	2024年					梅里斯区[1987年]
-230221	龙江县	黑龙江省	齐齐哈尔市	龙江县	民政部	1984年	2024年					
-230222	讷河县	黑龙江省	齐齐哈尔市	讷河县	民政部	1984年	1991年	[已撤销]	239008	省直辖县级行政区划,讷河市[已撤销]		
-230223	依安县	黑龙江省	齐齐哈尔市	依安县	民政部	1984年	2024年					
-230224	泰来县	黑龙江省	齐齐哈尔市	泰来县	民政部	1984年	2024年					
-230225	甘南县	黑龙江省	齐齐哈尔市	甘南县	民政部	1984年	2024年					
-230226	杜尔伯特蒙古族自治县	黑龙江省	齐齐哈尔市	杜尔伯特蒙古族自治县	民政部	1984年	1991年	[已撤销]	230624	大庆市,杜尔伯特蒙古族自治县		
-230227	富裕县	黑龙江省	齐齐哈尔市	富裕县	民政部	1984年	2024年					
-230228	林甸县	黑龙江省	齐齐哈尔市	林甸县	民政部	1984年	1991年	[已撤销]	230623	大庆市,林甸县		
-230229	克山县	黑龙江省	齐齐哈尔市	克山县	民政部	1984年	2024年					
-230230	克东县	黑龙江省	齐齐哈尔市	克东县	民政部	1984年	2024年					
-230231	拜泉县	黑龙江省	齐齐哈尔市	拜泉县	民政部	1984年	2024年					
-230281	讷河市	黑龙江省	齐齐哈尔市	讷河市	民政部	1995年	2024年					
-230300	鸡西市	黑龙江省	鸡西市	-	民政部	1980年	2024年					
-230301	市辖区	黑龙江省	鸡西市	市辖区	国标							增设（GB/T 2260-1984）
-230302	鸡冠区	黑龙江省	鸡西市	鸡冠区	民政部	1980年	2024年					
-230303	恒山区	黑龙江省	鸡西市	恒山区	民政部	1980年	2024年					
-230304	滴道区	黑龙江省	鸡西市	滴道区	民政部	1980年	2024年					
-230305	梨树区	黑龙江省	鸡西市	梨树区	民政部	1980年	2024年					
-230306	城子河区	黑龙江省	鸡西市	城子河区	民政部	1980年	2024年					
-230307	麻山区	黑龙江省	鸡西市	麻山区	民政部	1980年	2024年					
-230321	鸡东县	黑龙江省	鸡西市	鸡东县	民政部	1983年	2024年					
-230322	虎林县	黑龙江省	鸡西市	虎林县	民政部	1993年	1995年	[已撤销]	230381	鸡西市,虎林市		
-230381	虎林市	黑龙江省	鸡西市	虎林市	民政部	1996年	2024年					
-230382	密山市	黑龙江省	鸡西市	密山市	民政部	1995年	2024年					
-230400	鹤岗市	黑龙江省	鹤岗市	-	民政部	1980年	2024年					大庆市[1981年]
-230401	市辖区	黑龙江省	鹤岗市	市辖区	国标							增设（GB/T 2260-1984）
-230402	向阳区	黑龙江省	鹤岗市	向阳区	民政部	1980年	2024年					萨尔图区[1981年]
-230403	工农区	黑龙江省	鹤岗市	工农区	民政部	1980年	2024年					龙凤区[1981年]
-230404	南山区	黑龙江省	鹤岗市	南山区	民政部	1980年	2024年					让胡路区[1981年]
-230405	兴安区	黑龙江省	鹤岗市	兴安区	民政部	1980年	2024年					红岗区[1981年]
-230406	东山区	黑龙江省	鹤岗市	东山区	民政部	1980年	2024年					大同区[1981年]
-230407	兴山区	黑龙江省	鹤岗市	兴山区	民政部	1982年	2024年					
-230421	萝北县	黑龙江省	鹤岗市	萝北县	民政部	1987年	2024年					
-230422	绥滨县	黑龙江省	鹤岗市	绥滨县	民政部	1987年	2024年					
-230500	双鸭山市	黑龙江省	双鸭山市	-	民政部	1980年	2024年					鹤岗市[1981年]
-230501	市辖区	黑龙江省	双鸭山市	市辖区	国标							增设（GB/T 2260-1984）
-230502	尖山区	黑龙江省	双鸭山市	尖山区	民政部	1980年	2024年					向阳区[1981年]
-230503	岭东区	黑龙江省	双鸭山市	岭东区	民政部	1980年	2024年					工农区[1981年]
-230504	岭西区	黑龙江省	双鸭山市	岭西区	民政部	1980年	1986年	[已撤销]	230503	双鸭山市,岭东区		南山区[1981年]
-230505	四方台区	黑龙江省	双鸭山市	四方台区	民政部	1980年	2024年					兴安区[1981年]
-230506	宝山区	黑龙江省	双鸭山市	宝山区	民政部	1980年	2024年					东山区[1981年]
-230507	兴山区	黑龙江省	双鸭山市	兴山区	民政部	1980年	1981年	[已撤销]	230407	鹤岗市,兴山区		
-230521	集贤县	黑龙江省	双鸭山市	集贤县	民政部	1987年	2024年					
-230522	友谊县	黑龙江省	双鸭山市	友谊县	民政部	1991年	2024年					
-230523	宝清县	黑龙江省	双鸭山市	宝清县	民政部	1991年	2024年					
-230524	饶河县	黑龙江省	双鸭山市	饶河县	民政部	1993年	2024年					
-230600	大庆市	黑龙江省	大庆市	-	民政部	1980年	2024年					双鸭山市[1981年]
-230601	市辖区	黑龙江省	大庆市	市辖区	国标							增设（GB/T 2260-1984）
-230602	萨尔图区	黑龙江省	大庆市	萨尔图区	民政部	1980年	2024年					尖山区[1981年]
-230603	龙凤区	黑龙江省	大庆市	龙凤区	民政部	1980年	2024年					岭东区[1981年]
-230604	让胡路区	黑龙江省	大庆市	让胡路区	民政部	1980年	2024年					岭西区[1981年]
-230605	红岗区	黑龙江省	大庆市	红岗区	民政部	1980年	2024年					四方台区[1981年]
-230606	大同区	黑龙江省	大庆市	大同区	民政部	1980年	2024年					宝山区[1981年]
-230621	肇州县	黑龙江省	大庆市	肇州县	民政部	1992年	2024年					
-230622	肇源县	黑龙江省	大庆市	肇源县	民政部	1992年	2024年					
-230623	林甸县	黑龙江省	大庆市	林甸县	民政部	1992年	2024年					
-230624	杜尔伯特蒙古族自治县	黑龙江省	大庆市	杜尔伯特蒙古族自治县	民政部	1992年	2024年					
-230700	伊春市	黑龙江省	伊春市	-	民政部	1980年	2024年					
-230701	市辖区	黑龙江省	伊春市	市辖区	国标							增设（GB/T 2260-1984）
-230702	伊春区	黑龙江省	伊春市	伊春区	民政部	1980年	2018年	[已撤销]	230717	伊春市,伊美区		
-230703	南岔区	黑龙江省	伊春市	南岔区	民政部	1980年	2018年	[已撤销]	230726	伊春市,南岔县		
-230704	友好区	黑龙江省	伊春市	友好区	民政部	1980年	2018年	[已撤销]	230719	伊春市,友好区		
-230705	西林区	黑龙江省	伊春市	西林区	民政部	1980年	2018年	[已撤销]	230751	伊春市,金林区		
-230706	翠峦区	黑龙江省	伊春市	翠峦区	民政部	1980年	2018年	[已撤销]	230718	伊春市,乌翠区		
-230707	新青区	黑龙江省	伊春市	新青区	民政部	1980年	2018年	[已撤销]	230724	伊春市,丰林县		
-230708	美溪区	黑龙江省	伊春市	美溪区	民政部	1980年	2018年	[已撤销]	230717	伊春市,伊美区		
-230709	金山屯区	黑龙江省	伊春市	金山屯区	民政部	1980年	2018年	[已撤销]	230751	伊春市,金林区		大丰区[1983年]
-230710	五营区	黑龙江省	伊春市	五营区	民政部	1980年	2018年	[已撤销]	230724	伊春市,丰林县		
-230711	乌马河区	黑龙江省	伊春市	乌马河区	民政部	1980年	2018年	[已撤销]	230718,230717	伊春市,乌翠区,伊美区		乌敏河区[1983年]
-230712	汤旺河区	黑龙江省	伊春市	汤旺河区	民政部	1980年	2018年	[已撤销]	230723	伊春市,汤旺县		东风区[1983年]
-230713	带岭区	黑龙江省	伊春市	带岭区	民政部	1980年	2018年	[已撤销]	230725	伊春市,大箐山县		
-230714	乌伊岭区	黑龙江省	伊春市	乌伊岭区	民政部	1980年	2018年	[已撤销]	230723	伊春市,汤旺县		
-230715	红星区	黑龙江省	伊春市	红星区	民政部	1980年	2018年	[已撤销]	230724	伊春市,丰林县		
-230716	上甘岭区	黑龙江省	伊春市	上甘岭区	民政部	1980年	2018年	[已撤销]	230719	伊春市,友好区		
-230717	伊美区	黑龙江省	伊春市	伊美区	民政部	2019年	2024年					
-230718	乌翠区	黑龙江省	伊春市	乌翠区	民政部	2019年	2024年					
-230719	友好区	黑龙江省	伊春市	友好区	民政部	2019年	2024年					
-230720	市区	黑龙江省	伊春市	市区	非官方							
-230721	铁力县	黑龙江省	伊春市	铁力县	民政部	1980年	1987年	[已撤销]	239005	省直辖县级行政区划,铁力市[已撤销]		旧称：铁力县(铁骊县)；
-230722	嘉荫县	黑龙江省	伊春市	嘉荫县	民政部	1980年	2024年					
-230723	汤旺县	黑龙江省	伊春市	汤旺县	民政部	2019年	2024年					
-230724	丰林县	黑龙江省	伊春市	丰林县	民政部	2019年	2024年					
-230725	大箐山县	黑龙江省	伊春市	大箐山县	民政部	2019年	2024年					
-230726	南岔县	黑龙江省	伊春市	南岔县	民政部	2019年	2024年					
-230751	金林区	黑龙江省	伊春市	金林区	民政部	2019年	2024年					
-230781	铁力市	黑龙江省	伊春市	铁力市	民政部	1995年	2024年					旧称：铁力市(铁骊市)；
-230800	佳木斯市	黑龙江省	佳木斯市	-	民政部	1983年	2024年					
-230801	市辖区	黑龙江省	佳木斯市	市辖区	国标							增设（GB/T 2260-1984）
-230802	永红区	黑龙江省	佳木斯市	永红区	民政部	1983年	2005年	[已撤销]	230811	佳木斯市,郊区		
-230803	向阳区	黑龙江省	佳木斯市	向阳区	民政部	1983年	2024年					
-230804	前进区	黑龙江省	佳木斯市	前进区	民政部	1983年	2024年					
-230805	东风区	黑龙江省	佳木斯市	东风区	民政部	1983年	2024年					
-230811	郊区	黑龙江省	佳木斯市	郊区	民政部	1983年	2024年					
-230819		黑龙江省	佳木斯市		非官方						1959-1974年	
-230821	富锦县	黑龙江省	佳木斯市	富锦县	民政部	1984年	1987年	[已撤销]	239004	省直辖县级行政区划,富锦市[已撤销]		
-230822	桦南县	黑龙江省	佳木斯市	桦南县	民政部	1984年	2024年					
-230823	依兰县	黑龙江省	佳木斯市	依兰县	民政部	1984年	1990年	[已撤销]	230123	哈尔滨市,依兰县		
-230824	友谊县	黑龙江省	佳木斯市	友谊县	民政部	1984年	1990年	[已撤销]	230522	双鸭山市,友谊县		
-230825	集贤县	黑龙江省	佳木斯市	集贤县	民政部	1984年	1986年	[已撤销]	230521	双鸭山市,集贤县		
-230826	桦川县	黑龙江省	佳木斯市	桦川县	民政部	1984年	2024年					
-230827	宝清县	黑龙江省	佳木斯市	宝清县	民政部	1984年	1990年	[已撤销]	230523	双鸭山市,宝清县		
-230828	汤原县	黑龙江省	佳木斯市	汤原县	民政部	1984年	2024年					
-230829	绥滨县	黑龙江省	佳木斯市	绥滨县	民政部	1984年	1986年	[已撤销]	230422	鹤岗市,绥滨县		
-230830	萝北县	黑龙江省	佳木斯市	萝北县	民政部	1984年	1986年	[已撤销]	230421	鹤岗市,萝北县		
-230831	同江县	黑龙江省	佳木斯市	同江县	民政部	1984年	1986年	[已撤销]	239003	省直辖县级行政区划,同江市[已撤销]		
-230832	饶河县	黑龙江省	佳木斯市	饶河县	民政部	1984年	1992年	[已撤销]	230524	双鸭山市,饶河县		
-230833	抚远县	黑龙江省	佳木斯市	抚远县	民政部	1984年	2015年	[已撤销]	230883	佳木斯市,抚远市		
-230834	友谊县	黑龙江省	佳木斯市	友谊县	非官方						1963年	
-230881	同江市	黑龙江省	佳木斯市	同江市	民政部	1995年	2024年					
-230882	富锦市	黑龙江省	佳木斯市	富锦市	民政部	1995年	2024年					
-230883	抚远市	黑龙江省	佳木斯市	抚远市	民政部	2016年	2024年					
-230900	七台河市	黑龙江省	七台河市	-	民政部	1983年	2024年					
-230901	市辖区	黑龙江省	七台河市	市辖区	国标							
-230902	新兴区	黑龙江省	七台河市	新兴区	民政部	1984年	2024年					
-230903	桃山区	黑龙江省	七台河市	桃山区	民政部	1984年	2024年					
-230904	茄子河区	黑龙江省	七台河市	茄子河区	民政部	1984年	2024年					
-230921	勃利县	黑龙江省	七台河市	勃利县	民政部	1983年	2024年					
-231000	牡丹江市	黑龙江省	牡丹江市	-	民政部	1983年	2024年					
-231001	市辖区	黑龙江省	牡丹江市	市辖区	国标							增设（GB/T 2260-1984）
-231002	东安区	黑龙江省	牡丹江市	东安区	民政部	1983年	2024年					
-231003	阳明区	黑龙江省	牡丹江市	阳明区	民政部	1984年	2024年					
-231004	爱民区	黑龙江省	牡丹江市	爱民区	民政部	1984年	2024年					
-231005	西安区	黑龙江省	牡丹江市	西安区	民政部	1983年	2024年					
-231006	爱民区	黑龙江省	牡丹江市	爱民区	民政部	1983年	1983年	[已撤销]	231004	牡丹江市,爱民区		
-231007	阳明区	黑龙江省	牡丹江市	阳明区	民政部	1983年	1983年	[已撤销]	231003	牡丹江市,阳明区		
-231011	郊区	黑龙江省	牡丹江市	郊区	民政部	1983年	1996年	[已撤销]	231002,231005,231003,231004	牡丹江市,东安区,西安区,阳明区,爱民区		
-231019	镜泊湖市	黑龙江省	牡丹江市	镜泊湖市	非官方							
-231020	绥芬河市	黑龙江省	牡丹江市	绥芬河市	民政部	1984年	1985年	[已撤销]	239001	省直辖县级行政区划,绥芬河市[已撤销]		
-231021	宁安县	黑龙江省	牡丹江市	宁安县	民政部	1983年	1992年	[已撤销]	239011	省直辖县级行政区划,宁安市[已撤销]		
-231022	海林县	黑龙江省	牡丹江市	海林县	民政部	1983年	1991年	[已撤销]	239007	省直辖县级行政区划,海林市[已撤销]		
-231023	穆棱县	黑龙江省	牡丹江市	穆棱县	民政部	1983年	1994年	[已撤销]	231085	牡丹江市,穆棱市		
-231024	东宁县	黑龙江省	牡丹江市	东宁县	民政部	1983年	2014年	[已撤销]	231086	牡丹江市,东宁市		
-231025	林口县	黑龙江省	牡丹江市	林口县	民政部	1983年	2024年					
-231026	密山县	黑龙江省	牡丹江市	密山县	民政部	1983年	1987年	[已撤销]	239006	省直辖县级行政区划,密山市[已撤销]		
-231027	虎林县	黑龙江省	牡丹江市	虎林县	民政部	1983年	1992年	[已撤销]	230322	鸡西市,虎林县[已撤销]		
-231081	绥芬河市	黑龙江省	牡丹江市	绥芬河市	民政部	1995年	2024年					
-231082	密山市	黑龙江省	牡丹江市	密山市	国标							修订（GB/T 2260-1991）
-231083	海林市	黑龙江省	牡丹江市	海林市	民政部	1995年	2024年					
-231084	宁安市	黑龙江省	牡丹江市	宁安市	民政部	1995年	2024年					
-231085	穆棱市	黑龙江省	牡丹江市	穆棱市	民政部	1995年	2024年					
-231086	东宁市	黑龙江省	牡丹江市	东宁市	民政部	2015年	2024年					
-231100	黑河市	黑龙江省	黑河市	-	民政部	1993年	2024年					
-231101	绥芬河市	黑龙江省	黑河市	绥芬河市	民政部	1983年	1983年	[已撤销]	231020	牡丹江市,绥芬河市[已撤销]		
-231102	爱辉区	黑龙江省	黑河市	爱辉区	民政部	1993年	2024年					旧称：爱辉区(瑷珲区)；
-231104		黑龙江省	黑河市		非官方						1982年	
-231121	嫩江县	黑龙江省	黑河市	嫩江县	民政部	1993年	2018年	[已撤销]	231183	黑河市,嫩江市		
-231122	德都县	黑龙江省	黑河市	德都县	民政部	1993年	1995年	[已撤销]	231182	黑河市,五大连池市		
-231123	逊克县	黑龙江省	黑河市	逊克县	民政部	1993年	2024年					
-231124	孙吴县	黑龙江省	黑河市	孙吴县	民政部	1993年	2024年					
-231181	北安市	黑龙江省	黑河市	北安市	民政部	1995年	2024年					
-231182	五大连池市	黑龙江省	黑河市	五大连池市	民政部	1995年	2024年					
-231183	嫩江市	黑龙江省	黑河市	嫩江市	民政部	2019年	2024年					
-231200	绥化市	黑龙江省	绥化市	-	民政部	1999年	2024年					
-231201	市辖区	黑龙江省	绥化市	市辖区	国标							
-231202	北林区	黑龙江省	绥化市	北林区	民政部	1999年	2024年					
-231221	望奎县	黑龙江省	绥化市	望奎县	民政部	1999年	2024年					
-231222	兰西县	黑龙江省	绥化市	兰西县	民政部	1999年	2024年					
-231223	青冈县	黑龙江省	绥化市	青冈县	民政部	1999年	2024年					
-231224	庆安县	黑龙江省	绥化市	庆安县	民政部	1999年	2024年					
-231225	明水县	黑龙江省	绥化市	明水县	民政部	1999年	2024年					
-231226	绥棱县	黑龙江省	绥化市	绥棱县	民政部	1999年	2024年					
-231281	安达市	黑龙江省	绥化市	安达市	民政部	1999年	2024年					
-231282	肇东市	黑龙江省	绥化市	肇东市	民政部	1999年	2024年					
-231283	海伦市	黑龙江省	绥化市	海伦市	民政部	1999年	2024年					
-232100	松花江地区	黑龙江省	松花江地区	-	民政部	1980年	1995年	[已撤销]	230100	哈尔滨市（地市）		绥化地区[1981年]
-232101	双城市	黑龙江省	松花江地区	双城市	民政部	1988年	1995年	[已撤销]	230182	哈尔滨市,双城市[已撤销]		
-232102	尚志市	黑龙江省	松花江地区	尚志市	民政部	1988年	1995年	[已撤销]	230183	哈尔滨市,尚志市		
-232103	五常市	黑龙江省	松花江地区	五常市	民政部	1993年	1995年	[已撤销]	230184	哈尔滨市,五常市		
-232121	阿城县	黑龙江省	松花江地区	阿城县	民政部	1980年	1982年	[已撤销]	230122	哈尔滨市,阿城县[已撤销]		海伦县[1981年]
-232122	宾县	黑龙江省	松花江地区	宾县	民政部	1980年	1990年	[已撤销]	230125	哈尔滨市,宾县		肇东县[1981年]
-232123	呼兰县	黑龙江省	松花江地区	呼兰县	民政部	1980年	1982年	[已撤销]	230121	哈尔滨市,呼兰县[已撤销]		绥化县[1981年]
-232124	双城县	黑龙江省	松花江地区	双城县	民政部	1980年	1987年	[已撤销]	232101	松花江地区,双城市[已撤销]		安达县[1981年]
-232125	五常县	黑龙江省	松花江地区	五常县	民政部	1980年	1992年	[已撤销]	232103	松花江地区,五常市[已撤销]		望奎县[1981年]
-232126	巴彦县	黑龙江省	松花江地区	巴彦县	民政部	1980年	1995年	[已撤销]	230126	哈尔滨市,巴彦县		兰西县[1981年]
-232127	木兰县	黑龙江省	松花江地区	木兰县	民政部	1980年	1995年	[已撤销]	230127	哈尔滨市,木兰县		青冈县[1981年]
-232128	通河县	黑龙江省	松花江地区	通河县	民政部	1980年	1995年	[已撤销]	230128	哈尔滨市,通河县		肇源县[1981年]
-232129	尚志县	黑龙江省	松花江地区	尚志县	民政部	1980年	1987年	[已撤销]	232102	松花江地区,尚志市[已撤销]		肇州县[1981年]
-232130	方正县	黑龙江省	松花江地区	方正县	民政部	1980年	1990年	[已撤销]	230124	哈尔滨市,方正县		庆安县[1981年]
-232131	延寿县	黑龙江省	松花江地区	延寿县	民政部	1980年	1995年	[已撤销]	230129	哈尔滨市,延寿县		明水县[1981年]
-232132	绥棱县	黑龙江省	松花江地区	绥棱县	民政部	1980年	1981年	[已撤销]	232332	绥化地区,绥棱县[已撤销]		
-232200	嫩江地区	黑龙江省	嫩江地区	-	民政部	1980年	1983年	[已撤销]	230200	齐齐哈尔市（地市）		松花江地区[1981年]
-232221	龙江县	黑龙江省	嫩江地区	龙江县	民政部	1980年	1983年	[已撤销]	230221	齐齐哈尔市,龙江县		五常县[1981年]
-232222	讷河县	黑龙江省	嫩江地区	讷河县	民政部	1980年	1983年	[已撤销]	230222	齐齐哈尔市,讷河县[已撤销]		双城县[1981年]
-232223	依安县	黑龙江省	嫩江地区	依安县	民政部	1980年	1983年	[已撤销]	230223	齐齐哈尔市,依安县		巴彦县[1981年]
-232224	泰来县	黑龙江省	嫩江地区	泰来县	民政部	1980年	1983年	[已撤销]	230224	齐齐哈尔市,泰来县		呼兰县[1981年]
-232225	甘南县	黑龙江省	嫩江地区	甘南县	民政部	1980年	1983年	[已撤销]	230225	齐齐哈尔市,甘南县		宾县[1981年]
-232226	杜尔伯特蒙古族自治县	黑龙江省	嫩江地区	杜尔伯特蒙古族自治县	民政部	1980年	1983年	[已撤销]	230226	齐齐哈尔市,杜尔伯特蒙古族自治县[已撤销]		阿城县[1981年]
-232227	富裕县	黑龙江省	嫩江地区	富裕县	民政部	1980年	1983年	[已撤销]	230227	齐齐哈尔市,富裕县		尚志县[1981年]
-232228	林甸县	黑龙江省	嫩江地区	林甸县	民政部	1980年	1983年	[已撤销]	230228	齐齐哈尔市,林甸县[已撤销]		木兰县[1981年]
-232229	克山县	黑龙江省	嫩江地区	克山县	民政部	1980年	1983年	[已撤销]	230229	齐齐哈尔市,克山县		延寿县[1981年]
-232230	克东县	黑龙江省	嫩江地区	克东县	民政部	1980年	1983年	[已撤销]	230230	齐齐哈尔市,克东县		通河县[1981年]
-232231	拜泉县	黑龙江省	嫩江地区	拜泉县	民政部	1980年	1983年	[已撤销]	230231	齐齐哈尔市,拜泉县		方正县[1981年]
-232300	绥化地区	黑龙江省	绥化地区	-	民政部	1980年	1998年	[已撤销]	231200	绥化市（地市）		嫩江地区[1981年]
-232301	绥化市	黑龙江省	绥化地区	绥化市	民政部	1982年	1998年	[已撤销]	231200	绥化市（地市）		
-232302	安达市	黑龙江省	绥化地区	安达市	民政部	1984年	1998年	[已撤销]	231281	绥化市,安达市		
-232303	肇东市	黑龙江省	绥化地区	肇东市	民政部	1986年	1998年	[已撤销]	231282	绥化市,肇东市		
-232304	海伦市	黑龙江省	绥化地区	海伦市	民政部	1989年	1998年	[已撤销]	231283	绥化市,海伦市		
-232321	海伦县	黑龙江省	绥化地区	海伦县	民政部	1980年	1988年	[已撤销]	232304	绥化地区,海伦市[已撤销]		讷河县[1981年]
-232322	肇东县	黑龙江省	绥化地区	肇东县	民政部	1980年	1985年	[已撤销]	232303	绥化地区,肇东市[已撤销]		拜泉县[1981年]
-232323	龙江县	黑龙江省	绥化地区	龙江县	民政部	1980年	1981年	[已撤销]	230221	齐齐哈尔市,龙江县		
-232324	望奎县	黑龙江省	绥化地区	望奎县	民政部	1980年	1998年	[已撤销]	231221	绥化市,望奎县		依安县[1981年]
-232325	兰西县	黑龙江省	绥化地区	兰西县	民政部	1980年	1998年	[已撤销]	231222	绥化市,兰西县		克山县[1981年]
-232326	青冈县	黑龙江省	绥化地区	青冈县	民政部	1980年	1998年	[已撤销]	231223	绥化市,青冈县		甘南县[1981年]
-232327	安达县	黑龙江省	绥化地区	安达县	民政部	1980年	1983年	[已撤销]	232302	绥化地区,安达市[已撤销]		泰来县[1981年]
-232328	肇源县	黑龙江省	绥化地区	肇源县	民政部	1980年	1991年	[已撤销]	230622	大庆市,肇源县		克东县[1981年]
-232329	肇州县	黑龙江省	绥化地区	肇州县	民政部	1980年	1991年	[已撤销]	230621	大庆市,肇州县		富裕县[1981年]
-232330	庆安县	黑龙江省	绥化地区	庆安县	民政部	1980年	1998年	[已撤销]	231224	绥化市,庆安县		林甸县[1981年]
-232331	明水县	黑龙江省	绥化地区	明水县	民政部	1980年	1998年	[已撤销]	231225	绥化市,明水县		杜尔伯特蒙古族自治县[1981年]
-232332	绥棱县	黑龙江省	绥化地区	绥棱县	民政部	1982年	1998年	[已撤销]	231226	绥化市,绥棱县		
-232400	合江地区	黑龙江省	合江地区	-	民政部	1980年	1983年	[已撤销]	230800	佳木斯市（地市）		
-232401	佳木斯市	黑龙江省	合江地区	佳木斯市	民政部	1980年	1982年	[已撤销]	230800	佳木斯市（地市）		
-232402	七台河市	黑龙江省	合江地区	七台河市	民政部	1980年	1982年	[已撤销]	230900	七台河市（地市）		
-232403	永红区	黑龙江省	合江地区	永红区	民政部	1980年	1982年	[已撤销]	230802	佳木斯市,永红区[已撤销]		
-232404	向阳区	黑龙江省	合江地区	向阳区	民政部	1980年	1982年	[已撤销]	230803	佳木斯市,向阳区		
-232405	前进区	黑龙江省	合江地区	前进区	民政部	1980年	1982年	[已撤销]	230804	佳木斯市,前进区		
-232406	东风区	黑龙江省	合江地区	东风区	民政部	1980年	1982年	[已撤销]	230805	佳木斯市,东风区		
-232411	郊区	黑龙江省	合江地区	郊区	民政部	1980年	1982年	[已撤销]	230811	佳木斯市,郊区		
-232421	富锦县	黑龙江省	合江地区	富锦县	民政部	1980年	1983年	[已撤销]	230821	佳木斯市,富锦县[已撤销]		桦南县[1981年]
-232422	桦南县	黑龙江省	合江地区	桦南县	民政部	1980年	1983年	[已撤销]	230822	佳木斯市,桦南县		集贤县[1981年]
-232423	依兰县	黑龙江省	合江地区	依兰县	民政部	1980年	1983年	[已撤销]	230823	佳木斯市,依兰县[已撤销]		宝清县[1981年]
-232424	勃利县	黑龙江省	合江地区	勃利县	民政部	1980年	1982年	[已撤销]	230921	七台河市,勃利县		富锦县[1981年]
-232425	集贤县	黑龙江省	合江地区	集贤县	民政部	1980年	1983年	[已撤销]	230825	佳木斯市,集贤县[已撤销]		依兰县[1981年]
-232426	桦川县	黑龙江省	合江地区	桦川县	民政部	1980年	1983年	[已撤销]	230826	佳木斯市,桦川县		勃利县[1981年]
-232427	宝清县	黑龙江省	合江地区	宝清县	民政部	1980年	1983年	[已撤销]	230827	佳木斯市,宝清县[已撤销]		汤原县[1981年]
-232428	汤原县	黑龙江省	合江地区	汤原县	民政部	1980年	1983年	[已撤销]	230828	佳木斯市,汤原县		桦川县[1981年]
-232429	绥滨县	黑龙江省	合江地区	绥滨县	民政部	1980年	1983年	[已撤销]	230829	佳木斯市,绥滨县[已撤销]		萝北县[1981年]
-232430	萝北县	黑龙江省	合江地区	萝北县	民政部	1980年	1983年	[已撤销]	230830	佳木斯市,萝北县[已撤销]		绥滨县[1981年]
-232431	同江县	黑龙江省	合江地区	同江县	民政部	1980年	1983年	[已撤销]	230831	佳木斯市,同江县[已撤销]		饶河县[1981年]
-232432	饶河县	黑龙江省	合江地区	饶河县	民政部	1980年	1983年	[已撤销]	230832	佳木斯市,饶河县[已撤销]		同江县[1981年]
-232433	抚远县	黑龙江省	合江地区	抚远县	民政部	1980年	1983年	[已撤销]	230833	佳木斯市,抚远县[已撤销]		
-232500	牡丹江地区	黑龙江省	牡丹江地区	-	民政部	1980年	1982年	[已撤销]	231000	牡丹江市（地市）		
-232501	牡丹江市	黑龙江省	牡丹江地区	牡丹江市	民政部	1980年	1982年	[已撤销]	231000	牡丹江市（地市）		
-232502	绥芬河市	黑龙江省	牡丹江地区	绥芬河市	民政部	1980年	1982年	[已撤销]	231101	黑河市,绥芬河市[已撤销]		东凤区[1981年]
-232503	东凤区	黑龙江省	牡丹江地区	东凤区	民政部	1980年	1982年	[已撤销]	231002	牡丹江市,东安区		先锋区[1981年]
-232504	先锋区	黑龙江省	牡丹江地区	先锋区	民政部	1980年	1982年	[已撤销]	231005	牡丹江市,西安区		爱民区[1981年]
-232505	爱民区	黑龙江省	牡丹江地区	爱民区	民政部	1980年	1982年	[已撤销]	231006	牡丹江市,爱民区[已撤销]		阳明区[1981年]
-232506	阳明区	黑龙江省	牡丹江地区	阳明区	民政部	1982年	1982年	[已撤销]	231007	牡丹江市,阳明区[已撤销]		
-232511	郊区	黑龙江省	牡丹江地区	郊区	民政部	1980年	1982年	[已撤销]	231011	牡丹江市,郊区[已撤销]		
-232521	宁安县	黑龙江省	牡丹江地区	宁安县	民政部	1980年	1982年	[已撤销]	231021	牡丹江市,宁安县[已撤销]		海林县[1981年]
-232522	海林县	黑龙江省	牡丹江地区	海林县	民政部	1980年	1982年	[已撤销]	231022	牡丹江市,海林县[已撤销]		宁安县[1981年]
-232523	穆棱县	黑龙江省	牡丹江地区	穆棱县	民政部	1980年	1982年	[已撤销]	231023	牡丹江市,穆棱县[已撤销]		林口县[1981年]
-232524	东宁县	黑龙江省	牡丹江地区	东宁县	民政部	1980年	1982年	[已撤销]	231024	牡丹江市,东宁县[已撤销]		密山县[1981年]
-232525	林口县	黑龙江省	牡丹江地区	林口县	民政部	1980年	1982年	[已撤销]	231025	牡丹江市,林口县		穆棱县[1981年]
-232526	鸡东县	黑龙江省	牡丹江地区	鸡东县	民政部	1980年	1982年	[已撤销]	230321	鸡西市,鸡东县		虎林县[1981年]
-232527	密山县	黑龙江省	牡丹江地区	密山县	民政部	1980年	1982年	[已撤销]	231026	牡丹江市,密山县[已撤销]		鸡东县[1981年]
-232528	虎林县	黑龙江省	牡丹江地区	虎林县	民政部	1980年	1982年	[已撤销]	231027	牡丹江市,虎林县[已撤销]		东宁县[1981年]
-232581	绥芬河市	黑龙江省	牡丹江地区	绥芬河市	民政部	1980年	1981年	[已撤销]	231101	黑河市,绥芬河市[已撤销]		
-232600	黑河地区	黑龙江省	黑河地区	-	民政部	1980年	1992年	[已撤销]	231100	黑河市（地市）		
-232601	黑河市	黑龙江省	黑河地区	黑河市	民政部	1980年	1992年	[已撤销]	231100	黑河市（地市）		
-232602	北安市	黑龙江省	黑河地区	北安市	民政部	1982年	1992年	[已撤销]	239009	省直辖县级行政区划,北安市[已撤销]		
-232603	五大连池市	黑龙江省	黑河地区	五大连池市	民政部	1983年	1992年	[已撤销]	239010	省直辖县级行政区划,五大连池市[已撤销]		
-232621	嫩江县	黑龙江省	黑河地区	嫩江县	民政部	1980年	1981年	[已撤销]	232622	黑河地区,嫩江县[已撤销]		
-232622	嫩江县	黑龙江省	黑河地区	嫩江县	民政部	1980年	1992年	[已撤销]	231121	黑河市,嫩江县[已撤销]		北安县[1981年]
-232623	德都县	黑龙江省	黑河地区	德都县	民政部	1980年	1992年	[已撤销]	231122	黑河市,德都县[已撤销]		
-232624	爱辉县	黑龙江省	黑河地区	爱辉县	民政部	1980年	1982年	[已撤销]	232601	黑河地区,黑河市[已撤销]		旧称：爱辉县(瑷珲县)；
-232625	逊克县	黑龙江省	黑河地区	逊克县	民政部	1980年	1992年	[已撤销]	231123	黑河市,逊克县		
-232626	孙吴县	黑龙江省	黑河地区	孙吴县	民政部	1980年	1992年	[已撤销]	231124	黑河市,孙吴县		
-232627	通北县	黑龙江省	黑河地区	通北县	民政部	1982年	1982年	[已撤销]	232602	黑河地区,北安市[已撤销]		
-232700	大兴安岭地区	黑龙江省	大兴安岭地区	-	民政部	1980年	2024年					
-232701	漠河市	黑龙江省	大兴安岭地区	漠河市	民政部	2018年	2024年					
-232702	松岭区	黑龙江省	大兴安岭地区	松岭区	非官方							文章评论：2010年有官方记录，实为“黑区”
-232703	新林区	黑龙江省	大兴安岭地区	新林区	非官方							文章评论：2010年有官方记录，实为“黑区”
-232704	呼中区	黑龙江省	大兴安岭地区	呼中区	非官方							文章评论：2010年有官方记录，实为“黑区”
-232721	呼玛县	黑龙江省	大兴安岭地区	呼玛县	民政部	1980年	2024年					
-232722	塔河县	黑龙江省	大兴安岭地区	塔河县	民政部	1981年	2024年					
-232723	漠河县	黑龙江省	大兴安岭地区	漠河县	民政部	1981年	2017年	[已撤销]	232701	大兴安岭地区,漠河市		
-232724	大兴安岭地区	黑龙江省	大兴安岭地区	漠河县	非官方							非国标，身份证曾用
-239000	省直辖县	黑龙江省	省直辖县级行政区划	-	非官方							
-239001	绥芬河市	黑龙江省	省直辖县级行政区划	绥芬河市	民政部	1986年	1994年	[已撤销]	231081	牡丹江市,绥芬河市		
-239002	阿城市	黑龙江省	省直辖县级行政区划	阿城市	民政部	1986年	1994年	[已撤销]	230181	哈尔滨市,阿城市[已撤销]		镜泊湖市[1986年]
-239003	同江市	黑龙江省	省直辖县级行政区划	同江市	民政部	1987年	1994年	[已撤销]	230881	佳木斯市,同江市		
-239004	富锦市	黑龙江省	省直辖县级行政区划	富锦市	民政部	1988年	1994年	[已撤销]	230882	佳木斯市,富锦市		
-239005	铁力市	黑龙江省	省直辖县级行政区划	铁力市	民政部	1988年	1994年	[已撤销]	230781	伊春市,铁力市		旧称：铁力市(铁骊市)；
-239006	密山市	黑龙江省	省直辖县级行政区划	密山市	民政部	1988年	1994年	[已撤销]	230382	鸡西市,密山市		
-239007	海林市	黑龙江省	省直辖县级行政区划	海林市	民政部	1992年	1994年	[已撤销]	231083	牡丹江市,海林市		
-239008	讷河市	黑龙江省	省直辖县级行政区划	讷河市	民政部	1992年	1994年	[已撤销]	230281	齐齐哈尔市,讷河市		
-239009	北安市	黑龙江省	省直辖县级行政区划	北安市	民政部	1993年	1994年	[已撤销]	231181	黑河市,北安市		
-239010	五大连池市	黑龙江省	省直辖县级行政区划	五大连池市	民政部	1993年	1994年	[已撤销]	231182	黑河市,五大连池市		
-239011	宁安市	黑龙江省	省直辖县级行政区划	宁安市	民政部	1993年	1994年	[已撤销]	231084	牡丹江市,宁安市		
-310000	上海市	上海市	-	-	民政部	1980年	2024年					
-310100	市辖区	上海市	市辖区	-	国标							
-310101	黄浦区	上海市	市辖区	黄浦区	民政部	1980年	2024年					
-310102	南市区	上海市	市辖区	南市区	民政部	1980年	1999年	[已撤销]	310101	市辖区,黄浦区		
-310103	卢湾区	上海市	市辖区	卢湾区	民政部	1980年	2010年	[已撤销]	310101	市辖区,黄浦区		
-310104	徐汇区	上海市	市辖区	徐汇区	民政部	1980年	2024年					
-310105	长宁区	上海市	市辖区	长宁区	民政部	1980年	2024年					
-310106	静安区	上海市	市辖区	静安区	民政部	1980年	2024年					
-310107	普陀区	上海市	市辖区	普陀区	民政部	1980年	2024年					
-310108	闸北区	上海市	市辖区	闸北区	民政部	1980年	2014年	[已撤销]	310106	市辖区,静安区		
-310109	虹口区	上海市	市辖区	虹口区	民政部	1980年	2024年					
-310110	杨浦区	上海市	市辖区	杨浦区	民政部	1980年	2024年					
-310111	吴淞区	上海市	市辖区	吴淞区	民政部	1980年	1987年	[已撤销]	310113	市辖区,宝山区		
-310112	闵行区	上海市	市辖区	闵行区	民政部	1981年	2024年					
-310113	宝山区	上海市	市辖区	宝山区	民政部	1988年	2024年					
-310114	嘉定区	上海市	市辖区	嘉定区	民政部	1992年	2024年					
-310115	浦东新区	上海市	市辖区	浦东新区	民政部	1992年	2024年					
-310116	金山区	上海市	市辖区	金山区	民政部	1997年	2024年					
-310117	松江区	上海市	市辖区	松江区	民政部	1998年	2024年					
-310118	青浦区	上海市	市辖区	青浦区	民政部	1999年	2024年					
-310119	南汇区	上海市	市辖区	南汇区	民政部	2001年	2008年	[已撤销]	310115	市辖区,浦东新区		
-310120	奉贤区	上海市	市辖区	奉贤区	民政部	2001年	2024年					
-310151	崇明区	上海市	市辖区	崇明区	民政部	2016年	2024年					
-310200	县	上海市	县	-	国标							
-310201	上海县	上海市	县	上海县	民政部	1980年	1981年	[已撤销]	310221	县,上海县[已撤销]		
-310202	嘉定县	上海市	县	嘉定县	民政部	1980年	1981年	[已撤销]	310222	县,嘉定县[已撤销]		
-310203	宝山县	上海市	县	宝山县	民政部	1980年	1981年	[已撤销]	310223	县,宝山县[已撤销]		
-310204	川沙县	上海市	县	川沙县	民政部	1980年	1981年	[已撤销]	310224	县,川沙县[已撤销]		
-310205	南汇县	上海市	县	南汇县	民政部	1980年	1981年	[已撤销]	310225	县,南汇县[已撤销]		
-310206	奉贤县	上海市	县	奉贤县	民政部	1980年	1981年	[已撤销]	310226	县,奉贤县[已撤销]		
-310207	松江县	上海市	县	松江县	民政部	1980年	1981年	[已撤销]	310227	县,松江县[已撤销]		
-310208	金山县	上海市	县	金山县	民政部	1980年	1981年	[已撤销]	310228	县,金山县[已撤销]		
-310209	青浦县	上海市	县	青浦县	民政部	1980年	1981年	[已撤销]	310229	县,青浦县[已撤销]		
-310210	崇明县	上海市	县	崇明县	民政部	1980年	1981年	[已撤销]	310230	县,崇明县[已撤销]		
-310221	上海县	上海市	县	上海县	民政部	1982年	1991年	[已撤销]	310112,310115	市辖区,闵行区,浦东新区		
-310222	嘉定县	上海市	县	嘉定县	民政部	1982年	1991年	[已撤销]	310114	市辖区,嘉定区		
-310223	宝山县	上海市	县	宝山县	民政部	1982年	1987年	[已撤销]	310113	市辖区,宝山区		
-310224	川沙县	上海市	县	川沙县	民政部	1982年	1991年	[已撤销]	310115	市辖区,浦东新区		
-310225	南汇县	上海市	县	南汇县	民政部	1982年	2000年	[已撤销]	310119	市辖区,南汇区[已撤销]		
-310226	奉贤县	上海市	县	奉贤县	民政部	1982年	2000年	[已撤销]	310120	市辖区,奉贤区		
-310227	松江县	上海市	县	松江县	民政部	1982年	1997年	[已撤销]	310117	市辖区,松江区		
-310228	金山县	上海市	县	金山县	民政部	1982年	1996年	[已撤销]	310116	市辖区,金山区		
-310229	青浦县	上海市	县	青浦县	民政部	1982年	1998年	[已撤销]	310118	市辖区,青浦区		
-310230	崇明县	上海市	县	崇明县	民政部	1982年	2015年	[已撤销]	310151	市辖区,崇明区		
-320000	江苏省	江苏省	-	-	民政部	1980年	2024年					
-320100	南京市	江苏省	南京市	-	民政部	1980年	2024年					
-320101	市辖区	江苏省	南京市	市辖区	国标							增设（GB/T 2260-1984）
-320102	玄武区	江苏省	南京市	玄武区	民政部	1980年	2024年					
-320103	白下区	江苏省	南京市	白下区	民政部	1980年	2012年	[已撤销]	320104	南京市,秦淮区		
-320104	秦淮区	江苏省	南京市	秦淮区	民政部	1980年	2024年					
-320105	建邺区	江苏省	南京市	建邺区	民政部	1980年	2024年					
-320106	鼓楼区	江苏省	南京市	鼓楼区	民政部	1980年	2024年					
-320107	下关区	江苏省	南京市	下关区	民政部	1980年	2012年	[已撤销]	320106	南京市,鼓楼区		
-320111	浦口区	江苏省	南京市	浦口区	民政部	1980年	2024年					
-320112	大厂区	江苏省	南京市	大厂区	民政部	1980年	2001年	[已撤销]	320116	南京市,六合区		
-320113	栖霞区	江苏省	南京市	栖霞区	民政部	1980年	2024年					
-320114	雨花台区	江苏省	南京市	雨花台区	民政部	1980年	2024年					雨花区[1983年]
-320115	江宁区	江苏省	南京市	江宁区	民政部	2000年	2024年					
-320116	六合区	江苏省	南京市	六合区	民政部	2002年	2024年					
-320117	溧水区	江苏省	南京市	溧水区	民政部	2013年	2024年					
-320118	高淳区	江苏省	南京市	高淳区	民政部	2013年	2024年					
-320120	南京市区	江苏省	南京市	南京市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-320121	江宁县	江苏省	南京市	江宁县	民政部	1980年	1999年	[已撤销]	320115	南京市,江宁区		
-320122	江浦县	江苏省	南京市	江浦县	民政部	1980年	2001年	[已撤销]	320111	南京市,浦口区		
-320123	六合县	江苏省	南京市	六合县	民政部	1980年	2001年	[已撤销]	320116	南京市,六合区		
-320124	溧水县	江苏省	南京市	溧水县	民政部	1983年	2012年	[已撤销]	320117	南京市,溧水区		
-320125	高淳县	江苏省	南京市	高淳县	民政部	1983年	2012年	[已撤销]	320118	南京市,高淳区		
-320200	无锡市	江苏省	无锡市	-	民政部	1980年	2024年					
-320201	市辖区	江苏省	无锡市	市辖区	国标							增设（GB/T 2260-1984）
-320202	崇安区	江苏省	无锡市	崇安区	民政部	1980年	2014年	[已撤销]	320213	无锡市,梁溪区		
-320203	南长区	江苏省	无锡市	南长区	民政部	1980年	2014年	[已撤销]	320213	无锡市,梁溪区		
-320204	北塘区	江苏省	无锡市	北塘区	民政部	1980年	2014年	[已撤销]	320213	无锡市,梁溪区		
-320205	锡山区	江苏省	无锡市	锡山区	民政部	1987年	2024年					马山区[1999年]
-320206	惠山区	江苏省	无锡市	惠山区	民政部	2000年	2024年					
-320211	滨湖区	江苏省	无锡市	滨湖区	民政部	1983年	2024年					郊区[1999年]
-320212	马山区	江苏省	无锡市	马山区	非官方							
-320213	梁溪区	江苏省	无锡市	梁溪区	民政部	2015年	2024年					
-320214	新吴区	江苏省	无锡市	新吴区	民政部	2015年	2024年					
-320219	江阴市	江苏省	无锡市	江阴市	非官方						1973年	
-320221	江阴县	江苏省	无锡市	江阴县	民政部	1983年	1986年	[已撤销]	329005	省直辖县级行政区划,江阴市[已撤销]		
-320222	无锡县	江苏省	无锡市	无锡县	民政部	1983年	1994年	[已撤销]	320283	无锡市,锡山市[已撤销]		
-320223	宜兴县	江苏省	无锡市	宜兴县	民政部	1983年	1987年	[已撤销]	329011	省直辖县级行政区划,宜兴市[已撤销]		
-320281	江阴市	江苏省	无锡市	江阴市	民政部	1995年	2024年					
-320282	宜兴市	江苏省	无锡市	宜兴市	民政部	1995年	2024年					
-320283	锡山市	江苏省	无锡市	锡山市	民政部	1995年	1999年	[已撤销]	320205,320206	无锡市,锡山区,惠山区		
-320300	徐州市	江苏省	徐州市	-	民政部	1980年	2024年					
-320301	市辖区	江苏省	徐州市	市辖区	国标							增设（GB/T 2260-1984）
-320302	鼓楼区	江苏省	徐州市	鼓楼区	民政部	1980年	2024年					
-320303	云龙区	江苏省	徐州市	云龙区	民政部	1980年	2024年					
-320304	九里区	江苏省	徐州市	九里区	民政部	1980年	2009年	[已撤销]	320302,320311,320312	徐州市,鼓楼区,泉山区,铜山区		矿区[1994年]
-320305	贾汪区	江苏省	徐州市	贾汪区	民政部	1980年	2024年					
-320311	泉山区	江苏省	徐州市	泉山区	民政部	1980年	2024年					郊区[1992年]
-320312	铜山区	江苏省	徐州市	铜山区	民政部	2010年	2024年					
-320321	丰县	江苏省	徐州市	丰县	民政部	1983年	2024年					
-320322	沛县	江苏省	徐州市	沛县	民政部	1983年	2024年					
-320323	铜山县	江苏省	徐州市	铜山县	民政部	1983年	2009年	[已撤销]	320312	徐州市,铜山区		
-320324	睢宁县	江苏省	徐州市	睢宁县	民政部	1983年	2024年					
-320325	邳县	江苏省	徐州市	邳县	民政部	1983年	1991年	[已撤销]	329019	省直辖县级行政区划,邳州市[已撤销]		
-320326	新沂县	江苏省	徐州市	新沂县	民政部	1983年	1989年	[已撤销]	329014	省直辖县级行政区划,新沂市[已撤销]		
-320381	新沂市	江苏省	徐州市	新沂市	民政部	1995年	2024年					
-320382	邳州市	江苏省	徐州市	邳州市	民政部	1995年	2024年					
-320400	常州市	江苏省	常州市	-	民政部	1980年	2024年					
-320401	市辖区	江苏省	常州市	市辖区	国标							增设（GB/T 2260-1984）
-320402	天宁区	江苏省	常州市	天宁区	民政部	1980年	2024年					
-320403	广化区	江苏省	常州市	广化区	民政部	1980年	1985年	[已撤销]	320404,320402	常州市,钟楼区,天宁区		
-320404	钟楼区	江苏省	常州市	钟楼区	民政部	1980年	2024年					
-320405	戚墅堰区	江苏省	常州市	戚墅堰区	民政部	1980年	2014年	[已撤销]	320412	常州市,武进区		
-320411	新北区	江苏省	常州市	新北区	民政部	1983年	2024年					郊区[2001年]
-320412	武进区	江苏省	常州市	武进区	民政部	2002年	2024年					
-320413	金坛区	江苏省	常州市	金坛区	民政部	2015年	2024年					
-320419	武进市	江苏省	常州市	武进市	非官方							
-320421	武进县	江苏省	常州市	武进县	民政部	1983年	1994年	[已撤销]	320483	常州市,武进市[已撤销]		
-320422	金坛县	江苏省	常州市	金坛县	民政部	1983年	1992年	[已撤销]	329024	省直辖县级行政区划,金坛市[已撤销]		
-320423	溧阳县	江苏省	常州市	溧阳县	民政部	1983年	1989年	[已撤销]	329015	省直辖县级行政区划,溧阳市[已撤销]		
-320481	溧阳市	江苏省	常州市	溧阳市	民政部	1995年	2024年					
-320482	金坛市	江苏省	常州市	金坛市	民政部	1995年	2014年	[已撤销]	320413	常州市,金坛区		
-320483	武进市	江苏省	常州市	武进市	民政部	1995年	2001年	[已撤销]	320412	常州市,武进区		
-320500	苏州市	江苏省	苏州市	-	民政部	1980年	2024年					
-320501	市辖区	江苏省	苏州市	市辖区	国标							增设（GB/T 2260-1984）
-320502	沧浪区	江苏省	苏州市	沧浪区	民政部	1980年	2011年	[已撤销]	320508	苏州市,姑苏区		
-320503	平江区	江苏省	苏州市	平江区	民政部	1980年	2011年	[已撤销]	320508	苏州市,姑苏区		
-320504	金阊区	江苏省	苏州市	金阊区	民政部	1980年	2011年	[已撤销]	320508	苏州市,姑苏区		
-320505	虎丘区	江苏省	苏州市	虎丘区	民政部	2000年	2024年					
-320506	吴中区	江苏省	苏州市	吴中区	民政部	2000年	2024年					
-320507	相城区	江苏省	苏州市	相城区	民政部	2000年	2024年					
-320508	姑苏区	江苏省	苏州市	姑苏区	民政部	2012年	2024年					
-320509	吴江区	江苏省	苏州市	吴江区	民政部	2012年	2024年					
-320511	郊区	江苏省	苏州市	郊区	民政部	1983年	1999年	[已撤销]	320505	苏州市,虎丘区		
-320520	常熟市	江苏省	苏州市	常熟市	国标							修订前（GB/T 2260-1986）
-320521	沙洲县	江苏省	苏州市	沙洲县	民政部	1983年	1985年	[已撤销]	329004	省直辖县级行政区划,张家港市[已撤销]		
-320522	太仓县	江苏省	苏州市	太仓县	民政部	1983年	1992年	[已撤销]	329022	省直辖县级行政区划,太仓市[已撤销]		
-320523	昆山县	江苏省	苏州市	昆山县	民政部	1983年	1988年	[已撤销]	329012	省直辖县级行政区划,昆山市[已撤销]		
-320524	吴县	江苏省	苏州市	吴县	民政部	1983年	1994年	[已撤销]	320586	苏州市,吴县市[已撤销]		
-320525	吴江县	江苏省	苏州市	吴江县	民政部	1983年	1991年	[已撤销]	329018	省直辖县级行政区划,吴江市[已撤销]		
-320581	常熟市	江苏省	苏州市	常熟市	民政部	1995年	2024年					
-320582	张家港市	江苏省	苏州市	张家港市	民政部	1995年	2024年					
-320583	昆山市	江苏省	苏州市	昆山市	民政部	1995年	2024年					
-320584	吴江市	江苏省	苏州市	吴江市	民政部	1995年	2011年	[已撤销]	320509	苏州市,吴江区		
-320585	太仓市	江苏省	苏州市	太仓市	民政部	1995年	2024年					
-320586	吴县市	江苏省	苏州市	吴县市	民政部	1995年	1999年	[已撤销]	320506	苏州市,吴中区		
-320600	南通市	江苏省	南通市	-	民政部	1980年	2024年					
-320601	市辖区	江苏省	南通市	市辖区	国标							增设（GB/T 2260-1984）
-320602	崇川区	江苏省	南通市	崇川区	民政部	1980年	2019年	[已撤销]	320613	南通市,崇川区		城中区[1982年]；城区[1990年]
-320603	港闸区	江苏省	南通市	港闸区	民政部	1980年	1982年	[已撤销]	320611	南通市,港闸区[已撤销]		
-320611	港闸区	江苏省	南通市	港闸区	民政部	1980年	2019年	[已撤销]	320613	南通市,崇川区		郊区[1990年]
-320612	通州区	江苏省	南通市	通州区	民政部	2009年	2024年					
-320613	崇川区	江苏省	南通市	崇川区	民政部	2020年	2024年					
-320614	海门区	江苏省	南通市	海门区	民政部	2020年	2024年					
-320621	海安县	江苏省	南通市	海安县	民政部	1983年	2017年	[已撤销]	320685	南通市,海安市		
-320622	如皋县	江苏省	南通市	如皋县	民政部	1983年	1990年	[已撤销]	329016	省直辖县级行政区划,如皋市[已撤销]		
-320623	如东县	江苏省	南通市	如东县	民政部	1983年	2024年					
-320624	南通县	江苏省	南通市	南通县	民政部	1983年	1992年	[已撤销]	329021	省直辖县级行政区划,通州市[已撤销]		
-320625	海门县	江苏省	南通市	海门县	民政部	1983年	1993年	[已撤销]	329026	省直辖县级行政区划,海门市[已撤销]		
-320626	启东县	江苏省	南通市	启东县	民政部	1983年	1988年	[已撤销]	329013	省直辖县级行政区划,启东市[已撤销]		
-320681	启东市	江苏省	南通市	启东市	民政部	1995年	2024年					
-320682	如皋市	江苏省	南通市	如皋市	民政部	1995年	2024年					
-320683	通州市	江苏省	南通市	通州市	民政部	1995年	2008年	[已撤销]	320612	南通市,通州区		
-320684	海门市	江苏省	南通市	海门市	民政部	1995年	2019年	[已撤销]	320614	南通市,海门区		
-320685	海安市	江苏省	南通市	海安市	民政部	2018年	2024年					
-320700	连云港市	江苏省	连云港市	-	民政部	1980年	2024年					
-320701	市辖区	江苏省	连云港市	市辖区	国标							增设（GB/T 2260-1984）
-320702	新海区	江苏省	连云港市	新海区	民政部	1980年	1985年	[已撤销]	320706	连云港市,海州区		连云港区[1982年]
-320703	连云区	江苏省	连云港市	连云区	民政部	1980年	2024年					盐区[1982年]
-320704	云台区	江苏省	连云港市	云台区	民政部	1980年	2000年	[已撤销]	320703,320705	连云港市,连云区,新浦区[已撤销]		新浦区[1982年]
-320705	新浦区	江苏省	连云港市	新浦区	民政部	1980年	2013年	[已撤销]	320706	连云港市,海州区		海州区[1982年]
-320706	海州区	江苏省	连云港市	海州区	民政部	1986年	2024年					
-320707	赣榆区	江苏省	连云港市	赣榆区	民政部	2014年	2024年					
-320711	郊区	江苏省	连云港市	郊区	民政部	1981年	1982年	[已撤销]	320703	连云港市,连云区		
-320721	赣榆县	江苏省	连云港市	赣榆县	民政部	1983年	2013年	[已撤销]	320707	连云港市,赣榆区		
-320722	东海县	江苏省	连云港市	东海县	民政部	1983年	2024年					
-320723	灌云县	江苏省	连云港市	灌云县	民政部	1983年	2024年					
-320724	灌南县	江苏省	连云港市	灌南县	民政部	1996年	2024年					
-320800	淮安市	江苏省	淮安市	-	民政部	1983年	2024年					淮阴市[1999年]
-320801	市辖区	江苏省	淮安市	市辖区	国标							增设（GB/T 2260-1984）
-320802	清河区	江苏省	淮安市	清河区	民政部	1983年	2015年	[已撤销]	320812	淮安市,清江浦区		
-320803	淮安区	江苏省	淮安市	淮安区	民政部	2000年	2024年					楚州区[2010年]
-320804	淮阴区	江苏省	淮安市	淮阴区	民政部	2000年	2024年					
-320811	清浦区	江苏省	淮安市	清浦区	民政部	1983年	2015年	[已撤销]	320812	淮安市,清江浦区		
-320812	清江浦区	江苏省	淮安市	清江浦区	民政部	2016年	2024年					
-320813	洪泽区	江苏省	淮安市	洪泽区	民政部	2016年	2024年					
-320819	宿迁市	江苏省	淮安市	宿迁市	非官方						1947-1950年	
-320821	淮阴县	江苏省	淮安市	淮阴县	民政部	1983年	1999年	[已撤销]	320804	淮安市,淮阴区		
-320822	灌南县	江苏省	淮安市	灌南县	民政部	1983年	1995年	[已撤销]	320724	连云港市,灌南县		
-320823	沭阳县	江苏省	淮安市	沭阳县	民政部	1983年	1995年	[已撤销]	321322	宿迁市,沭阳县		
-320824	宿迁县	江苏省	淮安市	宿迁县	民政部	1983年	1986年	[已撤销]	329006	省直辖县级行政区划,宿迁市[已撤销]		
-320825	泗阳县	江苏省	淮安市	泗阳县	民政部	1983年	1995年	[已撤销]	321323	宿迁市,泗阳县		
-320826	涟水县	江苏省	淮安市	涟水县	民政部	1983年	2024年					
-320827	泗洪县	江苏省	淮安市	泗洪县	民政部	1983年	1995年	[已撤销]	321324	宿迁市,泗洪县		
-320828	淮安县	江苏省	淮安市	淮安县	民政部	1983年	1986年	[已撤销]	329010	省直辖县级行政区划,淮安市[已撤销]		
-320829	洪泽县	江苏省	淮安市	洪泽县	民政部	1983年	2015年	[已撤销]	320813	淮安市,洪泽区		
-320830	盱眙县	江苏省	淮安市	盱眙县	民政部	1983年	2024年					
-320831	金湖县	江苏省	淮安市	金湖县	民政部	1983年	2024年					
-320881	宿迁市	江苏省	淮安市	宿迁市	民政部	1995年	1995年	[已撤销]	321300	宿迁市（地市）		
-320882	淮安市	江苏省	淮安市	淮安市	民政部	1995年	1999年	[已撤销]	320803	淮安市,淮安区		
-320900	盐城市	江苏省	盐城市	-	民政部	1983年	2024年					
-320901	市辖区	江苏省	盐城市	市辖区	国标							增设（GB/T 2260-1984）
-320902	亭湖区	江苏省	盐城市	亭湖区	民政部	1983年	2024年					城区[2002年]
-320903	盐都区	江苏省	盐城市	盐都区	民政部	2003年	2024年					
-320904	大丰区	江苏省	盐城市	大丰区	民政部	2015年	2024年					
-320911	郊区	江苏省	盐城市	郊区	民政部	1983年	1995年	[已撤销]	320928,320902	盐城市,盐都县,亭湖区		
-320919	东台市	江苏省	盐城市	东台市	非官方						1953-1954年	
-320921	响水县	江苏省	盐城市	响水县	民政部	1983年	2024年					
-320922	滨海县	江苏省	盐城市	滨海县	民政部	1983年	2024年					
-320923	阜宁县	江苏省	盐城市	阜宁县	民政部	1983年	2024年					
-320924	射阳县	江苏省	盐城市	射阳县	民政部	1983年	2024年					
-320925	建湖县	江苏省	盐城市	建湖县	民政部	1983年	2024年					
-320926	大丰县	江苏省	盐城市	大丰县	民政部	1983年	1995年	[已撤销]	320982	盐城市,大丰市[已撤销]		
-320927	东台县	江苏省	盐城市	东台县	民政部	1983年	1986年	[已撤销]	329008	省直辖县级行政区划,东台市[已撤销]		
-320928	盐都县	江苏省	盐城市	盐都县	民政部	1996年	2002年	[已撤销]	320903	盐城市,盐都区		
-320981	东台市	江苏省	盐城市	东台市	民政部	1995年	2024年					
-320982	大丰市	江苏省	盐城市	大丰市	民政部	1996年	2014年	[已撤销]	320904	盐城市,大丰区		
-321000	扬州市	江苏省	扬州市	-	民政部	1983年	2024年					
-321001	市辖区	江苏省	扬州市	市辖区	国标							增设（GB/T 2260-1984）
-321002	广陵区	江苏省	扬州市	广陵区	民政部	1983年	2024年					
-321003	邗江区	江苏省	扬州市	邗江区	民政部	2000年	2024年					
-321011	维扬区	江苏省	扬州市	维扬区	民政部	1984年	2010年	[已撤销]	321003	扬州市,邗江区		郊区[2001年]
-321012	江都区	江苏省	扬州市	江都区	民政部	2011年	2024年					
-321019	仪征市	江苏省	扬州市	仪征市	国标							修订前（GB/T 2260-1986）
-321020	泰州市	江苏省	扬州市	泰州市	国标						1974-1975年	修订前（GB/T 2260-1986）
-321021	兴化县	江苏省	扬州市	兴化县	民政部	1983年	1986年	[已撤销]	329009	省直辖县级行政区划,兴化市[已撤销]		
-321022	高邮县	江苏省	扬州市	高邮县	民政部	1983年	1990年	[已撤销]	329017	省直辖县级行政区划,高邮市[已撤销]		
-321023	宝应县	江苏省	扬州市	宝应县	民政部	1983年	2024年					
-321024	靖江县	江苏省	扬州市	靖江县	民政部	1983年	1992年	[已撤销]	329023	省直辖县级行政区划,靖江市[已撤销]		
-321025	泰兴县	江苏省	扬州市	泰兴县	民政部	1983年	1991年	[已撤销]	329020	省直辖县级行政区划,泰兴市[已撤销]		
-321026	江都县	江苏省	扬州市	江都县	民政部	1983年	1993年	[已撤销]	329025	省直辖县级行政区划,江都市[已撤销]		
-321027	邗江县	江苏省	扬州市	邗江县	民政部	1983年	1999年	[已撤销]	321003	扬州市,邗江区		
-321028	泰县	江苏省	扬州市	泰县	民政部	1983年	1993年	[已撤销]	329028	省直辖县级行政区划,姜堰市[已撤销]		
-321029	仪征县	江苏省	扬州市	仪征县	民政部	1983年	1985年	[已撤销]	329002	省直辖县级行政区划,仪征市[已撤销]		
-321081	仪征市	江苏省	扬州市	仪征市	民政部	1995年	2024年					
-321082	泰州市	江苏省	扬州市	泰州市	民政部	1995年	1995年	[已撤销]	321200	泰州市（地市）		
-321083	兴化市	江苏省	扬州市	兴化市	民政部	1995年	1995年	[已撤销]	321281	泰州市,兴化市		
-321084	高邮市	江苏省	扬州市	高邮市	民政部	1995年	2024年					
-321085	靖江市	江苏省	扬州市	靖江市	民政部	1995年	1995年	[已撤销]	321282	泰州市,靖江市		
-321086	泰兴市	江苏省	扬州市	泰兴市	民政部	1995年	1995年	[已撤销]	321283	泰州市,泰兴市		
-321087	姜堰市	江苏省	扬州市	姜堰市	民政部	1995年	1995年	[已撤销]	321284	泰州市,姜堰市[已撤销]		
-321088	江都市	江苏省	扬州市	江都市	民政部	1995年	2010年	[已撤销]	321012	扬州市,江都区		
-321100	镇江市	江苏省	镇江市	-	民政部	1983年	2024年					
-321101	市辖区	江苏省	镇江市	市辖区	国标							增设（GB/T 2260-1984）
-321102	京口区	江苏省	镇江市	京口区	民政部	1983年	2024年					城区[1983年]
-321103	润州区	江苏省	镇江市	润州区	国标							郊区：修订前（GB-T 2260-1988）
-321111	润州区	江苏省	镇江市	润州区	民政部	1983年	2024年					郊区[1983年]
-321112	丹徒区	江苏省	镇江市	丹徒区	民政部	2002年	2024年					
-321119	丹阳市	江苏省	镇江市	丹阳市	非官方							
-321121	丹徒县	江苏省	镇江市	丹徒县	民政部	1983年	2001年	[已撤销]	321112	镇江市,丹徒区		
-321122	丹阳县	江苏省	镇江市	丹阳县	民政部	1983年	1986年	[已撤销]	329007	省直辖县级行政区划,丹阳市[已撤销]		
-321123	句容县	江苏省	镇江市	句容县	民政部	1983年	1994年	[已撤销]	321183	镇江市,句容市		
-321124	扬中县	江苏省	镇江市	扬中县	民政部	1983年	1993年	[已撤销]	329027	省直辖县级行政区划,扬中市[已撤销]		
-321181	丹阳市	江苏省	镇江市	丹阳市	民政部	1995年	2024年					
-321182	扬中市	江苏省	镇江市	扬中市	民政部	1995年	2024年					
-321183	句容市	江苏省	镇江市	句容市	民政部	1995年	2024年					
-321200	泰州市	江苏省	泰州市	-	民政部	1996年	2024年					
-321201	泰州市	江苏省	泰州市	泰州市	民政部	1983年	1983年	[已撤销]	329001	省直辖县级行政区划,泰州市[已撤销]		
-321202	海陵区	江苏省	泰州市	海陵区	民政部	1996年	2024年					
-321203	高港区	江苏省	泰州市	高港区	民政部	1997年	2024年					
-321204	姜堰区	江苏省	泰州市	姜堰区	民政部	2012年	2024年					
-321281	兴化市	江苏省	泰州市	兴化市	民政部	1996年	2024年					
-321282	靖江市	江苏省	泰州市	靖江市	民政部	1996年	2024年					
-321283	泰兴市	江苏省	泰州市	泰兴市	民政部	1996年	2024年					
-321284	姜堰市	江苏省	泰州市	姜堰市	民政部	1996年	2011年	[已撤销]	321204	泰州市,姜堰区		
-321300	宿迁市	江苏省	宿迁市	-	民政部	1996年	2024年					
-321301	常熟市	江苏省	宿迁市	常熟市	民政部	1983年	1983年	[已撤销]	329003	省直辖县级行政区划,常熟市[已撤销]		
-321302	宿城区	江苏省	宿迁市	宿城区	民政部	1996年	2024年					
-321311	宿豫区	江苏省	宿迁市	宿豫区	民政部	2004年	2024年					
-321321	宿豫县	江苏省	宿迁市	宿豫县	民政部	1996年	2003年	[已撤销]	321311	宿迁市,宿豫区		
-321322	沭阳县	江苏省	宿迁市	沭阳县	民政部	1996年	2024年					
-321323	泗阳县	江苏省	宿迁市	泗阳县	民政部	1996年	2024年					
-321324	泗洪县	江苏省	宿迁市	泗洪县	民政部	1996年	2024年					
-322100	徐州地区	江苏省	徐州地区	-	民政部	1980年	1982年	[已撤销]	320300	徐州市（地市）		
-322121	丰县	江苏省	徐州地区	丰县	民政部	1980年	1982年	[已撤销]	320321	徐州市,丰县		
-322122	沛县	江苏省	徐州地区	沛县	民政部	1980年	1982年	[已撤销]	320322	徐州市,沛县		
-322123	铜山县	江苏省	徐州地区	铜山县	民政部	1980年	1982年	[已撤销]	320323	徐州市,铜山县[已撤销]		
-322124	睢宁县	江苏省	徐州地区	睢宁县	民政部	1980年	1982年	[已撤销]	320324	徐州市,睢宁县		
-322125	邳县	江苏省	徐州地区	邳县	民政部	1980年	1982年	[已撤销]	320325	徐州市,邳县[已撤销]		
-322126	新沂县	江苏省	徐州地区	新沂县	民政部	1980年	1982年	[已撤销]	320326	徐州市,新沂县[已撤销]		
-322127	东海县	江苏省	徐州地区	东海县	民政部	1980年	1982年	[已撤销]	320722	连云港市,东海县		
-322128	赣榆县	江苏省	徐州地区	赣榆县	民政部	1980年	1982年	[已撤销]	320721	连云港市,赣榆县[已撤销]		
-322200	淮阴地区	江苏省	淮阴地区	-	民政部	1980年	1982年	[已撤销]	320800	淮安市（地市）		
-322201	清江市	江苏省	淮阴地区	清江市	民政部	1980年	1982年	[已撤销]	320811	淮安市,清浦区[已撤销]		
-322221	淮阴县	江苏省	淮阴地区	淮阴县	民政部	1980年	1982年	[已撤销]	320821	淮安市,淮阴县[已撤销]		
-322222	灌云县	江苏省	淮阴地区	灌云县	民政部	1980年	1982年	[已撤销]	320723	连云港市,灌云县		
-322223	灌南县	江苏省	淮阴地区	灌南县	民政部	1980年	1982年	[已撤销]	320822	淮安市,灌南县[已撤销]		
-322224	沭阳县	江苏省	淮阴地区	沭阳县	民政部	1980年	1982年	[已撤销]	320823	淮安市,沭阳县[已撤销]		
-322225	宿迁县	江苏省	淮阴地区	宿迁县	民政部	1980年	1982年	[已撤销]	320824	淮安市,宿迁县[已撤销]		
-322226	泗阳县	江苏省	淮阴地区	泗阳县	民政部	1980年	1982年	[已撤销]	320825	淮安市,泗阳县[已撤销]		
-322227	涟水县	江苏省	淮阴地区	涟水县	民政部	1980年	1982年	[已撤销]	320826	淮安市,涟水县		
-322228	泗洪县	江苏省	淮阴地区	泗洪县	民政部	1980年	1982年	[已撤销]	320827	淮安市,泗洪县[已撤销]		
-322229	淮安县	江苏省	淮阴地区	淮安县	民政部	1980年	1982年	[已撤销]	320828	淮安市,淮安县[已撤销]		
-322230	洪泽县	江苏省	淮阴地区	洪泽县	民政部	1980年	1982年	[已撤销]	320829	淮安市,洪泽县[已撤销]		
-322231	盱眙县	江苏省	淮阴地区	盱眙县	民政部	1980年	1982年	[已撤销]	320830	淮安市,盱眙县		
-322232	金湖县	江苏省	淮阴地区	金湖县	民政部	1980年	1982年	[已撤销]	320831	淮安市,金湖县		
-322300	盐城地区	江苏省	盐城地区	-	民政部	1980年	1982年	[已撤销]	320900	盐城市（地市）		
-322321	响水县	江苏省	盐城地区	响水县	民政部	1980年	1982年	[已撤销]	320921	盐城市,响水县		
-322322	滨海县	江苏省	盐城地区	滨海县	民政部	1980年	1982年	[已撤销]	320922	盐城市,滨海县		
-322323	阜宁县	江苏省	盐城地区	阜宁县	民政部	1980年	1982年	[已撤销]	320923	盐城市,阜宁县		
-322324	射阳县	江苏省	盐城地区	射阳县	民政部	1980年	1982年	[已撤销]	320924	盐城市,射阳县		
-322325	建湖县	江苏省	盐城地区	建湖县	民政部	1980年	1982年	[已撤销]	320925	盐城市,建湖县		
-322326	盐城县	江苏省	盐城地区	盐城县	民政部	1980年	1982年	[已撤销]	320900	盐城市（地市）		
-322327	大丰县	江苏省	盐城地区	大丰县	民政部	1980年	1982年	[已撤销]	320926	盐城市,大丰县[已撤销]		
-322328	东台县	江苏省	盐城地区	东台县	民政部	1980年	1982年	[已撤销]	320927	盐城市,东台县[已撤销]		
-322400	扬州地区	江苏省	扬州地区	-	民政部	1980年	1982年	[已撤销]	321000	扬州市（地市）		
-322401	扬州市	江苏省	扬州地区	扬州市	民政部	1980年	1982年	[已撤销]	321000	扬州市（地市）		
-322402	泰州市	江苏省	扬州地区	泰州市	民政部	1980年	1982年	[已撤销]	321201	泰州市,泰州市[已撤销]		
-322421	兴化县	江苏省	扬州地区	兴化县	民政部	1980年	1982年	[已撤销]	321021	扬州市,兴化县[已撤销]		
-322422	高邮县	江苏省	扬州地区	高邮县	民政部	1980年	1982年	[已撤销]	321022	扬州市,高邮县[已撤销]		
-322423	宝应县	江苏省	扬州地区	宝应县	民政部	1980年	1982年	[已撤销]	321023	扬州市,宝应县		
-322424	靖江县	江苏省	扬州地区	靖江县	民政部	1980年	1982年	[已撤销]	321024	扬州市,靖江县[已撤销]		
-322425	泰兴县	江苏省	扬州地区	泰兴县	民政部	1980年	1982年	[已撤销]	321025	扬州市,泰兴县[已撤销]		
-322426	江都县	江苏省	扬州地区	江都县	民政部	1980年	1982年	[已撤销]	321026	扬州市,江都县[已撤销]		
-322427	邗江县	江苏省	扬州地区	邗江县	民政部	1980年	1982年	[已撤销]	321027	扬州市,邗江县[已撤销]		
-322428	泰县	江苏省	扬州地区	泰县	民政部	1980年	1982年	[已撤销]	321028	扬州市,泰县[已撤销]		
-322429	仪征县	江苏省	扬州地区	仪征县	民政部	1980年	1982年	[已撤销]	321029	扬州市,仪征县[已撤销]		
-322500	南通地区	江苏省	南通地区	-	民政部	1980年	1982年	[已撤销]	320600	南通市（地市）		
-322521	海安县	江苏省	南通地区	海安县	民政部	1980年	1982年	[已撤销]	320621	南通市,海安县[已撤销]		
-322522	如皋县	江苏省	南通地区	如皋县	民政部	1980年	1982年	[已撤销]	320622	南通市,如皋县[已撤销]		
-322523	如东县	江苏省	南通地区	如东县	民政部	1980年	1982年	[已撤销]	320623	南通市,如东县		
-322524	南通县	江苏省	南通地区	南通县	民政部	1980年	1982年	[已撤销]	320624	南通市,南通县[已撤销]		
-322525	海门县	江苏省	南通地区	海门县	民政部	1980年	1982年	[已撤销]	320625	南通市,海门县[已撤销]		
-322526	启东县	江苏省	南通地区	启东县	民政部	1980年	1982年	[已撤销]	320626	南通市,启东县[已撤销]		
-322600	镇江地区	江苏省	镇江地区	-	民政部	1980年	1982年	[已撤销]	321100	镇江市（地市）		
-322601	镇江市	江苏省	镇江地区	镇江市	民政部	1980年	1982年	[已撤销]	321100	镇江市（地市）		
-322621	丹徒县	江苏省	镇江地区	丹徒县	民政部	1980年	1982年	[已撤销]	321121	镇江市,丹徒县[已撤销]		
-322622	武进县	江苏省	镇江地区	武进县	民政部	1980年	1982年	[已撤销]	320421	常州市,武进县[已撤销]		
-322623	丹阳县	江苏省	镇江地区	丹阳县	民政部	1980年	1982年	[已撤销]	321122	镇江市,丹阳县[已撤销]		
-322624	句容县	江苏省	镇江地区	句容县	民政部	1980年	1982年	[已撤销]	321123	镇江市,句容县[已撤销]		
-322625	金坛县	江苏省	镇江地区	金坛县	民政部	1980年	1982年	[已撤销]	320422	常州市,金坛县[已撤销]		
-322626	溧水县	江苏省	镇江地区	溧水县	民政部	1980年	1982年	[已撤销]	320124	南京市,溧水县[已撤销]		
-322627	高淳县	江苏省	镇江地区	高淳县	民政部	1980年	1982年	[已撤销]	320125	南京市,高淳县[已撤销]		
-322628	溧阳县	江苏省	镇江地区	溧阳县	民政部	1980年	1982年	[已撤销]	320423	常州市,溧阳县[已撤销]		
-322629	宜兴县	江苏省	镇江地区	宜兴县	民政部	1980年	1982年	[已撤销]	320223	无锡市,宜兴县[已撤销]		
-322630	扬中县	江苏省	镇江地区	扬中县	民政部	1980年	1982年	[已撤销]	321124	镇江市,扬中县[已撤销]		
-322700	苏州地区	江苏省	苏州地区	-	民政部	1980年	1982年	[已撤销]	320500	苏州市（地市）		
-322721	江阴县	江苏省	苏州地区	江阴县	民政部	1980年	1982年	[已撤销]	320221	无锡市,江阴县[已撤销]		
-322722	无锡县	江苏省	苏州地区	无锡县	民政部	1980年	1982年	[已撤销]	320222	无锡市,无锡县[已撤销]		
-322723	沙洲县	江苏省	苏州地区	沙洲县	民政部	1980年	1982年	[已撤销]	320521	苏州市,沙洲县[已撤销]		
-322724	常熟县	江苏省	苏州地区	常熟县	民政部	1980年	1982年	[已撤销]	321301	宿迁市,常熟市[已撤销]		
-322725	太仓县	江苏省	苏州地区	太仓县	民政部	1980年	1982年	[已撤销]	320522	苏州市,太仓县[已撤销]		
-322726	昆山县	江苏省	苏州地区	昆山县	民政部	1980年	1982年	[已撤销]	320523	苏州市,昆山县[已撤销]		
-322727	吴县	江苏省	苏州地区	吴县	民政部	1980年	1982年	[已撤销]	320524	苏州市,吴县[已撤销]		
-322728	吴江县	江苏省	苏州地区	吴江县	民政部	1980年	1982年	[已撤销]	320525	苏州市,吴江县[已撤销]		
-329000	省直辖县	江苏省	省直辖县级行政区划	-	非官方							
-329001	泰州市	江苏省	省直辖县级行政区划	泰州市	民政部	1984年	1994年	[已撤销]	321082	扬州市,泰州市[已撤销]		
-329002	仪征市	江苏省	省直辖县级行政区划	仪征市	民政部	1986年	1994年	[已撤销]	321081	扬州市,仪征市		
-329003	常熟市	江苏省	省直辖县级行政区划	常熟市	民政部	1984年	1994年	[已撤销]	320581	苏州市,常熟市		
-329004	张家港市	江苏省	省直辖县级行政区划	张家港市	民政部	1986年	1994年	[已撤销]	320582	苏州市,张家港市		
-329005	江阴市	江苏省	省直辖县级行政区划	江阴市	民政部	1987年	1994年	[已撤销]	320281	无锡市,江阴市		
-329006	宿迁市	江苏省	省直辖县级行政区划	宿迁市	民政部	1987年	1994年	[已撤销]	320881	淮安市,宿迁市[已撤销]		
-329007	丹阳市	江苏省	省直辖县级行政区划	丹阳市	民政部	1987年	1994年	[已撤销]	321181	镇江市,丹阳市		
-329008	东台市	江苏省	省直辖县级行政区划	东台市	民政部	1987年	1994年	[已撤销]	320981	盐城市,东台市		
-329009	兴化市	江苏省	省直辖县级行政区划	兴化市	民政部	1987年	1994年	[已撤销]	321083	扬州市,兴化市[已撤销]		
-329010	淮安市	江苏省	省直辖县级行政区划	淮安市	民政部	1987年	1994年	[已撤销]	320882	淮安市,淮安市[已撤销]		
-329011	宜兴市	江苏省	省直辖县级行政区划	宜兴市	民政部	1988年	1994年	[已撤销]	320282	无锡市,宜兴市		
-329012	昆山市	江苏省	省直辖县级行政区划	昆山市	民政部	1989年	1994年	[已撤销]	320583	苏州市,昆山市		
-329013	启东市	江苏省	省直辖县级行政区划	启东市	民政部	1989年	1994年	[已撤销]	320681	南通市,启东市		
-329014	新沂市	江苏省	省直辖县级行政区划	新沂市	民政部	1990年	1994年	[已撤销]	320381	徐州市,新沂市		
-329015	溧阳市	江苏省	省直辖县级行政区划	溧阳市	民政部	1990年	1994年	[已撤销]	320481	常州市,溧阳市		
-329016	如皋市	江苏省	省直辖县级行政区划	如皋市	民政部	1991年	1994年	[已撤销]	320682	南通市,如皋市		
-329017	高邮市	江苏省	省直辖县级行政区划	高邮市	民政部	1991年	1994年	[已撤销]	321084	扬州市,高邮市		
-329018	吴江市	江苏省	省直辖县级行政区划	吴江市	民政部	1992年	1994年	[已撤销]	320584	苏州市,吴江市[已撤销]		
-329019	邳州市	江苏省	省直辖县级行政区划	邳州市	民政部	1992年	1994年	[已撤销]	320382	徐州市,邳州市		
-329020	泰兴市	江苏省	省直辖县级行政区划	泰兴市	民政部	1992年	1994年	[已撤销]	321086	扬州市,泰兴市[已撤销]		
-329021	通州市	江苏省	省直辖县级行政区划	通州市	民政部	1993年	1994年	[已撤销]	320683	南通市,通州市[已撤销]		
-329022	太仓市	江苏省	省直辖县级行政区划	太仓市	民政部	1993年	1994年	[已撤销]	320585	苏州市,太仓市		
-329023	靖江市	江苏省	省直辖县级行政区划	靖江市	民政部	1993年	1994年	[已撤销]	321085	扬州市,靖江市[已撤销]		
-329024	金坛市	江苏省	省直辖县级行政区划	金坛市	民政部	1993年	1994年	[已撤销]	320482	常州市,金坛市[已撤销]		
-329025	江都市	江苏省	省直辖县级行政区划	江都市	民政部	1994年	1994年	[已撤销]	321088	扬州市,江都市[已撤销]		
-329026	海门市	江苏省	省直辖县级行政区划	海门市	民政部	1994年	1994年	[已撤销]	320684	南通市,海门市[已撤销]		
-329027	扬中市	江苏省	省直辖县级行政区划	扬中市	民政部	1994年	1994年	[已撤销]	321182	镇江市,扬中市		
-329028	姜堰市	江苏省	省直辖县级行政区划	姜堰市	民政部	1994年	1994年	[已撤销]	321087	扬州市,姜堰市[已撤销]		
-330000	浙江省	浙江省	-	-	民政部	1980年	2024年					
-330100	杭州市	浙江省	杭州市	-	民政部	1980年	2024年					
-330101	市辖区	浙江省	杭州市	市辖区	国标							增设（GB/T 2260-1984）
-330102	上城区	浙江省	杭州市	上城区	民政部	1980年	2024年					
-330103	下城区	浙江省	杭州市	下城区	民政部	1980年	2020年	[已撤销]	330105	杭州市,拱墅区		
-330104	江干区	浙江省	杭州市	江干区	民政部	1980年	2020年	[已撤销]	330102	杭州市,上城区		
-330105	拱墅区	浙江省	杭州市	拱墅区	民政部	1980年	2024年					
-330106	西湖区	浙江省	杭州市	西湖区	民政部	1980年	2024年					
-330107	半山区	浙江省	杭州市	半山区	民政部	1980年	1989年	[已撤销]	330105	杭州市,拱墅区		
-330108	滨江区	浙江省	杭州市	滨江区	民政部	1996年	2024年					
-330109	萧山区	浙江省	杭州市	萧山区	民政部	2001年	2024年					
-330110	余杭区	浙江省	杭州市	余杭区	民政部	2001年	2024年					
-330111	富阳区	浙江省	杭州市	富阳区	民政部	2014年	2024年					
-330112	临安区	浙江省	杭州市	临安区	民政部	2017年	2024年					
-330113	临平区	浙江省	杭州市	临平区	民政部	2021年	2024年					
-330114	钱塘区	浙江省	杭州市	钱塘区	民政部	2021年	2024年					
-330120	杭州市区	浙江省	杭州市	杭州市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-330121	萧山县	浙江省	杭州市	萧山县	民政部	1980年	1986年	[已撤销]	339005	省直辖县级行政区划,萧山市[已撤销]		
-330122	桐庐县	浙江省	杭州市	桐庐县	民政部	1980年	2024年					
-330123	富阳县	浙江省	杭州市	富阳县	民政部	1980年	1993年	[已撤销]	339019	省直辖县级行政区划,富阳市[已撤销]		
-330124	临安县	浙江省	杭州市	临安县	民政部	1980年	1995年	[已撤销]	330185	杭州市,临安市[已撤销]		
-330125	余杭县	浙江省	杭州市	余杭县	民政部	1980年	1993年	[已撤销]	339021	省直辖县级行政区划,余杭市[已撤销]		
-330126	建德县	浙江省	杭州市	建德县	民政部	1980年	1991年	[已撤销]	339013	省直辖县级行政区划,建德市[已撤销]		
-330127	淳安县	浙江省	杭州市	淳安县	民政部	1980年	2024年					
-330129	余姚市	浙江省	杭州市	余姚市	国标							修订前（GB-T 2260-1986）
-330181	萧山市	浙江省	杭州市	萧山市	民政部	1995年	2000年	[已撤销]	330109	杭州市,萧山区		
-330182	建德市	浙江省	杭州市	建德市	民政部	1995年	2024年					
-330183	富阳市	浙江省	杭州市	富阳市	民政部	1995年	2013年	[已撤销]	330111	杭州市,富阳区		
-330184	余杭市	浙江省	杭州市	余杭市	民政部	1995年	2000年	[已撤销]	330110	杭州市,余杭区		
-330185	临安市	浙江省	杭州市	临安市	民政部	1996年	2016年	[已撤销]	330112	杭州市,临安区		
-330200	宁波市	浙江省	宁波市	-	民政部	1980年	2024年					
-330201	市辖区	浙江省	宁波市	市辖区	国标							增设（GB/T 2260-1984）
-330202	镇明区	浙江省	宁波市	镇明区	民政部	1980年	1984年	[已撤销]	330203	宁波市,海曙区		
-330203	海曙区	浙江省	宁波市	海曙区	民政部	1980年	2024年					
-330204	江东区	浙江省	宁波市	江东区	民政部	1980年	2015年	[已撤销]	330212	宁波市,鄞州区		
-330205	江北区	浙江省	宁波市	江北区	民政部	1980年	2024年					
-330206	北仑区	浙江省	宁波市	北仑区	民政部	1985年	2024年					滨海区[1986年]
-330211	镇海区	浙江省	宁波市	镇海区	民政部	1985年	2024年					
-330212	鄞州区	浙江省	宁波市	鄞州区	民政部	2002年	2024年					
-330213	奉化区	浙江省	宁波市	奉化区	民政部	2016年	2024年					
-330219	余姚市	浙江省	宁波市	余姚市	民政部	1985年	1985年	[已撤销]	339001	省直辖县级行政区划,余姚市[已撤销]		
-330220	宁波市区	浙江省	宁波市	宁波市区	国标							增设（GB/T 2260-1982）
-330221	镇海县	浙江省	宁波市	镇海县	民政部	1982年	1984年	[已撤销]	330211	宁波市,镇海区		
-330222	慈溪县	浙江省	宁波市	慈溪县	民政部	1983年	1987年	[已撤销]	339009	省直辖县级行政区划,慈溪市[已撤销]		
-330223	余姚县	浙江省	宁波市	余姚县	民政部	1983年	1984年	[已撤销]	330219	宁波市,余姚市[已撤销]		
-330224	奉化县	浙江省	宁波市	奉化县	民政部	1983年	1987年	[已撤销]	339010	省直辖县级行政区划,奉化市[已撤销]		
-330225	象山县	浙江省	宁波市	象山县	民政部	1983年	2024年					
-330226	宁海县	浙江省	宁波市	宁海县	民政部	1983年	2024年					
-330227	鄞县	浙江省	宁波市	鄞县	民政部	1983年	2001年	[已撤销]	330212	宁波市,鄞州区		
-330281	余姚市	浙江省	宁波市	余姚市	民政部	1995年	2024年					
-330282	慈溪市	浙江省	宁波市	慈溪市	民政部	1995年	2024年					
-330283	奉化市	浙江省	宁波市	奉化市	民政部	1995年	2015年	[已撤销]	330213	宁波市,奉化区		
-330300	温州市	浙江省	温州市	-	民政部	1980年	2024年					
-330301	东城区	浙江省	温州市	东城区	民政部	1980年	1982年	[已撤销]	330302	温州市,鹿城区		
-330302	鹿城区	浙江省	温州市	鹿城区	民政部	1980年	2024年					南城区[1982年]；城区[1983年]
-330303	龙湾区	浙江省	温州市	龙湾区	民政部	1980年	2024年					西城区[1982年]
-330304	瓯海区	浙江省	温州市	瓯海区	民政部	1992年	2024年					
-330305	洞头区	浙江省	温州市	洞头区	民政部	2015年	2024年					
-330320	温州市区	浙江省	温州市	温州市区	国标							增设（GB/T 2260-1982）
-330321	瓯海县	浙江省	温州市	瓯海县	民政部	1981年	1991年	[已撤销]	330304	温州市,瓯海区		洞头县[1981年]
-330322	洞头县	浙江省	温州市	洞头县	民政部	1981年	2014年	[已撤销]	330305	温州市,洞头区		永嘉县[1981年]
-330323	乐清县	浙江省	温州市	乐清县	民政部	1981年	1992年	[已撤销]	339017	省直辖县级行政区划,乐清市[已撤销]		瑞安县[1981年]
-330324	永嘉县	浙江省	温州市	永嘉县	民政部	1981年	2024年					文成县[1981年]
-330325	瑞安县	浙江省	温州市	瑞安县	民政部	1981年	1986年	[已撤销]	339004	省直辖县级行政区划,瑞安市[已撤销]		平阳县[1981年]
-330326	平阳县	浙江省	温州市	平阳县	民政部	1981年	2024年					乐清县[1981年]
-330327	苍南县	浙江省	温州市	苍南县	民政部	1981年	2024年					泰顺县[1981年]
-330328	文成县	浙江省	温州市	文成县	民政部	1981年	2024年					瓯海县[1981年]
-330329	泰顺县	浙江省	温州市	泰顺县	民政部	1981年	2024年					苍南县[1981年]
-330381	瑞安市	浙江省	温州市	瑞安市	民政部	1995年	2024年					
-330382	乐清市	浙江省	温州市	乐清市	民政部	1995年	2024年					
-330383	龙港市	浙江省	温州市	龙港市	民政部	2019年	2024年					
-330400	嘉兴市	浙江省	嘉兴市	-	民政部	1983年	2024年					
-330401	市辖区	浙江省	嘉兴市	市辖区	国标							增设（GB/T 2260-1984）
-330402	南湖区	浙江省	嘉兴市	南湖区	民政部	1983年	2024年					城区[1992年]；秀城区[2004年]
-330411	秀洲区	浙江省	嘉兴市	秀洲区	民政部	1983年	2024年					郊区[1998年]
-330419	嘉兴市	浙江省	嘉兴市	海宁市	非官方							
-330421	嘉善县	浙江省	嘉兴市	嘉善县	民政部	1983年	2024年					
-330422	平湖县	浙江省	嘉兴市	平湖县	民政部	1983年	1990年	[已撤销]	339012	省直辖县级行政区划,平湖市[已撤销]		
-330423	海宁县	浙江省	嘉兴市	海宁县	民政部	1983年	1985年	[已撤销]	339002	省直辖县级行政区划,海宁市[已撤销]		
-330424	海盐县	浙江省	嘉兴市	海盐县	民政部	1983年	2024年					
-330425	桐乡县	浙江省	嘉兴市	桐乡县	民政部	1983年	1992年	[已撤销]	339016	省直辖县级行政区划,桐乡市[已撤销]		
-330481	海宁市	浙江省	嘉兴市	海宁市	民政部	1995年	2024年					
-330482	平湖市	浙江省	嘉兴市	平湖市	民政部	1995年	2024年					
-330483	桐乡市	浙江省	嘉兴市	桐乡市	民政部	1995年	2024年					
-330500	湖州市	浙江省	湖州市	-	民政部	1983年	2024年					
-330501	市辖区	浙江省	湖州市	市辖区	国标						1985-1993年	增设（GB/T 2260-1984）
-330502	吴兴区	浙江省	湖州市	吴兴区	民政部	1983年	2024年					城区[1987年]
-330503	南浔区	浙江省	湖州市	南浔区	民政部	2003年	2024年					
-330511	郊区	浙江省	湖州市	郊区	民政部	1983年	1987年	[已撤销]	330503	湖州市,南浔区		
-330521	德清县	浙江省	湖州市	德清县	民政部	1983年	2024年					
-330522	长兴县	浙江省	湖州市	长兴县	民政部	1983年	2024年					
-330523	安吉县	浙江省	湖州市	安吉县	民政部	1983年	2024年					
-330600	绍兴市	浙江省	绍兴市	-	民政部	1983年	2024年					
-330601	市辖区	浙江省	绍兴市	市辖区	国标							
-330602	越城区	浙江省	绍兴市	越城区	民政部	1983年	2024年					
-330603	柯桥区	浙江省	绍兴市	柯桥区	民政部	2013年	2024年					
-330604	上虞区	浙江省	绍兴市	上虞区	民政部	2013年	2024年					
-330621	绍兴县	浙江省	绍兴市	绍兴县	民政部	1983年	2012年	[已撤销]	330603	绍兴市,柯桥区		
-330622	上虞县	浙江省	绍兴市	上虞县	民政部	1983年	1991年	[已撤销]	339015	省直辖县级行政区划,上虞市[已撤销]		
-330623	嵊县	浙江省	绍兴市	嵊县	民政部	1983年	1994年	[已撤销]	330683	绍兴市,嵊州市		
-330624	新昌县	浙江省	绍兴市	新昌县	民政部	1983年	2024年					
-330625	诸暨县	浙江省	绍兴市	诸暨县	民政部	1983年	1988年	[已撤销]	339011	省直辖县级行政区划,诸暨市[已撤销]		
-330681	诸暨市	浙江省	绍兴市	诸暨市	民政部	1995年	2024年					
-330682	上虞市	浙江省	绍兴市	上虞市	民政部	1995年	2012年	[已撤销]	330604	绍兴市,上虞区		
-330683	嵊州市	浙江省	绍兴市	嵊州市	民政部	1995年	2024年					
-330700	金华市	浙江省	金华市	-	民政部	1985年	2024年					
-330701	兰溪市	浙江省	金华市	兰溪市	民政部	1985年	1985年	[已撤销]	339003	省直辖县级行政区划,兰溪市[已撤销]		
-330702	婺城区	浙江省	金华市	婺城区	民政部	1985年	2024年					
-330703	金东区	浙江省	金华市	金东区	民政部	2000年	2024年					
-330719	兰溪市	浙江省	金华市	兰溪市	国标						1982年	修订前（GB/T 2260-1986）
-330721	金华县	浙江省	金华市	金华县	民政部	1985年	1999年	[已撤销]	330703	金华市,金东区		
-330722	永康县	浙江省	金华市	永康县	民政部	1985年	1991年	[已撤销]	339014	省直辖县级行政区划,永康市[已撤销]		
-330723	武义县	浙江省	金华市	武义县	民政部	1985年	2024年					
-330724	东阳县	浙江省	金华市	东阳县	民政部	1985年	1987年	[已撤销]	339008	省直辖县级行政区划,东阳市[已撤销]		
-330725	义乌县	浙江省	金华市	义乌县	民政部	1985年	1987年	[已撤销]	339007	省直辖县级行政区划,义乌市[已撤销]		
-330726	浦江县	浙江省	金华市	浦江县	民政部	1985年	2024年					
-330727	磐安县	浙江省	金华市	磐安县	民政部	1985年	2024年					
-330781	兰溪市	浙江省	金华市	兰溪市	民政部	1995年	2024年					
-330782	义乌市	浙江省	金华市	义乌市	民政部	1995年	2024年					
-330783	东阳市	浙江省	金华市	东阳市	民政部	1995年	2024年					
-330784	永康市	浙江省	金华市	永康市	民政部	1995年	2024年					
-330800	衢州市	浙江省	衢州市	-	民政部	1985年	2024年					
-330801	市辖区	浙江省	衢州市	市辖区	国标							
-330802	柯城区	浙江省	衢州市	柯城区	民政部	1985年	2024年					
-330803	衢江区	浙江省	衢州市	衢江区	民政部	2001年	2024年					
-330821	衢县	浙江省	衢州市	衢县	民政部	1985年	2000年	[已撤销]	330803	衢州市,衢江区		
-330822	常山县	浙江省	衢州市	常山县	民政部	1985年	2024年					
-330823	江山县	浙江省	衢州市	江山县	民政部	1985年	1986年	[已撤销]	339006	省直辖县级行政区划,江山市[已撤销]		
-330824	开化县	浙江省	衢州市	开化县	民政部	1985年	2024年					
-330825	龙游县	浙江省	衢州市	龙游县	民政部	1985年	2024年					
-330881	江山市	浙江省	衢州市	江山市	民政部	1995年	2024年					
-330900	舟山市	浙江省	舟山市	-	民政部	1987年	2024年					
-330901	市辖区	浙江省	舟山市	市辖区	国标						1972年	
-330902	定海区	浙江省	舟山市	定海区	民政部	1987年	2024年					
-330903	普陀区	浙江省	舟山市	普陀区	民政部	1987年	2024年					
-330921	岱山县	浙江省	舟山市	岱山县	民政部	1987年	2024年					
-330922	嵊泗县	浙江省	舟山市	嵊泗县	民政部	1987年	2024年					
-331000	台州市	浙江省	台州市	-	民政部	1994年	2024年					
-331001	市辖区	浙江省	台州市	市辖区	国标							
-331002	椒江区	浙江省	台州市	椒江区	民政部	1994年	2024年					
-331003	黄岩区	浙江省	台州市	黄岩区	民政部	1994年	2024年					
-331004	路桥区	浙江省	台州市	路桥区	民政部	1994年	2024年					
-331021	玉环县	浙江省	台州市	玉环县	民政部	1994年	2016年	[已撤销]	331083	台州市,玉环市		
-331022	三门县	浙江省	台州市	三门县	民政部	1994年	2024年					
-331023	天台县	浙江省	台州市	天台县	民政部	1994年	2024年					
-331024	仙居县	浙江省	台州市	仙居县	民政部	1994年	2024年					
-331081	温岭市	浙江省	台州市	温岭市	民政部	1995年	2024年					
-331082	临海市	浙江省	台州市	临海市	民政部	1995年	2024年					
-331083	玉环市	浙江省	台州市	玉环市	民政部	2017年	2024年					
-331100	丽水市	浙江省	丽水市	-	民政部	2000年	2024年					
-331101	市辖区	浙江省	丽水市	市辖区	国标							
-331102	莲都区	浙江省	丽水市	莲都区	民政部	2000年	2024年					
-331121	青田县	浙江省	丽水市	青田县	民政部	2000年	2024年					
-331122	缙云县	浙江省	丽水市	缙云县	民政部	2000年	2024年					
-331123	遂昌县	浙江省	丽水市	遂昌县	民政部	2000年	2024年					
-331124	松阳县	浙江省	丽水市	松阳县	民政部	2000年	2024年					
-331125	云和县	浙江省	丽水市	云和县	民政部	2000年	2024年					
-331126	庆元县	浙江省	丽水市	庆元县	民政部	2000年	2024年					
-331127	景宁畲族自治县	浙江省	丽水市	景宁畲族自治县	民政部	2000年	2024年					
-331181	龙泉市	浙江省	丽水市	龙泉市	民政部	2000年	2024年					
-332100	嘉兴地区	浙江省	嘉兴地区	-	民政部	1980年	1982年	[已撤销]	330400	嘉兴市（地市）		
-332101	湖州市	浙江省	嘉兴地区	湖州市	民政部	1980年	1982年	[已撤销]	330500	湖州市（地市）		
-332102	嘉兴市	浙江省	嘉兴地区	嘉兴市	民政部	1980年	1982年	[已撤销]	330400	嘉兴市（地市）		
-332121	嘉善县	浙江省	嘉兴地区	嘉善县	民政部	1980年	1982年	[已撤销]	330421	嘉兴市,嘉善县		嘉兴县[1980年]
-332122	平湖县	浙江省	嘉兴地区	平湖县	民政部	1980年	1982年	[已撤销]	330422	嘉兴市,平湖县[已撤销]		嘉善县[1981年]
-332123	海宁县	浙江省	嘉兴地区	海宁县	民政部	1980年	1982年	[已撤销]	330423	嘉兴市,海宁县[已撤销]		平湖县[1981年]
-332124	海盐县	浙江省	嘉兴地区	海盐县	民政部	1980年	1982年	[已撤销]	330424	嘉兴市,海盐县		海宁县[1981年]
-332125	桐乡县	浙江省	嘉兴地区	桐乡县	民政部	1980年	1982年	[已撤销]	330425	嘉兴市,桐乡县[已撤销]		海盐县[1981年]
-332126	德清县	浙江省	嘉兴地区	德清县	民政部	1980年	1982年	[已撤销]	330521	湖州市,德清县		桐乡县[1981年]
-332127	长兴县	浙江省	嘉兴地区	长兴县	民政部	1980年	1982年	[已撤销]	330522	湖州市,长兴县		德清县[1981年]
-332128	安吉县	浙江省	嘉兴地区	安吉县	民政部	1980年	1982年	[已撤销]	330523	湖州市,安吉县		吴兴县[1980年]
-332129	长兴县	浙江省	嘉兴地区	长兴县	民政部	1980年	1981年	[已撤销]	330522	湖州市,长兴县		
-332130	安吉县	浙江省	嘉兴地区	安吉县	民政部	1980年	1981年	[已撤销]	330523	湖州市,安吉县		
-332200	宁波地区	浙江省	宁波地区	-	民政部	1980年	1982年	[已撤销]	330200	宁波市（地市）		
-332221	慈溪县	浙江省	宁波地区	慈溪县	民政部	1980年	1982年	[已撤销]	330222	宁波市,慈溪县[已撤销]		
-332222	余姚县	浙江省	宁波地区	余姚县	民政部	1980年	1982年	[已撤销]	330223	宁波市,余姚县[已撤销]		
-332223	奉化县	浙江省	宁波地区	奉化县	民政部	1980年	1982年	[已撤销]	330224	宁波市,奉化县[已撤销]		
-332224	象山县	浙江省	宁波地区	象山县	民政部	1980年	1982年	[已撤销]	330225	宁波市,象山县		
-332225	宁海县	浙江省	宁波地区	宁海县	民政部	1980年	1982年	[已撤销]	330226	宁波市,宁海县		
-332226	鄞县	浙江省	宁波地区	鄞县	民政部	1980年	1982年	[已撤销]	330227	宁波市,鄞县[已撤销]		
-332227	镇海县	浙江省	宁波地区	镇海县	民政部	1980年	1981年	[已撤销]	330221	宁波市,镇海县[已撤销]		
-332300	绍兴地区	浙江省	绍兴地区	-	民政部	1980年	1982年	[已撤销]	330600	绍兴市（地市）		
-332301	绍兴市	浙江省	绍兴地区	绍兴市	民政部	1980年	1982年	[已撤销]	330621	绍兴市,绍兴县[已撤销]		
-332321	上虞县	浙江省	绍兴地区	上虞县	民政部	1980年	1982年	[已撤销]	330622	绍兴市,上虞县[已撤销]		绍兴县[1980年]
-332322	嵊县	浙江省	绍兴地区	嵊县	民政部	1980年	1982年	[已撤销]	330623	绍兴市,嵊县[已撤销]		上虞县[1981年]
-332323	新昌县	浙江省	绍兴地区	新昌县	民政部	1980年	1982年	[已撤销]	330624	绍兴市,新昌县		嵊县[1981年]
-332324	诸暨县	浙江省	绍兴地区	诸暨县	民政部	1980年	1982年	[已撤销]	330625	绍兴市,诸暨县[已撤销]		新昌县[1981年]
-332325	诸暨县	浙江省	绍兴地区	诸暨县	民政部	1980年	1981年	[已撤销]	330625	绍兴市,诸暨县[已撤销]		
-332400	金华地区	浙江省	金华地区	-	民政部	1980年	1984年	[已撤销]	330700	金华市（地市）		温州地区：撤销（GB/T 2260-1982）；温州地区[1980年]
-332401	金华市	浙江省	金华地区	金华市	民政部	1982年	1984年	[已撤销]	330721	金华市,金华县[已撤销]		
-332402	衢州市	浙江省	金华地区	衢州市	民政部	1982年	1984年	[已撤销]	330821	衢州市,衢县[已撤销]		
-332421	兰溪县	浙江省	金华地区	兰溪县	民政部	1980年	1984年	[已撤销]	330701	金华市,兰溪市[已撤销]		洞头县[1980年]
-332422	永康县	浙江省	金华地区	永康县	民政部	1980年	1984年	[已撤销]	330722	金华市,永康县[已撤销]		永嘉县[1980年]
-332423	武义县	浙江省	金华地区	武义县	民政部	1980年	1984年	[已撤销]	330723	金华市,武义县		瑞安县[1980年]
-332424	东阳县	浙江省	金华地区	东阳县	民政部	1980年	1984年	[已撤销]	330724	金华市,东阳县[已撤销]		文成县[1980年]
-332425	义乌县	浙江省	金华地区	义乌县	民政部	1980年	1984年	[已撤销]	330725	金华市,义乌县[已撤销]		平阳县[1980年]
-332426	浦江县	浙江省	金华地区	浦江县	民政部	1980年	1984年	[已撤销]	330726	金华市,浦江县		乐清县[1980年]
-332427	常山县	浙江省	金华地区	常山县	民政部	1980年	1984年	[已撤销]	330822	衢州市,常山县		泰顺县[1980年]
-332428	江山县	浙江省	金华地区	江山县	民政部	1982年	1984年	[已撤销]	330823	衢州市,江山县[已撤销]		
-332429	开化县	浙江省	金华地区	开化县	民政部	1982年	1984年	[已撤销]	330824	衢州市,开化县		
-332430	龙游县	浙江省	金华地区	龙游县	民政部	1983年	1984年	[已撤销]	330825	衢州市,龙游县		
-332431	磐安县	浙江省	金华地区	磐安县	民政部	1983年	1984年	[已撤销]	330727	金华市,磐安县		
-332500	丽水地区	浙江省	丽水地区	-	民政部	1980年	1999年	[已撤销]	331100	丽水市（地市）		金华地区[1981年]
-332501	丽水市	浙江省	丽水地区	丽水市	民政部	1980年	1994年	[已撤销]	332582	丽水地区,丽水市[已撤销]		金华市[1981年]
-332502	龙泉市	浙江省	丽水地区	龙泉市	民政部	1980年	1994年	[已撤销]	332581	丽水地区,龙泉市[已撤销]		衢州市[1981年]
-332521	丽水县	浙江省	丽水地区	丽水县	民政部	1980年	1985年	[已撤销]	332501	丽水地区,丽水市[已撤销]		金华县[1980年]
-332522	青田县	浙江省	丽水地区	青田县	民政部	1980年	1999年	[已撤销]	331121	丽水市,青田县		兰溪县[1981年]
-332523	云和县	浙江省	丽水地区	云和县	民政部	1980年	1999年	[已撤销]	331125	丽水市,云和县		永康县[1981年]
-332524	龙泉县	浙江省	丽水地区	龙泉县	民政部	1980年	1989年	[已撤销]	332502	丽水地区,龙泉市[已撤销]		武义县[1981年]
-332525	庆元县	浙江省	丽水地区	庆元县	民政部	1980年	1999年	[已撤销]	331126	丽水市,庆元县		东阳县[1981年]
-332526	缙云县	浙江省	丽水地区	缙云县	民政部	1980年	1999年	[已撤销]	331122	丽水市,缙云县		义乌县[1981年]
-332527	遂昌县	浙江省	丽水地区	遂昌县	民政部	1980年	1999年	[已撤销]	331123	丽水市,遂昌县		浦江县[1981年]
-332528	松阳县	浙江省	丽水地区	松阳县	民政部	1980年	1999年	[已撤销]	331124	丽水市,松阳县		衢县[1980年]
-332529	景宁畲族自治县	浙江省	丽水地区	景宁畲族自治县	民政部	1980年	1999年	[已撤销]	331127	丽水市,景宁畲族自治县		常山县[1981年]
-332530	江山县	浙江省	丽水地区	江山县	民政部	1980年	1981年	[已撤销]	332428	金华地区,江山县[已撤销]		
-332531	开化县	浙江省	丽水地区	开化县	民政部	1980年	1981年	[已撤销]	332429	金华地区,开化县[已撤销]		
-332581	龙泉市	浙江省	丽水地区	龙泉市	民政部	1995年	1999年	[已撤销]	331181	丽水市,龙泉市		
-332582	丽水市	浙江省	丽水地区	丽水市	民政部	1995年	1999年	[已撤销]	331100	丽水市（地市）		
-332600	台州地区	浙江省	台州地区	-	民政部	1980年	1993年	[已撤销]	331000	台州市（地市）		丽水地区[1981年]
-332601	椒江市	浙江省	台州地区	椒江市	民政部	1982年	1993年	[已撤销]	331002	台州市,椒江区		
-332602	临海市	浙江省	台州地区	临海市	民政部	1986年	1993年	[已撤销]	339018	省直辖县级行政区划,临海市[已撤销]		
-332603	黄岩市	浙江省	台州地区	黄岩市	民政部	1989年	1993年	[已撤销]	331003	台州市,黄岩区		
-332604	台州地区	浙江省	台州地区	温岭市	非官方							
-332621	临海县	浙江省	台州地区	临海县	民政部	1980年	1985年	[已撤销]	332602	台州地区,临海市[已撤销]		丽水县[1981年]
-332622	黄岩县	浙江省	台州地区	黄岩县	民政部	1980年	1988年	[已撤销]	332603	台州地区,黄岩市[已撤销]		青田县[1981年]
-332623	温岭县	浙江省	台州地区	温岭县	民政部	1980年	1993年	[已撤销]	339020	省直辖县级行政区划,温岭市[已撤销]		云和县[1981年]
-332624	仙居县	浙江省	台州地区	仙居县	民政部	1980年	1993年	[已撤销]	331024	台州市,仙居县		龙泉县[1981年]
-332625	天台县	浙江省	台州地区	天台县	民政部	1980年	1993年	[已撤销]	331023	台州市,天台县		庆元县[1981年]
-332626	三门县	浙江省	台州地区	三门县	民政部	1980年	1993年	[已撤销]	331022	台州市,三门县		缙云县[1981年]
-332627	玉环县	浙江省	台州地区	玉环县	民政部	1980年	1993年	[已撤销]	331021	台州市,玉环县[已撤销]		遂昌县[1981年]
-332700	舟山地区	浙江省	舟山地区	-	民政部	1980年	1986年	[已撤销]	330900	舟山市（地市）		台州地区[1981年]
-332701	椒江市	浙江省	舟山地区	椒江市	民政部	1981年	1981年	[已撤销]	332601	台州地区,椒江市[已撤销]		
-332721	定海县	浙江省	舟山地区	定海县	民政部	1980年	1986年	[已撤销]	330902	舟山市,定海区		临海县[1981年]
-332722	普陀县	浙江省	舟山地区	普陀县	民政部	1980年	1986年	[已撤销]	330903	舟山市,普陀区		黄岩县[1981年]
-332723	岱山县	浙江省	舟山地区	岱山县	民政部	1980年	1986年	[已撤销]	330921	舟山市,岱山县		温岭县[1981年]
-332724	嵊泗县	浙江省	舟山地区	嵊泗县	民政部	1980年	1986年	[已撤销]	330922	舟山市,嵊泗县		仙居县[1981年]
-332725	天台县	浙江省	舟山地区	天台县	民政部	1980年	1981年	[已撤销]	332625	台州地区,天台县[已撤销]		
-332726	三门县	浙江省	舟山地区	三门县	民政部	1980年	1981年	[已撤销]	332626	台州地区,三门县[已撤销]		
-332727	玉环县	浙江省	舟山地区	玉环县	民政部	1980年	1981年	[已撤销]	331021	台州市,玉环县[已撤销]		
-332800	舟山地区	浙江省	舟山地区	-	民政部	1980年	1981年	[已撤销]	330900	舟山市（地市）		
-332821	定海县	浙江省	舟山地区	定海县	民政部	1980年	1981年	[已撤销]	330902	舟山市,定海区		
-332822	普陀县	浙江省	舟山地区	普陀县	民政部	1980年	1981年	[已撤销]	330903	舟山市,普陀区		
-332823	岱山县	浙江省	舟山地区	岱山县	民政部	1980年	1981年	[已撤销]	332723	舟山地区,岱山县[已撤销]		
-332824	嵊泗县	浙江省	舟山地区	嵊泗县	民政部	1980年	1981年	[已撤销]	330922	舟山市,嵊泗县		
-339000	省直辖行政单位	浙江省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-339001	余姚市	浙江省	省直辖县级行政区划	余姚市	民政部	1986年	1994年	[已撤销]	330281	宁波市,余姚市		
-339002	海宁市	浙江省	省直辖县级行政区划	海宁市	民政部	1986年	1994年	[已撤销]	330481	嘉兴市,海宁市		
-339003	兰溪市	浙江省	省直辖县级行政区划	兰溪市	民政部	1986年	1994年	[已撤销]	330781	金华市,兰溪市		
-339004	瑞安市	浙江省	省直辖县级行政区划	瑞安市	民政部	1987年	1994年	[已撤销]	330381	温州市,瑞安市		
-339005	萧山市	浙江省	省直辖县级行政区划	萧山市	民政部	1987年	1994年	[已撤销]	330181	杭州市,萧山市[已撤销]		
-339006	江山市	浙江省	省直辖县级行政区划	江山市	民政部	1987年	1994年	[已撤销]	330881	衢州市,江山市		
-339007	义乌市	浙江省	省直辖县级行政区划	义乌市	民政部	1988年	1994年	[已撤销]	330782	金华市,义乌市		
-339008	东阳市	浙江省	省直辖县级行政区划	东阳市	民政部	1988年	1994年	[已撤销]	330783	金华市,东阳市		
-339009	慈溪市	浙江省	省直辖县级行政区划	慈溪市	民政部	1988年	1994年	[已撤销]	330282	宁波市,慈溪市		
-339010	奉化市	浙江省	省直辖县级行政区划	奉化市	民政部	1988年	1994年	[已撤销]	330283	宁波市,奉化市[已撤销]		
-339011	诸暨市	浙江省	省直辖县级行政区划	诸暨市	民政部	1989年	1994年	[已撤销]	330681	绍兴市,诸暨市		
-339012	平湖市	浙江省	省直辖县级行政区划	平湖市	民政部	1991年	1994年	[已撤销]	330482	嘉兴市,平湖市		
-339013	建德市	浙江省	省直辖县级行政区划	建德市	民政部	1992年	1994年	[已撤销]	330182	杭州市,建德市		
-339014	永康市	浙江省	省直辖县级行政区划	永康市	民政部	1992年	1994年	[已撤销]	330784	金华市,永康市		
-339015	上虞市	浙江省	省直辖县级行政区划	上虞市	民政部	1992年	1994年	[已撤销]	330682	绍兴市,上虞市[已撤销]		
-339016	桐乡市	浙江省	省直辖县级行政区划	桐乡市	民政部	1993年	1994年	[已撤销]	330483	嘉兴市,桐乡市		
-339017	乐清市	浙江省	省直辖县级行政区划	乐清市	民政部	1993年	1994年	[已撤销]	330382	温州市,乐清市		
-339018	临海市	浙江省	省直辖县级行政区划	临海市	民政部	1994年	1994年	[已撤销]	331082	台州市,临海市		
-339019	富阳市	浙江省	省直辖县级行政区划	富阳市	民政部	1994年	1994年	[已撤销]	330183	杭州市,富阳市[已撤销]		
-339020	温岭市	浙江省	省直辖县级行政区划	温岭市	民政部	1994年	1994年	[已撤销]	331081	台州市,温岭市		
-339021	余杭市	浙江省	省直辖县级行政区划	余杭市	民政部	1994年	1994年	[已撤销]	330184	杭州市,余杭市[已撤销]		
-340000	安徽省	安徽省	-	-	民政部	1980年	2024年					
-340100	合肥市	安徽省	合肥市	-	民政部	1980年	2024年					
-340101	市辖区	安徽省	合肥市	市辖区	国标							增设（GB/T 2260-1984）
-340102	瑶海区	安徽省	合肥市	瑶海区	民政部	1980年	2024年					东市区[2001年]
-340103	庐阳区	安徽省	合肥市	庐阳区	民政部	1980年	2024年					中市区[2001年]
-340104	蜀山区	安徽省	合肥市	蜀山区	民政部	1980年	2024年					西市区[2001年]
-340111	包河区	安徽省	合肥市	包河区	民政部	1980年	2024年					郊区[2001年]
-340120	合肥市区	安徽省	合肥市	合肥市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-340121	长丰县	安徽省	合肥市	长丰县	民政部	1980年	2024年					
-340122	肥东县	安徽省	合肥市	肥东县	民政部	1983年	2024年					
-340123	肥西县	安徽省	合肥市	肥西县	民政部	1980年	2024年					
-340124	庐江县	安徽省	合肥市	庐江县	民政部	2011年	2024年					
-340181	巢湖市	安徽省	合肥市	巢湖市	民政部	2011年	2024年					
-340200	芜湖市	安徽省	芜湖市	-	民政部	1980年	2024年					
-340201	市辖区	安徽省	芜湖市	市辖区	国标							增设（GB/T 2260-1984）
-340202	镜湖区	安徽省	芜湖市	镜湖区	民政部	1980年	2024年					
-340203	弋江区	安徽省	芜湖市	弋江区	民政部	1980年	2019年	[已撤销]	340209	芜湖市,弋江区		马塘区[2004年]
-340204	新芜区	安徽省	芜湖市	新芜区	民政部	1980年	2004年	[已撤销]	340202	芜湖市,镜湖区		
-340205	鸠江区	安徽省	芜湖市	鸠江区	民政部	1980年	2004年	[已撤销]	340207	芜湖市,鸠江区		裕溪口区[1989年]
-340206	四褐山区	安徽省	芜湖市	四褐山区	民政部	1980年	1989年	[已撤销]	340205	芜湖市,鸠江区[已撤销]		
-340207	鸠江区	安徽省	芜湖市	鸠江区	民政部	2005年	2024年					
-340208	三山区	安徽省	芜湖市	三山区	民政部	2005年	2019年	[已撤销]	340209	芜湖市,弋江区		
-340209	弋江区	安徽省	芜湖市	弋江区	民政部	2020年	2024年					
-340210	湾沚区	安徽省	芜湖市	湾沚区	民政部	2020年	2024年					
-340211	郊区	安徽省	芜湖市	郊区	民政部	1980年	1989年	[已撤销]	340205	芜湖市,鸠江区[已撤销]		
-340212	繁昌区	安徽省	芜湖市	繁昌区	民政部	2020年	2024年					
-340220	芜湖市区	安徽省	芜湖市	芜湖市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-340221	芜湖县	安徽省	芜湖市	芜湖县	民政部	1980年	2019年	[已撤销]	340210	芜湖市,湾沚区		
-340222	繁昌县	安徽省	芜湖市	繁昌县	民政部	1980年	2019年	[已撤销]	340212	芜湖市,繁昌区		
-340223	南陵县	安徽省	芜湖市	南陵县	民政部	1980年	2024年					
-340224	青阳县	安徽省	芜湖市	青阳县	民政部	1980年	1987年	[已撤销]	342923	池州地区,青阳县[已撤销]		
-340225	无为县	安徽省	芜湖市	无为县	民政部	2011年	2018年	[已撤销]	340281	芜湖市,无为市		
-340281	无为市	安徽省	芜湖市	无为市	民政部	2019年	2024年					
-340300	蚌埠市	安徽省	蚌埠市	-	民政部	1980年	2024年					
-340301	市辖区	安徽省	蚌埠市	市辖区	国标							增设（GB/T 2260-1984）
-340302	龙子湖区	安徽省	蚌埠市	龙子湖区	民政部	1980年	2024年					东市区[2003年]
-340303	蚌山区	安徽省	蚌埠市	蚌山区	民政部	1980年	2024年					中市区[2003年]
-340304	禹会区	安徽省	蚌埠市	禹会区	民政部	1980年	2024年					西市区[2003年]
-340311	淮上区	安徽省	蚌埠市	淮上区	民政部	1980年	2024年					郊区[2003年]
-340321	怀远县	安徽省	蚌埠市	怀远县	民政部	1983年	2024年					
-340322	五河县	安徽省	蚌埠市	五河县	民政部	1983年	2024年					
-340323	固镇县	安徽省	蚌埠市	固镇县	民政部	1983年	2024年					
-340400	淮南市	安徽省	淮南市	-	民政部	1980年	2024年					
-340401	市辖区	安徽省	淮南市	市辖区	国标							增设（GB/T 2260-1984）
-340402	大通区	安徽省	淮南市	大通区	民政部	1980年	2024年					
-340403	田家庵区	安徽省	淮南市	田家庵区	民政部	1980年	2024年					
-340404	谢家集区	安徽省	淮南市	谢家集区	民政部	1980年	2024年					
-340405	八公山区	安徽省	淮南市	八公山区	民政部	1980年	2024年					
-340406	潘集区	安徽省	淮南市	潘集区	民政部	1980年	2024年					
-340420	淮南市区	安徽省	淮南市	淮南市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-340421	凤台县	安徽省	淮南市	凤台县	民政部	1980年	2024年					
-340422	寿县	安徽省	淮南市	寿县	民政部	2015年	2024年					
-340500	马鞍山市	安徽省	马鞍山市	-	民政部	1980年	2024年					
-340501	市辖区	安徽省	马鞍山市	市辖区	国标							增设（GB/T 2260-1984）
-340502	金家庄区	安徽省	马鞍山市	金家庄区	民政部	1980年	2011年	[已撤销]	340503	马鞍山市,花山区		
-340503	花山区	安徽省	马鞍山市	花山区	民政部	1980年	2024年					
-340504	雨山区	安徽省	马鞍山市	雨山区	民政部	1980年	2024年					
-340505	向山区	安徽省	马鞍山市	向山区	民政部	1980年	2000年	[已撤销]	340502,340503,340504	马鞍山市,金家庄区[已撤销],花山区,雨山区		
-340506	博望区	安徽省	马鞍山市	博望区	民政部	2012年	2024年					
-340511	郊区	安徽省	马鞍山市	郊区	民政部	1983年	1983年	[已撤销]	340505	马鞍山市,向山区[已撤销]		
-340521	当涂县	安徽省	马鞍山市	当涂县	民政部	1980年	2024年					
-340522	含山县	安徽省	马鞍山市	含山县	民政部	2011年	2024年					
-340523	和县	安徽省	马鞍山市	和县	民政部	2011年	2024年					
-340600	淮北市	安徽省	淮北市	-	民政部	1980年	2024年					
-340601	市辖区	安徽省	淮北市	市辖区	国标							增设（GB/T 2260-1984）
-340602	杜集区	安徽省	淮北市	杜集区	民政部	1980年	2024年					
-340603	相山区	安徽省	淮北市	相山区	民政部	1980年	2024年					
-340604	烈山区	安徽省	淮北市	烈山区	民政部	1980年	2024年					
-340611	郊区	安徽省	淮北市	郊区	民政部	1980年	1983年	[已撤销]	340603,340604,340602	淮北市,相山区,烈山区,杜集区		
-340620	淮北市区	安徽省	淮北市	淮北市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-340621	濉溪县	安徽省	淮北市	濉溪县	民政部	1980年	2024年					
-340700	铜陵市	安徽省	铜陵市	-	民政部	1980年	2024年					
-340701	市辖区	安徽省	铜陵市	市辖区	国标							增设（GB/T 2260-1984）
-340702	铜官山区	安徽省	铜陵市	铜官山区	民政部	1980年	2014年	[已撤销]	340705	铜陵市,铜官区		
-340703	狮子山区	安徽省	铜陵市	狮子山区	民政部	1980年	2014年	[已撤销]	340705	铜陵市,铜官区		
-340704	铜山区	安徽省	铜陵市	铜山区	民政部	1980年	1986年	[已撤销]	340711	铜陵市,郊区		
-340705	铜官区	安徽省	铜陵市	铜官区	民政部	2015年	2024年					
-340706	义安区	安徽省	铜陵市	义安区	民政部	2015年	2024年					
-340711	郊区	安徽省	铜陵市	郊区	民政部	1980年	2024年					
-340720	铜陵市区	安徽省	铜陵市	铜陵市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-340721	铜陵县	安徽省	铜陵市	铜陵县	民政部	1980年	2014年	[已撤销]	340706	铜陵市,义安区		
-340722	枞阳县	安徽省	铜陵市	枞阳县	民政部	2015年	2024年					
-340800	安庆市	安徽省	安庆市	-	民政部	1980年	2024年					
-340801	市辖区	安徽省	安庆市	市辖区	国标							增设（GB/T 2260-1984）
-340802	迎江区	安徽省	安庆市	迎江区	民政部	1980年	2024年					
-340803	大观区	安徽省	安庆市	大观区	民政部	1980年	2024年					
-340804	郊区	安徽省	安庆市	郊区	国标							增设（GB-T 2260-1984）
-340811	宜秀区	安徽省	安庆市	宜秀区	民政部	1980年	2024年					郊区[2004年]
-340821	桐城县	安徽省	安庆市	桐城县	民政部	1988年	1995年	[已撤销]	340881	安庆市,桐城市		
-340822	怀宁县	安徽省	安庆市	怀宁县	民政部	1988年	2024年					
-340823	枞阳县	安徽省	安庆市	枞阳县	民政部	1988年	2014年	[已撤销]	340722	铜陵市,枞阳县		
-340824	潜山县	安徽省	安庆市	潜山县	民政部	1988年	2017年	[已撤销]	340882	安庆市,潜山市		
-340825	太湖县	安徽省	安庆市	太湖县	民政部	1988年	2024年					
-340826	宿松县	安徽省	安庆市	宿松县	民政部	1988年	2024年					
-340827	望江县	安徽省	安庆市	望江县	民政部	1988年	2024年					
-340828	岳西县	安徽省	安庆市	岳西县	民政部	1988年	2024年					
-340829		安徽省	安庆市		非官方						1954年	
-340881	桐城市	安徽省	安庆市	桐城市	民政部	1996年	2024年					
-340882	潜山市	安徽省	安庆市	潜山市	民政部	2018年	2024年					
-340900	直辖行政单位	安徽省	直辖行政单位	-	国标			[已撤销]				撤销（GB/T 2260-1988）
-340901	黄山市	安徽省	直辖	黄山市	民政部	1983年	1986年	[已撤销]	341003	黄山市,黄山区		
-341000	黄山市	安徽省	黄山市	-	民政部	1987年	2024年					
-341001	市辖区	安徽省	黄山市	市辖区	国标							
-341002	屯溪区	安徽省	黄山市	屯溪区	民政部	1987年	2024年					
-341003	黄山区	安徽省	黄山市	黄山区	民政部	1987年	2024年					
-341004	徽州区	安徽省	黄山市	徽州区	民政部	1987年	2024年					
-341021	歙县	安徽省	黄山市	歙县	民政部	1987年	2024年					
-341022	休宁县	安徽省	黄山市	休宁县	民政部	1987年	2024年					
-341023	黟县	安徽省	黄山市	黟县	民政部	1987年	2024年					
-341024	祁门县	安徽省	黄山市	祁门县	民政部	1987年	2024年					
-341100	滁州市	安徽省	滁州市	-	民政部	1992年	2024年					
-341101	市辖区	安徽省	滁州市	市辖区	国标							
-341102	琅琊区	安徽省	滁州市	琅琊区	民政部	1992年	2024年					
-341103	南谯区	安徽省	滁州市	南谯区	民政部	1992年	2024年					
-341121	天长县	安徽省	滁州市	天长县	民政部	1992年	1992年	[已撤销]	349001	省直辖县级行政区划,天长市[已撤销]		
-341122	来安县	安徽省	滁州市	来安县	民政部	1992年	2024年					
-341123	滁州市	安徽省	滁州市	滁县	非官方							
-341124	全椒县	安徽省	滁州市	全椒县	民政部	1992年	2024年					
-341125	定远县	安徽省	滁州市	定远县	民政部	1992年	2024年					
-341126	凤阳县	安徽省	滁州市	凤阳县	民政部	1992年	2024年					
-341127	嘉山县	安徽省	滁州市	嘉山县	民政部	1992年	1993年	[已撤销]	341182	滁州市,明光市		
-341181	天长市	安徽省	滁州市	天长市	民政部	1995年	2024年					
-341182	明光市	安徽省	滁州市	明光市	民政部	1995年	2024年					
-341200	阜阳市	安徽省	阜阳市	-	民政部	1996年	2024年					
-341201	市辖区	安徽省	阜阳市	市辖区	国标							
-341202	颍州区	安徽省	阜阳市	颍州区	民政部	1996年	2024年					
-341203	颍东区	安徽省	阜阳市	颍东区	民政部	1996年	2024年					
-341204	颍泉区	安徽省	阜阳市	颍泉区	民政部	1996年	2024年					
-341221	临泉县	安徽省	阜阳市	临泉县	民政部	1996年	2024年					
-341222	太和县	安徽省	阜阳市	太和县	民政部	1996年	2024年					
-341223	涡阳县	安徽省	阜阳市	涡阳县	民政部	1996年	1999年	[已撤销]	341621	亳州市,涡阳县		
-341224	蒙城县	安徽省	阜阳市	蒙城县	民政部	1996年	1999年	[已撤销]	341622	亳州市,蒙城县		
-341225	阜南县	安徽省	阜阳市	阜南县	民政部	1996年	2024年					
-341226	颍上县	安徽省	阜阳市	颍上县	民政部	1996年	2024年					
-341227	利辛县	安徽省	阜阳市	利辛县	民政部	1996年	1999年	[已撤销]	341623	亳州市,利辛县		
-341281	亳州市	安徽省	阜阳市	亳州市	民政部	1996年	1999年	[已撤销]	341600	亳州市（地市）		
-341282	界首市	安徽省	阜阳市	界首市	民政部	1996年	2024年					
-341300	宿州市	安徽省	宿州市	-	民政部	1998年	2024年					
-341301	市辖区	安徽省	宿州市	市辖区	国标							
-341302	埇桥区	安徽省	宿州市	埇桥区	民政部	1998年	2024年					
-341321	砀山县	安徽省	宿州市	砀山县	民政部	1998年	2024年					
-341322	萧县	安徽省	宿州市	萧县	民政部	1998年	2024年					
-341323	灵璧县	安徽省	宿州市	灵璧县	民政部	1998年	2024年					
-341324	泗县	安徽省	宿州市	泗县	民政部	1998年	2024年					
-341400	巢湖市	安徽省	巢湖市	-	民政部	1999年	2010年	[已撤销]	340181	合肥市,巢湖市		
-341401	市辖区	安徽省	巢湖市	市辖区	国标							
-341402	居巢区	安徽省	巢湖市	居巢区	民政部	1999年	2010年	[已撤销]	340181	合肥市,巢湖市		
-341421	庐江县	安徽省	巢湖市	庐江县	民政部	1999年	2010年	[已撤销]	340124	合肥市,庐江县		
-341422	无为县	安徽省	巢湖市	无为县	民政部	1999年	2010年	[已撤销]	340225	芜湖市,无为县[已撤销]		
-341423	含山县	安徽省	巢湖市	含山县	民政部	1999年	2010年	[已撤销]	340522	马鞍山市,含山县		
-341424	和县	安徽省	巢湖市	和县	民政部	1999年	2010年	[已撤销]	340523	马鞍山市,和县		
-341500	六安市	安徽省	六安市	-	民政部	1999年	2024年					
-341501	市辖区	安徽省	六安市	市辖区	国标							
-341502	金安区	安徽省	六安市	金安区	民政部	1999年	2024年					
-341503	裕安区	安徽省	六安市	裕安区	民政部	1999年	2024年					
-341504	叶集区	安徽省	六安市	叶集区	民政部	2015年	2024年					
-341521	寿县	安徽省	六安市	寿县	民政部	1999年	2014年	[已撤销]	340422	淮南市,寿县		
-341522	霍邱县	安徽省	六安市	霍邱县	民政部	1999年	2024年					
-341523	舒城县	安徽省	六安市	舒城县	民政部	1999年	2024年					
-341524	金寨县	安徽省	六安市	金寨县	民政部	1999年	2024年					
-341525	霍山县	安徽省	六安市	霍山县	民政部	1999年	2024年					
-341600	亳州市	安徽省	亳州市	-	民政部	2000年	2024年					
-341601	市辖区	安徽省	亳州市	市辖区	国标							
-341602	谯城区	安徽省	亳州市	谯城区	民政部	2000年	2024年					
-341621	涡阳县	安徽省	亳州市	涡阳县	民政部	2000年	2024年					
-341622	蒙城县	安徽省	亳州市	蒙城县	民政部	2000年	2024年					
-341623	利辛县	安徽省	亳州市	利辛县	民政部	2000年	2024年					
-341700	池州市	安徽省	池州市	-	民政部	2000年	2024年					
-341701	市辖区	安徽省	池州市	市辖区	国标							
-341702	贵池区	安徽省	池州市	贵池区	民政部	2000年	2024年					
-341721	东至县	安徽省	池州市	东至县	民政部	2000年	2024年					
-341722	石台县	安徽省	池州市	石台县	民政部	2000年	2024年					旧称：石台县(石埭县)；
-341723	青阳县	安徽省	池州市	青阳县	民政部	2000年	2024年					
-341800	宣城市	安徽省	宣城市	-	民政部	2000年	2024年					
-341801	市辖区	安徽省	宣城市	市辖区	国标							
-341802	宣州区	安徽省	宣城市	宣州区	民政部	2000年	2024年					
-341821	郎溪县	安徽省	宣城市	郎溪县	民政部	2000年	2024年					
-341822	广德县	安徽省	宣城市	广德县	民政部	2000年	2018年	[已撤销]	341882	宣城市,广德市		
-341823	泾县	安徽省	宣城市	泾县	民政部	2000年	2024年					
-341824	绩溪县	安徽省	宣城市	绩溪县	民政部	2000年	2024年					
-341825	旌德县	安徽省	宣城市	旌德县	民政部	2000年	2024年					
-341881	宁国市	安徽省	宣城市	宁国市	民政部	2000年	2024年					
-341882	广德市	安徽省	宣城市	广德市	民政部	2019年	2024年					
-342100	阜阳地区	安徽省	阜阳地区	-	民政部	1980年	1995年	[已撤销]	341200	阜阳市（地市）		
-342101	阜阳市	安徽省	阜阳地区	阜阳市	民政部	1980年	1995年	[已撤销]	341200	阜阳市（地市）		
-342102	亳州市	安徽省	阜阳地区	亳州市	民政部	1986年	1995年	[已撤销]	341281	阜阳市,亳州市[已撤销]		
-342103	界首市	安徽省	阜阳地区	界首市	民政部	1989年	1995年	[已撤销]	341282	阜阳市,界首市		
-342121	阜阳县	安徽省	阜阳地区	阜阳县	民政部	1980年	1991年	[已撤销]	342101	阜阳地区,阜阳市[已撤销]		
-342122	临泉县	安徽省	阜阳地区	临泉县	民政部	1980年	1995年	[已撤销]	341221	阜阳市,临泉县		
-342123	太和县	安徽省	阜阳地区	太和县	民政部	1980年	1995年	[已撤销]	341222	阜阳市,太和县		
-342124	涡阳县	安徽省	阜阳地区	涡阳县	民政部	1980年	1995年	[已撤销]	341223	阜阳市,涡阳县[已撤销]		
-342125	蒙城县	安徽省	阜阳地区	蒙城县	民政部	1980年	1995年	[已撤销]	341224	阜阳市,蒙城县[已撤销]		
-342126	亳县	安徽省	阜阳地区	亳县	民政部	1980年	1985年	[已撤销]	342102	阜阳地区,亳州市[已撤销]		
-342127	阜南县	安徽省	阜阳地区	阜南县	民政部	1980年	1995年	[已撤销]	341225	阜阳市,阜南县		
-342128	颍上县	安徽省	阜阳地区	颍上县	民政部	1980年	1995年	[已撤销]	341226	阜阳市,颍上县		
-342129	界首县	安徽省	阜阳地区	界首县	民政部	1980年	1988年	[已撤销]	342103	阜阳地区,界首市[已撤销]		
-342130	利辛县	安徽省	阜阳地区	利辛县	民政部	1980年	1995年	[已撤销]	341227	阜阳市,利辛县[已撤销]		
-342200	宿县地区	安徽省	宿县地区	-	民政部	1980年	1997年	[已撤销]	341300	宿州市（地市）		
-342201	宿州市	安徽省	宿县地区	宿州市	民政部	1980年	1997年	[已撤销]	341300	宿州市（地市）		
-342221	砀山县	安徽省	宿县地区	砀山县	民政部	1980年	1997年	[已撤销]	341321	宿州市,砀山县		
-342222	萧县	安徽省	宿县地区	萧县	民政部	1980年	1997年	[已撤销]	341322	宿州市,萧县		
-342223	宿县	安徽省	宿县地区	宿县	民政部	1980年	1991年	[已撤销]	342201	宿县地区,宿州市[已撤销]		
-342224	灵璧县	安徽省	宿县地区	灵璧县	民政部	1980年	1997年	[已撤销]	341323	宿州市,灵璧县		
-342225	泗县	安徽省	宿县地区	泗县	民政部	1980年	1997年	[已撤销]	341324	宿州市,泗县		
-342226	怀远县	安徽省	宿县地区	怀远县	民政部	1980年	1982年	[已撤销]	340321	蚌埠市,怀远县		
-342227	五河县	安徽省	宿县地区	五河县	民政部	1980年	1982年	[已撤销]	340322	蚌埠市,五河县		
-342228	固镇县	安徽省	宿县地区	固镇县	民政部	1980年	1982年	[已撤销]	340323	蚌埠市,固镇县		
-342300	滁县地区	安徽省	滁县地区	-	民政部	1980年	1991年	[已撤销]	341100	滁州市（地市）		
-342301	滁州市	安徽省	滁县地区	滁州市	民政部	1982年	1991年	[已撤销]	341100	滁州市（地市）		
-342321	天长县	安徽省	滁县地区	天长县	民政部	1980年	1991年	[已撤销]	341121	滁州市,天长县[已撤销]		
-342322	来安县	安徽省	滁县地区	来安县	民政部	1980年	1991年	[已撤销]	341122	滁州市,来安县		
-342323	滁县	安徽省	滁县地区	滁县	民政部	1980年	1981年	[已撤销]	342301	滁县地区,滁州市[已撤销]		
-342324	全椒县	安徽省	滁县地区	全椒县	民政部	1980年	1991年	[已撤销]	341124	滁州市,全椒县		
-342325	定远县	安徽省	滁县地区	定远县	民政部	1980年	1991年	[已撤销]	341125	滁州市,定远县		
-342326	凤阳县	安徽省	滁县地区	凤阳县	民政部	1980年	1991年	[已撤销]	341126	滁州市,凤阳县		
-342327	嘉山县	安徽省	滁县地区	嘉山县	民政部	1980年	1991年	[已撤销]	341127	滁州市,嘉山县[已撤销]		
-342400	六安地区	安徽省	六安地区	-	民政部	1980年	1998年	[已撤销]	341500	六安市（地市）		
-342401	六安市	安徽省	六安地区	六安市	民政部	1980年	1998年	[已撤销]	341500	六安市（地市）		
-342421	六安县	安徽省	六安地区	六安县	民政部	1980年	1991年	[已撤销]	342401	六安地区,六安市[已撤销]		
-342422	寿县	安徽省	六安地区	寿县	民政部	1980年	1998年	[已撤销]	341521	六安市,寿县[已撤销]		
-342423	霍邱县	安徽省	六安地区	霍邱县	民政部	1980年	1998年	[已撤销]	341522	六安市,霍邱县		
-342424	肥西县	安徽省	六安地区	肥西县	民政部	1982年	1982年	[已撤销]	340123	合肥市,肥西县		
-342425	舒城县	安徽省	六安地区	舒城县	民政部	1980年	1998年	[已撤销]	341523	六安市,舒城县		
-342426	金寨县	安徽省	六安地区	金寨县	民政部	1980年	1998年	[已撤销]	341524	六安市,金寨县		
-342427	霍山县	安徽省	六安地区	霍山县	民政部	1980年	1998年	[已撤销]	341525	六安市,霍山县		
-342500	宣城地区	安徽省	宣城地区	-	民政部	1980年	1999年	[已撤销]	341800	宣城市（地市）		
-342501	宣城市	安徽省	宣城地区	宣城市	民政部	1987年	1999年	[已撤销]	341800	宣城市（地市）		
-342502	宁国市	安徽省	宣城地区	宁国市	民政部	1997年	1999年	[已撤销]	341881	宣城市,宁国市		
-342521	宣城县	安徽省	宣城地区	宣城县	民政部	1980年	1986年	[已撤销]	342501	宣城地区,宣城市[已撤销]		
-342522	郎溪县	安徽省	宣城地区	郎溪县	民政部	1980年	1999年	[已撤销]	341821	宣城市,郎溪县		
-342523	广德县	安徽省	宣城地区	广德县	民政部	1980年	1999年	[已撤销]	341822	宣城市,广德县[已撤销]		
-342524	宁国县	安徽省	宣城地区	宁国县	民政部	1980年	1996年	[已撤销]	342502	宣城地区,宁国市[已撤销]		
-342525	当涂县	安徽省	宣城地区	当涂县	民政部	1982年	1982年	[已撤销]	340521	马鞍山市,当涂县		
-342526	繁昌县	安徽省	宣城地区	繁昌县	民政部	1982年	1982年	[已撤销]	340222	芜湖市,繁昌县[已撤销]		
-342527	南陵县	安徽省	宣城地区	南陵县	民政部	1982年	1982年	[已撤销]	340223	芜湖市,南陵县		
-342528	青阳县	安徽省	宣城地区	青阳县	民政部	1982年	1982年	[已撤销]	342923	池州地区,青阳县[已撤销]		
-342529	泾县	安徽省	宣城地区	泾县	民政部	1980年	1999年	[已撤销]	341823	宣城市,泾县		
-342530	旌德县	安徽省	宣城地区	旌德县	民政部	1987年	1999年	[已撤销]	341825	宣城市,旌德县		
-342531	绩溪县	安徽省	宣城地区	绩溪县	民政部	1987年	1999年	[已撤销]	341824	宣城市,绩溪县		
-342600	巢湖地区	安徽省	巢湖地区	-	民政部	1980年	1998年	[已撤销]	341400	巢湖市（地市）[已撤销]		
-342601	巢湖市	安徽省	巢湖地区	巢湖市	民政部	1982年	1998年	[已撤销]	341400	巢湖市（地市）[已撤销]		
-342621	肥东县	安徽省	巢湖地区	肥东县	民政部	1980年	1982年	[已撤销]	340122	合肥市,肥东县		
-342622	庐江县	安徽省	巢湖地区	庐江县	民政部	1980年	1998年	[已撤销]	341421	巢湖市,庐江县[已撤销]		
-342623	无为县	安徽省	巢湖地区	无为县	民政部	1980年	1998年	[已撤销]	341422	巢湖市,无为县[已撤销]		
-342624	巢县	安徽省	巢湖地区	巢县	民政部	1980年	1982年	[已撤销]	342601	巢湖地区,巢湖市[已撤销]		
-342625	含山县	安徽省	巢湖地区	含山县	民政部	1980年	1998年	[已撤销]	341423	巢湖市,含山县[已撤销]		
-342626	和县	安徽省	巢湖地区	和县	民政部	1980年	1998年	[已撤销]	341424	巢湖市,和县[已撤销]		
-342700	徽州地区	安徽省	徽州地区	-	民政部	1980年	1986年	[已撤销]	341000	黄山市（地市）		
-342701	屯溪市	安徽省	徽州地区	屯溪市	民政部	1980年	1986年	[已撤销]	341002	黄山市,屯溪区		
-342721	绩溪县	安徽省	徽州地区	绩溪县	民政部	1980年	1986年	[已撤销]	342531	宣城地区,绩溪县[已撤销]		
-342722	旌德县	安徽省	徽州地区	旌德县	民政部	1980年	1986年	[已撤销]	342530	宣城地区,旌德县[已撤销]		
-342723	歙县	安徽省	徽州地区	歙县	民政部	1980年	1986年	[已撤销]	341021	黄山市,歙县		
-342724	休宁县	安徽省	徽州地区	休宁县	民政部	1980年	1986年	[已撤销]	341022	黄山市,休宁县		
-342725	黟县	安徽省	徽州地区	黟县	民政部	1980年	1986年	[已撤销]	341023	黄山市,黟县		
-342726	祁门县	安徽省	徽州地区	祁门县	民政部	1980年	1986年	[已撤销]	341024	黄山市,祁门县		
-342727	太平县	安徽省	徽州地区	太平县	民政部	1980年	1982年	[已撤销]	341003	黄山市,黄山区		
-342728	石台县	安徽省	徽州地区	石台县	民政部	1980年	1986年	[已撤销]	342831	安庆地区,石台县[已撤销]		旧称：石台县(石埭县)；
-342800	安庆地区	安徽省	安庆地区	-	民政部	1980年	1987年	[已撤销]	340800	安庆市（地市）		
-342821	怀宁县	安徽省	安庆地区	怀宁县	民政部	1980年	1987年	[已撤销]	340822	安庆市,怀宁县		
-342822	桐城县	安徽省	安庆地区	桐城县	民政部	1980年	1987年	[已撤销]	340821	安庆市,桐城县[已撤销]		
-342823	枞阳县	安徽省	安庆地区	枞阳县	民政部	1980年	1987年	[已撤销]	340823	安庆市,枞阳县[已撤销]		
-342824	潜山县	安徽省	安庆地区	潜山县	民政部	1980年	1987年	[已撤销]	340824	安庆市,潜山县[已撤销]		
-342825	太湖县	安徽省	安庆地区	太湖县	民政部	1980年	1987年	[已撤销]	340825	安庆市,太湖县		
-342826	宿松县	安徽省	安庆地区	宿松县	民政部	1980年	1987年	[已撤销]	340826	安庆市,宿松县		
-342827	望江县	安徽省	安庆地区	望江县	民政部	1980年	1987年	[已撤销]	340827	安庆市,望江县		
-342828	岳西县	安徽省	安庆地区	岳西县	民政部	1980年	1987年	[已撤销]	340828	安庆市,岳西县		
-342829	东至县	安徽省	安庆地区	东至县	民政部	1980年	1987年	[已撤销]	342921	池州地区,东至县[已撤销]		
-342830	贵池县	安徽省	安庆地区	贵池县	民政部	1980年	1987年	[已撤销]	342901	池州地区,贵池市[已撤销]		
-342831	石台县	安徽省	安庆地区	石台县	民政部	1987年	1987年	[已撤销]	342922	池州地区,石台县[已撤销]		
-342900	池州地区	安徽省	池州地区	-	民政部	1988年	1999年	[已撤销]	341700	池州市（地市）		
-342901	贵池市	安徽省	池州地区	贵池市	民政部	1988年	1999年	[已撤销]	341702	池州市,贵池区		
-342921	东至县	安徽省	池州地区	东至县	民政部	1988年	1999年	[已撤销]	341721	池州市,东至县		
-342922	石台县	安徽省	池州地区	石台县	民政部	1988年	1999年	[已撤销]	341722	池州市,石台县		旧称：石台县(石埭县)；
-342923	青阳县	安徽省	池州地区	青阳县	民政部	1988年	1999年	[已撤销]	341723	池州市,青阳县		
-342931	石台县	安徽省	池州地区	石台县	非官方							旧称：石台县(石埭县)；
-349000	省直辖行政单位	安徽省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-349001	天长市	安徽省	省直辖县级行政区划	天长市	民政部	1993年	1994年	[已撤销]	341181	滁州市,天长市		
-349002	明光市	安徽省	省直辖县级行政区划	明光市	民政部	1994年	1994年	[已撤销]	341182	滁州市,明光市		
-350000	福建省	福建省	-	-	民政部	1980年	2024年					
-350100	福州市	福建省	福州市	-	民政部	1980年	2024年					
-350101	市辖区	福建省	福州市	市辖区	国标							增设（GB/T 2260-1984）
-350102	鼓楼区	福建省	福州市	鼓楼区	民政部	1980年	2024年					
-350103	台江区	福建省	福州市	台江区	民政部	1980年	2024年					
-350104	仓山区	福建省	福州市	仓山区	民政部	1980年	2024年					
-350105	马尾区	福建省	福州市	马尾区	民政部	1980年	2024年					
-350111	晋安区	福建省	福州市	晋安区	民政部	1980年	2024年					郊区[1994年]
-350112	长乐区	福建省	福州市	长乐区	民政部	2017年	2024年					
-350120	福州市区	福建省	福州市	福州市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-350121	闽侯县	福建省	福州市	闽侯县	民政部	1980年	2024年					
-350122	连江县	福建省	福州市	连江县	民政部	1983年	2024年					
-350123	罗源县	福建省	福州市	罗源县	民政部	1983年	2024年					
-350124	闽清县	福建省	福州市	闽清县	民政部	1983年	2024年					
-350125	永泰县	福建省	福州市	永泰县	民政部	1983年	2024年					
-350126	长乐县	福建省	福州市	长乐县	民政部	1983年	1993年	[已撤销]	359011	省直辖县级行政区划,长乐市[已撤销]		
-350127	福清县	福建省	福州市	福清县	民政部	1983年	1989年	[已撤销]	359003	省直辖县级行政区划,福清市[已撤销]		
-350128	平潭县	福建省	福州市	平潭县	民政部	1983年	2024年					
-350181	福清市	福建省	福州市	福清市	民政部	1995年	2024年					
-350182	长乐市	福建省	福州市	长乐市	民政部	1995年	2016年	[已撤销]	350112	福州市,长乐区		
-350200	厦门市	福建省	厦门市	-	民政部	1980年	2024年					
-350201	市辖区	福建省	厦门市	市辖区	国标							增设（GB/T 2260-1984）
-350202	鼓浪屿区	福建省	厦门市	鼓浪屿区	民政部	1980年	2002年	[已撤销]	350203	厦门市,思明区		
-350203	思明区	福建省	厦门市	思明区	民政部	1980年	2024年					
-350204	开元区	福建省	厦门市	开元区	民政部	1980年	2002年	[已撤销]	350203	厦门市,思明区		
-350205	海沧区	福建省	厦门市	海沧区	民政部	1980年	2024年					杏林区[2002年]
-350206	湖里区	福建省	厦门市	湖里区	民政部	1987年	2024年					
-350211	集美区	福建省	厦门市	集美区	民政部	1980年	2024年					郊区[1986年]
-350212	同安区	福建省	厦门市	同安区	民政部	1996年	2024年					
-350213	翔安区	福建省	厦门市	翔安区	民政部	2003年	2024年					
-350220	厦门市区	福建省	厦门市	厦门市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-350221	同安县	福建省	厦门市	同安县	民政部	1980年	1995年	[已撤销]	350212	厦门市,同安区		
-350300	莆田市	福建省	莆田市	-	民政部	1983年	2024年					
-350301	市辖区	福建省	莆田市	市辖区	国标						1986-1997年	增设（GB/T 2260-1984）
-350302	城厢区	福建省	莆田市	城厢区	民政部	1983年	2024年					
-350303	涵江区	福建省	莆田市	涵江区	民政部	1983年	2024年					
-350304	荔城区	福建省	莆田市	荔城区	民政部	2002年	2024年					
-350305	秀屿区	福建省	莆田市	秀屿区	民政部	2002年	2024年					
-350321	莆田县	福建省	莆田市	莆田县	民政部	1983年	2001年	[已撤销]	350302,350303,350304,350305	莆田市,城厢区,涵江区,荔城区,秀屿区		
-350322	仙游县	福建省	莆田市	仙游县	民政部	1983年	2024年					
-350400	三明市	福建省	三明市	-	民政部	1983年	2024年					
-350401	市辖区	福建省	三明市	市辖区	国标							增设（GB/T 2260-1984）
-350402	梅列区	福建省	三明市	梅列区	民政部	1983年	2020年	[已撤销]	350404	三明市,三元区		
-350403	三元区	福建省	三明市	三元区	民政部	1983年	2020年	[已撤销]	350404	三明市,三元区		
-350404	三元区	福建省	三明市	三元区	民政部	2021年	2024年					
-350405	沙县区	福建省	三明市	沙县区	民政部	2021年	2024年					
-350420	永安市	福建省	三明市	永安市	民政部	1985年	1985年	[已撤销]	359001	省直辖县级行政区划,永安市[已撤销]		
-350421	明溪县	福建省	三明市	明溪县	民政部	1983年	2024年					
-350422	永安县	福建省	三明市	永安县	民政部	1983年	1983年	[已撤销]	350501	泉州市,永安市[已撤销]		
-350423	清流县	福建省	三明市	清流县	民政部	1983年	2024年					
-350424	宁化县	福建省	三明市	宁化县	民政部	1983年	2024年					
-350425	大田县	福建省	三明市	大田县	民政部	1983年	2024年					
-350426	尤溪县	福建省	三明市	尤溪县	民政部	1983年	2024年					
-350427	沙县	福建省	三明市	沙县	民政部	1983年	2020年	[已撤销]	350405	三明市,沙县区		
-350428	将乐县	福建省	三明市	将乐县	民政部	1983年	2024年					
-350429	泰宁县	福建省	三明市	泰宁县	民政部	1983年	2024年					
-350430	建宁县	福建省	三明市	建宁县	民政部	1983年	2024年					
-350481	永安市	福建省	三明市	永安市	民政部	1995年	2024年					
-350500	泉州市	福建省	泉州市	-	民政部	1985年	2024年					
-350501	永安市	福建省	泉州市	永安市	民政部	1984年	1984年	[已撤销]	350420	三明市,永安市[已撤销]		
-350502	鲤城区	福建省	泉州市	鲤城区	民政部	1985年	2024年					
-350503	丰泽区	福建省	泉州市	丰泽区	民政部	1997年	2024年					
-350504	洛江区	福建省	泉州市	洛江区	民政部	1997年	2024年					
-350505	泉港区	福建省	泉州市	泉港区	民政部	2000年	2024年					
-350521	惠安县	福建省	泉州市	惠安县	民政部	1985年	2024年					
-350522	晋江县	福建省	泉州市	晋江县	民政部	1985年	1991年	[已撤销]	359004	省直辖县级行政区划,晋江市[已撤销]		
-350523	南安县	福建省	泉州市	南安县	民政部	1985年	1992年	[已撤销]	359005	省直辖县级行政区划,南安市[已撤销]		
-350524	安溪县	福建省	泉州市	安溪县	民政部	1985年	2024年					
-350525	永春县	福建省	泉州市	永春县	民政部	1985年	2024年					
-350526	德化县	福建省	泉州市	德化县	民政部	1985年	2024年					
-350527	金门县	福建省	泉州市	金门县	民政部	1985年	2024年					
-350581	石狮市	福建省	泉州市	石狮市	民政部	1995年	2024年					
-350582	晋江市	福建省	泉州市	晋江市	民政部	1995年	2024年					
-350583	南安市	福建省	泉州市	南安市	民政部	1995年	2024年					
-350600	漳州市	福建省	漳州市	-	民政部	1985年	2024年					
-350601	市辖区	福建省	漳州市	市辖区	国标							
-350602	芗城区	福建省	漳州市	芗城区	民政部	1985年	2024年					
-350603	龙文区	福建省	漳州市	龙文区	民政部	1996年	2024年					
-350604	龙海区	福建省	漳州市	龙海区	民政部	2021年	2024年					
-350605	长泰区	福建省	漳州市	长泰区	民政部	2021年	2024年					
-350621	龙海县	福建省	漳州市	龙海县	民政部	1985年	1992年	[已撤销]	359006	省直辖县级行政区划,龙海市[已撤销]		
-350622	云霄县	福建省	漳州市	云霄县	民政部	1985年	2024年					
-350623	漳浦县	福建省	漳州市	漳浦县	民政部	1985年	2024年					
-350624	诏安县	福建省	漳州市	诏安县	民政部	1985年	2024年					
-350625	长泰县	福建省	漳州市	长泰县	民政部	1985年	2020年	[已撤销]	350605	漳州市,长泰区		
-350626	东山县	福建省	漳州市	东山县	民政部	1985年	2024年					
-350627	南靖县	福建省	漳州市	南靖县	民政部	1985年	2024年					
-350628	平和县	福建省	漳州市	平和县	民政部	1985年	2024年					
-350629	华安县	福建省	漳州市	华安县	民政部	1985年	2024年					
-350681	龙海市	福建省	漳州市	龙海市	民政部	1995年	2020年	[已撤销]	350604	漳州市,龙海区		
-350700	南平市	福建省	南平市	-	民政部	1994年	2024年					
-350701	市辖区	福建省	南平市	市辖区	国标							
-350702	延平区	福建省	南平市	延平区	民政部	1994年	2024年					
-350703	建阳区	福建省	南平市	建阳区	民政部	2014年	2024年					
-350721	顺昌县	福建省	南平市	顺昌县	民政部	1994年	2024年					
-350722	浦城县	福建省	南平市	浦城县	民政部	1994年	2024年					
-350723	光泽县	福建省	南平市	光泽县	民政部	1994年	2024年					
-350724	松溪县	福建省	南平市	松溪县	民政部	1994年	2024年					
-350725	政和县	福建省	南平市	政和县	民政部	1994年	2024年					
-350781	邵武市	福建省	南平市	邵武市	民政部	1995年	2024年					
-350782	武夷山市	福建省	南平市	武夷山市	民政部	1995年	2024年					
-350783	建瓯市	福建省	南平市	建瓯市	民政部	1995年	2024年					
-350784	建阳市	福建省	南平市	建阳市	民政部	1995年	2013年	[已撤销]	350703	南平市,建阳区		
-350800	龙岩市	福建省	龙岩市	-	民政部	1996年	2024年					
-350801	市辖区	福建省	龙岩市	市辖区	国标							
-350802	新罗区	福建省	龙岩市	新罗区	民政部	1996年	2024年					
-350803	永定区	福建省	龙岩市	永定区	民政部	2014年	2024年					
-350821	长汀县	福建省	龙岩市	长汀县	民政部	1996年	2024年					
-350822	永定县	福建省	龙岩市	永定县	民政部	1996年	2013年	[已撤销]	350803	龙岩市,永定区		
-350823	上杭县	福建省	龙岩市	上杭县	民政部	1996年	2024年					
-350824	武平县	福建省	龙岩市	武平县	民政部	1996年	2024年					
-350825	连城县	福建省	龙岩市	连城县	民政部	1996年	2024年					
-350881	漳平市	福建省	龙岩市	漳平市	民政部	1996年	2024年					
-350900	宁德市	福建省	宁德市	-	民政部	1999年	2024年					
-350901	市辖区	福建省	宁德市	市辖区	国标							
-350902	蕉城区	福建省	宁德市	蕉城区	民政部	1999年	2024年					
-350921	霞浦县	福建省	宁德市	霞浦县	民政部	1999年	2024年					
-350922	古田县	福建省	宁德市	古田县	民政部	1999年	2024年					
-350923	屏南县	福建省	宁德市	屏南县	民政部	1999年	2024年					
-350924	寿宁县	福建省	宁德市	寿宁县	民政部	1999年	2024年					
-350925	周宁县	福建省	宁德市	周宁县	民政部	1999年	2024年					
-350926	柘荣县	福建省	宁德市	柘荣县	民政部	1999年	2024年					
-350981	福安市	福建省	宁德市	福安市	民政部	1999年	2024年					
-350982	福鼎市	福建省	宁德市	福鼎市	民政部	1999年	2024年					
-352100	南平地区	福建省	南平地区	-	民政部	1982年	1993年	[已撤销]	350700	南平市（地市）		建阳地区[1987年]
-352101	南平市	福建省	南平地区	南平市	民政部	1982年	1993年	[已撤销]	350700	南平市（地市）		
-352102	邵武市	福建省	南平地区	邵武市	民政部	1983年	1993年	[已撤销]	359007	省直辖县级行政区划,邵武市[已撤销]		
-352103	武夷山市	福建省	南平地区	武夷山市	民政部	1989年	1993年	[已撤销]	359008	省直辖县级行政区划,武夷山市[已撤销]		
-352104	建瓯市	福建省	南平地区	建瓯市	民政部	1992年	1993年	[已撤销]	359009	省直辖县级行政区划,建瓯市[已撤销]		
-352105	南平地区	福建省	南平地区	建阳市	非官方							
-352121	顺昌县	福建省	南平地区	顺昌县	民政部	1982年	1993年	[已撤销]	350721	南平市,顺昌县		
-352122	建阳县	福建省	南平地区	建阳县	民政部	1982年	1993年	[已撤销]	359010	省直辖县级行政区划,建阳市[已撤销]		
-352123	建瓯县	福建省	南平地区	建瓯县	民政部	1982年	1991年	[已撤销]	352104	南平地区,建瓯市[已撤销]		
-352124	浦城县	福建省	南平地区	浦城县	民政部	1982年	1993年	[已撤销]	350722	南平市,浦城县		
-352125	邵武县	福建省	南平地区	邵武县	民政部	1982年	1982年	[已撤销]	350781	南平市,邵武市		
-352126	崇安县	福建省	南平地区	崇安县	民政部	1982年	1988年	[已撤销]	352103	南平地区,武夷山市[已撤销]		
-352127	光泽县	福建省	南平地区	光泽县	民政部	1982年	1993年	[已撤销]	350723	南平市,光泽县		
-352128	松溪县	福建省	南平地区	松溪县	民政部	1982年	1993年	[已撤销]	350724	南平市,松溪县		
-352129	政和县	福建省	南平地区	政和县	民政部	1982年	1993年	[已撤销]	350725	南平市,政和县		
-352200	宁德地区	福建省	宁德地区	-	民政部	1980年	1998年	[已撤销]	350900	宁德市（地市）		建阳地区[1981年]
-352201	宁德市	福建省	宁德地区	宁德市	民政部	1980年	1998年	[已撤销]	350900	宁德市（地市）		南平市[1981年]
-352202	福安市	福建省	宁德地区	福安市	民政部	1989年	1998年	[已撤销]	350981	宁德市,福安市		
-352203	福鼎市	福建省	宁德地区	福鼎市	民政部	1995年	1998年	[已撤销]	350982	宁德市,福鼎市		
-352221	宁德县	福建省	宁德地区	宁德县	民政部	1980年	1987年	[已撤销]	352201	宁德地区,宁德市[已撤销]		顺昌县[1981年]
-352222	连江县	福建省	宁德地区	连江县	民政部	1980年	1982年	[已撤销]	350122	福州市,连江县		建阳县[1981年]
-352223	罗源县	福建省	宁德地区	罗源县	民政部	1980年	1982年	[已撤销]	350123	福州市,罗源县		建瓯县[1981年]
-352224	福鼎县	福建省	宁德地区	福鼎县	民政部	1980年	1994年	[已撤销]	352203	宁德地区,福鼎市[已撤销]		浦城县[1981年]
-352225	霞浦县	福建省	宁德地区	霞浦县	民政部	1980年	1998年	[已撤销]	350921	宁德市,霞浦县		邵武县[1981年]
-352226	福安县	福建省	宁德地区	福安县	民政部	1980年	1988年	[已撤销]	352202	宁德地区,福安市[已撤销]		崇安县[1981年]
-352227	古田县	福建省	宁德地区	古田县	民政部	1980年	1998年	[已撤销]	350922	宁德市,古田县		光泽县[1981年]
-352228	屏南县	福建省	宁德地区	屏南县	民政部	1980年	1998年	[已撤销]	350923	宁德市,屏南县		松溪县[1981年]
-352229	寿宁县	福建省	宁德地区	寿宁县	民政部	1980年	1998年	[已撤销]	350924	宁德市,寿宁县		政和县[1981年]
-352230	周宁县	福建省	宁德地区	周宁县	民政部	1982年	1998年	[已撤销]	350925	宁德市,周宁县		
-352231	柘荣县	福建省	宁德地区	柘荣县	民政部	1982年	1998年	[已撤销]	350926	宁德市,柘荣县		
-352300	莆田地区	福建省	莆田地区	-	民政部	1980年	1982年	[已撤销]	350300	莆田市（地市）		宁德地区[1981年]
-352321	闽清县	福建省	莆田地区	闽清县	民政部	1980年	1982年	[已撤销]	350124	福州市,闽清县		宁德县[1981年]
-352322	永泰县	福建省	莆田地区	永泰县	民政部	1980年	1982年	[已撤销]	350125	福州市,永泰县		连江县[1981年]
-352323	长乐县	福建省	莆田地区	长乐县	民政部	1980年	1982年	[已撤销]	350126	福州市,长乐县[已撤销]		罗源县[1981年]
-352324	福清县	福建省	莆田地区	福清县	民政部	1980年	1982年	[已撤销]	350127	福州市,福清县[已撤销]		福鼎县[1981年]
-352325	平潭县	福建省	莆田地区	平潭县	民政部	1980年	1982年	[已撤销]	350128	福州市,平潭县		霞浦县[1981年]
-352326	莆田县	福建省	莆田地区	莆田县	民政部	1980年	1982年	[已撤销]	350321	莆田市,莆田县[已撤销]		福安县[1981年]
-352327	仙游县	福建省	莆田地区	仙游县	民政部	1980年	1982年	[已撤销]	350322	莆田市,仙游县		古田县[1981年]
-352328	屏南县	福建省	莆田地区	屏南县	民政部	1980年	1981年	[已撤销]	352228	宁德地区,屏南县[已撤销]		
-352329	寿宁县	福建省	莆田地区	寿宁县	民政部	1980年	1981年	[已撤销]	352229	宁德地区,寿宁县[已撤销]		
-352330	周宁县	福建省	莆田地区	周宁县	民政部	1980年	1981年	[已撤销]	352230	宁德地区,周宁县[已撤销]		
-352331	柘荣县	福建省	莆田地区	柘荣县	民政部	1980年	1981年	[已撤销]	352231	宁德地区,柘荣县[已撤销]		
-352400	晋江地区	福建省	晋江地区	-	民政部	1980年	1984年	[已撤销]	350500	泉州市（地市）		莆田地区[1981年]
-352401	泉州市	福建省	晋江地区	泉州市	民政部	1982年	1984年	[已撤销]	350500	泉州市（地市）		
-352421	惠安县	福建省	晋江地区	惠安县	民政部	1980年	1984年	[已撤销]	350521	泉州市,惠安县		闽清县[1981年]
-352422	晋江县	福建省	晋江地区	晋江县	民政部	1980年	1984年	[已撤销]	350522	泉州市,晋江县[已撤销]		永泰县[1981年]
-352423	南安县	福建省	晋江地区	南安县	民政部	1980年	1984年	[已撤销]	350523	泉州市,南安县[已撤销]		长乐县[1981年]
-352424	安溪县	福建省	晋江地区	安溪县	民政部	1980年	1984年	[已撤销]	350524	泉州市,安溪县		福清县[1981年]
-352425	永春县	福建省	晋江地区	永春县	民政部	1980年	1984年	[已撤销]	350525	泉州市,永春县		平潭县[1981年]
-352426	德化县	福建省	晋江地区	德化县	民政部	1980年	1984年	[已撤销]	350526	泉州市,德化县		莆田县[1981年]
-352427	金门县	福建省	晋江地区	金门县	民政部	1980年	1984年	[已撤销]	350527	泉州市,金门县		仙游县[1981年]
-352500	龙溪地区	福建省	龙溪地区	-	民政部	1980年	1984年	[已撤销]	350600	漳州市（地市）		晋江地区[1981年]
-352501	漳州市	福建省	龙溪地区	漳州市	民政部	1980年	1984年	[已撤销]	350600	漳州市（地市）		泉州市[1981年]
-352521	龙海县	福建省	龙溪地区	龙海县	民政部	1980年	1984年	[已撤销]	350621	漳州市,龙海县[已撤销]		惠安县[1981年]
-352522	云霄县	福建省	龙溪地区	云霄县	民政部	1980年	1984年	[已撤销]	350622	漳州市,云霄县		晋江县[1981年]
-352523	漳浦县	福建省	龙溪地区	漳浦县	民政部	1980年	1984年	[已撤销]	350623	漳州市,漳浦县		南安县[1981年]
-352524	诏安县	福建省	龙溪地区	诏安县	民政部	1980年	1984年	[已撤销]	350624	漳州市,诏安县		安溪县[1981年]
-352525	长泰县	福建省	龙溪地区	长泰县	民政部	1980年	1984年	[已撤销]	350625	漳州市,长泰县[已撤销]		永春县[1981年]
-352526	东山县	福建省	龙溪地区	东山县	民政部	1980年	1984年	[已撤销]	350626	漳州市,东山县		德化县[1981年]
-352527	南靖县	福建省	龙溪地区	南靖县	民政部	1980年	1984年	[已撤销]	350627	漳州市,南靖县		金门县[1981年]
-352528	平和县	福建省	龙溪地区	平和县	民政部	1982年	1984年	[已撤销]	350628	漳州市,平和县		
-352529	华安县	福建省	龙溪地区	华安县	民政部	1982年	1984年	[已撤销]	350629	漳州市,华安县		
-352600	龙岩地区	福建省	龙岩地区	-	民政部	1980年	1995年	[已撤销]	350800	龙岩市（地市）		龙溪地区[1981年]
-352601	龙岩市	福建省	龙岩地区	龙岩市	民政部	1980年	1995年	[已撤销]	350800	龙岩市（地市）		漳州市[1981年]
-352602	漳平市	福建省	龙岩地区	漳平市	民政部	1990年	1995年	[已撤销]	350881	龙岩市,漳平市		
-352621	龙海县	福建省	龙岩地区	龙海县	民政部	1980年	1981年	[已撤销]	350621	漳州市,龙海县[已撤销]		
-352622	长汀县	福建省	龙岩地区	长汀县	民政部	1980年	1995年	[已撤销]	350821	龙岩市,长汀县		云霄县[1981年]
-352623	永定县	福建省	龙岩地区	永定县	民政部	1980年	1995年	[已撤销]	350822	龙岩市,永定县[已撤销]		漳浦县[1981年]
-352624	上杭县	福建省	龙岩地区	上杭县	民政部	1980年	1995年	[已撤销]	350823	龙岩市,上杭县		诏安县[1981年]
-352625	武平县	福建省	龙岩地区	武平县	民政部	1980年	1995年	[已撤销]	350824	龙岩市,武平县		长泰县[1981年]
-352626	漳平县	福建省	龙岩地区	漳平县	民政部	1980年	1989年	[已撤销]	352602	龙岩地区,漳平市[已撤销]		东山县[1981年]
-352627	连城县	福建省	龙岩地区	连城县	民政部	1980年	1995年	[已撤销]	350825	龙岩市,连城县		南靖县[1981年]
-352628	平和县	福建省	龙岩地区	平和县	民政部	1980年	1981年	[已撤销]	352528	龙溪地区,平和县[已撤销]		
-352629	华安县	福建省	龙岩地区	华安县	民政部	1980年	1981年	[已撤销]	352529	龙溪地区,华安县[已撤销]		
-352700	三明地区	福建省	三明地区	-	民政部	1980年	1982年	[已撤销]	350400	三明市（地市）		龙岩地区[1981年]
-352701	三明市	福建省	三明地区	三明市	民政部	1981年	1982年	[已撤销]	350400	福建省,三明市		龙岩市[1981年]
-352721	明溪县	福建省	三明地区	明溪县	民政部	1980年	1982年	[已撤销]	350421	三明市,明溪县		龙岩县[1980年]
-352722	永安县	福建省	三明地区	永安县	民政部	1980年	1982年	[已撤销]	350422	三明市,永安县[已撤销]		长汀县[1981年]
-352723	清流县	福建省	三明地区	清流县	民政部	1980年	1982年	[已撤销]	350423	三明市,清流县		永定县[1981年]
-352724	宁化县	福建省	三明地区	宁化县	民政部	1980年	1982年	[已撤销]	350424	三明市,宁化县		上杭县[1981年]
-352725	大田县	福建省	三明地区	大田县	民政部	1980年	1982年	[已撤销]	350425	三明市,大田县		武平县[1981年]
-352726	尤溪县	福建省	三明地区	尤溪县	民政部	1980年	1982年	[已撤销]	350426	三明市,尤溪县		漳平县[1981年]
-352727	沙县	福建省	三明地区	沙县	民政部	1980年	1982年	[已撤销]	350427	三明市,沙县[已撤销]		连城县[1981年]
-352728	将乐县	福建省	三明地区	将乐县	民政部	1982年	1982年	[已撤销]	350428	三明市,将乐县		
-352729	泰宁县	福建省	三明地区	泰宁县	民政部	1982年	1982年	[已撤销]	350429	三明市,泰宁县		
-352730	建宁县	福建省	三明地区	建宁县	民政部	1982年	1982年	[已撤销]	350430	三明市,建宁县		
-352800	三明地区	福建省	三明地区	-	民政部	1980年	1981年	[已撤销]	350400	三明市（地市）		
-352801	三明市	福建省	三明地区	三明市	民政部	1980年	1981年	[已撤销]	350400	福建省,三明市		三明市
-352821	明溪县	福建省	三明地区	明溪县	民政部	1980年	1981年	[已撤销]	350421	三明市,明溪县		
-352822	永安县	福建省	三明地区	永安县	民政部	1980年	1981年	[已撤销]	350422	三明市,永安县[已撤销]		
-352823	清流县	福建省	三明地区	清流县	民政部	1980年	1981年	[已撤销]	350423	三明市,清流县		
-352824	宁化县	福建省	三明地区	宁化县	民政部	1980年	1981年	[已撤销]	350424	三明市,宁化县		
-352825	大田县	福建省	三明地区	大田县	民政部	1980年	1981年	[已撤销]	350425	三明市,大田县		
-352826	尤溪县	福建省	三明地区	尤溪县	民政部	1980年	1981年	[已撤销]	350426	三明市,尤溪县		
-352827	沙县	福建省	三明地区	沙县	民政部	1980年	1981年	[已撤销]	350427	三明市,沙县[已撤销]		
-352828	将乐县	福建省	三明地区	将乐县	民政部	1980年	1981年	[已撤销]	352728	三明地区,将乐县[已撤销]		
-352829	泰宁县	福建省	三明地区	泰宁县	民政部	1980年	1981年	[已撤销]	352729	三明地区,泰宁县[已撤销]		
-352830	建宁县	福建省	三明地区	建宁县	民政部	1980年	1981年	[已撤销]	352730	三明地区,建宁县[已撤销]		
-359000	省直辖县	福建省	省直辖县级行政区划	-	非官方							
-359001	永安市	福建省	省直辖县级行政区划	永安市	民政部	1986年	1994年	[已撤销]	350481	三明市,永安市		
-359002	石狮市	福建省	省直辖县级行政区划	石狮市	民政部	1987年	1994年	[已撤销]	350581	泉州市,石狮市		
-359003	福清市	福建省	省直辖县级行政区划	福清市	民政部	1990年	1994年	[已撤销]	350181	福州市,福清市		
-359004	晋江市	福建省	省直辖县级行政区划	晋江市	民政部	1992年	1994年	[已撤销]	350582	泉州市,晋江市		
-359005	南安市	福建省	省直辖县级行政区划	南安市	民政部	1993年	1994年	[已撤销]	350583	泉州市,南安市		
-359006	龙海市	福建省	省直辖县级行政区划	龙海市	民政部	1993年	1994年	[已撤销]	350681	漳州市,龙海市[已撤销]		
-359007	邵武市	福建省	省直辖县级行政区划	邵武市	民政部	1994年	1994年	[已撤销]	350781	南平市,邵武市		
-359008	武夷山市	福建省	省直辖县级行政区划	武夷山市	民政部	1994年	1994年	[已撤销]	350782	南平市,武夷山市		
-359009	建瓯市	福建省	省直辖县级行政区划	建瓯市	民政部	1994年	1994年	[已撤销]	350783	南平市,建瓯市		
-359010	建阳市	福建省	省直辖县级行政区划	建阳市	民政部	1994年	1994年	[已撤销]	350784	南平市,建阳市[已撤销]		
-359011	长乐市	福建省	省直辖县级行政区划	长乐市	民政部	1994年	1994年	[已撤销]	350182	福州市,长乐市[已撤销]		
-360000	江西省	江西省	-	-	民政部	1980年	2024年					
-360100	南昌市	江西省	南昌市	-	民政部	1980年	2024年					
-360101	市辖区	江西省	南昌市	市辖区	国标							增设（GB/T 2260-1984）
-360102	东湖区	江西省	南昌市	东湖区	民政部	1980年	2024年					
-360103	西湖区	江西省	南昌市	西湖区	民政部	1980年	2024年					
-360104	青云谱区	江西省	南昌市	青云谱区	民政部	1980年	2024年					
-360105	湾里区	江西省	南昌市	湾里区	民政部	1980年	2018年	[已撤销]	360112	南昌市,新建区		
-360111	青山湖区	江西省	南昌市	青山湖区	民政部	1980年	2024年					郊区[2001年]
-360112	新建区	江西省	南昌市	新建区	民政部	2015年	2024年					
-360113	红谷滩区	江西省	南昌市	红谷滩区	民政部	2019年	2024年					
-360120	南昌市	江西省	南昌市	市区	非官方							
-360121	南昌县	江西省	南昌市	南昌县	民政部	1980年	2024年					新建县[1981年]
-360122	新建县	江西省	南昌市	新建县	民政部	1980年	2014年	[已撤销]	360112	南昌市,新建区		南昌县[1981年]
-360123	安义县	江西省	南昌市	安义县	民政部	1983年	2024年					
-360124	进贤县	江西省	南昌市	进贤县	民政部	1983年	2024年					
-360200	景德镇市	江西省	景德镇市	-	民政部	1980年	2024年					
-360201	市辖区	江西省	景德镇市	市辖区	国标							增设（GB/T 2260-1984）
-360202	昌江区	江西省	景德镇市	昌江区	民政部	1980年	2024年					
-360203	珠山区	江西省	景德镇市	珠山区	民政部	1980年	2024年					
-360211	鹅湖区	江西省	景德镇市	鹅湖区	民政部	1980年	1987年	[已撤销]	360222	景德镇市,浮梁县		
-360212	蛟潭区	江西省	景德镇市	蛟潭区	民政部	1980年	1987年	[已撤销]	360222	景德镇市,浮梁县		
-360221	乐平县	江西省	景德镇市	乐平县	民政部	1983年	1991年	[已撤销]	369002	省直辖县级行政区划,乐平市[已撤销]		
-360222	浮梁县	江西省	景德镇市	浮梁县	民政部	1988年	2024年					
-360281	乐平市	江西省	景德镇市	乐平市	民政部	1995年	2024年					
-360300	萍乡市	江西省	萍乡市	-	民政部	1980年	2024年					
-360301	市辖区	江西省	萍乡市	市辖区	国标							增设（GB/T 2260-1984）
-360302	安源区	江西省	萍乡市	安源区	民政部	1980年	2024年					城关区[1992年]
-360311	上栗区	江西省	萍乡市	上栗区	民政部	1980年	1996年	[已撤销]	360322	萍乡市,上栗县		
-360312	芦溪区	江西省	萍乡市	芦溪区	民政部	1980年	1996年	[已撤销]	360323	萍乡市,芦溪县		
-360313	湘东区	江西省	萍乡市	湘东区	民政部	1980年	2024年					
-360321	莲花县	江西省	萍乡市	莲花县	民政部	1992年	2024年					
-360322	上栗县	江西省	萍乡市	上栗县	民政部	1997年	2024年					
-360323	芦溪县	江西省	萍乡市	芦溪县	民政部	1997年	2024年					
-360400	九江市	江西省	九江市	-	民政部	1980年	2024年					
-360401	市辖区	江西省	九江市	市辖区	国标							增设（GB/T 2260-1984）
-360402	濂溪区	江西省	九江市	濂溪区	民政部	1980年	2024年					庐山区[2015年]
-360403	浔阳区	江西省	九江市	浔阳区	民政部	1980年	2024年					
-360404	柴桑区	江西省	九江市	柴桑区	民政部	2017年	2024年					
-360411	郊区	江西省	九江市	郊区	民政部	1980年	1983年	[已撤销]	360402	九江市,濂溪区		
-360421	九江县	江西省	九江市	九江县	民政部	1983年	2016年	[已撤销]	360404	九江市,柴桑区		
-360422	瑞昌县	江西省	九江市	瑞昌县	民政部	1983年	1988年	[已撤销]	369001	省直辖县级行政区划,瑞昌市[已撤销]		
-360423	武宁县	江西省	九江市	武宁县	民政部	1983年	2024年					
-360424	修水县	江西省	九江市	修水县	民政部	1983年	2024年					
-360425	永修县	江西省	九江市	永修县	民政部	1983年	2024年					
-360426	德安县	江西省	九江市	德安县	民政部	1983年	2024年					
-360427	星子县	江西省	九江市	星子县	民政部	1983年	2015年	[已撤销]	360483	九江市,庐山市		
-360428	都昌县	江西省	九江市	都昌县	民政部	1983年	2024年					
-360429	湖口县	江西省	九江市	湖口县	民政部	1983年	2024年					
-360430	彭泽县	江西省	九江市	彭泽县	民政部	1983年	2024年					
-360481	瑞昌市	江西省	九江市	瑞昌市	民政部	1995年	2024年					
-360482	共青城市	江西省	九江市	共青城市	民政部	2010年	2024年					
-360483	庐山市	江西省	九江市	庐山市	民政部	2016年	2024年					
-360500	新余市	江西省	新余市	-	民政部	1983年	2024年					旧称：新余市(新渝市)；直辖行政单位：撤销（GB/T 2260-1982）
-360501	市辖区	江西省	新余市	市辖区	国标							增设（GB/T 2260-1984）
-360502	渝水区	江西省	新余市	渝水区	民政部	1983年	2024年					
-360521	分宜县	江西省	新余市	分宜县	民政部	1980年	2024年					井冈山[1980年]
-360600	鹰潭市	江西省	鹰潭市	-	民政部	1983年	2024年					
-360601	市辖区	江西省	鹰潭市	市辖区	国标							增设（GB/T 2260-1984）
-360602	月湖区	江西省	鹰潭市	月湖区	民政部	1983年	2024年					
-360603	余江区	江西省	鹰潭市	余江区	民政部	2018年	2024年					
-360621	贵溪县	江西省	鹰潭市	贵溪县	民政部	1983年	1995年	[已撤销]	360681	鹰潭市,贵溪市		
-360622	余江县	江西省	鹰潭市	余江县	民政部	1983年	2017年	[已撤销]	360603	鹰潭市,余江区		
-360681	贵溪市	江西省	鹰潭市	贵溪市	民政部	1996年	2024年					
-360700	赣州市	江西省	赣州市	-	民政部	1998年	2024年					
-360701	市辖区	江西省	赣州市	市辖区	国标							
-360702	章贡区	江西省	赣州市	章贡区	民政部	1998年	2024年					
-360703	南康区	江西省	赣州市	南康区	民政部	2013年	2024年					
-360704	赣县区	江西省	赣州市	赣县区	民政部	2016年	2024年					
-360721	赣县	江西省	赣州市	赣县	民政部	1998年	2015年	[已撤销]	360704	赣州市,赣县区		
-360722	信丰县	江西省	赣州市	信丰县	民政部	1998年	2024年					
-360723	大余县	江西省	赣州市	大余县	民政部	1998年	2024年					旧称：大余县(大庾县)；
-360724	上犹县	江西省	赣州市	上犹县	民政部	1998年	2024年					
-360725	崇义县	江西省	赣州市	崇义县	民政部	1998年	2024年					
-360726	安远县	江西省	赣州市	安远县	民政部	1998年	2024年					
-360727	龙南县	江西省	赣州市	龙南县	民政部	1998年	2019年	[已撤销]	360783	赣州市,龙南市		
-360728	定南县	江西省	赣州市	定南县	民政部	1998年	2024年					
-360729	全南县	江西省	赣州市	全南县	民政部	1998年	2024年					旧称：全南县(虔南县)；
-360730	宁都县	江西省	赣州市	宁都县	民政部	1998年	2024年					
-360731	于都县	江西省	赣州市	于都县	民政部	1998年	2024年					旧称：于都县(雩都县)；
-360732	兴国县	江西省	赣州市	兴国县	民政部	1998年	2024年					
-360733	会昌县	江西省	赣州市	会昌县	民政部	1998年	2024年					
-360734	寻乌县	江西省	赣州市	寻乌县	民政部	1998年	2024年					旧称：寻乌县(寻邬县)；
-360735	石城县	江西省	赣州市	石城县	民政部	1998年	2024年					
-360781	瑞金市	江西省	赣州市	瑞金市	民政部	1998年	2024年					
-360782	南康市	江西省	赣州市	南康市	民政部	1998年	2012年	[已撤销]	360703	赣州市,南康区		
-360783	龙南市	江西省	赣州市	龙南市	民政部	2020年	2024年					
-360800	吉安市	江西省	吉安市	-	民政部	2000年	2024年					
-360801	市辖区	江西省	吉安市	市辖区	国标							
-360802	吉州区	江西省	吉安市	吉州区	民政部	2000年	2024年					
-360803	青原区	江西省	吉安市	青原区	民政部	2000年	2024年					
-360821	吉安县	江西省	吉安市	吉安县	民政部	2000年	2024年					
-360822	吉水县	江西省	吉安市	吉水县	民政部	2000年	2024年					
-360823	峡江县	江西省	吉安市	峡江县	民政部	2000年	2024年					
-360824	新干县	江西省	吉安市	新干县	民政部	2000年	2024年					旧称：新干县(新淦县)；
-360825	永丰县	江西省	吉安市	永丰县	民政部	2000年	2024年					
-360826	泰和县	江西省	吉安市	泰和县	民政部	2000年	2024年					
-360827	遂川县	江西省	吉安市	遂川县	民政部	2000年	2024年					
-360828	万安县	江西省	吉安市	万安县	民政部	2000年	2024年					
-360829	安福县	江西省	吉安市	安福县	民政部	2000年	2024年					
-360830	永新县	江西省	吉安市	永新县	民政部	2000年	2024年					
-360881	井冈山市	江西省	吉安市	井冈山市	民政部	2000年	2024年					
-360900	宜春市	江西省	宜春市	-	民政部	2000年	2024年					
-360901	市辖区	江西省	宜春市	市辖区	国标							
-360902	袁州区	江西省	宜春市	袁州区	民政部	2000年	2024年					
-360921	奉新县	江西省	宜春市	奉新县	民政部	2000年	2024年					
-360922	万载县	江西省	宜春市	万载县	民政部	2000年	2024年					
-360923	上高县	江西省	宜春市	上高县	民政部	2000年	2024年					
-360924	宜丰县	江西省	宜春市	宜丰县	民政部	2000年	2024年					
-360925	靖安县	江西省	宜春市	靖安县	民政部	2000年	2024年					
-360926	铜鼓县	江西省	宜春市	铜鼓县	民政部	2000年	2024年					
-360981	丰城市	江西省	宜春市	丰城市	民政部	2000年	2024年					
-360982	樟树市	江西省	宜春市	樟树市	民政部	2000年	2024年					
-360983	高安市	江西省	宜春市	高安市	民政部	2000年	2024年					
-361000	抚州市	江西省	抚州市	-	民政部	2000年	2024年					
-361001	市辖区	江西省	抚州市	市辖区	国标							
-361002	临川区	江西省	抚州市	临川区	民政部	2000年	2024年					
-361003	东乡区	江西省	抚州市	东乡区	民政部	2016年	2024年					
-361021	南城县	江西省	抚州市	南城县	民政部	2000年	2024年					
-361022	黎川县	江西省	抚州市	黎川县	民政部	2000年	2024年					
-361023	南丰县	江西省	抚州市	南丰县	民政部	2000年	2024年					
-361024	崇仁县	江西省	抚州市	崇仁县	民政部	2000年	2024年					
-361025	乐安县	江西省	抚州市	乐安县	民政部	2000年	2024年					
-361026	宜黄县	江西省	抚州市	宜黄县	民政部	2000年	2024年					
-361027	金溪县	江西省	抚州市	金溪县	民政部	2000年	2024年					
-361028	资溪县	江西省	抚州市	资溪县	民政部	2000年	2024年					
-361029	东乡县	江西省	抚州市	东乡县	民政部	2000年	2015年	[已撤销]	361003	抚州市,东乡区		
-361030	广昌县	江西省	抚州市	广昌县	民政部	2000年	2024年					
-361100	上饶市	江西省	上饶市	-	民政部	2000年	2024年					
-361101	市辖区	江西省	上饶市	市辖区	国标							
-361102	信州区	江西省	上饶市	信州区	民政部	2000年	2024年					
-361103	广丰区	江西省	上饶市	广丰区	民政部	2015年	2024年					
-361104	广信区	江西省	上饶市	广信区	民政部	2019年	2024年					
-361121	上饶县	江西省	上饶市	上饶县	民政部	2000年	2018年	[已撤销]	361104	上饶市,广信区		
-361122	广丰县	江西省	上饶市	广丰县	民政部	2000年	2014年	[已撤销]	361103	上饶市,广丰区		
-361123	玉山县	江西省	上饶市	玉山县	民政部	2000年	2024年					
-361124	铅山县	江西省	上饶市	铅山县	民政部	2000年	2024年					
-361125	横峰县	江西省	上饶市	横峰县	民政部	2000年	2024年					
-361126	弋阳县	江西省	上饶市	弋阳县	民政部	2000年	2024年					
-361127	余干县	江西省	上饶市	余干县	民政部	2000年	2024年					
-361128	鄱阳县	江西省	上饶市	鄱阳县	民政部	2000年	2024年					波阳县[2002年]
-361129	万年县	江西省	上饶市	万年县	民政部	2000年	2024年					
-361130	婺源县	江西省	上饶市	婺源县	民政部	2000年	2024年					
-361181	德兴市	江西省	上饶市	德兴市	民政部	2000年	2024年					
-362100	赣州地区	江西省	赣州地区	-	民政部	1980年	1997年	[已撤销]	360700	赣州市（地市）		九江地区[1981年]
-362101	赣州市	江西省	赣州地区	赣州市	民政部	1982年	1997年	[已撤销]	360700	赣州市（地市）		
-362102	瑞金市	江西省	赣州地区	瑞金市	民政部	1994年	1997年	[已撤销]	360781	赣州市,瑞金市		
-362103	南康市	江西省	赣州地区	南康市	民政部	1995年	1997年	[已撤销]	360782	赣州市,南康市[已撤销]		
-362121	赣县	江西省	赣州地区	赣县	民政部	1980年	1997年	[已撤销]	360721	赣州市,赣县[已撤销]		九江县[1981年]
-362122	南康县	江西省	赣州地区	南康县	民政部	1980年	1994年	[已撤销]	362103	赣州地区,南康市[已撤销]		永修县[1981年]
-362123	信丰县	江西省	赣州地区	信丰县	民政部	1980年	1997年	[已撤销]	360722	赣州市,信丰县		彭泽县[1981年]
-362124	大余县	江西省	赣州地区	大余县	民政部	1980年	1997年	[已撤销]	360723	赣州市,大余县		旧称：大余县(大庾县)；德安县[1981年]
-362125	上犹县	江西省	赣州地区	上犹县	民政部	1980年	1997年	[已撤销]	360724	赣州市,上犹县		湖口县[1981年]
-362126	崇义县	江西省	赣州地区	崇义县	民政部	1980年	1997年	[已撤销]	360725	赣州市,崇义县		瑞昌县[1981年]
-362127	安远县	江西省	赣州地区	安远县	民政部	1980年	1997年	[已撤销]	360726	赣州市,安远县		都昌县[1981年]
-362128	龙南县	江西省	赣州地区	龙南县	民政部	1980年	1997年	[已撤销]	360727	赣州市,龙南县[已撤销]		武宁县[1981年]
-362129	定南县	江西省	赣州地区	定南县	民政部	1980年	1997年	[已撤销]	360728	赣州市,定南县		星子县[1981年]
-362130	全南县	江西省	赣州地区	全南县	民政部	1980年	1997年	[已撤销]	360729	赣州市,全南县		旧称：全南县(虔南县)；修水县[1981年]
-362131	宁都县	江西省	赣州地区	宁都县	民政部	1982年	1997年	[已撤销]	360730	赣州市,宁都县		
-362132	于都县	江西省	赣州地区	于都县	民政部	1982年	1997年	[已撤销]	360731	赣州市,于都县		旧称：于都县(雩都县)；
-362133	兴国县	江西省	赣州地区	兴国县	民政部	1982年	1997年	[已撤销]	360732	赣州市,兴国县		
-362134	瑞金县	江西省	赣州地区	瑞金县	民政部	1982年	1993年	[已撤销]	362102	赣州地区,瑞金市[已撤销]		
-362135	会昌县	江西省	赣州地区	会昌县	民政部	1982年	1997年	[已撤销]	360733	赣州市,会昌县		
-362136	寻乌县	江西省	赣州地区	寻乌县	民政部	1982年	1997年	[已撤销]	360734	赣州市,寻乌县		旧称：寻乌县(寻邬县)；
-362137	石城县	江西省	赣州地区	石城县	民政部	1982年	1997年	[已撤销]	360735	赣州市,石城县		
-362138	广昌县	江西省	赣州地区	广昌县	民政部	1982年	1982年	[已撤销]	362532	抚州地区,广昌县[已撤销]		安福县[1981年]
-362200	宜春地区	江西省	宜春地区	-	民政部	1980年	1999年	[已撤销]	360900	宜春市（地市）		上饶地区[1981年]
-362201	宜春市	江西省	宜春地区	宜春市	民政部	1980年	1999年	[已撤销]	360900	宜春市（地市）		上饶市[1981年]
-362202	丰城市	江西省	宜春地区	丰城市	民政部	1980年	1999年	[已撤销]	360981	宜春市,丰城市		鹰潭市[1981年]
-362203	樟树市	江西省	宜春地区	樟树市	民政部	1988年	1999年	[已撤销]	360982	宜春市,樟树市		
-362204	高安市	江西省	宜春地区	高安市	民政部	1993年	1999年	[已撤销]	360983	宜春市,高安市		
-362221	丰城县	江西省	宜春地区	丰城县	民政部	1980年	1987年	[已撤销]	362202	宜春地区,丰城市[已撤销]		上饶县[1981年]
-362222	高安县	江西省	宜春地区	高安县	民政部	1980年	1992年	[已撤销]	362204	宜春地区,高安市[已撤销]		贵溪县[1981年]
-362223	清江县	江西省	宜春地区	清江县	民政部	1980年	1987年	[已撤销]	362203	宜春地区,樟树市[已撤销]		婺源县[1981年]
-362224	新余县	江西省	宜春地区	新余县	民政部	1980年	1982年	[已撤销]	360500	新余市（地市）		旧称：新余县(新渝县/新喻县)；余江县[1981年]
-362225	宜春县	江西省	宜春地区	宜春县	民政部	1980年	1984年	[已撤销]	362201	宜春地区,宜春市[已撤销]		德兴县[1981年]
-362226	奉新县	江西省	宜春地区	奉新县	民政部	1980年	1999年	[已撤销]	360921	宜春市,奉新县		万年县[1981年]
-362227	万载县	江西省	宜春地区	万载县	民政部	1980年	1999年	[已撤销]	360922	宜春市,万载县		玉山县[1981年]
-362228	上高县	江西省	宜春地区	上高县	民政部	1980年	1999年	[已撤销]	360923	宜春市,上高县		乐平县[1981年]
-362229	宜丰县	江西省	宜春地区	宜丰县	民政部	1980年	1999年	[已撤销]	360924	宜春市,宜丰县		广丰县[1981年]
-362230	分宜县	江西省	宜春地区	分宜县	民政部	1980年	1982年	[已撤销]	360521	新余市,分宜县		波阳县[1981年]
-362231	安义县	江西省	宜春地区	安义县	民政部	1980年	1982年	[已撤销]	360123	南昌市,安义县		铅山县[1981年]
-362232	靖安县	江西省	宜春地区	靖安县	民政部	1980年	1999年	[已撤销]	360925	宜春市,靖安县		余干县[1981年]
-362233	铜鼓县	江西省	宜春地区	铜鼓县	民政部	1980年	1999年	[已撤销]	360926	宜春市,铜鼓县		横峰县[1981年]
-362234	弋阳县	江西省	宜春地区	弋阳县	民政部	1980年	1981年	[已撤销]	362326	上饶地区,弋阳县[已撤销]		
-362300	上饶地区	江西省	上饶地区	-	民政部	1980年	1999年	[已撤销]	361100	上饶市（地市）		宜春地区[1981年]
-362301	上饶市	江西省	上饶地区	上饶市	民政部	1980年	1999年	[已撤销]	361121	上饶市,上饶县[已撤销]		宜春市[1981年]
-362302	德兴市	江西省	上饶地区	德兴市	民政部	1982年	1999年	[已撤销]	361181	上饶市,德兴市		鹰潭市[1982年]
-362320		江西省	上饶地区		非官方						1973年	未知地区（市区？参考360120）
-362321	上饶县	江西省	上饶地区	上饶县	民政部	1980年	1999年	[已撤销]	361121	上饶市,上饶县[已撤销]		宜春县[1981年]
-362322	广丰县	江西省	上饶地区	广丰县	民政部	1980年	1999年	[已撤销]	361122	上饶市,广丰县[已撤销]		高安县[1981年]
-362323	玉山县	江西省	上饶地区	玉山县	民政部	1980年	1999年	[已撤销]	361123	上饶市,玉山县		万载县[1981年]
-362324	铅山县	江西省	上饶地区	铅山县	民政部	1980年	1999年	[已撤销]	361124	上饶市,铅山县		丰城县[1981年]
-362325	横峰县	江西省	上饶地区	横峰县	民政部	1980年	1999年	[已撤销]	361125	上饶市,横峰县		铜鼓县[1981年]
-362326	弋阳县	江西省	上饶地区	弋阳县	民政部	1980年	1999年	[已撤销]	361126	上饶市,弋阳县		清江县[1981年]
-362327	贵溪县	江西省	上饶地区	贵溪县	民政部	1980年	1982年	[已撤销]	360621	鹰潭市,贵溪县[已撤销]		宜丰县[1981年]
-362328	余江县	江西省	上饶地区	余江县	民政部	1980年	1982年	[已撤销]	360622	鹰潭市,余江县[已撤销]		新余县[1981年]
-362329	余干县	江西省	上饶地区	余干县	民政部	1980年	1999年	[已撤销]	361127	上饶市,余干县		上高县[1981年]
-362330	波阳县	江西省	上饶地区	波阳县	民政部	1980年	1999年	[已撤销]	361128	上饶市,鄱阳县		旧称：波阳县(鄱阳县)；分宜县[1981年]
-362331	万年县	江西省	上饶地区	万年县	民政部	1980年	1999年	[已撤销]	361129	上饶市,万年县		安义县[1981年]
-362332	乐平县	江西省	上饶地区	乐平县	民政部	1980年	1982年	[已撤销]	360221	景德镇市,乐平县[已撤销]		靖安县[1981年]
-362333	德兴县	江西省	上饶地区	德兴县	民政部	1980年	1989年	[已撤销]	362302	上饶地区,德兴市[已撤销]		奉新县[1981年]
-362334	婺源县	江西省	上饶地区	婺源县	民政部	1982年	1999年	[已撤销]	361130	上饶市,婺源县		
-362400	吉安地区	江西省	吉安地区	-	民政部	1980年	1999年	[已撤销]	360800	吉安市（地市）		抚州地区[1981年]
-362401	吉安市	江西省	吉安地区	吉安市	民政部	1980年	1999年	[已撤销]	360800	吉安市（地市）		抚州市[1981年]
-362402	井冈山市	江西省	吉安地区	井冈山市	民政部	1984年	1999年	[已撤销]	360881	吉安市,井冈山市		
-362421	吉安县	江西省	吉安地区	吉安县	民政部	1980年	1999年	[已撤销]	360821	吉安市,吉安县		临川县[1981年]
-362422	吉水县	江西省	吉安地区	吉水县	民政部	1980年	1999年	[已撤销]	360822	吉安市,吉水县		宜黄县[1981年]
-362423	峡江县	江西省	吉安地区	峡江县	民政部	1980年	1999年	[已撤销]	360823	吉安市,峡江县		金溪县[1981年]
-362424	新干县	江西省	吉安地区	新干县	民政部	1980年	1999年	[已撤销]	360824	吉安市,新干县		旧称：新干县(新淦县)；崇仁县[1981年]
-362425	永丰县	江西省	吉安地区	永丰县	民政部	1980年	1999年	[已撤销]	360825	吉安市,永丰县		资溪县[1981年]
-362426	泰和县	江西省	吉安地区	泰和县	民政部	1980年	1999年	[已撤销]	360826	吉安市,泰和县		乐安县[1981年]
-362427	遂川县	江西省	吉安地区	遂川县	民政部	1980年	1999年	[已撤销]	360827	吉安市,遂川县		黎川县[1981年]
-362428	万安县	江西省	吉安地区	万安县	民政部	1980年	1999年	[已撤销]	360828	吉安市,万安县		东乡县[1981年]
-362429	安福县	江西省	吉安地区	安福县	民政部	1980年	1999年	[已撤销]	360829	吉安市,安福县		南丰县[1981年]
-362430	永新县	江西省	吉安地区	永新县	民政部	1980年	1999年	[已撤销]	360830	吉安市,永新县		进贤县[1981年]
-362431	莲花县	江西省	吉安地区	莲花县	民政部	1980年	1991年	[已撤销]	360321	萍乡市,莲花县		南城县[1981年]
-362432	宁冈县	江西省	吉安地区	宁冈县	民政部	1982年	1999年	[已撤销]	360881	吉安市,井冈山市		
-362433	井冈山县	江西省	吉安地区	井冈山县	民政部	1982年	1983年	[已撤销]	362402	吉安地区,井冈山市[已撤销]		
-362500	抚州地区	江西省	抚州地区	-	民政部	1980年	1999年	[已撤销]	361000	抚州市（地市）		吉安地区[1981年]
-362501	临川市	江西省	抚州地区	临川市	民政部	1980年	1999年	[已撤销]	361002	抚州市,临川区		吉安市[1981年]；抚州市[1986年]
-362502	临川市	江西省	抚州地区	临川市	国标						1973-2005年	增设（GB/T 2260-1988）
-362521	临川县	江西省	抚州地区	临川县	民政部	1980年	1986年	[已撤销]	362501	抚州地区,临川市[已撤销]		吉安县[1981年]
-362522	南城县	江西省	抚州地区	南城县	民政部	1980年	1999年	[已撤销]	361021	抚州市,南城县		万安县[1981年]
-362523	黎川县	江西省	抚州地区	黎川县	民政部	1980年	1999年	[已撤销]	361022	抚州市,黎川县		新干县[1981年]
-362524	南丰县	江西省	抚州地区	南丰县	民政部	1980年	1999年	[已撤销]	361023	抚州市,南丰县		遂川县[1981年]
-362525	崇仁县	江西省	抚州地区	崇仁县	民政部	1980年	1999年	[已撤销]	361024	抚州市,崇仁县		峡江县[1981年]
-362526	乐安县	江西省	抚州地区	乐安县	民政部	1980年	1999年	[已撤销]	361025	抚州市,乐安县		宁冈县[1981年]
-362527	宜黄县	江西省	抚州地区	宜黄县	民政部	1980年	1999年	[已撤销]	361026	抚州市,宜黄县		吉水县[1981年]
-362528	金溪县	江西省	抚州地区	金溪县	民政部	1980年	1999年	[已撤销]	361027	抚州市,金溪县		永新县[1981年]
-362529	资溪县	江西省	抚州地区	资溪县	民政部	1980年	1999年	[已撤销]	361028	抚州市,资溪县		永丰县[1981年]
-362530	进贤县	江西省	抚州地区	进贤县	民政部	1980年	1982年	[已撤销]	360124	南昌市,进贤县		莲花县[1981年]
-362531	东乡县	江西省	抚州地区	东乡县	民政部	1980年	1999年	[已撤销]	361029	抚州市,东乡县[已撤销]		泰和县[1981年]
-362532	广昌县	江西省	抚州地区	广昌县	民政部	1980年	1999年	[已撤销]	361030	抚州市,广昌县		
-362533	井冈山县	江西省	抚州地区	井冈山县	民政部	1981年	1981年	[已撤销]	362433	吉安地区,井冈山县[已撤销]		
-362600	九江地区	江西省	九江地区	-	民政部	1980年	1982年	[已撤销]	360400	九江市（地市）		赣州地区[1981年]
-362601	赣州市	江西省	九江地区	赣州市	民政部	1980年	1981年	[已撤销]	362101	赣州地区,赣州市[已撤销]		
-362621	九江县	江西省	九江地区	九江县	民政部	1980年	1982年	[已撤销]	360421	九江市,九江县[已撤销]		广昌县[1981年]
-362622	瑞昌县	江西省	九江地区	瑞昌县	民政部	1980年	1982年	[已撤销]	360422	九江市,瑞昌县[已撤销]		定南县[1981年]
-362623	武宁县	江西省	九江地区	武宁县	民政部	1980年	1982年	[已撤销]	360423	九江市,武宁县		石城县[1981年]
-362624	修水县	江西省	九江地区	修水县	民政部	1980年	1982年	[已撤销]	360424	九江市,修水县		龙南县[1981年]
-362625	永修县	江西省	九江地区	永修县	民政部	1980年	1982年	[已撤销]	360425	九江市,永修县		宁都县[1981年]
-362626	德安县	江西省	九江地区	德安县	民政部	1980年	1982年	[已撤销]	360426	九江市,德安县		全南县[1981年]
-362627	星子县	江西省	九江地区	星子县	民政部	1980年	1982年	[已撤销]	360427	九江市,星子县[已撤销]		兴国县[1981年]
-362628	都昌县	江西省	九江地区	都昌县	民政部	1980年	1982年	[已撤销]	360428	九江市,都昌县		信丰县[1981年]
-362629	湖口县	江西省	九江地区	湖口县	民政部	1980年	1982年	[已撤销]	360429	九江市,湖口县		于都县[1981年]
-362630	彭泽县	江西省	九江地区	彭泽县	民政部	1980年	1982年	[已撤销]	360430	九江市,彭泽县		赣县[1981年]
-362631	瑞金县	江西省	九江地区	瑞金县	民政部	1980年	1981年	[已撤销]	362134	赣州地区,瑞金县[已撤销]		
-362632	南康县	江西省	九江地区	南康县	民政部	1980年	1981年	[已撤销]	362103	赣州地区,南康市[已撤销]		
-362633	会昌县	江西省	九江地区	会昌县	民政部	1980年	1981年	[已撤销]	362135	赣州地区,会昌县[已撤销]		
-362634	上犹县	江西省	九江地区	上犹县	民政部	1980年	1981年	[已撤销]	362125	赣州地区,上犹县[已撤销]		
-362635	安远县	江西省	九江地区	安远县	民政部	1980年	1981年	[已撤销]	362127	赣州地区,安远县[已撤销]		
-362636	崇义县	江西省	九江地区	崇义县	民政部	1980年	1981年	[已撤销]	362126	赣州地区,崇义县[已撤销]		
-362637	寻乌县	江西省	九江地区	寻乌县	民政部	1980年	1981年	[已撤销]	362136	赣州地区,寻乌县[已撤销]		
-362638	大余县	江西省	九江地区	大余县	民政部	1980年	1981年	[已撤销]	362124	赣州地区,大余县[已撤销]		
-369000	省直辖县	江西省	省直辖县级行政区划	-	非官方							
-369001	瑞昌市	江西省	省直辖县级行政区划	瑞昌市	民政部	1989年	1994年	[已撤销]	360481	九江市,瑞昌市		
-369002	乐平市	江西省	省直辖县级行政区划	乐平市	民政部	1992年	1994年	[已撤销]	360281	景德镇市,乐平市		
-370000	山东省	山东省	-	-	民政部	1980年	2024年					
-370100	济南市	山东省	济南市	-	民政部	1980年	2024年					
-370101	市辖区	山东省	济南市	市辖区	国标							增设（GB/T 2260-1984）
-370102	历下区	山东省	济南市	历下区	民政部	1980年	2024年					
-370103	市中区	山东省	济南市	市中区	民政部	1980年	2024年					
-370104	槐荫区	山东省	济南市	槐荫区	民政部	1980年	2024年					
-370105	天桥区	山东省	济南市	天桥区	民政部	1980年	2024年					
-370111	郊区	山东省	济南市	郊区	民政部	1980年	1986年	[已撤销]	370112	济南市,历城区		
-370112	历城区	山东省	济南市	历城区	民政部	1987年	2024年					
-370113	长清区	山东省	济南市	长清区	民政部	2001年	2024年					
-370114	章丘区	山东省	济南市	章丘区	民政部	2016年	2024年					旧称：章丘区(章邱区)；
-370115	济阳区	山东省	济南市	济阳区	民政部	2018年	2024年					
-370116	莱芜区	山东省	济南市	莱芜区	民政部	2018年	2024年					
-370117	钢城区	山东省	济南市	钢城区	民政部	2018年	2024年					
-370120	济南市区	山东省	济南市	济南市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-370121	历城县	山东省	济南市	历城县	民政部	1980年	1986年	[已撤销]	370112	济南市,历城区		
-370122	章丘县	山东省	济南市	章丘县	民政部	1980年	1991年	[已撤销]	379020	省直辖县级行政区划,章丘市[已撤销]		旧称：章丘县(章邱县)；
-370123	长清县	山东省	济南市	长清县	民政部	1980年	2000年	[已撤销]	370113	济南市,长清区		
-370124	平阴县	山东省	济南市	平阴县	民政部	1985年	2024年					
-370125	济阳县	山东省	济南市	济阳县	民政部	1989年	2017年	[已撤销]	370115	济南市,济阳区		
-370126	商河县	山东省	济南市	商河县	民政部	1989年	2024年					
-370181	章丘市	山东省	济南市	章丘市	民政部	1995年	2015年	[已撤销]	370114	济南市,章丘区		旧称：章丘市(章邱市)；
-370200	青岛市	山东省	青岛市	-	民政部	1980年	2024年					
-370201	市辖区	山东省	青岛市	市辖区	国标							增设（GB/T 2260-1984）
-370202	市南区	山东省	青岛市	市南区	民政部	1980年	2024年					
-370203	市北区	山东省	青岛市	市北区	民政部	1980年	2024年					
-370204	台东区	山东省	青岛市	台东区	民政部	1980年	1993年	[已撤销]	370203	青岛市,市北区		
-370205	四方区	山东省	青岛市	四方区	民政部	1980年	2011年	[已撤销]	370203	青岛市,市北区		
-370206	沧口区	山东省	青岛市	沧口区	民政部	1980年	1993年	[已撤销]	370213,370205	青岛市,李沧区,四方区[已撤销]		
-370208	青岛市	山东省	青岛市	李沧区	非官方							
-370209	青岛市	山东省	青岛市	城阳区	非官方							
-370211	黄岛区	山东省	青岛市	黄岛区	民政部	1980年	2024年					
-370212	崂山区	山东省	青岛市	崂山区	民政部	1988年	2024年					
-370213	李沧区	山东省	青岛市	李沧区	民政部	1994年	2024年					
-370214	城阳区	山东省	青岛市	城阳区	民政部	1994年	2024年					
-370215	即墨区	山东省	青岛市	即墨区	民政部	2017年	2024年					
-370220	青岛市区	山东省	青岛市	青岛市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-370221	崂山县	山东省	青岛市	崂山县	民政部	1980年	1987年	[已撤销]	370212	青岛市,崂山区		
-370222	即墨县	山东省	青岛市	即墨县	民政部	1980年	1988年	[已撤销]	379013	省直辖县级行政区划,即墨市[已撤销]		
-370223	胶南县	山东省	青岛市	胶南县	民政部	1980年	1989年	[已撤销]	379016	省直辖县级行政区划,胶南市[已撤销]		
-370224	胶县	山东省	青岛市	胶县	民政部	1980年	1986年	[已撤销]	379006	省直辖县级行政区划,胶州市[已撤销]		
-370225	莱西县	山东省	青岛市	莱西县	民政部	1983年	1989年	[已撤销]	379015	省直辖县级行政区划,莱西市[已撤销]		
-370226	平度县	山东省	青岛市	平度县	民政部	1983年	1988年	[已撤销]	379014	省直辖县级行政区划,平度市[已撤销]		
-370281	胶州市	山东省	青岛市	胶州市	民政部	1995年	2024年					
-370282	即墨市	山东省	青岛市	即墨市	民政部	1995年	2016年	[已撤销]	370215	青岛市,即墨区		
-370283	平度市	山东省	青岛市	平度市	民政部	1995年	2024年					
-370284	胶南市	山东省	青岛市	胶南市	民政部	1995年	2011年	[已撤销]	370211	青岛市,黄岛区		
-370285	莱西市	山东省	青岛市	莱西市	民政部	1995年	2024年					
-370300	淄博市	山东省	淄博市	-	民政部	1980年	2024年					
-370301	市辖区	山东省	淄博市	市辖区	国标							增设（GB/T 2260-1984）
-370302	淄川区	山东省	淄博市	淄川区	民政部	1980年	2024年					
-370303	张店区	山东省	淄博市	张店区	民政部	1980年	2024年					
-370304	博山区	山东省	淄博市	博山区	民政部	1980年	2024年					
-370305	临淄区	山东省	淄博市	临淄区	民政部	1980年	2024年					
-370306	周村区	山东省	淄博市	周村区	民政部	1980年	2024年					
-370321	桓台县	山东省	淄博市	桓台县	民政部	1983年	2024年					
-370322	高青县	山东省	淄博市	高青县	民政部	1989年	2024年					
-370323	沂源县	山东省	淄博市	沂源县	民政部	1989年	2024年					
-370400	枣庄市	山东省	枣庄市	-	民政部	1980年	2024年					
-370401	市辖区	山东省	枣庄市	市辖区	国标							增设（GB/T 2260-1984）
-370402	市中区	山东省	枣庄市	市中区	民政部	1980年	2024年					
-370403	薛城区	山东省	枣庄市	薛城区	民政部	1980年	2024年					
-370404	峄城区	山东省	枣庄市	峄城区	民政部	1980年	2024年					
-370405	台儿庄区	山东省	枣庄市	台儿庄区	民政部	1980年	2024年					
-370406	山亭区	山东省	枣庄市	山亭区	民政部	1980年	2024年					齐村区[1982年]
-370420	枣庄市区	山东省	枣庄市	枣庄市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-370421	滕县	山东省	枣庄市	滕县	民政部	1980年	1987年	[已撤销]	379010	省直辖县级行政区划,滕州市[已撤销]		
-370481	滕州市	山东省	枣庄市	滕州市	民政部	1995年	2024年					
-370500	东营市	山东省	东营市	-	民政部	1982年	2024年					
-370501	市辖区	山东省	东营市	市辖区	国标							增设（GB/T 2260-1984）
-370502	东营区	山东省	东营市	东营区	民政部	1982年	2024年					
-370503	河口区	山东省	东营市	河口区	民政部	1982年	2024年					
-370504	牛庄区	山东省	东营市	牛庄区	民政部	1982年	1986年	[已撤销]	370502	东营市,东营区		
-370505	垦利区	山东省	东营市	垦利区	民政部	2016年	2024年					
-370521	垦利县	山东省	东营市	垦利县	民政部	1982年	2015年	[已撤销]	370505	东营市,垦利区		
-370522	利津县	山东省	东营市	利津县	民政部	1982年	2024年					
-370523	广饶县	山东省	东营市	广饶县	民政部	1983年	2024年					
-370600	烟台市	山东省	烟台市	-	民政部	1983年	2024年					
-370601	市辖区	山东省	烟台市	市辖区	国标							增设（GB/T 2260-1984）
-370602	芝罘区	山东省	烟台市	芝罘区	民政部	1983年	2024年					
-370603	福山区	山东省	烟台市	福山区	国标							增设（GB-T 2260-1984）
-370611	福山区	山东省	烟台市	福山区	民政部	1983年	2024年					
-370612	牟平区	山东省	烟台市	牟平区	民政部	1994年	2024年					
-370613	莱山区	山东省	烟台市	莱山区	民政部	1994年	2024年					
-370614	蓬莱区	山东省	烟台市	蓬莱区	民政部	2020年	2024年					
-370619	烟台市	山东省	烟台市	龙口市	非官方							
-370620	威海市	山东省	烟台市	威海市	民政部	1985年	1985年	[已撤销]	371000	威海市（地市）		
-370621	烟台市	山东省	烟台市	福山县	非官方							
-370622	蓬莱县	山东省	烟台市	蓬莱县	民政部	1983年	1990年	[已撤销]	379017	省直辖县级行政区划,蓬莱市[已撤销]		
-370623	黄县	山东省	烟台市	黄县	民政部	1983年	1985年	[已撤销]	370681	烟台市,龙口市		
-370624	招远县	山东省	烟台市	招远县	民政部	1983年	1990年	[已撤销]	379018	省直辖县级行政区划,招远市[已撤销]		
-370625	掖县	山东省	烟台市	掖县	民政部	1983年	1987年	[已撤销]	370683	烟台市,莱州市		
-370626	烟台市	山东省	烟台市	莱西县	非官方							
-370627	莱阳县	山东省	烟台市	莱阳县	民政部	1983年	1986年	[已撤销]	379008	省直辖县级行政区划,莱阳市[已撤销]		
-370628	栖霞县	山东省	烟台市	栖霞县	民政部	1983年	1994年	[已撤销]	370686	烟台市,栖霞市		
-370629	海阳县	山东省	烟台市	海阳县	民政部	1983年	1995年	[已撤销]	370687	烟台市,海阳市		
-370630	乳山县	山东省	烟台市	乳山县	民政部	1983年	1986年	[已撤销]	371021	威海市,乳山县[已撤销]		
-370631	牟平县	山东省	烟台市	牟平县	民政部	1983年	1993年	[已撤销]	370612	烟台市,牟平区		
-370632	文登县	山东省	烟台市	文登县	民政部	1983年	1986年	[已撤销]	371022	威海市,文登县[已撤销]		
-370633	荣成县	山东省	烟台市	荣成县	民政部	1983年	1986年	[已撤销]	371023	威海市,荣成县[已撤销]		
-370634	长岛县	山东省	烟台市	长岛县	民政部	1983年	2019年	[已撤销]	370614	烟台市,蓬莱区		
-370681	龙口市	山东省	烟台市	龙口市	民政部	1995年	2024年					
-370682	莱阳市	山东省	烟台市	莱阳市	民政部	1995年	2024年					
-370683	莱州市	山东省	烟台市	莱州市	民政部	1995年	2024年					
-370684	蓬莱市	山东省	烟台市	蓬莱市	民政部	1995年	2019年	[已撤销]	370614	烟台市,蓬莱区		
-370685	招远市	山东省	烟台市	招远市	民政部	1995年	2024年					
-370686	栖霞市	山东省	烟台市	栖霞市	民政部	1995年	2024年					
-370687	海阳市	山东省	烟台市	海阳市	民政部	1996年	2024年					
-370700	潍坊市	山东省	潍坊市	-	民政部	1983年	2024年					
-370701	市辖区	山东省	潍坊市	市辖区	国标							增设（GB/T 2260-1984）
-370702	潍城区	山东省	潍坊市	潍城区	民政部	1983年	2024年					
-370703	寒亭区	山东省	潍坊市	寒亭区	民政部	1983年	2024年					
-370704	坊子区	山东省	潍坊市	坊子区	民政部	1983年	2024年					
-370705	奎文区	山东省	潍坊市	奎文区	民政部	1994年	2024年					
-370719	青州市	山东省	潍坊市	青州市	国标							修订前（GB/T 2260-1986）
-370721	益都县	山东省	潍坊市	益都县	民政部	1983年	1985年	[已撤销]	379001	省直辖县级行政区划,青州市[已撤销]		
-370722	安丘县	山东省	潍坊市	安丘县	民政部	1983年	1993年	[已撤销]	379027	省直辖县级行政区划,安丘市[已撤销]		旧称：安丘县(安邱县)；
-370723	寿光县	山东省	潍坊市	寿光县	民政部	1983年	1992年	[已撤销]	379023	省直辖县级行政区划,寿光市[已撤销]		
-370724	临朐县	山东省	潍坊市	临朐县	民政部	1983年	2024年					
-370725	昌乐县	山东省	潍坊市	昌乐县	民政部	1983年	2024年					
-370726	昌邑县	山东省	潍坊市	昌邑县	民政部	1983年	1993年	[已撤销]	379028	省直辖县级行政区划,昌邑市[已撤销]		
-370727	高密县	山东省	潍坊市	高密县	民政部	1983年	1993年	[已撤销]	379029	省直辖县级行政区划,高密市[已撤销]		
-370728	诸城县	山东省	潍坊市	诸城县	民政部	1983年	1986年	[已撤销]	379007	省直辖县级行政区划,诸城市[已撤销]		
-370729	五莲县	山东省	潍坊市	五莲县	民政部	1983年	1991年	[已撤销]	371121	日照市,五莲县		
-370781	青州市	山东省	潍坊市	青州市	民政部	1995年	2024年					
-370782	诸城市	山东省	潍坊市	诸城市	民政部	1995年	2024年					
-370783	寿光市	山东省	潍坊市	寿光市	民政部	1995年	2024年					
-370784	安丘市	山东省	潍坊市	安丘市	民政部	1995年	2024年					旧称：安丘市(安邱市)；
-370785	高密市	山东省	潍坊市	高密市	民政部	1995年	2024年					
-370786	昌邑市	山东省	潍坊市	昌邑市	民政部	1995年	2024年					
-370800	济宁市	山东省	济宁市	-	民政部	1983年	2024年					
-370801	市辖区	山东省	济宁市	市辖区	国标							增设（GB/T 2260-1984）
-370802	市中区	山东省	济宁市	市中区	民政部	1983年	2012年	[已撤销]	370811	济宁市,任城区		
-370811	任城区	山东省	济宁市	任城区	民政部	1983年	2024年					市郊区[1992年]
-370812	兖州区	山东省	济宁市	兖州区	民政部	2013年	2024年					
-370819	曲阜市	山东省	济宁市	曲阜市	国标							修订前（GB/T 2260-1986）
-370821	济宁市	山东省	济宁市	济宁县	非官方							
-370822	兖州县	山东省	济宁市	兖州县	民政部	1983年	1991年	[已撤销]	379021	省直辖县级行政区划,兖州市[已撤销]		
-370823	曲阜县	山东省	济宁市	曲阜县	民政部	1983年	1985年	[已撤销]	379003	省直辖县级行政区划,曲阜市[已撤销]		
-370824	济宁市	山东省	济宁市	泗水县	非官方							
-370825	邹县	山东省	济宁市	邹县	民政部	1983年	1991年	[已撤销]	379022	省直辖县级行政区划,邹城市[已撤销]		
-370826	微山县	山东省	济宁市	微山县	民政部	1983年	2024年					
-370827	鱼台县	山东省	济宁市	鱼台县	民政部	1983年	2024年					
-370828	金乡县	山东省	济宁市	金乡县	民政部	1983年	2024年					
-370829	嘉祥县	山东省	济宁市	嘉祥县	民政部	1983年	2024年					
-370830	汶上县	山东省	济宁市	汶上县	民政部	1985年	2024年					
-370831	泗水县	山东省	济宁市	泗水县	民政部	1985年	2024年					
-370832	梁山县	山东省	济宁市	梁山县	民政部	1989年	2024年					
-370881	曲阜市	山东省	济宁市	曲阜市	民政部	1995年	2024年					
-370882	兖州市	山东省	济宁市	兖州市	民政部	1995年	2012年	[已撤销]	370812	济宁市,兖州区		
-370883	邹城市	山东省	济宁市	邹城市	民政部	1995年	2024年					
-370900	泰安市	山东省	泰安市	-	民政部	1985年	2024年					
-370901	威海市	山东省	泰安市	威海市	民政部	1983年	1984年	[已撤销]	370620	烟台市,威海市[已撤销]		
-370902	泰山区	山东省	泰安市	泰山区	民政部	1985年	2024年					
-370903	泰安市	山东省	泰安市	岱岳区	非官方							
-370911	岱岳区	山东省	泰安市	岱岳区	民政部	1985年	2024年					郊区[1999年]
-370919	莱芜市	山东省	泰安市	莱芜市	国标							修订前（GB/T 2260-1986）
-370920	新泰市	山东省	泰安市	新泰市	国标							修订前（GB/T 2260-1986）
-370921	宁阳县	山东省	泰安市	宁阳县	民政部	1985年	2024年					
-370922	肥城县	山东省	泰安市	肥城县	民政部	1985年	1991年	[已撤销]	379019	省直辖县级行政区划,肥城市[已撤销]		
-370923	东平县	山东省	泰安市	东平县	民政部	1985年	2024年					
-370981	莱芜市	山东省	泰安市	莱芜市	民政部	1985年	1985年	[已撤销]	379004	省直辖县级行政区划,莱芜市[已撤销]		
-370982	新泰市	山东省	泰安市	新泰市	民政部	1985年	2024年					
-370983	肥城市	山东省	泰安市	肥城市	民政部	1995年	2024年					
-371000	威海市	山东省	威海市	-	民政部	1987年	2024年					
-371001	市辖区	山东省	威海市	市辖区	国标							
-371002	环翠区	山东省	威海市	环翠区	民政部	1987年	2024年					
-371003	文登区	山东省	威海市	文登区	民政部	2014年	2024年					
-371021	乳山县	山东省	威海市	乳山县	民政部	1987年	1992年	[已撤销]	379024	省直辖县级行政区划,乳山市[已撤销]		
-371022	文登县	山东省	威海市	文登县	民政部	1987年	1987年	[已撤销]	379011	省直辖县级行政区划,文登市[已撤销]		
-371023	荣成县	山东省	威海市	荣成县	民政部	1987年	1987年	[已撤销]	379012	省直辖县级行政区划,荣成市[已撤销]		
-371081	文登市	山东省	威海市	文登市	民政部	1995年	2013年	[已撤销]	371003	威海市,文登区		
-371082	荣成市	山东省	威海市	荣成市	民政部	1995年	2024年					
-371083	乳山市	山东省	威海市	乳山市	民政部	1995年	2024年					
-371100	日照市	山东省	日照市	-	民政部	1989年	2024年					
-371101	市辖区	山东省	日照市	市辖区	国标							
-371102	东港区	山东省	日照市	东港区	民政部	1992年	2024年					
-371103	岚山区	山东省	日照市	岚山区	民政部	2004年	2024年					
-371121	五莲县	山东省	日照市	五莲县	民政部	1992年	2024年					
-371122	莒县	山东省	日照市	莒县	民政部	1992年	2024年					
-371200	莱芜市	山东省	莱芜市	-	民政部	1992年	2017年	[已撤销]	370100	济南市（地市）		
-371201	市辖区	山东省	莱芜市	市辖区	国标							
-371202	莱城区	山东省	莱芜市	莱城区	民政部	1992年	2017年	[已撤销]	370116	济南市,莱芜区		
-371203	钢城区	山东省	莱芜市	钢城区	民政部	1992年	2017年	[已撤销]	370117	济南市,钢城区		
-371300	临沂市	山东省	临沂市	-	民政部	1994年	2024年					
-371301	市辖区	山东省	临沂市	市辖区	国标							
-371302	兰山区	山东省	临沂市	兰山区	民政部	1994年	2024年					
-371311	罗庄区	山东省	临沂市	罗庄区	民政部	1994年	2024年					
-371312	河东区	山东省	临沂市	河东区	民政部	1994年	2024年					
-371321	沂南县	山东省	临沂市	沂南县	民政部	1994年	2024年					
-371322	郯城县	山东省	临沂市	郯城县	民政部	1994年	2024年					
-371323	沂水县	山东省	临沂市	沂水县	民政部	1994年	2024年					
-371324	兰陵县	山东省	临沂市	兰陵县	民政部	1994年	2024年					苍山县[2013年]
-371325	费县	山东省	临沂市	费县	民政部	1994年	2024年					
-371326	平邑县	山东省	临沂市	平邑县	民政部	1994年	2024年					
-371327	莒南县	山东省	临沂市	莒南县	民政部	1994年	2024年					
-371328	蒙阴县	山东省	临沂市	蒙阴县	民政部	1994年	2024年					
-371329	临沭县	山东省	临沂市	临沭县	民政部	1994年	2024年					
-371400	德州市	山东省	德州市	-	民政部	1994年	2024年					
-371401	市辖区	山东省	德州市	市辖区	国标							
-371402	德城区	山东省	德州市	德城区	民政部	1994年	2024年					
-371403	陵城区	山东省	德州市	陵城区	民政部	2014年	2024年					
-371421	陵县	山东省	德州市	陵县	民政部	1994年	2013年	[已撤销]	371403	德州市,陵城区		
-371422	宁津县	山东省	德州市	宁津县	民政部	1994年	2024年					
-371423	庆云县	山东省	德州市	庆云县	民政部	1994年	2024年					
-371424	临邑县	山东省	德州市	临邑县	民政部	1994年	2024年					
-371425	齐河县	山东省	德州市	齐河县	民政部	1994年	2024年					
-371426	平原县	山东省	德州市	平原县	民政部	1994年	2024年					
-371427	夏津县	山东省	德州市	夏津县	民政部	1994年	2024年					
-371428	武城县	山东省	德州市	武城县	民政部	1994年	2024年					
-371481	乐陵市	山东省	德州市	乐陵市	民政部	1995年	2024年					
-371482	禹城市	山东省	德州市	禹城市	民政部	1995年	2024年					
-371500	聊城市	山东省	聊城市	-	民政部	1997年	2024年					
-371501	市辖区	山东省	聊城市	市辖区	国标							
-371502	东昌府区	山东省	聊城市	东昌府区	民政部	1997年	2024年					
-371503	茌平区	山东省	聊城市	茌平区	民政部	2019年	2024年					
-371521	阳谷县	山东省	聊城市	阳谷县	民政部	1997年	2024年					
-371522	莘县	山东省	聊城市	莘县	民政部	1997年	2024年					
-371523	茌平县	山东省	聊城市	茌平县	民政部	1997年	2018年	[已撤销]	371503	聊城市,茌平区		
-371524	东阿县	山东省	聊城市	东阿县	民政部	1997年	2024年					
-371525	冠县	山东省	聊城市	冠县	民政部	1997年	2024年					
-371526	高唐县	山东省	聊城市	高唐县	民政部	1997年	2024年					
-371581	临清市	山东省	聊城市	临清市	民政部	1997年	2024年					
-371600	滨州市	山东省	滨州市	-	民政部	2000年	2024年					
-371601	市辖区	山东省	滨州市	市辖区	国标							
-371602	滨城区	山东省	滨州市	滨城区	民政部	2000年	2024年					
-371603	沾化区	山东省	滨州市	沾化区	民政部	2014年	2024年					
-371621	惠民县	山东省	滨州市	惠民县	民政部	2000年	2024年					
-371622	阳信县	山东省	滨州市	阳信县	民政部	2000年	2024年					
-371623	无棣县	山东省	滨州市	无棣县	民政部	2000年	2024年					
-371624	沾化县	山东省	滨州市	沾化县	民政部	2000年	2013年	[已撤销]	371603	滨州市,沾化区		
-371625	博兴县	山东省	滨州市	博兴县	民政部	2000年	2024年					
-371626	邹平县	山东省	滨州市	邹平县	民政部	2000年	2017年	[已撤销]	371681	滨州市,邹平市		
-371681	邹平市	山东省	滨州市	邹平市	民政部	2018年	2024年					
-371700	菏泽市	山东省	菏泽市	-	民政部	2000年	2024年					
-371701	市辖区	山东省	菏泽市	市辖区	国标							
-371702	牡丹区	山东省	菏泽市	牡丹区	民政部	2000年	2024年					
-371703	定陶区	山东省	菏泽市	定陶区	民政部	2016年	2024年					
-371721	曹县	山东省	菏泽市	曹县	民政部	2000年	2024年					
-371722	单县	山东省	菏泽市	单县	民政部	2000年	2024年					
-371723	成武县	山东省	菏泽市	成武县	民政部	2000年	2024年					
-371724	巨野县	山东省	菏泽市	巨野县	民政部	2000年	2024年					
-371725	郓城县	山东省	菏泽市	郓城县	民政部	2000年	2024年					
-371726	鄄城县	山东省	菏泽市	鄄城县	民政部	2000年	2024年					
-371727	定陶县	山东省	菏泽市	定陶县	民政部	2000年	2015年	[已撤销]	371703	菏泽市,定陶区		
-371728	东明县	山东省	菏泽市	东明县	民政部	2000年	2024年					
-372100	烟台地区	山东省	烟台地区	-	民政部	1980年	1982年	[已撤销]	370600	烟台市（地市）		
-372101	烟台市	山东省	烟台地区	烟台市	民政部	1980年	1982年	[已撤销]	370600	烟台市（地市）		
-372102	威海市	山东省	烟台地区	威海市	民政部	1980年	1982年	[已撤销]	370901	泰安市,威海市[已撤销]		
-372121	福山县	山东省	烟台地区	福山县	民政部	1980年	1982年	[已撤销]	370611	烟台市,福山区		
-372122	蓬莱县	山东省	烟台地区	蓬莱县	民政部	1980年	1982年	[已撤销]	370622	烟台市,蓬莱县[已撤销]		
-372123	黄县	山东省	烟台地区	黄县	民政部	1980年	1982年	[已撤销]	370623	烟台市,黄县[已撤销]		
-372124	招远县	山东省	烟台地区	招远县	民政部	1980年	1982年	[已撤销]	370624	烟台市,招远县[已撤销]		
-372125	掖县	山东省	烟台地区	掖县	民政部	1980年	1982年	[已撤销]	370625	烟台市,掖县[已撤销]		
-372126	莱西县	山东省	烟台地区	莱西县	民政部	1980年	1982年	[已撤销]	370225	青岛市,莱西县[已撤销]		
-372127	莱阳县	山东省	烟台地区	莱阳县	民政部	1980年	1982年	[已撤销]	370627	烟台市,莱阳县[已撤销]		
-372128	栖霞县	山东省	烟台地区	栖霞县	民政部	1980年	1982年	[已撤销]	370628	烟台市,栖霞县[已撤销]		
-372129	海阳县	山东省	烟台地区	海阳县	民政部	1980年	1982年	[已撤销]	370629	烟台市,海阳县[已撤销]		
-372130	乳山县	山东省	烟台地区	乳山县	民政部	1980年	1982年	[已撤销]	370630	烟台市,乳山县[已撤销]		
-372131	牟平县	山东省	烟台地区	牟平县	民政部	1980年	1982年	[已撤销]	370631	烟台市,牟平县[已撤销]		
-372132	文登县	山东省	烟台地区	文登县	民政部	1980年	1982年	[已撤销]	370632	烟台市,文登县[已撤销]		
-372133	荣成县	山东省	烟台地区	荣成县	民政部	1980年	1982年	[已撤销]	370633	烟台市,荣成县[已撤销]		
-372134	长岛县	山东省	烟台地区	长岛县	民政部	1980年	1982年	[已撤销]	370634	烟台市,长岛县[已撤销]		
-372200	潍坊地区	山东省	潍坊地区	-	民政部	1980年	1982年	[已撤销]	370700	潍坊市（地市）		昌潍地区[1980年]
-372201	潍坊市	山东省	潍坊地区	潍坊市	民政部	1980年	1982年	[已撤销]	370700	潍坊市（地市）		
-372221	益都县	山东省	潍坊地区	益都县	民政部	1980年	1982年	[已撤销]	370721	潍坊市,益都县[已撤销]		
-372222	安丘县	山东省	潍坊地区	安丘县	民政部	1980年	1982年	[已撤销]	370722	潍坊市,安丘县[已撤销]		旧称：安丘县(安邱县)；
-372223	寿光县	山东省	潍坊地区	寿光县	民政部	1980年	1982年	[已撤销]	370723	潍坊市,寿光县[已撤销]		
-372224	临朐县	山东省	潍坊地区	临朐县	民政部	1980年	1982年	[已撤销]	370724	潍坊市,临朐县		
-372225	昌乐县	山东省	潍坊地区	昌乐县	民政部	1980年	1982年	[已撤销]	370725	潍坊市,昌乐县		
-372226	昌邑县	山东省	潍坊地区	昌邑县	民政部	1980年	1982年	[已撤销]	370726	潍坊市,昌邑县[已撤销]		
-372227	高密县	山东省	潍坊地区	高密县	民政部	1980年	1982年	[已撤销]	370727	潍坊市,高密县[已撤销]		
-372228	诸城县	山东省	潍坊地区	诸城县	民政部	1980年	1982年	[已撤销]	370728	潍坊市,诸城县[已撤销]		
-372229	五莲县	山东省	潍坊地区	五莲县	民政部	1980年	1982年	[已撤销]	370729	潍坊市,五莲县[已撤销]		
-372230	平度县	山东省	潍坊地区	平度县	民政部	1980年	1982年	[已撤销]	370226	青岛市,平度县[已撤销]		
-372231	潍县	山东省	潍坊地区	潍县	民政部	1980年	1982年	[已撤销]	370702	潍坊市,潍城区		
-372300	滨州地区	山东省	滨州地区	-	民政部	1980年	1999年	[已撤销]	371600	滨州市（地市）		惠民地区[1991年]
-372301	滨州市	山东省	滨州地区	滨州市	民政部	1982年	1999年	[已撤销]	371600	滨州市（地市）		
-372321	惠民县	山东省	滨州地区	惠民县	民政部	1980年	1999年	[已撤销]	371621	滨州市,惠民县		
-372322	滨县	山东省	滨州地区	滨县	民政部	1980年	1986年	[已撤销]	372301	滨州地区,滨州市[已撤销]		
-372323	阳信县	山东省	滨州地区	阳信县	民政部	1980年	1999年	[已撤销]	371622	滨州市,阳信县		
-372324	无棣县	山东省	滨州地区	无棣县	民政部	1980年	1999年	[已撤销]	371623	滨州市,无棣县		
-372325	沾化县	山东省	滨州地区	沾化县	民政部	1980年	1999年	[已撤销]	371624	滨州市,沾化县[已撤销]		
-372326	利津县	山东省	滨州地区	利津县	民政部	1980年	1981年	[已撤销]	370522	东营市,利津县		
-372327	广饶县	山东省	滨州地区	广饶县	民政部	1980年	1982年	[已撤销]	370523	东营市,广饶县		
-372328	博兴县	山东省	滨州地区	博兴县	民政部	1980年	1999年	[已撤销]	371625	滨州市,博兴县		
-372329	桓台县	山东省	滨州地区	桓台县	民政部	1980年	1982年	[已撤销]	370321	淄博市,桓台县		
-372330	邹平县	山东省	滨州地区	邹平县	民政部	1980年	1999年	[已撤销]	371626	滨州市,邹平县[已撤销]		
-372331	高青县	山东省	滨州地区	高青县	民政部	1980年	1988年	[已撤销]	370322	淄博市,高青县		
-372332	垦利县	山东省	滨州地区	垦利县	民政部	1980年	1981年	[已撤销]	370521	东营市,垦利县[已撤销]		
-372400	德州地区	山东省	德州地区	-	民政部	1980年	1993年	[已撤销]	371400	德州市（地市）		
-372401	德州市	山东省	德州地区	德州市	民政部	1980年	1993年	[已撤销]	371400	德州市（地市）		
-372402	乐陵市	山东省	德州地区	乐陵市	民政部	1988年	1993年	[已撤销]	379025	省直辖县级行政区划,乐陵市[已撤销]		
-372403	禹城市	山东省	德州地区	禹城市	民政部	1993年	1993年	[已撤销]	379026	省直辖县级行政区划,禹城市[已撤销]		
-372421	陵县	山东省	德州地区	陵县	民政部	1980年	1993年	[已撤销]	371421	德州市,陵县[已撤销]		
-372422	平原县	山东省	德州地区	平原县	民政部	1980年	1993年	[已撤销]	371426	德州市,平原县		
-372423	夏津县	山东省	德州地区	夏津县	民政部	1980年	1993年	[已撤销]	371427	德州市,夏津县		
-372424	武城县	山东省	德州地区	武城县	民政部	1980年	1993年	[已撤销]	371428	德州市,武城县		
-372425	齐河县	山东省	德州地区	齐河县	民政部	1980年	1993年	[已撤销]	371425	德州市,齐河县		
-372426	禹城县	山东省	德州地区	禹城县	民政部	1980年	1992年	[已撤销]	372403	德州地区,禹城市[已撤销]		
-372427	乐陵县	山东省	德州地区	乐陵县	民政部	1980年	1987年	[已撤销]	372402	德州地区,乐陵市[已撤销]		
-372428	临邑县	山东省	德州地区	临邑县	民政部	1980年	1993年	[已撤销]	371424	德州市,临邑县		
-372429	商河县	山东省	德州地区	商河县	民政部	1980年	1988年	[已撤销]	370126	济南市,商河县		
-372430	济阳县	山东省	德州地区	济阳县	民政部	1980年	1988年	[已撤销]	370125	济南市,济阳县[已撤销]		
-372431	宁津县	山东省	德州地区	宁津县	民政部	1980年	1993年	[已撤销]	371422	德州市,宁津县		
-372432	庆云县	山东省	德州地区	庆云县	民政部	1980年	1993年	[已撤销]	371423	德州市,庆云县		
-372500	聊城地区	山东省	聊城地区	-	民政部	1980年	1996年	[已撤销]	371500	聊城市（地市）		
-372501	聊城市	山东省	聊城地区	聊城市	民政部	1983年	1996年	[已撤销]	371500	聊城市（地市）		
-372502	临清市	山东省	聊城地区	临清市	民政部	1983年	1996年	[已撤销]	371581	聊城市,临清市		
-372521	聊城县	山东省	聊城地区	聊城县	民政部	1980年	1982年	[已撤销]	372501	聊城地区,聊城市[已撤销]		阳谷县[1981年]
-372522	阳谷县	山东省	聊城地区	阳谷县	民政部	1980年	1996年	[已撤销]	371521	聊城市,阳谷县		莘县[1981年]
-372523	莘县	山东省	聊城地区	莘县	民政部	1980年	1996年	[已撤销]	371522	聊城市,莘县		茌平县[1981年]
-372524	茌平县	山东省	聊城地区	茌平县	民政部	1980年	1996年	[已撤销]	371523	聊城市,茌平县[已撤销]		东阿县[1981年]
-372525	东阿县	山东省	聊城地区	东阿县	民政部	1980年	1996年	[已撤销]	371524	聊城市,东阿县		冠县[1981年]
-372526	冠县	山东省	聊城地区	冠县	民政部	1980年	1996年	[已撤销]	371525	聊城市,冠县		高唐县[1981年]
-372527	高唐县	山东省	聊城地区	高唐县	民政部	1980年	1996年	[已撤销]	371526	聊城市,高唐县		临清县[1981年]
-372528	临清县	山东省	聊城地区	临清县	民政部	1980年	1982年	[已撤销]	371581	聊城市,临清市		聊城县[1981年]
-372600	泰安地区	山东省	泰安地区	-	民政部	1980年	1984年	[已撤销]	370900	泰安市（地市）		
-372601	泰安市	山东省	泰安地区	泰安市	民政部	1982年	1984年	[已撤销]	370900	泰安市（地市）		
-372602	莱芜市	山东省	泰安地区	莱芜市	民政部	1982年	1984年	[已撤销]	370981	泰安市,莱芜市[已撤销]		新汶市[1982年]
-372603	新泰市	山东省	泰安地区	新泰市	民政部	1983年	1984年	[已撤销]	370982	泰安市,新泰市		
-372621	莱芜县	山东省	泰安地区	莱芜县	民政部	1980年	1982年	[已撤销]	370981	泰安市,莱芜市[已撤销]		泰安县[1981年]
-372622	新泰县	山东省	泰安地区	新泰县	民政部	1980年	1982年	[已撤销]	372603	泰安地区,新泰市[已撤销]		莱芜县[1981年]
-372623	新泰县	山东省	泰安地区	新泰县	民政部	1980年	1981年	[已撤销]	372603	泰安地区,新泰市[已撤销]		
-372624	宁阳县	山东省	泰安地区	宁阳县	民政部	1980年	1984年	[已撤销]	370921	泰安市,宁阳县		
-372625	肥城县	山东省	泰安地区	肥城县	民政部	1980年	1984年	[已撤销]	370922	泰安市,肥城县[已撤销]		
-372626	东平县	山东省	泰安地区	东平县	民政部	1980年	1984年	[已撤销]	370923	泰安市,东平县		
-372627	平阴县	山东省	泰安地区	平阴县	民政部	1980年	1984年	[已撤销]	370124	济南市,平阴县		
-372628	新汶县	山东省	泰安地区	新汶县	民政部	1980年	1981年	[已撤销]	372603	泰安地区,新泰市[已撤销]		
-372629	汶上县	山东省	泰安地区	汶上县	民政部	1983年	1984年	[已撤销]	370830	济宁市,汶上县		
-372630	泗水县	山东省	泰安地区	泗水县	民政部	1983年	1984年	[已撤销]	370831	济宁市,泗水县		
-372700	济宁地区	山东省	济宁地区	-	民政部	1980年	1982年	[已撤销]	370800	济宁市（地市）		
-372701	济宁市	山东省	济宁地区	济宁市	民政部	1980年	1982年	[已撤销]	370800	济宁市（地市）		
-372721	济宁县	山东省	济宁地区	济宁县	民政部	1980年	1982年	[已撤销]	370811	济宁市,任城区		
-372722	兖州县	山东省	济宁地区	兖州县	民政部	1980年	1982年	[已撤销]	370822	济宁市,兖州县[已撤销]		
-372723	曲阜县	山东省	济宁地区	曲阜县	民政部	1980年	1982年	[已撤销]	370823	济宁市,曲阜县[已撤销]		
-372724	泗水县	山东省	济宁地区	泗水县	民政部	1980年	1982年	[已撤销]	372630	泰安地区,泗水县[已撤销]		
-372725	邹县	山东省	济宁地区	邹县	民政部	1980年	1982年	[已撤销]	370825	济宁市,邹县[已撤销]		
-372726	微山县	山东省	济宁地区	微山县	民政部	1980年	1982年	[已撤销]	370826	济宁市,微山县		
-372727	鱼台县	山东省	济宁地区	鱼台县	民政部	1980年	1982年	[已撤销]	370827	济宁市,鱼台县		
-372728	金乡县	山东省	济宁地区	金乡县	民政部	1980年	1982年	[已撤销]	370828	济宁市,金乡县		
-372729	嘉祥县	山东省	济宁地区	嘉祥县	民政部	1980年	1982年	[已撤销]	370829	济宁市,嘉祥县		
-372730	汶上县	山东省	济宁地区	汶上县	民政部	1980年	1982年	[已撤销]	372629	泰安地区,汶上县[已撤销]		
-372800	临沂地区	山东省	临沂地区	-	民政部	1980年	1993年	[已撤销]	371300	临沂市（地市）		
-372801	临沂市	山东省	临沂地区	临沂市	民政部	1983年	1993年	[已撤销]	371300	临沂市（地市）		
-372802	临沂地区	山东省	临沂地区	日照市	非官方							
-372821	临沂县	山东省	临沂地区	临沂县	民政部	1980年	1982年	[已撤销]	372801	临沂地区,临沂市[已撤销]		
-372822	郯城县	山东省	临沂地区	郯城县	民政部	1980年	1993年	[已撤销]	371322	临沂市,郯城县		
-372823	苍山县	山东省	临沂地区	苍山县	民政部	1980年	1993年	[已撤销]	371324	临沂市,兰陵县		
-372824	莒南县	山东省	临沂地区	莒南县	民政部	1980年	1993年	[已撤销]	371327	临沂市,莒南县		
-372825	日照县	山东省	临沂地区	日照县	民政部	1980年	1988年	[已撤销]	371100	日照市（地市）		
-372826	莒县	山东省	临沂地区	莒县	民政部	1980年	1991年	[已撤销]	371122	日照市,莒县		
-372827	沂水县	山东省	临沂地区	沂水县	民政部	1980年	1993年	[已撤销]	371323	临沂市,沂水县		
-372828	沂源县	山东省	临沂地区	沂源县	民政部	1980年	1988年	[已撤销]	370323	淄博市,沂源县		
-372829	蒙阴县	山东省	临沂地区	蒙阴县	民政部	1980年	1993年	[已撤销]	371328	临沂市,蒙阴县		
-372830	平邑县	山东省	临沂地区	平邑县	民政部	1980年	1993年	[已撤销]	371326	临沂市,平邑县		
-372831	费县	山东省	临沂地区	费县	民政部	1980年	1993年	[已撤销]	371325	临沂市,费县		
-372832	沂南县	山东省	临沂地区	沂南县	民政部	1980年	1993年	[已撤销]	371321	临沂市,沂南县		
-372833	临沭县	山东省	临沂地区	临沭县	民政部	1980年	1993年	[已撤销]	371329	临沂市,临沭县		
-372900	菏泽地区	山东省	菏泽地区	-	民政部	1980年	1999年	[已撤销]	371700	菏泽市（地市）		
-372901	菏泽市	山东省	菏泽地区	菏泽市	民政部	1983年	1999年	[已撤销]	371700	菏泽市（地市）		
-372921	菏泽县	山东省	菏泽地区	菏泽县	民政部	1980年	1982年	[已撤销]	372901	菏泽地区,菏泽市[已撤销]		
-372922	曹县	山东省	菏泽地区	曹县	民政部	1980年	1999年	[已撤销]	371721	菏泽市,曹县		
-372923	定陶县	山东省	菏泽地区	定陶县	民政部	1980年	1999年	[已撤销]	371727	菏泽市,定陶县[已撤销]		
-372924	成武县	山东省	菏泽地区	成武县	民政部	1980年	1999年	[已撤销]	371723	菏泽市,成武县		
-372925	单县	山东省	菏泽地区	单县	民政部	1980年	1999年	[已撤销]	371722	菏泽市,单县		
-372926	巨野县	山东省	菏泽地区	巨野县	民政部	1980年	1999年	[已撤销]	371724	菏泽市,巨野县		
-372927	梁山县	山东省	菏泽地区	梁山县	民政部	1980年	1988年	[已撤销]	370832	济宁市,梁山县		
-372928	郓城县	山东省	菏泽地区	郓城县	民政部	1980年	1999年	[已撤销]	371725	菏泽市,郓城县		
-372929	鄄城县	山东省	菏泽地区	鄄城县	民政部	1980年	1999年	[已撤销]	371726	菏泽市,鄄城县		
-372930	东明县	山东省	菏泽地区	东明县	民政部	1980年	1999年	[已撤销]	371728	菏泽市,东明县		
-379000	省直辖行政单位	山东省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-379001	青州市	山东省	省直辖县级行政区划	青州市	民政部	1986年	1994年	[已撤销]	370781	潍坊市,青州市		
-379002	龙口市	山东省	省直辖县级行政区划	龙口市	民政部	1986年	1994年	[已撤销]	370681	烟台市,龙口市		
-379003	曲阜市	山东省	省直辖县级行政区划	曲阜市	民政部	1986年	1994年	[已撤销]	370881	济宁市,曲阜市		
-379004	莱芜市	山东省	省直辖县级行政区划	莱芜市	民政部	1986年	1991年	[已撤销]	370116	济南市,莱芜区		
-379005	新泰市	山东省	省直辖县级行政区划	新泰市	民政部	1986年	1994年	[已撤销]	370982	泰安市,新泰市		
-379006	胶州市	山东省	省直辖县级行政区划	胶州市	民政部	1986年	1994年	[已撤销]	370281	青岛市,胶州市		威海市[1986年]
-379007	诸城市	山东省	省直辖县级行政区划	诸城市	民政部	1987年	1994年	[已撤销]	370782	潍坊市,诸城市		
-379008	莱阳市	山东省	省直辖县级行政区划	莱阳市	民政部	1987年	1994年	[已撤销]	370682	烟台市,莱阳市		
-379009	莱州市	山东省	省直辖县级行政区划	莱州市	民政部	1988年	1994年	[已撤销]	370683	烟台市,莱州市		
-379010	滕州市	山东省	省直辖县级行政区划	滕州市	民政部	1988年	1994年	[已撤销]	370481	枣庄市,滕州市		
-379011	文登市	山东省	省直辖县级行政区划	文登市	民政部	1988年	1994年	[已撤销]	371081	威海市,文登市[已撤销]		
-379012	荣成市	山东省	省直辖县级行政区划	荣成市	民政部	1988年	1994年	[已撤销]	371082	威海市,荣成市		
-379013	即墨市	山东省	省直辖县级行政区划	即墨市	民政部	1989年	1994年	[已撤销]	370282	青岛市,即墨市[已撤销]		
-379014	平度市	山东省	省直辖县级行政区划	平度市	民政部	1989年	1994年	[已撤销]	370283	青岛市,平度市		
-379015	莱西市	山东省	省直辖县级行政区划	莱西市	民政部	1990年	1994年	[已撤销]	370285	青岛市,莱西市		
-379016	胶南市	山东省	省直辖县级行政区划	胶南市	民政部	1990年	1994年	[已撤销]	370284	青岛市,胶南市[已撤销]		
-379017	蓬莱市	山东省	省直辖县级行政区划	蓬莱市	民政部	1991年	1994年	[已撤销]	370684	烟台市,蓬莱市[已撤销]		
-379018	招远市	山东省	省直辖县级行政区划	招远市	民政部	1991年	1994年	[已撤销]	370685	烟台市,招远市		
-379019	肥城市	山东省	省直辖县级行政区划	肥城市	民政部	1992年	1994年	[已撤销]	370983	泰安市,肥城市		
-379020	章丘市	山东省	省直辖县级行政区划	章丘市	民政部	1992年	1994年	[已撤销]	370181	济南市,章丘市[已撤销]		
-379021	兖州市	山东省	省直辖县级行政区划	兖州市	民政部	1992年	1994年	[已撤销]	370882	济宁市,兖州市[已撤销]		
-379022	邹城市	山东省	省直辖县级行政区划	邹城市	民政部	1992年	1994年	[已撤销]	370883	济宁市,邹城市		
-379023	寿光市	山东省	省直辖县级行政区划	寿光市	民政部	1993年	1994年	[已撤销]	370783	潍坊市,寿光市		旧称：安丘市(安邱市)；
-379024	乳山市	山东省	省直辖县级行政区划	乳山市	民政部	1993年	1994年	[已撤销]	371083	威海市,乳山市		
-379025	乐陵市	山东省	省直辖县级行政区划	乐陵市	民政部	1994年	1994年	[已撤销]	371481	德州市,乐陵市		
-379026	禹城市	山东省	省直辖县级行政区划	禹城市	民政部	1994年	1994年	[已撤销]	371482	德州市,禹城市		
-379027	安丘市	山东省	省直辖县级行政区划	安丘市	民政部	1994年	1994年	[已撤销]	370784	潍坊市,安丘市		
-379028	昌邑市	山东省	省直辖县级行政区划	昌邑市	民政部	1994年	1994年	[已撤销]	370786	潍坊市,昌邑市		
-379029	高密市	山东省	省直辖县级行政区划	高密市	民政部	1994年	1994年	[已撤销]	370785	潍坊市,高密市		
-410000	河南省	河南省	-	-	民政部	1980年	2024年					
-410100	郑州市	河南省	郑州市	-	民政部	1980年	2024年					
-410101	市辖区	河南省	郑州市	市辖区	国标						1989-2017年	增设（GB/T 2260-1984）
-410102	中原区	河南省	郑州市	中原区	民政部	1980年	2024年					
-410103	二七区	河南省	郑州市	二七区	民政部	1980年	2024年					
-410104	管城回族区	河南省	郑州市	管城回族区	民政部	1980年	2024年					向阳回族区[1982年]
-410105	金水区	河南省	郑州市	金水区	民政部	1980年	2024年					
-410106	上街区	河南省	郑州市	上街区	民政部	1980年	2024年					
-410107	新密区	河南省	郑州市	新密区	民政部	1982年	1986年	[已撤销]	410108	郑州市,惠济区		
-410108	惠济区	河南省	郑州市	惠济区	民政部	1987年	2024年					邙山区[2002年]
-410111	金海区	河南省	郑州市	金海区	民政部	1981年	1986年	[已撤销]	410108	郑州市,惠济区		
-410112	郊区	河南省	郑州市	郊区	民政部	1980年	1986年	[已撤销]	410108	郑州市,惠济区		
-410120	郑州市区	河南省	郑州市	郑州市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-410121	荥阳县	河南省	郑州市	荥阳县	民政部	1980年	1993年	[已撤销]	419016	省直辖县级行政区划,荥阳市[已撤销]		
-410122	中牟县	河南省	郑州市	中牟县	民政部	1983年	2024年					
-410123	新郑县	河南省	郑州市	新郑县	民政部	1983年	1993年	[已撤销]	419017	省直辖县级行政区划,新郑市[已撤销]		
-410124	巩县	河南省	郑州市	巩县	民政部	1983年	1990年	[已撤销]	419009	省直辖县级行政区划,巩义市[已撤销]		
-410125	登封县	河南省	郑州市	登封县	民政部	1983年	1993年	[已撤销]	419018	省直辖县级行政区划,登封市[已撤销]		
-410126	密县	河南省	郑州市	密县	民政部	1983年	1993年	[已撤销]	410183	郑州市,新密市		
-410127		河南省	郑州市		非官方						1955年	
-410181	巩义市	河南省	郑州市	巩义市	民政部	1995年	2024年					
-410182	荥阳市	河南省	郑州市	荥阳市	民政部	1995年	2024年					
-410183	新密市	河南省	郑州市	新密市	民政部	1995年	2024年					
-410184	新郑市	河南省	郑州市	新郑市	民政部	1995年	2024年					
-410185	登封市	河南省	郑州市	登封市	民政部	1995年	2024年					
-410200	开封市	河南省	开封市	-	民政部	1980年	2024年					
-410201	市辖区	河南省	开封市	市辖区	国标							增设（GB/T 2260-1984）
-410202	龙亭区	河南省	开封市	龙亭区	民政部	1980年	2024年					
-410203	顺河回族区	河南省	开封市	顺河回族区	民政部	1980年	2024年					
-410204	鼓楼区	河南省	开封市	鼓楼区	民政部	1980年	2024年					古楼区[1988年]
-410205	禹王台区	河南省	开封市	禹王台区	民政部	1980年	2024年					南关区[2004年]
-410211	金明区	河南省	开封市	金明区	民政部	1980年	2013年	[已撤销]	410202	开封市,龙亭区		郊区[2004年]
-410212	祥符区	河南省	开封市	祥符区	民政部	2014年	2024年					
-410221	杞县	河南省	开封市	杞县	民政部	1983年	2024年					
-410222	通许县	河南省	开封市	通许县	民政部	1983年	2024年					
-410223	尉氏县	河南省	开封市	尉氏县	民政部	1983年	2024年					
-410224	开封县	河南省	开封市	开封县	民政部	1983年	2013年	[已撤销]	410212	开封市,祥符区		
-410225	兰考县	河南省	开封市	兰考县	民政部	1983年	2024年					
-410300	洛阳市	河南省	洛阳市	-	民政部	1980年	2024年					
-410301	市辖区	河南省	洛阳市	市辖区	国标							增设（GB/T 2260-1984）
-410302	老城区	河南省	洛阳市	老城区	民政部	1980年	2024年					洛北区[1982年]
-410303	西工区	河南省	洛阳市	西工区	民政部	1980年	2024年					
-410304	瀍河回族区	河南省	洛阳市	瀍河回族区	民政部	1980年	2024年					
-410305	涧西区	河南省	洛阳市	涧西区	民政部	1980年	2024年					
-410306	吉利区	河南省	洛阳市	吉利区	民政部	1982年	2020年	[已撤销]	410308	洛阳市,孟津区		
-410307	偃师区	河南省	洛阳市	偃师区	民政部	2021年	2024年					洛龙区(非国标，身份证曾用)
-410308	孟津区	河南省	洛阳市	孟津区	民政部	2021年	2024年					开发区(非国标，身份证曾用)
-410311	洛龙区	河南省	洛阳市	洛龙区	民政部	1980年	2024年					郊区[1999年]
-410312	洛阳市	河南省	洛阳市	偃师区	非官方							
-410313	洛阳市	河南省	洛阳市	孟津区	非官方							
-410321	偃师县	河南省	洛阳市	偃师县	民政部	1983年	1992年	[已撤销]	419012	省直辖县级行政区划,偃师市[已撤销]		
-410322	孟津县	河南省	洛阳市	孟津县	民政部	1983年	2020年	[已撤销]	410308	洛阳市,孟津区		
-410323	新安县	河南省	洛阳市	新安县	民政部	1983年	2024年					
-410324	栾川县	河南省	洛阳市	栾川县	民政部	1986年	2024年					
-410325	嵩县	河南省	洛阳市	嵩县	民政部	1986年	2024年					
-410326	汝阳县	河南省	洛阳市	汝阳县	民政部	1986年	2024年					
-410327	宜阳县	河南省	洛阳市	宜阳县	民政部	1986年	2024年					
-410328	洛宁县	河南省	洛阳市	洛宁县	民政部	1986年	2024年					
-410329	伊川县	河南省	洛阳市	伊川县	民政部	1986年	2024年					
-410381	偃师市	河南省	洛阳市	偃师市	民政部	1995年	2020年	[已撤销]	410307	洛阳市,偃师区		
-410400	平顶山市	河南省	平顶山市	-	民政部	1980年	2024年					
-410401	市辖区	河南省	平顶山市	市辖区	国标							增设（GB/T 2260-1984）
-410402	新华区	河南省	平顶山市	新华区	民政部	1980年	2024年					
-410403	卫东区	河南省	平顶山市	卫东区	民政部	1980年	2024年					
-410404	石龙区	河南省	平顶山市	石龙区	民政部	1997年	2024年					
-410411	湛河区	河南省	平顶山市	湛河区	民政部	1980年	2024年					郊区[1993年]
-410412	舞钢区	河南省	平顶山市	舞钢区	民政部	1982年	1989年	[已撤销]	419008	省直辖县级行政区划,舞钢市[已撤销]		
-410421	宝丰县	河南省	平顶山市	宝丰县	民政部	1983年	2024年					
-410422	叶县	河南省	平顶山市	叶县	民政部	1983年	2024年					
-410423	鲁山县	河南省	平顶山市	鲁山县	民政部	1983年	2024年					
-410424	临汝县	河南省	平顶山市	临汝县	民政部	1986年	1987年	[已撤销]	419002	省直辖县级行政区划,汝州市[已撤销]		
-410425	郏县	河南省	平顶山市	郏县	民政部	1986年	2024年					
-410426	襄城县	河南省	平顶山市	襄城县	民政部	1986年	1996年	[已撤销]	411025	许昌市,襄城县		
-410481	舞钢市	河南省	平顶山市	舞钢市	民政部	1995年	2024年					
-410482	汝州市	河南省	平顶山市	汝州市	民政部	1995年	2024年					
-410500	安阳市	河南省	安阳市	-	民政部	1980年	2024年					鹤壁市[1981年]
-410501	市辖区	河南省	安阳市	市辖区	国标							增设（GB/T 2260-1984）
-410502	文峰区	河南省	安阳市	文峰区	民政部	1980年	2024年					鹤山区[1981年]
-410503	北关区	河南省	安阳市	北关区	民政部	1980年	2024年					山城区[1981年]
-410504	铁西区	河南省	安阳市	铁西区	民政部	1984年	2001年	[已撤销]	410505	安阳市,殷都区		
-410505	殷都区	河南省	安阳市	殷都区	民政部	2002年	2024年					
-410506	龙安区	河南省	安阳市	龙安区	民政部	2002年	2024年					
-410511	郊区	河南省	安阳市	郊区	民政部	1980年	2001年	[已撤销]	410506	安阳市,龙安区		
-410521	林县	河南省	安阳市	林县	民政部	1984年	1993年	[已撤销]	419014	省直辖县级行政区划,林州市[已撤销]		
-410522	安阳县	河南省	安阳市	安阳县	民政部	1984年	2024年					
-410523	汤阴县	河南省	安阳市	汤阴县	民政部	1984年	2024年					
-410524	淇县	河南省	安阳市	淇县	民政部	1984年	1985年	[已撤销]	410622	鹤壁市,淇县		
-410525	浚县	河南省	安阳市	浚县	民政部	1984年	1985年	[已撤销]	410621	鹤壁市,浚县		
-410526	滑县	河南省	安阳市	滑县	民政部	1986年	2024年					
-410527	内黄县	河南省	安阳市	内黄县	民政部	1986年	2024年					
-410581	林州市	河南省	安阳市	林州市	民政部	1995年	2024年					
-410600	鹤壁市	河南省	鹤壁市	-	民政部	1980年	2024年					焦作市[1981年]
-410601	市辖区	河南省	鹤壁市	市辖区	国标							增设（GB/T 2260-1984）
-410602	鹤山区	河南省	鹤壁市	鹤山区	民政部	1980年	2024年					解放区[1981年]
-410603	山城区	河南省	鹤壁市	山城区	民政部	1980年	2024年					中站区[1981年]
-410604	马村区	河南省	鹤壁市	马村区	民政部	1980年	1981年	[已撤销]	410804	焦作市,马村区		
-410611	淇滨区	河南省	鹤壁市	淇滨区	民政部	1980年	2024年					郊区[2000年]
-410621	浚县	河南省	鹤壁市	浚县	民政部	1986年	2024年					
-410622	淇县	河南省	鹤壁市	淇县	民政部	1986年	2024年					
-410700	新乡市	河南省	新乡市	-	民政部	1983年	2024年					
-410701	市辖区	河南省	新乡市	市辖区	国标							增设（GB/T 2260-1984）
-410702	红旗区	河南省	新乡市	红旗区	民政部	1983年	2024年					
-410703	卫滨区	河南省	新乡市	卫滨区	民政部	1983年	2024年					新华区[2002年]
-410704	凤泉区	河南省	新乡市	凤泉区	民政部	1983年	2024年					北站区[2002年]
-410711	牧野区	河南省	新乡市	牧野区	民政部	1983年	2024年					郊区[2002年]
-410721	新乡县	河南省	新乡市	新乡县	民政部	1983年	2024年					
-410722	汲县	河南省	新乡市	汲县	民政部	1983年	1987年	[已撤销]	419005	省直辖县级行政区划,卫辉市[已撤销]		
-410723	辉县	河南省	新乡市	辉县	民政部	1986年	1987年	[已撤销]	419006	省直辖县级行政区划,辉县市[已撤销]		
-410724	获嘉县	河南省	新乡市	获嘉县	民政部	1986年	2024年					
-410725	原阳县	河南省	新乡市	原阳县	民政部	1986年	2024年					
-410726	延津县	河南省	新乡市	延津县	民政部	1986年	2024年					
-410727	封丘县	河南省	新乡市	封丘县	民政部	1986年	2024年					旧称：封丘县(封邱县)；
-410728	长垣县	河南省	新乡市	长垣县	民政部	1986年	2018年	[已撤销]	410783	新乡市,长垣市		
-410781	卫辉市	河南省	新乡市	卫辉市	民政部	1995年	2024年					
-410782	辉县市	河南省	新乡市	辉县市	民政部	1995年	2024年					
-410783	长垣市	河南省	新乡市	长垣市	民政部	2019年	2024年					
-410800	焦作市	河南省	焦作市	-	民政部	1982年	2024年					
-410801	市辖区	河南省	焦作市	市辖区	国标							增设（GB/T 2260-1984）
-410802	解放区	河南省	焦作市	解放区	民政部	1982年	2024年					
-410803	中站区	河南省	焦作市	中站区	民政部	1982年	2024年					
-410804	马村区	河南省	焦作市	马村区	民政部	1982年	2024年					
-410811	山阳区	河南省	焦作市	山阳区	民政部	1982年	2024年					郊区[1989年]
-410821	修武县	河南省	焦作市	修武县	民政部	1983年	2024年					
-410822	博爱县	河南省	焦作市	博爱县	民政部	1983年	2024年					
-410823	武陟县	河南省	焦作市	武陟县	民政部	1986年	2024年					
-410824	沁阳县	河南省	焦作市	沁阳县	民政部	1986年	1988年	[已撤销]	419007	省直辖县级行政区划,沁阳市[已撤销]		
-410825	温县	河南省	焦作市	温县	民政部	1986年	2024年					
-410826	孟县	河南省	焦作市	孟县	民政部	1986年	1995年	[已撤销]	410883	焦作市,孟州市		
-410827	济源县	河南省	焦作市	济源县	民政部	1986年	1987年	[已撤销]	419003	省直辖县级行政区划,济源市[已撤销]		
-410881	济源市	河南省	焦作市	济源市	民政部	1995年	1996年	[已撤销]	419001	省直辖县级行政区划,济源市	1983-2010年	
-410882	沁阳市	河南省	焦作市	沁阳市	民政部	1995年	2024年					
-410883	孟州市	河南省	焦作市	孟州市	民政部	1996年	2024年					
-410900	濮阳市	河南省	濮阳市	-	民政部	1983年	2024年					
-410901	市辖区	河南省	濮阳市	市辖区	国标						1962-2002年	增设（GB/T 2260-1984）
-410902	华龙区	河南省	濮阳市	华龙区	民政部	1985年	2024年					市区[2001年]
-410911	郊区	河南省	濮阳市	郊区	民政部	1984年	1986年	[已撤销]	410928	濮阳市,濮阳县		
-410921	滑县	河南省	濮阳市	滑县	民政部	1983年	1985年	[已撤销]	410526	安阳市,滑县		
-410922	清丰县	河南省	濮阳市	清丰县	民政部	1983年	2024年					
-410923	南乐县	河南省	濮阳市	南乐县	民政部	1983年	2024年					
-410924	内黄县	河南省	濮阳市	内黄县	民政部	1983年	1985年	[已撤销]	410527	安阳市,内黄县		
-410925	长垣县	河南省	濮阳市	长垣县	民政部	1983年	1985年	[已撤销]	410728	新乡市,长垣县[已撤销]		
-410926	范县	河南省	濮阳市	范县	民政部	1983年	2024年					
-410927	台前县	河南省	濮阳市	台前县	民政部	1983年	2024年					
-410928	濮阳县	河南省	濮阳市	濮阳县	民政部	1987年	2024年					
-410981	禹州市	河南省	濮阳市	禹州市	国标							修订（GB/T 2260-1991）
-411000	许昌市	河南省	许昌市	-	民政部	1986年	2024年					
-411001	市辖区	河南省	许昌市	市辖区	国标							
-411002	魏都区	河南省	许昌市	魏都区	民政部	1986年	2024年					
-411003	建安区	河南省	许昌市	建安区	民政部	2016年	2024年					
-411021	禹县	河南省	许昌市	禹县	民政部	1986年	1987年	[已撤销]	419004	省直辖县级行政区划,禹州市[已撤销]		
-411022	长葛县	河南省	许昌市	长葛县	民政部	1986年	1992年	[已撤销]	419011	省直辖县级行政区划,长葛市[已撤销]		
-411023	许昌县	河南省	许昌市	许昌县	民政部	1986年	2015年	[已撤销]	411003	许昌市,建安区		
-411024	鄢陵县	河南省	许昌市	鄢陵县	民政部	1986年	2024年					
-411025	襄城县	河南省	许昌市	襄城县	民政部	1997年	2024年					
-411081	禹州市	河南省	许昌市	禹州市	民政部	1995年	2024年					
-411082	长葛市	河南省	许昌市	长葛市	民政部	1995年	2024年					
-411100	漯河市	河南省	漯河市	-	民政部	1986年	2024年					
-411101	市辖区	河南省	漯河市	市辖区	国标							
-411102	源汇区	河南省	漯河市	源汇区	民政部	1986年	2024年					
-411103	郾城区	河南省	漯河市	郾城区	民政部	2004年	2024年					
-411104	召陵区	河南省	漯河市	召陵区	民政部	2004年	2024年					
-411121	舞阳县	河南省	漯河市	舞阳县	民政部	1986年	2024年					
-411122	临颍县	河南省	漯河市	临颍县	民政部	1986年	2024年					
-411123	郾城县	河南省	漯河市	郾城县	民政部	1986年	2003年	[已撤销]	411103	漯河市,郾城区		
-411200	三门峡市	河南省	三门峡市	-	民政部	1986年	2024年					
-411201	市辖区	河南省	三门峡市	市辖区	国标							
-411202	湖滨区	河南省	三门峡市	湖滨区	民政部	1986年	2024年					
-411203	陕州区	河南省	三门峡市	陕州区	民政部	2015年	2024年					
-411219	义马市	河南省	三门峡市	义马市	国标							修订前（GB/T 2260-1986）
-411221	渑池县	河南省	三门峡市	渑池县	民政部	1986年	2024年					
-411222	陕县	河南省	三门峡市	陕县	民政部	1986年	2014年	[已撤销]	411203	三门峡市,陕州区		
-411223	灵宝县	河南省	三门峡市	灵宝县	民政部	1986年	1992年	[已撤销]	419010	省直辖县级行政区划,灵宝市[已撤销]		
-411224	卢氏县	河南省	三门峡市	卢氏县	民政部	1986年	2024年					
-411281	义马市	河南省	三门峡市	义马市	民政部	1995年	2024年					
-411282	灵宝市	河南省	三门峡市	灵宝市	民政部	1995年	2024年					
-411300	南阳市	河南省	南阳市	-	民政部	1994年	2024年					
-411301	市辖区	河南省	南阳市	市辖区	国标							
-411302	宛城区	河南省	南阳市	宛城区	民政部	1994年	2024年					
-411303	卧龙区	河南省	南阳市	卧龙区	民政部	1994年	2024年					
-411321	南召县	河南省	南阳市	南召县	民政部	1994年	2024年					
-411322	方城县	河南省	南阳市	方城县	民政部	1994年	2024年					
-411323	西峡县	河南省	南阳市	西峡县	民政部	1994年	2024年					
-411324	镇平县	河南省	南阳市	镇平县	民政部	1994年	2024年					
-411325	内乡县	河南省	南阳市	内乡县	民政部	1994年	2024年					
-411326	淅川县	河南省	南阳市	淅川县	民政部	1994年	2024年					
-411327	社旗县	河南省	南阳市	社旗县	民政部	1994年	2024年					
-411328	唐河县	河南省	南阳市	唐河县	民政部	1994年	2024年					
-411329	新野县	河南省	南阳市	新野县	民政部	1994年	2024年					
-411330	桐柏县	河南省	南阳市	桐柏县	民政部	1994年	2024年					
-411381	邓州市	河南省	南阳市	邓州市	民政部	1995年	2024年					
-411400	商丘市	河南省	商丘市	-	民政部	1997年	2024年					旧称：商丘市(商邱市)；
-411401	市辖区	河南省	商丘市	市辖区	国标							
-411402	梁园区	河南省	商丘市	梁园区	民政部	1997年	2024年					
-411403	睢阳区	河南省	商丘市	睢阳区	民政部	1997年	2024年					
-411421	民权县	河南省	商丘市	民权县	民政部	1997年	2024年					
-411422	睢县	河南省	商丘市	睢县	民政部	1997年	2024年					
-411423	宁陵县	河南省	商丘市	宁陵县	民政部	1997年	2024年					
-411424	柘城县	河南省	商丘市	柘城县	民政部	1997年	2024年					
-411425	虞城县	河南省	商丘市	虞城县	民政部	1997年	2024年					
-411426	夏邑县	河南省	商丘市	夏邑县	民政部	1997年	2024年					
-411481	永城市	河南省	商丘市	永城市	民政部	1997年	2024年					
-411500	信阳市	河南省	信阳市	-	民政部	1998年	2024年					
-411501	市辖区	河南省	信阳市	市辖区	国标							
-411502	浉河区	河南省	信阳市	浉河区	民政部	1998年	2024年					
-411503	平桥区	河南省	信阳市	平桥区	民政部	1998年	2024年					
-411521	罗山县	河南省	信阳市	罗山县	民政部	1998年	2024年					
-411522	光山县	河南省	信阳市	光山县	民政部	1998年	2024年					
-411523	新县	河南省	信阳市	新县	民政部	1998年	2024年					
-411524	商城县	河南省	信阳市	商城县	民政部	1998年	2024年					
-411525	固始县	河南省	信阳市	固始县	民政部	1998年	2024年					
-411526	潢川县	河南省	信阳市	潢川县	民政部	1998年	2024年					
-411527	淮滨县	河南省	信阳市	淮滨县	民政部	1998年	2024年					
-411528	息县	河南省	信阳市	息县	民政部	1998年	2024年					
-411600	周口市	河南省	周口市	-	民政部	2000年	2024年					
-411601	市辖区	河南省	周口市	市辖区	国标							
-411602	川汇区	河南省	周口市	川汇区	民政部	2000年	2024年					
-411603	淮阳区	河南省	周口市	淮阳区	民政部	2019年	2024年					
-411621	扶沟县	河南省	周口市	扶沟县	民政部	2000年	2024年					
-411622	西华县	河南省	周口市	西华县	民政部	2000年	2024年					
-411623	商水县	河南省	周口市	商水县	民政部	2000年	2024年					
-411624	沈丘县	河南省	周口市	沈丘县	民政部	2000年	2024年					旧称：沈丘县(沈邱县)；
-411625	郸城县	河南省	周口市	郸城县	民政部	2000年	2024年					
-411626	淮阳县	河南省	周口市	淮阳县	民政部	2000年	2018年	[已撤销]	411603	周口市,淮阳区		
-411627	太康县	河南省	周口市	太康县	民政部	2000年	2024年					
-411628	鹿邑县	河南省	周口市	鹿邑县	民政部	2000年	2024年					
-411681	项城市	河南省	周口市	项城市	民政部	2000年	2024年					
-411700	驻马店市	河南省	驻马店市	-	民政部	2000年	2024年					
-411701	市辖区	河南省	驻马店市	市辖区	国标							
-411702	驿城区	河南省	驻马店市	驿城区	民政部	2000年	2024年					
-411721	西平县	河南省	驻马店市	西平县	民政部	2000年	2024年					
-411722	上蔡县	河南省	驻马店市	上蔡县	民政部	2000年	2024年					
-411723	平舆县	河南省	驻马店市	平舆县	民政部	2000年	2024年					
-411724	正阳县	河南省	驻马店市	正阳县	民政部	2000年	2024年					
-411725	确山县	河南省	驻马店市	确山县	民政部	2000年	2024年					
-411726	泌阳县	河南省	驻马店市	泌阳县	民政部	2000年	2024年					
-411727	汝南县	河南省	驻马店市	汝南县	民政部	2000年	2024年					
-411728	遂平县	河南省	驻马店市	遂平县	民政部	2000年	2024年					
-411729	新蔡县	河南省	驻马店市	新蔡县	民政部	2000年	2024年					
-412100	安阳地区	河南省	安阳地区	-	民政部	1980年	1982年	[已撤销]	410500	安阳市（地市）		
-412101	安阳市	河南省	安阳地区	安阳市	民政部	1980年	1983年	[已撤销]	410500	安阳市（地市）		
-412102	文峰区	河南省	安阳地区	文峰区	民政部	1980年	1983年	[已撤销]	410502	安阳市,文峰区		
-412103	北关区	河南省	安阳地区	北关区	民政部	1980年	1983年	[已撤销]	410503	安阳市,北关区		
-412104	铁西区	河南省	安阳地区	铁西区	民政部	1980年	1983年	[已撤销]	410504	安阳市,铁西区[已撤销]		
-412111	郊区	河南省	安阳地区	郊区	民政部	1980年	1983年	[已撤销]	410511	安阳市,郊区[已撤销]		
-412121	林县	河南省	安阳地区	林县	民政部	1980年	1983年	[已撤销]	410521	安阳市,林县[已撤销]		
-412122	安阳县	河南省	安阳地区	安阳县	民政部	1980年	1983年	[已撤销]	410522	安阳市,安阳县		
-412123	汤阴县	河南省	安阳地区	汤阴县	民政部	1980年	1983年	[已撤销]	410523	安阳市,汤阴县		
-412124	淇县	河南省	安阳地区	淇县	民政部	1980年	1983年	[已撤销]	410524	安阳市,淇县[已撤销]		
-412125	浚县	河南省	安阳地区	浚县	民政部	1980年	1983年	[已撤销]	410525	安阳市,浚县[已撤销]		
-412126	濮阳县	河南省	安阳地区	濮阳县	民政部	1980年	1982年	[已撤销]	410911	濮阳市,郊区[已撤销]		
-412127	滑县	河南省	安阳地区	滑县	民政部	1980年	1982年	[已撤销]	410921	濮阳市,滑县[已撤销]		
-412128	清丰县	河南省	安阳地区	清丰县	民政部	1980年	1982年	[已撤销]	410922	濮阳市,清丰县		
-412129	南乐县	河南省	安阳地区	南乐县	民政部	1980年	1982年	[已撤销]	410923	濮阳市,南乐县		
-412130	内黄县	河南省	安阳地区	内黄县	民政部	1980年	1982年	[已撤销]	410924	濮阳市,内黄县[已撤销]		
-412131	长垣县	河南省	安阳地区	长垣县	民政部	1980年	1982年	[已撤销]	410925	濮阳市,长垣县[已撤销]		
-412132	范县	河南省	安阳地区	范县	民政部	1980年	1982年	[已撤销]	410926	濮阳市,范县		
-412133	台前县	河南省	安阳地区	台前县	民政部	1980年	1982年	[已撤销]	410927	濮阳市,台前县		
-412200	新乡地区	河南省	新乡地区	-	民政部	1980年	1985年	[已撤销]	410700	新乡市（地市）		
-412201	新乡市	河南省	新乡地区	新乡市	民政部	1980年	1982年	[已撤销]	410700	新乡市（地市）		
-412202	红旗区	河南省	新乡地区	红旗区	民政部	1980年	1982年	[已撤销]	410702	新乡市,红旗区		
-412203	新华区	河南省	新乡地区	新华区	民政部	1980年	1982年	[已撤销]	410402	平顶山市,新华区		
-412204	北站区	河南省	新乡地区	北站区	民政部	1982年	1982年	[已撤销]	410704	新乡市,凤泉区		
-412211	郊区	河南省	新乡地区	郊区	民政部	1980年	1982年	[已撤销]	410711	新乡市,牧野区		
-412221	沁阳县	河南省	新乡地区	沁阳县	民政部	1980年	1985年	[已撤销]	410824	焦作市,沁阳县[已撤销]		
-412222	博爱县	河南省	新乡地区	博爱县	民政部	1980年	1982年	[已撤销]	410822	焦作市,博爱县		
-412223	济源县	河南省	新乡地区	济源县	民政部	1980年	1985年	[已撤销]	410827	焦作市,济源县[已撤销]		
-412224	孟县	河南省	新乡地区	孟县	民政部	1980年	1985年	[已撤销]	410826	焦作市,孟县[已撤销]		
-412225	温县	河南省	新乡地区	温县	民政部	1980年	1985年	[已撤销]	410825	焦作市,温县		
-412226	武陟县	河南省	新乡地区	武陟县	民政部	1980年	1985年	[已撤销]	410823	焦作市,武陟县		
-412227	修武县	河南省	新乡地区	修武县	民政部	1980年	1982年	[已撤销]	410821	焦作市,修武县		
-412228	获嘉县	河南省	新乡地区	获嘉县	民政部	1980年	1985年	[已撤销]	410724	新乡市,获嘉县		
-412229	新乡县	河南省	新乡地区	新乡县	民政部	1980年	1982年	[已撤销]	410721	新乡市,新乡县		
-412230	辉县	河南省	新乡地区	辉县	民政部	1980年	1985年	[已撤销]	410723	新乡市,辉县[已撤销]		
-412231	汲县	河南省	新乡地区	汲县	民政部	1980年	1982年	[已撤销]	410722	新乡市,汲县[已撤销]		
-412232	原阳县	河南省	新乡地区	原阳县	民政部	1980年	1985年	[已撤销]	410725	新乡市,辉县[已撤销]		
-412233	延津县	河南省	新乡地区	延津县	民政部	1980年	1985年	[已撤销]	410726	新乡市,延津县		
-412234	封丘县	河南省	新乡地区	封丘县	民政部	1980年	1985年	[已撤销]	410727	新乡市,封丘县		旧称：封丘县(封邱县)；
-412300	商丘地区	河南省	商丘地区	-	民政部	1980年	1996年	[已撤销]	411400	商丘市（地市）		旧称：商丘地区(商邱地区)；
-412301	商丘市	河南省	商丘地区	商丘市	民政部	1980年	1996年	[已撤销]	411400	商丘市（地市）		旧称：商丘市(商邱市)；
-412302	永城市	河南省	商丘地区	永城市	民政部	1996年	1996年	[已撤销]	411481	商丘市,永城市		
-412321	虞城县	河南省	商丘地区	虞城县	民政部	1980年	1996年	[已撤销]	411425	商丘市,虞城县		
-412322	商丘县	河南省	商丘地区	商丘县	民政部	1980年	1996年	[已撤销]	411400	商丘市（地市）		旧称：商丘县(商邱县)；
-412323	民权县	河南省	商丘地区	民权县	民政部	1980年	1996年	[已撤销]	411421	商丘市,民权县		
-412324	宁陵县	河南省	商丘地区	宁陵县	民政部	1980年	1996年	[已撤销]	411423	商丘市,宁陵县		
-412325	睢县	河南省	商丘地区	睢县	民政部	1980年	1996年	[已撤销]	411422	商丘市,睢县		
-412326	夏邑县	河南省	商丘地区	夏邑县	民政部	1980年	1996年	[已撤销]	411426	商丘市,夏邑县		
-412327	柘城县	河南省	商丘地区	柘城县	民政部	1980年	1996年	[已撤销]	411424	商丘市,柘城县		
-412328	永城县	河南省	商丘地区	永城县	民政部	1980年	1995年	[已撤销]	411481	商丘市,永城市		
-412400	开封地区	河南省	开封地区	-	民政部	1980年	1982年	[已撤销]	410200	开封市（地市）		
-412421	杞县	河南省	开封地区	杞县	民政部	1980年	1982年	[已撤销]	410221	开封市,杞县		
-412422	通许县	河南省	开封地区	通许县	民政部	1980年	1982年	[已撤销]	410222	开封市,通许县		
-412423	尉氏县	河南省	开封地区	尉氏县	民政部	1980年	1982年	[已撤销]	410223	开封市,尉氏县		
-412424	开封县	河南省	开封地区	开封县	民政部	1980年	1982年	[已撤销]	410224	开封市,开封县[已撤销]		
-412425	中牟县	河南省	开封地区	中牟县	民政部	1980年	1982年	[已撤销]	410122	郑州市,中牟县		
-412426	巩县	河南省	开封地区	巩县	民政部	1980年	1982年	[已撤销]	410124	郑州市,巩县[已撤销]		新郑县[1981年]
-412427	登封县	河南省	开封地区	登封县	民政部	1980年	1982年	[已撤销]	410125	郑州市,登封县[已撤销]		巩县[1981年]
-412428	新郑县	河南省	开封地区	新郑县	民政部	1980年	1982年	[已撤销]	410123	郑州市,新郑县[已撤销]		登封县[1981年]
-412429	密县	河南省	开封地区	密县	民政部	1980年	1982年	[已撤销]	410126	郑州市,密县[已撤销]		
-412430	兰考县	河南省	开封地区	兰考县	民政部	1980年	1982年	[已撤销]	410225	开封市,兰考县		
-412500	洛阳地区	河南省	洛阳地区	-	民政部	1980年	1985年	[已撤销]	410300	洛阳市（地市）		
-412501	三门峡市	河南省	洛阳地区	三门峡市	民政部	1980年	1985年	[已撤销]	411200	三门峡市（地市）		
-412502	义马市	河南省	洛阳地区	义马市	民政部	1981年	1985年	[已撤销]	411281	三门峡市,义马市		
-412521	偃师县	河南省	洛阳地区	偃师县	民政部	1980年	1982年	[已撤销]	410321	洛阳市,偃师县[已撤销]		
-412522	孟津县	河南省	洛阳地区	孟津县	民政部	1980年	1982年	[已撤销]	410322	洛阳市,孟津县[已撤销]		
-412523	新安县	河南省	洛阳地区	新安县	民政部	1980年	1982年	[已撤销]	410323	洛阳市,新安县		
-412524	渑池县	河南省	洛阳地区	渑池县	民政部	1980年	1985年	[已撤销]	411221	三门峡市,渑池县		
-412525	陕县	河南省	洛阳地区	陕县	民政部	1980年	1985年	[已撤销]	411222	三门峡市,陕县[已撤销]		
-412526	灵宝县	河南省	洛阳地区	灵宝县	民政部	1980年	1985年	[已撤销]	411223	三门峡市,灵宝县[已撤销]		
-412527	伊川县	河南省	洛阳地区	伊川县	民政部	1980年	1985年	[已撤销]	410329	洛阳市,伊川县		
-412528	汝阳县	河南省	洛阳地区	汝阳县	民政部	1980年	1985年	[已撤销]	410326	洛阳市,汝阳县		
-412529	嵩县	河南省	洛阳地区	嵩县	民政部	1980年	1985年	[已撤销]	410325	洛阳市,嵩县		
-412530	洛宁县	河南省	洛阳地区	洛宁县	民政部	1980年	1985年	[已撤销]	410328	洛阳市,洛宁县		
-412531	卢氏县	河南省	洛阳地区	卢氏县	民政部	1980年	1985年	[已撤销]	411224	三门峡市,卢氏县		
-412532	栾川县	河南省	洛阳地区	栾川县	民政部	1980年	1985年	[已撤销]	410324	洛阳市,栾川县		
-412533	临汝县	河南省	洛阳地区	临汝县	民政部	1980年	1985年	[已撤销]	410424	平顶山市,临汝县[已撤销]		
-412534	宜阳县	河南省	洛阳地区	宜阳县	民政部	1980年	1985年	[已撤销]	410327	洛阳市,宜阳县		
-412535	洛阳地区	河南省	洛阳地区	义马矿区	非官方							
-412600	许昌地区	河南省	许昌地区	-	民政部	1980年	1985年	[已撤销]	411000	许昌市（地市）		
-412601	许昌市	河南省	许昌地区	许昌市	民政部	1980年	1985年	[已撤销]	411000	许昌市（地市）		
-412602	漯河市	河南省	许昌地区	漯河市	民政部	1980年	1985年	[已撤销]	411100	漯河市（地市）		
-412621	长葛县	河南省	许昌地区	长葛县	民政部	1980年	1985年	[已撤销]	411022	许昌市,长葛县[已撤销]		
-412622	禹县	河南省	许昌地区	禹县	民政部	1980年	1985年	[已撤销]	411021	许昌市,禹县[已撤销]		
-412623	鄢陵县	河南省	许昌地区	鄢陵县	民政部	1980年	1985年	[已撤销]	411024	许昌市,鄢陵县		
-412624	许昌县	河南省	许昌地区	许昌县	民政部	1980年	1985年	[已撤销]	411023	许昌市,许昌县[已撤销]		
-412625	郏县	河南省	许昌地区	郏县	民政部	1980年	1985年	[已撤销]	410425	平顶山市,郏县		
-412626	临颍县	河南省	许昌地区	临颍县	民政部	1980年	1985年	[已撤销]	411122	漯河市,临颍县		
-412627	襄城县	河南省	许昌地区	襄城县	民政部	1980年	1985年	[已撤销]	410426	平顶山市,襄城县[已撤销]		
-412628	宝丰县	河南省	许昌地区	宝丰县	民政部	1980年	1982年	[已撤销]	410421	平顶山市,宝丰县		
-412629	郾城县	河南省	许昌地区	郾城县	民政部	1980年	1985年	[已撤销]	411123	漯河市,郾城县[已撤销]		
-412630	叶县	河南省	许昌地区	叶县	民政部	1980年	1982年	[已撤销]	410422	平顶山市,叶县		
-412631	鲁山县	河南省	许昌地区	鲁山县	民政部	1980年	1982年	[已撤销]	410423	平顶山市,鲁山县		
-412632	舞阳县	河南省	许昌地区	舞阳县	民政部	1980年	1985年	[已撤销]	411121	漯河市,舞阳县		
-412700	周口地区	河南省	周口地区	-	民政部	1980年	1999年	[已撤销]	411600	周口市（地市）		
-412701	周口市	河南省	周口地区	周口市	民政部	1980年	1999年	[已撤销]	411600	周口市（地市）		
-412702	项城市	河南省	周口地区	项城市	民政部	1993年	1999年	[已撤销]	411681	周口市,项城市		
-412721	扶沟县	河南省	周口地区	扶沟县	民政部	1980年	1999年	[已撤销]	411621	周口市,扶沟县		
-412722	西华县	河南省	周口地区	西华县	民政部	1980年	1999年	[已撤销]	411622	周口市,西华县		
-412723	商水县	河南省	周口地区	商水县	民政部	1980年	1999年	[已撤销]	411623	周口市,商水县		
-412724	太康县	河南省	周口地区	太康县	民政部	1980年	1999年	[已撤销]	411627	周口市,太康县		
-412725	鹿邑县	河南省	周口地区	鹿邑县	民政部	1980年	1999年	[已撤销]	411628	周口市,鹿邑县		
-412726	郸城县	河南省	周口地区	郸城县	民政部	1980年	1999年	[已撤销]	411625	周口市,郸城县		
-412727	淮阳县	河南省	周口地区	淮阳县	民政部	1980年	1999年	[已撤销]	411626	周口市,淮阳县[已撤销]		
-412728	沈丘县	河南省	周口地区	沈丘县	民政部	1980年	1999年	[已撤销]	411624	周口市,沈丘县		旧称：沈丘县(沈邱县)；
-412729	项城县	河南省	周口地区	项城县	民政部	1980年	1992年	[已撤销]	412702	周口地区,项城市[已撤销]		
-412800	驻马店地区	河南省	驻马店地区	-	民政部	1980年	1999年	[已撤销]	411700	驻马店市（地市）		
-412801	驻马店市	河南省	驻马店地区	驻马店市	民政部	1980年	1999年	[已撤销]	411700	驻马店市（地市）		
-412821	确山县	河南省	驻马店地区	确山县	民政部	1980年	1999年	[已撤销]	411725	驻马店市,确山县		
-412822	泌阳县	河南省	驻马店地区	泌阳县	民政部	1980年	1999年	[已撤销]	411726	驻马店市,泌阳县		
-412823	遂平县	河南省	驻马店地区	遂平县	民政部	1980年	1999年	[已撤销]	411728	驻马店市,遂平县		
-412824	西平县	河南省	驻马店地区	西平县	民政部	1980年	1999年	[已撤销]	411721	驻马店市,西平县		
-412825	上蔡县	河南省	驻马店地区	上蔡县	民政部	1980年	1999年	[已撤销]	411722	驻马店市,上蔡县		
-412826	汝南县	河南省	驻马店地区	汝南县	民政部	1980年	1999年	[已撤销]	411727	驻马店市,汝南县		
-412827	平舆县	河南省	驻马店地区	平舆县	民政部	1980年	1999年	[已撤销]	411723	驻马店市,平舆县		
-412828	新蔡县	河南省	驻马店地区	新蔡县	民政部	1980年	1999年	[已撤销]	411729	驻马店市,新蔡县		
-412829	正阳县	河南省	驻马店地区	正阳县	民政部	1980年	1999年	[已撤销]	411724	驻马店市,正阳县		
-412900	南阳地区	河南省	南阳地区	-	民政部	1980年	1993年	[已撤销]	411300	南阳市（地市）		
-412901	南阳市	河南省	南阳地区	南阳市	民政部	1980年	1993年	[已撤销]	411300	南阳市（地市）		
-412902	邓州市	河南省	南阳地区	邓州市	民政部	1988年	1993年	[已撤销]	419013	省直辖县级行政区划,邓州市[已撤销]		
-412921	南召县	河南省	南阳地区	南召县	民政部	1980年	1993年	[已撤销]	411321	南阳市,南召县		
-412922	方城县	河南省	南阳地区	方城县	民政部	1980年	1993年	[已撤销]	411322	南阳市,方城县		
-412923	西峡县	河南省	南阳地区	西峡县	民政部	1980年	1993年	[已撤销]	411323	南阳市,西峡县		
-412924	南阳县	河南省	南阳地区	南阳县	民政部	1980年	1993年	[已撤销]	411300	南阳市（地市）		
-412925	镇平县	河南省	南阳地区	镇平县	民政部	1980年	1993年	[已撤销]	411324	南阳市,镇平县		
-412926	内乡县	河南省	南阳地区	内乡县	民政部	1980年	1993年	[已撤销]	411325	南阳市,内乡县		
-412927	淅川县	河南省	南阳地区	淅川县	民政部	1980年	1993年	[已撤销]	411326	南阳市,淅川县		
-412928	社旗县	河南省	南阳地区	社旗县	民政部	1980年	1993年	[已撤销]	411327	南阳市,社旗县		
-412929	唐河县	河南省	南阳地区	唐河县	民政部	1980年	1993年	[已撤销]	411328	南阳市,唐河县		
-412930	邓县	河南省	南阳地区	邓县	民政部	1980年	1987年	[已撤销]	412902	南阳地区,邓州市[已撤销]		
-412931	新野县	河南省	南阳地区	新野县	民政部	1980年	1993年	[已撤销]	411329	南阳市,新野县		
-412932	桐柏县	河南省	南阳地区	桐柏县	民政部	1980年	1993年	[已撤销]	411330	南阳市,桐柏县		
-413000	信阳地区	河南省	信阳地区	-	民政部	1980年	1997年	[已撤销]	411500	信阳市（地市）		
-413001	信阳市	河南省	信阳地区	信阳市	民政部	1980年	1997年	[已撤销]	411500	信阳市（地市）		
-413021	息县	河南省	信阳地区	息县	民政部	1980年	1997年	[已撤销]	411528	信阳市,息县		
-413022	淮滨县	河南省	信阳地区	淮滨县	民政部	1980年	1997年	[已撤销]	411527	信阳市,淮滨县		
-413023	信阳县	河南省	信阳地区	信阳县	民政部	1980年	1997年	[已撤销]	411500	信阳市（地市）		
-413024	潢川县	河南省	信阳地区	潢川县	民政部	1980年	1997年	[已撤销]	411526	信阳市,潢川县		
-413025	光山县	河南省	信阳地区	光山县	民政部	1980年	1997年	[已撤销]	411522	信阳市,光山县		
-413026	固始县	河南省	信阳地区	固始县	民政部	1980年	1997年	[已撤销]	411525	信阳市,固始县		
-413027	商城县	河南省	信阳地区	商城县	民政部	1980年	1997年	[已撤销]	411524	信阳市,商城县		
-413028	罗山县	河南省	信阳地区	罗山县	民政部	1980年	1997年	[已撤销]	411521	信阳市,罗山县		
-413029	新县	河南省	信阳地区	新县	民政部	1980年	1997年	[已撤销]	411523	信阳市,新县		
-413073		河南省	信阳地区		非官方						1981年	
-419000	省直辖行政单位	河南省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-419001	济源市	河南省	省直辖县级行政区划	济源市	民政部	1986年	2024年					义马市(用于身份证，济源市不用于身份证)；义马市[1994年]
-419002	汝州市	河南省	省直辖县级行政区划	汝州市	民政部	1988年	1994年	[已撤销]	410482	平顶山市,汝州市		
-419003	济源市	河南省	省直辖县级行政区划	济源市	民政部	1988年	1994年	[已撤销]	410881	焦作市,济源市[已撤销]		
-419004	禹州市	河南省	省直辖县级行政区划	禹州市	民政部	1988年	1994年	[已撤销]	411081	许昌市,禹州市		
-419005	卫辉市	河南省	省直辖县级行政区划	卫辉市	民政部	1988年	1994年	[已撤销]	410781	新乡市,卫辉市		
-419006	辉县市	河南省	省直辖县级行政区划	辉县市	民政部	1988年	1994年	[已撤销]	410782	新乡市,辉县市		
-419007	沁阳市	河南省	省直辖县级行政区划	沁阳市	民政部	1989年	1994年	[已撤销]	410882	焦作市,沁阳市		
-419008	舞钢市	河南省	省直辖县级行政区划	舞钢市	民政部	1990年	1994年	[已撤销]	410481	平顶山市,舞钢市		
-419009	巩义市	河南省	省直辖县级行政区划	巩义市	民政部	1991年	1994年	[已撤销]	410181	郑州市,巩义市		
-419010	灵宝市	河南省	省直辖县级行政区划	灵宝市	民政部	1993年	1994年	[已撤销]	411282	三门峡市,灵宝市		
-419011	长葛市	河南省	省直辖县级行政区划	长葛市	民政部	1993年	1994年	[已撤销]	411082	许昌市,长葛市		
-419012	偃师市	河南省	省直辖县级行政区划	偃师市	民政部	1993年	1994年	[已撤销]	410381	洛阳市,偃师市[已撤销]		
-419013	邓州市	河南省	省直辖县级行政区划	邓州市	民政部	1994年	1994年	[已撤销]	411381	南阳市,邓州市		
-419014	林州市	河南省	省直辖县级行政区划	林州市	民政部	1994年	1994年	[已撤销]	410581	安阳市,林州市		
-419015	新密市	河南省	省直辖县级行政区划	新密市	民政部	1994年	1994年	[已撤销]	410183	郑州市,新密市		
-419016	荥阳市	河南省	省直辖县级行政区划	荥阳市	民政部	1994年	1994年	[已撤销]	410182	郑州市,荥阳市		
-419017	新郑市	河南省	省直辖县级行政区划	新郑市	民政部	1994年	1994年	[已撤销]	410184	郑州市,新郑市		
-419018	登封市	河南省	省直辖县级行政区划	登封市	民政部	1994年	1994年	[已撤销]	410185	郑州市,登封市		
-420000	湖北省	湖北省	-	-	民政部	1980年	2024年					
-420100	武汉市	湖北省	武汉市	-	民政部	1980年	2024年					
-420101	市辖区	湖北省	武汉市	市辖区	国标							增设（GB/T 2260-1984）
-420102	江岸区	湖北省	武汉市	江岸区	民政部	1980年	2024年					
-420103	江汉区	湖北省	武汉市	江汉区	民政部	1980年	2024年					
-420104	硚口区	湖北省	武汉市	硚口区	民政部	1980年	2024年					
-420105	汉阳区	湖北省	武汉市	汉阳区	民政部	1980年	2024年					
-420106	武昌区	湖北省	武汉市	武昌区	民政部	1980年	2024年					
-420107	青山区	湖北省	武汉市	青山区	民政部	1980年	2024年					
-420111	洪山区	湖北省	武汉市	洪山区	民政部	1980年	2024年					
-420112	东西湖区	湖北省	武汉市	东西湖区	民政部	1980年	2024年					
-420113	汉南区	湖北省	武汉市	汉南区	民政部	1984年	2024年					
-420114	蔡甸区	湖北省	武汉市	蔡甸区	民政部	1992年	2024年					
-420115	江夏区	湖北省	武汉市	江夏区	民政部	1995年	2024年					
-420116	黄陂区	湖北省	武汉市	黄陂区	民政部	1998年	2024年					
-420117	新洲区	湖北省	武汉市	新洲区	民政部	1998年	2024年					
-420120	武汉市区	湖北省	武汉市	武汉市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-420121	汉阳县	湖北省	武汉市	汉阳县	民政部	1980年	1991年	[已撤销]	420114	武汉市,蔡甸区		
-420122	武昌县	湖北省	武汉市	武昌县	民政部	1980年	1994年	[已撤销]	420115	武汉市,江夏区		
-420123	黄陂县	湖北省	武汉市	黄陂县	民政部	1983年	1997年	[已撤销]	420116	武汉市,黄陂区		
-420124	新洲县	湖北省	武汉市	新洲县	民政部	1983年	1997年	[已撤销]	420117	武汉市,新洲区		
-420200	黄石市	湖北省	黄石市	-	民政部	1980年	2024年					
-420201	市辖区	湖北省	黄石市	市辖区	国标							增设（GB/T 2260-1984）
-420202	黄石港区	湖北省	黄石市	黄石港区	民政部	1980年	2024年					
-420203	西塞山区	湖北省	黄石市	西塞山区	民政部	1980年	2024年					石灰窑区[2000年]
-420204	下陆区	湖北省	黄石市	下陆区	民政部	1980年	2024年					
-420205	铁山区	湖北省	黄石市	铁山区	民政部	1980年	2024年					
-420211	郊区	湖北省	黄石市	郊区	民政部	1980年	1982年	[已撤销]	420204	黄石市,下陆区		
-420220	黄石市区	湖北省	黄石市	黄石市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-420221	大冶县	湖北省	黄石市	大冶县	民政部	1980年	1993年	[已撤销]	429016	省直辖行政单位,大冶市[已撤销]		
-420222	阳新县	湖北省	黄石市	阳新县	民政部	1996年	2024年					
-420281	大冶市	湖北省	黄石市	大冶市	民政部	1995年	2024年					
-420300	十堰市	湖北省	十堰市	-	民政部	1980年	2024年					
-420301	市辖区	湖北省	十堰市	市辖区	国标							
-420302	茅箭区	湖北省	十堰市	茅箭区	民政部	1984年	2024年					
-420303	张湾区	湖北省	十堰市	张湾区	民政部	1984年	2024年					
-420304	郧阳区	湖北省	十堰市	郧阳区	民政部	2014年	2024年					
-420321	郧县	湖北省	十堰市	郧县	民政部	1994年	2013年	[已撤销]	420304	十堰市,郧阳区		
-420322	郧西县	湖北省	十堰市	郧西县	民政部	1994年	2024年					
-420323	竹山县	湖北省	十堰市	竹山县	民政部	1994年	2024年					
-420324	竹溪县	湖北省	十堰市	竹溪县	民政部	1994年	2024年					
-420325	房县	湖北省	十堰市	房县	民政部	1994年	2024年					
-420381	丹江口市	湖北省	十堰市	丹江口市	民政部	1995年	2024年					
-420400	沙市市	湖北省	沙市市	-	民政部	1980年	1993年	[已撤销]	421002	荆州市,沙市区		
-420500	宜昌市	湖北省	宜昌市	-	民政部	1980年	2024年					
-420501	市辖区	湖北省	宜昌市	市辖区	国标							
-420502	西陵区	湖北省	宜昌市	西陵区	民政部	1986年	2024年					
-420503	伍家岗区	湖北省	宜昌市	伍家岗区	民政部	1986年	2024年					
-420504	点军区	湖北省	宜昌市	点军区	民政部	1986年	2024年					
-420505	猇亭区	湖北省	宜昌市	猇亭区	民政部	1995年	2024年					
-420506	夷陵区	湖北省	宜昌市	夷陵区	民政部	2001年	2024年					
-420521	宜昌县	湖北省	宜昌市	宜昌县	民政部	1992年	2000年	[已撤销]	420506	宜昌市,夷陵区		
-420523	枝江县	湖北省	宜昌市	枝江县	民政部	1992年	1995年	[已撤销]	420583	宜昌市,枝江市		
-420525	远安县	湖北省	宜昌市	远安县	民政部	1992年	2024年					
-420526	兴山县	湖北省	宜昌市	兴山县	民政部	1992年	2024年					
-420527	秭归县	湖北省	宜昌市	秭归县	民政部	1992年	2024年					
-420528	长阳土家族自治县	湖北省	宜昌市	长阳土家族自治县	民政部	1992年	2024年					
-420529	五峰土家族自治县	湖北省	宜昌市	五峰土家族自治县	民政部	1992年	2024年					
-420581	宜都市	湖北省	宜昌市	宜都市	民政部	1996年	2024年					枝城市[1997年]
-420582	当阳市	湖北省	宜昌市	当阳市	民政部	1995年	2024年					
-420583	枝江市	湖北省	宜昌市	枝江市	民政部	1995年	2024年					枝城市[1995年]
-420600	襄阳市	湖北省	襄阳市	-	民政部	1980年	2024年					襄樊市[2009年]
-420601	市辖区	湖北省	襄阳市	市辖区	国标						1933-1976年	
-420602	襄城区	湖北省	襄阳市	襄城区	民政部	1984年	2024年					
-420603	樊东区	湖北省	襄阳市	樊东区	民政部	1984年	1994年	[已撤销]	420606	襄阳市,樊城区		
-420604	樊西区	湖北省	襄阳市	樊西区	民政部	1984年	1994年	[已撤销]	420606	襄阳市,樊城区		
-420605	郊区	湖北省	襄阳市	郊区	国标							增设（GB/T 2260-1988）
-420606	樊城区	湖北省	襄阳市	樊城区	民政部	1995年	2024年					
-420607	襄州区	湖北省	襄阳市	襄州区	民政部	2001年	2024年					襄阳区[2009年]
-420611	郊区	湖北省	襄阳市	郊区	民政部	1984年	1994年	[已撤销]	420602,420606	襄阳市,襄城区,樊城区		
-420619	随州市	湖北省	襄阳市	随州市	国标						1935-1956年	修订前（GB/T 2260-1986）
-420620	老河口市	湖北省	襄阳市	老河口市	国标						1944-1979年	修订前（GB/T 2260-1986）
-420621	襄阳县	湖北省	襄阳市	襄阳县	民政部	1983年	2000年	[已撤销]	420607	襄阳市,襄州区		
-420622	枣阳县	湖北省	襄阳市	枣阳县	民政部	1983年	1987年	[已撤销]	429003	省直辖行政单位,枣阳市[已撤销]		
-420623	宜城县	湖北省	襄阳市	宜城县	民政部	1983年	1993年	[已撤销]	429017	省直辖行政单位,宜城市[已撤销]		
-420624	南漳县	湖北省	襄阳市	南漳县	民政部	1983年	2024年					
-420625	谷城县	湖北省	襄阳市	谷城县	民政部	1983年	2024年					
-420626	保康县	湖北省	襄阳市	保康县	民政部	1983年	2024年					
-420681	随州市	湖北省	襄阳市	随州市	国标							修订（GB/T 2260-1991）
-420682	老河口市	湖北省	襄阳市	老河口市	民政部	1995年	2024年					
-420683	枣阳市	湖北省	襄阳市	枣阳市	民政部	1995年	2024年					
-420684	宜城市	湖北省	襄阳市	宜城市	民政部	1995年	2024年					
-420700	鄂州市	湖北省	鄂州市	-	民政部	1983年	2024年					
-420701	市辖区	湖北省	鄂州市	市辖区	国标							
-420702	梁子湖区	湖北省	鄂州市	梁子湖区	民政部	1987年	2024年					
-420703	华容区	湖北省	鄂州市	华容区	民政部	1984年	2024年					黄州区[1986年]
-420704	鄂城区	湖北省	鄂州市	鄂城区	民政部	1984年	2024年					
-420709	鄂州市	湖北省	鄂州市	黄州区	非官方							
-420800	荆门市	湖北省	荆门市	-	民政部	1983年	2024年				1951-1969年	身份证直接用地市编码？其中有地址记录为荆门市沙洋县
-420801	市辖区	湖北省	荆门市	市辖区	国标							
-420802	东宝区	湖北省	荆门市	东宝区	民政部	1985年	2024年					
-420803	沙洋区	湖北省	荆门市	沙洋区	民政部	1985年	1997年	[已撤销]	420822	荆门市,沙洋县		
-420804	掇刀区	湖北省	荆门市	掇刀区	民政部	2001年	2024年					
-420821	京山县	湖北省	荆门市	京山县	民政部	1996年	2017年	[已撤销]	420882	荆门市,京山市		
-420822	沙洋县	湖北省	荆门市	沙洋县	民政部	1998年	2024年					
-420881	钟祥市	湖北省	荆门市	钟祥市	民政部	1996年	2024年					旧称：钟祥市(锺祥市)；
-420882	京山市	湖北省	荆门市	京山市	民政部	2018年	2024年					
-420900	孝感市	湖北省	孝感市	-	民政部	1993年	2024年					
-420901	随州市	湖北省	孝感市	随州市	民政部	1983年	1983年	[已撤销]	429001	省直辖行政单位,随州市[已撤销]		
-420902	孝南区	湖北省	孝感市	孝南区	民政部	1993年	2024年					
-420921	孝昌县	湖北省	孝感市	孝昌县	民政部	1993年	2024年					
-420922	大悟县	湖北省	孝感市	大悟县	民政部	1993年	2024年					
-420923	云梦县	湖北省	孝感市	云梦县	民政部	1993年	2024年					
-420924	汉川县	湖北省	孝感市	汉川县	民政部	1993年	1996年	[已撤销]	420984	孝感市,汉川市		
-420981	应城市	湖北省	孝感市	应城市	民政部	1995年	2024年					
-420982	安陆市	湖北省	孝感市	安陆市	民政部	1995年	2024年					
-420983	广水市	湖北省	孝感市	广水市	民政部	1995年	1999年	[已撤销]	421381	随州市,广水市		
-420984	汉川市	湖北省	孝感市	汉川市	民政部	1997年	2024年					
-421000	荆州市	湖北省	荆州市	-	民政部	1994年	2024年					荆沙市[1995年]
-421001	老河口市	湖北省	荆州市	老河口市	民政部	1983年	1983年	[已撤销]	429002	省直辖行政单位,老河口市[已撤销]		
-421002	沙市区	湖北省	荆州市	沙市区	民政部	1994年	2024年					
-421003	荆州区	湖北省	荆州市	荆州区	民政部	1994年	2024年					
-421004	江陵区	湖北省	荆州市	江陵区	民政部	1994年	1997年	[已撤销]	421024	荆州市,江陵县		
-421021	荆州市	湖北省	荆州市	松滋县	非官方							
-421022	公安县	湖北省	荆州市	公安县	民政部	1994年	2024年					
-421023	监利县	湖北省	荆州市	监利县	民政部	1994年	2019年	[已撤销]	421088	荆州市,监利市		
-421024	江陵县	湖北省	荆州市	江陵县	民政部	1994年	2024年					松滋县[1994年]
-421025	京山县	湖北省	荆州市	京山县	民政部	1994年	1995年	[已撤销]	420821	荆门市,京山县[已撤销]		
-421081	石首市	湖北省	荆州市	石首市	民政部	1995年	2024年					
-421082	钟祥市	湖北省	荆州市	钟祥市	民政部	1995年	1995年	[已撤销]	420881	荆门市,钟祥市		旧称：钟祥市(锺祥市)；
-421083	洪湖市	湖北省	荆州市	洪湖市	民政部	1995年	2024年					
-421084	荆州市	湖北省	荆州市	天门市	非官方							
-421085	荆州市	湖北省	荆州市	潜江市	非官方							
-421086	荆州市	湖北省	荆州市	仙桃市	非官方							
-421087	松滋市	湖北省	荆州市	松滋市	民政部	1995年	2024年					
-421088	监利市	湖北省	荆州市	监利市	民政部	2020年	2024年					
-421100	黄冈市	湖北省	黄冈市	-	民政部	1995年	2024年					
-421101	市辖区	湖北省	黄冈市	市辖区	国标							
-421102	黄州区	湖北省	黄冈市	黄州区	民政部	1995年	2024年					
-421121	团风县	湖北省	黄冈市	团风县	民政部	1995年	2024年					
-421122	红安县	湖北省	黄冈市	红安县	民政部	1995年	2024年					
-421123	罗田县	湖北省	黄冈市	罗田县	民政部	1995年	2024年					
-421124	英山县	湖北省	黄冈市	英山县	民政部	1995年	2024年					
-421125	浠水县	湖北省	黄冈市	浠水县	民政部	1995年	2024年					
-421126	蕲春县	湖北省	黄冈市	蕲春县	民政部	1995年	2024年					
-421127	黄梅县	湖北省	黄冈市	黄梅县	民政部	1995年	2024年					
-421181	麻城市	湖北省	黄冈市	麻城市	民政部	1995年	2024年					
-421182	武穴市	湖北省	黄冈市	武穴市	民政部	1995年	2024年					
-421200	咸宁市	湖北省	咸宁市	-	民政部	1998年	2024年					
-421201	市辖区	湖北省	咸宁市	市辖区	国标							
-421202	咸安区	湖北省	咸宁市	咸安区	民政部	1998年	2024年					
-421221	嘉鱼县	湖北省	咸宁市	嘉鱼县	民政部	1998年	2024年					
-421222	通城县	湖北省	咸宁市	通城县	民政部	1998年	2024年					
-421223	崇阳县	湖北省	咸宁市	崇阳县	民政部	1998年	2024年					
-421224	通山县	湖北省	咸宁市	通山县	民政部	1998年	2024年					
-421281	赤壁市	湖北省	咸宁市	赤壁市	民政部	1998年	2024年					
-421300	随州市	湖北省	随州市	-	民政部	2000年	2024年					
-421301	市辖区	湖北省	随州市	市辖区	国标							
-421302	随州市	湖北省	随州市	曾都区	非官方						1952-2017年	医保区划在用
-421303	曾都区	湖北省	随州市	曾都区	民政部	2000年	2024年					
-421321	随县	湖北省	随州市	随县	民政部	2009年	2024年					
-421381	广水市	湖北省	随州市	广水市	民政部	2000年	2024年					
-422100	黄冈地区	湖北省	黄冈地区	-	民政部	1980年	1994年	[已撤销]	421100	黄冈市（地市）		
-422101	麻城市	湖北省	黄冈地区	麻城市	民政部	1980年	1994年	[已撤销]	421181	黄冈市,麻城市		鄂城市[1982年]
-422102	武穴市	湖北省	黄冈地区	武穴市	民政部	1987年	1994年	[已撤销]	421182	黄冈市,武穴市		
-422103	黄州市	湖北省	黄冈地区	黄州市	民政部	1990年	1994年	[已撤销]	421102	黄冈市,黄州区		
-422121	黄冈县	湖北省	黄冈地区	黄冈县	民政部	1980年	1989年	[已撤销]	422103	黄冈地区,黄州市[已撤销]		
-422122	新洲县	湖北省	黄冈地区	新洲县	民政部	1980年	1982年	[已撤销]	420124	武汉市,新洲县[已撤销]		
-422123	红安县	湖北省	黄冈地区	红安县	民政部	1980年	1994年	[已撤销]	421122	黄冈市,红安县		
-422124	麻城县	湖北省	黄冈地区	麻城县	民政部	1980年	1985年	[已撤销]	422101	黄冈地区,麻城市[已撤销]		
-422125	罗田县	湖北省	黄冈地区	罗田县	民政部	1980年	1994年	[已撤销]	421123	黄冈市,罗田县		
-422126	英山县	湖北省	黄冈地区	英山县	民政部	1980年	1994年	[已撤销]	421124	黄冈市,英山县		
-422127	浠水县	湖北省	黄冈地区	浠水县	民政部	1980年	1994年	[已撤销]	421125	黄冈市,浠水县		
-422128	蕲春县	湖北省	黄冈地区	蕲春县	民政部	1980年	1994年	[已撤销]	421126	黄冈市,蕲春县		
-422129	广济县	湖北省	黄冈地区	广济县	民政部	1980年	1986年	[已撤销]	421127	黄冈市,黄梅县		
-422130	黄梅县	湖北省	黄冈地区	黄梅县	民政部	1980年	1994年	[已撤销]	421127	黄冈市,黄梅县		
-422131	鄂城县	湖北省	黄冈地区	鄂城县	民政部	1980年	1982年	[已撤销]	420700	鄂州市（地市）		
-422200	孝感地区	湖北省	孝感地区	-	民政部	1980年	1992年	[已撤销]	420900	孝感市（地市）		
-422201	孝感市	湖北省	孝感地区	孝感市	民政部	1983年	1992年	[已撤销]	420900	孝感市（地市）		
-422202	应城市	湖北省	孝感地区	应城市	民政部	1986年	1992年	[已撤销]	429009	省直辖行政单位,应城市[已撤销]		
-422203	安陆市	湖北省	孝感地区	安陆市	民政部	1987年	1992年	[已撤销]	429010	省直辖行政单位,安陆市[已撤销]		
-422204	广水市	湖北省	孝感地区	广水市	民政部	1988年	1992年	[已撤销]	429011	省直辖行政单位,广水市[已撤销]		
-422221	孝感县	湖北省	孝感地区	孝感县	民政部	1980年	1982年	[已撤销]	422201	孝感地区,孝感市[已撤销]		
-422222	黄陂县	湖北省	孝感地区	黄陂县	民政部	1980年	1982年	[已撤销]	420123	武汉市,黄陂县[已撤销]		
-422223	大悟县	湖北省	孝感地区	大悟县	民政部	1980年	1992年	[已撤销]	420922	孝感市,大悟县		
-422224	应山县	湖北省	孝感地区	应山县	民政部	1980年	1987年	[已撤销]	422204	孝感地区,广水市[已撤销]		
-422225	安陆县	湖北省	孝感地区	安陆县	民政部	1980年	1986年	[已撤销]	422203	孝感地区,安陆市[已撤销]		
-422226	云梦县	湖北省	孝感地区	云梦县	民政部	1980年	1992年	[已撤销]	420923	孝感市,云梦县		
-422227	应城县	湖北省	孝感地区	应城县	民政部	1980年	1985年	[已撤销]	422202	孝感地区,应城市[已撤销]		
-422228	汉川县	湖北省	孝感地区	汉川县	民政部	1980年	1992年	[已撤销]	420924	孝感市,汉川县[已撤销]		
-422229		湖北省	孝感地区		非官方						1973年	
-422300	咸宁地区	湖北省	咸宁地区	-	民政部	1980年	1997年	[已撤销]	421200	咸宁市（地市）		
-422301	咸宁市	湖北省	咸宁地区	咸宁市	民政部	1983年	1997年	[已撤销]	421200	咸宁市（地市）		
-422302	蒲圻市	湖北省	咸宁地区	蒲圻市	民政部	1986年	1997年	[已撤销]	421281	咸宁市,赤壁市		
-422321	咸宁县	湖北省	咸宁地区	咸宁县	民政部	1980年	1982年	[已撤销]	422301	咸宁地区,咸宁市[已撤销]		
-422322	嘉鱼县	湖北省	咸宁地区	嘉鱼县	民政部	1980年	1997年	[已撤销]	421221	咸宁市,嘉鱼县		
-422323	蒲圻县	湖北省	咸宁地区	蒲圻县	民政部	1980年	1985年	[已撤销]	422302	咸宁地区,蒲圻市[已撤销]		
-422324	通城县	湖北省	咸宁地区	通城县	民政部	1980年	1997年	[已撤销]	421222	咸宁市,通城县		
-422325	崇阳县	湖北省	咸宁地区	崇阳县	民政部	1980年	1997年	[已撤销]	421223	咸宁市,崇阳县		
-422326	通山县	湖北省	咸宁地区	通山县	民政部	1980年	1997年	[已撤销]	421224	咸宁市,通山县		
-422327	阳新县	湖北省	咸宁地区	阳新县	民政部	1980年	1995年	[已撤销]	420222	黄石市,阳新县		
-422400	荆州地区	湖北省	荆州地区	-	民政部	1980年	1993年	[已撤销]	421000	荆州市（地市）		
-422401	仙桃市	湖北省	荆州地区	仙桃市	民政部	1980年	1993年	[已撤销]	429004	省直辖行政单位,仙桃市		荆门市[1982年]
-422402	石首市	湖北省	荆州地区	石首市	民政部	1986年	1993年	[已撤销]	429012	省直辖行政单位,石首市[已撤销]		
-422403	洪湖市	湖北省	荆州地区	洪湖市	民政部	1987年	1993年	[已撤销]	429013	省直辖行政单位,洪湖市[已撤销]		
-422404	天门市	湖北省	荆州地区	天门市	民政部	1987年	1993年	[已撤销]	429006	省直辖行政单位,天门市		
-422405	潜江市	湖北省	荆州地区	潜江市	民政部	1988年	1993年	[已撤销]	429005	省直辖行政单位,潜江市		
-422406	钟祥市	湖北省	荆州地区	钟祥市	民政部	1992年	1993年	[已撤销]	429014	省直辖行政单位,钟祥市[已撤销]		旧称：钟祥市(锺祥市)；
-422421	江陵县	湖北省	荆州地区	江陵县	民政部	1980年	1993年	[已撤销]	421004	荆州市,江陵区[已撤销]		
-422422	松滋县	湖北省	荆州地区	松滋县	民政部	1980年	1993年	[已撤销]	421087	荆州市,松滋市		
-422423	公安县	湖北省	荆州地区	公安县	民政部	1980年	1993年	[已撤销]	421022	荆州市,公安县		
-422424	石首县	湖北省	荆州地区	石首县	民政部	1980年	1985年	[已撤销]	422402	荆州地区,石首市[已撤销]		
-422425	监利县	湖北省	荆州地区	监利县	民政部	1980年	1993年	[已撤销]	421023	荆州市,监利县[已撤销]		
-422426	洪湖县	湖北省	荆州地区	洪湖县	民政部	1980年	1986年	[已撤销]	422403	荆州地区,洪湖市[已撤销]		
-422427	沔阳县	湖北省	荆州地区	沔阳县	民政部	1980年	1985年	[已撤销]	422401	荆州地区,仙桃市[已撤销]		
-422428	天门县	湖北省	荆州地区	天门县	民政部	1980年	1986年	[已撤销]	422404	荆州地区,天门市[已撤销]		
-422429	潜江县	湖北省	荆州地区	潜江县	民政部	1980年	1987年	[已撤销]	422405	荆州地区,潜江市[已撤销]		
-422430	荆门县	湖北省	荆州地区	荆门县	民政部	1980年	1982年	[已撤销]	420800	荆门市（地市）		
-422431	钟祥县	湖北省	荆州地区	钟祥县	民政部	1980年	1991年	[已撤销]	422406	荆州地区,钟祥市[已撤销]		旧称：钟祥县(锺祥县)；
-422432	京山县	湖北省	荆州地区	京山县	民政部	1980年	1993年	[已撤销]	421025	荆州市,京山县[已撤销]		
-422500	襄阳地区	湖北省	襄阳地区	-	民政部	1980年	1982年	[已撤销]	420600	襄阳市（地市）		
-422501	随州市	湖北省	襄阳地区	随州市	民政部	1980年	1982年	[已撤销]	420901	孝感市,随州市[已撤销]		
-422502	老河口市	湖北省	襄阳地区	老河口市	民政部	1980年	1982年	[已撤销]	421001	荆州市,老河口市[已撤销]		
-422521	樊阳县	湖北省	襄阳地区	樊阳县	民政部	1980年	1982年	[已撤销]	420600	襄阳市（地市）		
-422522	枣阳县	湖北省	襄阳地区	枣阳县	民政部	1980年	1982年	[已撤销]	420622	襄阳市,枣阳县[已撤销]		
-422523	随县	湖北省	襄阳地区	随县	民政部	1980年	1982年	[已撤销]	420901	孝感市,随州市[已撤销]		
-422524	宜城县	湖北省	襄阳地区	宜城县	民政部	1980年	1982年	[已撤销]	420623	襄阳市,宜城县[已撤销]		
-422525	南漳县	湖北省	襄阳地区	南漳县	民政部	1980年	1982年	[已撤销]	420624	襄阳市,南漳县		
-422526	光化县	湖北省	襄阳地区	光化县	民政部	1980年	1982年	[已撤销]	421001	荆州市,老河口市[已撤销]		
-422527	谷城县	湖北省	襄阳地区	谷城县	民政部	1980年	1982年	[已撤销]	420625	襄阳市,谷城县		
-422528	保康县	湖北省	襄阳地区	保康县	民政部	1980年	1982年	[已撤销]	420626	襄阳市,保康县		
-422600	郧阳地区	湖北省	郧阳地区	-	民政部	1980年	1993年	[已撤销]	420300	十堰市（地市）		
-422601	丹江口市	湖北省	郧阳地区	丹江口市	民政部	1983年	1993年	[已撤销]	429015	省直辖行政单位,丹江口市[已撤销]		
-422621	均县	湖北省	郧阳地区	均县	民政部	1980年	1982年	[已撤销]	422601	郧阳地区,丹江口市[已撤销]		
-422622	郧县	湖北省	郧阳地区	郧县	民政部	1980年	1993年	[已撤销]	420321	十堰市,郧县[已撤销]		
-422623	郧西县	湖北省	郧阳地区	郧西县	民政部	1980年	1993年	[已撤销]	420322	十堰市,郧西县		
-422624	竹山县	湖北省	郧阳地区	竹山县	民政部	1980年	1993年	[已撤销]	420323	十堰市,竹山县		
-422625	竹溪县	湖北省	郧阳地区	竹溪县	民政部	1980年	1993年	[已撤销]	420324	十堰市,竹溪县		
-422626	房县	湖北省	郧阳地区	房县	民政部	1980年	1993年	[已撤销]	420325	十堰市,房县		
-422627	神农架林区	湖北省	郧阳地区	神农架林区	民政部	1980年	1982年	[已撤销]	422921	林区,神农架林区[已撤销]		
-422700	宜昌地区	湖北省	宜昌地区	-	民政部	1980年	1991年	[已撤销]	420500	宜昌市（地市）		
-422701	枝城市	湖北省	宜昌地区	枝城市	民政部	1987年	1991年	[已撤销]	429007	省直辖行政单位,枝城市[已撤销]		
-422702	当阳市	湖北省	宜昌地区	当阳市	民政部	1988年	1991年	[已撤销]	429008	省直辖行政单位,当阳市[已撤销]		
-422721	宜昌县	湖北省	宜昌地区	宜昌县	民政部	1980年	1991年	[已撤销]	420521	宜昌市,宜昌县[已撤销]		
-422722	宜都县	湖北省	宜昌地区	宜都县	民政部	1980年	1986年	[已撤销]	422701	宜昌地区,枝城市[已撤销]		
-422723	枝江县	湖北省	宜昌地区	枝江县	民政部	1980年	1991年	[已撤销]	420523	宜昌市,枝江县[已撤销]		
-422724	当阳县	湖北省	宜昌地区	当阳县	民政部	1980年	1987年	[已撤销]	422702	宜昌地区,当阳市[已撤销]		
-422725	远安县	湖北省	宜昌地区	远安县	民政部	1980年	1991年	[已撤销]	420525	宜昌市,远安县		
-422726	兴山县	湖北省	宜昌地区	兴山县	民政部	1980年	1991年	[已撤销]	420526	宜昌市,兴山县		
-422727	秭归县	湖北省	宜昌地区	秭归县	民政部	1980年	1991年	[已撤销]	420527	宜昌市,秭归县		
-422728	长阳土家族自治县	湖北省	宜昌地区	长阳土家族自治县	民政部	1980年	1991年	[已撤销]	420528	宜昌市,长阳土家族自治县		长阳县[1983年]
-422729	五峰土家族自治县	湖北省	宜昌地区	五峰土家族自治县	民政部	1980年	1991年	[已撤销]	420529	宜昌市,五峰土家族自治县		五峰县[1983年]
-422800	恩施土家族苗族自治州	湖北省	恩施土家族苗族自治州	-	民政部	1980年	2024年					恩施地区[1982年]；鄂西土家族苗族自治州[1992年]
-422801	恩施市	湖北省	恩施土家族苗族自治州	恩施市	民政部	1981年	2024年					
-422802	利川市	湖北省	恩施土家族苗族自治州	利川市	民政部	1986年	2024年					
-422821	恩施县	湖北省	恩施土家族苗族自治州	恩施县	民政部	1980年	1982年	[已撤销]	422801	恩施土家族苗族自治州,恩施市		
-422822	建始县	湖北省	恩施土家族苗族自治州	建始县	民政部	1980年	2024年					
-422823	巴东县	湖北省	恩施土家族苗族自治州	巴东县	民政部	1980年	2024年					
-422824	利川县	湖北省	恩施土家族苗族自治州	利川县	民政部	1980年	1985年	[已撤销]	422802	恩施土家族苗族自治州,利川市		
-422825	宣恩县	湖北省	恩施土家族苗族自治州	宣恩县	民政部	1980年	2024年					
-422826	咸丰县	湖北省	恩施土家族苗族自治州	咸丰县	民政部	1980年	2024年					
-422827	来凤县	湖北省	恩施土家族苗族自治州	来凤县	民政部	1980年	2024年					来凤土家族自治县[1982年]
-422828	鹤峰县	湖北省	恩施土家族苗族自治州	鹤峰县	民政部	1980年	2024年					鹤峰土家族自治县[1982年]
-422900	省直辖行政单位	湖北省	省直辖行政单位	-	国标							修订前（GB/T 2260-1986）
-422921	神农架林区	湖北省	林区	神农架林区	民政部	1983年	1983年	[已撤销]	429021	省直辖行政单位,神农架林区		
-429000	省直辖行政单位	湖北省	省直辖行政单位	-	国标							增设（GB/T 2260-1988），恢复为：省直辖行政单位 422900（GB/T 2260-1991）
-429001	随州市	湖北省	省直辖行政单位	随州市	民政部	1984年	1999年	[已撤销]	421300	随州市（地市）		
-429002	老河口市	湖北省	省直辖行政单位	老河口市	民政部	1984年	1994年	[已撤销]	420682	襄阳市,老河口市		
-429003	枣阳市	湖北省	省直辖行政单位	枣阳市	民政部	1988年	1994年	[已撤销]	420683	襄阳市,枣阳市		
-429004	仙桃市	湖北省	省直辖行政单位	仙桃市	民政部	1994年	2024年					
-429005	潜江市	湖北省	省直辖行政单位	潜江市	民政部	1994年	2024年					
-429006	天门市	湖北省	省直辖行政单位	天门市	民政部	1994年	2024年					
-429007	枝城市	湖北省	省直辖行政单位	枝城市	民政部	1992年	1994年	[已撤销]	420581	宜昌市,宜都市		
-429008	当阳市	湖北省	省直辖行政单位	当阳市	民政部	1992年	1994年	[已撤销]	420582	宜昌市,当阳市		
-429009	应城市	湖北省	省直辖行政单位	应城市	民政部	1993年	1994年	[已撤销]	420981	孝感市,应城市		
-429010	安陆市	湖北省	省直辖行政单位	安陆市	民政部	1993年	1994年	[已撤销]	420982	孝感市,安陆市		
-429011	广水市	湖北省	省直辖行政单位	广水市	民政部	1993年	1994年	[已撤销]	420983	孝感市,广水市[已撤销]		
-429012	石首市	湖北省	省直辖行政单位	石首市	民政部	1994年	1994年	[已撤销]	421081	荆州市,石首市		
-429013	洪湖市	湖北省	省直辖行政单位	洪湖市	民政部	1994年	1994年	[已撤销]	421083	荆州市,洪湖市		
-429014	钟祥市	湖北省	省直辖行政单位	钟祥市	民政部	1994年	1994年	[已撤销]	421082	荆州市,钟祥市[已撤销]		旧称：钟祥市(锺祥市)；
-429015	丹江口市	湖北省	省直辖行政单位	丹江口市	民政部	1994年	1994年	[已撤销]	420381	十堰市,丹江口市		
-429016	大冶市	湖北省	省直辖行政单位	大冶市	民政部	1994年	1994年	[已撤销]	420281	黄石市,大冶市		
-429017	宜城市	湖北省	省直辖行政单位	宜城市	民政部	1994年	1994年	[已撤销]	420684	襄阳市,宜城市		
-429021	神农架林区	湖北省	省直辖行政单位	神农架林区	民政部	1984年	2024年					
-430000	湖南省	湖南省	-	-	民政部	1980年	2024年					
-430100	长沙市	湖南省	长沙市	-	民政部	1980年	2024年					
-430101	市辖区	湖南省	长沙市	市辖区	国标							增设（GB/T 2260-1984）
-430102	芙蓉区	湖南省	长沙市	芙蓉区	民政部	1980年	2024年					城东区[1982年]；东区[1995年]
-430103	天心区	湖南省	长沙市	天心区	民政部	1980年	2024年					城南区[1982年]；南区[1995年]
-430104	岳麓区	湖南省	长沙市	岳麓区	民政部	1980年	2024年					城西区[1982年]；西区[1995年]
-430105	开福区	湖南省	长沙市	开福区	民政部	1980年	2024年					城北区[1982年]；北区[1995年]
-430111	雨花区	湖南省	长沙市	雨花区	民政部	1980年	2024年					郊区[1995年]
-430112	望城区	湖南省	长沙市	望城区	民政部	2011年	2024年					
-430120	长沙市区	湖南省	长沙市	长沙市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-430121	长沙县	湖南省	长沙市	长沙县	民政部	1980年	2024年					
-430122	望城县	湖南省	长沙市	望城县	民政部	1980年	2010年	[已撤销]	430112	长沙市,望城区		
-430123	浏阳县	湖南省	长沙市	浏阳县	民政部	1983年	1992年	[已撤销]	439008	省直辖县级行政区划,浏阳市[已撤销]		
-430124	宁乡县	湖南省	长沙市	宁乡县	民政部	1983年	2016年	[已撤销]	430182	长沙市,宁乡市		
-430181	浏阳市	湖南省	长沙市	浏阳市	民政部	1995年	2024年					
-430182	宁乡市	湖南省	长沙市	宁乡市	民政部	2017年	2024年					
-430200	株洲市	湖南省	株洲市	-	民政部	1980年	2024年					
-430201	市辖区	湖南省	株洲市	市辖区	国标							增设（GB/T 2260-1984）
-430202	荷塘区	湖南省	株洲市	荷塘区	民政部	1980年	2024年					东区[1996年]
-430203	芦淞区	湖南省	株洲市	芦淞区	民政部	1980年	2024年					北区[1996年]
-430204	石峰区	湖南省	株洲市	石峰区	民政部	1980年	2024年					南区[1996年]
-430211	天元区	湖南省	株洲市	天元区	民政部	1980年	2024年					郊区[1996年]
-430212	渌口区	湖南省	株洲市	渌口区	民政部	2018年	2024年					
-430219	醴陵市	湖南省	株洲市	醴陵市	民政部	1985年	1985年	[已撤销]	439001	省直辖县级行政区划,醴陵市[已撤销]		
-430220	株洲市区	湖南省	株洲市	株洲市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-430221	株洲县	湖南省	株洲市	株洲县	民政部	1980年	2017年	[已撤销]	430212	株洲市,渌口区		
-430222	醴陵县	湖南省	株洲市	醴陵县	民政部	1983年	1984年	[已撤销]	430219	株洲市,醴陵市[已撤销]		
-430223	攸县	湖南省	株洲市	攸县	民政部	1983年	2024年					
-430224	茶陵县	湖南省	株洲市	茶陵县	民政部	1983年	2024年					
-430225	炎陵县	湖南省	株洲市	炎陵县	民政部	1983年	2024年					酃县[1993年]
-430281	醴陵市	湖南省	株洲市	醴陵市	民政部	1995年	2024年					
-430300	湘潭市	湖南省	湘潭市	-	民政部	1980年	2024年					湘潭市[1981年]；邵阳市[1983年]
-430301	市辖区	湖南省	湘潭市	市辖区	国标							增设（GB/T 2260-1984）
-430302	雨湖区	湖南省	湘潭市	雨湖区	民政部	1980年	2024年					雨湖区[1981年]；东区[1983年]
-430303	湘江区	湖南省	湘潭市	湘江区	民政部	1980年	1991年	[已撤销]	430302	湘潭市,雨湖区		湘江区[1981年]；西区[1983年]
-430304	岳塘区	湖南省	湘潭市	岳塘区	民政部	1980年	2024年					岳塘区[1981年]；桥头区[1983年]
-430305	板塘区	湖南省	湘潭市	板塘区	民政部	1980年	1991年	[已撤销]	430304	湘潭市,岳塘区		
-430306	韶山区	湖南省	湘潭市	韶山区	民政部	1988年	1989年	[已撤销]	439006	省直辖县级行政区划,韶山市[已撤销]		
-430311	郊区	湖南省	湘潭市	郊区	民政部	1980年	1991年	[已撤销]	430304	湘潭市,岳塘区		
-430312	韶山区	湖南省	湘潭市	韶山区	国标						1963-1976年	修订前（GB/T 2260-1986）
-430321	湘潭县	湖南省	湘潭市	湘潭县	民政部	1983年	2024年					邵东县[1983年]
-430322	湘乡县	湖南省	湘潭市	湘乡县	民政部	1983年	1985年	[已撤销]	439002	省直辖县级行政区划,湘乡市[已撤销]		新邵县[1983年]
-430381	湘乡市	湖南省	湘潭市	湘乡市	民政部	1995年	2024年					
-430382	韶山市	湖南省	湘潭市	韶山市	民政部	1995年	2024年					
-430400	衡阳市	湖南省	衡阳市	-	民政部	1980年	2024年					衡阳市[1981年]；湘潭市[1983年]
-430401	市辖区	湖南省	衡阳市	市辖区	国标							增设（GB/T 2260-1984）
-430402	江东区	湖南省	衡阳市	江东区	民政部	1980年	2000年	[已撤销]	430405	衡阳市,珠晖区		江东区[1981年]；雨湖区[1983年]
-430403	城南区	湖南省	衡阳市	城南区	民政部	1980年	2000年	[已撤销]	430406	衡阳市,雁峰区		城南区[1981年]；湘江区[1983年]
-430404	城北区	湖南省	衡阳市	城北区	民政部	1980年	2000年	[已撤销]	430407	衡阳市,石鼓区		城北区[1981年]；岳塘区[1983年]
-430405	珠晖区	湖南省	衡阳市	珠晖区	民政部	1982年	2024年					板塘区[1983年]
-430406	雁峰区	湖南省	衡阳市	雁峰区	民政部	2001年	2024年					
-430407	石鼓区	湖南省	衡阳市	石鼓区	民政部	2001年	2024年					
-430408	蒸湘区	湖南省	衡阳市	蒸湘区	民政部	2001年	2024年					
-430411	郊区	湖南省	衡阳市	郊区	民政部	1980年	2000年	[已撤销]	430405,430406,430407,430408	衡阳市,珠晖区,雁峰区,石鼓区,蒸湘区		
-430412	南岳区	湖南省	衡阳市	南岳区	民政部	1988年	2024年					
-430419	衡阳市	湖南省	衡阳市	耒阳市	非官方						1950-1993年	
-430421	衡阳县	湖南省	衡阳市	衡阳县	民政部	1983年	2024年					湘潭县[1983年]
-430422	衡南县	湖南省	衡阳市	衡南县	民政部	1983年	2024年					湘乡县[1983年]
-430423	衡山县	湖南省	衡阳市	衡山县	民政部	1984年	2024年					
-430424	衡东县	湖南省	衡阳市	衡东县	民政部	1984年	2024年					
-430425	常宁县	湖南省	衡阳市	常宁县	民政部	1984年	1995年	[已撤销]	430482	衡阳市,常宁市		
-430426	祁东县	湖南省	衡阳市	祁东县	民政部	1984年	2024年					
-430427	耒阳县	湖南省	衡阳市	耒阳县	民政部	1984年	1985年	[已撤销]	439003	省直辖县级行政区划,耒阳市[已撤销]		
-430481	耒阳市	湖南省	衡阳市	耒阳市	民政部	1995年	2024年					
-430482	常宁市	湖南省	衡阳市	常宁市	民政部	1996年	2024年					
-430500	邵阳市	湖南省	邵阳市	-	民政部	1980年	2024年					邵阳市[1981年]；衡阳市[1983年]
-430501	市辖区	湖南省	邵阳市	市辖区	国标							增设（GB/T 2260-1984）
-430502	双清区	湖南省	邵阳市	双清区	民政部	1980年	2024年					东区[1981年]；江东区[1983年]；东区[1996年]
-430503	大祥区	湖南省	邵阳市	大祥区	民政部	1980年	2024年					西区[1981年]；城南区[1983年]；西区[1996年]
-430504	桥头区	湖南省	邵阳市	桥头区	民政部	1980年	1986年	[已撤销]	430502	邵阳市,双清区		桥头区[1981年]；城北区[1983年]
-430511	北塔区	湖南省	邵阳市	北塔区	民政部	1980年	2024年					郊区[1996年]
-430521	邵东县	湖南省	邵阳市	邵东县	民政部	1983年	2018年	[已撤销]	430582	邵阳市,邵东市		衡阳县[1983年]
-430522	新邵县	湖南省	邵阳市	新邵县	民政部	1983年	2024年					衡南县[1983年]
-430523	邵阳县	湖南省	邵阳市	邵阳县	民政部	1983年	2024年					衡山县[1983年]
-430524	隆回县	湖南省	邵阳市	隆回县	民政部	1983年	2024年					衡东县[1983年]
-430525	洞口县	湖南省	邵阳市	洞口县	民政部	1983年	2024年					常宁县[1983年]
-430526	武冈县	湖南省	邵阳市	武冈县	民政部	1983年	1993年	[已撤销]	439011	省直辖县级行政区划,武冈市[已撤销]		祁东县[1983年]
-430527	绥宁县	湖南省	邵阳市	绥宁县	民政部	1983年	2024年					耒阳县[1983年]
-430528	新宁县	湖南省	邵阳市	新宁县	民政部	1986年	2024年					
-430529	城步苗族自治县	湖南省	邵阳市	城步苗族自治县	民政部	1986年	2024年					
-430581	武冈市	湖南省	邵阳市	武冈市	民政部	1995年	2024年					
-430582	邵东市	湖南省	邵阳市	邵东市	民政部	2019年	2024年					
-430600	岳阳市	湖南省	岳阳市	-	民政部	1983年	2024年					
-430601	市辖区	湖南省	岳阳市	市辖区	国标							增设（GB/T 2260-1984）
-430602	岳阳楼区	湖南省	岳阳市	岳阳楼区	民政部	1984年	2024年					南区[1995年]
-430603	云溪区	湖南省	岳阳市	云溪区	民政部	1984年	2024年					北区[1995年]
-430611	君山区	湖南省	岳阳市	君山区	民政部	1984年	2024年					郊区[1995年]
-430621	岳阳县	湖南省	岳阳市	岳阳县	民政部	1983年	2024年					
-430622	临湘县	湖南省	岳阳市	临湘县	民政部	1986年	1991年	[已撤销]	439007	省直辖县级行政区划,临湘市[已撤销]		
-430623	华容县	湖南省	岳阳市	华容县	民政部	1986年	2024年					
-430624	湘阴县	湖南省	岳阳市	湘阴县	民政部	1986年	2024年					
-430625	汨罗县	湖南省	岳阳市	汨罗县	国标			[已撤销]				撤销（GB/T 2260-1988）
-430626	平江县	湖南省	岳阳市	平江县	民政部	1986年	2024年					
-430627	汨罗县	湖南省	岳阳市	汨罗县	民政部	1986年	1986年	[已撤销]	439004	省直辖县级行政区划,汨罗市[已撤销]		
-430681	汨罗市	湖南省	岳阳市	汨罗市	民政部	1995年	2024年					
-430682	临湘市	湖南省	岳阳市	临湘市	民政部	1995年	2024年					
-430700	常德市	湖南省	常德市	-	民政部	1988年	2024年					
-430701	市辖区	湖南省	常德市	市辖区	国标							
-430702	武陵区	湖南省	常德市	武陵区	民政部	1988年	2024年					
-430703	鼎城区	湖南省	常德市	鼎城区	民政部	1988年	2024年					
-430721	安乡县	湖南省	常德市	安乡县	民政部	1988年	2024年					
-430722	汉寿县	湖南省	常德市	汉寿县	民政部	1988年	2024年					
-430723	澧县	湖南省	常德市	澧县	民政部	1988年	2024年					
-430724	临澧县	湖南省	常德市	临澧县	民政部	1988年	2024年					
-430725	桃源县	湖南省	常德市	桃源县	民政部	1988年	2024年					
-430726	石门县	湖南省	常德市	石门县	民政部	1988年	2024年					
-430727	常德市	湖南省	常德市	慈利县	非官方							
-430781	津市市	湖南省	常德市	津市市	民政部	1995年	2024年					
-430800	张家界市	湖南省	张家界市	-	民政部	1988年	2024年					大庸市[1993年]
-430801	市辖区	湖南省	张家界市	市辖区	国标							
-430802	永定区	湖南省	张家界市	永定区	民政部	1988年	2024年					
-430811	武陵源区	湖南省	张家界市	武陵源区	民政部	1988年	2024年					
-430821	慈利县	湖南省	张家界市	慈利县	民政部	1988年	2024年					
-430822	桑植县	湖南省	张家界市	桑植县	民政部	1988年	2024年					
-430900	益阳市	湖南省	益阳市	-	民政部	1994年	2024年					
-430901	市辖区	湖南省	益阳市	市辖区	国标							
-430902	资阳区	湖南省	益阳市	资阳区	民政部	1994年	2024年					
-430903	赫山区	湖南省	益阳市	赫山区	民政部	1994年	2024年					
-430921	南县	湖南省	益阳市	南县	民政部	1994年	2024年					
-430922	桃江县	湖南省	益阳市	桃江县	民政部	1994年	2024年					
-430923	安化县	湖南省	益阳市	安化县	民政部	1994年	2024年					
-430981	沅江市	湖南省	益阳市	沅江市	民政部	1995年	2024年					
-431000	郴州市	湖南省	郴州市	-	民政部	1994年	2024年					
-431001	市辖区	湖南省	郴州市	市辖区	国标							
-431002	北湖区	湖南省	郴州市	北湖区	民政部	1994年	2024年					
-431003	苏仙区	湖南省	郴州市	苏仙区	民政部	1994年	2024年					
-431021	桂阳县	湖南省	郴州市	桂阳县	民政部	1994年	2024年					
-431022	宜章县	湖南省	郴州市	宜章县	民政部	1994年	2024年					
-431023	永兴县	湖南省	郴州市	永兴县	民政部	1994年	2024年					
-431024	嘉禾县	湖南省	郴州市	嘉禾县	民政部	1994年	2024年					
-431025	临武县	湖南省	郴州市	临武县	民政部	1994年	2024年					
-431026	汝城县	湖南省	郴州市	汝城县	民政部	1994年	2024年					
-431027	桂东县	湖南省	郴州市	桂东县	民政部	1994年	2024年					
-431028	安仁县	湖南省	郴州市	安仁县	民政部	1994年	2024年					
-431081	资兴市	湖南省	郴州市	资兴市	民政部	1995年	2024年					
-431100	永州市	湖南省	永州市	-	民政部	1995年	2024年					
-431101	市辖区	湖南省	永州市	市辖区	国标							
-431102	零陵区	湖南省	永州市	零陵区	民政部	1995年	2024年					芝山区[2004年]
-431103	冷水滩区	湖南省	永州市	冷水滩区	民政部	1995年	2024年					
-431121	祁阳县	湖南省	永州市	祁阳县	民政部	1995年	2020年	[已撤销]	431181	永州市,祁阳市		
-431122	东安县	湖南省	永州市	东安县	民政部	1995年	2024年					
-431123	双牌县	湖南省	永州市	双牌县	民政部	1995年	2024年					
-431124	道县	湖南省	永州市	道县	民政部	1995年	2024年					
-431125	江永县	湖南省	永州市	江永县	民政部	1995年	2024年					
-431126	宁远县	湖南省	永州市	宁远县	民政部	1995年	2024年					
-431127	蓝山县	湖南省	永州市	蓝山县	民政部	1995年	2024年					
-431128	新田县	湖南省	永州市	新田县	民政部	1995年	2024年					
-431129	江华瑶族自治县	湖南省	永州市	江华瑶族自治县	民政部	1995年	2024年					
-431181	祁阳市	湖南省	永州市	祁阳市	民政部	2021年	2024年					
-431200	怀化市	湖南省	怀化市	-	民政部	1997年	2024年					
-431201	市辖区	湖南省	怀化市	市辖区	国标							
-431202	鹤城区	湖南省	怀化市	鹤城区	民政部	1997年	2024年					
-431221	中方县	湖南省	怀化市	中方县	民政部	1997年	2024年					
-431222	沅陵县	湖南省	怀化市	沅陵县	民政部	1997年	2024年					
-431223	辰溪县	湖南省	怀化市	辰溪县	民政部	1997年	2024年					
-431224	溆浦县	湖南省	怀化市	溆浦县	民政部	1997年	2024年					
-431225	会同县	湖南省	怀化市	会同县	民政部	1997年	2024年					
-431226	麻阳苗族自治县	湖南省	怀化市	麻阳苗族自治县	民政部	1997年	2024年					
-431227	新晃侗族自治县	湖南省	怀化市	新晃侗族自治县	民政部	1997年	2024年					
-431228	芷江侗族自治县	湖南省	怀化市	芷江侗族自治县	民政部	1997年	2024年					
-431229	靖州苗族侗族自治县	湖南省	怀化市	靖州苗族侗族自治县	民政部	1997年	2024年					
-431230	通道侗族自治县	湖南省	怀化市	通道侗族自治县	民政部	1997年	2024年					
-431240	怀化市	湖南省	怀化市	洪江区*	非官方							医保区划在用
-431281	洪江市	湖南省	怀化市	洪江市	民政部	1997年	2024年					
-431300	娄底市	湖南省	娄底市	-	民政部	1999年	2024年					
-431301	市辖区	湖南省	娄底市	市辖区	国标							
-431302	娄星区	湖南省	娄底市	娄星区	民政部	1999年	2024年					
-431321	双峰县	湖南省	娄底市	双峰县	民政部	1999年	2024年					
-431322	新化县	湖南省	娄底市	新化县	民政部	1999年	2024年					
-431381	冷水江市	湖南省	娄底市	冷水江市	民政部	1999年	2024年					
-431382	涟源市	湖南省	娄底市	涟源市	民政部	1999年	2024年					
-432100	湘潭地区	湖南省	湘潭地区	-	民政部	1980年	1982年	[已撤销]	430300	湘潭市（地市）		
-432101	湘潭市	湖南省	湘潭地区	湘潭市	国标							修订前（GB-T 2260-1980）
-432121	湘潭县	湖南省	湘潭地区	湘潭县	民政部	1980年	1982年	[已撤销]	430321	湘潭市,湘潭县		
-432122	湘乡县	湖南省	湘潭地区	湘乡县	民政部	1980年	1982年	[已撤销]	430322	湘潭市,湘乡县[已撤销]		
-432123	醴陵县	湖南省	湘潭地区	醴陵县	民政部	1980年	1982年	[已撤销]	430222	株洲市,醴陵县[已撤销]		
-432124	浏阳县	湖南省	湘潭地区	浏阳县	民政部	1980年	1982年	[已撤销]	430123	长沙市,浏阳县[已撤销]		
-432125	攸县	湖南省	湘潭地区	攸县	民政部	1980年	1982年	[已撤销]	430223	株洲市,攸县		
-432126	茶陵县	湖南省	湘潭地区	茶陵县	民政部	1980年	1982年	[已撤销]	430224	株洲市,茶陵县		
-432127	酃县	湖南省	湘潭地区	酃县	民政部	1980年	1982年	[已撤销]	430225	株洲市,炎陵县		
-432128	湘潭地区	湖南省	湘潭地区	韶山区	非官方							
-432200	岳阳地区	湖南省	岳阳地区	-	民政部	1980年	1985年	[已撤销]	430600	岳阳市（地市）		
-432201	岳阳市	湖南省	岳阳地区	岳阳市	民政部	1980年	1982年	[已撤销]	430600	岳阳市（地市）		
-432221	岳阳县	湖南省	岳阳地区	岳阳县	民政部	1980年	1980年	[已撤销]	432201	岳阳地区,岳阳市[已撤销]		
-432222	平江县	湖南省	岳阳地区	平江县	民政部	1980年	1985年	[已撤销]	430626	岳阳市,平江县		
-432223	湘阴县	湖南省	岳阳地区	湘阴县	民政部	1980年	1985年	[已撤销]	430624	岳阳市,湘阴县		
-432224	汨罗县	湖南省	岳阳地区	汨罗县	民政部	1980年	1985年	[已撤销]	430627	岳阳市,汨罗县[已撤销]		
-432225	临湘县	湖南省	岳阳地区	临湘县	民政部	1980年	1985年	[已撤销]	430622	岳阳市,临湘县[已撤销]		
-432226	华容县	湖南省	岳阳地区	华容县	民政部	1980年	1985年	[已撤销]	430623	岳阳市,华容县		
-432300	益阳地区	湖南省	益阳地区	-	民政部	1980年	1993年	[已撤销]	430900	益阳市（地市）		
-432301	益阳市	湖南省	益阳地区	益阳市	民政部	1980年	1993年	[已撤销]	430900	益阳市（地市）		
-432302	沅江市	湖南省	益阳地区	沅江市	民政部	1988年	1993年	[已撤销]	439010	省直辖县级行政区划,沅江市[已撤销]		
-432321	益阳县	湖南省	益阳地区	益阳县	民政部	1980年	1993年	[已撤销]	430900	益阳市（地市）		
-432322	南县	湖南省	益阳地区	南县	民政部	1980年	1993年	[已撤销]	430921	益阳市,南县		
-432323	沅江县	湖南省	益阳地区	沅江县	民政部	1980年	1987年	[已撤销]	432302	益阳地区,沅江市[已撤销]		
-432324	宁乡县	湖南省	益阳地区	宁乡县	民政部	1980年	1982年	[已撤销]	430124	长沙市,宁乡县[已撤销]		
-432325	桃江县	湖南省	益阳地区	桃江县	民政部	1980年	1993年	[已撤销]	430922	益阳市,桃江县		
-432326	安化县	湖南省	益阳地区	安化县	民政部	1980年	1993年	[已撤销]	430923	益阳市,安化县		
-432400	常德地区	湖南省	常德地区	-	民政部	1980年	1987年	[已撤销]	430700	常德市（地市）		
-432401	常德市	湖南省	常德地区	常德市	民政部	1980年	1987年	[已撤销]	430700	常德市（地市）		
-432402	津市市	湖南省	常德地区	津市市	民政部	1980年	1987年	[已撤销]	439005	省直辖县级行政区划,津市市[已撤销]		
-432421	常德县	湖南省	常德地区	常德县	民政部	1980年	1987年	[已撤销]	430700	常德市（地市）		
-432422	安乡县	湖南省	常德地区	安乡县	民政部	1980年	1987年	[已撤销]	430721	常德市,安乡县		
-432423	汉寿县	湖南省	常德地区	汉寿县	民政部	1980年	1987年	[已撤销]	430722	常德市,汉寿县		
-432424	澧县	湖南省	常德地区	澧县	民政部	1980年	1987年	[已撤销]	430723	常德市,澧县		
-432425	临澧县	湖南省	常德地区	临澧县	民政部	1980年	1987年	[已撤销]	430724	常德市,临澧县		
-432426	桃源县	湖南省	常德地区	桃源县	民政部	1980年	1987年	[已撤销]	430725	常德市,桃源县		
-432427	石门县	湖南省	常德地区	石门县	民政部	1980年	1987年	[已撤销]	430726	常德市,石门县		
-432428	慈利县	湖南省	常德地区	慈利县	民政部	1980年	1987年	[已撤销]	430821	张家界市,慈利县		
-432500	娄底地区	湖南省	娄底地区	-	民政部	1980年	1998年	[已撤销]	431300	娄底市（地市）		涟源地区[1981年]
-432501	娄底市	湖南省	娄底地区	娄底市	民政部	1980年	1998年	[已撤销]	431300	娄底市（地市）		
-432502	冷水江市	湖南省	娄底地区	冷水江市	民政部	1980年	1998年	[已撤销]	431381	娄底市,冷水江市		
-432503	涟源市	湖南省	娄底地区	涟源市	民政部	1987年	1998年	[已撤销]	431382	娄底市,涟源市		
-432521	涟源县	湖南省	娄底地区	涟源县	民政部	1980年	1986年	[已撤销]	432503	娄底地区,涟源市[已撤销]		
-432522	双峰县	湖南省	娄底地区	双峰县	民政部	1980年	1998年	[已撤销]	431321	娄底市,双峰县		
-432523	邵东县	湖南省	娄底地区	邵东县	民政部	1980年	1982年	[已撤销]	430521	邵阳市,邵东县[已撤销]		
-432524	新化县	湖南省	娄底地区	新化县	民政部	1980年	1998年	[已撤销]	431322	娄底市,新化县		
-432525	新邵县	湖南省	娄底地区	新邵县	民政部	1980年	1982年	[已撤销]	430522	邵阳市,新邵县		
-432600	邵阳地区	湖南省	邵阳地区	-	民政部	1980年	1985年	[已撤销]	430500	邵阳市（地市）		
-432621	邵阳县	湖南省	邵阳地区	邵阳县	民政部	1980年	1985年	[已撤销]	430523	邵阳市,邵阳县		
-432622	隆回县	湖南省	邵阳地区	隆回县	民政部	1980年	1985年	[已撤销]	430524	邵阳市,隆回县		
-432623	武冈县	湖南省	邵阳地区	武冈县	民政部	1980年	1985年	[已撤销]	439011	省直辖县级行政区划,武冈市[已撤销]		
-432624	洞口县	湖南省	邵阳地区	洞口县	民政部	1980年	1985年	[已撤销]	430525	邵阳市,洞口县		
-432625	新宁县	湖南省	邵阳地区	新宁县	民政部	1980年	1985年	[已撤销]	430528	邵阳市,新宁县		
-432626	绥宁县	湖南省	邵阳地区	绥宁县	民政部	1980年	1985年	[已撤销]	430527	邵阳市,绥宁县		
-432627	城步苗族自治县	湖南省	邵阳地区	城步苗族自治县	民政部	1980年	1985年	[已撤销]	430529	邵阳市,城步苗族自治县		
-432700	衡阳地区	湖南省	衡阳地区	-	民政部	1980年	1982年	[已撤销]	430400	衡阳市（地市）		
-432701	衡阳市	湖南省	衡阳地区	衡阳市	国标							修订前（GB-T 2260-1980）
-432721	衡阳县	湖南省	衡阳地区	衡阳县	民政部	1980年	1982年	[已撤销]	430421	衡阳市,衡阳县		
-432722	衡南县	湖南省	衡阳地区	衡南县	民政部	1980年	1982年	[已撤销]	430422	衡阳市,衡南县		
-432723	衡山县	湖南省	衡阳地区	衡山县	民政部	1980年	1982年	[已撤销]	430423	衡阳市,衡山县		
-432724	衡东县	湖南省	衡阳地区	衡东县	民政部	1980年	1982年	[已撤销]	430424	衡阳市,衡东县		
-432725	常宁县	湖南省	衡阳地区	常宁县	民政部	1980年	1982年	[已撤销]	430425	衡阳市,常宁县[已撤销]		
-432726	祁东县	湖南省	衡阳地区	祁东县	民政部	1980年	1982年	[已撤销]	430426	衡阳市,祁东县		
-432727	祁阳县	湖南省	衡阳地区	祁阳县	民政部	1980年	1982年	[已撤销]	432930	零陵地区,祁阳县[已撤销]		
-432800	郴州地区	湖南省	郴州地区	-	民政部	1980年	1993年	[已撤销]	431000	郴州市（地市）		
-432801	郴州市	湖南省	郴州地区	郴州市	民政部	1980年	1993年	[已撤销]	431000	郴州市（地市）		
-432802	资兴市	湖南省	郴州地区	资兴市	民政部	1984年	1993年	[已撤销]	439009	省直辖县级行政区划,资兴市[已撤销]		
-432821	郴县	湖南省	郴州地区	郴县	民政部	1980年	1993年	[已撤销]	431003,431002	郴州市,苏仙区,北湖区		
-432822	桂阳县	湖南省	郴州地区	桂阳县	民政部	1980年	1993年	[已撤销]	431021	郴州市,桂阳县		
-432823	永兴县	湖南省	郴州地区	永兴县	民政部	1980年	1993年	[已撤销]	431023	郴州市,永兴县		
-432824	宜章县	湖南省	郴州地区	宜章县	民政部	1980年	1993年	[已撤销]	431022	郴州市,宜章县		
-432825	资兴县	湖南省	郴州地区	资兴县	民政部	1980年	1983年	[已撤销]	432802	郴州地区,资兴市[已撤销]		
-432826	嘉禾县	湖南省	郴州地区	嘉禾县	民政部	1980年	1993年	[已撤销]	431024	郴州市,嘉禾县		
-432827	临武县	湖南省	郴州地区	临武县	民政部	1980年	1993年	[已撤销]	431025	郴州市,临武县		
-432828	汝城县	湖南省	郴州地区	汝城县	民政部	1980年	1993年	[已撤销]	431026	郴州市,汝城县		
-432829	桂东县	湖南省	郴州地区	桂东县	民政部	1980年	1993年	[已撤销]	431027	郴州市,桂东县		
-432830	耒阳县	湖南省	郴州地区	耒阳县	民政部	1980年	1982年	[已撤销]	430427	衡阳市,耒阳县[已撤销]		
-432831	安仁县	湖南省	郴州地区	安仁县	民政部	1980年	1993年	[已撤销]	431028	郴州市,安仁县		
-432900	零陵地区	湖南省	零陵地区	-	民政部	1980年	1994年	[已撤销]	431100	永州市（地市）		永州地区：修订前（GB/T 2260-1980）
-432901	永州市	湖南省	零陵地区	永州市	民政部	1982年	1994年	[已撤销]	431100	永州市（地市）		
-432902	冷水滩市	湖南省	零陵地区	冷水滩市	民政部	1984年	1994年	[已撤销]	431103	永州市,冷水滩区		
-432921	零陵县	湖南省	零陵地区	零陵县	民政部	1980年	1983年	[已撤销]	432901	零陵地区,永州市[已撤销]		
-432922	东安县	湖南省	零陵地区	东安县	民政部	1980年	1994年	[已撤销]	431122	永州市,东安县		
-432923	道县	湖南省	零陵地区	道县	民政部	1980年	1994年	[已撤销]	431124	永州市,道县		
-432924	宁远县	湖南省	零陵地区	宁远县	民政部	1980年	1994年	[已撤销]	431126	永州市,宁远县		
-432925	江永县	湖南省	零陵地区	江永县	民政部	1980年	1994年	[已撤销]	431125	永州市,江永县		
-432926	江华瑶族自治县	湖南省	零陵地区	江华瑶族自治县	民政部	1980年	1994年	[已撤销]	431129	永州市,江华瑶族自治县		
-432927	蓝山县	湖南省	零陵地区	蓝山县	民政部	1980年	1994年	[已撤销]	431127	永州市,蓝山县		
-432928	新田县	湖南省	零陵地区	新田县	民政部	1980年	1994年	[已撤销]	431128	永州市,新田县		
-432929	双牌县	湖南省	零陵地区	双牌县	民政部	1980年	1994年	[已撤销]	431123	永州市,双牌县		
-432930	祁阳县	湖南省	零陵地区	祁阳县	民政部	1983年	1994年	[已撤销]	431121	永州市,祁阳县[已撤销]		
-433000	怀化地区	湖南省	怀化地区	-	民政部	1980年	1996年	[已撤销]	431200	怀化市（地市）		黔阳地区[1980年]
-433001	怀化市	湖南省	怀化地区	怀化市	民政部	1980年	1996年	[已撤销]	431200	怀化市（地市）		洪江市[1981年]
-433002	洪江市	湖南省	怀化地区	洪江市	民政部	1980年	1996年	[已撤销]	431281	怀化市,洪江市		怀化市[1981年]
-433021	黔阳县	湖南省	怀化地区	黔阳县	民政部	1980年	1996年	[已撤销]	431281	怀化市,洪江市		
-433022	沅陵县	湖南省	怀化地区	沅陵县	民政部	1980年	1996年	[已撤销]	431222	怀化市,沅陵县		
-433023	辰溪县	湖南省	怀化地区	辰溪县	民政部	1980年	1996年	[已撤销]	431223	怀化市,辰溪县		
-433024	溆浦县	湖南省	怀化地区	溆浦县	民政部	1980年	1996年	[已撤销]	431224	怀化市,溆浦县		
-433025	麻阳苗族自治县	湖南省	怀化地区	麻阳苗族自治县	民政部	1980年	1996年	[已撤销]	431226	怀化市,麻阳苗族自治县		麻阳县[1987年]
-433026	新晃侗族自治县	湖南省	怀化地区	新晃侗族自治县	民政部	1980年	1996年	[已撤销]	431227	怀化市,新晃侗族自治县		
-433027	芷江侗族自治县	湖南省	怀化地区	芷江侗族自治县	民政部	1980年	1996年	[已撤销]	431228	怀化市,芷江侗族自治县		芷江县[1985年]
-433028	怀化县	湖南省	怀化地区	怀化县	民政部	1980年	1981年	[已撤销]	433001	怀化地区,怀化市[已撤销]		
-433029	会同县	湖南省	怀化地区	会同县	民政部	1980年	1996年	[已撤销]	431225	怀化市,会同县		
-433030	靖州苗族侗族自治县	湖南省	怀化地区	靖州苗族侗族自治县	民政部	1980年	1996年	[已撤销]	431229	怀化市,靖州苗族侗族自治县		靖县[1986年]
-433031	通道侗族自治县	湖南省	怀化地区	通道侗族自治县	民政部	1980年	1996年	[已撤销]	431230	怀化市,通道侗族自治县		
-433100	湘西土家族苗族自治州	湖南省	湘西土家族苗族自治州	-	民政部	1980年	2024年					
-433101	吉首市	湖南省	湘西土家族苗族自治州	吉首市	民政部	1982年	2024年					
-433102	大庸市	湖南省	湘西土家族苗族自治州	大庸市	民政部	1985年	1987年	[已撤销]	430800	张家界市（地市）		
-433121	吉首县	湖南省	湘西土家族苗族自治州	吉首县	民政部	1980年	1981年	[已撤销]	433101	湘西土家族苗族自治州,吉首市		
-433122	泸溪县	湖南省	湘西土家族苗族自治州	泸溪县	民政部	1980年	2024年					
-433123	凤凰县	湖南省	湘西土家族苗族自治州	凤凰县	民政部	1980年	2024年					
-433124	花垣县	湖南省	湘西土家族苗族自治州	花垣县	民政部	1980年	2024年					
-433125	保靖县	湖南省	湘西土家族苗族自治州	保靖县	民政部	1980年	2024年					
-433126	古丈县	湖南省	湘西土家族苗族自治州	古丈县	民政部	1980年	2024年					
-433127	永顺县	湖南省	湘西土家族苗族自治州	永顺县	民政部	1980年	2024年					
-433128	大庸县	湖南省	湘西土家族苗族自治州	大庸县	民政部	1980年	1984年	[已撤销]	433102	湘西土家族苗族自治州,大庸市[已撤销]		
-433129	桑植县	湖南省	湘西土家族苗族自治州	桑植县	民政部	1980年	1987年	[已撤销]	430822	张家界市,桑植县		
-433130	龙山县	湖南省	湘西土家族苗族自治州	龙山县	民政部	1980年	2024年					
-439000	省直辖行政单位	湖南省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-439001	醴陵市	湖南省	省直辖县级行政区划	醴陵市	民政部	1986年	1994年	[已撤销]	430281	株洲市,醴陵市		
-439002	湘乡市	湖南省	省直辖县级行政区划	湘乡市	民政部	1986年	1994年	[已撤销]	430381	湘潭市,湘乡市		
-439003	耒阳市	湖南省	省直辖县级行政区划	耒阳市	民政部	1986年	1994年	[已撤销]	430481	衡阳市,耒阳市		
-439004	汨罗市	湖南省	省直辖县级行政区划	汨罗市	民政部	1987年	1994年	[已撤销]	430681	岳阳市,汨罗市		
-439005	津市市	湖南省	省直辖县级行政区划	津市市	民政部	1988年	1994年	[已撤销]	430781	常德市,津市市		
-439006	韶山市	湖南省	省直辖县级行政区划	韶山市	民政部	1990年	1994年	[已撤销]	430382	湘潭市,韶山市		
-439007	临湘市	湖南省	省直辖县级行政区划	临湘市	民政部	1992年	1994年	[已撤销]	430682	岳阳市,临湘市		
-439008	浏阳市	湖南省	省直辖县级行政区划	浏阳市	民政部	1993年	1994年	[已撤销]	430181	长沙市,浏阳市		
-439009	资兴市	湖南省	省直辖县级行政区划	资兴市	民政部	1994年	1994年	[已撤销]	431081	郴州市,资兴市		
-439010	沅江市	湖南省	省直辖县级行政区划	沅江市	民政部	1994年	1994年	[已撤销]	430981	益阳市,沅江市		
-439011	武冈市	湖南省	省直辖县级行政区划	武冈市	民政部	1994年	1994年	[已撤销]	430581	邵阳市,武冈市		
-440000	广东省	广东省	-	-	民政部	1980年	2024年					
-440001		广东省			非官方						1996年	可能为440101错号
-440100	广州市	广东省	广州市	-	民政部	1980年	2024年				未发现	
-440101	市辖区	广东省	广州市	市辖区	国标						至1991年	增设（GB/T 2260-1984）
-440102	东山区	广东省	广州市	东山区	民政部	1980年	2004年	[已撤销]	440104	广州市,越秀区	至2006年	
-440103	荔湾区	广东省	广州市	荔湾区	民政部	1980年	2024年				一直在用	
-440104	越秀区	广东省	广州市	越秀区	民政部	1980年	2024年				一直在用	
-440105	海珠区	广东省	广州市	海珠区	民政部	1980年	2024年				一直在用	
-440106	天河区	广东省	广州市	天河区	民政部	1985年	2024年				一直在用	芳村区[1987年]
-440107	芳村区	广东省	广州市	芳村区	民政部	1985年	2004年	[已撤销]	440103	广州市,荔湾区	至2006年	天河区[1987年]
-440111	白云区	广东省	广州市	白云区	民政部	1980年	2024年				一直在用	郊区[1986年]
-440112	黄埔区	广东省	广州市	黄埔区	民政部	1980年	2024年				一直在用	
-440113	番禺区	广东省	广州市	番禺区	民政部	2000年	2024年				2002年至今	有1965年身份证使用，疑为440101修改
-440114	花都区	广东省	广州市	花都区	民政部	2000年	2024年				2002年至今	
-440115	南沙区	广东省	广州市	南沙区	民政部	2005年	2024年				2011年至今	
-440116	萝岗区	广东省	广州市	萝岗区	民政部	2005年	2013年	[已撤销]	440112	广州市,黄埔区	2007-2019年	有1951-2000年身份证使用，疑为440101修改
-440117	从化区	广东省	广州市	从化区	民政部	2014年	2024年				2018年至今	
-440118	增城区	广东省	广州市	增城区	民政部	2014年	2024年				2020年至今	
-440120	广州市	广东省	广州市	市区	非官方						未发现	
-440121	花县	广东省	广州市	花县	民政部	1980年	1992年	[已撤销]	449013	省直辖县级行政区划,花都市[已撤销]	至1977年	
-440122	从化县	广东省	广州市	从化县	民政部	1980年	1993年	[已撤销]	449021	省直辖县级行政区划,从化市[已撤销]	至1980年	
-440123	新丰县	广东省	广州市	新丰县	民政部	1980年	1987年	[已撤销]	440233	韶关市,新丰县	至1970年	
-440124	龙门县	广东省	广州市	龙门县	民政部	1980年	1987年	[已撤销]	441324	惠州市,龙门县	至1980年	
-440125	增城县	广东省	广州市	增城县	民政部	1980年	1992年	[已撤销]	449017	省直辖县级行政区划,增城市[已撤销]	至1980年	
-440126	番禺县	广东省	广州市	番禺县	民政部	1980年	1991年	[已撤销]	449003	省直辖县级行政区划,番禺市[已撤销]	至1977年	
-440127	清远县	广东省	广州市	清远县	民政部	1983年	1987年	[已撤销]	441800	清远市（地市）	至1977年	
-440128	佛冈县	广东省	广州市	佛冈县	民政部	1983年	1987年	[已撤销]	441821	清远市,佛冈县	至1974年	
-440181	番禺市	广东省	广州市	番禺市	民政部	1995年	1999年	[已撤销]	440113	广州市,番禺区	1978-2005年	
-440182	花都市	广东省	广州市	花都市	民政部	1995年	1999年	[已撤销]	440114	广州市,花都区	1957-2004年	
-440183	增城市	广东省	广州市	增城市	民政部	1995年	2013年	[已撤销]	440118	广州市,增城区	1966-2019年	
-440184	从化市	广东省	广州市	从化市	民政部	1995年	2013年	[已撤销]	440117	广州市,从化区	1948-2018年	
-440200	韶关市	广东省	韶关市	-	民政部	1980年	2024年					
-440201	市辖区	广东省	韶关市	市辖区	国标							增设（GB/T 2260-1984）
-440202	北江区	广东省	韶关市	北江区	民政部	1984年	2003年	[已撤销]	440204	韶关市,浈江区		
-440203	武江区	广东省	韶关市	武江区	民政部	1984年	2024年					浈江区[2002年]
-440204	浈江区	广东省	韶关市	浈江区	民政部	1984年	2024年					武江区[2002年]
-440205	曲江区	广东省	韶关市	曲江区	民政部	2004年	2024年					
-440220	韶关市区	广东省	韶关市	韶关市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-440221	曲江县	广东省	韶关市	曲江县	民政部	1980年	2003年	[已撤销]	440205	韶关市,曲江区		
-440222	始兴县	广东省	韶关市	始兴县	民政部	1983年	2024年					
-440223	南雄县	广东省	韶关市	南雄县	民政部	1983年	1995年	[已撤销]	440282	韶关市,南雄市		
-440224	仁化县	广东省	韶关市	仁化县	民政部	1983年	2024年					
-440225	乐昌县	广东省	韶关市	乐昌县	民政部	1983年	1993年	[已撤销]	449026	省直辖县级行政区划,乐昌市[已撤销]		
-440226	连县	广东省	韶关市	连县	民政部	1983年	1987年	[已撤销]	441824	清远市,连县[已撤销]		
-440227	阳山县	广东省	韶关市	阳山县	民政部	1983年	1987年	[已撤销]	441823	清远市,阳山县		
-440228	英德县	广东省	韶关市	英德县	民政部	1983年	1987年	[已撤销]	441822	清远市,英德县[已撤销]		
-440229	翁源县	广东省	韶关市	翁源县	民政部	1983年	2024年					
-440230	连山壮族瑶族自治县	广东省	韶关市	连山壮族瑶族自治县	民政部	1983年	1987年	[已撤销]	441825	清远市,连山壮族瑶族自治县		
-440231	连南瑶族自治县	广东省	韶关市	连南瑶族自治县	民政部	1983年	1987年	[已撤销]	441826	清远市,连南瑶族自治县		
-440232	乳源瑶族自治县	广东省	韶关市	乳源瑶族自治县	民政部	1983年	2024年					
-440233	新丰县	广东省	韶关市	新丰县	民政部	1988年	2024年					
-440281	乐昌市	广东省	韶关市	乐昌市	民政部	1995年	2024年					
-440282	南雄市	广东省	韶关市	南雄市	民政部	1996年	2024年					
-440300	深圳市	广东省	深圳市	-	民政部	1980年	2024年					
-440301	市辖区	广东省	深圳市	市辖区	国标						1929-1999年	增设（GB/T 2260-1984）
-440302	沙头角区	广东省	深圳市	沙头角区	国标			[已撤销]				撤销（GB/T 2260-1988）
-440303	罗湖区	广东省	深圳市	罗湖区	民政部	1990年	2024年					
-440304	福田区	广东省	深圳市	福田区	民政部	1990年	2024年					
-440305	南山区	广东省	深圳市	南山区	民政部	1990年	2024年					
-440306	宝安区	广东省	深圳市	宝安区	民政部	1992年	2024年					
-440307	龙岗区	广东省	深圳市	龙岗区	民政部	1992年	2024年					
-440308	盐田区	广东省	深圳市	盐田区	民政部	1997年	2024年					
-440309	龙华区	广东省	深圳市	龙华区	民政部	2016年	2024年					
-440310	坪山区	广东省	深圳市	坪山区	民政部	2016年	2024年					
-440311	光明区	广东省	深圳市	光明区	民政部	2018年	2024年					
-440320	深圳市区	广东省	深圳市	深圳市区	国标							增设（GB/T 2260-1982）
-440321	宝安县	广东省	深圳市	宝安县	民政部	1982年	1991年	[已撤销]	440306	深圳市,宝安区		
-440400	珠海市	广东省	珠海市	-	民政部	1980年	2024年					
-440401	市辖区	广东省	珠海市	市辖区	国标						1949-1969年	增设（GB/T 2260-1984）
-440402	香洲区	广东省	珠海市	香洲区	民政部	1984年	2024年					
-440403	斗门区	广东省	珠海市	斗门区	民政部	2001年	2024年					
-440404	金湾区	广东省	珠海市	金湾区	民政部	2001年	2024年					
-440421	斗门县	广东省	珠海市	斗门县	民政部	1983年	2000年	[已撤销]	440403	珠海市,斗门区		
-440500	汕头市	广东省	汕头市	-	民政部	1980年	2024年					
-440501	市辖区	广东省	汕头市	市辖区	国标						1967年	增设（GB/T 2260-1984）
-440502	龙湖区	广东省	汕头市	龙湖区	民政部	1980年	1993年	[已撤销]	440507	汕头市,龙湖区		同平区[1990年]
-440503	金园区	广东省	汕头市	金园区	民政部	1980年	1993年	[已撤销]	440508	汕头市,金园区[已撤销]		安平区[1990年]
-440504	升平区	广东省	汕头市	升平区	民政部	1980年	1993年	[已撤销]	440509	汕头市,升平区[已撤销]		公园区[1990年]
-440505	金沙区	广东省	汕头市	金沙区	民政部	1980年	1990年	[已撤销]	440511	汕头市,金平区		
-440506	达豪区	广东省	汕头市	达豪区	民政部	1984年	2002年	[已撤销]	440512	汕头市,濠江区		
-440507	龙湖区	广东省	汕头市	龙湖区	民政部	1994年	2024年					
-440508	金园区	广东省	汕头市	金园区	民政部	1994年	2002年	[已撤销]	440511	汕头市,金平区		
-440509	升平区	广东省	汕头市	升平区	民政部	1994年	2002年	[已撤销]	440511	汕头市,金平区		
-440510	河浦区	广东省	汕头市	河浦区	民政部	1994年	2002年	[已撤销]	440512	汕头市,濠江区		
-440511	金平区	广东省	汕头市	金平区	民政部	1980年	2024年					郊区[1990年]
-440512	濠江区	广东省	汕头市	濠江区	民政部	2003年	2024年					
-440513	潮阳区	广东省	汕头市	潮阳区	民政部	2003年	2024年					
-440514	潮南区	广东省	汕头市	潮南区	民政部	2003年	2024年					
-440515	澄海区	广东省	汕头市	澄海区	民政部	2003年	2024年					
-440520	潮州市	广东省	汕头市	潮州市	国标						1930-1976年	修订前（GB/T 2260-1986）
-440521	澄海县	广东省	汕头市	澄海县	民政部	1983年	1993年	[已撤销]	449022	省直辖县级行政区划,澄海市[已撤销]		
-440522	饶平县	广东省	汕头市	饶平县	民政部	1983年	1990年	[已撤销]	445122	潮州市,饶平县		
-440523	南澳县	广东省	汕头市	南澳县	民政部	1983年	2024年					
-440524	潮阳县	广东省	汕头市	潮阳县	民政部	1983年	1992年	[已撤销]	449011	省直辖县级行政区划,潮阳市[已撤销]		
-440525	揭阳县	广东省	汕头市	揭阳县	民政部	1983年	1990年	[已撤销]	445200	揭阳市（地市）		
-440526	揭西县	广东省	汕头市	揭西县	民政部	1983年	1990年	[已撤销]	445222	揭阳市,揭西县		
-440527	普宁县	广东省	汕头市	普宁县	民政部	1983年	1990年	[已撤销]	445223	揭阳市,普宁县[已撤销]		
-440528	惠来县	广东省	汕头市	惠来县	民政部	1983年	1990年	[已撤销]	445224	揭阳市,惠来县		
-440581	汕头市	广东省	汕头市	潮州市	非官方							
-440582	潮阳市	广东省	汕头市	潮阳市	民政部	1995年	2002年	[已撤销]	440513	汕头市,潮阳区		
-440583	澄海市	广东省	汕头市	澄海市	民政部	1995年	2002年	[已撤销]	440515	汕头市,澄海区		
-440600	佛山市	广东省	佛山市	-	民政部	1980年	2024年					
-440601	市辖区	广东省	佛山市	市辖区	国标						1933-1971年	增设（GB/T 2260-1984）
-440602	城区	广东省	佛山市	城区	民政部	1984年	2001年	[已撤销]	440604	佛山市,禅城区		汾江区[1986年]
-440603	石湾区	广东省	佛山市	石湾区	民政部	1984年	2001年	[已撤销]	440604	佛山市,禅城区		
-440604	禅城区	广东省	佛山市	禅城区	民政部	2002年	2024年					
-440605	南海区	广东省	佛山市	南海区	民政部	2002年	2024年					
-440606	顺德区	广东省	佛山市	顺德区	民政部	2002年	2024年					
-440607	三水区	广东省	佛山市	三水区	民政部	2002年	2024年					
-440608	高明区	广东省	佛山市	高明区	民政部	2002年	2024年					
-440620	中山市	广东省	佛山市	中山市	民政部	1983年	1983年	[已撤销]	442000	中山市（地市）		
-440621	三水县	广东省	佛山市	三水县	民政部	1983年	1992年	[已撤销]	449008	省直辖县级行政区划,三水市[已撤销]		
-440622	南海县	广东省	佛山市	南海县	民政部	1983年	1991年	[已撤销]	449004	省直辖县级行政区划,南海市[已撤销]		
-440623	顺德县	广东省	佛山市	顺德县	民政部	1983年	1991年	[已撤销]	440681	佛山市,顺德市[已撤销]		
-440624	高明县	广东省	佛山市	高明县	民政部	1983年	1993年	[已撤销]	449023	省直辖县级行政区划,高明市[已撤销]		
-440681	顺德市	广东省	佛山市	顺德市	民政部	1995年	2001年	[已撤销]	440606	佛山市,顺德区		
-440682	南海市	广东省	佛山市	南海市	民政部	1995年	2001年	[已撤销]	440605	佛山市,南海区		
-440683	三水市	广东省	佛山市	三水市	民政部	1995年	2001年	[已撤销]	440607	佛山市,三水区		
-440684	高明市	广东省	佛山市	高明市	民政部	1995年	2001年	[已撤销]	440608	佛山市,高明区		
-440700	江门市	广东省	江门市	-	民政部	1980年	2024年					
-440701	市辖区	广东省	江门市	市辖区	国标						1942-1970年	增设（GB/T 2260-1984）
-440702	城区	广东省	江门市	城区	民政部	1984年	1993年	[已撤销]	440704	江门市,江海区		
-440703	蓬江区	广东省	江门市	蓬江区	民政部	1994年	2024年					
-440704	江海区	广东省	江门市	江海区	民政部	1994年	2024年					
-440705	新会区	广东省	江门市	新会区	民政部	2002年	2024年					
-440711	郊区	广东省	江门市	郊区	民政部	1984年	1993年	[已撤销]	440703	江门市,蓬江区		
-440721	新会县	广东省	江门市	新会县	民政部	1983年	1991年	[已撤销]	449006	省直辖县级行政区划,新会市[已撤销]		
-440722	台山县	广东省	江门市	台山县	民政部	1983年	1991年	[已撤销]	440781	江门市,台山市		
-440723	恩平县	广东省	江门市	恩平县	民政部	1983年	1993年	[已撤销]	449020	省直辖县级行政区划,恩平市[已撤销]		
-440724	开平县	广东省	江门市	开平县	民政部	1983年	1992年	[已撤销]	449007	省直辖县级行政区划,开平市[已撤销]		
-440725	鹤山县	广东省	江门市	鹤山县	民政部	1983年	1992年	[已撤销]	449015	省直辖县级行政区划,鹤山市[已撤销]		
-440726	阳江县	广东省	江门市	阳江县	民政部	1983年	1987年	[已撤销]	441700	阳江市（地市）		
-440727	阳春县	广东省	江门市	阳春县	民政部	1983年	1987年	[已撤销]	441722	阳江市,阳春县[已撤销]		
-440734		广东省	江门市		非官方						1956年	
-440781	台山市	广东省	江门市	台山市	民政部	1995年	2024年					
-440782	新会市	广东省	江门市	新会市	民政部	1995年	2001年	[已撤销]	440705	江门市,新会区		
-440783	开平市	广东省	江门市	开平市	民政部	1995年	2024年					
-440784	鹤山市	广东省	江门市	鹤山市	民政部	1995年	2024年					
-440785	恩平市	广东省	江门市	恩平市	民政部	1995年	2024年					
-440800	湛江市	广东省	湛江市	-	民政部	1980年	2024年					
-440801	市辖区	广东省	湛江市	市辖区	国标						1938-2022年	增设（GB/T 2260-1984）
-440802	赤坎区	广东省	湛江市	赤坎区	民政部	1980年	2024年					
-440803	霞山区	广东省	湛江市	霞山区	民政部	1980年	2024年					
-440804	坡头区	广东省	湛江市	坡头区	民政部	1984年	2024年					
-440811	麻章区	广东省	湛江市	麻章区	民政部	1980年	2024年					郊区[1993年]
-440821	吴川县	广东省	湛江市	吴川县	民政部	1983年	1993年	[已撤销]	449029	省直辖县级行政区划,吴川市[已撤销]		
-440822	廉江县	广东省	湛江市	廉江县	民政部	1983年	1992年	[已撤销]	449018	省直辖县级行政区划,廉江市[已撤销]		
-440823	遂溪县	广东省	湛江市	遂溪县	民政部	1983年	2024年					
-440824	海康县	广东省	湛江市	海康县	民政部	1983年	1993年	[已撤销]	449025	省直辖县级行政区划,雷州市[已撤销]		
-440825	徐闻县	广东省	湛江市	徐闻县	民政部	1983年	2024年					
-440881	廉江市	广东省	湛江市	廉江市	民政部	1995年	2024年					
-440882	雷州市	广东省	湛江市	雷州市	民政部	1995年	2024年					
-440883	吴川市	广东省	湛江市	吴川市	民政部	1995年	2024年					
-440900	茂名市	广东省	茂名市	-	民政部	1980年	2024年					
-440901	市辖区	广东省	茂名市	市辖区	国标							增设（GB/T 2260-1984）
-440902	茂南区	广东省	茂名市	茂南区	民政部	1984年	2024年					
-440903	茂港区	广东省	茂名市	茂港区	民政部	2001年	2013年	[已撤销]	440904	茂名市,电白区		
-440904	电白区	广东省	茂名市	电白区	民政部	2014年	2024年					
-440921	信宜县	广东省	茂名市	信宜县	民政部	1983年	1994年	[已撤销]	440983	茂名市,信宜市		
-440922	高州县	广东省	茂名市	高州县	民政部	1983年	1992年	[已撤销]	449012	省直辖县级行政区划,高州市[已撤销]		
-440923	电白县	广东省	茂名市	电白县	民政部	1983年	2013年	[已撤销]	440904	茂名市,电白区		
-440924	化州县	广东省	茂名市	化州县	民政部	1983年	1993年	[已撤销]	449031	省直辖县级行政区划,化州市[已撤销]		
-440925		广东省	茂名市		非官方						1953年	疑为电白县442925错号
-440927	茂名市	广东省	茂名市		非官方						1973年	分析见本人文章评论，疑为化州县442927错号
-440981	高州市	广东省	茂名市	高州市	民政部	1995年	2024年					
-440982	化州市	广东省	茂名市	化州市	民政部	1995年	2024年					
-440983	信宜市	广东省	茂名市	信宜市	民政部	1995年	2024年					
-441000	海口市	广东省	海口市	-	民政部	1980年	1987年	[已撤销]	460100	海口市（地市）		
-441001	潮州市	广东省	海口市	潮州市	民政部	1983年	1983年	[已撤销]	445100	潮州市（地市）		
-441002	新华区	广东省	海口市	新华区	民政部	1980年	1982年	[已撤销]	460103	海口市,新华区[已撤销]		
-441003	立新区	广东省	海口市	立新区	民政部	1980年	1982年	[已撤销]	460102	海口市,振东区[已撤销]		
-441004	东方红区	广东省	海口市	东方红区	民政部	1980年	1982年	[已撤销]	460102	海口市,振东区[已撤销]		
-441005	秀英区	广东省	海口市	秀英区	民政部	1980年	1982年	[已撤销]	460104	海口市,秀英区[已撤销]		
-441100	三亚市	广东省	三亚市	-	民政部	1987年	1987年	[已撤销]	460200	三亚市（地市）		
-441200	肇庆市	广东省	肇庆市	-	民政部	1988年	2024年					
-441201	市辖区	广东省	肇庆市	市辖区	国标							
-441202	端州区	广东省	肇庆市	端州区	民政部	1988年	2024年					
-441203	鼎湖区	广东省	肇庆市	鼎湖区	民政部	1988年	2024年					
-441204	高要区	广东省	肇庆市	高要区	民政部	2015年	2024年					
-441221	高要县	广东省	肇庆市	高要县	民政部	1988年	1992年	[已撤销]	449014	省直辖县级行政区划,高要市[已撤销]		
-441222	四会县	广东省	肇庆市	四会县	民政部	1988年	1992年	[已撤销]	449016	省直辖县级行政区划,四会市[已撤销]		
-441223	广宁县	广东省	肇庆市	广宁县	民政部	1988年	2024年					
-441224	怀集县	广东省	肇庆市	怀集县	民政部	1988年	2024年					
-441225	封开县	广东省	肇庆市	封开县	民政部	1988年	2024年					
-441226	德庆县	广东省	肇庆市	德庆县	民政部	1988年	2024年					
-441227	云浮县	广东省	肇庆市	云浮县	民政部	1988年	1991年	[已撤销]	449005	省直辖县级行政区划,云浮市[已撤销]		
-441228	新兴县	广东省	肇庆市	新兴县	民政部	1988年	1993年	[已撤销]	445321	云浮市,新兴县		
-441229	郁南县	广东省	肇庆市	郁南县	民政部	1988年	1993年	[已撤销]	445322	云浮市,郁南县		
-441230	罗定县	广东省	肇庆市	罗定县	民政部	1988年	1992年	[已撤销]	449010	省直辖县级行政区划,罗定市[已撤销]		
-441281	肇庆市	广东省	肇庆市	云浮市	非官方						1965-1983年	
-441282	肇庆市	广东省	肇庆市	罗定市	非官方						1966-1983年	
-441283	高要市	广东省	肇庆市	高要市	民政部	1995年	2014年	[已撤销]	441204	肇庆市,高要区		
-441284	四会市	广东省	肇庆市	四会市	民政部	1995年	2024年					
-441300	惠州市	广东省	惠州市	-	民政部	1988年	2024年					
-441301	市辖区	广东省	惠州市	市辖区	国标						1974-1998年	
-441302	惠城区	广东省	惠州市	惠城区	民政部	1988年	2024年					
-441303	惠阳区	广东省	惠州市	惠阳区	民政部	2003年	2024年					
-441321	惠阳县	广东省	惠州市	惠阳县	民政部	1988年	1993年	[已撤销]	449028	省直辖县级行政区划,惠阳市[已撤销]		
-441322	博罗县	广东省	惠州市	博罗县	民政部	1988年	2024年					
-441323	惠东县	广东省	惠州市	惠东县	民政部	1988年	2024年					
-441324	龙门县	广东省	惠州市	龙门县	民政部	1988年	2024年					
-441381	惠阳市	广东省	惠州市	惠阳市	民政部	1995年	2002年	[已撤销]	441303	惠州市,惠阳区		
-441400	梅州市	广东省	梅州市	-	民政部	1988年	2024年					
-441401	市辖区	广东省	梅州市	市辖区	国标							
-441402	梅江区	广东省	梅州市	梅江区	民政部	1988年	2024年					
-441403	梅县区	广东省	梅州市	梅县区	民政部	2013年	2024年					
-441421	梅县	广东省	梅州市	梅县	民政部	1988年	2012年	[已撤销]	441403	梅州市,梅县区		
-441422	大埔县	广东省	梅州市	大埔县	民政部	1988年	2024年					
-441423	丰顺县	广东省	梅州市	丰顺县	民政部	1988年	2024年					
-441424	五华县	广东省	梅州市	五华县	民政部	1988年	2024年					
-441425	兴宁县	广东省	梅州市	兴宁县	民政部	1988年	1993年	[已撤销]	449030	省直辖县级行政区划,兴宁市[已撤销]		
-441426	平远县	广东省	梅州市	平远县	民政部	1988年	2024年					
-441427	蕉岭县	广东省	梅州市	蕉岭县	民政部	1988年	2024年					
-441481	兴宁市	广东省	梅州市	兴宁市	民政部	1995年	2024年					
-441500	汕尾市	广东省	汕尾市	-	民政部	1988年	2024年					
-441501	市辖区	广东省	汕尾市	市辖区	国标						1954-2013年	
-441502	城区	广东省	汕尾市	城区	民政部	1988年	2024年					
-441521	海丰县	广东省	汕尾市	海丰县	民政部	1988年	2024年					
-441522	陆丰县	广东省	汕尾市	陆丰县	民政部	1988年	1994年	[已撤销]	441581	汕尾市,陆丰市		
-441523	陆河县	广东省	汕尾市	陆河县	民政部	1988年	2024年					
-441581	陆丰市	广东省	汕尾市	陆丰市	民政部	1995年	2024年					
-441600	河源市	广东省	河源市	-	民政部	1988年	2024年					
-441601	市辖区	广东省	河源市	市辖区	国标							
-441602	源城区	广东省	河源市	源城区	民政部	1988年	2024年					
-441611	郊区	广东省	河源市	郊区	民政部	1988年	1992年	[已撤销]	441625	河源市,东源县		
-441621	紫金县	广东省	河源市	紫金县	民政部	1988年	2024年					
-441622	龙川县	广东省	河源市	龙川县	民政部	1988年	2024年					
-441623	连平县	广东省	河源市	连平县	民政部	1988年	2024年					
-441624	和平县	广东省	河源市	和平县	民政部	1988年	2024年					
-441625	东源县	广东省	河源市	东源县	民政部	1993年	2024年					
-441700	阳江市	广东省	阳江市	-	民政部	1988年	2024年					
-441701	市辖区	广东省	阳江市	市辖区	国标						1967-2007年	
-441702	江城区	广东省	阳江市	江城区	民政部	1988年	2024年					
-441703	阳东区	广东省	阳江市	阳东区	民政部	1988年	1990年	[已撤销]	441723	阳江市,阳东县[已撤销]		
-441704	阳东区	广东省	阳江市	阳东区	民政部	2014年	2024年					
-441721	阳西县	广东省	阳江市	阳西县	民政部	1988年	2024年					
-441722	阳春县	广东省	阳江市	阳春县	民政部	1988年	1993年	[已撤销]	449027	省直辖县级行政区划,阳春市[已撤销]		
-441723	阳东县	广东省	阳江市	阳东县	民政部	1991年	2013年	[已撤销]	441704	阳江市,阳东区		
-441727		广东省	阳江市		非官方						1964年	
-441781	阳春市	广东省	阳江市	阳春市	民政部	1995年	2024年					
-441800	清远市	广东省	清远市	-	民政部	1988年	2024年					
-441801	市辖区	广东省	清远市	市辖区	国标						1977-1999年	
-441802	清城区	广东省	清远市	清城区	民政部	1988年	2024年					
-441803	清新区	广东省	清远市	清新区	民政部	2012年	2024年					
-441811	清郊区	广东省	清远市	清郊区	民政部	1988年	1991年	[已撤销]	441827	清远市,清新县[已撤销]		
-441821	佛冈县	广东省	清远市	佛冈县	民政部	1988年	2024年					
-441822	英德县	广东省	清远市	英德县	民政部	1988年	1993年	[已撤销]	449019	省直辖县级行政区划,英德市[已撤销]		
-441823	阳山县	广东省	清远市	阳山县	民政部	1988年	2024年					
-441824	连县	广东省	清远市	连县	民政部	1988年	1993年	[已撤销]	441882	省直辖县级行政区划,连州市[已撤销]		
-441825	连山壮族瑶族自治县	广东省	清远市	连山壮族瑶族自治县	民政部	1988年	2024年					
-441826	连南瑶族自治县	广东省	清远市	连南瑶族自治县	民政部	1988年	2024年					
-441827	清新县	广东省	清远市	清新县	民政部	1992年	2011年	[已撤销]	441803	清远市,清新区		
-441881	英德市	广东省	清远市	英德市	民政部	1995年	2024年					
-441882	连州市	广东省	清远市	连州市	民政部	1995年	2024年					
-441900	东莞市	广东省	东莞市	-	民政部	1988年	2024年					
-442000	中山市	广东省	中山市	-	民政部	1988年	2024年					
-442100	海南行政区	广东省	海南行政区	-	民政部	1980年	1987年	[已撤销]	460000	海南省		
-442101	海口市	广东省	海南行政区	海口市	民政部	1983年	1985年	[已撤销]	441000	海口市（地市）[已撤销]		
-442102	通什市	广东省	海南行政区	通什市	民政部	1987年	1987年	[已撤销]	460001	直辖,五指山市[已撤销]		
-442121	琼山县	广东省	海南行政区	琼山县	民政部	1980年	1987年	[已撤销]	460021	直辖,琼山县[已撤销]		
-442122	文昌县	广东省	海南行政区	文昌县	民政部	1980年	1987年	[已撤销]	460022	直辖,文昌县[已撤销]		
-442123	琼海县	广东省	海南行政区	琼海县	民政部	1980年	1987年	[已撤销]	460023	直辖,琼海县[已撤销]		
-442124	万宁县	广东省	海南行政区	万宁县	民政部	1980年	1987年	[已撤销]	460024	直辖,万宁县[已撤销]		
-442125	定安县	广东省	海南行政区	定安县	民政部	1980年	1987年	[已撤销]	460025	直辖,定安县[已撤销]		
-442126	屯昌县	广东省	海南行政区	屯昌县	民政部	1980年	1987年	[已撤销]	460026	直辖,屯昌县[已撤销]		
-442127	澄迈县	广东省	海南行政区	澄迈县	民政部	1980年	1987年	[已撤销]	460027	直辖,澄迈县[已撤销]		
-442128	临高县	广东省	海南行政区	临高县	民政部	1980年	1987年	[已撤销]	460028	直辖,临高县[已撤销]		
-442129	儋县	广东省	海南行政区	儋县	民政部	1980年	1987年	[已撤销]	460029	直辖,儋县[已撤销]		
-442130	东方黎族自治县	广东省	海南行政区	东方黎族自治县	民政部	1987年	1987年	[已撤销]	460032	直辖,东方黎族自治县[已撤销]		西沙群岛、南沙群岛、中沙群岛：增设（GB-T 2260-1982）
-442131	乐东黎族自治县	广东省	海南行政区	乐东黎族自治县	民政部	1987年	1987年	[已撤销]	460033	直辖,乐东黎族自治县[已撤销]		
-442132	琼中黎族苗族自治县	广东省	海南行政区	琼中黎族苗族自治县	民政部	1987年	1987年	[已撤销]	460036	直辖,琼中黎族苗族自治县[已撤销]		
-442133	保亭黎族苗族自治县	广东省	海南行政区	保亭黎族苗族自治县	民政部	1987年	1987年	[已撤销]	460035	直辖,保亭黎族苗族自治县[已撤销]		
-442134	陵水黎族自治县	广东省	海南行政区	陵水黎族自治县	民政部	1987年	1987年	[已撤销]	460034	直辖,陵水黎族自治县[已撤销]		
-442135	白沙黎族自治县	广东省	海南行政区	白沙黎族自治县	民政部	1987年	1987年	[已撤销]	460030	直辖,白沙黎族自治县[已撤销]		
-442136	昌江黎族自治县	广东省	海南行政区	昌江黎族自治县	民政部	1987年	1987年	[已撤销]	460031	直辖,昌江黎族自治县[已撤销]		
-442200	海南黎族苗族自治州	广东省	海南黎族苗族自治州	-	民政部	1980年	1986年	[已撤销]	460000	海南省		
-442201	三亚市	广东省	海南黎族苗族自治州	三亚市	民政部	1984年	1986年	[已撤销]	441100	三亚市（地市）[已撤销]		
-442202	通什市	广东省	海南黎族苗族自治州	通什市	民政部	1986年	1986年	[已撤销]	442102	海南行政区,通什市[已撤销]		
-442221	崖县	广东省	海南黎族苗族自治州	崖县	民政部	1980年	1983年	[已撤销]	442201	海南黎族苗族自治州,三亚市[已撤销]		
-442222	东方县	广东省	海南黎族苗族自治州	东方县	民政部	1980年	1986年	[已撤销]	442130	海南行政区,东方黎族自治县[已撤销]		
-442223	乐东县	广东省	海南黎族苗族自治州	乐东县	民政部	1980年	1986年	[已撤销]	442131	海南行政区,乐东黎族自治县[已撤销]		
-442224	琼中县	广东省	海南黎族苗族自治州	琼中县	民政部	1980年	1986年	[已撤销]	442132	海南行政区,琼中黎族苗族自治县[已撤销]		
-442225	保亭县	广东省	海南黎族苗族自治州	保亭县	民政部	1980年	1986年	[已撤销]	442133	海南行政区,保亭黎族苗族自治县[已撤销]		
-442226	陵水县	广东省	海南黎族苗族自治州	陵水县	民政部	1980年	1986年	[已撤销]	442134	海南行政区,陵水黎族自治县[已撤销]		
-442227	白沙县	广东省	海南黎族苗族自治州	白沙县	民政部	1980年	1986年	[已撤销]	442135	海南行政区,白沙黎族自治县[已撤销]		
-442228	昌江县	广东省	海南黎族苗族自治州	昌江县	民政部	1980年	1986年	[已撤销]	442136	海南行政区,昌江黎族自治县[已撤销]		
-442229	西沙、南沙、中沙群岛	广东省	海南黎族苗族自治州	西沙、南沙、中沙群岛	国标							修订前（GB/T 2260-1986）
-442287		广东省	海南黎族苗族自治州		非官方						1964年	
-442300	汕头地区	广东省	汕头地区	-	民政部	1980年	1982年	[已撤销]	440500	汕头市（地市）		
-442301	潮州市	广东省	汕头地区	潮州市	民政部	1980年	1981年	[已撤销]	442302	汕头地区,潮州市[已撤销]		
-442302	潮州市	广东省	汕头地区	潮州市	民政部	1982年	1982年	[已撤销]	441001	海口市,潮州市[已撤销]		
-442321	潮安县	广东省	汕头地区	潮安县	民政部	1980年	1982年	[已撤销]	445121	潮州市,潮安县[已撤销]		
-442322	澄海县	广东省	汕头地区	澄海县	民政部	1980年	1982年	[已撤销]	440521	汕头市,澄海县[已撤销]		
-442323	饶平县	广东省	汕头地区	饶平县	民政部	1980年	1982年	[已撤销]	440522	汕头市,饶平县[已撤销]		
-442324	南澳县	广东省	汕头地区	南澳县	民政部	1980年	1982年	[已撤销]	440523	汕头市,南澳县		
-442325	潮阳县	广东省	汕头地区	潮阳县	民政部	1980年	1982年	[已撤销]	440524	汕头市,潮阳县[已撤销]		
-442326	揭阳县	广东省	汕头地区	揭阳县	民政部	1980年	1982年	[已撤销]	440525	汕头市,揭阳县[已撤销]		
-442327	揭西县	广东省	汕头地区	揭西县	民政部	1980年	1982年	[已撤销]	440526	汕头市,揭西县[已撤销]		
-442328	普宁县	广东省	汕头地区	普宁县	民政部	1980年	1982年	[已撤销]	440527	汕头市,普宁县[已撤销]		
-442329	惠来县	广东省	汕头地区	惠来县	民政部	1980年	1982年	[已撤销]	440528	汕头市,惠来县[已撤销]		
-442330	陆丰县	广东省	汕头地区	陆丰县	民政部	1980年	1982年	[已撤销]	442530	惠阳地区,陆丰县[已撤销]		
-442331	海丰县	广东省	汕头地区	海丰县	民政部	1980年	1982年	[已撤销]	442531	惠阳地区,海丰县[已撤销]		
-442400	梅县地区	广东省	梅县地区	-	民政部	1980年	1987年	[已撤销]	441400	梅州市（地市）		
-442401	梅县市	广东省	梅县地区	梅县市	民政部	1980年	1987年	[已撤销]	441421	梅州市,梅县[已撤销]		梅州市[1982年]
-442421	梅县	广东省	梅县地区	梅县	民政部	1980年	1982年	[已撤销]	442401	梅县地区,梅县市[已撤销]		
-442422	大埔县	广东省	梅县地区	大埔县	民政部	1980年	1987年	[已撤销]	441422	梅州市,大埔县		
-442423	丰顺县	广东省	梅县地区	丰顺县	民政部	1980年	1987年	[已撤销]	441423	梅州市,丰顺县		
-442424	五华县	广东省	梅县地区	五华县	民政部	1980年	1987年	[已撤销]	441424	梅州市,五华县		
-442425	兴宁县	广东省	梅县地区	兴宁县	民政部	1980年	1987年	[已撤销]	441425	梅州市,兴宁县[已撤销]		
-442426	平远县	广东省	梅县地区	平远县	民政部	1980年	1987年	[已撤销]	441426	梅州市,平远县		
-442427	蕉岭县	广东省	梅县地区	蕉岭县	民政部	1980年	1987年	[已撤销]	441427	梅州市,蕉岭县		
-442500	惠阳地区	广东省	惠阳地区	-	民政部	1980年	1987年	[已撤销]	441300	惠州市（地市）		
-442501	惠州市	广东省	惠阳地区	惠州市	民政部	1980年	1987年	[已撤销]	441300	惠州市（地市）		
-442502	东莞市	广东省	惠阳地区	东莞市	民政部	1985年	1987年	[已撤销]	441900	东莞市（地市）		
-442521	惠阳县	广东省	惠阳地区	惠阳县	民政部	1980年	1987年	[已撤销]	441321	惠州市,惠阳县[已撤销]		
-442522	紫金县	广东省	惠阳地区	紫金县	民政部	1980年	1987年	[已撤销]	441621	河源市,紫金县		
-442523	和平县	广东省	惠阳地区	和平县	民政部	1980年	1987年	[已撤销]	441624	河源市,和平县		
-442524	连平县	广东省	惠阳地区	连平县	民政部	1980年	1987年	[已撤销]	441623	河源市,连平县		
-442525	河源县	广东省	惠阳地区	河源县	民政部	1980年	1987年	[已撤销]	441600	河源市（地市）		
-442526	博罗县	广东省	惠阳地区	博罗县	民政部	1980年	1987年	[已撤销]	441322	惠州市,博罗县		
-442527	东莞县	广东省	惠阳地区	东莞县	民政部	1980年	1984年	[已撤销]	442502	惠阳地区,东莞市[已撤销]		
-442528	惠东县	广东省	惠阳地区	惠东县	民政部	1980年	1987年	[已撤销]	441323	惠州市,惠东县		
-442529	龙川县	广东省	惠阳地区	龙川县	民政部	1980年	1987年	[已撤销]	441622	河源市,龙川县		
-442530	陆丰县	广东省	惠阳地区	陆丰县	民政部	1983年	1987年	[已撤销]	441522	汕尾市,陆丰县[已撤销]		
-442531	海丰县	广东省	惠阳地区	海丰县	民政部	1983年	1987年	[已撤销]	441521	汕尾市,海丰县		
-442600	韶关地区	广东省	韶关地区	-	民政部	1980年	1982年	[已撤销]	440200	韶关市（地市）		
-442621	始兴县	广东省	韶关地区	始兴县	民政部	1980年	1982年	[已撤销]	440222	韶关市,始兴县		
-442622	南雄县	广东省	韶关地区	南雄县	民政部	1980年	1982年	[已撤销]	440223	韶关市,南雄县[已撤销]		
-442623	仁化县	广东省	韶关地区	仁化县	民政部	1980年	1982年	[已撤销]	440224	韶关市,仁化县		
-442624	乐昌县	广东省	韶关地区	乐昌县	民政部	1980年	1982年	[已撤销]	440225	韶关市,乐昌县[已撤销]		
-442625	连县	广东省	韶关地区	连县	民政部	1980年	1982年	[已撤销]	440226	韶关市,连县[已撤销]		
-442626	阳山县	广东省	韶关地区	阳山县	民政部	1980年	1982年	[已撤销]	440227	韶关市,阳山县[已撤销]		
-442627	英德县	广东省	韶关地区	英德县	民政部	1980年	1982年	[已撤销]	440228	韶关市,英德县[已撤销]		
-442628	清远县	广东省	韶关地区	清远县	民政部	1980年	1982年	[已撤销]	440127	广州市,清远县[已撤销]		
-442629	佛冈县	广东省	韶关地区	佛冈县	民政部	1980年	1982年	[已撤销]	440128	广州市,佛冈县[已撤销]		
-442630	翁源县	广东省	韶关地区	翁源县	民政部	1980年	1982年	[已撤销]	440229	韶关市,翁源县		
-442631	连山壮族瑶族自治县	广东省	韶关地区	连山壮族瑶族自治县	民政部	1980年	1982年	[已撤销]	440230	韶关市,连山壮族瑶族自治县[已撤销]		
-442632	连南瑶族自治县	广东省	韶关地区	连南瑶族自治县	民政部	1980年	1982年	[已撤销]	440231	韶关市,连南瑶族自治县[已撤销]		
-442633	乳源瑶族自治县	广东省	韶关地区	乳源瑶族自治县	民政部	1980年	1982年	[已撤销]	440232	韶关市,乳源瑶族自治县		
-442700	佛山地区	广东省	佛山地区	-	民政部	1980年	1982年	[已撤销]	440600	佛山市（地市）		
-442701	佛山市	广东省	佛山地区	佛山市	国标			[已撤销]				撤销（GB/T 2260-1984）
-442702	江门市	广东省	佛山地区	江门市	国标			[已撤销]				撤销（GB/T 2260-1984）
-442721	三水县	广东省	佛山地区	三水县	民政部	1980年	1982年	[已撤销]	440621	佛山市,三水县[已撤销]		
-442722	南海县	广东省	佛山地区	南海县	民政部	1980年	1982年	[已撤销]	440622	佛山市,南海县[已撤销]		
-442723	顺德县	广东省	佛山地区	顺德县	民政部	1980年	1982年	[已撤销]	440623	佛山市,顺德县[已撤销]		
-442724	中山县	广东省	佛山地区	中山县	民政部	1980年	1982年	[已撤销]	440620	佛山市,中山市[已撤销]		
-442725	斗门县	广东省	佛山地区	斗门县	民政部	1980年	1982年	[已撤销]	440421	珠海市,斗门县[已撤销]		
-442726	新会县	广东省	佛山地区	新会县	民政部	1980年	1982年	[已撤销]	440721	江门市,新会县[已撤销]		
-442727	台山县	广东省	佛山地区	台山县	民政部	1980年	1982年	[已撤销]	440722	江门市,台山县[已撤销]		
-442728	恩平县	广东省	佛山地区	恩平县	民政部	1980年	1982年	[已撤销]	440723	江门市,恩平县[已撤销]		
-442729	开平县	广东省	佛山地区	开平县	民政部	1980年	1982年	[已撤销]	440724	江门市,开平县[已撤销]		
-442730	高鹤县	广东省	佛山地区	高鹤县	民政部	1980年	1980年	[已撤销]	442732,442731	佛山地区,高明县[已撤销],鹤山县[已撤销]		
-442731	鹤山县	广东省	佛山地区	鹤山县	民政部	1981年	1982年	[已撤销]	440725	江门市,鹤山县[已撤销]		
-442732	高明县	广东省	佛山地区	高明县	民政部	1981年	1982年	[已撤销]	440624	佛山市,高明县[已撤销]		
-442800	肇庆地区	广东省	肇庆地区	-	民政部	1980年	1987年	[已撤销]	441200	肇庆市（地市）		
-442801	肇庆市	广东省	肇庆地区	肇庆市	民政部	1980年	1987年	[已撤销]	441200	肇庆市（地市）		
-442803		广东省	肇庆地区		非官方						1966年	
-442821	高要县	广东省	肇庆地区	高要县	民政部	1980年	1987年	[已撤销]	441221	肇庆市,高要县[已撤销]		
-442822	四会县	广东省	肇庆地区	四会县	民政部	1980年	1987年	[已撤销]	441222	肇庆市,四会县[已撤销]		
-442823	广宁县	广东省	肇庆地区	广宁县	民政部	1980年	1987年	[已撤销]	441223	肇庆市,广宁县		
-442824	怀集县	广东省	肇庆地区	怀集县	民政部	1980年	1987年	[已撤销]	441224	肇庆市,怀集县		
-442825	封开县	广东省	肇庆地区	封开县	民政部	1980年	1987年	[已撤销]	441225	肇庆市,封开县		
-442826	德庆县	广东省	肇庆地区	德庆县	民政部	1980年	1987年	[已撤销]	441226	肇庆市,德庆县		
-442827	云浮县	广东省	肇庆地区	云浮县	民政部	1980年	1987年	[已撤销]	441227	肇庆市,云浮县[已撤销]		
-442828	新兴县	广东省	肇庆地区	新兴县	民政部	1980年	1987年	[已撤销]	441228	肇庆市,新兴县[已撤销]		
-442829	郁南县	广东省	肇庆地区	郁南县	民政部	1980年	1987年	[已撤销]	441229	肇庆市,郁南县[已撤销]		
-442830	罗定县	广东省	肇庆地区	罗定县	民政部	1980年	1987年	[已撤销]	441230	肇庆市,罗定县[已撤销]		
-442900	湛江地区	广东省	湛江地区	-	民政部	1980年	1982年	[已撤销]	440800	湛江市（地市）		
-442901	湛江市	广东省	湛江地区	湛江市	国标			[已撤销]				撤销（GB/T 2260-1984）
-442902	茂名市	广东省	湛江地区	茂名市	国标			[已撤销]				撤销（GB/T 2260-1984）
-442921	阳江县	广东省	湛江地区	阳江县	民政部	1980年	1982年	[已撤销]	440726	江门市,阳江县[已撤销]		
-442922	阳春县	广东省	湛江地区	阳春县	民政部	1980年	1982年	[已撤销]	440727	江门市,阳春县[已撤销]		
-442923	信宜县	广东省	湛江地区	信宜县	民政部	1980年	1982年	[已撤销]	440921	茂名市,信宜县[已撤销]		
-442924	高州县	广东省	湛江地区	高州县	民政部	1980年	1982年	[已撤销]	440922	茂名市,高州县[已撤销]		
-442925	电白县	广东省	湛江地区	电白县	民政部	1980年	1982年	[已撤销]	440923	茂名市,电白县[已撤销]		
-442926	吴川县	广东省	湛江地区	吴川县	民政部	1980年	1982年	[已撤销]	440821	湛江市,吴川县[已撤销]		
-442927	化州县	广东省	湛江地区	化州县	民政部	1980年	1982年	[已撤销]	440924	茂名市,化州县[已撤销]		
-442928	廉江县	广东省	湛江地区	廉江县	民政部	1980年	1982年	[已撤销]	440822	湛江市,廉江县[已撤销]		
-442929	遂溪县	广东省	湛江地区	遂溪县	民政部	1980年	1982年	[已撤销]	440823	湛江市,遂溪县		
-442930	海康县	广东省	湛江地区	海康县	民政部	1980年	1982年	[已撤销]	440824	湛江市,海康县[已撤销]		
-442931	徐闻县	广东省	湛江地区	徐闻县	民政部	1980年	1982年	[已撤销]	440825	湛江市,徐闻县		
-445100	潮州市	广东省	潮州市	-	民政部	1991年	2024年					
-445101	市辖区	广东省	潮州市	市辖区	国标							
-445102	湘桥区	广东省	潮州市	湘桥区	民政部	1991年	2024年					
-445103	潮安区	广东省	潮州市	潮安区	民政部	2013年	2024年					
-445121	潮安县	广东省	潮州市	潮安县	民政部	1991年	2012年	[已撤销]	445103	潮州市,潮安区		
-445122	饶平县	广东省	潮州市	饶平县	民政部	1991年	2024年					
-445200	揭阳市	广东省	揭阳市	-	民政部	1991年	2024年					
-445201	市辖区	广东省	揭阳市	市辖区	国标						1981-2017年	
-445202	榕城区	广东省	揭阳市	榕城区	民政部	1991年	2024年					
-445203	揭东区	广东省	揭阳市	揭东区	民政部	2012年	2024年					
-445221	揭东县	广东省	揭阳市	揭东县	民政部	1991年	2011年	[已撤销]	445203	揭阳市,揭东区		
-445222	揭西县	广东省	揭阳市	揭西县	民政部	1991年	2024年					
-445223	普宁县	广东省	揭阳市	普宁县	民政部	1991年	1992年	[已撤销]	449009	省直辖县级行政区划,普宁市[已撤销]		
-445224	惠来县	广东省	揭阳市	惠来县	民政部	1991年	2024年					
-445281	普宁市	广东省	揭阳市	普宁市	民政部	1995年	2024年					
-445300	云浮市	广东省	云浮市	-	民政部	1994年	2024年					
-445301	市辖区	广东省	云浮市	市辖区	国标							
-445302	云城区	广东省	云浮市	云城区	民政部	1994年	2024年					
-445303	云安区	广东省	云浮市	云安区	民政部	2014年	2024年					
-445321	新兴县	广东省	云浮市	新兴县	民政部	1994年	2024年					
-445322	郁南县	广东省	云浮市	郁南县	民政部	1994年	2024年					
-445323	云安县	广东省	云浮市	云安县	民政部	1996年	2013年	[已撤销]	445303	云浮市,云安区		
-445381	罗定市	广东省	云浮市	罗定市	民政部	1995年	2024年					
-446223		广东省			非官方						1962年	地址记录为南雄市珠玑镇石塘村
-449000	省直辖行政单位	广东省	省直辖行政单位	-	国标			[已撤销]			未发现	增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-449001	顺德市	广东省	省直辖县级行政区划	顺德市	民政部	1984年	1994年	[已撤销]	440681	佛山市,顺德市[已撤销]	未发现	潮州市[1990年]
-449002	台山市	广东省	省直辖县级行政区划	台山市	民政部	1984年	1994年	[已撤销]	440781	江门市,台山市	未发现	中山市[1987年]
-449003	番禺市	广东省	省直辖县级行政区划	番禺市	民政部	1992年	1994年	[已撤销]	440181	广州市,番禺市[已撤销]	未发现	海口市[1986年]（不计入初次记录年份）
-449004	南海市	广东省	省直辖县级行政区划	南海市	民政部	1992年	1994年	[已撤销]	440682	佛山市,南海市[已撤销]	未发现	
-449005	云浮市	广东省	省直辖县级行政区划	云浮市	民政部	1992年	1993年	[已撤销]	445300	云浮市（地市）	未发现	
-449006	新会市	广东省	省直辖县级行政区划	新会市	民政部	1992年	1994年	[已撤销]	440782	江门市,新会市[已撤销]	未发现	
-449007	开平市	广东省	省直辖县级行政区划	开平市	民政部	1993年	1994年	[已撤销]	440783	江门市,开平市	未发现	
-449008	三水市	广东省	省直辖县级行政区划	三水市	民政部	1993年	1994年	[已撤销]	440683	佛山市,三水市[已撤销]	未发现	
-449009	普宁市	广东省	省直辖县级行政区划	普宁市	民政部	1993年	1994年	[已撤销]	445281	揭阳市,普宁市	未发现	
-449010	罗定市	广东省	省直辖县级行政区划	罗定市	民政部	1993年	1994年	[已撤销]	445381	云浮市,罗定市	未发现	
-449011	潮阳市	广东省	省直辖县级行政区划	潮阳市	民政部	1993年	1994年	[已撤销]	440582	汕头市,潮阳市[已撤销]	未发现	
-449012	高州市	广东省	省直辖县级行政区划	高州市	民政部	1993年	1994年	[已撤销]	440981	茂名市,高州市	未发现	
-449013	花都市	广东省	省直辖县级行政区划	花都市	民政部	1993年	1994年	[已撤销]	440182	广州市,花都市[已撤销]	未发现	
-449014	高要市	广东省	省直辖县级行政区划	高要市	民政部	1993年	1994年	[已撤销]	441283	肇庆市,高要市[已撤销]	未发现	
-449015	鹤山市	广东省	省直辖县级行政区划	鹤山市	民政部	1993年	1994年	[已撤销]	440784	江门市,鹤山市	未发现	
-449016	四会市	广东省	省直辖县级行政区划	四会市	民政部	1993年	1994年	[已撤销]	441284	肇庆市,四会市	未发现	
-449017	增城市	广东省	省直辖县级行政区划	增城市	民政部	1993年	1994年	[已撤销]	440183	广州市,增城市[已撤销]	未发现	
-449018	廉江市	广东省	省直辖县级行政区划	廉江市	民政部	1993年	1994年	[已撤销]	440881	湛江市,廉江市	未发现	
-449019	英德市	广东省	省直辖县级行政区划	英德市	民政部	1994年	1994年	[已撤销]	441881	清远市,英德市	未发现	
-449020	恩平市	广东省	省直辖县级行政区划	恩平市	民政部	1994年	1994年	[已撤销]	440785	江门市,恩平市	未发现	
-449021	从化市	广东省	省直辖县级行政区划	从化市	民政部	1994年	1994年	[已撤销]	440184	广州市,从化市[已撤销]	未发现	
-449022	澄海市	广东省	省直辖县级行政区划	澄海市	民政部	1994年	1994年	[已撤销]	440583	汕头市,澄海市[已撤销]	未发现	
-449023	高明市	广东省	省直辖县级行政区划	高明市	民政部	1994年	1994年	[已撤销]	440684	佛山市,高明市[已撤销]	未发现	
-449024	连州市	广东省	省直辖县级行政区划	连州市	民政部	1994年	1994年	[已撤销]	441882	清远市,连州市	未发现	
-449025	雷州市	广东省	省直辖县级行政区划	雷州市	民政部	1994年	1994年	[已撤销]	440882	湛江市,雷州市	未发现	
-449026	乐昌市	广东省	省直辖县级行政区划	乐昌市	民政部	1994年	1994年	[已撤销]	440281	韶关市,乐昌市	未发现	
-449027	阳春市	广东省	省直辖县级行政区划	阳春市	民政部	1994年	1994年	[已撤销]	441781	阳江市,阳春市	未发现	
-449028	惠阳市	广东省	省直辖县级行政区划	惠阳市	民政部	1994年	1994年	[已撤销]	441381	惠州市,惠阳市[已撤销]	未发现	
-449029	吴川市	广东省	省直辖县级行政区划	吴川市	民政部	1994年	1994年	[已撤销]	440883	湛江市,吴川市	未发现	
-449030	兴宁市	广东省	省直辖县级行政区划	兴宁市	民政部	1994年	1994年	[已撤销]	441481	梅州市,兴宁市	未发现	
-449031	化州市	广东省	省直辖县级行政区划	化州市	民政部	1994年	1994年	[已撤销]	440982	茂名市,化州市	未发现	
-450000	广西壮族自治区	广西壮族自治区	-	-	民政部	1980年	2024年					
-450100	南宁市	广西壮族自治区	南宁市	-	民政部	1980年	2024年					
-450101	市辖区	广西壮族自治区	南宁市	市辖区	国标							增设（GB/T 2260-1984）
-450102	兴宁区	广西壮族自治区	南宁市	兴宁区	民政部	1980年	2024年					
-450103	青秀区	广西壮族自治区	南宁市	青秀区	民政部	1980年	2024年					新城区[2003年]
-450104	城北区	广西壮族自治区	南宁市	城北区	民政部	1980年	2003年	[已撤销]	450107	南宁市,西乡塘区		
-450105	江南区	广西壮族自治区	南宁市	江南区	民政部	1980年	2024年					
-450106	永新区	广西壮族自治区	南宁市	永新区	民政部	1980年	2003年	[已撤销]	450105,450109	南宁市,江南区,西乡塘区		
-450107	西乡塘区	广西壮族自治区	南宁市	西乡塘区	民政部	1984年	2024年					市郊区[2000年]
-450108	良庆区	广西壮族自治区	南宁市	良庆区	民政部	2004年	2024年					
-450109	邕宁区	广西壮族自治区	南宁市	邕宁区	民政部	2004年	2024年					
-450110	武鸣区	广西壮族自治区	南宁市	武鸣区	民政部	2015年	2024年					
-450111	南宁市	广西壮族自治区	南宁市	市郊区	非官方						1950-1998年	
-450121	邕宁县	广西壮族自治区	南宁市	邕宁县	民政部	1983年	2003年	[已撤销]	450109	南宁市,邕宁区		
-450122	武鸣县	广西壮族自治区	南宁市	武鸣县	民政部	1983年	2014年	[已撤销]	450110	南宁市,武鸣区		
-450123	隆安县	广西壮族自治区	南宁市	隆安县	民政部	2002年	2024年					
-450124	马山县	广西壮族自治区	南宁市	马山县	民政部	2002年	2024年					
-450125	上林县	广西壮族自治区	南宁市	上林县	民政部	2002年	2024年					
-450126	宾阳县	广西壮族自治区	南宁市	宾阳县	民政部	2002年	2024年					
-450127	横县	广西壮族自治区	南宁市	横县	民政部	2002年	2020年	[已撤销]	450181	南宁市,横州市		
-450181	横州市	广西壮族自治区	南宁市	横州市	民政部	2021年	2024年					
-450200	柳州市	广西壮族自治区	柳州市	-	民政部	1980年	2024年					
-450201	市辖区	广西壮族自治区	柳州市	市辖区	国标							增设（GB/T 2260-1984）
-450202	城中区	广西壮族自治区	柳州市	城中区	民政部	1980年	2024年					
-450203	鱼峰区	广西壮族自治区	柳州市	鱼峰区	民政部	1980年	2024年					
-450204	柳南区	广西壮族自治区	柳州市	柳南区	民政部	1980年	2024年					
-450205	柳北区	广西壮族自治区	柳州市	柳北区	民政部	1980年	2024年					
-450206	柳江区	广西壮族自治区	柳州市	柳江区	民政部	1984年	2024年					市郊区[2001年]
-450211	柳州市	广西壮族自治区	柳州市	市郊区	非官方						1935-1994年	其中有地址记录为鱼峰区、柳南区
-450221	柳江县	广西壮族自治区	柳州市	柳江县	民政部	1983年	2015年	[已撤销]	450206	柳州市,柳江区		
-450222	柳城县	广西壮族自治区	柳州市	柳城县	民政部	1983年	2024年					
-450223	鹿寨县	广西壮族自治区	柳州市	鹿寨县	民政部	2002年	2024年					
-450224	融安县	广西壮族自治区	柳州市	融安县	民政部	2002年	2024年					
-450225	融水苗族自治县	广西壮族自治区	柳州市	融水苗族自治县	民政部	2002年	2024年					
-450226	三江侗族自治县	广西壮族自治区	柳州市	三江侗族自治县	民政部	2002年	2024年					
-450300	桂林市	广西壮族自治区	桂林市	-	民政部	1980年	2024年					
-450301	市辖区	广西壮族自治区	桂林市	市辖区	国标							增设（GB/T 2260-1984）
-450302	秀峰区	广西壮族自治区	桂林市	秀峰区	民政部	1980年	2024年					
-450303	叠彩区	广西壮族自治区	桂林市	叠彩区	民政部	1980年	2024年					
-450304	象山区	广西壮族自治区	桂林市	象山区	民政部	1980年	2024年					
-450305	七星区	广西壮族自治区	桂林市	七星区	民政部	1980年	2024年					
-450306	市郊区	广西壮族自治区	桂林市	市郊区	民政部	1984年	1995年	[已撤销]	450311	桂林市,雁山区		
-450311	雁山区	广西壮族自治区	桂林市	雁山区	民政部	1996年	2024年					
-450312	临桂区	广西壮族自治区	桂林市	临桂区	民政部	2013年	2024年					
-450320	桂林市区	广西壮族自治区	桂林市	桂林市区	国标							增设（GB/T 2260-1982）
-450321	阳朔县	广西壮族自治区	桂林市	阳朔县	民政部	1981年	2024年					
-450322	临桂县	广西壮族自治区	桂林市	临桂县	民政部	1983年	2012年	[已撤销]	450312	桂林市,临桂区		
-450323	灵川县	广西壮族自治区	桂林市	灵川县	民政部	1998年	2024年					
-450324	全州县	广西壮族自治区	桂林市	全州县	民政部	1998年	2024年					
-450325	兴安县	广西壮族自治区	桂林市	兴安县	民政部	1998年	2024年					
-450326	永福县	广西壮族自治区	桂林市	永福县	民政部	1998年	2024年					
-450327	灌阳县	广西壮族自治区	桂林市	灌阳县	民政部	1998年	2024年					
-450328	龙胜各族自治县	广西壮族自治区	桂林市	龙胜各族自治县	民政部	1998年	2024年					
-450329	资源县	广西壮族自治区	桂林市	资源县	民政部	1998年	2024年					
-450330	平乐县	广西壮族自治区	桂林市	平乐县	民政部	1998年	2024年					
-450331	荔浦县	广西壮族自治区	桂林市	荔浦县	民政部	1998年	2017年	[已撤销]	450381	桂林市,荔浦市		
-450332	恭城瑶族自治县	广西壮族自治区	桂林市	恭城瑶族自治县	民政部	1998年	2024年					
-450381	荔浦市	广西壮族自治区	桂林市	荔浦市	民政部	2018年	2024年					
-450400	梧州市	广西壮族自治区	梧州市	-	民政部	1980年	2024年					
-450401	市辖区	广西壮族自治区	梧州市	市辖区	国标							增设（GB/T 2260-1984）
-450402	白云区	广西壮族自治区	梧州市	白云区	民政部	1980年	1983年	[已撤销]	450403	梧州市,万秀区		
-450403	万秀区	广西壮族自治区	梧州市	万秀区	民政部	1980年	2024年					
-450404	蝶山区	广西壮族自治区	梧州市	蝶山区	民政部	1980年	2012年	[已撤销]	450403	梧州市,万秀区		
-450405	长洲区	广西壮族自治区	梧州市	长洲区	民政部	1980年	2024年					鸳江区[1983年]；市郊区[2002年]
-450406	龙圩区	广西壮族自治区	梧州市	龙圩区	民政部	2013年	2024年					
-450411	梧州市	广西壮族自治区	梧州市	市郊区	非官方						1968-2002年	
-450421	苍梧县	广西壮族自治区	梧州市	苍梧县	民政部	1983年	2024年					
-450422	藤县	广西壮族自治区	梧州市	藤县	民政部	1997年	2024年					
-450423	蒙山县	广西壮族自治区	梧州市	蒙山县	民政部	1997年	2024年					
-450481	岑溪市	广西壮族自治区	梧州市	岑溪市	民政部	1997年	2024年					
-450500	北海市	广西壮族自治区	北海市	-	民政部	1983年	2024年					
-450501	市辖区	广西壮族自治区	北海市	市辖区	国标						1948-1974年	
-450502	海城区	广西壮族自治区	北海市	海城区	民政部	1984年	2024年					
-450503	银海区	广西壮族自治区	北海市	银海区	民政部	1984年	2024年					市郊区[1993年]
-450504	北海市	广西壮族自治区	北海市	铁山港区	非官方							
-450511	北海市	广西壮族自治区	北海市	市郊区	非官方						1974-1976年	
-450512	铁山港区	广西壮族自治区	北海市	铁山港区	民政部	1994年	2024年					
-450521	合浦县	广西壮族自治区	北海市	合浦县	民政部	1987年	2024年					
-450525		广西壮族自治区	北海市		非官方						1954-1971年	其中有地址记录为合浦县星岛（湖？）
-450600	防城港市	广西壮族自治区	防城港市	-	民政部	1993年	2024年					
-450601	市辖区	广西壮族自治区	防城港市	市辖区	国标							
-450602	港口区	广西壮族自治区	防城港市	港口区	民政部	1993年	2024年					
-450603	防城区	广西壮族自治区	防城港市	防城区	民政部	1993年	2024年					
-450621	上思县	广西壮族自治区	防城港市	上思县	民政部	1993年	2024年					
-450622	防城港市	广西壮族自治区	防城港市	浦北县	非官方							
-450681	东兴市	广西壮族自治区	防城港市	东兴市	民政部	1996年	2024年					
-450700	钦州市	广西壮族自治区	钦州市	-	民政部	1994年	2024年					
-450701	市辖区	广西壮族自治区	钦州市	市辖区	国标							
-450702	钦南区	广西壮族自治区	钦州市	钦南区	民政部	1994年	2024年					
-450703	钦北区	广西壮族自治区	钦州市	钦北区	民政部	1994年	2024年					
-450721	灵山县	广西壮族自治区	钦州市	灵山县	民政部	1994年	2024年					
-450722	浦北县	广西壮族自治区	钦州市	浦北县	民政部	1994年	2024年					
-450800	贵港市	广西壮族自治区	贵港市	-	民政部	1995年	2024年					
-450801	市辖区	广西壮族自治区	贵港市	市辖区	国标							
-450802	港北区	广西壮族自治区	贵港市	港北区	民政部	1995年	2024年					
-450803	港南区	广西壮族自治区	贵港市	港南区	民政部	1995年	2024年					
-450804	覃塘区	广西壮族自治区	贵港市	覃塘区	民政部	2003年	2024年					
-450821	平南县	广西壮族自治区	贵港市	平南县	民政部	1995年	2024年					
-450881	桂平市	广西壮族自治区	贵港市	桂平市	民政部	1995年	2024年					
-450900	玉林市	广西壮族自治区	玉林市	-	民政部	1997年	2024年					旧称：玉林市(鬱林市/郁林市)；
-450901	市辖区	广西壮族自治区	玉林市	市辖区	国标							
-450902	玉州区	广西壮族自治区	玉林市	玉州区	民政部	1997年	2024年					
-450903	福绵区	广西壮族自治区	玉林市	福绵区	民政部	2013年	2024年					
-450921	容县	广西壮族自治区	玉林市	容县	民政部	1997年	2024年					
-450922	陆川县	广西壮族自治区	玉林市	陆川县	民政部	1997年	2024年					
-450923	博白县	广西壮族自治区	玉林市	博白县	民政部	1997年	2024年					
-450924	兴业县	广西壮族自治区	玉林市	兴业县	民政部	1997年	2024年					
-450981	北流市	广西壮族自治区	玉林市	北流市	民政部	1997年	2024年					
-451000	百色市	广西壮族自治区	百色市	-	民政部	2002年	2024年					
-451001	市辖区	广西壮族自治区	百色市	市辖区	国标							
-451002	右江区	广西壮族自治区	百色市	右江区	民政部	2002年	2024年					
-451003	田阳区	广西壮族自治区	百色市	田阳区	民政部	2019年	2024年					
-451021	田阳县	广西壮族自治区	百色市	田阳县	民政部	2002年	2018年	[已撤销]	451003	百色市,田阳区		
-451022	田东县	广西壮族自治区	百色市	田东县	民政部	2002年	2024年					
-451023	平果县	广西壮族自治区	百色市	平果县	民政部	2002年	2018年	[已撤销]	451082	百色市,平果市		
-451024	德保县	广西壮族自治区	百色市	德保县	民政部	2002年	2024年					
-451025	靖西县	广西壮族自治区	百色市	靖西县	民政部	2002年	2014年	[已撤销]	451081	百色市,靖西市		
-451026	那坡县	广西壮族自治区	百色市	那坡县	民政部	2002年	2024年					
-451027	凌云县	广西壮族自治区	百色市	凌云县	民政部	2002年	2024年					
-451028	乐业县	广西壮族自治区	百色市	乐业县	民政部	2002年	2024年					
-451029	田林县	广西壮族自治区	百色市	田林县	民政部	2002年	2024年					
-451030	西林县	广西壮族自治区	百色市	西林县	民政部	2002年	2024年					
-451031	隆林各族自治县	广西壮族自治区	百色市	隆林各族自治县	民政部	2002年	2024年					
-451081	靖西市	广西壮族自治区	百色市	靖西市	民政部	2015年	2024年					
-451082	平果市	广西壮族自治区	百色市	平果市	民政部	2019年	2024年					
-451100	贺州市	广西壮族自治区	贺州市	-	民政部	2002年	2024年					
-451101	市辖区	广西壮族自治区	贺州市	市辖区	国标							
-451102	八步区	广西壮族自治区	贺州市	八步区	民政部	2002年	2024年					
-451103	平桂区	广西壮族自治区	贺州市	平桂区	民政部	2016年	2024年					
-451119	贺州市	广西壮族自治区	贺州市	平桂管理区	非官方							
-451121	昭平县	广西壮族自治区	贺州市	昭平县	民政部	2002年	2024年					
-451122	钟山县	广西壮族自治区	贺州市	钟山县	民政部	2002年	2024年					旧称：钟山县(锺山县)；
-451123	富川瑶族自治县	广西壮族自治区	贺州市	富川瑶族自治县	民政部	2002年	2024年					
-451200	河池市	广西壮族自治区	河池市	-	民政部	2002年	2024年					
-451201	市辖区	广西壮族自治区	河池市	市辖区	国标							
-451202	金城江区	广西壮族自治区	河池市	金城江区	民政部	2002年	2024年					
-451203	宜州区	广西壮族自治区	河池市	宜州区	民政部	2016年	2024年					
-451221	南丹县	广西壮族自治区	河池市	南丹县	民政部	2002年	2024年					
-451222	天峨县	广西壮族自治区	河池市	天峨县	民政部	2002年	2024年					
-451223	凤山县	广西壮族自治区	河池市	凤山县	民政部	2002年	2024年					
-451224	东兰县	广西壮族自治区	河池市	东兰县	民政部	2002年	2024年					
-451225	罗城仫佬族自治县	广西壮族自治区	河池市	罗城仫佬族自治县	民政部	2002年	2024年					
-451226	环江毛南族自治县	广西壮族自治区	河池市	环江毛南族自治县	民政部	2002年	2024年					
-451227	巴马瑶族自治县	广西壮族自治区	河池市	巴马瑶族自治县	民政部	2002年	2024年					
-451228	都安瑶族自治县	广西壮族自治区	河池市	都安瑶族自治县	民政部	2002年	2024年					
-451229	大化瑶族自治县	广西壮族自治区	河池市	大化瑶族自治县	民政部	2002年	2024年					
-451281	宜州市	广西壮族自治区	河池市	宜州市	民政部	2002年	2015年	[已撤销]	451203	河池市,宜州区		
-451300	来宾市	广西壮族自治区	来宾市	-	民政部	2002年	2024年					
-451301	市辖区	广西壮族自治区	来宾市	市辖区	国标							
-451302	兴宾区	广西壮族自治区	来宾市	兴宾区	民政部	2002年	2024年					
-451321	忻城县	广西壮族自治区	来宾市	忻城县	民政部	2002年	2024年					
-451322	象州县	广西壮族自治区	来宾市	象州县	民政部	2002年	2024年					
-451323	武宣县	广西壮族自治区	来宾市	武宣县	民政部	2002年	2024年					
-451324	金秀瑶族自治县	广西壮族自治区	来宾市	金秀瑶族自治县	民政部	2002年	2024年					
-451381	合山市	广西壮族自治区	来宾市	合山市	民政部	2002年	2024年					
-451400	崇左市	广西壮族自治区	崇左市	-	民政部	2002年	2024年					
-451401	市辖区	广西壮族自治区	崇左市	市辖区	国标							
-451402	江州区	广西壮族自治区	崇左市	江州区	民政部	2002年	2024年					
-451421	扶绥县	广西壮族自治区	崇左市	扶绥县	民政部	2002年	2024年					
-451422	宁明县	广西壮族自治区	崇左市	宁明县	民政部	2002年	2024年					
-451423	龙州县	广西壮族自治区	崇左市	龙州县	民政部	2002年	2024年					
-451424	大新县	广西壮族自治区	崇左市	大新县	民政部	2002年	2024年					
-451425	天等县	广西壮族自治区	崇左市	天等县	民政部	2002年	2024年					
-451481	凭祥市	广西壮族自治区	崇左市	凭祥市	民政部	2002年	2024年					
-452100	南宁地区	广西壮族自治区	南宁地区	-	民政部	1980年	2001年	[已撤销]	451400	崇左市（地市）		
-452101	凭祥市	广西壮族自治区	南宁地区	凭祥市	民政部	1980年	2001年	[已撤销]	451481	崇左市,凭祥市		
-452121	邕宁县	广西壮族自治区	南宁地区	邕宁县	民政部	1980年	1982年	[已撤销]	450121	南宁市,邕宁县[已撤销]		
-452122	横县	广西壮族自治区	南宁地区	横县	民政部	1980年	2001年	[已撤销]	450127	南宁市,横县[已撤销]		
-452123	宾阳县	广西壮族自治区	南宁地区	宾阳县	民政部	1980年	2001年	[已撤销]	450126	南宁市,宾阳县		
-452124	上林县	广西壮族自治区	南宁地区	上林县	民政部	1980年	2001年	[已撤销]	450125	南宁市,上林县		
-452125	武鸣县	广西壮族自治区	南宁地区	武鸣县	民政部	1980年	1982年	[已撤销]	450122	南宁市,武鸣县[已撤销]		
-452126	隆安县	广西壮族自治区	南宁地区	隆安县	民政部	1980年	2001年	[已撤销]	450123	南宁市,隆安县		
-452127	马山县	广西壮族自治区	南宁地区	马山县	民政部	1980年	2001年	[已撤销]	450124	南宁市,马山县		
-452128	扶绥县	广西壮族自治区	南宁地区	扶绥县	民政部	1980年	2001年	[已撤销]	451421	崇左市,扶绥县		
-452129	崇左县	广西壮族自治区	南宁地区	崇左县	民政部	1980年	2001年	[已撤销]	451402	崇左市,江州区		
-452130	大新县	广西壮族自治区	南宁地区	大新县	民政部	1980年	2001年	[已撤销]	451424	崇左市,大新县		
-452131	天等县	广西壮族自治区	南宁地区	天等县	民政部	1980年	2001年	[已撤销]	451425	崇左市,天等县		
-452132	宁明县	广西壮族自治区	南宁地区	宁明县	民政部	1980年	2001年	[已撤销]	451422	崇左市,宁明县		
-452133	龙州县	广西壮族自治区	南宁地区	龙州县	民政部	1980年	2001年	[已撤销]	451423	崇左市,龙州县		
-452200	柳州地区	广西壮族自治区	柳州地区	-	民政部	1980年	2001年	[已撤销]	450200	柳州市（地市）		
-452201	合山市	广西壮族自治区	柳州地区	合山市	民政部	1981年	2001年	[已撤销]	451381	来宾市,合山市		
-452221	柳江县	广西壮族自治区	柳州地区	柳江县	民政部	1980年	1982年	[已撤销]	450221	柳州市,柳江县[已撤销]		
-452222	柳城县	广西壮族自治区	柳州地区	柳城县	民政部	1980年	1982年	[已撤销]	450222	柳州市,柳城县		
-452223	鹿寨县	广西壮族自治区	柳州地区	鹿寨县	民政部	1980年	2001年	[已撤销]	450223	柳州市,鹿寨县		
-452224	象州县	广西壮族自治区	柳州地区	象州县	民政部	1980年	2001年	[已撤销]	451322	来宾市,象州县		
-452225	武宣县	广西壮族自治区	柳州地区	武宣县	民政部	1980年	2001年	[已撤销]	451323	来宾市,武宣县		
-452226	来宾县	广西壮族自治区	柳州地区	来宾县	民政部	1980年	2001年	[已撤销]	451302	来宾市,兴宾区		
-452227	融安县	广西壮族自治区	柳州地区	融安县	民政部	1980年	2001年	[已撤销]	450224	柳州市,融安县		
-452228	三江侗族自治县	广西壮族自治区	柳州地区	三江侗族自治县	民政部	1980年	2001年	[已撤销]	450226	柳州市,三江侗族自治县		
-452229	融水苗族自治县	广西壮族自治区	柳州地区	融水苗族自治县	民政部	1980年	2001年	[已撤销]	450225	柳州市,融水苗族自治县		
-452230	金秀瑶族自治县	广西壮族自治区	柳州地区	金秀瑶族自治县	民政部	1980年	2001年	[已撤销]	451324	来宾市,金秀瑶族自治县		
-452231	忻城县	广西壮族自治区	柳州地区	忻城县	民政部	1980年	2001年	[已撤销]	451321	来宾市,忻城县		
-452300	桂林地区	广西壮族自治区	桂林地区	-	民政部	1980年	1997年	[已撤销]	450300	桂林市（地市）		
-452321	临桂县	广西壮族自治区	桂林地区	临桂县	民政部	1980年	1982年	[已撤销]	450322	桂林市,临桂县[已撤销]		
-452322	灵川县	广西壮族自治区	桂林地区	灵川县	民政部	1980年	1997年	[已撤销]	450323	桂林市,灵川县		
-452323	全州县	广西壮族自治区	桂林地区	全州县	民政部	1980年	1997年	[已撤销]	450324	桂林市,全州县		
-452324	兴安县	广西壮族自治区	桂林地区	兴安县	民政部	1980年	1997年	[已撤销]	450325	桂林市,兴安县		
-452325	永福县	广西壮族自治区	桂林地区	永福县	民政部	1980年	1997年	[已撤销]	450326	桂林市,永福县		
-452326	阳朔县	广西壮族自治区	桂林地区	阳朔县	民政部	1980年	1980年	[已撤销]	450321	桂林市,阳朔县		
-452327	灌阳县	广西壮族自治区	桂林地区	灌阳县	民政部	1980年	1997年	[已撤销]	450327	桂林市,灌阳县		
-452328	龙胜各族自治县	广西壮族自治区	桂林地区	龙胜各族自治县	民政部	1980年	1997年	[已撤销]	450328	桂林市,龙胜各族自治县		
-452329	资源县	广西壮族自治区	桂林地区	资源县	民政部	1980年	1997年	[已撤销]	450329	桂林市,资源县		
-452330	平乐县	广西壮族自治区	桂林地区	平乐县	民政部	1980年	1997年	[已撤销]	450330	桂林市,平乐县		
-452331	荔浦县	广西壮族自治区	桂林地区	荔浦县	民政部	1980年	1997年	[已撤销]	450331	桂林市,荔浦县[已撤销]		
-452332	恭城瑶族自治县	广西壮族自治区	桂林地区	恭城瑶族自治县	民政部	1980年	1997年	[已撤销]	450332	桂林市,恭城瑶族自治县		恭城县[1989年]
-452400	贺州地区	广西壮族自治区	贺州地区	-	民政部	1980年	2001年	[已撤销]	451100	贺州市（地市）		梧州地区[1996年]
-452401	岑溪市	广西壮族自治区	贺州地区	岑溪市	民政部	1995年	1996年	[已撤销]	450481	梧州市,岑溪市		
-452402	贺州市	广西壮族自治区	贺州地区	贺州市	民政部	1997年	2001年	[已撤销]	451100	贺州市（地市）		
-452421	岑溪县	广西壮族自治区	贺州地区	岑溪县	民政部	1980年	1994年	[已撤销]	452401	贺州地区,岑溪市[已撤销]		
-452422	苍梧县	广西壮族自治区	贺州地区	苍梧县	民政部	1980年	1982年	[已撤销]	450421	梧州市,苍梧县		
-452423	藤县	广西壮族自治区	贺州地区	藤县	民政部	1980年	1996年	[已撤销]	450422	梧州市,藤县		
-452424	昭平县	广西壮族自治区	贺州地区	昭平县	民政部	1980年	2001年	[已撤销]	451121	贺州市,昭平县		
-452425	蒙山县	广西壮族自治区	贺州地区	蒙山县	民政部	1980年	1996年	[已撤销]	450423	梧州市,蒙山县		
-452426	贺县	广西壮族自治区	贺州地区	贺县	民政部	1980年	1996年	[已撤销]	452402	贺州地区,贺州市[已撤销]		
-452427	钟山县	广西壮族自治区	贺州地区	钟山县	民政部	1980年	2001年	[已撤销]	451122	贺州市,钟山县		旧称：钟山县(锺山县)；
-452428	富川瑶族自治县	广西壮族自治区	贺州地区	富川瑶族自治县	民政部	1980年	2001年	[已撤销]	451123	贺州市,富川瑶族自治县		富川县[1982年]
-452500	玉林地区	广西壮族自治区	玉林地区	-	民政部	1980年	1996年	[已撤销]	450900	玉林市（地市）		旧称：玉林地区(鬱林地区/郁林地区)；
-452501	玉林市	广西壮族自治区	玉林地区	玉林市	民政部	1983年	1996年	[已撤销]	450900	玉林市（地市）		旧称：玉林市(鬱林市/郁林市)；
-452502	贵港市	广西壮族自治区	玉林地区	贵港市	民政部	1988年	1994年	[已撤销]	450800	贵港市（地市）		
-452503	桂平市	广西壮族自治区	玉林地区	桂平市	民政部	1994年	1994年	[已撤销]	450881	贵港市,桂平市		
-452504	北流市	广西壮族自治区	玉林地区	北流市	民政部	1994年	1996年	[已撤销]	450981	玉林市,北流市		
-452521	玉林县	广西壮族自治区	玉林地区	玉林县	民政部	1980年	1982年	[已撤销]	452501	玉林地区,玉林市[已撤销]		旧称：玉林县(鬱林县/郁林县)；
-452522	贵县	广西壮族自治区	玉林地区	贵县	民政部	1980年	1987年	[已撤销]	452502	玉林地区,贵港市[已撤销]		
-452523	桂平县	广西壮族自治区	玉林地区	桂平县	民政部	1980年	1993年	[已撤销]	452503	玉林地区,桂平市[已撤销]		
-452524	平南县	广西壮族自治区	玉林地区	平南县	民政部	1980年	1994年	[已撤销]	450821	贵港市,平南县		
-452525	容县	广西壮族自治区	玉林地区	容县	民政部	1980年	1996年	[已撤销]	450921	玉林市,容县		
-452526	北流县	广西壮族自治区	玉林地区	北流县	民政部	1980年	1993年	[已撤销]	452504	玉林地区,北流市[已撤销]		
-452527	陆川县	广西壮族自治区	玉林地区	陆川县	民政部	1980年	1996年	[已撤销]	450922	玉林市,陆川县		
-452528	博白县	广西壮族自治区	玉林地区	博白县	民政部	1980年	1996年	[已撤销]	450923	玉林市,博白县		
-452600	百色地区	广西壮族自治区	百色地区	-	民政部	1980年	2001年	[已撤销]	451000	百色市（地市）		
-452601	百色市	广西壮族自治区	百色地区	百色市	民政部	1983年	2001年	[已撤销]	451000	百色市（地市）		
-452621	百色县	广西壮族自治区	百色地区	百色县	民政部	1980年	1982年	[已撤销]	452601	百色地区,百色市[已撤销]		
-452622	田阳县	广西壮族自治区	百色地区	田阳县	民政部	1980年	2001年	[已撤销]	451021	百色市,田阳县[已撤销]		
-452623	田东县	广西壮族自治区	百色地区	田东县	民政部	1980年	2001年	[已撤销]	451022	百色市,田东县		
-452624	平果县	广西壮族自治区	百色地区	平果县	民政部	1980年	2001年	[已撤销]	451023	百色市,平果县[已撤销]		
-452625	德保县	广西壮族自治区	百色地区	德保县	民政部	1980年	2001年	[已撤销]	451024	百色市,德保县		
-452626	靖西县	广西壮族自治区	百色地区	靖西县	民政部	1980年	2001年	[已撤销]	451025	百色市,靖西县[已撤销]		
-452627	那坡县	广西壮族自治区	百色地区	那坡县	民政部	1980年	2001年	[已撤销]	451026	百色市,那坡县		
-452628	凌云县	广西壮族自治区	百色地区	凌云县	民政部	1980年	2001年	[已撤销]	451027	百色市,凌云县		
-452629	乐业县	广西壮族自治区	百色地区	乐业县	民政部	1980年	2001年	[已撤销]	451028	百色市,乐业县		
-452630	田林县	广西壮族自治区	百色地区	田林县	民政部	1980年	2001年	[已撤销]	451029	百色市,田林县		
-452631	隆林各族自治县	广西壮族自治区	百色地区	隆林各族自治县	民政部	1980年	2001年	[已撤销]	451031	百色市,隆林各族自治县		
-452632	西林县	广西壮族自治区	百色地区	西林县	民政部	1980年	2001年	[已撤销]	451030	百色市,西林县		
-452700	河池地区	广西壮族自治区	河池地区	-	民政部	1980年	2001年	[已撤销]	451200	河池市（地市）		
-452701	河池市	广西壮族自治区	河池地区	河池市	民政部	1983年	2001年	[已撤销]	451200	河池市（地市）		
-452702	宜州市	广西壮族自治区	河池地区	宜州市	民政部	1993年	2001年	[已撤销]	451281	河池市,宜州市[已撤销]		
-452721	河池县	广西壮族自治区	河池地区	河池县	民政部	1980年	1982年	[已撤销]	452701	河池地区,河池市[已撤销]		
-452722	宜山县	广西壮族自治区	河池地区	宜山县	民政部	1980年	1992年	[已撤销]	452702	河池地区,宜州市[已撤销]		
-452723	罗城仫佬族自治县	广西壮族自治区	河池地区	罗城仫佬族自治县	民政部	1980年	2001年	[已撤销]	451225	河池市,罗城仫佬族自治县		罗城县[1982年]
-452724	环江毛南族自治县	广西壮族自治区	河池地区	环江毛南族自治县	民政部	1980年	2001年	[已撤销]	451226	河池市,环江毛南族自治县		环江县[1985年]
-452725	南丹县	广西壮族自治区	河池地区	南丹县	民政部	1980年	2001年	[已撤销]	451221	河池市,南丹县		
-452726	天峨县	广西壮族自治区	河池地区	天峨县	民政部	1980年	2001年	[已撤销]	451222	河池市,天峨县		
-452727	凤山县	广西壮族自治区	河池地区	凤山县	民政部	1980年	2001年	[已撤销]	451223	河池市,凤山县		
-452728	东兰县	广西壮族自治区	河池地区	东兰县	民政部	1980年	2001年	[已撤销]	451224	河池市,东兰县		
-452729	巴马瑶族自治县	广西壮族自治区	河池地区	巴马瑶族自治县	民政部	1980年	2001年	[已撤销]	451227	河池市,巴马瑶族自治县		
-452730	都安瑶族自治县	广西壮族自治区	河池地区	都安瑶族自治县	民政部	1980年	2001年	[已撤销]	451228	河池市,都安瑶族自治县		
-452731	大化瑶族自治县	广西壮族自治区	河池地区	大化瑶族自治县	民政部	1987年	2001年	[已撤销]	451229	河池市,大化瑶族自治县		
-452800	钦州地区	广西壮族自治区	钦州地区	-	民政部	1980年	1993年	[已撤销]	450700	钦州市（地市）		
-452801	北海市	广西壮族自治区	钦州地区	北海市	民政部	1980年	1982年	[已撤销]	450500	北海市（地市）		
-452802	钦州市	广西壮族自治区	钦州地区	钦州市	民政部	1983年	1993年	[已撤销]	450700	钦州市（地市）		
-452821	上思县	广西壮族自治区	钦州地区	上思县	民政部	1980年	1992年	[已撤销]	450621	防城港市,上思县		
-452822	防城各族自治县	广西壮族自治区	钦州地区	防城各族自治县	民政部	1980年	1992年	[已撤销]	450603	防城港市,防城区		
-452823	钦州县	广西壮族自治区	钦州地区	钦州县	民政部	1980年	1982年	[已撤销]	452802	钦州地区,钦州市[已撤销]		
-452824	灵山县	广西壮族自治区	钦州地区	灵山县	民政部	1980年	1993年	[已撤销]	450721	钦州市,灵山县		
-452825	合浦县	广西壮族自治区	钦州地区	合浦县	民政部	1980年	1986年	[已撤销]	450521	北海市,合浦县		
-452826	浦北县	广西壮族自治区	钦州地区	浦北县	民政部	1980年	1993年	[已撤销]	450722	钦州市,浦北县		
-460000	海南省	海南省	-	-	民政部	1988年	2024年					
-460001	五指山市	海南省	直辖	五指山市	民政部	1988年	2002年	[已撤销]	469001	省直辖县级行政区划,五指山市		通什市[2000年]
-460002	琼海市	海南省	直辖	琼海市	民政部	1992年	2002年	[已撤销]	469002	省直辖县级行政区划,琼海市		
-460003	儋州市	海南省	直辖	儋州市	民政部	1993年	2002年	[已撤销]	469003	省直辖县级行政区划,儋州市[已撤销]		
-460004	琼山市	海南省	直辖	琼山市	民政部	1994年	2001年	[已撤销]	460107	海口市,琼山区		
-460005	文昌市	海南省	直辖	文昌市	民政部	1995年	2002年	[已撤销]	469005	省直辖县级行政区划,文昌市		
-460006	万宁市	海南省	直辖	万宁市	民政部	1996年	2002年	[已撤销]	469006	省直辖县级行政区划,万宁市		
-460007	东方市	海南省	直辖	东方市	民政部	1997年	2002年	[已撤销]	469007	省直辖县级行政区划,东方市		
-460021	琼山县	海南省	直辖	琼山县	民政部	1988年	1993年	[已撤销]	460004	直辖,琼山市[已撤销]		
-460022	文昌县	海南省	直辖	文昌县	民政部	1988年	1994年	[已撤销]	460005	直辖,文昌市[已撤销]		
-460023	琼海县	海南省	直辖	琼海县	民政部	1988年	1991年	[已撤销]	460002	直辖,琼海市[已撤销]		
-460024	万宁县	海南省	直辖	万宁县	民政部	1988年	1995年	[已撤销]	460006	直辖,万宁市[已撤销]		
-460025	定安县	海南省	直辖	定安县	民政部	1988年	2002年	[已撤销]	469021	省直辖县级行政区划,定安县		
-460026	屯昌县	海南省	直辖	屯昌县	民政部	1988年	2002年	[已撤销]	469022	省直辖县级行政区划,屯昌县		
-460027	澄迈县	海南省	直辖	澄迈县	民政部	1988年	2002年	[已撤销]	469023	省直辖县级行政区划,澄迈县		
-460028	临高县	海南省	直辖	临高县	民政部	1988年	2002年	[已撤销]	469024	省直辖县级行政区划,临高县		
-460029	儋县	海南省	直辖	儋县	民政部	1988年	1992年	[已撤销]	460003	直辖,儋州市[已撤销]		
-460030	白沙黎族自治县	海南省	直辖	白沙黎族自治县	民政部	1988年	2002年	[已撤销]	469025	省直辖县级行政区划,白沙黎族自治县		
-460031	昌江黎族自治县	海南省	直辖	昌江黎族自治县	民政部	1988年	2002年	[已撤销]	469026	省直辖县级行政区划,昌江黎族自治县		
-460032	东方黎族自治县	海南省	直辖	东方黎族自治县	民政部	1988年	1996年	[已撤销]	460007	直辖,东方市[已撤销]		
-460033	乐东黎族自治县	海南省	直辖	乐东黎族自治县	民政部	1988年	2002年	[已撤销]	469027	省直辖县级行政区划,乐东黎族自治县		
-460034	陵水黎族自治县	海南省	直辖	陵水黎族自治县	民政部	1988年	2002年	[已撤销]	469028	省直辖县级行政区划,陵水黎族自治县		
-460035	保亭黎族苗族自治县	海南省	直辖	保亭黎族苗族自治县	民政部	1988年	2002年	[已撤销]	469029	省直辖县级行政区划,保亭黎族苗族自治县		
-460036	琼中黎族苗族自治县	海南省	直辖	琼中黎族苗族自治县	民政部	1988年	2002年	[已撤销]	469030	省直辖县级行政区划,琼中黎族苗族自治县		
-460037	西沙群岛	海南省	省直辖行政单位	西沙群岛	国标							分设（GB/T 2260-1988）
-460038	南沙群岛	海南省	省直辖行政单位	南沙群岛	国标							分设（GB/T 2260-1988）
-460039	中沙群岛的岛礁及其海域	海南省	省直辖行政单位	中沙群岛的岛礁及其海域	国标							分设（GB/T 2260-1988）
-460100	海口市	海南省	海口市	-	民政部	1988年	2024年					
-460101	市辖区	海南省	海口市	市辖区	国标							
-460102	振东区	海南省	海口市	振东区	民政部	1990年	2001年	[已撤销]	460108	海口市,美兰区		
-460103	新华区	海南省	海口市	新华区	民政部	1990年	2001年	[已撤销]	460106	海口市,龙华区		
-460104	秀英区	海南省	海口市	秀英区	民政部	1990年	2001年	[已撤销]	460105	海口市,秀英区		
-460105	秀英区	海南省	海口市	秀英区	民政部	2002年	2024年					
-460106	龙华区	海南省	海口市	龙华区	民政部	2002年	2024年					
-460107	琼山区	海南省	海口市	琼山区	民政部	2002年	2024年					
-460108	美兰区	海南省	海口市	美兰区	民政部	2002年	2024年					
-460200	三亚市	海南省	三亚市	-	民政部	1988年	2024年					
-460201	市辖区	海南省	三亚市	市辖区	国标							
-460202	海棠区	海南省	三亚市	海棠区	民政部	2014年	2024年					
-460203	吉阳区	海南省	三亚市	吉阳区	民政部	2014年	2024年					
-460204	天涯区	海南省	三亚市	天涯区	民政部	2014年	2024年					
-460205	崖州区	海南省	三亚市	崖州区	民政部	2014年	2024年					
-460300	三沙市	海南省	三沙市	-	民政部	2012年	2024年					
-460300-无编码1	西沙区	海南省	三沙市	西沙区	民政部	2020年	2024年					
-460300-无编码2	南沙区	海南省	三沙市	南沙区	民政部	2020年	2024年					
-460301	市辖区	海南省	三沙市	市辖区	国标							
-460302	三沙市	海南省	三沙市	西沙区	非官方							
-460303	三沙市	海南省	三沙市	南沙区	非官方							
-460400	儋州市	海南省	儋州市	-	民政部	2015年	2024年					
-469000	省直辖县	海南省	省直辖县级行政区划	-	非官方							医保区划在用
-469001	五指山市	海南省	省直辖县级行政区划	五指山市	民政部	2003年	2024年					
-469002	琼海市	海南省	省直辖县级行政区划	琼海市	民政部	2003年	2024年					
-469003	儋州市	海南省	省直辖县级行政区划	儋州市	民政部	2003年	2014年	[已撤销]	460400	儋州市（地市）		
-469004	省直辖县级行政区划	海南省	省直辖县级行政区划	琼山市	非官方							
-469005	文昌市	海南省	省直辖县级行政区划	文昌市	民政部	2003年	2024年					
-469006	万宁市	海南省	省直辖县级行政区划	万宁市	民政部	2003年	2024年					
-469007	东方市	海南省	省直辖县级行政区划	东方市	民政部	2003年	2024年					
-469021	定安县	海南省	省直辖县级行政区划	定安县	民政部	2003年	2024年					
-469022	屯昌县	海南省	省直辖县级行政区划	屯昌县	民政部	2003年	2024年					
-469023	澄迈县	海南省	省直辖县级行政区划	澄迈县	民政部	2003年	2024年					
-469024	临高县	海南省	省直辖县级行政区划	临高县	民政部	2003年	2024年					
-469025	白沙黎族自治县	海南省	省直辖县级行政区划	白沙黎族自治县	民政部	2003年	2024年					
-469026	昌江黎族自治县	海南省	省直辖县级行政区划	昌江黎族自治县	民政部	2003年	2024年					
-469027	乐东黎族自治县	海南省	省直辖县级行政区划	乐东黎族自治县	民政部	2003年	2024年					
-469028	陵水黎族自治县	海南省	省直辖县级行政区划	陵水黎族自治县	民政部	2003年	2024年					
-469029	保亭黎族苗族自治县	海南省	省直辖县级行政区划	保亭黎族苗族自治县	民政部	2003年	2024年					
-469030	琼中黎族苗族自治县	海南省	省直辖县级行政区划	琼中黎族苗族自治县	民政部	2003年	2024年					
-469031	西沙群岛	海南省	省直辖县级行政区划	西沙群岛	非官方							
-469032	南沙群岛	海南省	省直辖县级行政区划	南沙群岛	非官方							
-469033	中沙群岛的岛礁及其海域	海南省	省直辖县级行政区划	中沙群岛的岛礁及其海域	非官方							
-500000	重庆市	重庆市	-	-	民政部	1997年	2024年					
-500100	重庆市	重庆市	市辖区	-	国标							
-500101	万州区	重庆市	市辖区	万州区	民政部	1997年	2024年					万县区[1997年]
-500102	涪陵区	重庆市	市辖区	涪陵区	民政部	1997年	2024年					
-500103	渝中区	重庆市	市辖区	渝中区	民政部	1997年	2024年					
-500104	大渡口区	重庆市	市辖区	大渡口区	民政部	1997年	2024年					
-500105	江北区	重庆市	市辖区	江北区	民政部	1997年	2024年					
-500106	沙坪坝区	重庆市	市辖区	沙坪坝区	民政部	1997年	2024年					
-500107	九龙坡区	重庆市	市辖区	九龙坡区	民政部	1997年	2024年					
-500108	南岸区	重庆市	市辖区	南岸区	民政部	1997年	2024年					
-500109	北碚区	重庆市	市辖区	北碚区	民政部	1997年	2024年					
-500110	綦江区	重庆市	市辖区	綦江区	民政部	1997年	2024年					万盛区[2010年]
-500111	大足区	重庆市	市辖区	大足区	民政部	1997年	2024年					双桥区[2010年]
-500112	渝北区	重庆市	市辖区	渝北区	民政部	1997年	2024年					
-500113	巴南区	重庆市	市辖区	巴南区	民政部	1997年	2024年					
-500114	黔江区	重庆市	市辖区	黔江区	民政部	2000年	2024年					
-500115	长寿区	重庆市	市辖区	长寿区	民政部	2001年	2024年					
-500116	江津区	重庆市	市辖区	江津区	民政部	2006年	2024年					
-500117	合川区	重庆市	市辖区	合川区	民政部	2006年	2024年					
-500118	永川区	重庆市	市辖区	永川区	民政部	2006年	2024年					
-500119	南川区	重庆市	市辖区	南川区	民政部	2006年	2024年					
-500120	璧山区	重庆市	市辖区	璧山区	民政部	2014年	2024年					
-500151	铜梁区	重庆市	市辖区	铜梁区	民政部	2014年	2024年					
-500152	潼南区	重庆市	市辖区	潼南区	民政部	2015年	2024年					
-500153	荣昌区	重庆市	市辖区	荣昌区	民政部	2015年	2024年					
-500154	开州区	重庆市	市辖区	开州区	民政部	2016年	2024年					
-500155	梁平区	重庆市	市辖区	梁平区	民政部	2016年	2024年					
-500156	武隆区	重庆市	市辖区	武隆区	民政部	2016年	2024年					
-500200	重庆市	重庆市	县	-	国标							
-500221	长寿县	重庆市	县	长寿县	民政部	1997年	2000年	[已撤销]	500115	重庆市,市辖区,长寿区		
-500222	綦江县	重庆市	县	綦江县	民政部	1997年	2010年	[已撤销]	500110	重庆市,市辖区,綦江区		
-500223	潼南县	重庆市	县	潼南县	民政部	1997年	2014年	[已撤销]	500152	重庆市,市辖区,潼南区		
-500224	铜梁县	重庆市	县	铜梁县	民政部	1997年	2013年	[已撤销]	500151	重庆市,市辖区,铜梁区		
-500225	大足县	重庆市	县	大足县	民政部	1997年	2010年	[已撤销]	500111	重庆市,市辖区,大足区		
-500226	荣昌县	重庆市	县	荣昌县	民政部	1997年	2014年	[已撤销]	500153	重庆市,市辖区,荣昌区		
-500227	璧山县	重庆市	县	璧山县	民政部	1997年	2013年	[已撤销]	500120	重庆市,市辖区,璧山区		
-500228	梁平县	重庆市	县	梁平县	民政部	1997年	2015年	[已撤销]	500155	重庆市,市辖区,梁平区		
-500229	城口县	重庆市	县	城口县	民政部	1997年	2024年					
-500230	丰都县	重庆市	县	丰都县	民政部	1997年	2024年					旧称：丰都县(酆都县)；
-500231	垫江县	重庆市	县	垫江县	民政部	1997年	2024年					
-500232	武隆县	重庆市	县	武隆县	民政部	1997年	2015年	[已撤销]	500156	重庆市,市辖区,武隆区		
-500233	忠县	重庆市	县	忠县	民政部	1997年	2024年					
-500234	开县	重庆市	县	开县	民政部	1997年	2015年	[已撤销]	500154	重庆市,市辖区,开州区		
-500235	云阳县	重庆市	县	云阳县	民政部	1997年	2024年					
-500236	奉节县	重庆市	县	奉节县	民政部	1997年	2024年					
-500237	巫山县	重庆市	县	巫山县	民政部	1997年	2024年					
-500238	巫溪县	重庆市	县	巫溪县	民政部	1997年	2024年					
-500239	黔江土家族苗族自治县	重庆市	县	黔江土家族苗族自治县	民政部	1997年	1999年	[已撤销]	500114	重庆市,市辖区,黔江区		
-500240	石柱土家族自治县	重庆市	县	石柱土家族自治县	民政部	1997年	2024年					旧称：石柱土家族自治县(石砫土家族自治县)；
-500241	秀山土家族苗族自治县	重庆市	县	秀山土家族苗族自治县	民政部	1997年	2024年					
-500242	酉阳土家族苗族自治县	重庆市	县	酉阳土家族苗族自治县	民政部	1997年	2024年					
-500243	彭水苗族土家族自治县	重庆市	县	彭水苗族土家族自治县	民政部	1997年	2024年					
-500300	重庆市	重庆市	县	-	非官方							
-500381	江津市	重庆市	县	江津市	民政部	1997年	2005年	[已撤销]	500116	重庆市,市辖区,江津区		
-500382	合川市	重庆市	县	合川市	民政部	1997年	2005年	[已撤销]	500117	重庆市,市辖区,合川区		
-500383	永川市	重庆市	县	永川市	民政部	1997年	2005年	[已撤销]	500118	重庆市,市辖区,永川区		
-500384	南川市	重庆市	县	南川市	民政部	1997年	2005年	[已撤销]	500119	重庆市,市辖区,南川区		
-510000	四川省	四川省	-	-	民政部	1980年	2024年					
-510100	成都市	四川省	成都市	-	民政部	1980年	2024年					
-510101	市辖区	四川省	成都市	市辖区	国标							增设（GB/T 2260-1984）
-510102	东城区	四川省	成都市	东城区	民政部	1980年	1989年	[已撤销]	510104	成都市,锦江区		
-510103	西城区	四川省	成都市	西城区	民政部	1980年	1989年	[已撤销]	510105	成都市,青羊区		
-510104	锦江区	四川省	成都市	锦江区	民政部	1990年	2024年					
-510105	青羊区	四川省	成都市	青羊区	民政部	1990年	2024年					
-510106	金牛区	四川省	成都市	金牛区	民政部	1990年	2024年					
-510107	武侯区	四川省	成都市	武侯区	民政部	1990年	2024年					
-510108	成华区	四川省	成都市	成华区	民政部	1990年	2024年					
-510111	金牛区	四川省	成都市	金牛区	民政部	1980年	1989年	[已撤销]	510106	成都市,金牛区		
-510112	龙泉驿区	四川省	成都市	龙泉驿区	民政部	1980年	2024年					
-510113	青白江区	四川省	成都市	青白江区	民政部	1980年	2024年					
-510114	新都区	四川省	成都市	新都区	民政部	2001年	2024年					
-510115	温江区	四川省	成都市	温江区	民政部	2002年	2024年					
-510116	双流区	四川省	成都市	双流区	民政部	2015年	2024年					
-510117	郫都区	四川省	成都市	郫都区	民政部	2016年	2024年					
-510118	新津区	四川省	成都市	新津区	民政部	2020年	2024年					
-510120	成都市区	四川省	成都市	成都市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-510121	金堂县	四川省	成都市	金堂县	民政部	1980年	2024年					
-510122	双流县	四川省	成都市	双流县	民政部	1980年	2014年	[已撤销]	510116	成都市,双流区		
-510123	温江县	四川省	成都市	温江县	民政部	1983年	2001年	[已撤销]	510115	成都市,温江区		
-510124	郫县	四川省	成都市	郫县	民政部	1983年	2015年	[已撤销]	510117	成都市,郫都区		
-510125	新都县	四川省	成都市	新都县	民政部	1983年	2000年	[已撤销]	510114	成都市,新都区		
-510126	彭县	四川省	成都市	彭县	民政部	1983年	1992年	[已撤销]	519010	省直辖县级行政区划,彭州市[已撤销]		
-510127	灌县	四川省	成都市	灌县	民政部	1983年	1987年	[已撤销]	519003	省直辖县级行政区划,都江堰市[已撤销]		
-510128	崇庆县	四川省	成都市	崇庆县	民政部	1983年	1993年	[已撤销]	519013	省直辖县级行政区划,崇州市[已撤销]		
-510129	大邑县	四川省	成都市	大邑县	民政部	1983年	2024年					
-510130	邛崃县	四川省	成都市	邛崃县	民政部	1983年	1993年	[已撤销]	519012	省直辖县级行政区划,邛崃市[已撤销]		
-510131	蒲江县	四川省	成都市	蒲江县	民政部	1983年	2024年					
-510132	新津县	四川省	成都市	新津县	民政部	1983年	2019年	[已撤销]	510118	成都市,新津区		
-510181	都江堰市	四川省	成都市	都江堰市	民政部	1995年	2024年					
-510182	彭州市	四川省	成都市	彭州市	民政部	1995年	2024年					
-510183	邛崃市	四川省	成都市	邛崃市	民政部	1995年	2024年					
-510184	崇州市	四川省	成都市	崇州市	民政部	1995年	2024年					
-510185	简阳市	四川省	成都市	简阳市	民政部	2016年	2024年					
-510200	重庆市	四川省	重庆市	-	民政部	1980年	1996年	[已撤销]	500000	重庆市,重庆市（省级）		
-510201	市辖区	四川省	重庆市	市辖区	国标							增设（GB/T 2260-1984）
-510202	渝中区	四川省	重庆市	渝中区	民政部	1980年	1996年	[已撤销]	500103	重庆市,市辖区,渝中区		市中区[1993年]
-510203	大渡口区	四川省	重庆市	大渡口区	民政部	1980年	1996年	[已撤销]	500104	重庆市,市辖区,大渡口区		
-510210		四川省	重庆市		非官方						1963年	
-510211	江北区	四川省	重庆市	江北区	民政部	1980年	1996年	[已撤销]	500105	重庆市,市辖区,江北区		
-510212	沙坪坝区	四川省	重庆市	沙坪坝区	民政部	1980年	1996年	[已撤销]	500106	重庆市,市辖区,沙坪坝区		
-510213	九龙坡区	四川省	重庆市	九龙坡区	民政部	1980年	1996年	[已撤销]	500107	重庆市,市辖区,九龙坡区		
-510214	南岸区	四川省	重庆市	南岸区	民政部	1980年	1996年	[已撤销]	500108	重庆市,市辖区,南岸区		
-510215	北碚区	四川省	重庆市	北碚区	民政部	1980年	1996年	[已撤销]	500109	重庆市,市辖区,北碚区		
-510216	万盛区	四川省	重庆市	万盛区	民政部	1980年	1996年	[已撤销]	500110	重庆市,市辖区,綦江区		南桐矿区[1992年]
-510217	双桥区	四川省	重庆市	双桥区	民政部	1980年	1996年	[已撤销]	500111	重庆市,市辖区,大足区		
-510218	渝北区	四川省	重庆市	渝北区	民政部	1994年	1996年	[已撤销]	500112	重庆市,市辖区,渝北区		
-510219	巴南区	四川省	重庆市	巴南区	民政部	1994年	1996年	[已撤销]	500113	重庆市,市辖区,巴南区		
-510220	重庆市区	四川省	重庆市	重庆市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-510221	长寿县	四川省	重庆市	长寿县	民政部	1980年	1996年	[已撤销]	500221	重庆市,县,长寿县[已撤销]		
-510222	巴县	四川省	重庆市	巴县	民政部	1980年	1993年	[已撤销]	510219	重庆市,巴南区[已撤销]		
-510223	綦江县	四川省	重庆市	綦江县	民政部	1980年	1996年	[已撤销]	500222	重庆市,县,綦江县[已撤销]		
-510224	江北县	四川省	重庆市	江北县	民政部	1980年	1993年	[已撤销]	500105	重庆市,市辖区,江北区		
-510225	江津县	四川省	重庆市	江津县	民政部	1983年	1991年	[已撤销]	519007	省直辖县级行政区划,江津市[已撤销]		
-510226	合川县	四川省	重庆市	合川县	民政部	1983年	1991年	[已撤销]	519006	省直辖县级行政区划,合川市[已撤销]		
-510227	潼南县	四川省	重庆市	潼南县	民政部	1983年	1996年	[已撤销]	500223	重庆市,县,潼南县[已撤销]		
-510228	铜梁县	四川省	重庆市	铜梁县	民政部	1983年	1996年	[已撤销]	500224	重庆市,县,铜梁县[已撤销]		
-510229	永川县	四川省	重庆市	永川县	民政部	1983年	1991年	[已撤销]	519005	省直辖县级行政区划,永川市[已撤销]		
-510230	大足县	四川省	重庆市	大足县	民政部	1983年	1996年	[已撤销]	500225	重庆市,县,大足县[已撤销]		
-510231	荣昌县	四川省	重庆市	荣昌县	民政部	1983年	1996年	[已撤销]	500226	重庆市,县,荣昌县[已撤销]		
-510232	璧山县	四川省	重庆市	璧山县	民政部	1983年	1996年	[已撤销]	500227	重庆市,县,璧山县[已撤销]		
-510281	永川市	四川省	重庆市	永川市	民政部	1995年	1996年	[已撤销]	500383	重庆市,县,永川市[已撤销]		
-510282	合川市	四川省	重庆市	合川市	民政部	1995年	1996年	[已撤销]	500382	重庆市,县,合川市[已撤销]		
-510283	江津市	四川省	重庆市	江津市	民政部	1995年	1996年	[已撤销]	500381	重庆市,县,江津市[已撤销]		
-510300	自贡市	四川省	自贡市	-	民政部	1980年	2024年					
-510301	市辖区	四川省	自贡市	市辖区	国标							增设（GB/T 2260-1984）
-510302	自流井区	四川省	自贡市	自流井区	民政部	1980年	2024年					
-510303	贡井区	四川省	自贡市	贡井区	民政部	1980年	2024年					
-510304	大安区	四川省	自贡市	大安区	民政部	1980年	2024年					
-510311	沿滩区	四川省	自贡市	沿滩区	民政部	1980年	2024年					
-510320	自贡市区	四川省	自贡市	自贡市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-510321	荣县	四川省	自贡市	荣县	民政部	1980年	2024年					
-510322	富顺县	四川省	自贡市	富顺县	民政部	1983年	2024年					
-510400	攀枝花市	四川省	攀枝花市	-	民政部	1980年	2024年					渡口市[1986年]
-510401	市辖区	四川省	攀枝花市	市辖区	国标							增设（GB/T 2260-1984）
-510402	东区	四川省	攀枝花市	东区	民政部	1980年	2024年					
-510403	西区	四川省	攀枝花市	西区	民政部	1980年	2024年					
-510411	仁和区	四川省	攀枝花市	仁和区	民政部	1980年	2024年					郊区[1981年]
-510420	攀枝花市区	四川省	攀枝花市	攀枝花市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-510421	米易县	四川省	攀枝花市	米易县	民政部	1980年	2024年					
-510422	盐边县	四川省	攀枝花市	盐边县	民政部	1980年	2024年					
-510500	泸州市	四川省	泸州市	-	民政部	1983年	2024年					
-510501	市辖区	四川省	泸州市	市辖区	国标							增设（GB/T 2260-1984）
-510502	江阳区	四川省	泸州市	江阳区	民政部	1984年	2024年					市中区[1994年]
-510503	纳溪区	四川省	泸州市	纳溪区	民政部	1995年	2024年					
-510504	龙马潭区	四川省	泸州市	龙马潭区	民政部	1995年	2024年					
-510521	泸县	四川省	泸州市	泸县	民政部	1983年	2024年					
-510522	合江县	四川省	泸州市	合江县	民政部	1983年	2024年					
-510523	纳溪县	四川省	泸州市	纳溪县	民政部	1983年	1994年	[已撤销]	510503	泸州市,纳溪区		
-510524	叙永县	四川省	泸州市	叙永县	民政部	1985年	2024年					
-510525	古蔺县	四川省	泸州市	古蔺县	民政部	1985年	2024年					
-510600	德阳市	四川省	德阳市	-	民政部	1983年	2024年					
-510601	市辖区	四川省	德阳市	市辖区	国标							增设（GB/T 2260-1984）
-510602	市中区	四川省	德阳市	市中区	民政部	1984年	1995年	[已撤销]	510603,510626	德阳市,旌阳区,罗江县[已撤销]		
-510603	旌阳区	四川省	德阳市	旌阳区	民政部	1996年	2024年					
-510604	罗江区	四川省	德阳市	罗江区	民政部	2017年	2024年					
-510621	德阳县	四川省	德阳市	德阳县	民政部	1983年	1983年	[已撤销]	510600	德阳市（地市）		
-510622	绵竹县	四川省	德阳市	绵竹县	民政部	1983年	1995年	[已撤销]	510683	德阳市,绵竹市		
-510623	中江县	四川省	德阳市	中江县	民政部	1983年	2024年					
-510624	广汉县	四川省	德阳市	广汉县	民政部	1983年	1987年	[已撤销]	519001	省直辖县级行政区划,广汉市[已撤销]		
-510625	什邡县	四川省	德阳市	什邡县	民政部	1983年	1994年	[已撤销]	510682	德阳市,什邡市		
-510626	罗江县	四川省	德阳市	罗江县	民政部	1996年	2016年	[已撤销]	510604	德阳市,罗江区		
-510681	广汉市	四川省	德阳市	广汉市	民政部	1995年	2024年					
-510682	什邡市	四川省	德阳市	什邡市	民政部	1995年	2024年					
-510683	绵竹市	四川省	德阳市	绵竹市	民政部	1996年	2024年					
-510700	绵阳市	四川省	绵阳市	-	民政部	1985年	2024年					
-510701	市辖区	四川省	绵阳市	市辖区	国标							
-510702	市中区	四川省	绵阳市	市中区	民政部	1985年	1991年	[已撤销]	510703,510704	绵阳市,涪城区,游仙区		
-510703	涪城区	四川省	绵阳市	涪城区	民政部	1992年	2024年					
-510704	游仙区	四川省	绵阳市	游仙区	民政部	1992年	2024年					
-510705	安州区	四川省	绵阳市	安州区	民政部	2016年	2024年					
-510721	江油县	四川省	绵阳市	江油县	民政部	1985年	1987年	[已撤销]	519002	省直辖县级行政区划,江油市[已撤销]		
-510722	三台县	四川省	绵阳市	三台县	民政部	1985年	2024年					
-510723	盐亭县	四川省	绵阳市	盐亭县	民政部	1985年	2024年					
-510724	安县	四川省	绵阳市	安县	民政部	1985年	2015年	[已撤销]	510705	绵阳市,安州区		
-510725	梓潼县	四川省	绵阳市	梓潼县	民政部	1985年	2024年					
-510726	北川羌族自治县	四川省	绵阳市	北川羌族自治县	民政部	1985年	2024年					北川县[2002年]
-510727	平武县	四川省	绵阳市	平武县	民政部	1985年	2024年					
-510781	江油市	四川省	绵阳市	江油市	民政部	1995年	2024年					
-510800	广元市	四川省	广元市	-	民政部	1985年	2024年					
-510801	市辖区	四川省	广元市	市辖区	国标							
-510802	利州区	四川省	广元市	利州区	民政部	1985年	2024年					市中区[2006年]
-510811	昭化区	四川省	广元市	昭化区	民政部	1989年	2024年					元坝区[2012年]
-510812	朝天区	四川省	广元市	朝天区	民政部	1989年	2024年					
-510821	旺苍县	四川省	广元市	旺苍县	民政部	1985年	2024年					
-510822	青川县	四川省	广元市	青川县	民政部	1985年	2024年					
-510823	剑阁县	四川省	广元市	剑阁县	民政部	1985年	2024年					
-510824	苍溪县	四川省	广元市	苍溪县	民政部	1985年	2024年					
-510900	遂宁市	四川省	遂宁市	-	民政部	1985年	2024年					
-510901	市辖区	四川省	遂宁市	市辖区	国标							
-510902	市中区	四川省	遂宁市	市中区	民政部	1985年	2002年	[已撤销]	510903,510904	遂宁市,船山区,安居区		
-510903	船山区	四川省	遂宁市	船山区	民政部	2003年	2024年					
-510904	安居区	四川省	遂宁市	安居区	民政部	2003年	2024年					
-510921	蓬溪县	四川省	遂宁市	蓬溪县	民政部	1985年	2024年					
-510922	射洪县	四川省	遂宁市	射洪县	民政部	1985年	2018年	[已撤销]	510981	遂宁市,射洪市		
-510923	大英县	四川省	遂宁市	大英县	民政部	1997年	2024年					
-510981	射洪市	四川省	遂宁市	射洪市	民政部	2019年	2024年					
-511000	内江市	四川省	内江市	-	民政部	1985年	2024年					
-511001	市辖区	四川省	内江市	市辖区	国标							
-511002	市中区	四川省	内江市	市中区	民政部	1985年	2024年					
-511011	东兴区	四川省	内江市	东兴区	民政部	1989年	2024年					
-511021	内江县	四川省	内江市	内江县	民政部	1985年	1988年	[已撤销]	511011	内江市,东兴区		
-511022	乐至县	四川省	内江市	乐至县	民政部	1985年	1997年	[已撤销]	513922	资阳地区,乐至县[已撤销]		
-511023	安岳县	四川省	内江市	安岳县	民政部	1985年	1997年	[已撤销]	513921	资阳地区,安岳县[已撤销]		
-511024	威远县	四川省	内江市	威远县	民政部	1985年	2024年					
-511025	资中县	四川省	内江市	资中县	民政部	1985年	2024年					
-511026	资阳县	四川省	内江市	资阳县	民政部	1985年	1992年	[已撤销]	519009	省直辖县级行政区划,资阳市[已撤销]		
-511027	简阳县	四川省	内江市	简阳县	民政部	1985年	1993年	[已撤销]	519011	省直辖县级行政区划,简阳市[已撤销]		
-511028	隆昌县	四川省	内江市	隆昌县	民政部	1985年	2016年	[已撤销]	511083	内江市,隆昌市		
-511081	资阳市	四川省	内江市	资阳市	民政部	1995年	1997年	[已撤销]	513901	资阳地区,资阳市[已撤销]		
-511082	简阳市	四川省	内江市	简阳市	民政部	1995年	1997年	[已撤销]	513902	资阳地区,简阳市[已撤销]		
-511083	隆昌市	四川省	内江市	隆昌市	民政部	2017年	2024年					
-511100	乐山市	四川省	乐山市	-	民政部	1985年	2024年					
-511101	市辖区	四川省	乐山市	市辖区	国标							
-511102	市中区	四川省	乐山市	市中区	民政部	1985年	2024年					
-511111	沙湾区	四川省	乐山市	沙湾区	民政部	1985年	2024年					
-511112	五通桥区	四川省	乐山市	五通桥区	民政部	1985年	2024年					
-511113	金口河区	四川省	乐山市	金口河区	民政部	1985年	2024年					
-511121	仁寿县	四川省	乐山市	仁寿县	民政部	1985年	1996年	[已撤销]	513822	眉山地区,仁寿县[已撤销]		
-511122	眉山县	四川省	乐山市	眉山县	民政部	1985年	1996年	[已撤销]	513821	眉山地区,眉山县[已撤销]		
-511123	犍为县	四川省	乐山市	犍为县	民政部	1985年	2024年					
-511124	井研县	四川省	乐山市	井研县	民政部	1985年	2024年					
-511125	峨眉县	四川省	乐山市	峨眉县	民政部	1985年	1987年	[已撤销]	519004	省直辖县级行政区划,峨眉山市[已撤销]		
-511126	夹江县	四川省	乐山市	夹江县	民政部	1985年	2024年					
-511127	洪雅县	四川省	乐山市	洪雅县	民政部	1985年	1996年	[已撤销]	513824	眉山地区,洪雅县[已撤销]		
-511128	彭山县	四川省	乐山市	彭山县	民政部	1985年	1996年	[已撤销]	513823	眉山地区,彭山县[已撤销]		
-511129	沐川县	四川省	乐山市	沐川县	民政部	1985年	2024年					
-511130	青神县	四川省	乐山市	青神县	民政部	1985年	1996年	[已撤销]	513826	眉山地区,青神县[已撤销]		
-511131	丹棱县	四川省	乐山市	丹棱县	民政部	1985年	1996年	[已撤销]	513825	眉山地区,丹棱县[已撤销]		
-511132	峨边彝族自治县	四川省	乐山市	峨边彝族自治县	民政部	1985年	2024年					
-511133	马边彝族自治县	四川省	乐山市	马边彝族自治县	民政部	1985年	2024年					
-511181	峨眉山市	四川省	乐山市	峨眉山市	民政部	1995年	2024年					
-511200	万县市	四川省	万县市	-	民政部	1992年	1996年	[已撤销]	500101	重庆市,市辖区,万州区		
-511201	市辖区	四川省	万县市	市辖区	国标							
-511202	龙宝区	四川省	万县市	龙宝区	民政部	1992年	1996年	[已撤销]	500101	重庆市,市辖区,万州区		
-511203	天城区	四川省	万县市	天城区	民政部	1992年	1996年	[已撤销]	500101	重庆市,市辖区,万州区		
-511204	五桥区	四川省	万县市	五桥区	民政部	1992年	1996年	[已撤销]	500101	重庆市,市辖区,万州区		
-511221	开县	四川省	万县市	开县	民政部	1992年	1996年	[已撤销]	500234	重庆市,县,开县[已撤销]		
-511222	忠县	四川省	万县市	忠县	民政部	1992年	1996年	[已撤销]	500233	重庆市,县,忠县		
-511223	梁平县	四川省	万县市	梁平县	民政部	1992年	1996年	[已撤销]	500228	重庆市,县,梁平县[已撤销]		
-511224	云阳县	四川省	万县市	云阳县	民政部	1992年	1996年	[已撤销]	500235	重庆市,县,云阳县		
-511225	奉节县	四川省	万县市	奉节县	民政部	1992年	1996年	[已撤销]	500236	重庆市,县,奉节县		
-511226	巫山县	四川省	万县市	巫山县	民政部	1992年	1996年	[已撤销]	500237	重庆市,县,巫山县		
-511227	巫溪县	四川省	万县市	巫溪县	民政部	1992年	1996年	[已撤销]	500238	重庆市,县,巫溪县		
-511228	城口县	四川省	万县市	城口县	民政部	1992年	1996年	[已撤销]	500229	重庆市,县,城口县		
-511300	南充市	四川省	南充市	-	民政部	1993年	2024年					
-511301	市辖区	四川省	南充市	市辖区	国标							
-511302	顺庆区	四川省	南充市	顺庆区	民政部	1993年	2024年					
-511303	高坪区	四川省	南充市	高坪区	民政部	1993年	2024年					
-511304	嘉陵区	四川省	南充市	嘉陵区	民政部	1993年	2024年					
-511321	南部县	四川省	南充市	南部县	民政部	1993年	2024年					
-511322	营山县	四川省	南充市	营山县	民政部	1993年	2024年					
-511323	蓬安县	四川省	南充市	蓬安县	民政部	1993年	2024年					
-511324	仪陇县	四川省	南充市	仪陇县	民政部	1993年	2024年					
-511325	西充县	四川省	南充市	西充县	民政部	1993年	2024年					
-511381	阆中市	四川省	南充市	阆中市	民政部	1995年	2024年					
-511400	眉山市	四川省	眉山市	-	民政部	2000年	2024年					
-511401	市辖区	四川省	眉山市	市辖区	国标							
-511402	东坡区	四川省	眉山市	东坡区	民政部	2000年	2024年					
-511403	彭山区	四川省	眉山市	彭山区	民政部	2014年	2024年					
-511421	仁寿县	四川省	眉山市	仁寿县	民政部	2000年	2024年					
-511422	彭山县	四川省	眉山市	彭山县	民政部	2000年	2013年	[已撤销]	511403	眉山市,彭山区		
-511423	洪雅县	四川省	眉山市	洪雅县	民政部	2000年	2024年					
-511424	丹棱县	四川省	眉山市	丹棱县	民政部	2000年	2024年					
-511425	青神县	四川省	眉山市	青神县	民政部	2000年	2024年					
-511500	宜宾市	四川省	宜宾市	-	民政部	1996年	2024年					
-511501	市辖区	四川省	宜宾市	市辖区	国标							
-511502	翠屏区	四川省	宜宾市	翠屏区	民政部	1996年	2024年					
-511503	南溪区	四川省	宜宾市	南溪区	民政部	2011年	2024年					
-511504	叙州区	四川省	宜宾市	叙州区	民政部	2018年	2024年					
-511521	宜宾县	四川省	宜宾市	宜宾县	民政部	1996年	2017年	[已撤销]	511504	宜宾市,叙州区		
-511522	南溪县	四川省	宜宾市	南溪县	民政部	1996年	2010年	[已撤销]	511503	宜宾市,南溪区		
-511523	江安县	四川省	宜宾市	江安县	民政部	1996年	2024年					
-511524	长宁县	四川省	宜宾市	长宁县	民政部	1996年	2024年					
-511525	高县	四川省	宜宾市	高县	民政部	1996年	2024年					
-511526	珙县	四川省	宜宾市	珙县	民政部	1996年	2024年					
-511527	筠连县	四川省	宜宾市	筠连县	民政部	1996年	2024年					
-511528	兴文县	四川省	宜宾市	兴文县	民政部	1996年	2024年					
-511529	屏山县	四川省	宜宾市	屏山县	民政部	1996年	2024年					
-511600	广安市	四川省	广安市	-	民政部	1998年	2024年					
-511601	市辖区	四川省	广安市	市辖区	国标							
-511602	广安区	四川省	广安市	广安区	民政部	1998年	2024年					
-511603	前锋区	四川省	广安市	前锋区	民政部	2013年	2024年					
-511621	岳池县	四川省	广安市	岳池县	民政部	1998年	2024年					
-511622	武胜县	四川省	广安市	武胜县	民政部	1998年	2024年					
-511623	邻水县	四川省	广安市	邻水县	民政部	1998年	2024年					
-511681	华蓥市	四川省	广安市	华蓥市	民政部	1998年	2024年					
-511700	达州市	四川省	达州市	-	民政部	1999年	2024年					
-511701	市辖区	四川省	达州市	市辖区	国标							
-511702	通川区	四川省	达州市	通川区	民政部	1999年	2024年					
-511703	达川区	四川省	达州市	达川区	民政部	2013年	2024年					
-511721	达县	四川省	达州市	达县	民政部	1999年	2012年	[已撤销]	511703	达州市,达川区		
-511722	宣汉县	四川省	达州市	宣汉县	民政部	1999年	2024年					
-511723	开江县	四川省	达州市	开江县	民政部	1999年	2024年					
-511724	大竹县	四川省	达州市	大竹县	民政部	1999年	2024年					
-511725	渠县	四川省	达州市	渠县	民政部	1999年	2024年					
-511781	万源市	四川省	达州市	万源市	民政部	1999年	2024年					
-511800	雅安市	四川省	雅安市	-	民政部	2000年	2024年					
-511801	市辖区	四川省	雅安市	市辖区	国标							
-511802	雨城区	四川省	雅安市	雨城区	民政部	2000年	2024年					
-511803	名山区	四川省	雅安市	名山区	民政部	2012年	2024年					
-511821	名山县	四川省	雅安市	名山县	民政部	2000年	2011年	[已撤销]	511803	雅安市,名山区		
-511822	荥经县	四川省	雅安市	荥经县	民政部	2000年	2024年					
-511823	汉源县	四川省	雅安市	汉源县	民政部	2000年	2024年					
-511824	石棉县	四川省	雅安市	石棉县	民政部	2000年	2024年					
-511825	天全县	四川省	雅安市	天全县	民政部	2000年	2024年					
-511826	芦山县	四川省	雅安市	芦山县	民政部	2000年	2024年					
-511827	宝兴县	四川省	雅安市	宝兴县	民政部	2000年	2024年					
-511900	巴中市	四川省	巴中市	-	民政部	2000年	2024年					
-511901	市辖区	四川省	巴中市	市辖区	国标							
-511902	巴州区	四川省	巴中市	巴州区	民政部	2000年	2024年					
-511903	恩阳区	四川省	巴中市	恩阳区	民政部	2013年	2024年					
-511921	通江县	四川省	巴中市	通江县	民政部	2000年	2024年					
-511922	南江县	四川省	巴中市	南江县	民政部	2000年	2024年					
-511923	平昌县	四川省	巴中市	平昌县	民政部	2000年	2024年					
-512000	资阳市	四川省	资阳市	-	民政部	2000年	2024年					
-512001	市辖区	四川省	资阳市	市辖区	国标							
-512002	雁江区	四川省	资阳市	雁江区	民政部	2000年	2024年					
-512021	安岳县	四川省	资阳市	安岳县	民政部	2000年	2024年					
-512022	乐至县	四川省	资阳市	乐至县	民政部	2000年	2024年					
-512081	简阳市	四川省	资阳市	简阳市	民政部	2000年	2015年	[已撤销]	510185	成都市,简阳市		
-512100	永川地区	四川省	永川地区	-	民政部	1980年	1982年	[已撤销]	510200	重庆市（地市）[已撤销]		温江地区[1981年]
-512121	江津县	四川省	永川地区	江津县	民政部	1980年	1982年	[已撤销]	510225	重庆市,江津县[已撤销]		温江县[1981年]
-512122	合川县	四川省	永川地区	合川县	民政部	1980年	1982年	[已撤销]	510226	重庆市,合川县[已撤销]		郫县[1981年]
-512123	潼南县	四川省	永川地区	潼南县	民政部	1980年	1982年	[已撤销]	510227	重庆市,潼南县[已撤销]		灌县[1981年]
-512124	铜梁县	四川省	永川地区	铜梁县	民政部	1980年	1982年	[已撤销]	510228	重庆市,铜梁县[已撤销]		彭县[1981年]
-512125	永川县	四川省	永川地区	永川县	民政部	1980年	1982年	[已撤销]	510229	重庆市,永川县[已撤销]		什邡县[1981年]
-512126	大足县	四川省	永川地区	大足县	民政部	1980年	1982年	[已撤销]	510230	重庆市,大足县[已撤销]		广汉县[1981年]
-512127	荣昌县	四川省	永川地区	荣昌县	民政部	1980年	1982年	[已撤销]	510231	重庆市,荣昌县[已撤销]		新都县[1981年]
-512128	璧山县	四川省	永川地区	璧山县	民政部	1980年	1982年	[已撤销]	510232	重庆市,璧山县[已撤销]		新津县[1981年]
-512129	蒲江县	四川省	永川地区	蒲江县	民政部	1980年	1981年	[已撤销]	512731	温江地区,蒲江县[已撤销]		
-512130	邛崃县	四川省	永川地区	邛崃县	民政部	1980年	1981年	[已撤销]	510130	成都市,邛崃县[已撤销]		
-512131	大邑县	四川省	永川地区	大邑县	民政部	1980年	1981年	[已撤销]	510129	成都市,大邑县		
-512132	崇庆县	四川省	永川地区	崇庆县	民政部	1980年	1981年	[已撤销]	510128	成都市,崇庆县[已撤销]		
-512200	万县地区	四川省	万县地区	-	民政部	1980年	1991年	[已撤销]	511200	万县市（地市）[已撤销]		绵阳地区[1981年]
-512201	万县市	四川省	万县地区	万县市	民政部	1980年	1991年	[已撤销]	511200	万县市（地市）[已撤销]		绵阳市[1981年]
-512202	市中区	四川省	万县地区	市中区	民政部	1980年	1981年	[已撤销]	510202	重庆市,渝中区[已撤销]		
-512221	万县	四川省	万县地区	万县	民政部	1980年	1991年	[已撤销]	511200	万县市（地市）[已撤销]		江油县[1981年]
-512222	开县	四川省	万县地区	开县	民政部	1980年	1991年	[已撤销]	511221	万县市,开县[已撤销]		青川县[1981年]
-512223	忠县	四川省	万县地区	忠县	民政部	1980年	1991年	[已撤销]	511222	万县市,忠县[已撤销]		平武县[1981年]
-512224	梁平县	四川省	万县地区	梁平县	民政部	1980年	1991年	[已撤销]	511223	万县市,梁平县[已撤销]		广元县[1981年]
-512225	云阳县	四川省	万县地区	云阳县	民政部	1980年	1991年	[已撤销]	511224	万县市,云阳县[已撤销]		旺苍县[1981年]
-512226	奉节县	四川省	万县地区	奉节县	民政部	1980年	1991年	[已撤销]	511225	万县市,奉节县[已撤销]		剑阁县[1981年]
-512227	巫山县	四川省	万县地区	巫山县	民政部	1980年	1991年	[已撤销]	511226	万县市,巫山县[已撤销]		梓潼县[1981年]
-512228	巫溪县	四川省	万县地区	巫溪县	民政部	1980年	1991年	[已撤销]	511227	万县市,巫溪县[已撤销]		三台县[1981年]
-512229	城口县	四川省	万县地区	城口县	民政部	1980年	1991年	[已撤销]	511228	万县市,城口县[已撤销]		盐亭县[1981年]
-512230	射洪县	四川省	万县地区	射洪县	民政部	1980年	1981年	[已撤销]	512836	绵阳地区,射洪县[已撤销]		
-512231	遂宁县	四川省	万县地区	遂宁县	民政部	1980年	1981年	[已撤销]	512832	绵阳地区,遂宁县[已撤销]		
-512232	蓬溪县	四川省	万县地区	蓬溪县	民政部	1980年	1981年	[已撤销]	512835	绵阳地区,蓬溪县[已撤销]		
-512233	中江县	四川省	万县地区	中江县	民政部	1980年	1981年	[已撤销]	512834	绵阳地区,中江县[已撤销]		
-512234	德阳县	四川省	万县地区	德阳县	民政部	1980年	1981年	[已撤销]	510621	德阳市,德阳县[已撤销]		
-512235	绵竹县	四川省	万县地区	绵竹县	民政部	1980年	1981年	[已撤销]	510622	德阳市,绵竹县[已撤销]		
-512236	安县	四川省	万县地区	安县	民政部	1980年	1981年	[已撤销]	512823	绵阳地区,安县[已撤销]		
-512237	北川县	四川省	万县地区	北川县	民政部	1980年	1981年	[已撤销]	512831	绵阳地区,北川县[已撤销]		
-512300	涪陵地区	四川省	涪陵地区	-	民政部	1980年	1994年	[已撤销]	517000	涪陵市（地市）[已撤销]		内江地区[1981年]
-512301	涪陵市	四川省	涪陵地区	涪陵市	民政部	1980年	1994年	[已撤销]	517000	涪陵市（地市）[已撤销]		内江市[1981年]
-512302	南川市	四川省	涪陵地区	南川市	民政部	1994年	1994年	[已撤销]	517081	涪陵市,南川市[已撤销]		
-512321	涪陵县	四川省	涪陵地区	涪陵县	民政部	1980年	1982年	[已撤销]	512301	涪陵地区,涪陵市[已撤销]		内江县[1981年]
-512322	垫江县	四川省	涪陵地区	垫江县	民政部	1980年	1994年	[已撤销]	517021	涪陵市,垫江县[已撤销]		乐至县[1981年]
-512323	南川县	四川省	涪陵地区	南川县	民政部	1980年	1993年	[已撤销]	512302	涪陵地区,南川市[已撤销]		安岳县[1981年]
-512324	丰都县	四川省	涪陵地区	丰都县	民政部	1980年	1994年	[已撤销]	517022	涪陵市,丰都县[已撤销]		旧称：丰都县(酆都县)；威远县[1981年]
-512325	石柱土家族自治县	四川省	涪陵地区	石柱土家族自治县	民政部	1980年	1987年	[已撤销]	513521	黔江地区,石柱土家族自治县[已撤销]		旧称：石柱土家族自治县(石砫土家族自治县)；资中县[1981年]
-512326	武隆县	四川省	涪陵地区	武隆县	民政部	1980年	1994年	[已撤销]	517023	涪陵市,武隆县[已撤销]		资阳县[1981年]
-512327	彭水苗族土家族自治县	四川省	涪陵地区	彭水苗族土家族自治县	民政部	1980年	1987年	[已撤销]	513525	黔江地区,彭水苗族土家族自治县[已撤销]		简阳县[1981年]
-512328	黔江土家族苗族自治县	四川省	涪陵地区	黔江土家族苗族自治县	民政部	1982年	1987年	[已撤销]	513523	黔江地区,黔江土家族苗族自治县[已撤销]		黔江县[1982年]
-512329	酉阳土家族苗族自治县	四川省	涪陵地区	酉阳土家族苗族自治县	民政部	1982年	1987年	[已撤销]	513524	黔江地区,酉阳土家族苗族自治县[已撤销]		酉阳县[1982年]
-512330	秀山土家族苗族自治县	四川省	涪陵地区	秀山土家族苗族自治县	民政部	1982年	1987年	[已撤销]	513522	黔江地区,秀山土家族苗族自治县[已撤销]		秀山县[1982年]
-512400	内江地区	四川省	内江地区	-	民政部	1980年	1984年	[已撤销]	511000	内江市（地市）		宜宾地区[1981年]
-512401	内江市	四川省	内江地区	内江市	民政部	1980年	1984年	[已撤销]	511021	内江市,内江县[已撤销]		宜宾市[1981年]
-512402	泸州市	四川省	内江地区	泸州市	民政部	1980年	1981年	[已撤销]	512502	宜宾地区,泸州市[已撤销]		
-512421	内江县	四川省	内江地区	内江县	民政部	1980年	1984年	[已撤销]	511021	内江市,内江县[已撤销]		宜宾县[1981年]
-512422	资中县	四川省	内江地区	资中县	民政部	1980年	1984年	[已撤销]	511025	内江市,资中县		富顺县[1981年]
-512423	资阳县	四川省	内江地区	资阳县	民政部	1980年	1984年	[已撤销]	511026	内江市,资阳县[已撤销]		隆昌县[1981年]
-512424	简阳县	四川省	内江地区	简阳县	民政部	1980年	1984年	[已撤销]	511027	内江市,简阳县[已撤销]		南溪县[1981年]
-512425	威远县	四川省	内江地区	威远县	民政部	1980年	1984年	[已撤销]	511024	内江市,威远县		江安县[1981年]
-512426	隆昌县	四川省	内江地区	隆昌县	民政部	1980年	1984年	[已撤销]	511028	内江市,隆昌县[已撤销]		纳溪县[1981年]
-512427	安岳县	四川省	内江地区	安岳县	民政部	1980年	1984年	[已撤销]	511023	内江市,安岳县[已撤销]		泸县[1981年]
-512428	乐至县	四川省	内江地区	乐至县	民政部	1980年	1984年	[已撤销]	511022	内江市,乐至县[已撤销]		合江县[1981年]
-512429	古蔺县	四川省	内江地区	古蔺县	民政部	1980年	1981年	[已撤销]	512526	宜宾地区,古蔺县[已撤销]		
-512430	叙永县	四川省	内江地区	叙永县	民政部	1980年	1981年	[已撤销]	510524	泸州市,叙永县		
-512431	长宁县	四川省	内江地区	长宁县	民政部	1980年	1981年	[已撤销]	512530	宜宾地区,长宁县[已撤销]		
-512432	兴文县	四川省	内江地区	兴文县	民政部	1980年	1981年	[已撤销]	512534	宜宾地区,兴文县[已撤销]		
-512433	珙县	四川省	内江地区	珙县	民政部	1980年	1981年	[已撤销]	512533	宜宾地区,珙县[已撤销]		
-512434	高县	四川省	内江地区	高县	民政部	1980年	1981年	[已撤销]	512531	宜宾地区,高县[已撤销]		
-512435	筠连县	四川省	内江地区	筠连县	民政部	1980年	1981年	[已撤销]	512532	宜宾地区,筠连县[已撤销]		
-512436	屏山县	四川省	内江地区	屏山县	民政部	1980年	1981年	[已撤销]	512535	宜宾地区,屏山县[已撤销]		
-512500	宜宾地区	四川省	宜宾地区	-	民政部	1980年	1995年	[已撤销]	511500	宜宾市（地市）		乐山地区[1981年]
-512501	宜宾市	四川省	宜宾地区	宜宾市	民政部	1980年	1995年	[已撤销]	511500	宜宾市（地市）		乐山市[1981年]
-512502	泸州市	四川省	宜宾地区	泸州市	民政部	1982年	1982年	[已撤销]	510500	泸州市（地市）		
-512521	泸县	四川省	宜宾地区	泸县	民政部	1980年	1982年	[已撤销]	510521	泸州市,泸县		夹江县[1981年]
-512522	富顺县	四川省	宜宾地区	富顺县	民政部	1980年	1982年	[已撤销]	510322	自贡市,富顺县		洪雅县[1981年]
-512523	合江县	四川省	宜宾地区	合江县	民政部	1980年	1982年	[已撤销]	510522	泸州市,合江县		丹棱县[1981年]
-512524	纳溪县	四川省	宜宾地区	纳溪县	民政部	1980年	1982年	[已撤销]	510523	泸州市,纳溪县[已撤销]		青神县[1981年]
-512525	叙永县	四川省	宜宾地区	叙永县	民政部	1980年	1984年	[已撤销]	510524	泸州市,叙永县		眉山县[1981年]
-512526	古蔺县	四川省	宜宾地区	古蔺县	民政部	1980年	1984年	[已撤销]	510525	泸州市,古蔺县		彭山县[1981年]
-512527	宜宾县	四川省	宜宾地区	宜宾县	民政部	1980年	1995年	[已撤销]	511521	宜宾市,宜宾县[已撤销]		井研县[1981年]
-512528	南溪县	四川省	宜宾地区	南溪县	民政部	1980年	1995年	[已撤销]	511522	宜宾市,南溪县[已撤销]		仁寿县[1981年]
-512529	江安县	四川省	宜宾地区	江安县	民政部	1980年	1995年	[已撤销]	511523	宜宾市,江安县		犍为县[1981年]
-512530	长宁县	四川省	宜宾地区	长宁县	民政部	1980年	1995年	[已撤销]	511524	宜宾市,长宁县		沐川县[1981年]
-512531	高县	四川省	宜宾地区	高县	民政部	1980年	1995年	[已撤销]	511525	宜宾市,高县		峨眉县[1981年]
-512532	筠连县	四川省	宜宾地区	筠连县	民政部	1980年	1995年	[已撤销]	511527	宜宾市,筠连县		金口河工农区[1981年]
-512533	珙县	四川省	宜宾地区	珙县	民政部	1981年	1995年	[已撤销]	511526	宜宾市,珙县		峨边县[1981年]
-512534	兴文县	四川省	宜宾地区	兴文县	民政部	1981年	1995年	[已撤销]	511528	宜宾市,兴文县		马边县[1981年]
-512535	屏山县	四川省	宜宾地区	屏山县	民政部	1982年	1995年	[已撤销]	511529	宜宾市,屏山县		
-512600	乐山地区	四川省	乐山地区	-	民政部	1980年	1984年	[已撤销]	511100	乐山市（地市）		江津地区[1980年]；永川地区[1981年]
-512601	乐山市	四川省	乐山地区	乐山市	民政部	1982年	1984年	[已撤销]	511100	乐山市（地市）		
-512621	仁寿县	四川省	乐山地区	仁寿县	民政部	1980年	1984年	[已撤销]	511121	乐山市,仁寿县[已撤销]		永川县[1981年]
-512622	眉山县	四川省	乐山地区	眉山县	民政部	1980年	1984年	[已撤销]	511122	乐山市,眉山县[已撤销]		大足县[1981年]
-512623	犍为县	四川省	乐山地区	犍为县	民政部	1980年	1984年	[已撤销]	511123	乐山市,犍为县		铜梁县[1981年]
-512624	井研县	四川省	乐山地区	井研县	民政部	1980年	1984年	[已撤销]	511124	乐山市,井研县		合川县[1981年]
-512625	峨眉县	四川省	乐山地区	峨眉县	民政部	1980年	1984年	[已撤销]	511125	乐山市,峨眉县[已撤销]		潼南县[1981年]
-512626	夹江县	四川省	乐山地区	夹江县	民政部	1980年	1984年	[已撤销]	511126	乐山市,夹江县		璧山县[1981年]
-512627	洪雅县	四川省	乐山地区	洪雅县	民政部	1980年	1984年	[已撤销]	511127	乐山市,洪雅县[已撤销]		江津县[1981年]
-512628	彭山县	四川省	乐山地区	彭山县	民政部	1980年	1984年	[已撤销]	511128	乐山市,彭山县[已撤销]		荣昌县[1981年]
-512629	沐川县	四川省	乐山地区	沐川县	民政部	1982年	1984年	[已撤销]	511129	乐山市,沐川县		
-512630	青神县	四川省	乐山地区	青神县	民政部	1982年	1984年	[已撤销]	511130	乐山市,青神县[已撤销]		
-512631	丹棱县	四川省	乐山地区	丹棱县	民政部	1982年	1984年	[已撤销]	511131	乐山市,丹棱县[已撤销]		
-512632	峨边彝族自治县	四川省	乐山地区	峨边彝族自治县	民政部	1982年	1984年	[已撤销]	511132	乐山市,峨边彝族自治县		峨边县[1982年]
-512633	马边彝族自治县	四川省	乐山地区	马边彝族自治县	民政部	1982年	1984年	[已撤销]	511133	乐山市,马边彝族自治县		马边县[1982年]
-512634	金口河工农区	四川省	乐山地区	金口河工农区	民政部	1982年	1984年	[已撤销]	511113	乐山市,金口河区		
-512700	温江地区	四川省	温江地区	-	民政部	1980年	1982年	[已撤销]	510100,510600	成都市,德阳市		涪陵地区[1981年]
-512721	温江县	四川省	温江地区	温江县	民政部	1980年	1982年	[已撤销]	510123	成都市,温江县[已撤销]		涪陵县[1981年]
-512722	郫县	四川省	温江地区	郫县	民政部	1980年	1982年	[已撤销]	510124	成都市,郫县[已撤销]		垫江县[1981年]
-512723	新都县	四川省	温江地区	新都县	民政部	1980年	1982年	[已撤销]	510125	成都市,新都县[已撤销]		丰都县[1981年]
-512724	广汉县	四川省	温江地区	广汉县	民政部	1980年	1982年	[已撤销]	510624	德阳市,广汉县[已撤销]		石柱县[1981年]
-512725	什邡县	四川省	温江地区	什邡县	民政部	1980年	1982年	[已撤销]	510625	德阳市,什邡县[已撤销]		秀山县[1981年]
-512726	彭县	四川省	温江地区	彭县	民政部	1980年	1982年	[已撤销]	510126	成都市,彭县[已撤销]		酉阳县[1981年]
-512727	灌县	四川省	温江地区	灌县	民政部	1980年	1982年	[已撤销]	510127	成都市,灌县[已撤销]		黔江县[1981年]
-512728	崇庆县	四川省	温江地区	崇庆县	民政部	1980年	1982年	[已撤销]	510128	成都市,崇庆县[已撤销]		彭水县[1981年]
-512729	大邑县	四川省	温江地区	大邑县	民政部	1980年	1982年	[已撤销]	510129	成都市,大邑县		武隆县[1981年]
-512730	邛崃县	四川省	温江地区	邛崃县	民政部	1980年	1982年	[已撤销]	510130	成都市,邛崃县[已撤销]		南川县[1981年]
-512731	蒲江县	四川省	温江地区	蒲江县	民政部	1982年	1982年	[已撤销]	510131	成都市,蒲江县		
-512732	新津县	四川省	温江地区	新津县	民政部	1982年	1982年	[已撤销]	510132	成都市,新津县[已撤销]		
-512800	绵阳地区	四川省	绵阳地区	-	民政部	1980年	1984年	[已撤销]	510700,510800,510900	绵阳市,广元市,遂宁市		万县地区[1981年]
-512801	绵阳市	四川省	绵阳地区	绵阳市	民政部	1980年	1984年	[已撤销]	510700	绵阳市（地市）		万县市[1981年]
-512802	市中区	四川省	绵阳地区	市中区	民政部	1982年	1982年	[已撤销]	510702	绵阳市,市中区[已撤销]		
-512821	德阳县	四川省	绵阳地区	德阳县	民政部	1980年	1982年	[已撤销]	510621	德阳市,德阳县[已撤销]		万县[1981年]
-512822	绵竹县	四川省	绵阳地区	绵竹县	民政部	1980年	1982年	[已撤销]	510622	德阳市,绵竹县[已撤销]		开县[1981年]
-512823	安县	四川省	绵阳地区	安县	民政部	1980年	1984年	[已撤销]	510724	绵阳市,安县[已撤销]		城口县[1981年]
-512824	江油县	四川省	绵阳地区	江油县	民政部	1980年	1984年	[已撤销]	510721	绵阳市,江油县[已撤销]		巫溪县[1981年]
-512825	梓潼县	四川省	绵阳地区	梓潼县	民政部	1980年	1984年	[已撤销]	510725	绵阳市,梓潼县		巫山县[1981年]
-512826	剑阁县	四川省	绵阳地区	剑阁县	民政部	1980年	1984年	[已撤销]	510823	广元市,剑阁县		奉节县[1981年]
-512827	广元县	四川省	绵阳地区	广元县	民政部	1980年	1984年	[已撤销]	510702	绵阳市,市中区[已撤销]		云阳县[1981年]
-512828	旺苍县	四川省	绵阳地区	旺苍县	民政部	1980年	1984年	[已撤销]	510821	广元市,旺苍县		忠县[1981年]
-512829	青川县	四川省	绵阳地区	青川县	民政部	1980年	1984年	[已撤销]	510822	广元市,青川县		梁平县[1981年]
-512830	平武县	四川省	绵阳地区	平武县	民政部	1982年	1984年	[已撤销]	510727	绵阳市,平武县		
-512831	北川县	四川省	绵阳地区	北川县	民政部	1982年	1984年	[已撤销]	510726	绵阳市,北川羌族自治县		
-512832	遂宁县	四川省	绵阳地区	遂宁县	民政部	1982年	1984年	[已撤销]	510900	遂宁市（地市）		
-512833	三台县	四川省	绵阳地区	三台县	民政部	1982年	1984年	[已撤销]	510722	绵阳市,三台县		
-512834	中江县	四川省	绵阳地区	中江县	民政部	1982年	1982年	[已撤销]	510623	德阳市,中江县		
-512835	蓬溪县	四川省	绵阳地区	蓬溪县	民政部	1982年	1984年	[已撤销]	510921	遂宁市,蓬溪县		
-512836	射洪县	四川省	绵阳地区	射洪县	民政部	1982年	1984年	[已撤销]	510922	遂宁市,射洪县[已撤销]		
-512837	盐亭县	四川省	绵阳地区	盐亭县	民政部	1982年	1984年	[已撤销]	510723	绵阳市,盐亭县		
-512900	南充地区	四川省	南充地区	-	民政部	1980年	1992年	[已撤销]	511300	南充市（地市）		
-512901	南充市	四川省	南充地区	南充市	民政部	1980年	1992年	[已撤销]	511300	南充市（地市）		
-512902	华蓥市	四川省	南充地区	华蓥市	民政部	1985年	1992年	[已撤销]	513601	广安地区,华蓥市[已撤销]		
-512903	阆中市	四川省	南充地区	阆中市	民政部	1991年	1992年	[已撤销]	519008	省直辖县级行政区划,阆中市[已撤销]		
-512921	南充县	四川省	南充地区	南充县	民政部	1980年	1992年	[已撤销]	511300	南充市（地市）		
-512922	南部县	四川省	南充地区	南部县	民政部	1980年	1992年	[已撤销]	511321	南充市,南部县		苍溪县[1981年]
-512923	岳池县	四川省	南充地区	岳池县	民政部	1980年	1992年	[已撤销]	513621	广安地区,岳池县[已撤销]		阆中县[1981年]
-512924	营山县	四川省	南充地区	营山县	民政部	1980年	1992年	[已撤销]	511322	南充市,营山县		仪陇县[1981年]
-512925	广安县	四川省	南充地区	广安县	民政部	1980年	1992年	[已撤销]	513622	广安地区,广安县[已撤销]		南部县[1981年]
-512926	蓬安县	四川省	南充地区	蓬安县	民政部	1980年	1992年	[已撤销]	511323	南充市,蓬安县		西充县[1981年]
-512927	仪陇县	四川省	南充地区	仪陇县	民政部	1980年	1992年	[已撤销]	511324	南充市,仪陇县		营山县[1981年]
-512928	武胜县	四川省	南充地区	武胜县	民政部	1980年	1992年	[已撤销]	513623	广安地区,武胜县[已撤销]		蓬安县[1981年]
-512929	西充县	四川省	南充地区	西充县	民政部	1980年	1992年	[已撤销]	511325	南充市,西充县		广安县[1981年]
-512930	阆中县	四川省	南充地区	阆中县	民政部	1980年	1990年	[已撤销]	511381	南充市,阆中市		岳池县[1981年]
-512931	苍溪县	四川省	南充地区	苍溪县	民政部	1980年	1984年	[已撤销]	510824	广元市,苍溪县		武胜县[1981年]
-512932	华云工农区	四川省	南充地区	华云工农区	民政部	1980年	1984年	[已撤销]	512902	南充地区,华蓥市[已撤销]		
-513000	达川地区	四川省	达川地区	-	民政部	1980年	1998年	[已撤销]	511700	达州市（地市）		达县地区[1992年]
-513001	达川市	四川省	达川地区	达川市	民政部	1980年	1998年	[已撤销]	511700	达州市（地市）		达县市[1992年]
-513002	万源市	四川省	达川地区	万源市	民政部	1993年	1998年	[已撤销]	511781	达州市,万源市		
-513003	达川地区	四川省	达川地区	万源市	非官方							
-513021	达县	四川省	达川地区	达县	民政部	1980年	1998年	[已撤销]	511721	达州市,达县[已撤销]		
-513022	宣汉县	四川省	达川地区	宣汉县	民政部	1980年	1998年	[已撤销]	511722	达州市,宣汉县		万源县[1981年]
-513023	开江县	四川省	达川地区	开江县	民政部	1980年	1998年	[已撤销]	511723	达州市,开江县		宣汉县[1981年]
-513024	万源县	四川省	达川地区	万源县	民政部	1980年	1992年	[已撤销]	513002	达川地区,万源市[已撤销]		开江县[1981年]
-513025	通江县	四川省	达川地区	通江县	民政部	1980年	1992年	[已撤销]	513721	巴中地区,通江县[已撤销]		邻水县[1981年]
-513026	南江县	四川省	达川地区	南江县	民政部	1980年	1992年	[已撤销]	513722	巴中地区,南江县[已撤销]		大竹县[1981年]
-513027	巴中县	四川省	达川地区	巴中县	民政部	1980年	1992年	[已撤销]	513701	巴中地区,巴中市[已撤销]		渠县[1981年]
-513028	平昌县	四川省	达川地区	平昌县	民政部	1980年	1992年	[已撤销]	513723	巴中地区,平昌县[已撤销]		南江县[1981年]
-513029	大竹县	四川省	达川地区	大竹县	民政部	1980年	1998年	[已撤销]	511724	达州市,大竹县		巴中县[1981年]
-513030	渠县	四川省	达川地区	渠县	民政部	1980年	1998年	[已撤销]	511725	达州市,渠县		平昌县[1981年]
-513031	邻水县	四川省	达川地区	邻水县	民政部	1980年	1992年	[已撤销]	513624	广安地区,邻水县[已撤销]		通江县[1981年]
-513032	白沙工农区	四川省	达川地区	白沙工农区	民政部	1980年	1992年	[已撤销]	513002	达川地区,万源市[已撤销]		
-513100	雅安地区	四川省	雅安地区	-	民政部	1980年	1999年	[已撤销]	511800	雅安市（地市）		
-513101	雅安市	四川省	雅安地区	雅安市	民政部	1983年	1999年	[已撤销]	511800	雅安市（地市）		
-513121	雅安县	四川省	雅安地区	雅安县	民政部	1980年	1982年	[已撤销]	513101	雅安地区,雅安市[已撤销]		
-513122	名山县	四川省	雅安地区	名山县	民政部	1980年	1999年	[已撤销]	511821	雅安市,名山县[已撤销]		芦山县[1981年]
-513123	荥经县	四川省	雅安地区	荥经县	民政部	1980年	1999年	[已撤销]	511822	雅安市,荥经县		名山县[1981年]
-513124	汉源县	四川省	雅安地区	汉源县	民政部	1980年	1999年	[已撤销]	511823	雅安市,汉源县		荥经县[1981年]
-513125	石棉县	四川省	雅安地区	石棉县	民政部	1980年	1999年	[已撤销]	511824	雅安市,石棉县		汉源县[1981年]
-513126	天全县	四川省	雅安地区	天全县	民政部	1980年	1999年	[已撤销]	511825	雅安市,天全县		石棉县[1981年]
-513127	芦山县	四川省	雅安地区	芦山县	民政部	1980年	1999年	[已撤销]	511826	雅安市,芦山县		天全县[1981年]
-513128	宝兴县	四川省	雅安地区	宝兴县	民政部	1980年	1999年	[已撤销]	511827	雅安市,宝兴县		
-513200	阿坝藏族羌族自治州	四川省	阿坝藏族羌族自治州	-	民政部	1980年	2024年					阿坝藏族自治州[1986年]
-513201	马尔康市	四川省	阿坝藏族羌族自治州	马尔康市	民政部	2015年	2024年					
-513221	汶川县	四川省	阿坝藏族羌族自治州	汶川县	民政部	1980年	2024年					马尔康县[1981年]
-513222	理县	四川省	阿坝藏族羌族自治州	理县	民政部	1980年	2024年					红原县[1981年]
-513223	茂县	四川省	阿坝藏族羌族自治州	茂县	民政部	1980年	2024年					阿坝县[1981年]；茂汶羌族自治县[1986年]
-513224	松潘县	四川省	阿坝藏族羌族自治州	松潘县	民政部	1980年	2024年					若尔盖县[1981年]
-513225	九寨沟县	四川省	阿坝藏族羌族自治州	九寨沟县	民政部	1980年	2024年					黑水县[1981年]；南坪县[1996年]
-513226	金川县	四川省	阿坝藏族羌族自治州	金川县	民政部	1980年	2024年					松潘县[1981年]
-513227	小金县	四川省	阿坝藏族羌族自治州	小金县	民政部	1980年	2024年					南坪县[1981年]
-513228	黑水县	四川省	阿坝藏族羌族自治州	黑水县	民政部	1980年	2024年					茂汶羌族自治县[1981年]
-513229	马尔康县	四川省	阿坝藏族羌族自治州	马尔康县	民政部	1980年	2014年	[已撤销]	513201	阿坝藏族羌族自治州,马尔康市		汶川县[1981年]
-513230	壤塘县	四川省	阿坝藏族羌族自治州	壤塘县	民政部	1980年	2024年					理县[1981年]
-513231	阿坝县	四川省	阿坝藏族羌族自治州	阿坝县	民政部	1980年	2024年					小金县[1981年]
-513232	若尔盖县	四川省	阿坝藏族羌族自治州	若尔盖县	民政部	1980年	2024年					金川县[1981年]
-513233	红原县	四川省	阿坝藏族羌族自治州	红原县	民政部	1980年	2024年					壤塘县[1981年]
-513300	甘孜藏族自治州	四川省	甘孜藏族自治州	-	民政部	1980年	2024年					
-513301	康定市	四川省	甘孜藏族自治州	康定市	民政部	2015年	2024年					
-513321	康定县	四川省	甘孜藏族自治州	康定县	民政部	1980年	2014年	[已撤销]	513301	甘孜藏族自治州,康定市		
-513322	泸定县	四川省	甘孜藏族自治州	泸定县	民政部	1980年	2024年					炉霍县[1981年]
-513323	丹巴县	四川省	甘孜藏族自治州	丹巴县	民政部	1980年	2024年					甘孜县[1981年]
-513324	九龙县	四川省	甘孜藏族自治州	九龙县	民政部	1980年	2024年					新龙县[1981年]
-513325	雅江县	四川省	甘孜藏族自治州	雅江县	民政部	1980年	2024年					白玉县[1981年]
-513326	道孚县	四川省	甘孜藏族自治州	道孚县	民政部	1980年	2024年					德格县[1981年]
-513327	炉霍县	四川省	甘孜藏族自治州	炉霍县	民政部	1980年	2024年					石渠县[1981年]
-513328	甘孜县	四川省	甘孜藏族自治州	甘孜县	民政部	1980年	2024年					色达县[1981年]
-513329	新龙县	四川省	甘孜藏族自治州	新龙县	民政部	1980年	2024年					泸定县[1981年]
-513330	德格县	四川省	甘孜藏族自治州	德格县	民政部	1980年	2024年					丹巴县[1981年]
-513331	白玉县	四川省	甘孜藏族自治州	白玉县	民政部	1980年	2024年					九龙县[1981年]
-513332	石渠县	四川省	甘孜藏族自治州	石渠县	民政部	1980年	2024年					雅江县[1981年]
-513333	色达县	四川省	甘孜藏族自治州	色达县	民政部	1980年	2024年					道孚县[1981年]
-513334	理塘县	四川省	甘孜藏族自治州	理塘县	民政部	1980年	2024年					
-513335	巴塘县	四川省	甘孜藏族自治州	巴塘县	民政部	1980年	2024年					乡城县[1981年]
-513336	乡城县	四川省	甘孜藏族自治州	乡城县	民政部	1980年	2024年					稻城县[1981年]
-513337	稻城县	四川省	甘孜藏族自治州	稻城县	民政部	1980年	2024年					巴塘县[1981年]
-513338	得荣县	四川省	甘孜藏族自治州	得荣县	民政部	1980年	2024年					
-513400	凉山彝族自治州	四川省	凉山彝族自治州	-	民政部	1980年	2024年					
-513401	西昌市	四川省	凉山彝族自治州	西昌市	民政部	1980年	2024年					
-513402	会理市	四川省	凉山彝族自治州	会理市	民政部	2021年	2024年					
-513421	西昌县	四川省	凉山彝族自治州	西昌县	民政部	1980年	1985年	[已撤销]	513401	凉山彝族自治州,西昌市		
-513422	木里藏族自治县	四川省	凉山彝族自治州	木里藏族自治县	民政部	1980年	2024年					昭觉县[1981年]
-513423	盐源县	四川省	凉山彝族自治州	盐源县	民政部	1980年	2024年					甘洛县[1981年]
-513424	德昌县	四川省	凉山彝族自治州	德昌县	民政部	1980年	2024年					峨边县：修订前（GB/T 2260-1980）；峨边县[1980年]
-513425	会理县	四川省	凉山彝族自治州	会理县	民政部	1980年	2020年	[已撤销]	513402	凉山彝族自治州,会理市		马边县：修订前（GB/T 2260-1980）；马边县[1980年]
-513426	会东县	四川省	凉山彝族自治州	会东县	民政部	1980年	2024年					雷波县[1981年]
-513427	宁南县	四川省	凉山彝族自治州	宁南县	民政部	1980年	2024年					
-513428	普格县	四川省	凉山彝族自治州	普格县	民政部	1980年	2024年					会东县[1981年]
-513429	布拖县	四川省	凉山彝族自治州	布拖县	民政部	1980年	2024年					会理县[1981年]
-513430	金阳县	四川省	凉山彝族自治州	金阳县	民政部	1980年	2024年					德昌县[1981年]
-513431	昭觉县	四川省	凉山彝族自治州	昭觉县	民政部	1980年	2024年					美姑县[1981年]
-513432	喜德县	四川省	凉山彝族自治州	喜德县	民政部	1980年	2024年					金阳县[1981年]
-513433	冕宁县	四川省	凉山彝族自治州	冕宁县	民政部	1980年	2024年					布拖县[1981年]
-513434	越西县	四川省	凉山彝族自治州	越西县	民政部	1980年	2024年					旧称：越西县(越嶲县)；普格县[1981年]
-513435	甘洛县	四川省	凉山彝族自治州	甘洛县	民政部	1980年	2024年					旧称：甘洛县(呷洛县)；喜德县[1981年]
-513436	美姑县	四川省	凉山彝族自治州	美姑县	民政部	1980年	2024年					越西县[1981年]
-513437	雷波县	四川省	凉山彝族自治州	雷波县	民政部	1980年	2024年					盐源县[1981年]
-513438	木里藏族自治县	四川省	凉山彝族自治州	木里藏族自治县	民政部	1980年	1981年	[已撤销]	513422	凉山彝族自治州,木里藏族自治县		
-513439	冕宁县	四川省	凉山彝族自治州	冕宁县	民政部	1980年	1981年	[已撤销]	513433	凉山彝族自治州,冕宁县		
-513500	黔江地区	四川省	黔江地区	-	民政部	1988年	1996年	[已撤销]	500239	重庆市,县,黔江土家族苗族自治县[已撤销]		
-513521	石柱土家族自治县	四川省	黔江地区	石柱土家族自治县	民政部	1988年	1996年	[已撤销]	500240	重庆市,县,石柱土家族自治县		旧称：石柱土家族自治县(石砫土家族自治县)；
-513522	秀山土家族苗族自治县	四川省	黔江地区	秀山土家族苗族自治县	民政部	1988年	1996年	[已撤销]	500241	重庆市,县,秀山土家族苗族自治县		
-513523	黔江土家族苗族自治县	四川省	黔江地区	黔江土家族苗族自治县	民政部	1988年	1996年	[已撤销]	500239	重庆市,县,黔江土家族苗族自治县[已撤销]		
-513524	酉阳土家族苗族自治县	四川省	黔江地区	酉阳土家族苗族自治县	民政部	1988年	1996年	[已撤销]	500242	重庆市,县,酉阳土家族苗族自治县		
-513525	彭水苗族土家族自治县	四川省	黔江地区	彭水苗族土家族自治县	民政部	1988年	1996年	[已撤销]	500243	重庆市,县,彭水苗族土家族自治县		
-513600	广安地区	四川省	广安地区	-	民政部	1993年	1997年	[已撤销]	511600	广安市（地市）		
-513601	华蓥市	四川省	广安地区	华蓥市	民政部	1993年	1997年	[已撤销]	511681	广安市,华蓥市		
-513621	岳池县	四川省	广安地区	岳池县	民政部	1993年	1997年	[已撤销]	511621	广安市,岳池县		
-513622	广安县	四川省	广安地区	广安县	民政部	1993年	1997年	[已撤销]	511602	广安市,广安区		
-513623	武胜县	四川省	广安地区	武胜县	民政部	1993年	1997年	[已撤销]	511622	广安市,武胜县		
-513624	邻水县	四川省	广安地区	邻水县	民政部	1993年	1997年	[已撤销]	511623	广安市,邻水县		
-513700	巴中地区	四川省	巴中地区	-	民政部	1993年	1999年	[已撤销]	511900	巴中市（地市）		
-513701	巴中市	四川省	巴中地区	巴中市	民政部	1993年	1999年	[已撤销]	511900	巴中市（地市）		
-513721	通江县	四川省	巴中地区	通江县	民政部	1993年	1999年	[已撤销]	511921	巴中市,通江县		
-513722	南江县	四川省	巴中地区	南江县	民政部	1993年	1999年	[已撤销]	511922	巴中市,南江县		
-513723	平昌县	四川省	巴中地区	平昌县	民政部	1993年	1999年	[已撤销]	511923	巴中市,平昌县		
-513800	眉山地区	四川省	眉山地区	-	民政部	1997年	1999年	[已撤销]	511400	眉山市（地市）		
-513821	眉山县	四川省	眉山地区	眉山县	民政部	1997年	1999年	[已撤销]	511402	眉山市,东坡区		
-513822	仁寿县	四川省	眉山地区	仁寿县	民政部	1997年	1999年	[已撤销]	511421	眉山市,仁寿县		
-513823	彭山县	四川省	眉山地区	彭山县	民政部	1997年	1999年	[已撤销]	511422	眉山市,彭山县[已撤销]		
-513824	洪雅县	四川省	眉山地区	洪雅县	民政部	1997年	1999年	[已撤销]	511423	眉山市,洪雅县		
-513825	丹棱县	四川省	眉山地区	丹棱县	民政部	1997年	1999年	[已撤销]	511424	眉山市,丹棱县		
-513826	青神县	四川省	眉山地区	青神县	民政部	1997年	1999年	[已撤销]	511425	眉山市,青神县		
-513900	资阳地区	四川省	资阳地区	-	民政部	1998年	1999年	[已撤销]	512000	资阳市（地市）		
-513901	资阳市	四川省	资阳地区	资阳市	民政部	1998年	1999年	[已撤销]	512000	资阳市（地市）		
-513902	简阳市	四川省	资阳地区	简阳市	民政部	1998年	1999年	[已撤销]	512081	资阳市,简阳市[已撤销]		
-513921	安岳县	四川省	资阳地区	安岳县	民政部	1998年	1999年	[已撤销]	512021	资阳市,安岳县		
-513922	乐至县	四川省	资阳地区	乐至县	民政部	1998年	1999年	[已撤销]	512022	资阳市,乐至县		
-517000	涪陵市	四川省	涪陵市	-	民政部	1995年	1996年	[已撤销]	500102	重庆市,市辖区,涪陵区		
-517002	枳城区	四川省	涪陵市	枳城区	民政部	1995年	1996年	[已撤销]	500102	重庆市,市辖区,涪陵区		
-517003	李渡区	四川省	涪陵市	李渡区	民政部	1995年	1996年	[已撤销]	500102	重庆市,市辖区,涪陵区		
-517021	垫江县	四川省	涪陵市	垫江县	民政部	1995年	1996年	[已撤销]	500231	重庆市,县,垫江县		
-517022	丰都县	四川省	涪陵市	丰都县	民政部	1995年	1996年	[已撤销]	500230	重庆市,县,丰都县		
-517023	武隆县	四川省	涪陵市	武隆县	民政部	1995年	1996年	[已撤销]	500232	重庆市,县,武隆县[已撤销]		
-517081	南川市	四川省	涪陵市	南川市	民政部	1995年	1996年	[已撤销]	500384	重庆市,县,南川市[已撤销]		
-519000	省直辖行政单位	四川省	省直辖行政单位	-	国标			[已撤销]				增设（GB/T 2260-1988），撤销（GB/T 2260-1991）
-519001	广汉市	四川省	省直辖县级行政区划	广汉市	民政部	1988年	1994年	[已撤销]	510681	德阳市,广汉市		
-519002	江油市	四川省	省直辖县级行政区划	江油市	民政部	1988年	1994年	[已撤销]	510781	绵阳市,江油市		
-519003	都江堰市	四川省	省直辖县级行政区划	都江堰市	民政部	1988年	1994年	[已撤销]	510181	成都市,都江堰市		
-519004	峨眉山市	四川省	省直辖县级行政区划	峨眉山市	民政部	1988年	1994年	[已撤销]	511181	乐山市,峨眉山市		
-519005	永川市	四川省	省直辖县级行政区划	永川市	民政部	1992年	1994年	[已撤销]	510281	重庆市,永川市[已撤销]		
-519006	合川市	四川省	省直辖县级行政区划	合川市	民政部	1992年	1994年	[已撤销]	510282	重庆市,合川市[已撤销]		
-519007	江津市	四川省	省直辖县级行政区划	江津市	民政部	1992年	1994年	[已撤销]	510283	重庆市,江津市[已撤销]		
-519008	阆中市	四川省	省直辖县级行政区划	阆中市	民政部	1993年	1994年	[已撤销]	511381	南充市,阆中市		
-519009	资阳市	四川省	省直辖县级行政区划	资阳市	民政部	1993年	1994年	[已撤销]	511081	内江市,资阳市[已撤销]		
-519010	彭州市	四川省	省直辖县级行政区划	彭州市	民政部	1993年	1994年	[已撤销]	510182	成都市,彭州市		
-519011	简阳市	四川省	省直辖县级行政区划	简阳市	民政部	1994年	1994年	[已撤销]	511082	内江市,简阳市[已撤销]		
-519012	邛崃市	四川省	省直辖县级行政区划	邛崃市	民政部	1994年	1994年	[已撤销]	510183	成都市,邛崃市		
-519013	崇州市	四川省	省直辖县级行政区划	崇州市	民政部	1994年	1994年	[已撤销]	510184	成都市,崇州市		
-520000	贵州省	贵州省	-	-	民政部	1980年	2024年					
-520100	贵阳市	贵州省	贵阳市	-	民政部	1980年	2024年					
-520101	市辖区	贵州省	贵阳市	市辖区	国标							增设（GB/T 2260-1984）
-520102	南明区	贵州省	贵阳市	南明区	民政部	1980年	2024年					
-520103	云岩区	贵州省	贵阳市	云岩区	民政部	1980年	2024年					
-520111	花溪区	贵州省	贵阳市	花溪区	民政部	1980年	2024年					
-520112	乌当区	贵州省	贵阳市	乌当区	民政部	1980年	2024年					
-520113	白云区	贵州省	贵阳市	白云区	民政部	1980年	2024年					
-520114	小河区	贵州省	贵阳市	小河区	民政部	2000年	2011年	[已撤销]	520111	贵阳市,花溪区		
-520115	观山湖区	贵州省	贵阳市	观山湖区	民政部	2012年	2024年					
-520121	开阳县	贵州省	贵阳市	开阳县	民政部	1995年	2024年					
-520122	息烽县	贵州省	贵阳市	息烽县	民政部	1995年	2024年					
-520123	修文县	贵州省	贵阳市	修文县	民政部	1995年	2024年					
-520181	清镇市	贵州省	贵阳市	清镇市	民政部	1995年	2024年					
-520200	六盘水市	贵州省	六盘水市	-	民政部	1980年	2024年					
-520201	钟山区	贵州省	六盘水市	钟山区	民政部	1980年	2024年					水城特区[1986年]
-520202	盘县特区	贵州省	六盘水市	盘县特区	民政部	1980年	1998年	[已撤销]	520222	六盘水市,盘县[已撤销]		
-520203	六枝特区	贵州省	六盘水市	六枝特区	民政部	1980年	2024年					
-520204	水城区	贵州省	六盘水市	水城区	民政部	2020年	2024年					
-520221	水城县	贵州省	六盘水市	水城县	民政部	1987年	2019年	[已撤销]	520204	六盘水市,水城区		
-520222	盘县	贵州省	六盘水市	盘县	民政部	1999年	2016年	[已撤销]	520281	六盘水市,盘州市		
-520281	盘州市	贵州省	六盘水市	盘州市	民政部	2017年	2024年					
-520300	遵义市	贵州省	遵义市	-	民政部	1997年	2024年					
-520301	市辖区	贵州省	遵义市	市辖区	国标							
-520302	红花岗区	贵州省	遵义市	红花岗区	民政部	1997年	2024年					
-520303	汇川区	贵州省	遵义市	汇川区	民政部	2003年	2024年					
-520304	播州区	贵州省	遵义市	播州区	民政部	2016年	2024年					
-520321	遵义县	贵州省	遵义市	遵义县	民政部	1997年	2015年	[已撤销]	520304	遵义市,播州区		
-520322	桐梓县	贵州省	遵义市	桐梓县	民政部	1997年	2024年					
-520323	绥阳县	贵州省	遵义市	绥阳县	民政部	1997年	2024年					
-520324	正安县	贵州省	遵义市	正安县	民政部	1997年	2024年					
-520325	道真仡佬族苗族自治县	贵州省	遵义市	道真仡佬族苗族自治县	民政部	1997年	2024年					
-520326	务川仡佬族苗族自治县	贵州省	遵义市	务川仡佬族苗族自治县	民政部	1997年	2024年					旧称：务川仡佬族苗族自治县(婺川仡佬族苗族自治县)；
-520327	凤冈县	贵州省	遵义市	凤冈县	民政部	1997年	2024年					
-520328	湄潭县	贵州省	遵义市	湄潭县	民政部	1997年	2024年					
-520329	余庆县	贵州省	遵义市	余庆县	民政部	1997年	2024年					
-520330	习水县	贵州省	遵义市	习水县	民政部	1997年	2024年					旧称：习水县(鳛水县)；
-520381	赤水市	贵州省	遵义市	赤水市	民政部	1997年	2024年					
-520382	仁怀市	贵州省	遵义市	仁怀市	民政部	1997年	2024年					
-520400	安顺市	贵州省	安顺市	-	民政部	2000年	2024年					
-520401	市辖区	贵州省	安顺市	市辖区	国标							
-520402	西秀区	贵州省	安顺市	西秀区	民政部	2000年	2024年					
-520403	平坝区	贵州省	安顺市	平坝区	民政部	2014年	2024年					
-520421	平坝县	贵州省	安顺市	平坝县	民政部	2000年	2013年	[已撤销]	520403	安顺市,平坝区		
-520422	普定县	贵州省	安顺市	普定县	民政部	2000年	2024年					
-520423	镇宁布依族苗族自治县	贵州省	安顺市	镇宁布依族苗族自治县	民政部	2000年	2024年					
-520424	关岭布依族苗族自治县	贵州省	安顺市	关岭布依族苗族自治县	民政部	2000年	2024年					
-520425	紫云苗族布依族自治县	贵州省	安顺市	紫云苗族布依族自治县	民政部	2000年	2024年					
-520500	毕节市	贵州省	毕节市	-	民政部	2011年	2024年					
-520501	市辖区	贵州省	毕节市	市辖区	国标							
-520502	七星关区	贵州省	毕节市	七星关区	民政部	2011年	2024年					
-520521	大方县	贵州省	毕节市	大方县	民政部	2011年	2024年					
-520522	黔西县	贵州省	毕节市	黔西县	民政部	2011年	2020年	[已撤销]	520581	毕节市,黔西市		
-520523	金沙县	贵州省	毕节市	金沙县	民政部	2011年	2024年					
-520524	织金县	贵州省	毕节市	织金县	民政部	2011年	2024年					
-520525	纳雍县	贵州省	毕节市	纳雍县	民政部	2011年	2024年					
-520526	威宁彝族回族苗族自治县	贵州省	毕节市	威宁彝族回族苗族自治县	民政部	2011年	2024年					
-520527	赫章县	贵州省	毕节市	赫章县	民政部	2011年	2024年					
-520581	黔西市	贵州省	毕节市	黔西市	民政部	2021年	2024年					
-520600	铜仁市	贵州省	铜仁市	-	民政部	2011年	2024年					
-520601	市辖区	贵州省	铜仁市	市辖区	国标							
-520602	碧江区	贵州省	铜仁市	碧江区	民政部	2011年	2024年					
-520603	万山区	贵州省	铜仁市	万山区	民政部	2011年	2024年					
-520621	江口县	贵州省	铜仁市	江口县	民政部	2011年	2024年					
-520622	玉屏侗族自治县	贵州省	铜仁市	玉屏侗族自治县	民政部	2011年	2024年					
-520623	石阡县	贵州省	铜仁市	石阡县	民政部	2011年	2024年					
-520624	思南县	贵州省	铜仁市	思南县	民政部	2011年	2024年					
-520625	印江土家族苗族自治县	贵州省	铜仁市	印江土家族苗族自治县	民政部	2011年	2024年					
-520626	德江县	贵州省	铜仁市	德江县	民政部	2011年	2024年					
-520627	沿河土家族自治县	贵州省	铜仁市	沿河土家族自治县	民政部	2011年	2024年					
-520628	松桃苗族自治县	贵州省	铜仁市	松桃苗族自治县	民政部	2011年	2024年					
-522100	遵义地区	贵州省	遵义地区	-	民政部	1980年	1996年	[已撤销]	520300	遵义市（地市）		
-522101	遵义市	贵州省	遵义地区	遵义市	民政部	1980年	1996年	[已撤销]	520300	遵义市（地市）		
-522102	赤水市	贵州省	遵义地区	赤水市	民政部	1990年	1996年	[已撤销]	520381	遵义市,赤水市		
-522103	仁怀市	贵州省	遵义地区	仁怀市	民政部	1995年	1996年	[已撤销]	520382	遵义市,仁怀市		
-522121	遵义县	贵州省	遵义地区	遵义县	民政部	1980年	1996年	[已撤销]	520321	遵义市,遵义县[已撤销]		
-522122	桐梓县	贵州省	遵义地区	桐梓县	民政部	1980年	1996年	[已撤销]	520322	遵义市,桐梓县		
-522123	绥阳县	贵州省	遵义地区	绥阳县	民政部	1980年	1996年	[已撤销]	520323	遵义市,绥阳县		
-522124	正安县	贵州省	遵义地区	正安县	民政部	1980年	1996年	[已撤销]	520324	遵义市,正安县		
-522125	道真仡佬族苗族自治县	贵州省	遵义地区	道真仡佬族苗族自治县	民政部	1980年	1996年	[已撤销]	520325	遵义市,道真仡佬族苗族自治县		道真县[1985年]
-522126	务川仡佬族苗族自治县	贵州省	遵义地区	务川仡佬族苗族自治县	民政部	1980年	1996年	[已撤销]	520326	遵义市,务川仡佬族苗族自治县		旧称：务川仡佬族苗族自治县(婺川仡佬族苗族自治县)；务川县[1985年]
-522127	凤冈县	贵州省	遵义地区	凤冈县	民政部	1980年	1996年	[已撤销]	520327	遵义市,凤冈县		
-522128	湄潭县	贵州省	遵义地区	湄潭县	民政部	1980年	1996年	[已撤销]	520328	遵义市,湄潭县		
-522129	余庆县	贵州省	遵义地区	余庆县	民政部	1980年	1996年	[已撤销]	520329	遵义市,余庆县		
-522130	仁怀县	贵州省	遵义地区	仁怀县	民政部	1980年	1994年	[已撤销]	522103	遵义地区,仁怀市[已撤销]		
-522131	赤水县	贵州省	遵义地区	赤水县	民政部	1980年	1989年	[已撤销]	522102	遵义地区,赤水市[已撤销]		
-522132	习水县	贵州省	遵义地区	习水县	民政部	1980年	1996年	[已撤销]	520330	遵义市,习水县		旧称：习水县(鳛水县)；
-522200	铜仁地区	贵州省	铜仁地区	-	民政部	1980年	2010年	[已撤销]	520600	铜仁市（地市）		
-522201	铜仁市	贵州省	铜仁地区	铜仁市	民政部	1987年	2010年	[已撤销]	520600	铜仁市（地市）		
-522221	铜仁县	贵州省	铜仁地区	铜仁县	民政部	1980年	1986年	[已撤销]	522201	铜仁地区,铜仁市[已撤销]		
-522222	江口县	贵州省	铜仁地区	江口县	民政部	1980年	2010年	[已撤销]	520621	铜仁市,江口县		
-522223	玉屏侗族自治县	贵州省	铜仁地区	玉屏侗族自治县	民政部	1980年	2010年	[已撤销]	520622	铜仁市,玉屏侗族自治县		玉屏县[1982年]
-522224	石阡县	贵州省	铜仁地区	石阡县	民政部	1980年	2010年	[已撤销]	520623	铜仁市,石阡县		
-522225	思南县	贵州省	铜仁地区	思南县	民政部	1980年	2010年	[已撤销]	520624	铜仁市,思南县		
-522226	印江土家族苗族自治县	贵州省	铜仁地区	印江土家族苗族自治县	民政部	1980年	2010年	[已撤销]	520625	铜仁市,印江土家族苗族自治县		印江县[1985年]
-522227	德江县	贵州省	铜仁地区	德江县	民政部	1980年	2010年	[已撤销]	520626	铜仁市,德江县		
-522228	沿河土家族自治县	贵州省	铜仁地区	沿河土家族自治县	民政部	1980年	2010年	[已撤销]	520627	铜仁市,沿河土家族自治县		沿河县[1985年]
-522229	松桃苗族自治县	贵州省	铜仁地区	松桃苗族自治县	民政部	1980年	2010年	[已撤销]	520628	铜仁市,松桃苗族自治县		
-522230	万山特区	贵州省	铜仁地区	万山特区	民政部	1980年	2010年	[已撤销]	520603	铜仁市,万山区		万山县：修订前（GB/T 2260-1980）
-522300	黔西南布依族苗族自治州	贵州省	黔西南布依族苗族自治州	-	民政部	1980年	2024年					兴义地区[1980年]
-522301	兴义市	贵州省	黔西南布依族苗族自治州	兴义市	民政部	1987年	2024年					
-522302	兴仁市	贵州省	黔西南布依族苗族自治州	兴仁市	民政部	2018年	2024年					
-522321	兴义县	贵州省	黔西南布依族苗族自治州	兴义县	民政部	1980年	1986年	[已撤销]	522301	黔西南布依族苗族自治州,兴义市		
-522322	兴仁县	贵州省	黔西南布依族苗族自治州	兴仁县	民政部	1980年	2017年	[已撤销]	522302	黔西南布依族苗族自治州,兴仁市		
-522323	普安县	贵州省	黔西南布依族苗族自治州	普安县	民政部	1980年	2024年					
-522324	晴隆县	贵州省	黔西南布依族苗族自治州	晴隆县	民政部	1980年	2024年					
-522325	贞丰县	贵州省	黔西南布依族苗族自治州	贞丰县	民政部	1980年	2024年					贞丰布依族苗族自治县[1980年]
-522326	望谟县	贵州省	黔西南布依族苗族自治州	望谟县	民政部	1980年	2024年					望谟布依族苗族自治县[1980年]
-522327	册亨县	贵州省	黔西南布依族苗族自治州	册亨县	民政部	1980年	2024年					册亨布依族自治县[1980年]
-522328	安龙县	贵州省	黔西南布依族苗族自治州	安龙县	民政部	1980年	2024年					安龙布依族苗族自治县[1980年]
-522400	毕节地区	贵州省	毕节地区	-	民政部	1980年	2010年	[已撤销]	520500	毕节市（地市）		
-522401	毕节市	贵州省	毕节地区	毕节市	民政部	1993年	2010年	[已撤销]	520500	毕节市（地市）		
-522421	毕节县	贵州省	毕节地区	毕节县	民政部	1980年	1992年	[已撤销]	522401	毕节地区,毕节市[已撤销]		
-522422	大方县	贵州省	毕节地区	大方县	民政部	1980年	2010年	[已撤销]	520521	毕节市,大方县		
-522423	黔西县	贵州省	毕节地区	黔西县	民政部	1980年	2010年	[已撤销]	520522	毕节市,黔西县[已撤销]		
-522424	金沙县	贵州省	毕节地区	金沙县	民政部	1980年	2010年	[已撤销]	520523	毕节市,金沙县		
-522425	织金县	贵州省	毕节地区	织金县	民政部	1980年	2010年	[已撤销]	520524	毕节市,织金县		
-522426	纳雍县	贵州省	毕节地区	纳雍县	民政部	1980年	2010年	[已撤销]	520525	毕节市,纳雍县		
-522427	威宁彝族回族苗族自治县	贵州省	毕节地区	威宁彝族回族苗族自治县	民政部	1980年	2010年	[已撤销]	520526	毕节市,威宁彝族回族苗族自治县		
-522428	赫章县	贵州省	毕节地区	赫章县	民政部	1980年	2010年	[已撤销]	520527	毕节市,赫章县		
-522500	安顺地区	贵州省	安顺地区	-	民政部	1980年	1999年	[已撤销]	520400	安顺市（地市）		
-522501	安顺市	贵州省	安顺地区	安顺市	民政部	1980年	1999年	[已撤销]	520400	安顺市（地市）		
-522502	清镇市	贵州省	安顺地区	清镇市	民政部	1992年	1994年	[已撤销]	520181	贵阳市,清镇市		
-522521	安顺县	贵州省	安顺地区	安顺县	民政部	1980年	1989年	[已撤销]	522501	安顺地区,安顺市[已撤销]		
-522522	开阳县	贵州省	安顺地区	开阳县	民政部	1980年	1994年	[已撤销]	520121	贵阳市,开阳县		
-522523	息烽县	贵州省	安顺地区	息烽县	民政部	1980年	1994年	[已撤销]	520122	贵阳市,息烽县		
-522524	修文县	贵州省	安顺地区	修文县	民政部	1980年	1994年	[已撤销]	520123	贵阳市,修文县		
-522525	清镇县	贵州省	安顺地区	清镇县	民政部	1980年	1991年	[已撤销]	522502	安顺地区,清镇市[已撤销]		
-522526	平坝县	贵州省	安顺地区	平坝县	民政部	1980年	1999年	[已撤销]	520421	安顺市,平坝县[已撤销]		
-522527	普定县	贵州省	安顺地区	普定县	民政部	1980年	1999年	[已撤销]	520422	安顺市,普定县		
-522528	关岭布依族苗族自治县	贵州省	安顺地区	关岭布依族苗族自治县	民政部	1980年	1999年	[已撤销]	520424	安顺市,关岭布依族苗族自治县		关岭县[1980年]
-522529	镇宁布依族苗族自治县	贵州省	安顺地区	镇宁布依族苗族自治县	民政部	1980年	1999年	[已撤销]	520423	安顺市,镇宁布依族苗族自治县		
-522530	紫云苗族布依族自治县	贵州省	安顺地区	紫云苗族布依族自治县	民政部	1980年	1999年	[已撤销]	520425	安顺市,紫云苗族布依族自治县		
-522600	黔东南苗族侗族自治州	贵州省	黔东南苗族侗族自治州	-	民政部	1980年	2024年					
-522601	凯里市	贵州省	黔东南苗族侗族自治州	凯里市	民政部	1983年	2024年					
-522621	凯里县	贵州省	黔东南苗族侗族自治州	凯里县	民政部	1980年	1982年	[已撤销]	522601	黔东南苗族侗族自治州,凯里市		
-522622	黄平县	贵州省	黔东南苗族侗族自治州	黄平县	民政部	1980年	2024年					
-522623	施秉县	贵州省	黔东南苗族侗族自治州	施秉县	民政部	1980年	2024年					
-522624	三穗县	贵州省	黔东南苗族侗族自治州	三穗县	民政部	1980年	2024年					
-522625	镇远县	贵州省	黔东南苗族侗族自治州	镇远县	民政部	1980年	2024年					
-522626	岑巩县	贵州省	黔东南苗族侗族自治州	岑巩县	民政部	1980年	2024年					
-522627	天柱县	贵州省	黔东南苗族侗族自治州	天柱县	民政部	1980年	2024年					
-522628	锦屏县	贵州省	黔东南苗族侗族自治州	锦屏县	民政部	1980年	2024年					
-522629	剑河县	贵州省	黔东南苗族侗族自治州	剑河县	民政部	1980年	2024年					
-522630	台江县	贵州省	黔东南苗族侗族自治州	台江县	民政部	1980年	2024年					
-522631	黎平县	贵州省	黔东南苗族侗族自治州	黎平县	民政部	1980年	2024年					
-522632	榕江县	贵州省	黔东南苗族侗族自治州	榕江县	民政部	1980年	2024年					
-522633	从江县	贵州省	黔东南苗族侗族自治州	从江县	民政部	1980年	2024年					
-522634	雷山县	贵州省	黔东南苗族侗族自治州	雷山县	民政部	1980年	2024年					
-522635	麻江县	贵州省	黔东南苗族侗族自治州	麻江县	民政部	1980年	2024年					
-522636	丹寨县	贵州省	黔东南苗族侗族自治州	丹寨县	民政部	1980年	2024年					
-522700	黔南布依族苗族自治州	贵州省	黔南布依族苗族自治州	-	民政部	1980年	2024年					
-522701	都匀市	贵州省	黔南布依族苗族自治州	都匀市	民政部	1980年	2024年					
-522702	福泉市	贵州省	黔南布依族苗族自治州	福泉市	民政部	1996年	2024年					
-522721	都匀县	贵州省	黔南布依族苗族自治州	都匀县	民政部	1980年	1982年	[已撤销]	522701	黔南布依族苗族自治州,都匀市		
-522722	荔波县	贵州省	黔南布依族苗族自治州	荔波县	民政部	1980年	2024年					
-522723	贵定县	贵州省	黔南布依族苗族自治州	贵定县	民政部	1980年	2024年					
-522724	福泉县	贵州省	黔南布依族苗族自治州	福泉县	民政部	1980年	1995年	[已撤销]	522702	黔南布依族苗族自治州,福泉市		
-522725	瓮安县	贵州省	黔南布依族苗族自治州	瓮安县	民政部	1980年	2024年					
-522726	独山县	贵州省	黔南布依族苗族自治州	独山县	民政部	1980年	2024年					
-522727	平塘县	贵州省	黔南布依族苗族自治州	平塘县	民政部	1980年	2024年					
-522728	罗甸县	贵州省	黔南布依族苗族自治州	罗甸县	民政部	1980年	2024年					
-522729	长顺县	贵州省	黔南布依族苗族自治州	长顺县	民政部	1980年	2024年					
-522730	龙里县	贵州省	黔南布依族苗族自治州	龙里县	民政部	1980年	2024年					
-522731	惠水县	贵州省	黔南布依族苗族自治州	惠水县	民政部	1980年	2024年					
-522732	三都水族自治县	贵州省	黔南布依族苗族自治州	三都水族自治县	民政部	1980年	2024年					
-530000	云南省	云南省	-	-	民政部	1980年	2024年					
-530100	昆明市	云南省	昆明市	-	民政部	1980年	2024年					
-530101	市辖区	云南省	昆明市	市辖区	国标							增设（GB/T 2260-1984）
-530102	五华区	云南省	昆明市	五华区	民政部	1980年	2024年					
-530103	盘龙区	云南省	昆明市	盘龙区	民政部	1980年	2024年					
-530111	官渡区	云南省	昆明市	官渡区	民政部	1980年	2024年					
-530112	西山区	云南省	昆明市	西山区	民政部	1980年	2024年					
-530113	东川区	云南省	昆明市	东川区	民政部	1998年	2024年					
-530114	呈贡区	云南省	昆明市	呈贡区	民政部	2011年	2024年					
-530115	晋宁区	云南省	昆明市	晋宁区	民政部	2016年	2024年					
-530120	昆明市区	云南省	昆明市	昆明市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-530121	呈贡县	云南省	昆明市	呈贡县	民政部	1980年	2010年	[已撤销]	530114	昆明市,呈贡区		安宁县[1981年]
-530122	晋宁县	云南省	昆明市	晋宁县	民政部	1980年	2015年	[已撤销]	530115	昆明市,晋宁区		呈贡县[1981年]
-530123	安宁县	云南省	昆明市	安宁县	民政部	1980年	1994年	[已撤销]	530181	昆明市,安宁市		富民县[1981年]
-530124	富民县	云南省	昆明市	富民县	民政部	1980年	2024年					晋宁县[1981年]
-530125	宜良县	云南省	昆明市	宜良县	民政部	1983年	2024年					
-530126	石林彝族自治县	云南省	昆明市	石林彝族自治县	民政部	1983年	2024年					路南彝族自治县[1997年]
-530127	嵩明县	云南省	昆明市	嵩明县	民政部	1983年	2024年					
-530128	禄劝彝族苗族自治县	云南省	昆明市	禄劝彝族苗族自治县	民政部	1983年	2024年					禄劝县[1984年]
-530129	寻甸回族彝族自治县	云南省	昆明市	寻甸回族彝族自治县	民政部	1998年	2024年					
-530181	安宁市	云南省	昆明市	安宁市	民政部	1995年	2024年					
-530200	东川市	云南省	东川市	-	民政部	1980年	1997年	[已撤销]	530113	昆明市,东川区		
-530201	市辖区	云南省	东川市	市辖区	国标							增设（GB/T 2260-1984）
-530300	曲靖市	云南省	曲靖市	-	民政部	1997年	2024年					
-530301	市辖区	云南省	曲靖市	市辖区	国标							
-530302	麒麟区	云南省	曲靖市	麒麟区	民政部	1997年	2024年					
-530303	沾益区	云南省	曲靖市	沾益区	民政部	2016年	2024年					
-530304	马龙区	云南省	曲靖市	马龙区	民政部	2018年	2024年					
-530321	马龙县	云南省	曲靖市	马龙县	民政部	1997年	2017年	[已撤销]	530304	曲靖市,马龙区		
-530322	陆良县	云南省	曲靖市	陆良县	民政部	1997年	2024年					
-530323	师宗县	云南省	曲靖市	师宗县	民政部	1997年	2024年					
-530324	罗平县	云南省	曲靖市	罗平县	民政部	1997年	2024年					
-530325	富源县	云南省	曲靖市	富源县	民政部	1997年	2024年					
-530326	会泽县	云南省	曲靖市	会泽县	民政部	1997年	2024年					
-530327	寻甸回族彝族自治县	云南省	曲靖市	寻甸回族彝族自治县	民政部	1997年	1997年	[已撤销]	530129	昆明市,寻甸回族彝族自治县		
-530328	沾益县	云南省	曲靖市	沾益县	民政部	1997年	2015年	[已撤销]	530303	曲靖市,沾益区		
-530381	宣威市	云南省	曲靖市	宣威市	民政部	1997年	2024年					
-530400	玉溪市	云南省	玉溪市	-	民政部	1997年	2024年					
-530401	市辖区	云南省	玉溪市	市辖区	国标							
-530402	红塔区	云南省	玉溪市	红塔区	民政部	1997年	2024年					
-530403	江川区	云南省	玉溪市	江川区	民政部	2015年	2024年					
-530421	江川县	云南省	玉溪市	江川县	民政部	1997年	2014年	[已撤销]	530403	玉溪市,江川区		
-530422	澄江县	云南省	玉溪市	澄江县	民政部	1997年	2018年	[已撤销]	530481	玉溪市,澄江市		
-530423	通海县	云南省	玉溪市	通海县	民政部	1997年	2024年					
-530424	华宁县	云南省	玉溪市	华宁县	民政部	1997年	2024年					
-530425	易门县	云南省	玉溪市	易门县	民政部	1997年	2024年					
-530426	峨山彝族自治县	云南省	玉溪市	峨山彝族自治县	民政部	1997年	2024年					
-530427	新平彝族傣族自治县	云南省	玉溪市	新平彝族傣族自治县	民政部	1997年	2024年					
-530428	元江哈尼族彝族傣族自治县	云南省	玉溪市	元江哈尼族彝族傣族自治县	民政部	1997年	2024年					
-530481	澄江市	云南省	玉溪市	澄江市	民政部	2019年	2024年					
-530500	保山市	云南省	保山市	-	民政部	2000年	2024年					
-530501	市辖区	云南省	保山市	市辖区	国标							
-530502	隆阳区	云南省	保山市	隆阳区	民政部	2000年	2024年					
-530521	施甸县	云南省	保山市	施甸县	民政部	2000年	2024年					
-530522	腾冲县	云南省	保山市	腾冲县	民政部	2000年	2014年	[已撤销]	530581	保山市,腾冲市		
-530523	龙陵县	云南省	保山市	龙陵县	民政部	2000年	2024年					
-530524	昌宁县	云南省	保山市	昌宁县	民政部	2000年	2024年					
-530581	腾冲市	云南省	保山市	腾冲市	民政部	2015年	2024年					
-530600	昭通市	云南省	昭通市	-	民政部	2001年	2024年					
-530601	市辖区	云南省	昭通市	市辖区	国标							
-530602	昭阳区	云南省	昭通市	昭阳区	民政部	2001年	2024年					
-530621	鲁甸县	云南省	昭通市	鲁甸县	民政部	2001年	2024年					
-530622	巧家县	云南省	昭通市	巧家县	民政部	2001年	2024年					
-530623	盐津县	云南省	昭通市	盐津县	民政部	2001年	2024年					
-530624	大关县	云南省	昭通市	大关县	民政部	2001年	2024年					
-530625	永善县	云南省	昭通市	永善县	民政部	2001年	2024年					
-530626	绥江县	云南省	昭通市	绥江县	民政部	2001年	2024年					
-530627	镇雄县	云南省	昭通市	镇雄县	民政部	2001年	2024年					
-530628	彝良县	云南省	昭通市	彝良县	民政部	2001年	2024年					
-530629	威信县	云南省	昭通市	威信县	民政部	2001年	2024年					
-530630	水富县	云南省	昭通市	水富县	民政部	2001年	2017年	[已撤销]	530681	昭通市,水富市		
-530681	水富市	云南省	昭通市	水富市	民政部	2018年	2024年					
-530700	丽江市	云南省	丽江市	-	民政部	2002年	2024年					
-530701	市辖区	云南省	丽江市	市辖区	国标							
-530702	古城区	云南省	丽江市	古城区	民政部	2002年	2024年					
-530721	玉龙纳西族自治县	云南省	丽江市	玉龙纳西族自治县	民政部	2002年	2024年					
-530722	永胜县	云南省	丽江市	永胜县	民政部	2002年	2024年					
-530723	华坪县	云南省	丽江市	华坪县	民政部	2002年	2024年					
-530724	宁蒗彝族自治县	云南省	丽江市	宁蒗彝族自治县	民政部	2002年	2024年					
-530800	普洱市	云南省	普洱市	-	民政部	2003年	2024年					思茅市[2006年]
-530801	市辖区	云南省	普洱市	市辖区	国标							
-530802	思茅区	云南省	普洱市	思茅区	民政部	2003年	2024年					翠云区[2006年]
-530821	宁洱哈尼族彝族自治县	云南省	普洱市	宁洱哈尼族彝族自治县	民政部	2003年	2024年					普洱哈尼族彝族自治县[2006年]
-530822	墨江哈尼族自治县	云南省	普洱市	墨江哈尼族自治县	民政部	2003年	2024年					
-530823	景东彝族自治县	云南省	普洱市	景东彝族自治县	民政部	2003年	2024年					
-530824	景谷傣族彝族自治县	云南省	普洱市	景谷傣族彝族自治县	民政部	2003年	2024年					
-530825	镇沅彝族哈尼族拉祜族自治县	云南省	普洱市	镇沅彝族哈尼族拉祜族自治县	民政部	2003年	2024年					
-530826	江城哈尼族彝族自治县	云南省	普洱市	江城哈尼族彝族自治县	民政部	2003年	2024年					
-530827	孟连傣族拉祜族佤族自治县	云南省	普洱市	孟连傣族拉祜族佤族自治县	民政部	2003年	2024年					
-530828	澜沧拉祜族自治县	云南省	普洱市	澜沧拉祜族自治县	民政部	2003年	2024年					
-530829	西盟佤族自治县	云南省	普洱市	西盟佤族自治县	民政部	2003年	2024年					
-530900	临沧市	云南省	临沧市	-	民政部	2003年	2024年					
-530901	市辖区	云南省	临沧市	市辖区	国标							
-530902	临翔区	云南省	临沧市	临翔区	民政部	2003年	2024年					
-530921	凤庆县	云南省	临沧市	凤庆县	民政部	2003年	2024年					
-530922	云县	云南省	临沧市	云县	民政部	2003年	2024年					
-530923	永德县	云南省	临沧市	永德县	民政部	2003年	2024年					
-530924	镇康县	云南省	临沧市	镇康县	民政部	2003年	2024年					
-530925	双江拉祜族佤族布朗族傣族自治县	云南省	临沧市	双江拉祜族佤族布朗族傣族自治县	民政部	2003年	2024年					
-530926	耿马傣族佤族自治县	云南省	临沧市	耿马傣族佤族自治县	民政部	2003年	2024年					
-530927	沧源佤族自治县	云南省	临沧市	沧源佤族自治县	民政部	2003年	2024年					
-530928	临沧市	云南省	临沧市	果敢县*	非官方							
-532100	昭通地区	云南省	昭通地区	-	民政部	1980年	2000年	[已撤销]	530600	昭通市（地市）		
-532101	昭通市	云南省	昭通地区	昭通市	民政部	1981年	2000年	[已撤销]	530600	昭通市（地市）		
-532121	昭通县	云南省	昭通地区	昭通县	民政部	1980年	1982年	[已撤销]	532101	昭通地区,昭通市[已撤销]		
-532122	鲁甸县	云南省	昭通地区	鲁甸县	民政部	1980年	2000年	[已撤销]	530621	昭通市,鲁甸县		
-532123	巧家县	云南省	昭通地区	巧家县	民政部	1980年	2000年	[已撤销]	530622	昭通市,巧家县		
-532124	盐津县	云南省	昭通地区	盐津县	民政部	1980年	2000年	[已撤销]	530623	昭通市,盐津县		
-532125	大关县	云南省	昭通地区	大关县	民政部	1980年	2000年	[已撤销]	530624	昭通市,大关县		
-532126	永善县	云南省	昭通地区	永善县	民政部	1980年	2000年	[已撤销]	530625	昭通市,永善县		
-532127	绥江县	云南省	昭通地区	绥江县	民政部	1980年	2000年	[已撤销]	530626	昭通市,绥江县		
-532128	镇雄县	云南省	昭通地区	镇雄县	民政部	1980年	2000年	[已撤销]	530627	昭通市,镇雄县		
-532129	彝良县	云南省	昭通地区	彝良县	民政部	1980年	2000年	[已撤销]	530628	昭通市,彝良县		
-532130	威信县	云南省	昭通地区	威信县	民政部	1980年	2000年	[已撤销]	530629	昭通市,威信县		
-532131	水富县	云南省	昭通地区	水富县	民政部	1981年	2000年	[已撤销]	530630	昭通市,水富县[已撤销]		
-532200	曲靖地区	云南省	曲靖地区	-	民政部	1980年	1996年	[已撤销]	530300	曲靖市（地市）		
-532201	曲靖市	云南省	曲靖地区	曲靖市	民政部	1983年	1996年	[已撤销]	530300	曲靖市（地市）		
-532202	宣威市	云南省	曲靖地区	宣威市	民政部	1994年	1996年	[已撤销]	530381	曲靖市,宣威市		
-532221	曲靖县	云南省	曲靖地区	曲靖县	民政部	1980年	1982年	[已撤销]	532201	曲靖地区,曲靖市[已撤销]		
-532222	沾益县	云南省	曲靖地区	沾益县	民政部	1980年	1982年	[已撤销]	532201	曲靖地区,曲靖市[已撤销]		
-532223	马龙县	云南省	曲靖地区	马龙县	民政部	1980年	1996年	[已撤销]	530321	曲靖市,马龙县[已撤销]		
-532224	宣威县	云南省	曲靖地区	宣威县	民政部	1980年	1993年	[已撤销]	532202	曲靖地区,宣威市[已撤销]		
-532225	富源县	云南省	曲靖地区	富源县	民政部	1980年	1996年	[已撤销]	530325	曲靖市,富源县		
-532226	罗平县	云南省	曲靖地区	罗平县	民政部	1980年	1996年	[已撤销]	530324	曲靖市,罗平县		
-532227	师宗县	云南省	曲靖地区	师宗县	民政部	1980年	1996年	[已撤销]	530323	曲靖市,师宗县		
-532228	陆良县	云南省	曲靖地区	陆良县	民政部	1980年	1996年	[已撤销]	530322	曲靖市,陆良县		
-532229	宜良县	云南省	曲靖地区	宜良县	民政部	1980年	1982年	[已撤销]	530125	昆明市,宜良县		
-532230	路南彝族自治县	云南省	曲靖地区	路南彝族自治县	民政部	1980年	1982年	[已撤销]	530126	昆明市,石林彝族自治县		
-532231	寻甸回族彝族自治县	云南省	曲靖地区	寻甸回族彝族自治县	民政部	1980年	1996年	[已撤销]	530327	曲靖市,寻甸回族彝族自治县[已撤销]		
-532232	嵩明县	云南省	曲靖地区	嵩明县	民政部	1980年	1982年	[已撤销]	530127	昆明市,嵩明县		
-532233	会泽县	云南省	曲靖地区	会泽县	民政部	1980年	1996年	[已撤销]	530326	曲靖市,会泽县		
-532300	楚雄彝族自治州	云南省	楚雄彝族自治州	-	民政部	1980年	2024年					
-532301	楚雄市	云南省	楚雄彝族自治州	楚雄市	民政部	1983年	2024年					
-532302	禄丰市	云南省	楚雄彝族自治州	禄丰市	民政部	2021年	2024年					
-532321	楚雄县	云南省	楚雄彝族自治州	楚雄县	民政部	1980年	1982年	[已撤销]	532301	楚雄彝族自治州,楚雄市		
-532322	双柏县	云南省	楚雄彝族自治州	双柏县	民政部	1980年	2024年					
-532323	牟定县	云南省	楚雄彝族自治州	牟定县	民政部	1980年	2024年					
-532324	南华县	云南省	楚雄彝族自治州	南华县	民政部	1980年	2024年					
-532325	姚安县	云南省	楚雄彝族自治州	姚安县	民政部	1980年	2024年					
-532326	大姚县	云南省	楚雄彝族自治州	大姚县	民政部	1980年	2024年					
-532327	永仁县	云南省	楚雄彝族自治州	永仁县	民政部	1980年	2024年					
-532328	元谋县	云南省	楚雄彝族自治州	元谋县	民政部	1980年	2024年					
-532329	武定县	云南省	楚雄彝族自治州	武定县	民政部	1980年	2024年					
-532330	禄劝县	云南省	楚雄彝族自治州	禄劝县	民政部	1980年	1982年	[已撤销]	530128	昆明市,禄劝彝族苗族自治县		
-532331	禄丰县	云南省	楚雄彝族自治州	禄丰县	民政部	1980年	2020年	[已撤销]	532302	楚雄彝族自治州,禄丰市		
-532400	玉溪地区	云南省	玉溪地区	-	民政部	1980年	1996年	[已撤销]	530400	玉溪市（地市）		
-532401	玉溪市	云南省	玉溪地区	玉溪市	民政部	1983年	1996年	[已撤销]	530400	玉溪市（地市）		
-532421	玉溪县	云南省	玉溪地区	玉溪县	民政部	1980年	1982年	[已撤销]	532401	玉溪地区,玉溪市[已撤销]		
-532422	江川县	云南省	玉溪地区	江川县	民政部	1980年	1996年	[已撤销]	530421	玉溪市,江川县[已撤销]		
-532423	澄江县	云南省	玉溪地区	澄江县	民政部	1980年	1996年	[已撤销]	530422	玉溪市,澄江县[已撤销]		
-532424	通海县	云南省	玉溪地区	通海县	民政部	1980年	1996年	[已撤销]	530423	玉溪市,通海县		
-532425	华宁县	云南省	玉溪地区	华宁县	民政部	1980年	1996年	[已撤销]	530424	玉溪市,华宁县		
-532426	易门县	云南省	玉溪地区	易门县	民政部	1980年	1996年	[已撤销]	530425	玉溪市,易门县		
-532427	峨山彝族自治县	云南省	玉溪地区	峨山彝族自治县	民政部	1980年	1996年	[已撤销]	530426	玉溪市,峨山彝族自治县		
-532428	新平彝族傣族自治县	云南省	玉溪地区	新平彝族傣族自治县	民政部	1980年	1996年	[已撤销]	530427	玉溪市,新平彝族傣族自治县		
-532429	元江哈尼族彝族傣族自治县	云南省	玉溪地区	元江哈尼族彝族傣族自治县	民政部	1980年	1996年	[已撤销]	530428	玉溪市,元江哈尼族彝族傣族自治县		
-532500	红河哈尼族彝族自治州	云南省	红河哈尼族彝族自治州	-	民政部	1980年	2024年					
-532501	个旧市	云南省	红河哈尼族彝族自治州	个旧市	民政部	1980年	2024年					
-532502	开远市	云南省	红河哈尼族彝族自治州	开远市	民政部	1981年	2024年					
-532503	蒙自市	云南省	红河哈尼族彝族自治州	蒙自市	民政部	2010年	2024年					
-532504	弥勒市	云南省	红河哈尼族彝族自治州	弥勒市	民政部	2013年	2024年					
-532521	开远县	云南省	红河哈尼族彝族自治州	开远县	民政部	1980年	1980年	[已撤销]	532502	红河哈尼族彝族自治州,开远市		
-532522	蒙自县	云南省	红河哈尼族彝族自治州	蒙自县	民政部	1980年	2009年	[已撤销]	532503	红河哈尼族彝族自治州,蒙自市		
-532523	屏边苗族自治县	云南省	红河哈尼族彝族自治州	屏边苗族自治县	民政部	1980年	2024年					
-532524	建水县	云南省	红河哈尼族彝族自治州	建水县	民政部	1980年	2024年					
-532525	石屏县	云南省	红河哈尼族彝族自治州	石屏县	民政部	1980年	2024年					
-532526	弥勒县	云南省	红河哈尼族彝族自治州	弥勒县	民政部	1980年	2012年	[已撤销]	532504	红河哈尼族彝族自治州,弥勒市		
-532527	泸西县	云南省	红河哈尼族彝族自治州	泸西县	民政部	1980年	2024年					
-532528	元阳县	云南省	红河哈尼族彝族自治州	元阳县	民政部	1980年	2024年					
-532529	红河县	云南省	红河哈尼族彝族自治州	红河县	民政部	1980年	2024年					
-532530	金平苗族瑶族傣族自治县	云南省	红河哈尼族彝族自治州	金平苗族瑶族傣族自治县	民政部	1980年	2024年					金平县[1984年]
-532531	绿春县	云南省	红河哈尼族彝族自治州	绿春县	民政部	1980年	2024年					
-532532	河口瑶族自治县	云南省	红河哈尼族彝族自治州	河口瑶族自治县	民政部	1980年	2024年					
-532600	文山壮族苗族自治州	云南省	文山壮族苗族自治州	-	民政部	1980年	2024年					
-532601	文山市	云南省	文山壮族苗族自治州	文山市	民政部	2010年	2024年					
-532621	文山县	云南省	文山壮族苗族自治州	文山县	民政部	1980年	2009年	[已撤销]	532601	文山壮族苗族自治州,文山市		
-532622	砚山县	云南省	文山壮族苗族自治州	砚山县	民政部	1980年	2024年					
-532623	西畴县	云南省	文山壮族苗族自治州	西畴县	民政部	1980年	2024年					
-532624	麻栗坡县	云南省	文山壮族苗族自治州	麻栗坡县	民政部	1980年	2024年					
-532625	马关县	云南省	文山壮族苗族自治州	马关县	民政部	1980年	2024年					
-532626	丘北县	云南省	文山壮族苗族自治州	丘北县	民政部	1980年	2024年					旧称：丘北县(邱北县)；
-532627	广南县	云南省	文山壮族苗族自治州	广南县	民政部	1980年	2024年					
-532628	富宁县	云南省	文山壮族苗族自治州	富宁县	民政部	1980年	2024年					
-532700	思茅地区	云南省	思茅地区	-	民政部	1980年	2002年	[已撤销]	530800	普洱市（地市）		
-532701	思茅市	云南省	思茅地区	思茅市	民政部	1993年	2002年	[已撤销]	530802	普洱市,思茅区		
-532721	思茅县	云南省	思茅地区	思茅县	民政部	1981年	1992年	[已撤销]	532701	思茅地区,思茅市[已撤销]		
-532722	普洱哈尼族彝族自治县	云南省	思茅地区	普洱哈尼族彝族自治县	民政部	1980年	2002年	[已撤销]	530821	普洱市,宁洱哈尼族彝族自治县		普洱县[1984年]
-532723	墨江哈尼族自治县	云南省	思茅地区	墨江哈尼族自治县	民政部	1980年	2002年	[已撤销]	530822	普洱市,墨江哈尼族自治县		
-532724	景东彝族自治县	云南省	思茅地区	景东彝族自治县	民政部	1980年	2002年	[已撤销]	530823	普洱市,景东彝族自治县		景东县[1984年]
-532725	景谷傣族彝族自治县	云南省	思茅地区	景谷傣族彝族自治县	民政部	1980年	2002年	[已撤销]	530824	普洱市,景谷傣族彝族自治县		景谷县[1984年]
-532726	镇沅彝族哈尼族拉祜族自治县	云南省	思茅地区	镇沅彝族哈尼族拉祜族自治县	民政部	1980年	2002年	[已撤销]	530825	普洱市,镇沅彝族哈尼族拉祜族自治县		镇沅县[1989年]
-532727	江城哈尼族彝族自治县	云南省	思茅地区	江城哈尼族彝族自治县	民政部	1980年	2002年	[已撤销]	530826	普洱市,江城哈尼族彝族自治县		
-532728	孟连傣族拉祜族佤族自治县	云南省	思茅地区	孟连傣族拉祜族佤族自治县	民政部	1980年	2002年	[已撤销]	530827	普洱市,孟连傣族拉祜族佤族自治县		
-532729	澜沧拉祜族自治县	云南省	思茅地区	澜沧拉祜族自治县	民政部	1980年	2002年	[已撤销]	530828	普洱市,澜沧拉祜族自治县		
-532730	西盟佤族自治县	云南省	思茅地区	西盟佤族自治县	民政部	1980年	2002年	[已撤销]	530829	普洱市,西盟佤族自治县		
-532800	西双版纳傣族自治州	云南省	西双版纳傣族自治州	-	民政部	1980年	2024年					
-532801	景洪市	云南省	西双版纳傣族自治州	景洪市	民政部	1993年	2024年					
-532821	景洪县	云南省	西双版纳傣族自治州	景洪县	民政部	1980年	1992年	[已撤销]	532801	西双版纳傣族自治州,景洪市		
-532822	勐海县	云南省	西双版纳傣族自治州	勐海县	民政部	1980年	2024年					
-532823	勐腊县	云南省	西双版纳傣族自治州	勐腊县	民政部	1980年	2024年					
-532900	大理白族自治州	云南省	大理白族自治州	-	民政部	1980年	2024年					
-532901	大理市	云南省	大理白族自治州	大理市	民政部	1980年	2024年					下关市[1982年]
-532921	大理县	云南省	大理白族自治州	大理县	民政部	1980年	1982年	[已撤销]	532901	大理白族自治州,大理市		
-532922	漾濞彝族自治县	云南省	大理白族自治州	漾濞彝族自治县	民政部	1980年	2024年					漾濞县[1984年]
-532923	祥云县	云南省	大理白族自治州	祥云县	民政部	1980年	2024年					
-532924	宾川县	云南省	大理白族自治州	宾川县	民政部	1980年	2024年					
-532925	弥渡县	云南省	大理白族自治州	弥渡县	民政部	1980年	2024年					
-532926	南涧彝族自治县	云南省	大理白族自治州	南涧彝族自治县	民政部	1980年	2024年					
-532927	巍山彝族回族自治县	云南省	大理白族自治州	巍山彝族回族自治县	民政部	1980年	2024年					
-532928	永平县	云南省	大理白族自治州	永平县	民政部	1980年	2024年					
-532929	云龙县	云南省	大理白族自治州	云龙县	民政部	1980年	2024年					
-532930	洱源县	云南省	大理白族自治州	洱源县	民政部	1980年	2024年					
-532931	剑川县	云南省	大理白族自治州	剑川县	民政部	1980年	2024年					
-532932	鹤庆县	云南省	大理白族自治州	鹤庆县	民政部	1980年	2024年					
-533000	保山地区	云南省	保山地区	-	民政部	1980年	1999年	[已撤销]	530500	保山市（地市）		
-533001	保山市	云南省	保山地区	保山市	民政部	1983年	1999年	[已撤销]	530500	保山市（地市）		
-533021	保山县	云南省	保山地区	保山县	民政部	1980年	1982年	[已撤销]	533001	保山地区,保山市[已撤销]		
-533022	施甸县	云南省	保山地区	施甸县	民政部	1980年	1999年	[已撤销]	530521	保山市,施甸县		
-533023	腾冲县	云南省	保山地区	腾冲县	民政部	1980年	1999年	[已撤销]	530522	保山市,腾冲县[已撤销]		
-533024	龙陵县	云南省	保山地区	龙陵县	民政部	1980年	1999年	[已撤销]	530523	保山市,龙陵县		
-533025	昌宁县	云南省	保山地区	昌宁县	民政部	1980年	1999年	[已撤销]	530524	保山市,昌宁县		
-533100	德宏傣族景颇族自治州	云南省	德宏傣族景颇族自治州	-	民政部	1980年	2024年					
-533101	畹町市	云南省	德宏傣族景颇族自治州	畹町市	民政部	1985年	1998年	[已撤销]	533102	德宏傣族景颇族自治州,瑞丽市		
-533102	瑞丽市	云南省	德宏傣族景颇族自治州	瑞丽市	民政部	1992年	2024年					
-533103	芒市	云南省	德宏傣族景颇族自治州	芒市	民政部	1996年	2024年					潞西市[2009年]
-533121	潞西县	云南省	德宏傣族景颇族自治州	潞西县	民政部	1980年	1995年	[已撤销]	533103	德宏傣族景颇族自治州,芒市		
-533122	梁河县	云南省	德宏傣族景颇族自治州	梁河县	民政部	1980年	2024年					
-533123	盈江县	云南省	德宏傣族景颇族自治州	盈江县	民政部	1980年	2024年					
-533124	陇川县	云南省	德宏傣族景颇族自治州	陇川县	民政部	1980年	2024年					
-533125	瑞丽县	云南省	德宏傣族景颇族自治州	瑞丽县	民政部	1980年	1991年	[已撤销]	533102	德宏傣族景颇族自治州,瑞丽市		
-533126	畹町镇	云南省	德宏傣族景颇族自治州	畹町镇	民政部	1980年	1984年	[已撤销]	533101	德宏傣族景颇族自治州,畹町市[已撤销]		
-533200	丽江地区	云南省	丽江地区	-	民政部	1980年	2001年	[已撤销]	530700	丽江市（地市）		
-533221	丽江纳西族自治县	云南省	丽江地区	丽江纳西族自治县	民政部	1980年	2001年	[已撤销]	530721	丽江市,玉龙纳西族自治县		
-533222	永胜县	云南省	丽江地区	永胜县	民政部	1980年	2001年	[已撤销]	530722	丽江市,永胜县		
-533223	华坪县	云南省	丽江地区	华坪县	民政部	1980年	2001年	[已撤销]	530723	丽江市,华坪县		
-533224	宁蒗彝族自治县	云南省	丽江地区	宁蒗彝族自治县	民政部	1980年	2001年	[已撤销]	530724	丽江市,宁蒗彝族自治县		
-533300	怒江傈僳族自治州	云南省	怒江傈僳族自治州	-	民政部	1980年	2024年					
-533301	泸水市	云南省	怒江傈僳族自治州	泸水市	民政部	2016年	2024年					
-533321	泸水县	云南省	怒江傈僳族自治州	泸水县	民政部	1980年	2015年	[已撤销]	533301	怒江傈僳族自治州,泸水市		碧江县[1981年]
-533322	碧江县	云南省	怒江傈僳族自治州	碧江县	民政部	1980年	1985年	[已撤销]	533323,533321	怒江傈僳族自治州,福贡县,泸水县[已撤销]		福贡县[1981年]
-533323	福贡县	云南省	怒江傈僳族自治州	福贡县	民政部	1980年	2024年					贡山独龙族怒族自治县[1981年]
-533324	贡山独龙族怒族自治县	云南省	怒江傈僳族自治州	贡山独龙族怒族自治县	民政部	1980年	2024年					泸水县[1981年]
-533325	兰坪白族普米族自治县	云南省	怒江傈僳族自治州	兰坪白族普米族自治县	民政部	1980年	2024年					兰坪县[1986年]
-533400	迪庆藏族自治州	云南省	迪庆藏族自治州	-	民政部	1980年	2024年					
-533401	香格里拉市	云南省	迪庆藏族自治州	香格里拉市	民政部	2014年	2024年					
-533421	香格里拉县	云南省	迪庆藏族自治州	香格里拉县	民政部	1980年	2013年	[已撤销]	533401	迪庆藏族自治州,香格里拉市		中甸县[2000年]
-533422	德钦县	云南省	迪庆藏族自治州	德钦县	民政部	1980年	2024年					
-533423	维西傈僳族自治县	云南省	迪庆藏族自治州	维西傈僳族自治县	民政部	1980年	2024年					维西县[1984年]
-533500	临沧地区	云南省	临沧地区	-	民政部	1980年	2002年	[已撤销]	530900	临沧市（地市）		
-533521	临沧县	云南省	临沧地区	临沧县	民政部	1980年	2002年	[已撤销]	530900	临沧市（地市）		
-533522	凤庆县	云南省	临沧地区	凤庆县	民政部	1980年	2002年	[已撤销]	530921	临沧市,凤庆县		
-533523	云县	云南省	临沧地区	云县	民政部	1980年	2002年	[已撤销]	530922	临沧市,云县		
-533524	永德县	云南省	临沧地区	永德县	民政部	1980年	2002年	[已撤销]	530923	临沧市,永德县		
-533525	镇康县	云南省	临沧地区	镇康县	民政部	1980年	2002年	[已撤销]	530924	临沧市,镇康县		
-533526	双江拉祜族佤族布朗族傣族自治县	云南省	临沧地区	双江拉祜族佤族布朗族傣族自治县	民政部	1980年	2002年	[已撤销]	530925	临沧市,双江拉祜族佤族布朗族傣族自治县		双江县[1984年]
-533527	耿马傣族佤族自治县	云南省	临沧地区	耿马傣族佤族自治县	民政部	1980年	2002年	[已撤销]	530926	临沧市,耿马傣族佤族自治县		
-533528	沧源佤族自治县	云南省	临沧地区	沧源佤族自治县	民政部	1980年	2002年	[已撤销]	530927	临沧市,沧源佤族自治县		
-534000	克钦景颇族自治州*	云南省	克钦景颇族自治州*	-	非官方							
-534021	克钦景颇族自治州*	云南省	克钦景颇族自治州*	密支那县	非官方							
-534022	克钦景颇族自治州*	云南省	克钦景颇族自治州*	八莫县	非官方							
-534023	克钦景颇族自治州*	云南省	克钦景颇族自治州*	葡萄县	非官方							
-534024	克钦景颇族自治州*	云南省	克钦景颇族自治州*	莫因县	非官方							
-534100	掸东佤族自治州*	云南省	掸东佤族自治州*	-	非官方							
-534101	掸东佤族自治州*	云南省	掸东佤族自治州*	邦康区	非官方							
-534102	掸东佤族自治州*	云南省	掸东佤族自治州*	南邓区	非官方							
-534121	掸东佤族自治州*	云南省	掸东佤族自治州*	勐冒县	非官方							
-534122	掸东佤族自治州*	云南省	掸东佤族自治州*	勐能县	非官方							
-534123	掸东佤族自治州*	云南省	掸东佤族自治州*	勐波县	非官方							
-534124	掸东佤族自治州*	云南省	掸东佤族自治州*	勐拉县	非官方							
-534200	掸北德昂族自治州*	云南省	掸北德昂族自治州*	-	非官方							
-534300	掸中傣族自治州*	云南省	掸中傣族自治州*	-	非官方							
-534400	掸南佤族自治州*	云南省	掸南佤族自治州*	-	非官方							
-540000	西藏自治区	西藏自治区	-	-	民政部	1980年	2024年					
-540100	拉萨市	西藏自治区	拉萨市	-	民政部	1980年	2024年					
-540101	市辖区	西藏自治区	拉萨市	市辖区	国标							增设（GB/T 2260-1984）
-540102	城关区	西藏自治区	拉萨市	城关区	民政部	1980年	2024年					
-540103	堆龙德庆区	西藏自治区	拉萨市	堆龙德庆区	民政部	2015年	2024年					
-540104	达孜区	西藏自治区	拉萨市	达孜区	民政部	2017年	2024年					
-540120	拉萨市	西藏自治区	拉萨市	市区	非官方							
-540121	林周县	西藏自治区	拉萨市	林周县	民政部	1980年	2024年					
-540122	当雄县	西藏自治区	拉萨市	当雄县	民政部	1980年	2024年					
-540123	尼木县	西藏自治区	拉萨市	尼木县	民政部	1980年	2024年					
-540124	曲水县	西藏自治区	拉萨市	曲水县	民政部	1980年	2024年					
-540125	堆龙德庆县	西藏自治区	拉萨市	堆龙德庆县	民政部	1980年	2014年	[已撤销]	540103	拉萨市,堆龙德庆区		
-540126	达孜县	西藏自治区	拉萨市	达孜县	民政部	1980年	2016年	[已撤销]	540104	拉萨市,达孜区		
-540127	墨竹工卡县	西藏自治区	拉萨市	墨竹工卡县	民政部	1980年	2024年					
-540128	工布江达县	西藏自治区	拉萨市	工布江达县	民政部	1980年	1982年	[已撤销]	542622	林芝地区,工布江达县[已撤销]		
-540129	林芝县	西藏自治区	拉萨市	林芝县	民政部	1980年	1982年	[已撤销]	542621	林芝地区,林芝县[已撤销]		
-540130	米林县	西藏自治区	拉萨市	米林县	民政部	1980年	1982年	[已撤销]	542623	林芝地区,米林县[已撤销]		
-540131	墨脱县	西藏自治区	拉萨市	墨脱县	民政部	1980年	1982年	[已撤销]	542624	林芝地区,墨脱县[已撤销]		
-540200	日喀则市	西藏自治区	日喀则市	-	民政部	2014年	2024年					
-540201	市辖区	西藏自治区	日喀则市	市辖区	国标				371721			
-540202	桑珠孜区	西藏自治区	日喀则市	桑珠孜区	民政部	2014年	2024年					
-540221	南木林县	西藏自治区	日喀则市	南木林县	民政部	2014年	2024年					
-540222	江孜县	西藏自治区	日喀则市	江孜县	民政部	2014年	2024年					
-540223	定日县	西藏自治区	日喀则市	定日县	民政部	2014年	2024年					
-540224	萨迦县	西藏自治区	日喀则市	萨迦县	民政部	2014年	2024年					
-540225	拉孜县	西藏自治区	日喀则市	拉孜县	民政部	2014年	2024年					
-540226	昂仁县	西藏自治区	日喀则市	昂仁县	民政部	2014年	2024年					
-540227	谢通门县	西藏自治区	日喀则市	谢通门县	民政部	2014年	2024年					
-540228	白朗县	西藏自治区	日喀则市	白朗县	民政部	2014年	2024年					
-540229	仁布县	西藏自治区	日喀则市	仁布县	民政部	2014年	2024年					
-540230	康马县	西藏自治区	日喀则市	康马县	民政部	2014年	2024年					
-540231	定结县	西藏自治区	日喀则市	定结县	民政部	2014年	2024年					
-540232	仲巴县	西藏自治区	日喀则市	仲巴县	民政部	2014年	2024年					
-540233	亚东县	西藏自治区	日喀则市	亚东县	民政部	2014年	2024年					
-540234	吉隆县	西藏自治区	日喀则市	吉隆县	民政部	2014年	2024年					
-540235	聂拉木县	西藏自治区	日喀则市	聂拉木县	民政部	2014年	2024年					
-540236	萨嘎县	西藏自治区	日喀则市	萨嘎县	民政部	2014年	2024年					
-540237	岗巴县	西藏自治区	日喀则市	岗巴县	民政部	2014年	2024年					
-540300	昌都市	西藏自治区	昌都市	-	民政部	2014年	2024年					
-540301	市辖区	西藏自治区	昌都市	市辖区	国标							
-540302	卡若区	西藏自治区	昌都市	卡若区	民政部	2014年	2024年					
-540321	江达县	西藏自治区	昌都市	江达县	民政部	2014年	2024年					
-540322	贡觉县	西藏自治区	昌都市	贡觉县	民政部	2014年	2024年					
-540323	类乌齐县	西藏自治区	昌都市	类乌齐县	民政部	2014年	2024年					
-540324	丁青县	西藏自治区	昌都市	丁青县	民政部	2014年	2024年					
-540325	察雅县	西藏自治区	昌都市	察雅县	民政部	2014年	2024年					
-540326	八宿县	西藏自治区	昌都市	八宿县	民政部	2014年	2024年					
-540327	左贡县	西藏自治区	昌都市	左贡县	民政部	2014年	2024年					
-540328	芒康县	西藏自治区	昌都市	芒康县	民政部	2014年	2024年					
-540329	洛隆县	西藏自治区	昌都市	洛隆县	民政部	2014年	2024年					
-540330	边坝县	西藏自治区	昌都市	边坝县	民政部	2014年	2024年					
-540400	林芝市	西藏自治区	林芝市	-	民政部	2015年	2024年					
-540401	市辖区	西藏自治区	林芝市	市辖区	国标							
-540402	巴宜区	西藏自治区	林芝市	巴宜区	民政部	2015年	2024年					
-540421	工布江达县	西藏自治区	林芝市	工布江达县	民政部	2015年	2024年					
-540422	米林县	西藏自治区	林芝市	米林县	民政部	2015年	2022年	[已撤销]	540481	林芝市,米林市		
-540423	墨脱县	西藏自治区	林芝市	墨脱县	民政部	2015年	2024年					
-540424	波密县	西藏自治区	林芝市	波密县	民政部	2015年	2024年					
-540425	察隅县	西藏自治区	林芝市	察隅县	民政部	2015年	2024年					
-540426	朗县	西藏自治区	林芝市	朗县	民政部	2015年	2024年					
-540481	米林市	西藏自治区	林芝市	米林市	民政部	2023年	2024年					
-540500	山南市	西藏自治区	山南市	-	民政部	2016年	2024年					
-540501	市辖区	西藏自治区	山南市	市辖区	国标							
-540502	乃东区	西藏自治区	山南市	乃东区	民政部	2016年	2024年					
-540521	扎囊县	西藏自治区	山南市	扎囊县	民政部	2016年	2024年					
-540522	贡嘎县	西藏自治区	山南市	贡嘎县	民政部	2016年	2024年					
-540523	桑日县	西藏自治区	山南市	桑日县	民政部	2016年	2024年					
-540524	琼结县	西藏自治区	山南市	琼结县	民政部	2016年	2024年					
-540525	曲松县	西藏自治区	山南市	曲松县	民政部	2016年	2024年					
-540526	措美县	西藏自治区	山南市	措美县	民政部	2016年	2024年					
-540527	洛扎县	西藏自治区	山南市	洛扎县	民政部	2016年	2024年					
-540528	加查县	西藏自治区	山南市	加查县	民政部	2016年	2024年					
-540529	隆子县	西藏自治区	山南市	隆子县	民政部	2016年	2024年					
-540530	错那县	西藏自治区	山南市	错那县	民政部	2016年	2022年	[已撤销]	540581	山南市,错那市		
-540531	浪卡子县	西藏自治区	山南市	浪卡子县	民政部	2016年	2024年					
-540581	错那市	西藏自治区	山南市	错那市	民政部	2023年	2024年					
-540600	那曲市	西藏自治区	那曲市	-	民政部	2017年	2024年					
-540601	市辖区	西藏自治区	那曲市	市辖区	国标							
-540602	色尼区	西藏自治区	那曲市	色尼区	民政部	2017年	2024年					
-540621	嘉黎县	西藏自治区	那曲市	嘉黎县	民政部	2017年	2024年					
-540622	比如县	西藏自治区	那曲市	比如县	民政部	2017年	2024年					
-540623	聂荣县	西藏自治区	那曲市	聂荣县	民政部	2017年	2024年					
-540624	安多县	西藏自治区	那曲市	安多县	民政部	2017年	2024年					
-540625	申扎县	西藏自治区	那曲市	申扎县	民政部	2017年	2024年					
-540626	索县	西藏自治区	那曲市	索县	民政部	2017年	2024年					
-540627	班戈县	西藏自治区	那曲市	班戈县	民政部	2017年	2024年					
-540628	巴青县	西藏自治区	那曲市	巴青县	民政部	2017年	2024年					
-540629	尼玛县	西藏自治区	那曲市	尼玛县	民政部	2017年	2024年					
-540630	双湖县	西藏自治区	那曲市	双湖县	民政部	2017年	2024年					
-542100	昌都地区	西藏自治区	昌都地区	-	民政部	1980年	2013年	[已撤销]	540300	昌都市（地市）		
-542121	昌都县	西藏自治区	昌都地区	昌都县	民政部	1980年	2013年	[已撤销]	540300	昌都市（地市）		
-542122	江达县	西藏自治区	昌都地区	江达县	民政部	1980年	2013年	[已撤销]	540321	昌都市,江达县		
-542123	贡觉县	西藏自治区	昌都地区	贡觉县	民政部	1980年	2013年	[已撤销]	540322	昌都市,贡觉县		
-542124	类乌齐县	西藏自治区	昌都地区	类乌齐县	民政部	1980年	2013年	[已撤销]	540323	昌都市,类乌齐县		
-542125	丁青县	西藏自治区	昌都地区	丁青县	民政部	1980年	2013年	[已撤销]	540324	昌都市,丁青县		
-542126	察雅县	西藏自治区	昌都地区	察雅县	民政部	1980年	2013年	[已撤销]	540325	昌都市,察雅县		
-542127	八宿县	西藏自治区	昌都地区	八宿县	民政部	1980年	2013年	[已撤销]	540326	昌都市,八宿县		
-542128	左贡县	西藏自治区	昌都地区	左贡县	民政部	1980年	2013年	[已撤销]	540327	昌都市,左贡县		
-542129	芒康县	西藏自治区	昌都地区	芒康县	民政部	1980年	2013年	[已撤销]	540328	昌都市,芒康县		
-542130	波密县	西藏自治区	昌都地区	波密县	民政部	1980年	1982年	[已撤销]	542625	林芝地区,波密县[已撤销]		
-542131	察隅县	西藏自治区	昌都地区	察隅县	民政部	1980年	1982年	[已撤销]	542135	昌都地区,碧土县[已撤销]		
-542132	洛隆县	西藏自治区	昌都地区	洛隆县	民政部	1980年	2013年	[已撤销]	540329	昌都市,洛隆县		
-542133	边坝县	西藏自治区	昌都地区	边坝县	民政部	1980年	2013年	[已撤销]	540330	昌都市,边坝县		
-542134	盐井县	西藏自治区	昌都地区	盐井县	民政部	1983年	1998年	[已撤销]	542100	昌都地区（地市）[已撤销]		
-542135	碧土县	西藏自治区	昌都地区	碧土县	民政部	1983年	1998年	[已撤销]	542100	昌都地区（地市）[已撤销]		
-542136	妥坝县	西藏自治区	昌都地区	妥坝县	民政部	1983年	1998年	[已撤销]	542100	昌都地区（地市）[已撤销]		
-542137	生达县	西藏自治区	昌都地区	生达县	民政部	1983年	1998年	[已撤销]	542100	昌都地区（地市）[已撤销]		
-542200	山南地区	西藏自治区	山南地区	-	民政部	1980年	2015年	[已撤销]	540500	山南市（地市）		
-542221	乃东县	西藏自治区	山南地区	乃东县	民政部	1980年	2015年	[已撤销]	540502	山南市,乃东区		
-542222	扎囊县	西藏自治区	山南地区	扎囊县	民政部	1980年	2015年	[已撤销]	540521	山南市,扎囊县		
-542223	贡嘎县	西藏自治区	山南地区	贡嘎县	民政部	1980年	2015年	[已撤销]	540522	山南市,贡嘎县		
-542224	桑日县	西藏自治区	山南地区	桑日县	民政部	1980年	2015年	[已撤销]	540523	山南市,桑日县		
-542225	琼结县	西藏自治区	山南地区	琼结县	民政部	1980年	2015年	[已撤销]	540524	山南市,琼结县		穷结县[1985年]
-542226	曲松县	西藏自治区	山南地区	曲松县	民政部	1980年	2015年	[已撤销]	540525	山南市,曲松县		
-542227	措美县	西藏自治区	山南地区	措美县	民政部	1980年	2015年	[已撤销]	540526	山南市,措美县		
-542228	洛扎县	西藏自治区	山南地区	洛扎县	民政部	1980年	2015年	[已撤销]	540527	山南市,洛扎县		
-542229	加查县	西藏自治区	山南地区	加查县	民政部	1980年	2015年	[已撤销]	540528	山南市,加查县		
-542230	朗县	西藏自治区	山南地区	朗县	民政部	1980年	1982年	[已撤销]	542627	林芝地区,朗县[已撤销]		
-542231	隆子县	西藏自治区	山南地区	隆子县	民政部	1980年	2015年	[已撤销]	540529	山南市,隆子县		
-542232	错那县	西藏自治区	山南地区	错那县	民政部	1980年	2015年	[已撤销]	540530	山南市,错那县[已撤销]		
-542233	浪卡子县	西藏自治区	山南地区	浪卡子县	民政部	1980年	2015年	[已撤销]	540531	山南市,浪卡子县		
-542300	日喀则地区	西藏自治区	日喀则地区	-	民政部	1980年	2013年	[已撤销]	540200	日喀则市（地市）		
-542301	日喀则市	西藏自治区	日喀则地区	日喀则市	民政部	1986年	2013年	[已撤销]	540200	日喀则市（地市）		
-542321	日喀则县	西藏自治区	日喀则地区	日喀则县	民政部	1980年	1985年	[已撤销]	542301	日喀则地区,日喀则市[已撤销]		
-542322	南木林县	西藏自治区	日喀则地区	南木林县	民政部	1980年	2013年	[已撤销]	540221	日喀则市,南木林县		
-542323	江孜县	西藏自治区	日喀则地区	江孜县	民政部	1980年	2013年	[已撤销]	540222	日喀则市,江孜县		
-542324	定日县	西藏自治区	日喀则地区	定日县	民政部	1980年	2013年	[已撤销]	540223	日喀则市,定日县		
-542325	萨迦县	西藏自治区	日喀则地区	萨迦县	民政部	1980年	2013年	[已撤销]	540224	日喀则市,萨迦县		
-542326	拉孜县	西藏自治区	日喀则地区	拉孜县	民政部	1980年	2013年	[已撤销]	540225	日喀则市,拉孜县		
-542327	昂仁县	西藏自治区	日喀则地区	昂仁县	民政部	1980年	2013年	[已撤销]	540226	日喀则市,昂仁县		
-542328	谢通门县	西藏自治区	日喀则地区	谢通门县	民政部	1980年	2013年	[已撤销]	540227	日喀则市,谢通门县		
-542329	白朗县	西藏自治区	日喀则地区	白朗县	民政部	1980年	2013年	[已撤销]	540228	日喀则市,白朗县		
-542330	仁布县	西藏自治区	日喀则地区	仁布县	民政部	1980年	2013年	[已撤销]	540229	日喀则市,仁布县		
-542331	康马县	西藏自治区	日喀则地区	康马县	民政部	1980年	2013年	[已撤销]	540230	日喀则市,康马县		
-542332	定结县	西藏自治区	日喀则地区	定结县	民政部	1980年	2013年	[已撤销]	540231	日喀则市,定结县		
-542333	仲巴县	西藏自治区	日喀则地区	仲巴县	民政部	1980年	2013年	[已撤销]	540232	日喀则市,仲巴县		
-542334	亚东县	西藏自治区	日喀则地区	亚东县	民政部	1980年	2013年	[已撤销]	540233	日喀则市,亚东县		
-542335	吉隆县	西藏自治区	日喀则地区	吉隆县	民政部	1980年	2013年	[已撤销]	540234	日喀则市,吉隆县		
-542336	聂拉木县	西藏自治区	日喀则地区	聂拉木县	民政部	1980年	2013年	[已撤销]	540235	日喀则市,聂拉木县		
-542337	萨嘎县	西藏自治区	日喀则地区	萨嘎县	民政部	1980年	2013年	[已撤销]	540236	日喀则市,萨嘎县		
-542338	岗巴县	西藏自治区	日喀则地区	岗巴县	民政部	1980年	2013年	[已撤销]	540237	日喀则市,岗巴县		
-542400	那曲地区	西藏自治区	那曲地区	-	民政部	1980年	2016年	[已撤销]	540600	那曲市（地市）		
-542421	那曲县	西藏自治区	那曲地区	那曲县	民政部	1980年	2016年	[已撤销]	540600	那曲市（地市）		
-542422	嘉黎县	西藏自治区	那曲地区	嘉黎县	民政部	1980年	2016年	[已撤销]	540621	那曲市,嘉黎县		
-542423	比如县	西藏自治区	那曲地区	比如县	民政部	1980年	2016年	[已撤销]	540622	那曲市,比如县		
-542424	聂荣县	西藏自治区	那曲地区	聂荣县	民政部	1980年	2016年	[已撤销]	540623	那曲市,聂荣县		
-542425	安多县	西藏自治区	那曲地区	安多县	民政部	1980年	2016年	[已撤销]	540624	那曲市,安多县		
-542426	申扎县	西藏自治区	那曲地区	申扎县	民政部	1980年	2016年	[已撤销]	540625	那曲市,申扎县		
-542427	索县	西藏自治区	那曲地区	索县	民政部	1980年	2016年	[已撤销]	540626	那曲市,索县		
-542428	班戈县	西藏自治区	那曲地区	班戈县	民政部	1980年	2016年	[已撤销]	540627	那曲市,班戈县		
-542429	巴青县	西藏自治区	那曲地区	巴青县	民政部	1980年	2016年	[已撤销]	540628	那曲市,巴青县		
-542430	尼玛县	西藏自治区	那曲地区	尼玛县	民政部	1983年	2016年	[已撤销]	540629	那曲市,尼玛县		
-542431	双湖县	西藏自治区	那曲地区	双湖县	民政部	2012年	2016年	[已撤销]	540630	那曲市,双湖县		
-542500	阿里地区	西藏自治区	阿里地区	-	民政部	1980年	2024年					
-542521	普兰县	西藏自治区	阿里地区	普兰县	民政部	1980年	2024年					
-542522	札达县	西藏自治区	阿里地区	札达县	民政部	1980年	2024年					
-542523	噶尔县	西藏自治区	阿里地区	噶尔县	民政部	1980年	2024年					
-542524	日土县	西藏自治区	阿里地区	日土县	民政部	1980年	2024年					
-542525	革吉县	西藏自治区	阿里地区	革吉县	民政部	1980年	2024年					
-542526	改则县	西藏自治区	阿里地区	改则县	民政部	1980年	2024年					
-542527	措勤县	西藏自治区	阿里地区	措勤县	民政部	1980年	2024年					
-542528	隆格尔县	西藏自治区	阿里地区	隆格尔县	民政部	1983年	1998年	[已撤销]	542500	阿里地区（地市）		
-542600	林芝地区	西藏自治区	林芝地区	-	民政部	1983年	2014年	[已撤销]	540400	林芝市（地市）		
-542621	林芝县	西藏自治区	林芝地区	林芝县	民政部	1983年	2014年	[已撤销]	540400	林芝市（地市）		
-542622	工布江达县	西藏自治区	林芝地区	工布江达县	民政部	1983年	2014年	[已撤销]	540421	林芝市,工布江达县		
-542623	米林县	西藏自治区	林芝地区	米林县	民政部	1983年	2014年	[已撤销]	540422	林芝市,米林县[已撤销]		
-542624	墨脱县	西藏自治区	林芝地区	墨脱县	民政部	1983年	2014年	[已撤销]	540423	林芝市,墨脱县		
-542625	波密县	西藏自治区	林芝地区	波密县	民政部	1983年	2014年	[已撤销]	540424	林芝市,波密县		
-542626	察隅县	西藏自治区	林芝地区	察隅县	民政部	1983年	2014年	[已撤销]	540425	林芝市,察隅县		
-542627	朗县	西藏自治区	林芝地区	朗县	民政部	1983年	2014年	[已撤销]	540426	林芝市,朗县		
-542700	江孜地区	西藏自治区	江孜地区	-	民政部	1983年	1985年	[已撤销]	542300,542200	日喀则地区,山南地区		
-542721	江孜县	西藏自治区	江孜地区	江孜县	民政部	1983年	1985年	[已撤销]	542323	日喀则地区,江孜县[已撤销]		
-542722	浪卡子县	西藏自治区	江孜地区	浪卡子县	民政部	1983年	1985年	[已撤销]	542233	山南地区,浪卡子县[已撤销]		
-542723	白朗县	西藏自治区	江孜地区	白朗县	民政部	1983年	1985年	[已撤销]	542329	日喀则地区,白朗县[已撤销]		
-542724	仁布县	西藏自治区	江孜地区	仁布县	民政部	1983年	1985年	[已撤销]	542330	日喀则地区,仁布县[已撤销]		
-542725	康马县	西藏自治区	江孜地区	康马县	民政部	1983年	1985年	[已撤销]	542331	日喀则地区,康马县[已撤销]		
-542726	亚东县	西藏自治区	江孜地区	亚东县	民政部	1983年	1985年	[已撤销]	542334	日喀则地区,亚东县[已撤销]		
-542727	岗巴县	西藏自治区	江孜地区	岗巴县	民政部	1983年	1985年	[已撤销]	542338	日喀则地区,岗巴县[已撤销]		
-610000	陕西省	陕西省	-	-	民政部	1980年	2024年					
-610100	西安市	陕西省	西安市	-	民政部	1980年	2024年					
-610101	市辖区	陕西省	西安市	市辖区	国标							增设（GB/T 2260-1984）
-610102	新城区	陕西省	西安市	新城区	民政部	1980年	2024年					
-610103	碑林区	陕西省	西安市	碑林区	民政部	1980年	2024年					
-610104	莲湖区	陕西省	西安市	莲湖区	民政部	1980年	2024年					
-610107		陕西省	西安市		非官方						1977年	
-610111	灞桥区	陕西省	西安市	灞桥区	民政部	1980年	2024年					
-610112	未央区	陕西省	西安市	未央区	民政部	1980年	2024年					
-610113	雁塔区	陕西省	西安市	雁塔区	民政部	1980年	2024年					
-610114	阎良区	陕西省	西安市	阎良区	民政部	1980年	2024年					
-610115	临潼区	陕西省	西安市	临潼区	民政部	1997年	2024年					
-610116	长安区	陕西省	西安市	长安区	民政部	2002年	2024年					
-610117	高陵区	陕西省	西安市	高陵区	民政部	2014年	2024年					
-610118	鄠邑区	陕西省	西安市	鄠邑区	民政部	2016年	2024年					
-610120	西安市区	陕西省	西安市	西安市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-610121	长安县	陕西省	西安市	长安县	民政部	1980年	2001年	[已撤销]	610116	西安市,长安区		
-610122	蓝田县	陕西省	西安市	蓝田县	民政部	1983年	2024年					
-610123	临潼县	陕西省	西安市	临潼县	民政部	1983年	1996年	[已撤销]	610115	西安市,临潼区		
-610124	周至县	陕西省	西安市	周至县	民政部	1983年	2024年					旧称：周至县(盩厔县)；
-610125	户县	陕西省	西安市	户县	民政部	1983年	2015年	[已撤销]	610118	西安市,鄠邑区		旧称：户县(鄠县)；
-610126	高陵县	陕西省	西安市	高陵县	民政部	1983年	2013年	[已撤销]	610117	西安市,高陵区		
-610200	铜川市	陕西省	铜川市	-	民政部	1980年	2024年					
-610201	市辖区	陕西省	铜川市	市辖区	国标							增设（GB/T 2260-1984）
-610202	王益区	陕西省	铜川市	王益区	民政部	1980年	2024年					城区[1999年]
-610203	印台区	陕西省	铜川市	印台区	民政部	1980年	2024年					郊区[1999年]
-610204	耀州区	陕西省	铜川市	耀州区	民政部	2002年	2024年					
-610220	铜川市区	陕西省	铜川市	铜川市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-610221	耀县	陕西省	铜川市	耀县	民政部	1980年	2001年	[已撤销]	610204	铜川市,耀州区		
-610222	宜君县	陕西省	铜川市	宜君县	民政部	1983年	2024年					
-610300	宝鸡市	陕西省	宝鸡市	-	民政部	1980年	2024年					
-610301	市辖区	陕西省	宝鸡市	市辖区	国标							增设（GB/T 2260-1984）
-610302	渭滨区	陕西省	宝鸡市	渭滨区	民政部	1980年	2024年					
-610303	金台区	陕西省	宝鸡市	金台区	民政部	1980年	2024年					
-610304	陈仓区	陕西省	宝鸡市	陈仓区	民政部	1982年	2024年					杨陵区[1982年]
-610305	凤翔区	陕西省	宝鸡市	凤翔区	民政部	2021年	2024年					
-610320	宝鸡市区	陕西省	宝鸡市	宝鸡市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-610321	宝鸡县	陕西省	宝鸡市	宝鸡县	民政部	1980年	2002年	[已撤销]	610304,610303,610302	宝鸡市,陈仓区,金台区,渭滨区		
-610322	凤翔县	陕西省	宝鸡市	凤翔县	民政部	1980年	2020年	[已撤销]	610305	宝鸡市,凤翔区		
-610323	岐山县	陕西省	宝鸡市	岐山县	民政部	1980年	2024年					
-610324	扶风县	陕西省	宝鸡市	扶风县	民政部	1980年	2024年					
-610325	武功县	陕西省	宝鸡市	武功县	民政部	1980年	1982年	[已撤销]	610431	咸阳市,武功县		
-610326	眉县	陕西省	宝鸡市	眉县	民政部	1980年	2024年					旧称：眉县(郿县)；
-610327	陇县	陕西省	宝鸡市	陇县	民政部	1980年	2024年					
-610328	千阳县	陕西省	宝鸡市	千阳县	民政部	1980年	2024年					旧称：千阳县(汧阳县)；
-610329	麟游县	陕西省	宝鸡市	麟游县	民政部	1980年	2024年					
-610330	凤县	陕西省	宝鸡市	凤县	民政部	1980年	2024年					
-610331	太白县	陕西省	宝鸡市	太白县	民政部	1980年	2024年					
-610400	咸阳市	陕西省	咸阳市	-	民政部	1984年	2024年					
-610401	咸阳市	陕西省	咸阳市	咸阳市	民政部	1983年	1983年	[已撤销]	610400	咸阳市（地市）		
-610402	秦都区	陕西省	咸阳市	秦都区	民政部	1983年	2024年					
-610403	杨陵区	陕西省	咸阳市	杨陵区	民政部	1983年	2024年					
-610404	渭城区	陕西省	咸阳市	渭城区	民政部	1986年	2024年					
-610421	兴平县	陕西省	咸阳市	兴平县	民政部	1983年	1992年	[已撤销]	619001	省直辖县级行政区划,兴平市[已撤销]		
-610422	三原县	陕西省	咸阳市	三原县	民政部	1983年	2024年					
-610423	泾阳县	陕西省	咸阳市	泾阳县	民政部	1983年	2024年					
-610424	乾县	陕西省	咸阳市	乾县	民政部	1983年	2024年					
-610425	礼泉县	陕西省	咸阳市	礼泉县	民政部	1983年	2024年					旧称：礼泉县(醴泉县)；
-610426	永寿县	陕西省	咸阳市	永寿县	民政部	1983年	2024年					
-610427	彬县	陕西省	咸阳市	彬县	民政部	1983年	2017年	[已撤销]	610482	咸阳市,彬州市		旧称：彬县(邠县)；
-610428	长武县	陕西省	咸阳市	长武县	民政部	1983年	2024年					
-610429	旬邑县	陕西省	咸阳市	旬邑县	民政部	1983年	2024年					旧称：旬邑县(栒邑县)；
-610430	淳化县	陕西省	咸阳市	淳化县	民政部	1983年	2024年					
-610431	武功县	陕西省	咸阳市	武功县	民政部	1983年	2024年					
-610481	兴平市	陕西省	咸阳市	兴平市	民政部	1995年	2024年					
-610482	彬州市	陕西省	咸阳市	彬州市	民政部	2018年	2024年					旧称：彬州市(邠州市)；
-610500	渭南市	陕西省	渭南市	-	民政部	1994年	2024年					
-610501	市辖区	陕西省	渭南市	市辖区	国标							
-610502	临渭区	陕西省	渭南市	临渭区	民政部	1994年	2024年					
-610503	华州区	陕西省	渭南市	华州区	民政部	2015年	2024年					
-610521	华县	陕西省	渭南市	华县	民政部	1994年	2014年	[已撤销]	610503	渭南市,华州区		
-610522	潼关县	陕西省	渭南市	潼关县	民政部	1994年	2024年					
-610523	大荔县	陕西省	渭南市	大荔县	民政部	1994年	2024年					
-610524	合阳县	陕西省	渭南市	合阳县	民政部	1994年	2024年					旧称：合阳县(郃阳县)；
-610525	澄城县	陕西省	渭南市	澄城县	民政部	1994年	2024年					
-610526	蒲城县	陕西省	渭南市	蒲城县	民政部	1994年	2024年					
-610527	白水县	陕西省	渭南市	白水县	民政部	1994年	2024年					
-610528	富平县	陕西省	渭南市	富平县	民政部	1994年	2024年					
-610581	韩城市	陕西省	渭南市	韩城市	民政部	1995年	2024年					
-610582	华阴市	陕西省	渭南市	华阴市	民政部	1995年	2024年					
-610600	延安市	陕西省	延安市	-	民政部	1996年	2024年					
-610601	市辖区	陕西省	延安市	市辖区	国标							
-610602	宝塔区	陕西省	延安市	宝塔区	民政部	1996年	2024年					
-610603	安塞区	陕西省	延安市	安塞区	民政部	2016年	2024年					
-610621	延长县	陕西省	延安市	延长县	民政部	1996年	2024年					
-610622	延川县	陕西省	延安市	延川县	民政部	1996年	2024年					
-610623	子长县	陕西省	延安市	子长县	民政部	1996年	2018年	[已撤销]	610681	延安市,子长市		
-610624	安塞县	陕西省	延安市	安塞县	民政部	1996年	2015年	[已撤销]	610603	延安市,安塞区		
-610625	志丹县	陕西省	延安市	志丹县	民政部	1996年	2024年					
-610626	吴起县	陕西省	延安市	吴起县	民政部	1996年	2024年					吴旗县[2004年]
-610627	甘泉县	陕西省	延安市	甘泉县	民政部	1996年	2024年					
-610628	富县	陕西省	延安市	富县	民政部	1996年	2024年					旧称：富县(鄜县)；
-610629	洛川县	陕西省	延安市	洛川县	民政部	1996年	2024年					
-610630	宜川县	陕西省	延安市	宜川县	民政部	1996年	2024年					
-610631	黄龙县	陕西省	延安市	黄龙县	民政部	1996年	2024年					
-610632	黄陵县	陕西省	延安市	黄陵县	民政部	1996年	2024年					
-610681	子长市	陕西省	延安市	子长市	民政部	2019年	2024年					
-610700	汉中市	陕西省	汉中市	-	民政部	1996年	2024年					
-610701	市辖区	陕西省	汉中市	市辖区	国标							
-610702	汉台区	陕西省	汉中市	汉台区	民政部	1996年	2024年					
-610703	南郑区	陕西省	汉中市	南郑区	民政部	2017年	2024年					
-610721	南郑县	陕西省	汉中市	南郑县	民政部	1996年	2016年	[已撤销]	610703	汉中市,南郑区		
-610722	城固县	陕西省	汉中市	城固县	民政部	1996年	2024年					
-610723	洋县	陕西省	汉中市	洋县	民政部	1996年	2024年					
-610724	西乡县	陕西省	汉中市	西乡县	民政部	1996年	2024年					
-610725	勉县	陕西省	汉中市	勉县	民政部	1996年	2024年					旧称：勉县(沔县)；
-610726	宁强县	陕西省	汉中市	宁强县	民政部	1996年	2024年					
-610727	略阳县	陕西省	汉中市	略阳县	民政部	1996年	2024年					
-610728	镇巴县	陕西省	汉中市	镇巴县	民政部	1996年	2024年					
-610729	留坝县	陕西省	汉中市	留坝县	民政部	1996年	2024年					
-610730	佛坪县	陕西省	汉中市	佛坪县	民政部	1996年	2024年					
-610800	榆林市	陕西省	榆林市	-	民政部	1999年	2024年					
-610801	市辖区	陕西省	榆林市	市辖区	国标							
-610802	榆阳区	陕西省	榆林市	榆阳区	民政部	1999年	2024年					
-610803	横山区	陕西省	榆林市	横山区	民政部	2015年	2024年					
-610821	神木县	陕西省	榆林市	神木县	民政部	1999年	2016年	[已撤销]	610881	榆林市,神木市		
-610822	府谷县	陕西省	榆林市	府谷县	民政部	1999年	2024年					
-610823	横山县	陕西省	榆林市	横山县	民政部	1999年	2014年	[已撤销]	610803	榆林市,横山区		
-610824	靖边县	陕西省	榆林市	靖边县	民政部	1999年	2024年					
-610825	定边县	陕西省	榆林市	定边县	民政部	1999年	2024年					
-610826	绥德县	陕西省	榆林市	绥德县	民政部	1999年	2024年					
-610827	米脂县	陕西省	榆林市	米脂县	民政部	1999年	2024年					
-610828	佳县	陕西省	榆林市	佳县	民政部	1999年	2024年					旧称：佳县(葭县)；
-610829	吴堡县	陕西省	榆林市	吴堡县	民政部	1999年	2024年					
-610830	清涧县	陕西省	榆林市	清涧县	民政部	1999年	2024年					
-610831	子洲县	陕西省	榆林市	子洲县	民政部	1999年	2024年					
-610881	神木市	陕西省	榆林市	神木市	民政部	2017年	2024年					
-610900	安康市	陕西省	安康市	-	民政部	2000年	2024年					
-610901	市辖区	陕西省	安康市	市辖区	国标							
-610902	汉滨区	陕西省	安康市	汉滨区	民政部	2000年	2024年					
-610921	汉阴县	陕西省	安康市	汉阴县	民政部	2000年	2024年					
-610922	石泉县	陕西省	安康市	石泉县	民政部	2000年	2024年					
-610923	宁陕县	陕西省	安康市	宁陕县	民政部	2000年	2024年					
-610924	紫阳县	陕西省	安康市	紫阳县	民政部	2000年	2024年					
-610925	岚皋县	陕西省	安康市	岚皋县	民政部	2000年	2024年					
-610926	平利县	陕西省	安康市	平利县	民政部	2000年	2024年					
-610927	镇坪县	陕西省	安康市	镇坪县	民政部	2000年	2024年					
-610928	旬阳县	陕西省	安康市	旬阳县	民政部	2000年	2020年	[已撤销]	610981	安康市,旬阳市		旧称：旬阳县(洵阳县)；
-610929	白河县	陕西省	安康市	白河县	民政部	2000年	2024年					
-610981	旬阳市	陕西省	安康市	旬阳市	民政部	2021年	2024年					旧称：旬阳市(洵阳市)；
-611000	商洛市	陕西省	商洛市	-	民政部	2001年	2024年					旧称：商洛市(商雒市)；
-611001	市辖区	陕西省	商洛市	市辖区	国标							
-611002	商州区	陕西省	商洛市	商州区	民政部	2001年	2024年					
-611021	洛南县	陕西省	商洛市	洛南县	民政部	2001年	2024年					旧称：洛南县(雒南县)；
-611022	丹凤县	陕西省	商洛市	丹凤县	民政部	2001年	2024年					
-611023	商南县	陕西省	商洛市	商南县	民政部	2001年	2024年					
-611024	山阳县	陕西省	商洛市	山阳县	民政部	2001年	2024年					
-611025	镇安县	陕西省	商洛市	镇安县	民政部	2001年	2024年					
-611026	柞水县	陕西省	商洛市	柞水县	民政部	2001年	2024年					
-612100	渭南地区	陕西省	渭南地区	-	民政部	1980年	1993年	[已撤销]	610500	渭南市（地市）		
-612101	渭南市	陕西省	渭南地区	渭南市	民政部	1983年	1993年	[已撤销]	610500	渭南市（地市）		
-612102	韩城市	陕西省	渭南地区	韩城市	民政部	1983年	1993年	[已撤销]	619002	省直辖县级行政区划,韩城市[已撤销]		
-612103	华阴市	陕西省	渭南地区	华阴市	民政部	1990年	1993年	[已撤销]	619003	省直辖县级行政区划,华阴市[已撤销]		
-612121	蓝田县	陕西省	渭南地区	蓝田县	民政部	1980年	1982年	[已撤销]	610122	西安市,蓝田县		
-612122	临潼县	陕西省	渭南地区	临潼县	民政部	1980年	1982年	[已撤销]	610123	西安市,临潼县[已撤销]		
-612123	渭南县	陕西省	渭南地区	渭南县	民政部	1980年	1982年	[已撤销]	612101	渭南地区,渭南市[已撤销]		
-612124	华县	陕西省	渭南地区	华县	民政部	1980年	1993年	[已撤销]	610521	渭南市,华县[已撤销]		
-612125	华阴县	陕西省	渭南地区	华阴县	民政部	1980年	1989年	[已撤销]	612103	渭南地区,华阴市[已撤销]		
-612126	潼关县	陕西省	渭南地区	潼关县	民政部	1980年	1993年	[已撤销]	610522	渭南市,潼关县		
-612127	大荔县	陕西省	渭南地区	大荔县	民政部	1980年	1993年	[已撤销]	610523	渭南市,大荔县		
-612128	蒲城县	陕西省	渭南地区	蒲城县	民政部	1980年	1993年	[已撤销]	610526	渭南市,蒲城县		
-612129	澄城县	陕西省	渭南地区	澄城县	民政部	1980年	1993年	[已撤销]	610525	渭南市,澄城县		
-612130	白水县	陕西省	渭南地区	白水县	民政部	1980年	1993年	[已撤销]	610527	渭南市,白水县		
-612131	韩城县	陕西省	渭南地区	韩城县	民政部	1980年	1982年	[已撤销]	612102	渭南地区,韩城市[已撤销]		
-612132	合阳县	陕西省	渭南地区	合阳县	民政部	1980年	1993年	[已撤销]	610524	渭南市,合阳县		旧称：合阳县(郃阳县)；
-612133	富平县	陕西省	渭南地区	富平县	民政部	1980年	1993年	[已撤销]	610528	渭南市,富平县		
-612200	咸阳地区	陕西省	咸阳地区	-	民政部	1980年	1982年	[已撤销]	610400	咸阳市（地市）		
-612201	咸阳市	陕西省	咸阳地区	咸阳市	民政部	1980年	1982年	[已撤销]	610401	咸阳市,咸阳市[已撤销]		
-612221	兴平县	陕西省	咸阳地区	兴平县	民政部	1980年	1982年	[已撤销]	610421	咸阳市,兴平县[已撤销]		
-612222	周至县	陕西省	咸阳地区	周至县	民政部	1980年	1982年	[已撤销]	610124	西安市,周至县		旧称：周至县(盩厔县)；
-612223	户县	陕西省	咸阳地区	户县	民政部	1980年	1982年	[已撤销]	610125	西安市,户县[已撤销]		旧称：户县(鄠县)；
-612224	三原县	陕西省	咸阳地区	三原县	民政部	1980年	1982年	[已撤销]	610422	咸阳市,三原县		
-612225	泾阳县	陕西省	咸阳地区	泾阳县	民政部	1980年	1982年	[已撤销]	610423	咸阳市,泾阳县		
-612226	高陵县	陕西省	咸阳地区	高陵县	民政部	1980年	1982年	[已撤销]	610126	西安市,高陵县[已撤销]		
-612227	乾县	陕西省	咸阳地区	乾县	民政部	1980年	1982年	[已撤销]	610424	咸阳市,乾县		
-612228	礼泉县	陕西省	咸阳地区	礼泉县	民政部	1980年	1982年	[已撤销]	610425	咸阳市,礼泉县		旧称：礼泉县(醴泉县)；
-612229	永寿县	陕西省	咸阳地区	永寿县	民政部	1980年	1982年	[已撤销]	610426	咸阳市,永寿县		
-612230	彬县	陕西省	咸阳地区	彬县	民政部	1980年	1982年	[已撤销]	610427	咸阳市,彬县[已撤销]		旧称：彬县(邠县)；
-612231	长武县	陕西省	咸阳地区	长武县	民政部	1980年	1982年	[已撤销]	610428	咸阳市,长武县		
-612232	旬邑县	陕西省	咸阳地区	旬邑县	民政部	1980年	1982年	[已撤销]	610429	咸阳市,旬邑县		旧称：旬邑县(栒邑县)；
-612233	淳化县	陕西省	咸阳地区	淳化县	民政部	1980年	1982年	[已撤销]	610430	咸阳市,淳化县		
-612300	汉中地区	陕西省	汉中地区	-	民政部	1980年	1995年	[已撤销]	610700	汉中市（地市）		
-612301	汉中市	陕西省	汉中地区	汉中市	民政部	1980年	1995年	[已撤销]	610700	汉中市（地市）		
-612321	南郑县	陕西省	汉中地区	南郑县	民政部	1980年	1995年	[已撤销]	610721	汉中市,南郑县[已撤销]		
-612322	城固县	陕西省	汉中地区	城固县	民政部	1980年	1995年	[已撤销]	610722	汉中市,城固县		
-612323	洋县	陕西省	汉中地区	洋县	民政部	1980年	1995年	[已撤销]	610723	汉中市,洋县		
-612324	西乡县	陕西省	汉中地区	西乡县	民政部	1980年	1995年	[已撤销]	610724	汉中市,西乡县		
-612325	勉县	陕西省	汉中地区	勉县	民政部	1980年	1995年	[已撤销]	610725	汉中市,勉县		旧称：勉县(沔县)；
-612326	宁强县	陕西省	汉中地区	宁强县	民政部	1980年	1995年	[已撤销]	610726	汉中市,宁强县		
-612327	略阳县	陕西省	汉中地区	略阳县	民政部	1980年	1995年	[已撤销]	610727	汉中市,略阳县		
-612328	镇巴县	陕西省	汉中地区	镇巴县	民政部	1980年	1995年	[已撤销]	610728	汉中市,镇巴县		
-612329	留坝县	陕西省	汉中地区	留坝县	民政部	1980年	1995年	[已撤销]	610729	汉中市,留坝县		
-612330	佛坪县	陕西省	汉中地区	佛坪县	民政部	1980年	1995年	[已撤销]	610730	汉中市,佛坪县		
-612400	安康地区	陕西省	安康地区	-	民政部	1980年	1999年	[已撤销]	610900	安康市（地市）		
-612401	安康市	陕西省	安康地区	安康市	民政部	1988年	1999年	[已撤销]	610900	安康市（地市）		
-612421	安康县	陕西省	安康地区	安康县	民政部	1980年	1987年	[已撤销]	612401	安康地区,安康市[已撤销]		
-612422	汉阴县	陕西省	安康地区	汉阴县	民政部	1980年	1999年	[已撤销]	610921	安康市,汉阴县		
-612423	石泉县	陕西省	安康地区	石泉县	民政部	1980年	1999年	[已撤销]	610922	安康市,石泉县		
-612424	宁陕县	陕西省	安康地区	宁陕县	民政部	1980年	1999年	[已撤销]	610923	安康市,宁陕县		
-612425	紫阳县	陕西省	安康地区	紫阳县	民政部	1980年	1999年	[已撤销]	610924	安康市,紫阳县		
-612426	岚皋县	陕西省	安康地区	岚皋县	民政部	1980年	1999年	[已撤销]	610925	安康市,岚皋县		
-612427	平利县	陕西省	安康地区	平利县	民政部	1980年	1999年	[已撤销]	610926	安康市,平利县		
-612428	镇坪县	陕西省	安康地区	镇坪县	民政部	1980年	1999年	[已撤销]	610927	安康市,镇坪县		
-612429	旬阳县	陕西省	安康地区	旬阳县	民政部	1980年	1999年	[已撤销]	610928	安康市,旬阳县[已撤销]		旧称：旬阳县(洵阳县)；
-612430	白河县	陕西省	安康地区	白河县	民政部	1980年	1999年	[已撤销]	610929	安康市,白河县		
-612500	商洛地区	陕西省	商洛地区	-	民政部	1980年	2000年	[已撤销]	610900	安康市（地市）		旧称：商洛地区(商雒地区)；
-612501	商州市	陕西省	商洛地区	商州市	民政部	1988年	2000年	[已撤销]	611002	商洛市,商州区		
-612521	商县	陕西省	商洛地区	商县	民政部	1980年	1987年	[已撤销]	612501	商洛地区,商州市[已撤销]		
-612522	洛南县	陕西省	商洛地区	洛南县	民政部	1980年	2000年	[已撤销]	611021	商洛市,洛南县		旧称：洛南县(雒南县)；
-612523	丹凤县	陕西省	商洛地区	丹凤县	民政部	1980年	2000年	[已撤销]	611022	商洛市,丹凤县		
-612524	商南县	陕西省	商洛地区	商南县	民政部	1980年	2000年	[已撤销]	611023	商洛市,商南县		
-612525	山阳县	陕西省	商洛地区	山阳县	民政部	1980年	2000年	[已撤销]	611024	商洛市,山阳县		
-612526	镇安县	陕西省	商洛地区	镇安县	民政部	1980年	2000年	[已撤销]	611025	商洛市,镇安县		
-612527	柞水县	陕西省	商洛地区	柞水县	民政部	1980年	2000年	[已撤销]	611026	商洛市,柞水县		
-612600	延安地区	陕西省	延安地区	-	民政部	1980年	1995年	[已撤销]	610600	延安市（地市）		
-612601	延安市	陕西省	延安地区	延安市	民政部	1980年	1995年	[已撤销]	610600	延安市（地市）		
-612621	延长县	陕西省	延安地区	延长县	民政部	1980年	1995年	[已撤销]	610621	延安市,延长县		
-612622	延川县	陕西省	延安地区	延川县	民政部	1980年	1995年	[已撤销]	610622	延安市,延川县		
-612623	子长县	陕西省	延安地区	子长县	民政部	1980年	1995年	[已撤销]	610623	延安市,子长县[已撤销]		
-612624	安塞县	陕西省	延安地区	安塞县	民政部	1980年	1995年	[已撤销]	610624	延安市,安塞县[已撤销]		
-612625	志丹县	陕西省	延安地区	志丹县	民政部	1980年	1995年	[已撤销]	610625	延安市,志丹县		
-612626	吴旗县	陕西省	延安地区	吴旗县	民政部	1980年	1995年	[已撤销]	610626	延安市,吴起县		
-612627	甘泉县	陕西省	延安地区	甘泉县	民政部	1980年	1995年	[已撤销]	610627	延安市,甘泉县		
-612628	富县	陕西省	延安地区	富县	民政部	1980年	1995年	[已撤销]	610628	延安市,富县		旧称：富县(鄜县)；
-612629	洛川县	陕西省	延安地区	洛川县	民政部	1980年	1995年	[已撤销]	610629	延安市,洛川县		
-612630	宜川县	陕西省	延安地区	宜川县	民政部	1980年	1995年	[已撤销]	610630	延安市,宜川县		
-612631	黄龙县	陕西省	延安地区	黄龙县	民政部	1980年	1995年	[已撤销]	610631	延安市,黄龙县		
-612632	黄陵县	陕西省	延安地区	黄陵县	民政部	1980年	1995年	[已撤销]	610632	延安市,黄陵县		
-612633	宜君县	陕西省	延安地区	宜君县	民政部	1980年	1982年	[已撤销]	610222	铜川市,宜君县		
-612700	榆林地区	陕西省	榆林地区	-	民政部	1980年	1998年	[已撤销]	610800	榆林市（地市）		
-612701	榆林市	陕西省	榆林地区	榆林市	民政部	1988年	1998年	[已撤销]	610802	榆林市,榆阳区		
-612721	榆林县	陕西省	榆林地区	榆林县	民政部	1980年	1987年	[已撤销]	612701	榆林地区,榆林市[已撤销]		
-612722	神木县	陕西省	榆林地区	神木县	民政部	1980年	1998年	[已撤销]	610821	榆林市,神木县[已撤销]		
-612723	府谷县	陕西省	榆林地区	府谷县	民政部	1980年	1998年	[已撤销]	610822	榆林市,府谷县		
-612724	横山县	陕西省	榆林地区	横山县	民政部	1980年	1998年	[已撤销]	610823	榆林市,横山县[已撤销]		
-612725	靖边县	陕西省	榆林地区	靖边县	民政部	1980年	1998年	[已撤销]	610824	榆林市,靖边县		
-612726	定边县	陕西省	榆林地区	定边县	民政部	1980年	1998年	[已撤销]	610825	榆林市,定边县		
-612727	绥德县	陕西省	榆林地区	绥德县	民政部	1980年	1998年	[已撤销]	610826	榆林市,绥德县		
-612728	米脂县	陕西省	榆林地区	米脂县	民政部	1980年	1998年	[已撤销]	610827	榆林市,米脂县		
-612729	佳县	陕西省	榆林地区	佳县	民政部	1980年	1998年	[已撤销]	610828	榆林市,佳县		旧称：佳县(葭县)；
-612730	吴堡县	陕西省	榆林地区	吴堡县	民政部	1980年	1998年	[已撤销]	610829	榆林市,吴堡县		
-612731	清涧县	陕西省	榆林地区	清涧县	民政部	1980年	1998年	[已撤销]	610830	榆林市,清涧县		
-612732	子洲县	陕西省	榆林地区	子洲县	民政部	1980年	1998年	[已撤销]	610831	榆林市,子洲县		
-619000	省直辖县	陕西省	省直辖县级行政区划	-	非官方							
-619001	兴平市	陕西省	省直辖县级行政区划	兴平市	民政部	1993年	1994年	[已撤销]	610481	咸阳市,兴平市		
-619002	韩城市	陕西省	省直辖县级行政区划	韩城市	民政部	1994年	1994年	[已撤销]	610581	渭南市,韩城市		
-619003	华阴市	陕西省	省直辖县级行政区划	华阴市	民政部	1994年	1994年	[已撤销]	610582	渭南市,华阴市		
-620000	甘肃省	甘肃省	-	-	民政部	1980年	2024年					
-620100	兰州市	甘肃省	兰州市	-	民政部	1980年	2024年					
-620101	市辖区	甘肃省	兰州市	市辖区	国标							增设（GB/T 2260-1984）
-620102	城关区	甘肃省	兰州市	城关区	民政部	1980年	2024年					
-620103	七里河区	甘肃省	兰州市	七里河区	民政部	1980年	2024年					
-620104	西固区	甘肃省	兰州市	西固区	民政部	1980年	2024年					
-620105	安宁区	甘肃省	兰州市	安宁区	民政部	1980年	2024年					
-620106	红古区	甘肃省	兰州市	红古区	国标							增设（GB-T 2260-1984）
-620111	红古区	甘肃省	兰州市	红古区	民政部	1980年	2024年					
-620112	白银区	甘肃省	兰州市	白银区	民政部	1980年	1984年	[已撤销]	620402	白银市,白银区		
-620120	兰州市区	甘肃省	兰州市	兰州市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-620121	永登县	甘肃省	兰州市	永登县	民政部	1980年	2024年					
-620122	皋兰县	甘肃省	兰州市	皋兰县	民政部	1980年	2024年					
-620123	榆中县	甘肃省	兰州市	榆中县	民政部	1980年	2024年					
-620200	嘉峪关市	甘肃省	嘉峪关市	-	民政部	1980年	2024年					
-620201	市辖区	甘肃省	嘉峪关市	市辖区	国标							增设（GB/T 2260-1984）
-620202		甘肃省	嘉峪关市		非官方						1977年	文章评论：“嘉峪关区”
-620300	金昌市	甘肃省	金昌市	-	民政部	1981年	2024年					
-620301	市辖区	甘肃省	金昌市	市辖区	国标							增设（GB/T 2260-1984）
-620302	金川区	甘肃省	金昌市	金川区	民政部	1984年	2024年					
-620320	金昌市区	甘肃省	金昌市	金昌市区	国标							增设（GB/T 2260-1982）
-620321	永昌县	甘肃省	金昌市	永昌县	民政部	1981年	2024年					
-620400	白银市	甘肃省	白银市	-	民政部	1985年	2024年					
-620401	市辖区	甘肃省	白银市	市辖区	国标							
-620402	白银区	甘肃省	白银市	白银区	民政部	1985年	2024年					
-620403	平川区	甘肃省	白银市	平川区	民政部	1985年	2024年					
-620421	靖远县	甘肃省	白银市	靖远县	民政部	1985年	2024年					
-620422	会宁县	甘肃省	白银市	会宁县	民政部	1985年	2024年					
-620423	景泰县	甘肃省	白银市	景泰县	民政部	1985年	2024年					
-620500	天水市	甘肃省	天水市	-	民政部	1985年	2024年					
-620501	市辖区	甘肃省	天水市	市辖区	国标							
-620502	秦州区	甘肃省	天水市	秦州区	民政部	1985年	2024年					秦城区[2003年]
-620503	麦积区	甘肃省	天水市	麦积区	民政部	1985年	2024年					北道区[2003年]
-620521	清水县	甘肃省	天水市	清水县	民政部	1985年	2024年					
-620522	秦安县	甘肃省	天水市	秦安县	民政部	1985年	2024年					
-620523	甘谷县	甘肃省	天水市	甘谷县	民政部	1985年	2024年					
-620524	武山县	甘肃省	天水市	武山县	民政部	1985年	2024年					
-620525	张家川回族自治县	甘肃省	天水市	张家川回族自治县	民政部	1985年	2024年					
-620600	武威市	甘肃省	武威市	-	民政部	2001年	2024年					
-620601	市辖区	甘肃省	武威市	市辖区	国标							
-620602	凉州区	甘肃省	武威市	凉州区	民政部	2001年	2024年					
-620621	民勤县	甘肃省	武威市	民勤县	民政部	2001年	2024年					
-620622	古浪县	甘肃省	武威市	古浪县	民政部	2001年	2024年					
-620623	天祝藏族自治县	甘肃省	武威市	天祝藏族自治县	民政部	2001年	2024年					
-620700	张掖市	甘肃省	张掖市	-	民政部	2002年	2024年					
-620701	市辖区	甘肃省	张掖市	市辖区	国标							
-620702	甘州区	甘肃省	张掖市	甘州区	民政部	2002年	2024年					
-620721	肃南裕固族自治县	甘肃省	张掖市	肃南裕固族自治县	民政部	2002年	2024年					
-620722	民乐县	甘肃省	张掖市	民乐县	民政部	2002年	2024年					
-620723	临泽县	甘肃省	张掖市	临泽县	民政部	2002年	2024年					
-620724	高台县	甘肃省	张掖市	高台县	民政部	2002年	2024年					
-620725	山丹县	甘肃省	张掖市	山丹县	民政部	2002年	2024年					
-620800	平凉市	甘肃省	平凉市	-	民政部	2002年	2024年					
-620801	市辖区	甘肃省	平凉市	市辖区	国标							
-620802	崆峒区	甘肃省	平凉市	崆峒区	民政部	2002年	2024年					
-620821	泾川县	甘肃省	平凉市	泾川县	民政部	2002年	2024年					
-620822	灵台县	甘肃省	平凉市	灵台县	民政部	2002年	2024年					
-620823	崇信县	甘肃省	平凉市	崇信县	民政部	2002年	2024年					
-620824	华亭县	甘肃省	平凉市	华亭县	民政部	2002年	2017年	[已撤销]	620881	平凉市,华亭市		
-620825	庄浪县	甘肃省	平凉市	庄浪县	民政部	2002年	2024年					
-620826	静宁县	甘肃省	平凉市	静宁县	民政部	2002年	2024年					
-620881	华亭市	甘肃省	平凉市	华亭市	民政部	2018年	2024年					
-620900	酒泉市	甘肃省	酒泉市	-	民政部	2002年	2024年					
-620901	市辖区	甘肃省	酒泉市	市辖区	国标							
-620902	肃州区	甘肃省	酒泉市	肃州区	民政部	2002年	2024年					
-620921	金塔县	甘肃省	酒泉市	金塔县	民政部	2002年	2024年					
-620922	瓜州县	甘肃省	酒泉市	瓜州县	民政部	2006年	2024年					
-620923	肃北蒙古族自治县	甘肃省	酒泉市	肃北蒙古族自治县	民政部	2002年	2024年					
-620924	阿克塞哈萨克族自治县	甘肃省	酒泉市	阿克塞哈萨克族自治县	民政部	2002年	2024年					
-620925	安西县	甘肃省	酒泉市	安西县	民政部	2002年	2005年	[已撤销]	620922	酒泉市,瓜州县		
-620981	玉门市	甘肃省	酒泉市	玉门市	民政部	2002年	2024年					
-620982	敦煌市	甘肃省	酒泉市	敦煌市	民政部	2002年	2024年					
-621000	庆阳市	甘肃省	庆阳市	-	民政部	2002年	2024年					
-621001	市辖区	甘肃省	庆阳市	市辖区	国标							
-621002	西峰区	甘肃省	庆阳市	西峰区	民政部	2002年	2024年					
-621021	庆城县	甘肃省	庆阳市	庆城县	民政部	2002年	2024年					
-621022	环县	甘肃省	庆阳市	环县	民政部	2002年	2024年					
-621023	华池县	甘肃省	庆阳市	华池县	民政部	2002年	2024年					
-621024	合水县	甘肃省	庆阳市	合水县	民政部	2002年	2024年					
-621025	正宁县	甘肃省	庆阳市	正宁县	民政部	2002年	2024年					
-621026	宁县	甘肃省	庆阳市	宁县	民政部	2002年	2024年					
-621027	镇原县	甘肃省	庆阳市	镇原县	民政部	2002年	2024年					
-621100	定西市	甘肃省	定西市	-	民政部	2003年	2024年					
-621101	市辖区	甘肃省	定西市	市辖区	国标							
-621102	安定区	甘肃省	定西市	安定区	民政部	2003年	2024年					
-621121	通渭县	甘肃省	定西市	通渭县	民政部	2003年	2024年					
-621122	陇西县	甘肃省	定西市	陇西县	民政部	2003年	2024年					
-621123	渭源县	甘肃省	定西市	渭源县	民政部	2003年	2024年					
-621124	临洮县	甘肃省	定西市	临洮县	民政部	2003年	2024年					
-621125	漳县	甘肃省	定西市	漳县	民政部	2003年	2024年					
-621126	岷县	甘肃省	定西市	岷县	民政部	2003年	2024年					
-621200	陇南市	甘肃省	陇南市	-	民政部	2004年	2024年					
-621201	市辖区	甘肃省	陇南市	市辖区	国标							
-621202	武都区	甘肃省	陇南市	武都区	民政部	2004年	2024年					
-621221	成县	甘肃省	陇南市	成县	民政部	2004年	2024年					
-621222	文县	甘肃省	陇南市	文县	民政部	2004年	2024年					
-621223	宕昌县	甘肃省	陇南市	宕昌县	民政部	2004年	2024年					
-621224	康县	甘肃省	陇南市	康县	民政部	2004年	2024年					
-621225	西和县	甘肃省	陇南市	西和县	民政部	2004年	2024年					
-621226	礼县	甘肃省	陇南市	礼县	民政部	2004年	2024年					
-621227	徽县	甘肃省	陇南市	徽县	民政部	2004年	2024年					
-621228	两当县	甘肃省	陇南市	两当县	民政部	2004年	2024年					
-622100	酒泉地区	甘肃省	酒泉地区	-	民政部	1980年	2001年	[已撤销]	620900	酒泉市（地市）		
-622101	玉门市	甘肃省	酒泉地区	玉门市	民政部	1980年	2001年	[已撤销]	620981	酒泉市,玉门市		
-622102	酒泉市	甘肃省	酒泉地区	酒泉市	民政部	1985年	2001年	[已撤销]	620900	酒泉市（地市）		
-622103	敦煌市	甘肃省	酒泉地区	敦煌市	民政部	1987年	2001年	[已撤销]	620982	酒泉市,敦煌市		
-622121	酒泉县	甘肃省	酒泉地区	酒泉县	民政部	1980年	1984年	[已撤销]	622102	酒泉地区,酒泉市[已撤销]		
-622122	敦煌县	甘肃省	酒泉地区	敦煌县	民政部	1980年	1986年	[已撤销]	622103	酒泉地区,敦煌市[已撤销]		
-622123	金塔县	甘肃省	酒泉地区	金塔县	民政部	1980年	2001年	[已撤销]	620921	酒泉市,金塔县		
-622124	肃北蒙古族自治县	甘肃省	酒泉地区	肃北蒙古族自治县	民政部	1980年	2001年	[已撤销]	620923	酒泉市,肃北蒙古族自治县		
-622125	阿克塞哈萨克族自治县	甘肃省	酒泉地区	阿克塞哈萨克族自治县	民政部	1980年	2001年	[已撤销]	620924	酒泉市,阿克塞哈萨克族自治县		
-622126	安西县	甘肃省	酒泉地区	安西县	民政部	1980年	2001年	[已撤销]	620925	酒泉市,安西县[已撤销]		
-622200	张掖地区	甘肃省	张掖地区	-	民政部	1980年	2001年	[已撤销]	620700	张掖市（地市）		
-622201	张掖市	甘肃省	张掖地区	张掖市	民政部	1985年	2001年	[已撤销]	620700	张掖市（地市）		
-622221	张掖县	甘肃省	张掖地区	张掖县	民政部	1980年	1984年	[已撤销]	622201	张掖地区,张掖市[已撤销]		
-622222	肃南裕固族自治县	甘肃省	张掖地区	肃南裕固族自治县	民政部	1980年	2001年	[已撤销]	620721	张掖市,肃南裕固族自治县		
-622223	民乐县	甘肃省	张掖地区	民乐县	民政部	1980年	2001年	[已撤销]	620722	张掖市,民乐县		
-622224	临泽县	甘肃省	张掖地区	临泽县	民政部	1980年	2001年	[已撤销]	620723	张掖市,临泽县		
-622225	高台县	甘肃省	张掖地区	高台县	民政部	1980年	2001年	[已撤销]	620724	张掖市,高台县		
-622226	山丹县	甘肃省	张掖地区	山丹县	民政部	1980年	2001年	[已撤销]	620725	张掖市,山丹县		
-622300	武威地区	甘肃省	武威地区	-	民政部	1980年	2000年	[已撤销]	620600	武威市（地市）		
-622301	武威市	甘肃省	武威地区	武威市	民政部	1985年	2000年	[已撤销]	620600	武威市（地市）		
-622321	武威县	甘肃省	武威地区	武威县	民政部	1980年	1984年	[已撤销]	622301	武威地区,武威市[已撤销]		
-622322	民勤县	甘肃省	武威地区	民勤县	民政部	1980年	2000年	[已撤销]	620621	武威市,民勤县		
-622323	古浪县	甘肃省	武威地区	古浪县	民政部	1980年	2000年	[已撤销]	620622	武威市,古浪县		
-622324	景泰县	甘肃省	武威地区	景泰县	民政部	1980年	1984年	[已撤销]	620423	白银市,景泰县		
-622325	永昌县	甘肃省	武威地区	永昌县	民政部	1980年	1980年	[已撤销]	620321	金昌市,永昌县		
-622326	天祝藏族自治县	甘肃省	武威地区	天祝藏族自治县	民政部	1980年	2000年	[已撤销]	620623	武威市,天祝藏族自治县		
-622400	定西地区	甘肃省	定西地区	-	民政部	1980年	2002年	[已撤销]	621100	定西市（地市）		
-622421	定西县	甘肃省	定西地区	定西县	民政部	1980年	2002年	[已撤销]	621100	定西市（地市）		
-622422	靖远县	甘肃省	定西地区	靖远县	民政部	1980年	1984年	[已撤销]	620421	白银市,靖远县		
-622423	会宁县	甘肃省	定西地区	会宁县	民政部	1980年	1984年	[已撤销]	620422	白银市,会宁县		
-622424	通渭县	甘肃省	定西地区	通渭县	民政部	1980年	2002年	[已撤销]	621121	定西市,通渭县		
-622425	陇西县	甘肃省	定西地区	陇西县	民政部	1980年	2002年	[已撤销]	621122	定西市,陇西县		
-622426	渭源县	甘肃省	定西地区	渭源县	民政部	1980年	2002年	[已撤销]	621123	定西市,渭源县		
-622427	临洮县	甘肃省	定西地区	临洮县	民政部	1980年	2002年	[已撤销]	621124	定西市,临洮县		
-622428	漳县	甘肃省	定西地区	漳县	民政部	1985年	2002年	[已撤销]	621125	定西市,漳县		
-622429	岷县	甘肃省	定西地区	岷县	民政部	1985年	2002年	[已撤销]	621126	定西市,岷县		
-622500	天水地区	甘肃省	天水地区	-	民政部	1980年	1984年	[已撤销]	620500	天水市（地市）		
-622501	天水市	甘肃省	天水地区	天水市	民政部	1980年	1984年	[已撤销]	620500	天水市（地市）		
-622521	张家川回族自治县	甘肃省	天水地区	张家川回族自治县	民政部	1980年	1984年	[已撤销]	620525	天水市,张家川回族自治县		
-622522	天水县	甘肃省	天水地区	天水县	民政部	1980年	1984年	[已撤销]	620500	天水市（地市）		
-622523	清水县	甘肃省	天水地区	清水县	民政部	1980年	1984年	[已撤销]	620521	天水市,清水县		
-622524	徽县	甘肃省	天水地区	徽县	民政部	1980年	1984年	[已撤销]	622630	陇南地区,徽县[已撤销]		
-622525	两当县	甘肃省	天水地区	两当县	民政部	1980年	1984年	[已撤销]	622629	陇南地区,两当县[已撤销]		
-622526	礼县	甘肃省	天水地区	礼县	民政部	1980年	1984年	[已撤销]	622628	陇南地区,礼县[已撤销]		
-622527	西和县	甘肃省	天水地区	西和县	民政部	1980年	1984年	[已撤销]	622627	陇南地区,西和县[已撤销]		
-622528	武山县	甘肃省	天水地区	武山县	民政部	1980年	1984年	[已撤销]	620524	天水市,武山县		
-622529	甘谷县	甘肃省	天水地区	甘谷县	民政部	1980年	1984年	[已撤销]	620523	天水市,甘谷县		
-622530	秦安县	甘肃省	天水地区	秦安县	民政部	1980年	1984年	[已撤销]	620522	天水市,秦安县		
-622531	漳县	甘肃省	天水地区	漳县	民政部	1980年	1984年	[已撤销]	622428	定西地区,漳县[已撤销]		
-622600	陇南地区	甘肃省	陇南地区	-	民政部	1980年	2003年	[已撤销]	621200	陇南市（地市）		武都地区[1984年]
-622621	武都县	甘肃省	陇南地区	武都县	民政部	1980年	2003年	[已撤销]	621202	陇南市,武都区		
-622622	岷县	甘肃省	陇南地区	岷县	民政部	1980年	1984年	[已撤销]	622429	定西地区,岷县[已撤销]		
-622623	宕昌县	甘肃省	陇南地区	宕昌县	民政部	1980年	2003年	[已撤销]	621223	陇南市,宕昌县		
-622624	成县	甘肃省	陇南地区	成县	民政部	1980年	2003年	[已撤销]	621221	陇南市,成县		
-622625	康县	甘肃省	陇南地区	康县	民政部	1980年	2003年	[已撤销]	621224	陇南市,康县		
-622626	文县	甘肃省	陇南地区	文县	民政部	1980年	2003年	[已撤销]	621222	陇南市,文县		
-622627	西和县	甘肃省	陇南地区	西和县	民政部	1985年	2003年	[已撤销]	621225	陇南市,西和县		
-622628	礼县	甘肃省	陇南地区	礼县	民政部	1985年	2003年	[已撤销]	621226	陇南市,礼县		
-622629	两当县	甘肃省	陇南地区	两当县	民政部	1985年	2003年	[已撤销]	621228	陇南市,两当县		
-622630	徽县	甘肃省	陇南地区	徽县	民政部	1985年	2003年	[已撤销]	621227	陇南市,徽县		
-622700	平凉地区	甘肃省	平凉地区	-	民政部	1980年	2001年	[已撤销]	620800	平凉市（地市）		
-622701	平凉市	甘肃省	平凉地区	平凉市	民政部	1983年	2001年	[已撤销]	620800	平凉市（地市）		
-622721	平凉县	甘肃省	平凉地区	平凉县	民政部	1980年	1982年	[已撤销]	622701	平凉地区,平凉市[已撤销]		
-622722	泾川县	甘肃省	平凉地区	泾川县	民政部	1980年	2001年	[已撤销]	620821	平凉市,泾川县		
-622723	灵台县	甘肃省	平凉地区	灵台县	民政部	1980年	2001年	[已撤销]	620822	平凉市,灵台县		
-622724	崇信县	甘肃省	平凉地区	崇信县	民政部	1980年	2001年	[已撤销]	620823	平凉市,崇信县		
-622725	华亭县	甘肃省	平凉地区	华亭县	民政部	1980年	2001年	[已撤销]	620824	平凉市,华亭县[已撤销]		
-622726	庄浪县	甘肃省	平凉地区	庄浪县	民政部	1980年	2001年	[已撤销]	620825	平凉市,庄浪县		
-622727	静宁县	甘肃省	平凉地区	静宁县	民政部	1980年	2001年	[已撤销]	620826	平凉市,静宁县		
-622800	庆阳地区	甘肃省	庆阳地区	-	民政部	1980年	2001年	[已撤销]	621000	庆阳市（地市）		
-622801	西峰市	甘肃省	庆阳地区	西峰市	民政部	1985年	2001年	[已撤销]	621002	庆阳市,西峰区		
-622821	庆阳县	甘肃省	庆阳地区	庆阳县	民政部	1980年	2001年	[已撤销]	621021	庆阳市,庆城县		
-622822	环县	甘肃省	庆阳地区	环县	民政部	1980年	2001年	[已撤销]	621022	庆阳市,环县		
-622823	华池县	甘肃省	庆阳地区	华池县	民政部	1980年	2001年	[已撤销]	621023	庆阳市,华池县		
-622824	合水县	甘肃省	庆阳地区	合水县	民政部	1980年	2001年	[已撤销]	621024	庆阳市,合水县		
-622825	正宁县	甘肃省	庆阳地区	正宁县	民政部	1980年	2001年	[已撤销]	621025	庆阳市,正宁县		
-622826	宁县	甘肃省	庆阳地区	宁县	民政部	1980年	2001年	[已撤销]	621026	庆阳市,宁县		
-622827	镇原县	甘肃省	庆阳地区	镇原县	民政部	1980年	2001年	[已撤销]	621027	庆阳市,镇原县		
-622900	临夏回族自治州	甘肃省	临夏回族自治州	-	民政部	1980年	2024年					
-622901	临夏市	甘肃省	临夏回族自治州	临夏市	民政部	1983年	2024年					
-622921	临夏县	甘肃省	临夏回族自治州	临夏县	民政部	1980年	2024年					
-622922	康乐县	甘肃省	临夏回族自治州	康乐县	民政部	1980年	2024年					
-622923	永靖县	甘肃省	临夏回族自治州	永靖县	民政部	1980年	2024年					
-622924	广河县	甘肃省	临夏回族自治州	广河县	民政部	1980年	2024年					
-622925	和政县	甘肃省	临夏回族自治州	和政县	民政部	1980年	2024年					
-622926	东乡族自治县	甘肃省	临夏回族自治州	东乡族自治县	民政部	1980年	2024年					
-622927	积石山保安族东乡族撒拉族自治县	甘肃省	临夏回族自治州	积石山保安族东乡族撒拉族自治县	民政部	1980年	2024年					
-623000	甘南藏族自治州	甘肃省	甘南藏族自治州	-	民政部	1980年	2024年					
-623001	合作市	甘肃省	甘南藏族自治州	合作市	民政部	1996年	2024年					
-623021	临潭县	甘肃省	甘南藏族自治州	临潭县	民政部	1980年	2024年					
-623022	卓尼县	甘肃省	甘南藏族自治州	卓尼县	民政部	1980年	2024年					
-623023	舟曲县	甘肃省	甘南藏族自治州	舟曲县	民政部	1980年	2024年					
-623024	迭部县	甘肃省	甘南藏族自治州	迭部县	民政部	1980年	2024年					
-623025	玛曲县	甘肃省	甘南藏族自治州	玛曲县	民政部	1980年	2024年					
-623026	碌曲县	甘肃省	甘南藏族自治州	碌曲县	民政部	1980年	2024年					
-623027	夏河县	甘肃省	甘南藏族自治州	夏河县	民政部	1980年	2024年					
-630000	青海省	青海省	-	-	民政部	1980年	2024年					
-630100	西宁市	青海省	西宁市	-	民政部	1980年	2024年					
-630101	市辖区	青海省	西宁市	市辖区	国标							增设（GB/T 2260-1984）
-630102	城东区	青海省	西宁市	城东区	民政部	1980年	2024年					
-630103	城中区	青海省	西宁市	城中区	民政部	1980年	2024年					
-630104	城西区	青海省	西宁市	城西区	民政部	1980年	2024年					
-630105	城北区	青海省	西宁市	城北区	民政部	1986年	2024年					
-630106	湟中区	青海省	西宁市	湟中区	民政部	2019年	2024年					
-630111	郊区	青海省	西宁市	郊区	民政部	1980年	1985年	[已撤销]	630102,630103,630104,630105	西宁市,城东区,城中区,城西区,城北区		
-630120	西宁市区	青海省	西宁市	西宁市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-630121	大通回族土族自治县	青海省	西宁市	大通回族土族自治县	民政部	1980年	2024年					大通县[1984年]
-630122	湟中县	青海省	西宁市	湟中县	民政部	1999年	2018年	[已撤销]	630106	西宁市,湟中区		
-630123	湟源县	青海省	西宁市	湟源县	民政部	1999年	2024年					
-630200	海东市	青海省	海东市	-	民政部	2013年	2024年					
-630201	市辖区	青海省	海东市	市辖区	国标							
-630202	乐都区	青海省	海东市	乐都区	民政部	2013年	2024年					
-630203	平安区	青海省	海东市	平安区	民政部	2015年	2024年					
-630221	平安县	青海省	海东市	平安县	民政部	2013年	2014年	[已撤销]	630203	海东市,平安区		
-630222	民和回族土族自治县	青海省	海东市	民和回族土族自治县	民政部	2013年	2024年					
-630223	互助土族自治县	青海省	海东市	互助土族自治县	民政部	2013年	2024年					
-630224	化隆回族自治县	青海省	海东市	化隆回族自治县	民政部	2013年	2024年					
-630225	循化撒拉族自治县	青海省	海东市	循化撒拉族自治县	民政部	2013年	2024年					
-632100	海东地区	青海省	海东地区	-	民政部	1980年	2012年	[已撤销]	630200	海东市（地市）		
-632121	平安县	青海省	海东地区	平安县	民政部	1980年	2012年	[已撤销]	630221	海东市,平安县[已撤销]		
-632122	民和回族土族自治县	青海省	海东地区	民和回族土族自治县	民政部	1980年	2012年	[已撤销]	630222	海东市,民和回族土族自治县		民和县[1984年]
-632123	乐都县	青海省	海东地区	乐都县	民政部	1980年	2012年	[已撤销]	630202	海东市,乐都区		
-632124	湟中县	青海省	海东地区	湟中县	民政部	1980年	1998年	[已撤销]	630122	西宁市,湟中县[已撤销]		
-632125	湟源县	青海省	海东地区	湟源县	民政部	1980年	1998年	[已撤销]	630123	西宁市,湟源县		
-632126	互助土族自治县	青海省	海东地区	互助土族自治县	民政部	1980年	2012年	[已撤销]	630223	海东市,互助土族自治县		
-632127	化隆回族自治县	青海省	海东地区	化隆回族自治县	民政部	1980年	2012年	[已撤销]	630224	海东市,化隆回族自治县		
-632128	循化撒拉族自治县	青海省	海东地区	循化撒拉族自治县	民政部	1980年	2012年	[已撤销]	630225	海东市,循化撒拉族自治县		
-632200	海北藏族自治州	青海省	海北藏族自治州	-	民政部	1980年	2024年					
-632221	门源回族自治县	青海省	海北藏族自治州	门源回族自治县	民政部	1980年	2024年					旧称：门源回族自治县(亹源回族自治县)；
-632222	祁连县	青海省	海北藏族自治州	祁连县	民政部	1980年	2024年					
-632223	海晏县	青海省	海北藏族自治州	海晏县	民政部	1980年	2024年					
-632224	刚察县	青海省	海北藏族自治州	刚察县	民政部	1980年	2024年					
-632300	黄南藏族自治州	青海省	黄南藏族自治州	-	民政部	1980年	2024年					
-632301	同仁市	青海省	黄南藏族自治州	同仁市	民政部	2020年	2024年					
-632321	同仁县	青海省	黄南藏族自治州	同仁县	民政部	1980年	2019年	[已撤销]	632301	黄南藏族自治州,同仁市		
-632322	尖扎县	青海省	黄南藏族自治州	尖扎县	民政部	1980年	2024年					
-632323	泽库县	青海省	黄南藏族自治州	泽库县	民政部	1980年	2024年					
-632324	河南蒙古族自治县	青海省	黄南藏族自治州	河南蒙古族自治县	民政部	1981年	2024年					
-632400	直辖行政单位	青海省	直辖行政单位	-	国标			[已撤销]				撤销（GB/T 2260-1988）
-632421	河南蒙古族自治县	青海省	直辖	河南蒙古族自治县	民政部	1980年	1983年	[已撤销]	632324	黄南藏族自治州,河南蒙古族自治县		
-632500	海南藏族自治州	青海省	海南藏族自治州	-	民政部	1980年	2024年					
-632521	共和县	青海省	海南藏族自治州	共和县	民政部	1980年	2024年					
-632522	同德县	青海省	海南藏族自治州	同德县	民政部	1980年	2024年					
-632523	贵德县	青海省	海南藏族自治州	贵德县	民政部	1980年	2024年					
-632524	兴海县	青海省	海南藏族自治州	兴海县	民政部	1980年	2024年					
-632525	贵南县	青海省	海南藏族自治州	贵南县	民政部	1980年	2024年					
-632600	果洛藏族自治州	青海省	果洛藏族自治州	-	民政部	1980年	2024年					
-632621	玛沁县	青海省	果洛藏族自治州	玛沁县	民政部	1980年	2024年					
-632622	班玛县	青海省	果洛藏族自治州	班玛县	民政部	1980年	2024年					
-632623	甘德县	青海省	果洛藏族自治州	甘德县	民政部	1980年	2024年					
-632624	达日县	青海省	果洛藏族自治州	达日县	民政部	1980年	2024年					
-632625	久治县	青海省	果洛藏族自治州	久治县	民政部	1980年	2024年					
-632626	玛多县	青海省	果洛藏族自治州	玛多县	民政部	1980年	2024年					
-632700	玉树藏族自治州	青海省	玉树藏族自治州	-	民政部	1980年	2024年					
-632701	玉树市	青海省	玉树藏族自治州	玉树市	民政部	2013年	2024年					
-632721	玉树县	青海省	玉树藏族自治州	玉树县	民政部	1980年	2012年	[已撤销]	632701	玉树藏族自治州,玉树市		
-632722	杂多县	青海省	玉树藏族自治州	杂多县	民政部	1980年	2024年					
-632723	称多县	青海省	玉树藏族自治州	称多县	民政部	1980年	2024年					
-632724	治多县	青海省	玉树藏族自治州	治多县	民政部	1980年	2024年					
-632725	囊谦县	青海省	玉树藏族自治州	囊谦县	民政部	1980年	2024年					
-632726	曲麻莱县	青海省	玉树藏族自治州	曲麻莱县	民政部	1980年	2024年					
-632800	海西蒙古族藏族自治州	青海省	海西蒙古族藏族自治州	-	民政部	1980年	2024年					
-632801	格尔木市	青海省	海西蒙古族藏族自治州	格尔木市	民政部	1980年	2024年					
-632802	德令哈市	青海省	海西蒙古族藏族自治州	德令哈市	民政部	1988年	2024年					
-632803	茫崖市	青海省	海西蒙古族藏族自治州	茫崖市	民政部	2018年	2024年					
-632821	乌兰县	青海省	海西蒙古族藏族自治州	乌兰县	民政部	1980年	2024年					
-632822	都兰县	青海省	海西蒙古族藏族自治州	都兰县	民政部	1980年	2024年					
-632823	天峻县	青海省	海西蒙古族藏族自治州	天峻县	民政部	1980年	2024年					
-632825	海西蒙古族藏族自治州	青海省	海西蒙古族藏族自治州	大柴旦行政委员会*	非官方							
-640000	宁夏回族自治区	宁夏回族自治区	-	-	民政部	1980年	2024年					
-640100	银川市	宁夏回族自治区	银川市	-	民政部	1980年	2024年					
-640101	市辖区	宁夏回族自治区	银川市	市辖区	国标							增设（GB/T 2260-1984）
-640102	城区	宁夏回族自治区	银川市	城区	民政部	1980年	2001年	[已撤销]	640104	银川市,兴庆区		
-640103	新城区	宁夏回族自治区	银川市	新城区	民政部	1980年	2001年	[已撤销]	640105,640106	银川市,西夏区,金凤区		
-640104	兴庆区	宁夏回族自治区	银川市	兴庆区	民政部	1980年	2024年					郊区[2001年]
-640105	西夏区	宁夏回族自治区	银川市	西夏区	民政部	2002年	2024年					
-640106	金凤区	宁夏回族自治区	银川市	金凤区	民政部	2002年	2024年					
-640111	银川市	宁夏回族自治区	银川市	郊区	非官方							
-640120	银川市区	宁夏回族自治区	银川市	银川市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-640121	永宁县	宁夏回族自治区	银川市	永宁县	民政部	1980年	2024年					
-640122	贺兰县	宁夏回族自治区	银川市	贺兰县	民政部	1980年	2024年					
-640181	灵武市	宁夏回族自治区	银川市	灵武市	民政部	2002年	2024年					
-640200	石嘴山市	宁夏回族自治区	石嘴山市	-	民政部	1980年	2024年					石咀山市[1986年]
-640201	市辖区	宁夏回族自治区	石嘴山市	市辖区	国标							增设（GB/T 2260-1984）
-640202	大武口区	宁夏回族自治区	石嘴山市	大武口区	民政部	1980年	2024年					
-640203	石嘴山市	宁夏回族自治区	石嘴山市	石嘴山区	非官方							
-640204	石炭井区	宁夏回族自治区	石嘴山市	石炭井区	民政部	1980年	2001年	[已撤销]	640202	石嘴山市,大武口区		
-640205	惠农区	宁夏回族自治区	石嘴山市	惠农区	民政部	1980年	2024年					石咀山区[1986年]；石嘴山区[2002年]
-640211	郊区	宁夏回族自治区	石嘴山市	郊区	民政部	1980年	1986年	[已撤销]	640223	石嘴山市,惠农县[已撤销]		
-640220	石嘴山市区	宁夏回族自治区	石嘴山市	石嘴山市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-640221	平罗县	宁夏回族自治区	石嘴山市	平罗县	民政部	1980年	2024年					
-640222	陶乐县	宁夏回族自治区	石嘴山市	陶乐县	民政部	1980年	2002年	[已撤销]	640104	银川市,兴庆区		
-640223	惠农县	宁夏回族自治区	石嘴山市	惠农县	民政部	1987年	2002年	[已撤销]	640205	石嘴山市,惠农区		
-640300	吴忠市	宁夏回族自治区	吴忠市	-	民政部	1998年	2024年					
-640301	市辖区	宁夏回族自治区	吴忠市	市辖区	国标							
-640302	利通区	宁夏回族自治区	吴忠市	利通区	民政部	1998年	2024年					
-640303	红寺堡区	宁夏回族自治区	吴忠市	红寺堡区	民政部	2009年	2024年					
-640321	中卫县	宁夏回族自治区	吴忠市	中卫县	民政部	1998年	2002年	[已撤销]	640500	中卫市（地市）		
-640322	中宁县	宁夏回族自治区	吴忠市	中宁县	民政部	1998年	2002年	[已撤销]	640500	中卫市（地市）		
-640323	盐池县	宁夏回族自治区	吴忠市	盐池县	民政部	1998年	2024年					
-640324	同心县	宁夏回族自治区	吴忠市	同心县	民政部	1998年	2024年					
-640381	青铜峡市	宁夏回族自治区	吴忠市	青铜峡市	民政部	1998年	2024年					
-640382	灵武市	宁夏回族自治区	吴忠市	灵武市	民政部	1998年	2001年	[已撤销]	640181	银川市,灵武市		
-640400	固原市	宁夏回族自治区	固原市	-	民政部	2001年	2024年					
-640401	市辖区	宁夏回族自治区	固原市	市辖区	国标							
-640402	原州区	宁夏回族自治区	固原市	原州区	民政部	2001年	2024年					
-640421	海原县	宁夏回族自治区	固原市	海原县	民政部	2001年	2002年	[已撤销]	640522	中卫市,海原县		
-640422	西吉县	宁夏回族自治区	固原市	西吉县	民政部	2001年	2024年					
-640423	隆德县	宁夏回族自治区	固原市	隆德县	民政部	2001年	2024年					
-640424	泾源县	宁夏回族自治区	固原市	泾源县	民政部	2001年	2024年					
-640425	彭阳县	宁夏回族自治区	固原市	彭阳县	民政部	2001年	2024年					
-640500	中卫市	宁夏回族自治区	中卫市	-	民政部	2003年	2024年					
-640501	市辖区	宁夏回族自治区	中卫市	市辖区	国标							
-640502	沙坡头区	宁夏回族自治区	中卫市	沙坡头区	民政部	2003年	2024年					
-640521	中宁县	宁夏回族自治区	中卫市	中宁县	民政部	2003年	2024年					
-640522	海原县	宁夏回族自治区	中卫市	海原县	民政部	2003年	2024年					
-642100	银南地区	宁夏回族自治区	银南地区	-	民政部	1980年	1997年	[已撤销]	640300	吴忠市（地市）		
-642101	吴忠市	宁夏回族自治区	银南地区	吴忠市	民政部	1983年	1997年	[已撤销]	640300	吴忠市（地市）		
-642102	青铜峡市	宁夏回族自治区	银南地区	青铜峡市	民政部	1984年	1997年	[已撤销]	640381	吴忠市,青铜峡市		
-642103	灵武市	宁夏回族自治区	银南地区	灵武市	民政部	1996年	1997年	[已撤销]	640382	吴忠市,灵武市[已撤销]		
-642121	吴忠县	宁夏回族自治区	银南地区	吴忠县	民政部	1980年	1982年	[已撤销]	642101	银南地区,吴忠市[已撤销]		
-642122	青铜峡县	宁夏回族自治区	银南地区	青铜峡县	民政部	1980年	1983年	[已撤销]	642102	银南地区,青铜峡市[已撤销]		
-642123	中卫县	宁夏回族自治区	银南地区	中卫县	民政部	1980年	1997年	[已撤销]	640321	吴忠市,中卫县[已撤销]		
-642124	中宁县	宁夏回族自治区	银南地区	中宁县	民政部	1980年	1997年	[已撤销]	640322	吴忠市,中宁县[已撤销]		
-642125	灵武县	宁夏回族自治区	银南地区	灵武县	民政部	1980年	1995年	[已撤销]	642103	银南地区,灵武市[已撤销]		
-642126	盐池县	宁夏回族自治区	银南地区	盐池县	民政部	1980年	1997年	[已撤销]	640323	吴忠市,盐池县		
-642127	同心县	宁夏回族自治区	银南地区	同心县	民政部	1980年	1997年	[已撤销]	640324	吴忠市,同心县		
-642200	固原地区	宁夏回族自治区	固原地区	-	民政部	1980年	2000年	[已撤销]	640400	固原市（地市）		
-642221	固原县	宁夏回族自治区	固原地区	固原县	民政部	1980年	2000年	[已撤销]	640400	固原市（地市）		
-642222	海原县	宁夏回族自治区	固原地区	海原县	民政部	1980年	2000年	[已撤销]	640421	固原市,海原县[已撤销]		
-642223	西吉县	宁夏回族自治区	固原地区	西吉县	民政部	1980年	2000年	[已撤销]	640422	固原市,西吉县		
-642224	隆德县	宁夏回族自治区	固原地区	隆德县	民政部	1980年	2000年	[已撤销]	640423	固原市,隆德县		
-642225	泾源县	宁夏回族自治区	固原地区	泾源县	民政部	1980年	2000年	[已撤销]	640424	固原市,泾源县		
-642226	彭阳县	宁夏回族自治区	固原地区	彭阳县	民政部	1983年	2000年	[已撤销]	640425	固原市,彭阳县		
-650000	新疆维吾尔自治区	新疆维吾尔自治区	-	-	民政部	1980年	2024年					
-650100	乌鲁木齐市	新疆维吾尔自治区	乌鲁木齐市	-	民政部	1980年	2024年					
-650101	市辖区	新疆维吾尔自治区	乌鲁木齐市	市辖区	国标							增设（GB/T 2260-1984）
-650102	天山区	新疆维吾尔自治区	乌鲁木齐市	天山区	民政部	1980年	2024年					
-650103	沙依巴克区	新疆维吾尔自治区	乌鲁木齐市	沙依巴克区	民政部	1980年	2024年					
-650104	新市区	新疆维吾尔自治区	乌鲁木齐市	新市区	民政部	1980年	2024年					
-650105	水磨沟区	新疆维吾尔自治区	乌鲁木齐市	水磨沟区	民政部	1980年	2024年					
-650106	头屯河区	新疆维吾尔自治区	乌鲁木齐市	头屯河区	民政部	1980年	2024年					
-650107	达坂城区	新疆维吾尔自治区	乌鲁木齐市	达坂城区	民政部	1980年	2024年					南山区[1988年]；南山矿区[1998年]；南泉区[2001年]
-650108	东山区	新疆维吾尔自治区	乌鲁木齐市	东山区	民政部	1987年	2006年	[已撤销]	650109	乌鲁木齐市,米东区		
-650109	米东区	新疆维吾尔自治区	乌鲁木齐市	米东区	民政部	2007年	2024年					
-650120	乌鲁木齐市区	新疆维吾尔自治区	乌鲁木齐市	乌鲁木齐市区	国标			[已撤销]				撤销（GB/T 2260-1984）
-650121	乌鲁木齐县	新疆维吾尔自治区	乌鲁木齐市	乌鲁木齐县	民政部	1980年	2024年					
-650200	克拉玛依市	新疆维吾尔自治区	克拉玛依市	-	民政部	1980年	2024年					
-650201	市辖区	新疆维吾尔自治区	克拉玛依市	市辖区	国标							增设（GB/T 2260-1984）
-650202	独山子区	新疆维吾尔自治区	克拉玛依市	独山子区	民政部	1980年	2024年					
-650203	克拉玛依区	新疆维吾尔自治区	克拉玛依市	克拉玛依区	民政部	1982年	2024年					
-650204	白碱滩区	新疆维吾尔自治区	克拉玛依市	白碱滩区	民政部	1982年	2024年					
-650205	乌尔禾区	新疆维吾尔自治区	克拉玛依市	乌尔禾区	民政部	1982年	2024年					
-650300	石河子市	新疆维吾尔自治区	石河子市	-	民政部	1980年	1984年	[已撤销]	659001	省直辖县级行政区划,石河子市		
-650400	吐鲁番市	新疆维吾尔自治区	吐鲁番市	-	民政部	2015年	2024年					
-650401	市辖区	新疆维吾尔自治区	吐鲁番市	市辖区	国标							
-650402	高昌区	新疆维吾尔自治区	吐鲁番市	高昌区	民政部	2015年	2024年					
-650421	鄯善县	新疆维吾尔自治区	吐鲁番市	鄯善县	民政部	2015年	2024年					
-650422	托克逊县	新疆维吾尔自治区	吐鲁番市	托克逊县	民政部	2015年	2024年					
-650500	哈密市	新疆维吾尔自治区	哈密市	-	民政部	2016年	2024年					
-650501	市辖区	新疆维吾尔自治区	哈密市	市辖区	国标							
-650502	伊州区	新疆维吾尔自治区	哈密市	伊州区	民政部	2016年	2024年					
-650521	巴里坤哈萨克自治县	新疆维吾尔自治区	哈密市	巴里坤哈萨克自治县	民政部	2016年	2024年					
-650522	伊吾县	新疆维吾尔自治区	哈密市	伊吾县	民政部	2016年	2024年					
-652100	吐鲁番地区	新疆维吾尔自治区	吐鲁番地区	-	民政部	1980年	2014年	[已撤销]	650400	吐鲁番市（地市）		
-652101	吐鲁番市	新疆维吾尔自治区	吐鲁番地区	吐鲁番市	民政部	1984年	2014年	[已撤销]	650400	吐鲁番市（地市）		
-652121	吐鲁番县	新疆维吾尔自治区	吐鲁番地区	吐鲁番县	民政部	1980年	1983年	[已撤销]	652101	吐鲁番地区,吐鲁番市[已撤销]		
-652122	鄯善县	新疆维吾尔自治区	吐鲁番地区	鄯善县	民政部	1980年	2014年	[已撤销]	650421	吐鲁番市,鄯善县		
-652123	托克逊县	新疆维吾尔自治区	吐鲁番地区	托克逊县	民政部	1980年	2014年	[已撤销]	650422	吐鲁番市,托克逊县		
-652200	哈密地区	新疆维吾尔自治区	哈密地区	-	民政部	1980年	2015年	[已撤销]	650500	哈密市（地市）		
-652201	哈密市	新疆维吾尔自治区	哈密地区	哈密市	民政部	1980年	2015年	[已撤销]	650500	哈密市（地市）		
-652221	哈密县	新疆维吾尔自治区	哈密地区	哈密县	民政部	1980年	1982年	[已撤销]	652201	哈密地区,哈密市[已撤销]		
-652222	巴里坤哈萨克自治县	新疆维吾尔自治区	哈密地区	巴里坤哈萨克自治县	民政部	1980年	2015年	[已撤销]	650521	哈密市,巴里坤哈萨克自治县		
-652223	伊吾县	新疆维吾尔自治区	哈密地区	伊吾县	民政部	1980年	2015年	[已撤销]	650522	哈密市,伊吾县		
-652300	昌吉回族自治州	新疆维吾尔自治区	昌吉回族自治州	-	民政部	1980年	2024年					
-652301	昌吉市	新疆维吾尔自治区	昌吉回族自治州	昌吉市	民政部	1983年	2024年					
-652302	阜康市	新疆维吾尔自治区	昌吉回族自治州	阜康市	民政部	1992年	2024年					
-652303	米泉市	新疆维吾尔自治区	昌吉回族自治州	米泉市	民政部	1996年	2006年	[已撤销]	650109	乌鲁木齐市,米东区		
-652321	昌吉县	新疆维吾尔自治区	昌吉回族自治州	昌吉县	民政部	1980年	1982年	[已撤销]	652301	昌吉回族自治州,昌吉市		
-652322	米泉县	新疆维吾尔自治区	昌吉回族自治州	米泉县	民政部	1980年	1995年	[已撤销]	652303	昌吉回族自治州,米泉市[已撤销]		
-652323	呼图壁县	新疆维吾尔自治区	昌吉回族自治州	呼图壁县	民政部	1980年	2024年					
-652324	玛纳斯县	新疆维吾尔自治区	昌吉回族自治州	玛纳斯县	民政部	1980年	2024年					
-652325	奇台县	新疆维吾尔自治区	昌吉回族自治州	奇台县	民政部	1980年	2024年					
-652326	阜康县	新疆维吾尔自治区	昌吉回族自治州	阜康县	民政部	1980年	1991年	[已撤销]	652302	昌吉回族自治州,阜康市		
-652327	吉木萨尔县	新疆维吾尔自治区	昌吉回族自治州	吉木萨尔县	民政部	1980年	2024年					
-652328	木垒哈萨克自治县	新疆维吾尔自治区	昌吉回族自治州	木垒哈萨克自治县	民政部	1980年	2024年					
-652400	伊犁哈萨克自治州	新疆维吾尔自治区	伊犁哈萨克自治州	-	民政部	1980年	1983年	[已撤销]	654000	伊犁哈萨克自治州（地市）		
-652401	伊宁市	新疆维吾尔自治区	伊犁哈萨克自治州	伊宁市	民政部	1980年	1983年	[已撤销]	654101	伊犁地区,伊宁市[已撤销]		奎屯市[1981年]
-652402	一区	新疆维吾尔自治区	伊犁哈萨克自治州	一区	民政部	1980年	1982年	[已撤销]	652401	伊犁哈萨克自治州,伊宁市[已撤销]		伊宁市[1981年]
-652403	二区	新疆维吾尔自治区	伊犁哈萨克自治州	二区	民政部	1980年	1982年	[已撤销]	652401	伊犁哈萨克自治州,伊宁市[已撤销]		一区[1981年]
-652404	奎屯市	新疆维吾尔自治区	伊犁哈萨克自治州	奎屯市	民政部	1980年	1983年	[已撤销]	654001	伊犁哈萨克自治州,奎屯市[已撤销]		二区[1981年]
-652421	伊宁县	新疆维吾尔自治区	伊犁哈萨克自治州	伊宁县	民政部	1980年	1983年	[已撤销]	654121	伊犁地区,伊宁县[已撤销]		
-652422	察布查尔锡伯自治县	新疆维吾尔自治区	伊犁哈萨克自治州	察布查尔锡伯自治县	民政部	1980年	1983年	[已撤销]	654122	伊犁地区,察布查尔锡伯自治县[已撤销]		
-652423	霍城县	新疆维吾尔自治区	伊犁哈萨克自治州	霍城县	民政部	1980年	1983年	[已撤销]	654123	伊犁地区,霍城县[已撤销]		
-652424	巩留县	新疆维吾尔自治区	伊犁哈萨克自治州	巩留县	民政部	1980年	1983年	[已撤销]	654124	伊犁地区,巩留县[已撤销]		
-652425	新源县	新疆维吾尔自治区	伊犁哈萨克自治州	新源县	民政部	1980年	1983年	[已撤销]	654125	伊犁地区,新源县[已撤销]		
-652426	昭苏县	新疆维吾尔自治区	伊犁哈萨克自治州	昭苏县	民政部	1980年	1983年	[已撤销]	654126	伊犁地区,昭苏县[已撤销]		
-652427	特克斯县	新疆维吾尔自治区	伊犁哈萨克自治州	特克斯县	民政部	1980年	1983年	[已撤销]	654027	伊犁地区,特克斯县[已撤销]		
-652428	尼勒克县	新疆维吾尔自治区	伊犁哈萨克自治州	尼勒克县	民政部	1980年	1983年	[已撤销]	654128	伊犁地区,尼勒克县[已撤销]		
-652500	塔城地区	新疆维吾尔自治区	塔城地区	-	民政部	1980年	1983年	[已撤销]	654200	塔城地区（地市）		
-652521	塔城县	新疆维吾尔自治区	塔城地区	塔城县	民政部	1980年	1983年	[已撤销]	654201	塔城地区,塔城市		
-652522	额敏县	新疆维吾尔自治区	塔城地区	额敏县	民政部	1980年	1983年	[已撤销]	654221	塔城地区,额敏县		
-652523	乌苏县	新疆维吾尔自治区	塔城地区	乌苏县	民政部	1980年	1983年	[已撤销]	654222	塔城地区,乌苏县[已撤销]		
-652524	沙湾县	新疆维吾尔自治区	塔城地区	沙湾县	民政部	1980年	1983年	[已撤销]	654223	塔城地区,沙湾县[已撤销]		
-652525	托里县	新疆维吾尔自治区	塔城地区	托里县	民政部	1980年	1983年	[已撤销]	654224	塔城地区,托里县		
-652526	裕民县	新疆维吾尔自治区	塔城地区	裕民县	民政部	1980年	1983年	[已撤销]	654225	塔城地区,裕民县		
-652527	和布克赛尔蒙古自治县	新疆维吾尔自治区	塔城地区	和布克赛尔蒙古自治县	民政部	1980年	1983年	[已撤销]	654226	塔城地区,和布克赛尔蒙古自治县		
-652600	阿勒泰地区	新疆维吾尔自治区	阿勒泰地区	-	民政部	1980年	1983年	[已撤销]	654300	阿勒泰地区（地市）		
-652601		新疆维吾尔自治区	阿勒泰地区		非官方						1973年	
-652621	阿勒泰县	新疆维吾尔自治区	阿勒泰地区	阿勒泰县	民政部	1980年	1983年	[已撤销]	654301	阿勒泰地区,阿勒泰市		
-652622	布尔津县	新疆维吾尔自治区	阿勒泰地区	布尔津县	民政部	1980年	1983年	[已撤销]	654321	阿勒泰地区,布尔津县		
-652623	富蕴县	新疆维吾尔自治区	阿勒泰地区	富蕴县	民政部	1980年	1983年	[已撤销]	654322	阿勒泰地区,富蕴县		
-652624	福海县	新疆维吾尔自治区	阿勒泰地区	福海县	民政部	1980年	1983年	[已撤销]	654323	阿勒泰地区,福海县		
-652625	哈巴河县	新疆维吾尔自治区	阿勒泰地区	哈巴河县	民政部	1980年	1983年	[已撤销]	654324	阿勒泰地区,哈巴河县		
-652626	青河县	新疆维吾尔自治区	阿勒泰地区	青河县	民政部	1980年	1983年	[已撤销]	654325	阿勒泰地区,青河县		
-652627	吉木乃县	新疆维吾尔自治区	阿勒泰地区	吉木乃县	民政部	1980年	1983年	[已撤销]	654326	阿勒泰地区,吉木乃县		
-652700	博尔塔拉蒙古自治州	新疆维吾尔自治区	博尔塔拉蒙古自治州	-	民政部	1980年	2024年					
-652701	博乐市	新疆维吾尔自治区	博尔塔拉蒙古自治州	博乐市	民政部	1985年	2024年					
-652702	阿拉山口市	新疆维吾尔自治区	博尔塔拉蒙古自治州	阿拉山口市	民政部	2012年	2024年					
-652721	博乐县	新疆维吾尔自治区	博尔塔拉蒙古自治州	博乐县	民政部	1980年	1984年	[已撤销]	652701	博尔塔拉蒙古自治州,博乐市		
-652722	精河县	新疆维吾尔自治区	博尔塔拉蒙古自治州	精河县	民政部	1980年	2024年					
-652723	温泉县	新疆维吾尔自治区	博尔塔拉蒙古自治州	温泉县	民政部	1980年	2024年					
-652800	巴音郭楞蒙古自治州	新疆维吾尔自治区	巴音郭楞蒙古自治州	-	民政部	1980年	2024年					
-652801	库尔勒市	新疆维吾尔自治区	巴音郭楞蒙古自治州	库尔勒市	民政部	1980年	2024年					
-652821	库尔勒县	新疆维吾尔自治区	巴音郭楞蒙古自治州	库尔勒县	民政部	1980年	1982年	[已撤销]	652801	巴音郭楞蒙古自治州,库尔勒市		
-652822	轮台县	新疆维吾尔自治区	巴音郭楞蒙古自治州	轮台县	民政部	1980年	2024年					
-652823	尉犁县	新疆维吾尔自治区	巴音郭楞蒙古自治州	尉犁县	民政部	1980年	2024年					
-652824	若羌县	新疆维吾尔自治区	巴音郭楞蒙古自治州	若羌县	民政部	1980年	2024年					旧称：若羌县(婼羌县)；
-652825	且末县	新疆维吾尔自治区	巴音郭楞蒙古自治州	且末县	民政部	1980年	2024年					
-652826	焉耆回族自治县	新疆维吾尔自治区	巴音郭楞蒙古自治州	焉耆回族自治县	民政部	1980年	2024年					
-652827	和静县	新疆维吾尔自治区	巴音郭楞蒙古自治州	和静县	民政部	1980年	2024年					
-652828	和硕县	新疆维吾尔自治区	巴音郭楞蒙古自治州	和硕县	民政部	1980年	2024年					
-652829	博湖县	新疆维吾尔自治区	巴音郭楞蒙古自治州	博湖县	民政部	1980年	2024年					
-652900	阿克苏地区	新疆维吾尔自治区	阿克苏地区	-	民政部	1980年	2024年					
-652901	阿克苏市	新疆维吾尔自治区	阿克苏地区	阿克苏市	民政部	1983年	2024年					
-652902	库车市	新疆维吾尔自治区	阿克苏地区	库车市	民政部	2019年	2024年					
-652921	阿克苏县	新疆维吾尔自治区	阿克苏地区	阿克苏县	民政部	1980年	1982年	[已撤销]	652901	阿克苏地区,阿克苏市		
-652922	温宿县	新疆维吾尔自治区	阿克苏地区	温宿县	民政部	1980年	2024年					
-652923	库车县	新疆维吾尔自治区	阿克苏地区	库车县	民政部	1980年	2018年	[已撤销]	652902	阿克苏地区,库车市		
-652924	沙雅县	新疆维吾尔自治区	阿克苏地区	沙雅县	民政部	1980年	2024年					
-652925	新和县	新疆维吾尔自治区	阿克苏地区	新和县	民政部	1980年	2024年					
-652926	拜城县	新疆维吾尔自治区	阿克苏地区	拜城县	民政部	1980年	2024年					
-652927	乌什县	新疆维吾尔自治区	阿克苏地区	乌什县	民政部	1980年	2024年					
-652928	阿瓦提县	新疆维吾尔自治区	阿克苏地区	阿瓦提县	民政部	1980年	2024年					
-652929	柯坪县	新疆维吾尔自治区	阿克苏地区	柯坪县	民政部	1980年	2024年					
-653000	克孜勒苏柯尔克孜自治州	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	-	民政部	1980年	2024年					
-653001	阿图什市	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	阿图什市	民政部	1986年	2024年					
-653021	阿图什县	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	阿图什县	民政部	1980年	1985年	[已撤销]	653001	克孜勒苏柯尔克孜自治州,阿图什市		
-653022	阿克陶县	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	阿克陶县	民政部	1980年	2024年					
-653023	阿合奇县	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	阿合奇县	民政部	1980年	2024年					
-653024	乌恰县	新疆维吾尔自治区	克孜勒苏柯尔克孜自治州	乌恰县	民政部	1980年	2024年					
-653100	喀什地区	新疆维吾尔自治区	喀什地区	-	民政部	1980年	2024年					
-653101	喀什市	新疆维吾尔自治区	喀什地区	喀什市	民政部	1980年	2024年					
-653121	疏附县	新疆维吾尔自治区	喀什地区	疏附县	民政部	1980年	2024年					
-653122	疏勒县	新疆维吾尔自治区	喀什地区	疏勒县	民政部	1980年	2024年					
-653123	英吉沙县	新疆维吾尔自治区	喀什地区	英吉沙县	民政部	1980年	2024年					
-653124	泽普县	新疆维吾尔自治区	喀什地区	泽普县	民政部	1980年	2024年					
-653125	莎车县	新疆维吾尔自治区	喀什地区	莎车县	民政部	1980年	2024年					
-653126	叶城县	新疆维吾尔自治区	喀什地区	叶城县	民政部	1980年	2024年					
-653127	麦盖提县	新疆维吾尔自治区	喀什地区	麦盖提县	民政部	1980年	2024年					
-653128	岳普湖县	新疆维吾尔自治区	喀什地区	岳普湖县	民政部	1980年	2024年					
-653129	伽师县	新疆维吾尔自治区	喀什地区	伽师县	民政部	1980年	2024年					
-653130	巴楚县	新疆维吾尔自治区	喀什地区	巴楚县	民政部	1980年	2024年					
-653131	塔什库尔干塔吉克自治县	新疆维吾尔自治区	喀什地区	塔什库尔干塔吉克自治县	民政部	1980年	2024年					
-653200	和田地区	新疆维吾尔自治区	和田地区	-	民政部	1980年	2024年					旧称：和田地区(和阗地区)；
-653201	和田市	新疆维吾尔自治区	和田地区	和田市	民政部	1983年	2024年					旧称：和田市(和阗市)；
-653221	和田县	新疆维吾尔自治区	和田地区	和田县	民政部	1980年	2024年					旧称：和田县(和阗县)；
-653222	墨玉县	新疆维吾尔自治区	和田地区	墨玉县	民政部	1980年	2024年					
-653223	皮山县	新疆维吾尔自治区	和田地区	皮山县	民政部	1980年	2024年					
-653224	洛浦县	新疆维吾尔自治区	和田地区	洛浦县	民政部	1980年	2024年					
-653225	策勒县	新疆维吾尔自治区	和田地区	策勒县	民政部	1980年	2024年					
-653226	于田县	新疆维吾尔自治区	和田地区	于田县	民政部	1980年	2024年					旧称：于田县(于阗县)；
-653227	民丰县	新疆维吾尔自治区	和田地区	民丰县	民政部	1980年	2024年					
-653228	和康县	新疆维吾尔自治区	和田地区	和康县	民政部	2024年	2024年					
-653229	和安县	新疆维吾尔自治区	和田地区	和安县	民政部	2024年	2024年					
-654000	伊犁哈萨克自治州	新疆维吾尔自治区	伊犁哈萨克自治州	-	民政部	1984年	2024年					
-654001	奎屯市	新疆维吾尔自治区	伊犁哈萨克自治州	奎屯市	民政部	1984年	2000年	[已撤销]	654003	伊犁哈萨克自治州,奎屯市		
-654002	伊宁市	新疆维吾尔自治区	伊犁哈萨克自治州	伊宁市	民政部	2001年	2024年					
-654003	奎屯市	新疆维吾尔自治区	伊犁哈萨克自治州	奎屯市	民政部	2001年	2024年					
-654004	霍尔果斯市	新疆维吾尔自治区	伊犁哈萨克自治州	霍尔果斯市	民政部	2014年	2024年					
-654021	伊宁县	新疆维吾尔自治区	伊犁哈萨克自治州	伊宁县	民政部	2001年	2024年					
-654022	察布查尔锡伯自治县	新疆维吾尔自治区	伊犁哈萨克自治州	察布查尔锡伯自治县	民政部	2001年	2024年					
-654023	霍城县	新疆维吾尔自治区	伊犁哈萨克自治州	霍城县	民政部	2001年	2024年					
-654024	巩留县	新疆维吾尔自治区	伊犁哈萨克自治州	巩留县	民政部	2001年	2024年					
-654025	新源县	新疆维吾尔自治区	伊犁哈萨克自治州	新源县	民政部	2001年	2024年					
-654026	昭苏县	新疆维吾尔自治区	伊犁哈萨克自治州	昭苏县	民政部	2001年	2024年					
-654027	特克斯县	新疆维吾尔自治区	伊犁哈萨克自治州	特克斯县	民政部	2001年	2024年					
-654028	尼勒克县	新疆维吾尔自治区	伊犁哈萨克自治州	尼勒克县	民政部	2001年	2024年					
-654100	伊犁地区	新疆维吾尔自治区	伊犁地区	-	民政部	1984年	2000年	[已撤销]	654002	伊犁哈萨克自治州,伊宁市		
-654101	伊宁市	新疆维吾尔自治区	伊犁地区	伊宁市	民政部	1984年	2000年	[已撤销]	654002	伊犁哈萨克自治州,伊宁市		
-654121	伊宁县	新疆维吾尔自治区	伊犁地区	伊宁县	民政部	1984年	2000年	[已撤销]	654021	伊犁哈萨克自治州,伊宁县		
-654122	察布查尔锡伯自治县	新疆维吾尔自治区	伊犁地区	察布查尔锡伯自治县	民政部	1984年	2000年	[已撤销]	654022	伊犁哈萨克自治州,察布查尔锡伯自治县		
-654123	霍城县	新疆维吾尔自治区	伊犁地区	霍城县	民政部	1984年	2000年	[已撤销]	654023	伊犁哈萨克自治州,霍城县		
-654124	巩留县	新疆维吾尔自治区	伊犁地区	巩留县	民政部	1984年	2000年	[已撤销]	654024	伊犁哈萨克自治州,巩留县		
-654125	新源县	新疆维吾尔自治区	伊犁地区	新源县	民政部	1984年	2000年	[已撤销]	654025	伊犁哈萨克自治州,新源县		
-654126	昭苏县	新疆维吾尔自治区	伊犁地区	昭苏县	民政部	1984年	2000年	[已撤销]	654026	伊犁哈萨克自治州,昭苏县		
-654127	特克斯县	新疆维吾尔自治区	伊犁地区	特克斯县	民政部	1984年	2000年	[已撤销]	654027	伊犁哈萨克自治州,特克斯县		
-654128	尼勒克县	新疆维吾尔自治区	伊犁地区	尼勒克县	民政部	1984年	2000年	[已撤销]	654028	伊犁哈萨克自治州,尼勒克县		
-654200	塔城地区	新疆维吾尔自治区	塔城地区	-	民政部	1984年	2024年					
-654201	塔城市	新疆维吾尔自治区	塔城地区	塔城市	民政部	1984年	2024年					
-654202	乌苏市	新疆维吾尔自治区	塔城地区	乌苏市	民政部	1996年	2024年					
-654203	沙湾市	新疆维吾尔自治区	塔城地区	沙湾市	民政部	2021年	2024年					
-654221	额敏县	新疆维吾尔自治区	塔城地区	额敏县	民政部	1984年	2024年					
-654222	乌苏县	新疆维吾尔自治区	塔城地区	乌苏县	民政部	1984年	1995年	[已撤销]	654202	塔城地区,乌苏市		
-654223	沙湾县	新疆维吾尔自治区	塔城地区	沙湾县	民政部	1984年	2020年	[已撤销]	654203	塔城地区,沙湾市		
-654224	托里县	新疆维吾尔自治区	塔城地区	托里县	民政部	1984年	2024年					
-654225	裕民县	新疆维吾尔自治区	塔城地区	裕民县	民政部	1984年	2024年					
-654226	和布克赛尔蒙古自治县	新疆维吾尔自治区	塔城地区	和布克赛尔蒙古自治县	民政部	1984年	2024年					
-654300	阿勒泰地区	新疆维吾尔自治区	阿勒泰地区	-	民政部	1984年	2024年					
-654301	阿勒泰市	新疆维吾尔自治区	阿勒泰地区	阿勒泰市	民政部	1984年	2024年					
-654321	布尔津县	新疆维吾尔自治区	阿勒泰地区	布尔津县	民政部	1984年	2024年					
-654322	富蕴县	新疆维吾尔自治区	阿勒泰地区	富蕴县	民政部	1984年	2024年					
-654323	福海县	新疆维吾尔自治区	阿勒泰地区	福海县	民政部	1984年	2024年					
-654324	哈巴河县	新疆维吾尔自治区	阿勒泰地区	哈巴河县	民政部	1984年	2024年					
-654325	青河县	新疆维吾尔自治区	阿勒泰地区	青河县	民政部	1984年	2024年					
-654326	吉木乃县	新疆维吾尔自治区	阿勒泰地区	吉木乃县	民政部	1984年	2024年					
-659000	省直辖行政单位	新疆维吾尔自治区	省直辖行政单位	-	国标							增设（GB/T 2260-1988）
-659001	石河子市	新疆维吾尔自治区	省直辖县级行政区划	石河子市	民政部	1985年	2024年					
-659002	阿拉尔市	新疆维吾尔自治区	省直辖县级行政区划	阿拉尔市	民政部	2002年	2024年					
-659003	图木舒克市	新疆维吾尔自治区	省直辖县级行政区划	图木舒克市	民政部	2002年	2024年					
-659004	五家渠市	新疆维吾尔自治区	省直辖县级行政区划	五家渠市	民政部	2002年	2024年					
-659005	北屯市	新疆维吾尔自治区	省直辖县级行政区划	北屯市	民政部	2011年	2024年					
-659006	铁门关市	新疆维吾尔自治区	省直辖县级行政区划	铁门关市	民政部	2012年	2024年					
-659007	双河市	新疆维吾尔自治区	省直辖县级行政区划	双河市	民政部	2014年	2024年					
-659008	可克达拉市	新疆维吾尔自治区	省直辖县级行政区划	可克达拉市	民政部	2015年	2024年					
-659009	昆玉市	新疆维吾尔自治区	省直辖县级行政区划	昆玉市	民政部	2016年	2024年					
-659010	胡杨河市	新疆维吾尔自治区	省直辖县级行政区划	胡杨河市	民政部	2019年	2024年					
-659011	新星市	新疆维吾尔自治区	省直辖县级行政区划	新星市	民政部	2021年	2024年					
-659012	白杨市	新疆维吾尔自治区	省直辖县级行政区划	白杨市	民政部	2023年	2024年					
-710000	台湾省	台湾省	-	-	民政部	2013年	2024年					
-810000	香港特别行政区	香港特别行政区	-	-	民政部	2013年	2024年					
-820000	澳门特别行政区	澳门特别行政区	-	-	民政部	2013年	2024年					
-830000	台湾省	台湾省	-	-	非官方							非国标，用于身份证
-"""
-
-output_data = batch_transfer_codes_with_names_full_columns(input_data)
-print(output_data)
+def split_header(lines):
+    """跳过开头的空行，返回 (表头行, 剩余行迭代器)"""
+    lines = iter(lines)
+    for line in lines:
+        if line.strip():
+            return line.rstrip('\r\n'), lines
+    return None, lines
+
+
+def split_rows(lines):
+    """逐行按制表符分割"""
+    for line in lines:
+        yield line.rstrip('\r\n').split('\t')
+
+
+def stream_transfer_codes(infile, outfile, closure=None):
+    """流式处理区划历史表：逐行读入、逐行写出，内存只保留映射表
+
+    未提供 closure 时分两遍处理：第一遍构建转归闭包，第二遍改写并输出；
+    不可回退的输入（如标准输入）会先转存到临时文件。
+    返回输出的数据行数。
+    """
+    import shutil
+    import tempfile
+
+    spool = None
+    try:
+        if closure is None:
+            if not infile.seekable():
+                spool = tempfile.TemporaryFile('w+', encoding='utf-8', newline='')
+                shutil.copyfileobj(infile, spool)
+                infile = spool
+            infile.seek(0)
+            _, lines = split_header(infile)
+            closure, cycles = resolve_transfers(*build_transfer_mappings(split_rows(lines)))
+            for cycle in cycles:
+                print(f"检测到循环转归: {' -> '.join(cycle + cycle[:1])}", file=sys.stderr)
+            infile.seek(0)
+
+        header, lines = split_header(infile)
+        if header is None:
+            return 0
+        outfile.write(header + '\n')
+
+        count = 0
+        for row in split_rows(lines):
+            if len(row) < 11:  # 跳过无效行
+                continue
+
+            orig_code = row[0].strip()
+            final_code, final_name = closure.get(orig_code, (orig_code, None))
+
+            # 只更新第10和11列，直接在当前行上修改
+            row[9] = final_code
+            if final_name is not None:
+                row[10] = final_name
+
+            outfile.write('\t'.join(row) + '\n')
+            count += 1
+        return count
+    finally:
+        if spool is not None:
+            spool.close()
+
+
+def parse_year(text):
+    """'1980年' -> 1980，空值返回None"""
+    text = text.strip().rstrip('年')
+    return int(text) if text.isdigit() else None
+
+
+def read_history(path=DEFAULT_HISTORY_PATH):
+    """读取区划历史表文本"""
+    with open(path, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def load_transfer_table(path=DEFAULT_HISTORY_PATH):
+    """直接从区划历史表文件构建转归闭包表，不生成整表文本"""
+    with open(path, encoding='utf-8', newline='') as f:
+        _, lines = split_header(f)
+        return resolve_transfers(*build_transfer_mappings(split_rows(lines)))
+
+
+def __getattr__(name):
+    # 兼容旧代码中的 idFilter.input_data，按需从数据文件读取
+    if name == 'input_data':
+        return read_history()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    # 用法: python idFilter.py [输入文件|-] [输出文件]
+    # 不带参数时处理 idHistory.tsv
+    if len(sys.argv) > 1:
+        if sys.argv[1] == '-':
+            source = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+        else:
+            source = open(sys.argv[1], encoding='utf-8', newline='')
+        if len(sys.argv) > 2:
+            target = open(sys.argv[2], 'w', encoding='utf-8', newline='')
+        else:
+            target = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='')
+        with source, target:
+            stream_transfer_codes(source, target)
+    else:
+        output_data = batch_transfer_codes_with_names_full_columns(read_history())
+        print(output_data)
@@ -0,0 +1,141 @@
+# 合成身份证号码生成器：基于真实行政区划代码生成校验通过的号码，可按比例混入无效号码，供压测和基准测试使用
+
+import argparse
+import datetime
+import sys
+
+import numpy as np
+
+import idBatch
+import idChecksum
+import idDate
+
+
+def _region_codes(county_only=True):
+    """行政区划代码列表，默认只取县区级（末两位不为00）"""
+    from idRegion import region_data
+    codes = [code for code in region_data.keys() if not (county_only and code.endswith("00"))]
+    return np.array([int(code) for code in codes], dtype=np.int64)
+
+
+def _write_digits(mat, col, values, width):
+    for k in range(width):
+        mat[:, col + k] = 48 + (values // 10 ** (width - 1 - k)) % 10
+
+
+def generate(n, seed=None, regions=None, region_weights=None, years=(1940, 2020),
+             year_weights=None, male_ratio=0.5, bad_checksum=0.0, bad_date=0.0,
+             unknown_region=0.0, today=None):
+    """生成 n 个身份证号码，返回 (n, 18) uint8 矩阵（ASCII）
+
+    regions/region_weights: 候选6位代码（整数或字符串）及其权重，默认取全部县区级代码等概率；
+    years/year_weights: 出生年份范围 (起, 止)，或 {年份: 权重}，超出 [MIN_YEAR, 今年] 的部分被忽略；
+    male_ratio: 男性比例；
+    bad_checksum/bad_date/unknown_region: 校验码错误、日期不存在、未知区划代码的比例（互斥）。
+    """
+    rng = np.random.default_rng(seed)
+    today = today or datetime.date.today()
+
+    if regions is None:
+        codes = _region_codes()
+    else:
+        codes = np.array([int(code) for code in regions], dtype=np.int64)
+    p = None
+    if region_weights is not None:
+        p = np.asarray(region_weights, dtype=np.float64)
+        p = p / p.sum()
+    region = codes[rng.choice(len(codes), size=n, p=p)]
+
+    # 出生年份限制在校验认可的范围 [MIN_YEAR, 今年] 内，否则"有效"号码也会校验失败
+    if year_weights is not None:
+        year_weights = {year: w for year, w in year_weights.items()
+                        if idDate.MIN_YEAR <= year <= today.year}
+        if not year_weights:
+            raise ValueError(f"year_weights 中没有 {idDate.MIN_YEAR}-{today.year} 范围内的年份")
+        choices = np.array(list(year_weights), dtype=np.int64)
+        weights = np.array(list(year_weights.values()), dtype=np.float64)
+        year = rng.choice(choices, size=n, p=weights / weights.sum())
+    else:
+        first, last = max(years[0], idDate.MIN_YEAR), min(years[1], today.year)
+        if first > last:
+            raise ValueError(f"出生年份范围 {years} 与 {idDate.MIN_YEAR}-{today.year} 无交集")
+        year = rng.integers(first, last + 1, size=n)
+    month = rng.integers(1, 13, size=n)
+    day = 1 + (rng.random(n) * idDate.days_in_month(year, month)).astype(np.int64)
+    # 今年晚于今天的日期，在今年1月1日至今天之间重新抽取
+    future = year * 10000 + month * 100 + day > idDate.today_ymd(today)
+    if future.any():
+        start = np.datetime64(f"{today.year:04d}-01-01")
+        offset = rng.integers(0, today.timetuple().tm_yday, size=int(future.sum()))
+        dates = (start + offset).astype("datetime64[D]")
+        month[future] = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        day[future] = (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+    male = rng.random(n) < male_ratio
+    sequence = rng.integers(0, 500, size=n) * 2 + male
+
+    # 互斥地划分无效类型
+    u = rng.random(n)
+    checksum_mask = u < bad_checksum
+    date_mask = (u >= bad_checksum) & (u < bad_checksum + bad_date)
+    region_mask = ((u >= bad_checksum + bad_date)
+                   & (u < bad_checksum + bad_date + unknown_region))
+
+    # 不存在的日期：13月、32日或2月30日
+    kind = rng.integers(0, 3, size=n)
+    month = np.where(date_mask & (kind == 0), 13, month)
+    day = np.where(date_mask & (kind == 1), 32, day)
+    month = np.where(date_mask & (kind == 2), 2, month)
+    day = np.where(date_mask & (kind == 2), 30, day)
+    # 未知区划：省级代码段 00、90-99 不存在
+    region = np.where(region_mask, rng.integers(900000, 1000000, size=n), region)
+
+    mat = np.empty((n, 18), dtype=np.uint8)
+    _write_digits(mat, 0, region, 6)
+    _write_digits(mat, 6, year, 4)
+    _write_digits(mat, 10, month, 2)
+    _write_digits(mat, 12, day, 2)
+    _write_digits(mat, 14, sequence, 3)
+    mat[:, 17] = idChecksum.check_codes(mat)
+    # 校验码错误：把正确校验码在 CHECK_CODES 中的位置平移 1-10 位，保证与正确值不同
+    correct = np.argmax(idBatch.MAPPING == mat[checksum_mask, 17, None], axis=1)
+    mat[checksum_mask, 17] = idBatch.MAPPING[(correct + 1 + rng.integers(
+        0, 10, size=int(checksum_mask.sum()))) % 11]
+    return mat
+
+
+def to_strings(mat):
+    """(n, 18) uint8 矩阵转为字符串列表"""
+    text = mat.tobytes().decode("ascii")
+    return [text[i:i + 18] for i in range(0, len(text), 18)]
+
+
+def stream(n, chunk_size=100_000, seed=None, **options):
+    """分块生成，逐个产出字符串，内存只保留一块"""
+    rng = np.random.default_rng(seed)
+    remaining = n
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield from to_strings(generate(size, seed=rng.integers(1 << 63), **options))
+        remaining -= size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成合成身份证号码（每行一个）")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--years", type=int, nargs=2, default=(1940, 2020), metavar=("起", "止"))
+    parser.add_argument("--male-ratio", type=float, default=0.5)
+    parser.add_argument("--bad-checksum", type=float, default=0.0, help="校验码错误比例")
+    parser.add_argument("--bad-date", type=float, default=0.0, help="日期不存在比例")
+    parser.add_argument("--unknown-region", type=float, default=0.0, help="未知区划代码比例")
+    args = parser.parse_args(argv)
+
+    ids = stream(args.count, seed=args.seed, years=tuple(args.years),
+                 male_ratio=args.male_ratio, bad_checksum=args.bad_checksum,
+                 bad_date=args.bad_date, unknown_region=args.unknown_region)
+    sys.stdout.writelines(f"{id_num}\n" for id_num in ids)
+
+
+if __name__ == "__main__":
+    main()
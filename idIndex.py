@@ -0,0 +1,226 @@
+# 行政区划二进制索引：由 idCode.region_data 编译，mmap 加载，二分查找
+
+import bisect
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"IDRI"
+VERSION = 2
+# 文件头：魔数、版本、条目数、字符串数、字符串表字节数、构建时 idCode.py 的大小与修改时间（纳秒，不存在时为0）
+HEADER = struct.Struct("<4sIIIIQq")
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(ROOT, "idCode.bin")
+SOURCE = os.path.join(ROOT, "idCode.py")
+
+
+def _source_stamp():
+    try:
+        st = os.stat(SOURCE)
+    except FileNotFoundError:
+        return 0, 0
+    return st.st_size, st.st_mtime_ns
+
+
+def build(path=DEFAULT_PATH, data=None):
+    """将 region_data 编译为二进制索引文件
+
+    布局（小端）：文件头 | int32 代码[N] | uint32 字符串编号[N][4]
+                 | uint32 字符串偏移[S+1] | UTF-8 字符串表
+    相同字符串只存一份。文件头记录此时 idCode.py 的大小与修改时间，供 is_fresh() 判断索引是否过期。
+    """
+    if data is None:
+        from idCode import region_data as data
+
+    strings = {}
+    codes = []
+    refs = []
+    for code in sorted(data, key=int):
+        codes.append(int(code))
+        for text in data[code]:
+            refs.append(strings.setdefault(text, len(strings)))
+
+    offsets = [0]
+    blob = bytearray()
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(codes), len(strings), len(blob), *_source_stamp()))
+        f.write(struct.pack(f"<{len(codes)}i", *codes))
+        f.write(struct.pack(f"<{len(refs)}I", *refs))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    os.replace(tmp, path)
+    return path
+
+
+def is_fresh(path=DEFAULT_PATH):
+    """索引是否不旧于 idCode.py：只读文件头并比较 idCode.py 的大小与修改时间，不读取源文件内容
+
+    索引不存在、版本不符或 idCode.py 在构建后被修改时返回 False；idCode.py 不存在时索引是唯一的数据，视为最新。
+    """
+    try:
+        with open(path, "rb") as f:
+            magic, version, *_, size, mtime = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return False
+    if magic != MAGIC or version != VERSION:
+        return False
+    stamp = _source_stamp()
+    return stamp == (0, 0) or stamp == (size, mtime)
+
+
+class RegionLookup:
+    """按升序整数代码数组二分查找的只读映射，接口与 region_data 字典一致
+
+    子类提供升序的 _codes 与按行号生成记录的 _record(i)。
+    """
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        return self.keys()
+
+    def __contains__(self, code):
+        return self._find(code) >= 0
+
+    def __getitem__(self, code):
+        i = self._find(code)
+        if i < 0:
+            raise KeyError(code)
+        return self._record(i)
+
+    def _find(self, code):
+        """二分查找代码所在行，未找到返回-1"""
+        # 只接受ASCII数字，与 dict 的键比较一致（全角等数字不会命中）
+        if not (isinstance(code, str) and len(code) == 6 and code.isascii() and code.isdigit()):
+            return -1
+        key = int(code)
+        i = bisect.bisect_left(self._codes, key)
+        if i < len(self._codes) and self._codes[i] == key:
+            return i
+        return -1
+
+    def get(self, code, default=None):
+        i = self._find(code)
+        return default if i < 0 else self._record(i)
+
+    def keys(self):
+        return (f"{code:06d}" for code in self._codes)
+
+    def values(self):
+        return (self._record(i) for i in range(len(self._codes)))
+
+    def items(self):
+        return ((f"{code:06d}", self._record(i)) for i, code in enumerate(self._codes))
+
+
+class RegionIndex(RegionLookup):
+    """只读行政区划索引，数据留在 mmap 中，字符串按需解码"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, n_strings, blob_size, *_ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"无效的索引文件: {path}")
+
+        view = self._view = memoryview(self._mm)
+        pos = HEADER.size
+        self._codes = view[pos:pos + count * 4].cast("i")
+        pos += count * 4
+        self._refs = view[pos:pos + count * 16].cast("I")
+        pos += count * 16
+        self._offsets = view[pos:pos + (n_strings + 1) * 4].cast("I")
+        pos += (n_strings + 1) * 4
+        self._blob = view[pos:pos + blob_size]
+        self._strings = {}
+
+    def _string(self, ref):
+        text = self._strings.get(ref)
+        if text is None:
+            start, end = self._offsets[ref], self._offsets[ref + 1]
+            text = self._strings[ref] = str(self._blob[start:end], "utf-8")
+        return text
+
+    def _record(self, i):
+        refs = self._refs[i * 4:i * 4 + 4]
+        return tuple(self._string(ref) for ref in refs)
+
+    def close(self):
+        self._codes.release()
+        self._refs.release()
+        self._offsets.release()
+        self._blob.release()
+        self._view.release()
+        self._mm.close()
+
+
+def load(path=DEFAULT_PATH):
+    """加载二进制索引"""
+    return RegionIndex(path)
+
+
+_PROBE = """
+import time
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+region_data.get("110101", ("-", "-", "-", "-"))
+with open("/proc/self/status") as f:
+    rss = next(line.split()[1] for line in f if line.startswith("VmRSS:"))
+print(elapsed, rss)
+"""
+# 空解释器，作为常驻内存的基线
+BASELINE = "region_data = {}"
+
+
+def probe(stmt, env, repeat=5):
+    """在子进程中执行 stmt 得到 region_data，返回 (最短耗时秒数, 最小常驻内存KB)（读取 /proc，仅限Linux）"""
+    import subprocess
+
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _PROBE.format(stmt=stmt)],
+                             cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        elapsed, rss = out.stdout.split()
+        runs.append((float(elapsed), int(rss)))
+    return min(r[0] for r in runs), min(r[1] for r in runs)
+
+
+def measure():
+    """在子进程中对比导入耗时与常驻内存"""
+    import subprocess
+    import tempfile
+
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    with tempfile.TemporaryDirectory() as cold_cache, tempfile.TemporaryDirectory() as warm_cache:
+        cold = dict(env, PYTHONPYCACHEPREFIX=cold_cache, PYTHONDONTWRITEBYTECODE="1")
+        warm = dict(env, PYTHONPYCACHEPREFIX=warm_cache)
+        subprocess.run([sys.executable, "-c", "import idCode, idIndex"], cwd=ROOT, env=warm, check=True)
+
+        _, base_rss = probe(BASELINE, warm)
+        cases = [
+            ("idCode（无 .pyc）", "from idCode import region_data", cold),
+            ("idCode（有 .pyc）", "from idCode import region_data", warm),
+            ("idCode.bin", "import idIndex; region_data = idIndex.load()", warm),
+        ]
+        for name, stmt, run_env in cases:
+            elapsed, rss = probe(stmt, run_env)
+            print(f"{name:<18} 导入 {elapsed * 1000:8.1f} ms  "
+                  f"常驻内存 {rss / 1024:6.1f} MB（+{(rss - base_rss) / 1024:.1f} MB）")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        print(f"已生成 {build()}")
+    elif command == "measure":
+        measure()
+    else:
+        print("用法: python idIndex.py [build|measure]")
@@ -0,0 +1,78 @@
+# 一代15位身份证升级为18位：补全世纪并计算校验码，支持单条、批量和流式迁移
+
+import csv
+import sys
+
+import idChecksum
+
+
+def upgrade(id_num, century="19"):
+    """15位身份证升级为18位；不是15位数字时抛出 ValueError"""
+    if len(id_num) != 15 or not id_num.isdigit():
+        raise ValueError("需要15位数字")
+    return idChecksum.complete(id_num[:6] + century + id_num[6:])
+
+
+def normalize(id_num, century="19"):
+    """15位数字自动升级为18位，其他输入原样返回"""
+    if len(id_num) == 15 and id_num.isdigit():
+        return upgrade(id_num, century)
+    return id_num
+
+
+def upgrade_batch(ids, century="19"):
+    """批量升级：15位数字在NumPy中补全世纪与校验码，其余原样返回，返回字符串列表"""
+    import numpy as np
+
+    upgraded = list(ids)
+    legacy = [i for i, s in enumerate(upgraded) if len(s) == 15 and s.isascii()]
+    if legacy:
+        buf = "".join(upgraded[i] for i in legacy).encode("ascii")
+        src = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 15)
+        mat = np.empty((len(legacy), 18), dtype=np.uint8)
+        mat[:, :6] = src[:, :6]
+        mat[:, 6:8] = np.frombuffer(century.encode("ascii"), dtype=np.uint8)
+        mat[:, 8:17] = src[:, 6:]
+        digits_ok = ((src >= 48) & (src <= 57)).all(axis=1)
+        mat[:, 17] = 0
+        mat[digits_ok, 17] = idChecksum.check_codes(mat[digits_ok])
+        text = mat.tobytes().decode("ascii")
+        for k in np.flatnonzero(digits_ok).tolist():
+            upgraded[legacy[k]] = text[k * 18:k * 18 + 18]
+    # 非ASCII数字（如全角）逐条处理；上标等 isdigit() 为真但不能转为整数的字符保持原样，由校验报告格式错误
+    for i, s in enumerate(upgraded):
+        if len(s) == 15 and not s.isascii():
+            try:
+                upgraded[i] = normalize(s, century)
+            except ValueError:
+                pass
+    return upgraded
+
+
+def convert_stream(infile, outfile, chunk_size=50000, century="19"):
+    """流式迁移：逐块读取号码，升级、校验并解析行政区划后写出CSV，返回处理条数"""
+    import idBatch
+    from idCheck import HEADER, chunked, describe
+
+    writer = csv.writer(outfile)
+    writer.writerow(["原号码"] + HEADER)
+    ids = (line.strip().upper() for line in infile)
+    total = 0
+    for chunk in chunked((s for s in ids if s), chunk_size):
+        upgraded = upgrade_batch(chunk, century)
+        _, reasons = idBatch.check_batch(upgraded)
+        writer.writerows([original] + describe(new, reason)
+                         for original, new, reason in zip(chunk, upgraded, reasons.tolist()))
+        total += len(chunk)
+    return total
+
+
+if __name__ == "__main__":
+    # 用法: python idLegacy.py [输入文件|-] [输出文件]
+    from idCheck import open_text
+
+    source = sys.argv[1] if len(sys.argv) > 1 else "-"
+    target = sys.argv[2] if len(sys.argv) > 2 else "-"
+    with open_text(source) as f, open_text(target, "w") as out:
+        count = convert_stream(f, out)
+    print(f"共处理 {count} 条", file=sys.stderr)
@@ -0,0 +1,111 @@
+# 预计算的输出片段：每个行政区划代码的 CSV/JSON 字段在加载时编码为 UTF-8 字节，批量输出时逐行拼接字节而不再格式化
+
+import csv
+import io
+import json
+
+import idBatch
+from idCheck import HEADER, UNKNOWN_REGION, describe
+
+_REGION_FIELDS = ("province", "city", "district", "source")
+
+
+def csv_line(row, lineterminator="\r\n"):
+    """按 csv.writer 默认规则编码一行（与 idCheck 输出逐字节一致）"""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator=lineterminator).writerow(row)
+    return buffer.getvalue().encode("utf-8")
+
+
+def json_line(row):
+    """按 idService.to_json 的字段顺序编码一行 JSON Lines"""
+    record = dict(zip(["id", "result", "gender", "birth", *_REGION_FIELDS], row))
+    record["valid"] = record["result"] == idBatch.REASONS[idBatch.REASON_OK]
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class OutputRecords:
+    """每个代码一份不可变的输出片段，构建一次后只读，可在线程间共享"""
+
+    def __init__(self, source=None, lineterminator="\r\n"):
+        if source is None:
+            from idRegion import region_data as source
+        self.lineterminator = lineterminator
+        self.eol = lineterminator.encode("ascii")
+
+        # ",省级,地市级,县区级,数据来源"
+        self.csv = {code: b"," + csv_line(record, "")
+                    for code, record in source.items()}
+        self.csv_unknown = b"," + csv_line(UNKNOWN_REGION, "")
+        # '"province": "…", "city": "…", "district": "…", "source": "…"'
+        self.json = {code: self._json_region(record) for code, record in source.items()}
+        self.json_unknown = self._json_region(UNKNOWN_REGION)
+
+        ok = idBatch.REASONS[idBatch.REASON_OK]
+        self.csv_valid = f",{ok},".encode("utf-8")
+        self.csv_gender = (b"\xe5\xa5\xb3,", b"\xe7\x94\xb7,")  # "女," / "男,"
+        self.csv_invalid = {reason: csv_line([""] + describe("", reason)[1:], lineterminator)
+                            for reason in idBatch.REASONS if reason != idBatch.REASON_OK}
+        self.json_valid = f'", "result": "{ok}", "gender": "'.encode("utf-8")
+        self.json_gender = ("女".encode("utf-8"), "男".encode("utf-8"))
+        self.json_invalid = {reason: json_line(describe("", reason))[len(b'{"id": ""'):]
+                             for reason in idBatch.REASONS if reason != idBatch.REASON_OK}
+
+    @staticmethod
+    def _json_region(record):
+        return json.dumps(dict(zip(_REGION_FIELDS, record)), ensure_ascii=False)[1:-1].encode("utf-8")
+
+    def header(self):
+        return csv_line(HEADER, self.lineterminator)
+
+    def csv_rows(self, ids, reasons):
+        """按 check_chunk 的规则生成CSV行，返回拼接后的字节（与 csv.writer 逐字节一致）"""
+        csv_region, unknown, eol = self.csv, self.csv_unknown, self.eol
+        valid, gender, invalid = self.csv_valid, self.csv_gender, self.csv_invalid
+        ok = idBatch.REASON_OK
+        out = []
+        for id_num, reason in zip(ids, reasons.tolist()):
+            if reason == ok and id_num.isascii():
+                b = id_num.encode("ascii")
+                out.append(b + valid + gender[b[16] & 1] + b[6:10] + b"-" + b[10:12] + b"-"
+                           + b[12:14] + csv_region.get(id_num[:6], unknown) + eol)
+            elif reason == ok:
+                out.append(csv_line(describe(id_num, reason), self.lineterminator))
+            elif id_num.isascii() and id_num.isalnum():
+                out.append(id_num.encode("ascii") + invalid[reason])
+            else:
+                # 空号码、含逗号或引号等：整行交给 csv.writer，引号规则才与 check_chunk 一致
+                out.append(csv_line(describe(id_num, reason), self.lineterminator))
+        return b"".join(out)
+
+    def json_rows(self, ids, reasons):
+        """按 idService 的字段生成 JSON Lines，返回拼接后的字节"""
+        json_region, unknown = self.json, self.json_unknown
+        valid, gender, invalid = self.json_valid, self.json_gender, self.json_invalid
+        ok = idBatch.REASON_OK
+        out = []
+        for id_num, reason in zip(ids, reasons.tolist()):
+            if reason == ok and id_num.isascii():
+                b = id_num.encode("ascii")
+                out.append(b'{"id": "' + b + valid + gender[b[16] & 1] + b'", "birth": "'
+                           + b[6:10] + b"-" + b[10:12] + b"-" + b[12:14] + b'", '
+                           + json_region.get(id_num[:6], unknown) + b', "valid": true}\n')
+            elif reason == ok:
+                out.append(json_line(describe(id_num, reason)))
+            elif id_num.isascii() and id_num.isalnum():
+                out.append(b'{"id": "' + id_num.encode("ascii") + b'"' + invalid[reason])
+            else:
+                out.append(b'{"id": ' + json.dumps(id_num, ensure_ascii=False).encode("utf-8")
+                           + invalid[reason])
+        return b"".join(out)
+
+
+_records = None
+
+
+def records():
+    """基于 region_data 的共享实例，首次调用时构建（每个进程一次）"""
+    global _records
+    if _records is None:
+        _records = OutputRecords()
+    return _records
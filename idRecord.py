@@ -0,0 +1,127 @@
+# 紧凑行政区划表：名称字符串池化（每个名称只存一份）+ 按列存储的整数引用，记录按需生成，仍可按元组解包
+
+import os
+import sys
+from array import array
+from collections import namedtuple
+
+import idIndex
+
+FIELDS = ("province", "city", "district", "source")
+
+
+class RegionRecord(namedtuple("RegionRecord", FIELDS)):
+    """一条行政区划记录；是元组的子类，`province, city, district, source = record` 等用法不变"""
+
+    __slots__ = ()
+
+
+class RegionTable(idIndex.RegionLookup):
+    """按列存储的只读行政区划表，接口与 region_data 字典一致（查找逻辑见 idIndex.RegionLookup）
+
+    codes 为升序 int32 数组，refs 为每条记录4个名称编号（uint16 或 uint32），
+    names 为去重后的名称池；每条记录只占 4 + 4×2 字节，查询时二分查找并生成 RegionRecord。
+    """
+
+    def __init__(self, codes, refs, names):
+        self._codes = codes
+        self._refs = refs
+        self.names = names
+
+    @classmethod
+    def from_mapping(cls, data):
+        """由 {代码: (省级, 地市级, 县区级, 数据来源)} 构建，相同名称合并为同一对象"""
+        pool = {}
+        codes = array("i")
+        refs = []
+        for code in sorted(data, key=int):
+            codes.append(int(code))
+            for text in data[code]:
+                refs.append(pool.setdefault(text, len(pool)))
+        names = tuple(sys.intern(text) for text in pool)
+        return cls(codes, array("H" if len(names) <= 0xFFFF else "I", refs), names)
+
+    @classmethod
+    def load(cls, path=idIndex.DEFAULT_PATH):
+        """从二进制索引 idCode.bin 读入内存（不保留 mmap）"""
+        index = idIndex.load(path)
+        try:
+            codes = array("i", index._codes)
+            refs = array("I", index._refs)
+            names = tuple(sys.intern(index._string(ref)) for ref in range(len(index._offsets) - 1))
+        finally:
+            index.close()
+        if len(names) <= 0xFFFF:
+            refs = array("H", refs)
+        return cls(codes, refs, names)
+
+    def _record(self, i):
+        names, refs = self.names, self._refs
+        j = i * 4
+        return RegionRecord(names[refs[j]], names[refs[j + 1]], names[refs[j + 2]], names[refs[j + 3]])
+
+    def column(self, field):
+        """某一列的名称编号（array），可配合 names 做按列统计而不生成记录"""
+        k = FIELDS.index(field)
+        return self._refs[k::4]
+
+    def nbytes(self):
+        """数组与名称池占用的字节数（不含解释器开销）"""
+        return (self._codes.itemsize * len(self._codes) + self._refs.itemsize * len(self._refs)
+                + sys.getsizeof(self.names) + sum(sys.getsizeof(name) for name in self.names))
+
+
+# 加载后仍存活的 Python 对象字节数（tracemalloc），不受内存页与分配器缓存影响
+_HEAP = """
+import gc, tracemalloc
+tracemalloc.start()
+{stmt}
+gc.collect()
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+# 从文本数据（Excel、CSV）读入时每个名称都是新字符串，这里用复制字符串模拟
+_FRESH = """
+from idCode import region_data as source
+region_data = {code: tuple("".join(list(text)) for text in record) for code, record in source.items()}
+del source; import sys; del sys.modules["idCode"]
+import gc; gc.collect()
+"""
+
+
+def measure():
+    """在子进程中对比各种表示的常驻内存（读取 /proc，仅限Linux），基线为空解释器"""
+    import subprocess
+    import tempfile
+
+    if not idIndex.is_fresh():
+        idIndex.build()
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+    def heap(stmt):
+        out = subprocess.run([sys.executable, "-c", _HEAP.format(stmt=stmt)],
+                             cwd=idIndex.ROOT, env=env, capture_output=True, text=True, check=True)
+        return int(out.stdout)
+
+    with tempfile.TemporaryDirectory() as cache:
+        env["PYTHONPYCACHEPREFIX"] = cache
+        subprocess.run([sys.executable, "-c", "import idCode, idRecord"], cwd=idIndex.ROOT, env=env, check=True)
+        _, base_rss = idIndex.probe(idIndex.BASELINE, env)
+        cases = [
+            ("dict（idCode.py）", "from idCode import region_data"),
+            ("dict（逐条新字符串）", _FRESH),
+            ("RegionTable", "import idRecord; region_data = idRecord.RegionTable.load()"),
+        ]
+        for name, stmt in cases:
+            elapsed, rss = idIndex.probe(stmt, env)
+            print(f"{name:<18} 加载 {elapsed * 1000:8.1f} ms  "
+                  f"常驻内存 {rss / 1024:6.1f} MB（+{(rss - base_rss) / 1024:.2f} MB）  "
+                  f"存活对象 {heap(stmt) / 1024 ** 2:5.2f} MB")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "measure"
+    if command == "measure":
+        measure()
+    else:
+        print("用法: python idRecord.py [measure]")
@@ -0,0 +1,60 @@
+# 行政区划懒加载查询：首次 get() 时才加载数据，仅做校验的进程不占用内存
+
+# threading 会连带导入 collections、functools（约4 ms），这里只需要一把锁
+import _thread
+
+
+def _default_loader():
+    """优先加载二进制索引 idCode.bin；索引不存在或旧于 idCode.py（见 idIndex.is_fresh）时回退到 idCode.region_data"""
+    import idIndex
+    if idIndex.is_fresh():
+        return idIndex.load()
+    from idCode import region_data
+    return region_data
+
+
+class LazyRegionData:
+    """与 region_data 字典接口一致的懒加载外观"""
+
+    def __init__(self, loader=_default_loader):
+        self._loader = loader
+        self._data = None
+        self._lock = _thread.allocate_lock()
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def _load(self):
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._loader()
+        return self._data
+
+    def get(self, code, default=None):
+        return self._load().get(code, default)
+
+    def __getitem__(self, code):
+        return self._load()[code]
+
+    def __contains__(self, code):
+        return code in self._load()
+
+    def __len__(self):
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return self._load().keys()
+
+    def values(self):
+        return self._load().values()
+
+    def items(self):
+        return self._load().items()
+
+
+region_data = LazyRegionData()
@@ -0,0 +1,242 @@
+# 异步HTTP校验服务：单条请求合并为微批次走向量化校验，行政区划数据在进程内共享
+
+import asyncio
+import json
+import sys
+import time
+import traceback
+from urllib.parse import parse_qs, urlsplit
+
+from idCache import CachedFormatter
+from idCheck import check_chunk
+from idRegion import region_data
+
+FIELDS = ["id", "result", "gender", "birth", "province", "city", "district", "source"]
+MAX_BODY = 16 * 1024 * 1024
+
+
+def to_json(row):
+    record = dict(zip(FIELDS, row))
+    record["valid"] = record["result"] == "有效"
+    return record
+
+
+class BatchCoalescer:
+    """把并发的单条校验请求合并为微批次
+
+    达到 max_batch 条或等待超过 max_delay 秒时统一校验一次。
+    """
+
+    def __init__(self, max_batch=1024, max_delay=0.002, extract=None):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.extract = extract or CachedFormatter()
+        self._pending = []
+        self._timer = None
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, id_num):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((id_num, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            rows = check_chunk([id_num for id_num, _ in batch], self.extract)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+
+class Service:
+    """请求处理逻辑，与HTTP传输层分离，便于进程内调用"""
+
+    def __init__(self, coalescer=None):
+        self.coalescer = coalescer or BatchCoalescer()
+        self.requests = 0
+
+    async def handle(self, method, target, body=b""):
+        """处理一个请求，返回 (状态码, JSON对象)"""
+        self.requests += 1
+        url = urlsplit(target)
+        try:
+            if method == "GET" and url.path == "/check":
+                id_num = parse_qs(url.query).get("id", [""])[0].strip().upper()
+                return 200, to_json(await self.coalescer.submit(id_num))
+            if method == "POST" and url.path == "/check/batch":
+                request = json.loads(body or b"{}")
+                ids = request.get("ids") if isinstance(request, dict) else None
+                if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+                    return 400, {"error": "请求体应为 {\"ids\": [\"...\"]}"}
+                # 大批量在线程池中校验，不阻塞事件循环上的单条请求
+                rows = await asyncio.get_running_loop().run_in_executor(
+                    None, check_chunk, [i.strip().upper() for i in ids], self.coalescer.extract)
+                return 200, {"results": [to_json(row) for row in rows]}
+            if method == "GET" and url.path == "/stats":
+                c = self.coalescer
+                return 200, {
+                    "requests": self.requests,
+                    "batches": c.batches,
+                    "avg_batch": c.items / c.batches if c.batches else 0.0,
+                    "region_loaded": region_data.loaded,
+                    "cache": c.extract.stats(),
+                }
+        except (ValueError, RecursionError):
+            # RecursionError：嵌套过深的 JSON（如 [[[[…）
+            return 400, {"error": "请求体不是有效的JSON"}
+        return 404, {"error": "未找到"}
+
+
+class LocalClient:
+    """进程内客户端：不经过网络直接调用 Service，用于本地测试"""
+
+    def __init__(self, service=None):
+        self.service = service or Service()
+
+    async def get(self, target):
+        return await self.service.handle("GET", target)
+
+    async def post(self, target, payload):
+        return await self.service.handle("POST", target, json.dumps(payload).encode("utf-8"))
+
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+async def _serve_connection(service, reader, writer):
+    """HTTP/1.1 连接处理，支持 keep-alive"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            except ValueError:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                break
+            if length < 0:
+                status, payload = 400, {"error": "Content-Length 无效"}
+            elif length > MAX_BODY:
+                status, payload = 413, {"error": "请求体过大"}
+            else:
+                body = await reader.readexactly(length) if length else b""
+                try:
+                    status, payload = await service.handle(method, target, body)
+                except Exception:
+                    # 意外错误也要应答，而不是让连接任务异常退出、客户端收不到响应
+                    traceback.print_exc(file=sys.stderr)
+                    status, payload = 500, {"error": "服务器内部错误"}
+
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            # 未读取请求体时无法继续解析后续请求，直接关闭连接
+            keep_alive = (headers.get("connection", "").lower() != "close"
+                          and 0 <= length <= MAX_BODY)
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                + data)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host="127.0.0.1", port=8000, service=None):
+    """启动服务，返回 asyncio.Server；区划数据在启动时预加载并被所有请求共享"""
+    service = service or Service()
+    region_data.get("110101")
+    return await asyncio.start_server(
+        lambda r, w: _serve_connection(service, r, w), host, port)
+
+
+async def load_test(concurrency=64, requests=20000):
+    """在本进程启动服务，用多条 keep-alive 连接并发发送单条请求，统计延迟与吞吐"""
+    import idGenerate
+
+    server = await start_server(port=0)
+    port = server.sockets[0].getsockname()[1]
+    ids = idGenerate.to_strings(idGenerate.generate(requests, seed=0, bad_checksum=0.1))
+    latencies = []
+
+    async def worker(offset):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for i in range(offset, requests, concurrency):
+            start = time.perf_counter()
+            writer.write(f"GET /check?id={ids[i]} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            await writer.drain()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    print(f"请求数 {requests}，并发 {concurrency}")
+    print(f"吞吐量 {requests / elapsed:,.0f} 请求/秒")
+    print(f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+async def serve(host, port):
+    server = await start_server(host, port)
+    print(f"服务已启动: http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    # 用法: python idService.py [serve [端口]|loadtest [并发数] [请求数]]
+    command = sys.argv[1] if len(sys.argv) > 1 else "serve"
+    if command == "loadtest":
+        args = [int(a) for a in sys.argv[2:4]]
+        asyncio.run(load_test(*args))
+    else:
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+        asyncio.run(serve("127.0.0.1", port))
@@ -0,0 +1,133 @@
+# 按省份分片的行政区划表：每个省（代码前两位）一个二进制索引，首次访问时加载，超出内存预算时按LRU淘汰
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import idIndex
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "idShards")
+
+
+def build(directory=DEFAULT_DIR, data=None):
+    """将 region_data 按省份拆分为 idShards/11.bin、12.bin …… 83.bin"""
+    if data is None:
+        from idCode import region_data as data
+
+    shards = {}
+    for code, record in data.items():
+        shards.setdefault(code[:2], {})[code] = record
+
+    os.makedirs(directory, exist_ok=True)
+    for province, subset in sorted(shards.items()):
+        idIndex.build(os.path.join(directory, f"{province}.bin"), subset)
+    return sorted(shards)
+
+
+class ShardedRegionData:
+    """按省份路由的行政区划查询，接口与 region_data 字典一致
+
+    budget 为常驻分片文件总字节数上限，None 表示不限制。
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, budget=None):
+        self.directory = directory
+        self.budget = budget
+        self._shards = OrderedDict()  # 省份代码 -> RegionIndex，按最近使用排序
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _shard(self, province):
+        """取出省份分片，未加载时从文件加载；不存在的省份返回None（调用方需持有锁）"""
+        shard = self._shards.get(province)
+        if shard is not None:
+            self.hits += 1
+            self._shards.move_to_end(province)
+            return shard
+
+        self.misses += 1
+        path = os.path.join(self.directory, f"{province}.bin")
+        if not (len(province) == 2 and province.isdigit() and os.path.exists(path)):
+            return None
+        shard = self._shards[province] = idIndex.RegionIndex(path)
+        self._sizes[province] = os.path.getsize(path)
+        self._evict(keep=province)
+        return shard
+
+    def _evict(self, keep):
+        """超出预算时淘汰最久未使用的分片（至少保留当前分片）"""
+        if self.budget is None:
+            return
+        while self.resident_bytes > self.budget and len(self._shards) > 1:
+            province = next(iter(self._shards))
+            if province == keep:
+                break
+            shard = self._shards.pop(province)
+            del self._sizes[province]
+            self.evictions += 1
+            shard.close()
+
+    @property
+    def resident_bytes(self):
+        return sum(self._sizes.values())
+
+    def get(self, code, default=None):
+        if not isinstance(code, str):
+            return default
+        # 查询在锁内完成，避免分片在读取期间被其他线程淘汰并关闭
+        with self._lock:
+            shard = self._shard(code[:2])
+            return default if shard is None else shard.get(code, default)
+
+    def __getitem__(self, code):
+        record = self.get(code)
+        if record is None:
+            raise KeyError(code)
+        return record
+
+    def __contains__(self, code):
+        return self.get(code) is not None
+
+    def stats(self):
+        """命中/未命中/淘汰次数与常驻分片信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "resident_shards": list(self._shards),
+                "resident_bytes": self.resident_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            for shard in self._shards.values():
+                shard.close()
+            self._shards.clear()
+            self._sizes.clear()
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        provinces = build()
+        print(f"已生成 {len(provinces)} 个分片: {DEFAULT_DIR}")
+    elif command == "stats":
+        # 模拟集中在少数省份的流量，观察命中率与常驻内存
+        import random
+        from idCode import region_data
+        codes = list(region_data)
+        hot = [c for c in codes if c[:2] in ("11", "31", "44")]
+        lookup = ShardedRegionData(budget=int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        for _ in range(100_000):
+            lookup.get(random.choice(hot) if random.random() < 0.9 else random.choice(codes))
+        for key, value in lookup.stats().items():
+            print(f"{key:<16} {value}")
+    else:
+        print("用法: python idShard.py [build|stats [预算字节数]]")
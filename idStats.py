@@ -0,0 +1,227 @@
+# 人口统计汇总：按 行政区划序号 × 性别 × 出生年份段 在稠密 NumPy 数组中计数，可跨进程合并，最后才生成带名称的结果
+
+import argparse
+import csv
+import datetime
+import os
+import sys
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import idBatch
+import idCheck
+import idDate
+import idTree
+
+SEXES = ("女", "男")
+HEADER = ["行政区划代码", "省级", "地市级", "县区级", "性别", "出生年份", "数量"]
+_DIGITS = 10 ** np.arange(5, -1, -1)
+
+
+class Aggregator:
+    """计数数组 counts[区划序号, 性别, 年份段]，最后一行为未知区划；内存只与区划数和年份段数有关"""
+
+    def __init__(self, tree=None, bucket=1, start_year=idDate.MIN_YEAR, end_year=None):
+        self.tree = tree or idTree.tree()
+        self.bucket = bucket
+        self.start_year = start_year
+        self.end_year = end_year or datetime.date.today().year
+        self.buckets = (self.end_year - start_year) // bucket + 1
+        self.unknown = len(self.tree)
+        self.counts = np.zeros((self.unknown + 1, len(SEXES), self.buckets), dtype=np.int64)
+        self.reasons = np.zeros(len(idBatch.REASONS), dtype=np.int64)
+        self._lookup = None
+
+    @property
+    def config(self):
+        return self.unknown, self.bucket, self.start_year, self.end_year
+
+    def lookup(self):
+        """6位代码（整数）到区划序号的查找表，约4MB，首次使用时构建"""
+        if self._lookup is None:
+            lookup = np.full(1_000_000, self.unknown, dtype=np.int32)
+            lookup[np.array([int(code) for code in self.tree.codes], dtype=np.int64)] = \
+                np.arange(len(self.tree), dtype=np.int32)
+            self._lookup = lookup
+        return self._lookup
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lookup"] = None
+        return state
+
+    def sparse(self, ids, today=None):
+        """校验一块身份证并计数但不累加，返回 (格子下标, 数量, 原因码计数)，体积与块大小相当，适合跨进程传递"""
+        today = today or datetime.date.today()
+        mat, ok_len, fallback = idBatch.to_matrix(ids)
+        reason = idBatch.check_matrix(mat, ok_len, today)
+        for i in fallback:
+            reason[i] = idBatch.check_one(ids[i], today)
+            if reason[i] == idBatch.REASON_OK:
+                # 全角、阿拉伯-印度数字等通过校验的号码逐字符取数值转为ASCII后参与统计
+                mat[i] = [48 + unicodedata.digit(c) for c in ids[i][:17]] + [ord(ids[i][17])]
+        reasons = np.bincount(reason, minlength=len(self.reasons)).astype(np.int64)
+
+        valid = mat[reason == idBatch.REASON_OK].astype(np.int64) - 48
+        region = self.lookup()[valid[:, :6] @ _DIGITS]
+        sex = valid[:, 16] & 1
+        year = valid[:, 6:10] @ _DIGITS[2:]
+        bucket = np.clip((year - self.start_year) // self.bucket, 0, self.buckets - 1)
+        flat = (region * len(SEXES) + sex) * self.buckets + bucket
+        keys, values = np.unique(flat, return_counts=True)
+        return keys, values, reasons
+
+    def add_sparse(self, keys, values, reasons):
+        self.counts.reshape(-1)[keys] += values
+        self.reasons += reasons
+
+    def add(self, ids, today=None):
+        """校验并累加一块身份证（字符串序列、S18 数组或 (N, 18) uint8 矩阵）"""
+        self.add_sparse(*self.sparse(ids, today))
+        return self
+
+    def merge(self, other):
+        """合并另一个相同配置的汇总结果（如其他进程或分片的结果）"""
+        if other.config != self.config:
+            raise ValueError("汇总配置不一致，无法合并")
+        self.counts += other.counts
+        self.reasons += other.reasons
+        return self
+
+    __iadd__ = merge
+
+    def save(self, path):
+        np.savez_compressed(path, counts=self.counts, reasons=self.reasons,
+                            config=np.array(self.config, dtype=np.int64))
+
+    @classmethod
+    def load(cls, path, tree=None):
+        with np.load(path) as data:
+            unknown, bucket, start_year, end_year = data["config"].tolist()
+            agg = cls(tree, bucket, start_year, end_year)
+            if agg.unknown != unknown:
+                raise ValueError(f"{path} 的行政区划数与当前数据不一致")
+            agg.counts[...] = data["counts"]
+            agg.reasons[...] = data["reasons"]
+        return agg
+
+    @property
+    def total(self):
+        return int(self.reasons.sum())
+
+    def rolled(self, level="district"):
+        """按层级汇总后的计数数组，行为该层级代码的序号（其余行为0），最后一行为未知或无法归属"""
+        ancestors = np.array(self.tree.ancestor_ordinals(level) + [self.unknown], dtype=np.int64)
+        ancestors[ancestors < 0] = self.unknown
+        result = np.zeros_like(self.counts)
+        np.add.at(result, ancestors, self.counts)
+        return result
+
+    def year_label(self, bucket):
+        start = self.start_year + bucket * self.bucket
+        return str(start) if self.bucket == 1 else f"{start}-{start + self.bucket - 1}"
+
+    def rows(self, level="district", by_sex=True, by_year=True):
+        """生成带名称的结果行，只输出非零格子；不分性别或年份时对应列为空"""
+        from idRegion import region_data
+
+        counts = self.rolled(level)
+        if not by_sex:
+            counts = counts.sum(axis=1, keepdims=True)
+        if not by_year:
+            counts = counts.sum(axis=2, keepdims=True)
+        for ordinal, sex, bucket in np.argwhere(counts).tolist():
+            if ordinal == self.unknown:
+                code, names = "", idCheck.UNKNOWN_REGION[:3]
+            else:
+                code = self.tree.codes[ordinal]
+                names = region_data.get(code, idCheck.UNKNOWN_REGION)[:3]
+            yield [code, *names,
+                   SEXES[sex] if by_sex else "",
+                   self.year_label(bucket) if by_year else "",
+                   int(counts[ordinal, sex, bucket])]
+
+
+_worker = None
+
+
+def _sparse_chunk(ids, config):
+    """工作进程：复用本进程的汇总器（查找表只构建一次），返回稀疏计数"""
+    global _worker
+    _, bucket, start_year, end_year = config
+    if _worker is None or _worker.config != config:
+        _worker = Aggregator(bucket=bucket, start_year=start_year, end_year=end_year)
+    return _worker.sparse(ids)
+
+
+def aggregate(chunks, agg, workers=1, max_pending=None):
+    """多进程汇总分块，限制在途块数以控制内存"""
+    if workers <= 1:
+        for chunk in chunks:
+            agg.add(chunk)
+        return agg
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_sparse_chunk, chunk, agg.config))
+            if len(pending) >= max_pending:
+                agg.add_sparse(*pending.popleft().result())
+        while pending:
+            agg.add_sparse(*pending.popleft().result())
+    return agg
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="按行政区划、性别和出生年份统计身份证号码")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="输入文件，'-' 为标准输入，支持 .gz")
+    parser.add_argument("-o", "--output", default="-", help="输出CSV文件，默认标准输出")
+    parser.add_argument("-f", "--format", choices=["csv", "tsv", "lines"], help="输入格式，默认按扩展名判断")
+    parser.add_argument("-c", "--column", type=int, default=0, help="身份证号码所在列（从0开始）")
+    parser.add_argument("--skip-header", action="store_true", help="跳过每个输入文件的首行")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="进程数")
+    parser.add_argument("--chunk-size", type=int, default=200_000, help="每个工作单元的记录数")
+    parser.add_argument("--level", choices=list(idTree.LEVELS), default="district", help="汇总层级")
+    parser.add_argument("--bucket", type=int, default=1, help="出生年份段长度（年）")
+    parser.add_argument("--no-sex", action="store_true", help="不按性别区分")
+    parser.add_argument("--no-year", action="store_true", help="不按出生年份区分")
+    parser.add_argument("--save", help="保存原始计数数组（.npz），供之后合并")
+    parser.add_argument("--merge", nargs="+", default=[], help="合并已保存的计数数组（.npz）")
+    args = parser.parse_args(argv)
+
+    if args.merge:
+        agg = Aggregator.load(args.merge[0])
+        for path in args.merge[1:]:
+            agg.merge(Aggregator.load(path))
+        if args.inputs == ["-"]:
+            args.inputs = []
+    else:
+        agg = Aggregator(bucket=args.bucket)
+
+    def all_ids():
+        for path in args.inputs:
+            with idCheck.open_text(path) as f:
+                yield from idCheck.read_ids(f, args.format or idCheck.guess_format(path),
+                                            args.column, args.skip_header)
+
+    start = time.perf_counter()
+    aggregate(idCheck.chunked(all_ids(), args.chunk_size), agg, args.workers)
+    elapsed = time.perf_counter() - start
+    if args.save:
+        agg.save(args.save)
+
+    with idCheck.open_text(args.output, "w") as out:
+        writer = csv.writer(out)
+        writer.writerow(HEADER)
+        writer.writerows(agg.rows(args.level, not args.no_sex, not args.no_year))
+
+    summary = "，".join(f"{idBatch.REASONS[r]} {n}" for r, n in enumerate(agg.reasons.tolist()))
+    print(f"共处理 {agg.total} 条（{summary}），用时 {elapsed:.2f} 秒", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
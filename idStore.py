@@ -0,0 +1,168 @@
+# SQLite 行政区划库：导出 region_data 与区划历史表，建立索引，多进程共享同一只读文件
+
+import os
+import pathlib
+import sqlite3
+import sys
+import time
+
+import idFilter
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "idCode.db")
+
+SCHEMA = """
+CREATE TABLE region (
+    code TEXT PRIMARY KEY,
+    province TEXT NOT NULL,
+    city TEXT NOT NULL,
+    district TEXT NOT NULL,
+    source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE history (
+    code TEXT PRIMARY KEY,
+    name TEXT,
+    province TEXT,
+    city TEXT,
+    district TEXT,
+    source TEXT,
+    first_year INTEGER,
+    last_year INTEGER,
+    status TEXT,
+    transfer_code TEXT,
+    transfer_name TEXT,
+    id_usage TEXT,
+    remark TEXT,
+    final_code TEXT,
+    final_name TEXT
+) WITHOUT ROWID;
+CREATE INDEX region_province ON region (province, city);
+CREATE INDEX region_city ON region (city);
+CREATE INDEX region_district ON region (district);
+CREATE INDEX history_name ON history (name);
+CREATE INDEX history_province ON history (province, city);
+CREATE INDEX history_years ON history (first_year, last_year);
+CREATE INDEX history_status ON history (status);
+CREATE INDEX history_final ON history (final_code);
+"""
+
+
+def export(path=DEFAULT_PATH, history_path=idFilter.DEFAULT_HISTORY_PATH, data=None):
+    """由 region_data 和区划历史表生成 SQLite 数据库"""
+    if data is None:
+        from idCode import region_data as data
+
+    closure, _ = idFilter.load_transfer_table(history_path)
+
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany("INSERT INTO region VALUES (?, ?, ?, ?, ?)",
+                         ((code, *record) for code, record in data.items()))
+
+        def history_rows():
+            with open(history_path, encoding="utf-8", newline="") as f:
+                _, lines = idFilter.split_header(f)
+                for row in idFilter.split_rows(lines):
+                    if len(row) < 13:
+                        continue
+                    code = row[0].strip()
+                    # 与 idTimeline、idFilter 一致：未转归的代码以自身为最终转归
+                    final_code, final_name = closure.get(code, (code, None))
+                    yield (code, row[1], row[2], row[3], row[4], row[5],
+                           idFilter.parse_year(row[6]), idFilter.parse_year(row[7]),
+                           row[8] or None, row[9] or None, row[10] or None,
+                           row[11] or None, row[12] or None, final_code, final_name)
+
+        conn.executemany(f"INSERT INTO history VALUES ({', '.join('?' * 15)})", history_rows())
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+def _prefix_range(prefix):
+    """前缀 -> 可走索引的 [lo, hi) 范围，空前缀匹配全部"""
+    if not prefix:
+        return "", "\uffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class RegionStore:
+    """只读查询层，get(code, default) 与 region_data 字典接口一致"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        uri = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+        self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, code, default=None):
+        row = self.conn.execute(
+            "SELECT province, city, district, source FROM region WHERE code = ?", (code,)).fetchone()
+        return default if row is None else tuple(row)
+
+    def __contains__(self, code):
+        return self.get(code) is not None
+
+    def history(self, code):
+        """单个代码的完整历史记录，不存在时返回None"""
+        row = self.conn.execute("SELECT * FROM history WHERE code = ?", (code,)).fetchone()
+        return None if row is None else dict(row)
+
+    def prefix(self, prefix):
+        """按代码前缀查询，如 '4403' 返回深圳市下所有代码"""
+        return self.query("SELECT * FROM region WHERE code >= ? AND code < ? ORDER BY code",
+                          _prefix_range(prefix))
+
+    def by_province(self, province, city=None):
+        if city is None:
+            return self.query("SELECT * FROM region WHERE province = ? ORDER BY code", (province,))
+        return self.query("SELECT * FROM region WHERE province = ? AND city = ? ORDER BY code",
+                          (province, city))
+
+    def search(self, name):
+        """按名称前缀查询历史记录"""
+        lo, hi = _prefix_range(name)
+        return self.query("SELECT * FROM history WHERE name >= ? AND name < ? ORDER BY code", (lo, hi))
+
+    def valid_in(self, year, prefix=""):
+        """查询某年份有记录的代码（按初次/最后记录年份）"""
+        lo, hi = _prefix_range(prefix)
+        return self.query(
+            "SELECT * FROM history WHERE first_year <= ? AND last_year >= ? "
+            "AND code >= ? AND code < ? ORDER BY code", (year, year, lo, hi))
+
+    def revoked(self, prefix=""):
+        """已撤销的代码及其最终转归"""
+        lo, hi = _prefix_range(prefix)
+        return self.query(
+            "SELECT * FROM history WHERE status = '[已撤销]' AND code >= ? AND code < ? "
+            "ORDER BY code", (lo, hi))
+
+    def query(self, sql, params=()):
+        """执行任意只读查询，返回字典列表"""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+if __name__ == "__main__":
+    # 用法: python idStore.py [build|query SQL]
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        print(f"已生成 {export()}")
+    elif command == "query":
+        store = RegionStore()
+        start = time.perf_counter()
+        rows = store.query(sys.argv[2])
+        for row in rows:
+            print("\t".join("" if v is None else str(v) for v in row.values()))
+        print(f"{len(rows)} 行，{(time.perf_counter() - start) * 1000:.2f} ms", file=sys.stderr)
+    else:
+        print("用法: python idStore.py [build|query SQL]")
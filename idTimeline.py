@@ -0,0 +1,94 @@
+# 按出生年份解析行政区划：根据初次/最后记录年份和曾用名称确定当时的区划名称，并给出当前转归
+
+import bisect
+import re
+import sys
+from collections import namedtuple
+
+import idFilter
+
+# 曾用名称记录，如 "东郊区[1991年]；城区[1995年]"
+_FORMER_NAME = re.compile(r"([^；;\[\]]+)\[(\d{4})年\]")
+
+Resolution = namedtuple("Resolution", [
+    "code",         # 行政区划代码
+    "year",         # 查询年份
+    "name",         # 该年份的区划名称
+    "in_range",     # 年份是否在记录范围内，无年份记录时为None
+    "province", "city", "district",
+    "final_code",   # 当前转归代码（未撤销时为自身）
+    "final_name",   # 当前转归名称（未撤销时为None）
+])
+
+
+class RegionTimeline:
+    """每个代码一组按结束年份排序的名称区间，按年份二分查找"""
+
+    def __init__(self, path=idFilter.DEFAULT_HISTORY_PATH):
+        self._codes = {}
+        with open(path, encoding="utf-8", newline="") as f:
+            _, lines = idFilter.split_header(f)
+            rows = [row for row in idFilter.split_rows(lines) if len(row) >= 13]
+
+        mapping_dict, name_dict = idFilter.build_transfer_mappings(rows)
+        self.closure, self.cycles = idFilter.resolve_transfers(mapping_dict, name_dict)
+
+        # 最新记录年份视为"至今"
+        self.latest = max((idFilter.parse_year(row[7]) or 0) for row in rows)
+
+        for row in rows:
+            code = row[0].strip()
+            first, last = idFilter.parse_year(row[6]), idFilter.parse_year(row[7])
+            if last == self.latest:
+                last = None
+            former = sorted((int(year), name.strip())
+                            for name, year in _FORMER_NAME.findall(row[12]))
+            ends = [year for year, _ in former]
+            names = [name for _, name in former] + [row[1].strip()]
+            self._codes[code] = (ends, names, first, last, (row[2], row[3], row[4]))
+
+    def __contains__(self, code):
+        return code in self._codes
+
+    def name_at(self, code, year):
+        """代码在某年份使用的名称，未知代码返回None"""
+        entry = self._codes.get(code)
+        if entry is None:
+            return None
+        ends, names = entry[0], entry[1]
+        return names[bisect.bisect_left(ends, year)]
+
+    def resolve(self, code, year):
+        """解析代码在某年份对应的区划及其当前转归，未知代码返回None"""
+        entry = self._codes.get(code)
+        if entry is None:
+            return None
+        ends, names, first, last, (province, city, district) = entry
+        name = names[bisect.bisect_left(ends, year)]
+        if first is None:
+            in_range = None
+        else:
+            in_range = first <= year and (last is None or year <= last)
+        final_code, final_name = self.closure.get(code, (code, None))
+        return Resolution(code, year, name, in_range, province, city, district,
+                          final_code, final_name)
+
+    def resolve_id(self, id_num):
+        """按身份证号码前6位和出生年份解析"""
+        return self.resolve(id_num[:6], int(id_num[6:10]))
+
+    def resolve_batch(self, ids):
+        """批量解析身份证号码，未知代码对应None"""
+        resolve = self.resolve
+        return [resolve(id_num[:6], int(id_num[6:10])) for id_num in ids]
+
+
+if __name__ == "__main__":
+    # 用法: python idTimeline.py 代码 年份  或  python idTimeline.py 身份证号码
+    timeline = RegionTimeline()
+    if len(sys.argv) == 3:
+        print(timeline.resolve(sys.argv[1], int(sys.argv[2])))
+    elif len(sys.argv) == 2:
+        print(timeline.resolve_id(sys.argv[1]))
+    else:
+        print("用法: python idTimeline.py 代码 年份 | 身份证号码")
@@ -0,0 +1,147 @@
+# 行政区划层级索引：按代码的 2/4/6 位结构建立 省级 -> 地市级 -> 县区级 树，父子导航与子树范围均为预计算
+
+import bisect
+import sys
+
+PROVINCE, CITY, DISTRICT = 1, 2, 3
+LEVELS = {"province": PROVINCE, "city": CITY, "district": DISTRICT}
+
+
+def level_of(code):
+    """按代码结构判断层级：XX0000 为省级，XXYY00 为地市级，其余为县区级"""
+    if code.endswith("0000"):
+        return PROVINCE
+    if code.endswith("00"):
+        return CITY
+    return DISTRICT
+
+
+class RegionTree:
+    """代码按字典序排列后，同一前缀的代码连续，每个节点的子树即 codes 中的一段 [lo, hi)
+
+    所有表在构建时一次算好，查询均为字典访问；不在数据中的代码按结构就近挂到已有的上级。
+    """
+
+    def __init__(self, source=None):
+        if source is None:
+            from idRegion import region_data as source
+        self.codes = tuple(sorted(source.keys()))
+        self.ordinal = {code: i for i, code in enumerate(self.codes)}
+        self._parent = {}
+        self._children = {None: []}
+        self._span = {}
+
+        for code in self.codes:
+            parent = self._find_parent(code)
+            self._parent[code] = parent
+            self._children.setdefault(parent, []).append(code)
+            self._children.setdefault(code, [])
+            self._span[code] = self._prefix_span(code[:2 * level_of(code)])
+        self._children = {code: tuple(children) for code, children in self._children.items()}
+
+    def _find_parent(self, code):
+        level = level_of(code)
+        if level == DISTRICT and code[:4] + "00" in self.ordinal:
+            return code[:4] + "00"
+        if level != PROVINCE and code[:2] + "0000" in self.ordinal:
+            return code[:2] + "0000"
+        return None
+
+    def _prefix_span(self, prefix):
+        lo = bisect.bisect_left(self.codes, prefix)
+        hi = bisect.bisect_left(self.codes, prefix + "\uffff", lo)
+        return lo, hi
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        return code in self.ordinal
+
+    def parent(self, code):
+        """上级代码，省级或无上级时返回None"""
+        try:
+            return self._parent[code]
+        except KeyError:
+            return self._find_parent(code)
+
+    def children(self, code=None):
+        """直接下级代码元组；code 为None时返回全部省级代码"""
+        return self._children.get(code, ())
+
+    def provinces(self):
+        return self._children[None]
+
+    def ancestors(self, code):
+        """从直接上级到省级的代码列表"""
+        result = []
+        code = self.parent(code)
+        while code is not None:
+            result.append(code)
+            code = self._parent[code]
+        return result
+
+    def roll_up(self, code, level):
+        """代码在指定层级上的归属代码（自身层级不高于 level 时返回自身），无对应上级时返回None"""
+        level = LEVELS.get(level, level)
+        if level_of(code) <= level:
+            return code if code in self.ordinal else None
+        for ancestor in self.ancestors(code):
+            if level_of(ancestor) == level:
+                return ancestor
+        return None
+
+    def span(self, code):
+        """子树（含自身）在 codes 中的范围 [lo, hi)；未知代码按前缀计算"""
+        try:
+            return self._span[code]
+        except KeyError:
+            return self._prefix_span(code[:2 * level_of(code)])
+
+    def descendants(self, code, level=None):
+        """子树中的全部代码（不含自身），可按层级筛选"""
+        lo, hi = self.span(code)
+        codes = [c for c in self.codes[lo:hi] if c != code]
+        if level is not None:
+            level = LEVELS.get(level, level)
+            codes = [c for c in codes if level_of(c) == level]
+        return codes
+
+    def ancestor_ordinals(self, level):
+        """每个序号在指定层级上的归属序号（无对应上级为-1），用于按层级汇总计数数组"""
+        result = []
+        for code in self.codes:
+            ancestor = self.roll_up(code, level)
+            result.append(-1 if ancestor is None else self.ordinal[ancestor])
+        return result
+
+    def rollup(self, counts, level):
+        """把 {代码: 数量} 汇总到指定层级，返回 {上级代码: 数量}；无法归属的计入None"""
+        totals = {}
+        for code, count in counts.items():
+            key = self.roll_up(code, level)
+            totals[key] = totals.get(key, 0) + count
+        return totals
+
+
+_tree = None
+
+
+def tree():
+    """基于 region_data 的共享实例，首次调用时构建"""
+    global _tree
+    if _tree is None:
+        _tree = RegionTree()
+    return _tree
+
+
+if __name__ == "__main__":
+    from idRegion import region_data
+
+    t = tree()
+    for code in sys.argv[1:] or ["440305"]:
+        path = [code] + t.ancestors(code)
+        print(" > ".join(f"{c} {'/'.join(n for n in region_data[c][:3] if n)}"
+                         for c in reversed(path) if c in region_data))
+        lo, hi = t.span(code)
+        print(f"子树 {hi - lo} 个代码，直接下级 {len(t.children(code))} 个")
@@ -0,0 +1,118 @@
+# 等价性回归测试：向量化、预计算的快速路径与原有逐条实现的结果必须一致（python -m pytest -q）
+
+import csv
+import importlib.util
+import io
+import json
+import os
+import random
+
+import numpy as np
+import pytest
+
+import idBatch
+import idCheck
+import idChecksum
+import idFilter
+import idGenerate
+import idService
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+VALID = idChecksum.complete("11010119800101001")
+# 边界输入：空串、长度不符、小写x、全角数字、日期不存在、未知区划、需要 CSV/JSON 转义的字符
+EDGE_IDS = [
+    "", " ", VALID, VALID[:17], VALID + "0", VALID[:17] + "x", VALID[:17] + "Y",
+    idChecksum.complete("11010119800230001"), idChecksum.complete("99999919800101001"),
+    "".join(chr(ord(c) + 0xFEE0) if c.isdigit() else c for c in VALID),
+    "１１０１０１１９８００１０１００１Ｘ", "11010119800101001,", "a,b", 'a"b', "身份证",
+    VALID[:16] + ",1", "1101011980010100\n1",
+]
+
+
+@pytest.fixture(scope="module")
+def ids():
+    mat = idGenerate.generate(20_000, seed=1, bad_checksum=0.2, bad_date=0.1, unknown_region=0.05)
+    return idGenerate.to_strings(mat) + EDGE_IDS
+
+
+def _authenticator():
+    """不创建窗口，只取 GUI 中的逐条校验 check_all"""
+    pytest.importorskip("tkinter")
+    spec = importlib.util.spec_from_file_location(
+        "authenticator", os.path.join(ROOT, "1.4.0-rc", "1.4.0-rc.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.IDAuthenticator.__new__(module.IDAuthenticator)
+
+
+def test_check_batch_matches_check_all(ids):
+    app = _authenticator()
+    valid, reason = idBatch.check_batch(ids)
+    assert valid.tolist() == [app.check_all(s) for s in ids]
+    assert reason.tolist() == [idBatch.check_one(s) for s in ids]
+
+
+def test_check_batch_input_forms(ids):
+    ascii_ids = [s for s in ids if len(s) == 18 and s.isascii()]
+    _, expected = idBatch.check_batch(ascii_ids)
+    mat = np.frombuffer("".join(ascii_ids).encode("ascii"), dtype=np.uint8).reshape(-1, 18)
+    assert idBatch.check_batch(mat)[1].tolist() == expected.tolist()
+    packed = np.array([s.encode("ascii") for s in ascii_ids], dtype="S18")
+    assert idBatch.check_batch(packed)[1].tolist() == expected.tolist()
+
+
+def _walk(mapping_dict, name_dict, start_code):
+    """逐条沿转归链查找（预计算闭包之前的实现，作为参照）"""
+    current_code = start_code
+    final_name = None
+    visited = set()
+    while current_code in mapping_dict:
+        if current_code in visited:
+            break
+        visited.add(current_code)
+        next_code = mapping_dict[current_code]
+        if next_code == current_code:
+            break
+        if current_code in name_dict:
+            final_name = name_dict[current_code]
+        current_code = next_code
+    return current_code, final_name
+
+
+def _assert_closure_matches_walk(mapping_dict, name_dict, codes):
+    closure, _ = idFilter.resolve_transfers(mapping_dict, name_dict)
+    for code in codes:
+        assert closure.get(code, (code, None)) == _walk(mapping_dict, name_dict, code), code
+
+
+def test_closure_matches_walk_on_history():
+    with open(idFilter.DEFAULT_HISTORY_PATH, encoding="utf-8", newline="") as f:
+        _, lines = idFilter.split_header(f)
+        rows = list(idFilter.split_rows(lines))
+    mapping_dict, name_dict = idFilter.build_transfer_mappings(rows)
+    _assert_closure_matches_walk(mapping_dict, name_dict, [row[0].strip() for row in rows])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_closure_matches_walk_with_cycles(seed):
+    rng = random.Random(seed)
+    codes = [f"{i:06d}" for i in range(60)]
+    mapping_dict = {code: rng.choice(codes) for code in rng.sample(codes, 45)}
+    # 与 build_transfer_mappings 一致：每个有转归代码的记录都有名称（可能为空）
+    name_dict = {code: f"名称{code}" if rng.random() < 0.8 else "" for code in mapping_dict}
+    _assert_closure_matches_walk(mapping_dict, name_dict, codes)
+
+
+def test_csv_bytes_match_csv_writer(ids):
+    expected = io.StringIO()
+    csv.writer(expected).writerows(idCheck.check_chunk(ids))
+    _, data = idCheck.check_chunk_bytes(ids)
+    assert data == expected.getvalue().encode("utf-8")
+
+
+def test_json_bytes_match_service(ids):
+    expected = "".join(json.dumps(idService.to_json(row), ensure_ascii=False) + "\n"
+                       for row in idCheck.check_chunk(ids))
+    _, data = idCheck.check_chunk_bytes(ids, "json")
+    assert data == expected.encode("utf-8")